@@ -4,6 +4,8 @@
 from algosdk import account, mnemonic, transaction
 from algosdk.v2client import algod
 
+from smart_contracts.algorealm.params_cache import suggested_params
+
 
 def get_algod_client() -> algod.AlgodClient:
     """Get algod client for LocalNet"""
@@ -41,7 +43,7 @@ def fund_contract() -> None:
 
     fund_txn = transaction.PaymentTxn(
         sender=deployer_address,
-        sp=client.suggested_params(),
+        sp=suggested_params(client),
         receiver=contract_address,
         amt=fund_amount,
     )
@@ -1,11 +1,16 @@
+import base64
 import dataclasses
 import importlib
+import json
 import logging
+import math
 import subprocess
 import sys
+import tempfile
 from collections.abc import Callable
 from pathlib import Path
 from shutil import rmtree
+from typing import TypedDict, cast
 
 from algokit_utils.config import config
 from dotenv import load_dotenv
@@ -34,6 +39,9 @@ class SmartContract:
     path: Path
     name: str
     deploy: Callable[[], None] | None = None
+    extra_sources: list[Path] = dataclasses.field(default_factory=list)
+    # Measures {contract name: {method: opcode cost}} for the app specs in a directory
+    measure_costs: Callable[[Path], dict[str, dict[str, int]]] | None = None
 
 
 def import_contract(folder: Path) -> Path:
@@ -45,6 +53,16 @@ def import_contract(folder: Path) -> Path:
         raise Exception(f"Contract not found in {folder}")
 
 
+def import_extra_sources(folder: Path) -> list[Path]:
+    """Lists the additional contract modules a folder compiles alongside contract.py."""
+    try:
+        package = importlib.import_module(f"{folder.parent.name}.{folder.name}")
+    except ImportError:
+        return []
+    module_names: str = getattr(package, "EXTRA_CONTRACT_MODULES", "")
+    return [folder / module_name for module_name in module_names.split()]
+
+
 def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
     """Imports the deploy function from a folder if it exists."""
     try:
@@ -55,6 +73,18 @@ def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
         return None
 
 
+def import_benchmark_if_exists(
+    folder: Path,
+) -> Callable[[Path], dict[str, dict[str, int]]] | None:
+    """Imports the method cost benchmark from a folder if it exists."""
+    try:
+        module_name = f"{folder.parent.name}.{folder.name}.benchmark_config"
+        benchmark_module = importlib.import_module(module_name)
+        return benchmark_module.measure_method_costs  # type: ignore[no-any-return, misc]
+    except ImportError:
+        return None
+
+
 def has_contract_file(directory: Path) -> bool:
     """Checks whether the directory contains a contract.py file."""
     return (directory / "contract.py").exists()
@@ -67,6 +97,8 @@ contracts: list[SmartContract] = [
         path=import_contract(folder),
         name=folder.name,
         deploy=import_deploy_if_exists(folder),
+        extra_sources=import_extra_sources(folder),
+        measure_costs=import_benchmark_if_exists(folder),
     )
     for folder in root_path.iterdir()
     if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
@@ -86,17 +118,13 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
-def build(output_dir: Path, contract_path: Path) -> Path:
-    """
-    Builds the contract by exporting (compiling) its source and generating a client.
-    If the output directory already exists, it is cleared.
-    """
-    output_dir = output_dir.resolve()
-    if output_dir.exists():
-        rmtree(output_dir)
-    output_dir.mkdir(exist_ok=True, parents=True)
-    logger.info(f"Exporting {contract_path} to {output_dir}")
-
+def compile_contract(
+    output_dir: Path,
+    contract_path: Path,
+    extra_sources: list[Path] | None = None,
+    optimization_level: int | None = None,
+) -> None:
+    """Compiles a contract and its extra sources into output_dir."""
     build_result = subprocess.run(
         [
             "algokit",
@@ -104,10 +132,16 @@ def build(output_dir: Path, contract_path: Path) -> Path:
             "compile",
             "python",
             str(contract_path.resolve()),
+            *(str(source.resolve()) for source in extra_sources or []),
             f"--out-dir={output_dir}",
             "--no-output-arc32",
             "--output-arc56",
             "--output-source-map",
+            *(
+                [f"--optimization-level={optimization_level}"]
+                if optimization_level is not None
+                else []
+            ),
         ],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
@@ -116,6 +150,23 @@ def build(output_dir: Path, contract_path: Path) -> Path:
     if build_result.returncode:
         raise Exception(f"Could not build contract:\n{build_result.stdout}")
 
+
+def build(
+    output_dir: Path, contract_path: Path, extra_sources: list[Path] | None = None
+) -> Path:
+    """
+    Builds the contract by exporting (compiling) its source and generating a client.
+    Any extra sources are compiled in the same invocation, producing one app spec
+    and client per contract.
+    If the output directory already exists, it is cleared.
+    """
+    output_dir = output_dir.resolve()
+    if output_dir.exists():
+        rmtree(output_dir)
+    output_dir.mkdir(exist_ok=True, parents=True)
+    logger.info(f"Exporting {contract_path} to {output_dir}")
+    compile_contract(output_dir, contract_path, extra_sources)
+
     # Look for arc56.json files and generate the client based on them.
     app_spec_file_names: list[str] = [
         file.name for file in output_dir.glob("*.arc56.json")
@@ -157,6 +208,106 @@ def build(output_dir: Path, contract_path: Path) -> Path:
     return output_dir
 
 
+# ------------------------- Benchmark Logic ------------------------- #
+
+OPTIMIZATION_LEVELS = (0, 1, 2)
+# Approval and clear programs share one 2048 byte page plus up to 3 extra pages
+PROGRAM_PAGE_SIZE = 2048
+MAX_EXTRA_PAGES = 3
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    contract: str
+    optimization_level: int
+    approval_size: int
+    clear_size: int
+    method_costs: dict[str, int] = dataclasses.field(default_factory=dict)
+
+    @property
+    def extra_pages(self) -> int:
+        pages = math.ceil((self.approval_size + self.clear_size) / PROGRAM_PAGE_SIZE)
+        return max(0, pages - 1)
+
+
+def benchmark(contract: SmartContract) -> list[BenchmarkResult]:
+    """
+    Compiles the contract at every optimization level and records program sizes.
+    Per-method opcode costs are added when the contract folder has a
+    benchmark_config.py and its network (e.g. LocalNet) is reachable.
+    """
+    results: list[BenchmarkResult] = []
+    for level in OPTIMIZATION_LEVELS:
+        with tempfile.TemporaryDirectory() as out_dir:
+            output_dir = Path(out_dir)
+            logger.info(f"Compiling {contract.path} at -O{level}")
+            compile_contract(output_dir, contract.path, contract.extra_sources, level)
+            level_results = {
+                result.contract: result
+                for result in (
+                    _program_sizes(spec_path, level)
+                    for spec_path in sorted(output_dir.glob("*.arc56.json"))
+                )
+            }
+            if contract.measure_costs:
+                try:
+                    method_costs = contract.measure_costs(output_dir)
+                except Exception as e:
+                    logger.warning(f"Skipping method costs at -O{level}: {e}")
+                    method_costs = {}
+                for name, costs in method_costs.items():
+                    level_results[name].method_costs = costs
+            results.extend(level_results.values())
+    return results
+
+
+class _ByteCode(TypedDict):
+    approval: str  # base64
+    clear: str  # base64
+
+
+class _AppSpec(TypedDict):
+    name: str
+    byteCode: _ByteCode
+
+
+def _program_sizes(spec_path: Path, level: int) -> BenchmarkResult:
+    app_spec = cast(_AppSpec, json.loads(spec_path.read_text()))
+    byte_code = app_spec["byteCode"]
+    return BenchmarkResult(
+        contract=app_spec["name"],
+        optimization_level=level,
+        approval_size=len(base64.b64decode(byte_code["approval"])),
+        clear_size=len(base64.b64decode(byte_code["clear"])),
+    )
+
+
+def _benchmark_order(result: BenchmarkResult) -> tuple[str, int]:
+    return result.contract, result.optimization_level
+
+
+def format_benchmark(results: list[BenchmarkResult]) -> str:
+    """One row per contract and optimization level, one cost column per method"""
+    methods = sorted({method for result in results for method in result.method_costs})
+    name_width = max(len(result.contract) for result in results)
+    header = f"{'contract':<{name_width}} {'-O':>3} {'approval':>9} {'clear':>6} {'pages':>6}"
+    rows = [header + "".join(f" {method:>{len(method)}}" for method in methods)]
+    for result in sorted(results, key=_benchmark_order):
+        pages = f"{result.extra_pages}" + (
+            "!" if result.extra_pages > MAX_EXTRA_PAGES else ""
+        )
+        row = (
+            f"{result.contract:<{name_width}} {result.optimization_level:>3}"
+            f" {result.approval_size:>9} {result.clear_size:>6} {pages:>6}"
+        )
+        row += "".join(
+            f" {result.method_costs.get(method, '-'):>{len(method)}}"
+            for method in methods
+        )
+        rows.append(row)
+    return "\n".join(rows)
+
+
 # --------------------------- Main Logic --------------------------- #
 
 
@@ -174,7 +325,11 @@ def main(action: str, contract_name: str | None = None) -> None:
         case "build":
             for contract in filtered_contracts:
                 logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+                build(
+                    artifact_path / contract.name,
+                    contract.path,
+                    contract.extra_sources,
+                )
         case "deploy":
             for contract in filtered_contracts:
                 output_dir = artifact_path / contract.name
@@ -194,10 +349,22 @@ def main(action: str, contract_name: str | None = None) -> None:
         case "all":
             for contract in filtered_contracts:
                 logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+                build(
+                    artifact_path / contract.name,
+                    contract.path,
+                    contract.extra_sources,
+                )
                 if contract.deploy:
                     logger.info(f"Deploying {contract.name}")
                     contract.deploy()
+        case "benchmark":
+            results = [
+                result
+                for contract in filtered_contracts
+                for result in benchmark(contract)
+            ]
+            if results:
+                print(format_benchmark(results))
         case _:
             logger.error(f"Unknown action: {action}")
 
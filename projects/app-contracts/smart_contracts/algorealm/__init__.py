@@ -1 +1,5 @@
 # AlgoRealm Gaming System
+
+# Contract modules compiled alongside contract.py by `python -m smart_contracts build`
+# (space separated: puya parses this package and rejects module-level lists)
+EXTRA_CONTRACT_MODULES = "quest_system.py guild_system.py opt_in_delegation.py"
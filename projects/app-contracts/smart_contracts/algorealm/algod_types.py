@@ -0,0 +1,229 @@
+"""Typed shapes of the algod and indexer JSON responses AlgoRealm tooling reads"""
+
+from typing import TypedDict
+
+
+class TealValue(TypedDict, total=False):
+    type: int  # 1 = bytes, 2 = uint
+    bytes: str  # base64
+    uint: int
+
+
+class TealKeyValue(TypedDict):
+    key: str  # base64
+    value: TealValue
+
+
+ApplicationLocalState = TypedDict(
+    "ApplicationLocalState", {"id": int, "key-value": list[TealKeyValue]}, total=False
+)
+
+AccountApplicationInfo = TypedDict(
+    "AccountApplicationInfo",
+    {"round": int, "app-local-state": ApplicationLocalState},
+    total=False,
+)
+
+ApplicationParams = TypedDict(
+    "ApplicationParams", {"global-state": list[TealKeyValue]}, total=False
+)
+
+
+class ApplicationInfo(TypedDict):
+    id: int
+    params: ApplicationParams
+
+
+NodeStatus = TypedDict("NodeStatus", {"last-round": int})
+
+TransactionParams = TypedDict(
+    "TransactionParams",
+    {
+        "fee": int,
+        "last-round": int,
+        "genesis-hash": str,
+        "genesis-id": str,
+        "consensus-version": str,
+        "min-fee": int,
+    },
+)
+
+
+class CompileResponse(TypedDict):
+    hash: str
+    result: str  # base64
+
+
+class PostTransactionsResponse(TypedDict):
+    txId: str
+
+
+class BlockTxids(TypedDict, total=False):
+    blockTxids: list[str] | None
+
+
+class TransactionFields(TypedDict, total=False):
+    type: str
+    fee: int  # Omitted when zero
+    snd: str
+    apid: int  # Omitted on app creation
+    apaa: list[str]  # base64 app args
+    apat: list[str]
+    apas: list[int]
+
+
+class SignedTransactionFields(TypedDict, total=False):
+    txn: TransactionFields
+
+
+class BlockInnerTransaction(TypedDict, total=False):
+    caid: int  # Set on asset creation
+
+
+class EvalDelta(TypedDict, total=False):
+    lg: list[str]  # base64 logs
+    itx: list[BlockInnerTransaction]
+
+
+class BlockTransaction(SignedTransactionFields, total=False):
+    dt: EvalDelta
+
+
+class Block(TypedDict, total=False):
+    txns: list[BlockTransaction]
+
+
+class BlockResponse(TypedDict):
+    block: Block
+
+
+PendingTransactionInfo = TypedDict(
+    "PendingTransactionInfo",
+    {
+        "txn": SignedTransactionFields,
+        "confirmed-round": int,
+        "pool-error": str,
+        "logs": list[str],
+        "inner-txns": list["PendingTransactionInfo"],
+    },
+    total=False,
+)
+
+
+class BoxReference(TypedDict, total=False):
+    app: int
+    name: str  # base64
+
+
+class AssetHoldingReference(TypedDict):
+    account: str
+    asset: int
+
+
+class ApplicationLocalReference(TypedDict):
+    account: str
+    app: int
+
+
+UnnamedResourcesAccessed = TypedDict(
+    "UnnamedResourcesAccessed",
+    {
+        "accounts": list[str],
+        "assets": list[int],
+        "apps": list[int],
+        "boxes": list[BoxReference],
+        "extra-box-refs": int,
+        "asset-holdings": list[AssetHoldingReference],
+        "app-locals": list[ApplicationLocalReference],
+    },
+    total=False,
+)
+
+
+class SimulationOpcodeTraceUnit(TypedDict):
+    pc: int
+
+
+SimulationTransactionExecTrace = TypedDict(
+    "SimulationTransactionExecTrace",
+    {
+        "approval-program-hash": str,  # base64
+        "approval-program-trace": list[SimulationOpcodeTraceUnit],
+        "inner-trace": list["SimulationTransactionExecTrace"],
+    },
+    total=False,
+)
+
+SimulateTransactionResult = TypedDict(
+    "SimulateTransactionResult",
+    {
+        "txn-result": PendingTransactionInfo,
+        "app-budget-consumed": int,
+        "unnamed-resources-accessed": UnnamedResourcesAccessed,
+        "exec-trace": SimulationTransactionExecTrace,
+    },
+    total=False,
+)
+
+SimulateTransactionGroupResult = TypedDict(
+    "SimulateTransactionGroupResult",
+    {
+        "txn-results": list[SimulateTransactionResult],
+        "failure-message": str,
+        "failed-at": list[int],
+        "app-budget-added": int,
+        "app-budget-consumed": int,
+        "unnamed-resources-accessed": UnnamedResourcesAccessed,
+    },
+    total=False,
+)
+
+SimulateResponse = TypedDict(
+    "SimulateResponse", {"txn-groups": list[SimulateTransactionGroupResult]}
+)
+
+
+# Indexer
+
+IndexerAssetParams = TypedDict(
+    "IndexerAssetParams",
+    {"name": str, "unit-name": str, "clawback": str},
+    total=False,
+)
+
+IndexerAsset = TypedDict(
+    "IndexerAsset",
+    {"index": int, "params": IndexerAssetParams, "created-at-round": int},
+    total=False,
+)
+
+AssetsResponse = TypedDict(
+    "AssetsResponse",
+    {"assets": list[IndexerAsset], "next-token": str},
+    total=False,
+)
+
+IndexerTransaction = TypedDict(
+    "IndexerTransaction",
+    {
+        "created-asset-index": int,
+        "note": str,  # base64
+        "inner-txns": list["IndexerTransaction"],
+    },
+    total=False,
+)
+
+TransactionsResponse = TypedDict(
+    "TransactionsResponse",
+    {"transactions": list[IndexerTransaction], "next-token": str},
+    total=False,
+)
+
+
+class MiniAssetHolding(TypedDict):
+    address: str
+    amount: int
+
+
+class AssetBalancesResponse(TypedDict, total=False):
+    balances: list[MiniAssetHolding]
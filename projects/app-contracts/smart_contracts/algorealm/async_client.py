@@ -0,0 +1,783 @@
+"""asyncio client for AlgoRealm backed by a pooled HTTP session to algod"""
+
+import asyncio
+import base64
+import copy
+import hashlib
+import json
+import os
+from collections.abc import Sequence
+from pathlib import Path
+from typing import NamedTuple, TypedDict, Unpack, cast
+
+import httpx
+from algosdk import abi, encoding, logic, transaction
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    EmptySigner,
+    LogicSigTransactionSigner,
+    TransactionSigner,
+    TransactionWithSigner,
+)
+from algosdk.v2client.models import (
+    SimulateRequest,
+    SimulateRequestTransactionGroup,
+)
+
+from smart_contracts.algorealm.algod_types import (
+    AccountApplicationInfo,
+    ApplicationInfo,
+    BlockTxids,
+    NodeStatus,
+    PendingTransactionInfo,
+    PostTransactionsResponse,
+    SimulateResponse,
+    SimulateTransactionGroupResult,
+    TransactionParams,
+)
+from smart_contracts.algorealm.deploy_config import player_name_mbr
+from smart_contracts.algorealm.params_cache import suggested_params_cache
+from smart_contracts.algorealm.preflight import (
+    PADDING_METHOD,
+    PREFLIGHT_EXTRA_BUDGET,
+    References,
+    plan_group,
+)
+from smart_contracts.algorealm.state_cache import PlayerState, decode_local_state
+
+APP_SPEC_PATH = (
+    Path(__file__).parent.parent
+    / "artifacts"
+    / "algorealm"
+    / "AlgoRealmGameManager.arc56.json"
+)
+
+# Prefix of the log carrying an ABI method's return value
+ABI_RETURN_PREFIX = bytes.fromhex("151f7c75")
+ZERO_ADDRESS: str = encoding.encode_address(bytes(32))
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_TIMEOUT_SECONDS = 10.0
+DEFAULT_MAX_ROUNDS_TO_WAIT = 5
+# Inner transactions an outer fee may cover during a fee dry pass (AVM group limit)
+MAX_POOLED_INNER_TRANSACTIONS = 256
+
+
+class _AppSpec(TypedDict):
+    methods: list[dict[str, object]]
+
+
+class MethodCall(NamedTuple):
+    """One app call of a group sent with AsyncAlgoRealmClient.send_group"""
+
+    method: str
+    args: list[object] | None = None
+    on_complete: transaction.OnComplete = transaction.OnComplete.NoOpOC
+    inner_transactions: int = 0
+
+
+class AlgodClientOptions(TypedDict, total=False):
+    """Keyword options of AsyncAlgodClient"""
+
+    max_connections: int
+    timeout: float
+
+
+class AsyncAlgodClient:
+    """
+    Minimal asyncio algod client.
+    All requests share one httpx.AsyncClient, so connections are pooled and
+    kept alive across thousands of concurrent calls.
+    """
+
+    def __init__(
+        self,
+        algod_address: str,
+        algod_token: str = "",
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ) -> None:
+        self.address = algod_address
+        self._http = httpx.AsyncClient(
+            base_url=algod_address.rstrip("/") + "/v2",
+            headers={"X-Algo-API-Token": algod_token},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=timeout,
+        )
+
+    @classmethod
+    def from_environment(
+        cls, **kwargs: Unpack[AlgodClientOptions]
+    ) -> "AsyncAlgodClient":
+        """Create a client from ALGOD_SERVER, ALGOD_PORT and ALGOD_TOKEN (LocalNet by default)"""
+        server = os.getenv("ALGOD_SERVER", "http://localhost")
+        port = os.getenv("ALGOD_PORT", "4001")
+        token = os.getenv("ALGOD_TOKEN", "a" * 64)
+        address = f"{server}:{port}" if port else server
+        return cls(address, token, **kwargs)
+
+    async def __aenter__(self) -> "AsyncAlgodClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        content: bytes | None = None,
+        params: dict[str, str] | None = None,
+    ) -> object:
+        headers = {"Content-Type": "application/x-binary"} if content else None
+        response = await self._http.request(
+            method, path, content=content, params=params, headers=headers
+        )
+        response.raise_for_status()
+        result: object = response.json()
+        return result
+
+    async def status(self) -> NodeStatus:
+        return cast(NodeStatus, await self._request("GET", "/status"))
+
+    async def status_after_block(self, round_: int) -> NodeStatus:
+        return cast(
+            NodeStatus,
+            await self._request("GET", f"/status/wait-for-block-after/{round_}"),
+        )
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        """Suggested params, served from the shared cache at most once per round"""
+        sp = suggested_params_cache.get_fresh(self.address)
+        if sp is not None:
+            return sp
+        params = cast(
+            TransactionParams, await self._request("GET", "/transactions/params")
+        )
+        sp = transaction.SuggestedParams(
+            fee=params["fee"],
+            first=params["last-round"],
+            last=params["last-round"] + 1000,
+            gh=params["genesis-hash"],
+            gen=params["genesis-id"],
+            flat_fee=False,
+            consensus_version=params["consensus-version"],
+            min_fee=params["min-fee"],
+        )
+        suggested_params_cache.put(self.address, sp)
+        return sp
+
+    async def send_transactions(
+        self, signed_txns: list[transaction.GenericSignedTransaction]
+    ) -> str:
+        """Submit a signed group, returning the first transaction ID"""
+        raw = b"".join(
+            base64.b64decode(_msgpack_encode(signed_txn)) for signed_txn in signed_txns
+        )
+        response = cast(
+            PostTransactionsResponse,
+            await self._request("POST", "/transactions", content=raw),
+        )
+        return response["txId"]
+
+    async def block_txids(self, round_: int) -> list[str]:
+        """IDs of the top-level transactions confirmed in a block"""
+        response = cast(
+            BlockTxids, await self._request("GET", f"/blocks/{round_}/txids")
+        )
+        return response.get("blockTxids") or []
+
+    async def pending_transaction_info(self, tx_id: str) -> PendingTransactionInfo:
+        return cast(
+            PendingTransactionInfo,
+            await self._request("GET", f"/transactions/pending/{tx_id}"),
+        )
+
+    async def simulate(self, request: SimulateRequest) -> SimulateResponse:
+        raw = base64.b64decode(_msgpack_encode(request))
+        return cast(
+            SimulateResponse,
+            await self._request(
+                "POST",
+                "/transactions/simulate",
+                content=raw,
+                params={"format": "json"},
+            ),
+        )
+
+    async def account_application_info(
+        self, address: str, app_id: int
+    ) -> AccountApplicationInfo:
+        return cast(
+            AccountApplicationInfo,
+            await self._request("GET", f"/accounts/{address}/applications/{app_id}"),
+        )
+
+    async def application_info(self, app_id: int) -> ApplicationInfo:
+        return cast(
+            ApplicationInfo, await self._request("GET", f"/applications/{app_id}")
+        )
+
+    async def wait_for_confirmation(
+        self, tx_id: str, max_rounds: int = DEFAULT_MAX_ROUNDS_TO_WAIT
+    ) -> PendingTransactionInfo:
+        """Wait for a transaction to be confirmed without blocking the event loop"""
+        last_round = (await self.status())["last-round"]
+        for current_round in range(last_round, last_round + max_rounds):
+            info = await self.pending_transaction_info(tx_id)
+            if info.get("confirmed-round", 0) > 0:
+                return info
+            if info.get("pool-error"):
+                raise Exception(f"Transaction {tx_id} rejected: {info['pool-error']}")
+            await self.status_after_block(current_round)
+        raise Exception(f"Transaction {tx_id} not confirmed after {max_rounds} rounds")
+
+
+class AsyncAlgoRealmClient:
+    """
+    asyncio counterpart of AlgoRealmGameManagerClient.
+    Method calls are built and signed with algosdk locally; only network I/O
+    is awaited, so one process can drive many player operations at once.
+    """
+
+    def __init__(
+        self,
+        algod: AsyncAlgodClient,
+        app_id: int,
+        *,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        app_spec_path: Path = APP_SPEC_PATH,
+        max_in_flight: int = DEFAULT_MAX_CONNECTIONS,
+    ) -> None:
+        self.algod = algod
+        self.app_id = app_id
+        self.default_sender = default_sender
+        self.default_signer = default_signer
+        self.methods = load_methods(app_spec_path)
+        # Bounds concurrent requests; confirmation waits do not hold a slot
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+
+    async def send(
+        self,
+        method: str,
+        args: list[object] | None = None,
+        *,
+        sender: str | None = None,
+        signer: TransactionSigner | None = None,
+        on_complete: transaction.OnComplete = transaction.OnComplete.NoOpOC,
+        inner_transactions: int | None = 0,
+        boxes: list[tuple[int, bytes]] | None = None,
+        max_rounds_to_wait: int = DEFAULT_MAX_ROUNDS_TO_WAIT,
+    ) -> object:
+        """
+        Sign, submit and confirm a method call, returning the decoded ABI return.
+        The outer fee covers inner_transactions inner fees; None counts them
+        with a simulate dry pass first (for apps that pool inner fees).
+        """
+        sender = sender or self.default_sender
+        signer = signer or self.default_signer
+        if sender is None or signer is None:
+            raise ValueError("A sender and signer are required to send transactions")
+        if inner_transactions is None:
+            inner_transactions = await self.pooled_inner_transactions(
+                method, args, sender=sender, on_complete=on_complete, boxes=boxes
+            )
+
+        async with self._in_flight:
+            atc = await self._compose(
+                method, args, sender, signer, on_complete, inner_transactions, boxes
+            )
+            signed_txns = atc.gather_signatures()
+            tx_id = await self.algod.send_transactions(signed_txns)
+        info = await self.algod.wait_for_confirmation(tx_id, max_rounds_to_wait)
+        return self.decode_return(method, info.get("logs", []))
+
+    async def simulate(
+        self,
+        method: str,
+        args: list[object] | None = None,
+        *,
+        sender: str,
+        on_complete: transaction.OnComplete = transaction.OnComplete.NoOpOC,
+    ) -> object:
+        """Simulate a method call without signing, returning the decoded ABI return"""
+        group = await self._simulate(method, args, sender, on_complete, 0, None)
+        logs = group["txn-results"][-1]["txn-result"].get("logs", [])
+        return self.decode_return(method, logs)
+
+    async def pooled_inner_transactions(
+        self,
+        method: str,
+        args: list[object] | None = None,
+        *,
+        sender: str,
+        on_complete: transaction.OnComplete = transaction.OnComplete.NoOpOC,
+        boxes: list[tuple[int, bytes]] | None = None,
+    ) -> int:
+        """
+        How many inner transaction fees the outer fee must cover, found by
+        simulating with fee credit for MAX_POOLED_INNER_TRANSACTIONS inners and
+        counting those (at any depth) that paid less than the minimum fee
+        """
+        group = await self._simulate(
+            method, args, sender, on_complete, MAX_POOLED_INNER_TRANSACTIONS, boxes
+        )
+        min_fee = cast(int, (await self.algod.suggested_params()).min_fee)
+        inner_txns = group["txn-results"][-1]["txn-result"].get("inner-txns", [])
+        return _count_pooled_inner_transactions(inner_txns, min_fee)
+
+    async def preflight(
+        self,
+        calls: Sequence[MethodCall],
+        *,
+        sender: str,
+        signer: TransactionSigner,
+    ) -> AtomicTransactionComposer:
+        """
+        Build a group that succeeds first time: simulate it once with unnamed
+        resources and extra budget allowed, then rebuild it naming every
+        account, asset, app and box it touched and with just enough
+        PADDING_METHOD calls appended to cover its opcode budget
+        """
+        sp = await self.algod.suggested_params()
+        draft = self.compose_group(sp, calls, sender=sender, signer=EmptySigner())
+        group = await self._simulate_group(
+            draft,
+            ", ".join(call.method for call in calls),
+            extra_opcode_budget=PREFLIGHT_EXTRA_BUDGET,
+        )
+        plan = plan_group(
+            group,
+            [
+                References.of(txn_with_signer.txn)
+                for txn_with_signer in draft.build_group()
+            ],
+        )
+        padding = [MethodCall(PADDING_METHOD)] * plan.padding_calls
+        return self.compose_group(
+            sp,
+            [*calls, *padding],
+            sender=sender,
+            signer=signer,
+            references=plan.references,
+        )
+
+    async def send_group(
+        self,
+        calls: Sequence[MethodCall],
+        *,
+        sender: str | None = None,
+        signer: TransactionSigner | None = None,
+        max_rounds_to_wait: int = DEFAULT_MAX_ROUNDS_TO_WAIT,
+    ) -> list[object]:
+        """Preflight, sign and submit calls as one group, returning their ABI returns"""
+        sender = sender or self.default_sender
+        signer = signer or self.default_signer
+        if sender is None or signer is None:
+            raise ValueError("A sender and signer are required to send transactions")
+
+        atc = await self.preflight(calls, sender=sender, signer=signer)
+        signed_txns = atc.gather_signatures()
+        tx_ids = [_txid(txn_with_signer.txn) for txn_with_signer in atc.build_group()]
+        async with self._in_flight:
+            await self.algod.send_transactions(signed_txns)
+        await self.algod.wait_for_confirmation(tx_ids[0], max_rounds_to_wait)
+        infos = [
+            await self.algod.pending_transaction_info(tx_id)
+            for tx_id in tx_ids[: len(calls)]
+        ]
+        return [
+            self.decode_return(call.method, info.get("logs", []))
+            for call, info in zip(calls, infos, strict=True)
+        ]
+
+    async def deliver_item(
+        self,
+        asset_id: int,
+        delegation: transaction.LogicSigAccount,
+        *,
+        sender: str | None = None,
+        signer: TransactionSigner | None = None,
+        inner_transactions: int = 1,
+        max_rounds_to_wait: int = DEFAULT_MAX_ROUNDS_TO_WAIT,
+    ) -> None:
+        """Opt the delegating player in to an item and deliver it in one group"""
+        sender = sender or self.default_sender
+        signer = signer or self.default_signer
+        if sender is None or signer is None:
+            raise ValueError("A sender and signer are required to send transactions")
+
+        async with self._in_flight:
+            sp = await self.algod.suggested_params()
+            atc = self.compose_delivery(
+                sp,
+                asset_id,
+                delegation,
+                sender=sender,
+                signer=signer,
+                inner_transactions=inner_transactions,
+            )
+            signed_txns = atc.gather_signatures()
+            tx_id = _txid(atc.build_group()[-1].txn)
+            await self.algod.send_transactions(signed_txns)
+        await self.algod.wait_for_confirmation(tx_id, max_rounds_to_wait)
+
+    async def register_player(
+        self,
+        player_name: str,
+        *,
+        sender: str | None = None,
+        signer: TransactionSigner | None = None,
+        opt_in: bool = True,
+        max_rounds_to_wait: int = DEFAULT_MAX_ROUNDS_TO_WAIT,
+    ) -> str:
+        """
+        Register the sender under player_name in one group, opting in first
+        unless opt_in is False, and return the welcome message
+        """
+        sender = sender or self.default_sender
+        signer = signer or self.default_signer
+        if sender is None or signer is None:
+            raise ValueError("A sender and signer are required to send transactions")
+
+        async with self._in_flight:
+            sp = await self.algod.suggested_params()
+            atc = self.compose_registration(
+                sp, player_name, sender=sender, signer=signer, opt_in=opt_in
+            )
+            signed_txns = atc.gather_signatures()
+            tx_id = _txid(atc.build_group()[-1].txn)
+            await self.algod.send_transactions(signed_txns)
+        info = await self.algod.wait_for_confirmation(tx_id, max_rounds_to_wait)
+        return cast(str, self.decode_return("register_player", info.get("logs", [])))
+
+    async def get_player_stats(self, player: str) -> tuple[int, int, int]:
+        stats = cast(
+            list[int],
+            await self.simulate(
+                "get_player_stats", [player], sender=self.default_sender or player
+            ),
+        )
+        return (stats[0], stats[1], stats[2])
+
+    async def get_game_info(self, sender: str) -> tuple[int, int, int]:
+        info = cast(list[int], await self.simulate("get_game_info", sender=sender))
+        return (info[0], info[1], info[2])
+
+    async def resolve_name(self, player_name: str, sender: str) -> str | None:
+        """Address registered under a player name, or None if the name is free"""
+        address = cast(
+            str, await self.simulate("resolve_name", [player_name], sender=sender)
+        )
+        return None if address == ZERO_ADDRESS else address
+
+    async def name_of(self, player: str) -> str:
+        return cast(
+            str,
+            await self.simulate(
+                "name_of", [player], sender=self.default_sender or player
+            ),
+        )
+
+    async def player_state(self, address: str) -> PlayerState:
+        """Read a player's local state in one request"""
+        async with self._in_flight:
+            info = await self.algod.account_application_info(address, self.app_id)
+        key_values = info.get("app-local-state", {}).get("key-value", [])
+        return decode_local_state(address, key_values, info["round"])
+
+    async def global_state(self) -> dict[str, int | bytes]:
+        """Read and decode the app's global state"""
+        async with self._in_flight:
+            info = await self.algod.application_info(self.app_id)
+        state: dict[str, int | bytes] = {}
+        for item in info["params"].get("global-state", []):
+            key = base64.b64decode(item["key"]).decode()
+            value = item["value"]
+            state[key] = (
+                value["uint"]
+                if value["type"] == 2
+                else base64.b64decode(value["bytes"])
+            )
+        return state
+
+    async def _simulate(
+        self,
+        method: str,
+        args: list[object] | None,
+        sender: str,
+        on_complete: transaction.OnComplete,
+        inner_transactions: int,
+        boxes: list[tuple[int, bytes]] | None,
+    ) -> SimulateTransactionGroupResult:
+        atc = await self._compose(
+            method,
+            args,
+            sender,
+            EmptySigner(),
+            on_complete,
+            inner_transactions,
+            boxes,
+        )
+        return await self._simulate_group(atc, method)
+
+    async def _simulate_group(
+        self,
+        atc: AtomicTransactionComposer,
+        label: str,
+        extra_opcode_budget: int = 0,
+    ) -> SimulateTransactionGroupResult:
+        request = SimulateRequest(
+            txn_groups=[
+                SimulateRequestTransactionGroup(
+                    txns=[
+                        transaction.SignedTransaction(txn_with_signer.txn, None)
+                        for txn_with_signer in atc.build_group()
+                    ]
+                )
+            ],
+            allow_empty_signatures=True,
+            allow_unnamed_resources=True,
+            extra_opcode_budget=extra_opcode_budget,
+        )
+        async with self._in_flight:
+            response = await self.algod.simulate(request)
+
+        group = response["txn-groups"][0]
+        failure = group.get("failure-message")
+        if failure:
+            raise Exception(f"Simulation of {label} failed: {failure}")
+        return group
+
+    async def _compose(
+        self,
+        method: str,
+        args: list[object] | None,
+        sender: str,
+        signer: TransactionSigner,
+        on_complete: transaction.OnComplete,
+        inner_transactions: int,
+        boxes: list[tuple[int, bytes]] | None,
+    ) -> AtomicTransactionComposer:
+        sp = await self.algod.suggested_params()
+        return self.compose_method_call(
+            sp,
+            method,
+            args,
+            sender=sender,
+            signer=signer,
+            on_complete=on_complete,
+            inner_transactions=inner_transactions,
+            boxes=boxes,
+        )
+
+    def compose_method_call(
+        self,
+        sp: transaction.SuggestedParams,
+        method: str,
+        args: list[object] | None = None,
+        *,
+        sender: str,
+        signer: TransactionSigner,
+        on_complete: transaction.OnComplete = transaction.OnComplete.NoOpOC,
+        inner_transactions: int = 0,
+        boxes: list[tuple[int, bytes]] | None = None,
+    ) -> AtomicTransactionComposer:
+        """Build a method call group with the given params, without any network I/O"""
+        return self.compose_group(
+            sp,
+            [MethodCall(method, args, on_complete, inner_transactions)],
+            sender=sender,
+            signer=signer,
+            references=[References(boxes=boxes or [])],
+        )
+
+    def compose_group(
+        self,
+        sp: transaction.SuggestedParams,
+        calls: Sequence[MethodCall],
+        *,
+        sender: str,
+        signer: TransactionSigner,
+        references: Sequence[References] | None = None,
+    ) -> AtomicTransactionComposer:
+        """Build a group of method calls, one References per call, without network I/O"""
+        atc = AtomicTransactionComposer()
+        for call, refs in zip(
+            calls, references or [References() for _ in calls], strict=True
+        ):
+            self._add_method_call(atc, sp, call, refs, sender=sender, signer=signer)
+        return atc
+
+    def compose_delivery(
+        self,
+        sp: transaction.SuggestedParams,
+        asset_id: int,
+        delegation: transaction.LogicSigAccount,
+        *,
+        sender: str,
+        signer: TransactionSigner,
+        inner_transactions: int = 1,
+    ) -> AtomicTransactionComposer:
+        """
+        Build an [opt-in, deliver_item] group: the player's zero-fee opt-in is
+        signed by their delegated AlgoRealmItemOptIn logic signature, and the
+        game master's deliver_item fee covers it and inner_transactions inners
+        """
+        player = delegation.address()
+        opt_in_sp = copy.copy(sp)
+        opt_in_sp.flat_fee = True
+        opt_in_sp.fee = 0
+        atc = AtomicTransactionComposer()
+        atc.add_transaction(
+            TransactionWithSigner(
+                transaction.AssetOptInTxn(player, opt_in_sp, asset_id),
+                LogicSigTransactionSigner(delegation),
+            )
+        )
+        self._add_method_call(
+            atc,
+            sp,
+            MethodCall(
+                "deliver_item",
+                [asset_id, player],
+                inner_transactions=1 + inner_transactions,
+            ),
+            References(),
+            sender=sender,
+            signer=signer,
+        )
+        return atc
+
+    def compose_registration(
+        self,
+        sp: transaction.SuggestedParams,
+        player_name: str,
+        *,
+        sender: str,
+        signer: TransactionSigner,
+        opt_in: bool = True,
+    ) -> AtomicTransactionComposer:
+        """
+        Build an [opt-in, MBR payment, register_player] group: the NoOp
+        registration requires the payment covering its name boxes right before
+        it, and names both boxes itself
+        """
+        # name_owners and player_names box keys
+        name_key = b"n" + hashlib.sha256(player_name.encode()).digest()
+        player_key: bytes = encoding.decode_address(sender)
+        atc = AtomicTransactionComposer()
+        if opt_in:
+            self._add_method_call(
+                atc,
+                sp,
+                MethodCall(
+                    "register_player",
+                    [player_name],
+                    on_complete=transaction.OnComplete.OptInOC,
+                ),
+                References(),
+                sender=sender,
+                signer=signer,
+            )
+        atc.add_transaction(
+            TransactionWithSigner(
+                transaction.PaymentTxn(
+                    sender,
+                    sp,
+                    logic.get_application_address(self.app_id),
+                    player_name_mbr(player_name).micro_algo,
+                ),
+                signer,
+            )
+        )
+        self._add_method_call(
+            atc,
+            sp,
+            MethodCall("register_player", [player_name]),
+            References(boxes=[(0, name_key), (0, b"a" + player_key)]),
+            sender=sender,
+            signer=signer,
+        )
+        return atc
+
+    def _add_method_call(
+        self,
+        atc: AtomicTransactionComposer,
+        sp: transaction.SuggestedParams,
+        call: MethodCall,
+        refs: References,
+        *,
+        sender: str,
+        signer: TransactionSigner,
+    ) -> None:
+        call_sp = copy.copy(sp)
+        # Pay for the outer call plus any inner transactions it issues
+        call_sp.flat_fee = True
+        call_sp.fee = cast(int, sp.min_fee) * (1 + call.inner_transactions)
+        atc.add_method_call(
+            app_id=self.app_id,
+            method=self.methods[call.method],
+            sender=sender,
+            sp=call_sp,
+            signer=signer,
+            method_args=call.args or [],
+            on_complete=call.on_complete,
+            accounts=refs.accounts or None,
+            foreign_assets=refs.assets or None,
+            foreign_apps=refs.apps or None,
+            boxes=refs.boxes or None,
+        )
+
+    def decode_return(self, method: str, logs: list[str]) -> object:
+        """Decode a method's ABI return value from its base64 transaction logs"""
+        return_type = self.methods[method].returns.type
+        # Only abi.Returns.VOID is a plain string here
+        if not isinstance(return_type, abi.ABIType) or not logs:
+            return None
+        last_log = base64.b64decode(logs[-1])
+        if not last_log.startswith(ABI_RETURN_PREFIX):
+            raise Exception(f"{method} did not log an ABI return value")
+        value: object = return_type.decode(last_log[len(ABI_RETURN_PREFIX) :])
+        return value
+
+
+def _count_pooled_inner_transactions(
+    inner_txns: list[PendingTransactionInfo], min_fee: int
+) -> int:
+    count = 0
+    for inner in inner_txns:
+        # Zero fees are omitted from the encoded transaction
+        if inner.get("txn", {}).get("txn", {}).get("fee", 0) < min_fee:
+            count += 1
+        count += _count_pooled_inner_transactions(inner.get("inner-txns", []), min_fee)
+    return count
+
+
+def _txid(txn: transaction.Transaction) -> str:
+    tx_id: str = txn.get_txid()
+    return tx_id
+
+
+def _msgpack_encode(obj: object) -> str:
+    encoded: str = encoding.msgpack_encode(obj)
+    return encoded
+
+
+def load_methods(app_spec_path: Path = APP_SPEC_PATH) -> dict[str, abi.Method]:
+    """Load the ABI methods of an ARC-56 app spec, keyed by name"""
+    app_spec = cast(_AppSpec, json.loads(app_spec_path.read_text()))
+    # undictify keeps the argument names, which from_signature would drop
+    return {
+        cast(str, method["name"]): abi.Method.undictify(method)
+        for method in app_spec["methods"]
+    }
@@ -0,0 +1,132 @@
+"""Method cost workload for `python -m smart_contracts benchmark algorealm`"""
+
+import logging
+from pathlib import Path
+from typing import cast
+
+import algokit_utils
+from algosdk.transaction import OnComplete
+
+from smart_contracts.algorealm.algod_types import SimulateResponse
+from smart_contracts.algorealm.deploy_config import player_name_mbr
+from smart_contracts.algorealm.params_cache import shared_algorand_client
+
+logger = logging.getLogger(__name__)
+
+# Covers the item minting state the cost-sensitive methods touch
+APP_FUNDING = algokit_utils.AlgoAmount.from_algo(1)
+PLAYER_NAME = "Benchmark"
+
+
+def measure_method_costs(spec_dir: Path) -> dict[str, dict[str, int]]:
+    """
+    Deploy a fresh AlgoRealmGameManager from the app spec in spec_dir and
+    simulate a fixed set of calls against it, returning each call's opcode cost.
+    """
+    algorand = shared_algorand_client()
+    deployer = algorand.account.from_environment("DEPLOYER")
+    sender = deployer.address
+    factory = algorand.client.get_app_factory(
+        app_spec=(spec_dir / "AlgoRealmGameManager.arc56.json").read_text(),
+        default_sender=sender,
+    )
+    app_client, _ = factory.send.create(
+        algokit_utils.AppFactoryCreateMethodCallParams(method="initialize_game")
+    )
+    app_client.fund_app_account(algokit_utils.FundAppAccountParams(amount=APP_FUNDING))
+    costs = measure_app_costs(app_client, sender)
+    logger.info(f"Measured {len(costs)} method costs on app {app_client.app_id}")
+    return {"AlgoRealmGameManager": costs}
+
+
+def measure_app_costs(
+    app_client: algokit_utils.AppClient, sender: str
+) -> dict[str, int]:
+    """
+    Register sender as a player, then simulate each benchmarked call.
+    A call that fails is logged and left out rather than dropping every cost.
+    """
+    opt_in = algokit_utils.AppClientMethodCallParams(
+        method="register_player",
+        args=[PLAYER_NAME],
+        on_complete=OnComplete.OptInOC,
+    )
+    costs: dict[str, int] = {}
+    _record_cost(costs, app_client, "register_player", opt_in)
+    app_client.send.opt_in(opt_in)
+    # Opting in only initializes local state; the NoOp call registers the player
+    # and must follow a payment covering its name boxes
+    register = app_client.params.call(
+        algokit_utils.AppClientMethodCallParams(
+            method="register_player", args=[PLAYER_NAME]
+        )
+    )
+    (
+        app_client.algorand.new_group()
+        .add_payment(
+            algokit_utils.PaymentParams(
+                amount=player_name_mbr(PLAYER_NAME),
+                sender=sender,
+                receiver=app_client.app_address,
+            )
+        )
+        .add_app_call_method_call(register)
+        .send()
+    )
+
+    calls: list[tuple[str, list[algokit_utils.ABIValue]]] = [
+        ("get_game_info", []),
+        ("get_player_stats", [sender]),
+        ("get_recovery_status", [sender]),
+        ("get_action_cooldown", [sender, 1]),
+        ("create_game_item", [sender, "Sword", "Weapon", "Rare", 10, 5, "Burns"]),
+        (
+            "create_game_item_with_key",
+            [b"benchmark", sender, "Sword", "Weapon", "Rare", 10, 5, "Burns"],
+        ),
+        ("create_item_stack", ["potion", "common"]),
+        ("seasonal_event_reissue", ["Winter", b"proof", sender]),
+        ("advance_season", []),
+    ]
+    for method, args in calls:
+        _record_cost(
+            costs,
+            app_client,
+            method,
+            algokit_utils.AppClientMethodCallParams(method=method, args=args),
+        )
+    return costs
+
+
+def _record_cost(
+    costs: dict[str, int],
+    app_client: algokit_utils.AppClient,
+    method: str,
+    params: algokit_utils.AppClientMethodCallParams,
+) -> None:
+    try:
+        costs[method] = _simulate_cost(app_client, params)
+    except Exception as e:
+        logger.warning(f"Skipping the cost of {method}: {e}")
+
+
+def _simulate_cost(
+    app_client: algokit_utils.AppClient,
+    params: algokit_utils.AppClientMethodCallParams,
+) -> int:
+    if params.on_complete == OnComplete.OptInOC:
+        txn = app_client.params.opt_in(params)
+    else:
+        txn = app_client.params.call(params)
+    result = (
+        app_client.algorand.new_group()
+        .add_app_call_method_call(txn)
+        .simulate(allow_unnamed_resources=True, skip_signatures=True)
+    )
+    simulate_response = cast(SimulateResponse | None, result.simulate_response)
+    assert simulate_response is not None
+    group = simulate_response["txn-groups"][0]
+    if "failure-message" in group:
+        raise Exception(group["failure-message"])
+    (txn_result,) = group["txn-results"]
+    return txn_result.get("app-budget-consumed", 0)
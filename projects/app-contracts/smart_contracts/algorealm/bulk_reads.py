@@ -0,0 +1,202 @@
+"""Batch AlgoRealm readonly ABI calls into grouped simulate requests"""
+
+import logging
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple, Protocol, cast
+
+import algokit_utils
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    EmptySigner,
+    SimulateABIResult,
+    TransactionWithSigner,
+)
+from algosdk.v2client.models import SimulateRequest
+
+if TYPE_CHECKING:
+    from smart_contracts.artifacts.algorealm.algo_realm_game_manager_client import (
+        AlgoRealmGameManagerClient,
+        AlgoRealmGameManagerComposer,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of transactions in a group
+MAX_GROUP_SIZE = 16
+DEFAULT_MAX_CONCURRENCY = 8
+# Failure messages of a single call's program; anything else (fees, balances)
+# fails the whole group and is raised rather than read as a missing value
+CALL_FAILURES = ("logic eval error", "rejected by ApprovalProgram")
+
+
+class PlayerStats(NamedTuple):
+    level: int
+    experience: int
+    recovery_count: int
+
+
+class RecoveryStatus(NamedTuple):
+    recovery_count: int
+    max_recoveries: int
+
+
+class GameInfo(NamedTuple):
+    total_players: int
+    total_items_created: int
+    current_season: int
+
+
+class _AddCall(Protocol):
+    """A generated composer method that adds one call to the group"""
+
+    def __call__(
+        self,
+        *,
+        args: tuple[object, ...] = ...,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> object: ...
+
+
+class _ReadGroupError(Exception):
+    """A simulated group failed at one call; the calls before it still returned"""
+
+    def __init__(self, failed_at: int, message: str, returns: list[object | None]):
+        super().__init__(message)
+        self.failed_at = failed_at
+        self.returns = returns
+
+
+def bulk_read(
+    client: "AlgoRealmGameManagerClient",
+    method: str,
+    args_list: Sequence[tuple[object, ...]],
+    *,
+    sender: str | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[object | None]:
+    """
+    Call a readonly method once per args tuple, 16 calls per simulate request.
+    Groups are simulated concurrently. A call whose program fails (e.g. an
+    unregistered player) yields None; the calls before it keep their simulated
+    returns and only the calls after it are simulated again. Failures of the
+    group itself, such as an unfunded sender, are raised.
+    Signatures are skipped, but the sender (the client's default sender unless
+    given) must be able to pay the group's fees.
+    """
+    chunks = [
+        list(args_list[start : start + MAX_GROUP_SIZE])
+        for start in range(0, len(args_list), MAX_GROUP_SIZE)
+    ]
+    if not chunks:
+        return []
+
+    def read_chunk(chunk: list[tuple[object, ...]]) -> list[object | None]:
+        values: list[object | None] = []
+        while chunk:
+            try:
+                return values + _simulate_group(client, method, chunk, sender)
+            except _ReadGroupError as e:
+                logger.debug(f"Readonly {method}{chunk[e.failed_at]} failed: {e}")
+                values += [*e.returns, None]
+                chunk = chunk[e.failed_at + 1 :]
+        return values
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(chunks))) as pool:
+        results = pool.map(read_chunk, chunks)
+    return [value for chunk_result in results for value in chunk_result]
+
+
+def bulk_player_stats(
+    client: "AlgoRealmGameManagerClient",
+    players: Sequence[str],
+    *,
+    sender: str | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> dict[str, PlayerStats | None]:
+    """get_player_stats for many players; unregistered players map to None"""
+    values = bulk_read(
+        client,
+        "get_player_stats",
+        [(player,) for player in players],
+        sender=sender,
+        max_concurrency=max_concurrency,
+    )
+    return {
+        player: PlayerStats(*value) if value is not None else None  # type: ignore[misc]
+        for player, value in zip(players, values, strict=True)
+    }
+
+
+def bulk_recovery_status(
+    client: "AlgoRealmGameManagerClient",
+    players: Sequence[str],
+    *,
+    sender: str | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> dict[str, RecoveryStatus | None]:
+    """get_recovery_status for many players; unregistered players map to None"""
+    values = bulk_read(
+        client,
+        "get_recovery_status",
+        [(player,) for player in players],
+        sender=sender,
+        max_concurrency=max_concurrency,
+    )
+    return {
+        player: RecoveryStatus(*value) if value is not None else None  # type: ignore[misc]
+        for player, value in zip(players, values, strict=True)
+    }
+
+
+def read_game_info(
+    client: "AlgoRealmGameManagerClient", *, sender: str | None = None
+) -> GameInfo:
+    """get_game_info through simulate, without signing or submitting"""
+    (value,) = _simulate_group(client, "get_game_info", [()], sender)
+    return GameInfo(*value)  # type: ignore[misc]
+
+
+def _simulate_group(
+    client: "AlgoRealmGameManagerClient",
+    method: str,
+    chunk: list[tuple[object, ...]],
+    sender: str | None,
+) -> list[object | None]:
+    composer: AlgoRealmGameManagerComposer = client.new_group()
+    params = algokit_utils.CommonAppCallParams(sender=sender)
+    for args in chunk:
+        add_call: _AddCall = getattr(composer, method)
+        if args:
+            add_call(args=args, params=params)
+        else:
+            add_call(params=params)
+
+    # Simulate through algosdk so a failure reports which call it was
+    built = composer.composer().build_transactions()
+    atc = AtomicTransactionComposer()
+    for txn in built.transactions:
+        atc.add_transaction(TransactionWithSigner(txn, EmptySigner()))
+    atc.method_dict = built.method_calls
+    response = atc.simulate(
+        client.algorand.client.algod,
+        SimulateRequest(
+            txn_groups=[], allow_empty_signatures=True, allow_unnamed_resources=True
+        ),
+    )
+
+    results: list[SimulateABIResult] = response.abi_results
+    returns = [cast(object | None, result.return_value) for result in results]
+    failed: list[int] | None = response.failed_at
+    if failed:
+        message: str = response.failure_message
+        raise _group_failure(failed[0], message, returns[: failed[0]])
+    return returns
+
+
+def _group_failure(
+    failed_at: int, message: str, returns: list[object | None]
+) -> Exception:
+    if any(failure in message for failure in CALL_FAILURES):
+        return _ReadGroupError(failed_at, message, returns)
+    return Exception(f"Simulated read group failed: {message}")
@@ -1,20 +1,147 @@
 from algopy import (
     Account,
+    Application,
     ARC4Contract,
     Asset,
+    BoxMap,
     Bytes,
     Global,
     GlobalState,
     LocalState,
     OnCompleteAction,
     String,
+    TransactionType,
     Txn,
     UInt64,
+    arc4,
+    gtxn,
     itxn,
-    log,
     op,
+    subroutine,
+    urange,
 )
-from algopy.arc4 import Bool, abimethod
+from algopy.arc4 import Address, Bool, DynamicArray, Struct, abimethod
+
+from smart_contracts.algorealm.quest_system import AlgoRealmQuestSystem
+
+# How an item was minted, carried by ItemMinted events
+ITEM_SOURCE_CREATED = 1
+ITEM_SOURCE_SEASONAL = 2
+ITEM_SOURCE_CRAFTED = 3
+
+# Item type and rarity codes stored in ItemMetadata (0: type not in the list)
+ITEM_TYPE_OTHER = 0
+ITEM_TYPE_WEAPON = 1
+ITEM_TYPE_ARMOR = 2
+ITEM_TYPE_CONSUMABLE = 3
+ITEM_TYPE_BADGE = 4
+RARITY_COMMON = 1
+RARITY_RARE = 2
+RARITY_EPIC = 3
+RARITY_LEGENDARY = 4
+# Stats are packed as uint16, effect 0 means no special effect
+MAX_ITEM_STAT = 65_535
+NO_EFFECT = 0
+MAX_RECOVERY_COUNT = 255
+# create_game_item notes are ITEM_NOTE_PREFIX + ItemMetadata bytes
+ITEM_NOTE_PREFIX = b"ITEM_"
+
+# Maximum number of transactions in a single inner transaction group
+MAX_INNER_GROUP_SIZE = 16
+
+# Units minted for each stackable item template (fungible, 0 decimals)
+ITEM_STACK_SUPPLY = 1_000_000_000_000
+# Maximum ASA name length; stack names are "<item_type>:<rarity>"
+MAX_ASSET_NAME_LENGTH = 32
+# Player names are unique byte-for-byte (case sensitive)
+MAX_PLAYER_NAME_LENGTH = 32
+# Box MBR for one registration: the owner entry, 2500 + 400 * (len(b"n") + 32 key
+# + 32 value), and the name entry, 2500 + 400 * (len(b"a") + 32 key + 2 length
+# prefix), plus 400 per name byte
+PLAYER_NAME_BOX_MBR = 45_000
+PLAYER_NAME_BYTE_MBR = 400
+
+# Rate-limited actions, indexing 8-byte slots in the packed action_clock
+ACTION_SEASONAL_REISSUE = 0
+ACTION_CRAFT_ITEMS = 1
+ACTION_CLOCK_SIZE = 16
+# Default minimum seconds between actions and how many may be taken back-to-back
+DEFAULT_SEASONAL_REISSUE_INTERVAL = 3_600
+DEFAULT_CRAFT_INTERVAL = 60
+DEFAULT_RATE_LIMIT_BURST = 3
+
+
+class ItemMetadata(Struct):
+    """
+    Fixed-width item record (18 bytes): every field is a constant-offset read.
+    The special effect text is interned once in the effect table.
+    """
+
+    item_type: arc4.UInt8
+    rarity: arc4.UInt8
+    attack_power: arc4.UInt16
+    defense_power: arc4.UInt16
+    effect_id: arc4.UInt16
+    is_recovered: arc4.Bool
+    recovery_count: arc4.UInt8
+    original_creation_time: arc4.UInt64
+
+
+class PlayerRegistered(Struct):
+    """ARC-28 event: a player completed registration"""
+
+    player: Address
+
+
+class ItemMinted(Struct):
+    """ARC-28 event: a new item ASA is held by the contract for recipient"""
+
+    asset_id: arc4.UInt64
+    recipient: Address
+    source: arc4.UInt8
+
+
+class ItemRecovered(Struct):
+    """ARC-28 event: a lost item was reissued as a new ASA"""
+
+    original_asset_id: arc4.UInt64
+    asset_id: arc4.UInt64
+    recipient: Address
+
+
+class ItemClaimed(Struct):
+    """ARC-28 event: an item was transferred to the player"""
+
+    asset_id: arc4.UInt64
+    player: Address
+
+
+class ItemStackCreated(Struct):
+    """ARC-28 event: the fungible ASA for an item template was minted"""
+
+    asset_id: arc4.UInt64
+    supply: arc4.UInt64
+
+
+class StackItemsDispensed(Struct):
+    """ARC-28 event: units of a stackable item were sent to a player"""
+
+    asset_id: arc4.UInt64
+    recipient: Address
+    amount: arc4.UInt64
+
+
+class ItemsRecycled(Struct):
+    """ARC-28 event: item ASAs were clawed back and destroyed"""
+
+    count: arc4.UInt64
+    clawed_back: arc4.UInt64
+
+
+class SeasonAdvanced(Struct):
+    """ARC-28 event: a new season started"""
+
+    season: arc4.UInt64
 
 
 class AlgoRealmGameManager(ARC4Contract):
@@ -27,36 +154,118 @@ class AlgoRealmGameManager(ARC4Contract):
         # Global game state
         self.total_players = GlobalState(UInt64)
         self.total_items_created = GlobalState(UInt64)
+        self.total_items_recycled = GlobalState(UInt64)
         self.game_master = GlobalState(Account)
         self.current_season = GlobalState(UInt64)
         self.max_recovery_per_item = GlobalState(UInt64)
+        # Linked AlgoRealm systems, set by configure_systems
+        self.quest_system_app = GlobalState(Application)
+        self.guild_system_app = GlobalState(Application)
+        # Rate limits for item-minting player actions
+        self.seasonal_reissue_interval = GlobalState(UInt64)
+        self.craft_interval = GlobalState(UInt64)
+        self.rate_limit_burst = GlobalState(UInt64)
+        self.total_effects = GlobalState(UInt64)
+        # When set, inner transactions carry no fee and the caller's outer fee covers them
+        self.pool_inner_fees = GlobalState(Bool)
 
         # Player local state - using basic types to avoid struct issues
         self.player_level = LocalState(UInt64)
         self.player_experience = LocalState(UInt64)
         self.player_recovery_count = LocalState(UInt64)
+        # Season the per-season counters above belong to; older stamps read as 0
+        self.player_season = LocalState(UInt64)
         self.is_registered = LocalState(Bool)
+        # Per-action rate limit clocks, one big-endian uint64 per action
+        self.action_clock = LocalState(Bytes)
+
+        # Stackable item ASA per sha256("<item_type>:<rarity>") template key
+        self.item_stacks = BoxMap(Bytes, UInt64, key_prefix=b"s")
+        # Compact metadata of unique items, by asset ID
+        self.item_metadata = BoxMap(UInt64, ItemMetadata, key_prefix=b"m")
+        # Interned special effects: ID to text and sha256(text) to ID
+        self.effect_table = BoxMap(UInt64, String, key_prefix=b"e")
+        self.effect_ids = BoxMap(Bytes, UInt64, key_prefix=b"i")
+        # Asset minted per sha256(request key) by create_game_item_with_key
+        self.minted_requests = BoxMap(Bytes, UInt64, key_prefix=b"r")
+        # Player name registry: sha256(name) to player and player to name
+        self.name_owners = BoxMap(Bytes, Account, key_prefix=b"n")
+        self.player_names = BoxMap(Account, String, key_prefix=b"a")
 
     @abimethod(create="require")
     def initialize_game(self) -> String:
         """Initialize the game state - called once when contract is created"""
         self.total_players.value = UInt64(0)
         self.total_items_created.value = UInt64(0)
+        self.total_items_recycled.value = UInt64(0)
         self.current_season.value = UInt64(1)
         self.max_recovery_per_item.value = UInt64(3)
         self.game_master.value = Txn.sender  # Set the creator as game master
+        self.quest_system_app.value = Application(0)
+        self.guild_system_app.value = Application(0)
+        self.seasonal_reissue_interval.value = UInt64(DEFAULT_SEASONAL_REISSUE_INTERVAL)
+        self.craft_interval.value = UInt64(DEFAULT_CRAFT_INTERVAL)
+        self.rate_limit_burst.value = UInt64(DEFAULT_RATE_LIMIT_BURST)
+        self.total_effects.value = UInt64(0)
+        self.pool_inner_fees.value = Bool(False)
         return String("AlgoRealm initialized!")
 
+    @abimethod()
+    def configure_systems(
+        self, quest_system: Application, guild_system: Application
+    ) -> None:
+        """Link the quest and guild system apps (only game master)"""
+        assert (
+            Txn.sender == self.game_master.value
+        ), "Only game master can configure systems"
+        self.quest_system_app.value = quest_system
+        self.guild_system_app.value = guild_system
+
+    @abimethod()
+    def configure_rate_limits(
+        self, seasonal_reissue_interval: UInt64, craft_interval: UInt64, burst: UInt64
+    ) -> None:
+        """
+        Set the minimum seconds between seasonal reissues and crafts, and how
+        many of each a player may take back-to-back (only game master)
+        An interval of 0 disables the limit for that action
+        """
+        assert (
+            Txn.sender == self.game_master.value
+        ), "Only game master can configure rate limits"
+        assert burst > 0, "Burst must be at least 1"
+        self.seasonal_reissue_interval.value = seasonal_reissue_interval
+        self.craft_interval.value = craft_interval
+        self.rate_limit_burst.value = burst
+
+    @abimethod()
+    def configure_fee_pooling(self, enabled: Bool) -> None:
+        """
+        Choose who pays inner transaction fees (only game master)
+        Enabled: inner fees are 0 and callers must cover them through the outer
+        fee. Disabled: the app account pays them
+        """
+        assert (
+            Txn.sender == self.game_master.value
+        ), "Only game master can configure fee pooling"
+        self.pool_inner_fees.value = enabled
+
     @abimethod(allow_actions=["NoOp", "OptIn"])
     def register_player(self, player_name: String) -> String:
-        """Register a new player in the game"""
+        """
+        Register a new player in the game
+        Opt in first, then call again as NoOp right after a payment to the app
+        covering the MBR of the name boxes
+        """
         # Check if this is an opt-in call
         if Txn.on_completion == OnCompleteAction.OptIn:
             # Initialize default values for local state when opting in
             self.player_level[Txn.sender] = UInt64(0)
             self.player_experience[Txn.sender] = UInt64(0)
             self.player_recovery_count[Txn.sender] = UInt64(0)
+            self.player_season[Txn.sender] = self.current_season.value
             self.is_registered[Txn.sender] = Bool(False)
+            self.action_clock[Txn.sender] = op.bzero(ACTION_CLOCK_SIZE)
             return String("Opted in to AlgoRealm!")
 
         # For NoOp calls, handle registration
@@ -64,17 +273,54 @@ class AlgoRealmGameManager(ARC4Contract):
         if self.is_registered[Txn.sender]:
             return String("Player already registered")
 
+        # Claim the name; the hashed key makes the uniqueness check one box read
+        assert player_name.bytes.length > 0, "Player name must not be empty"
+        assert (
+            player_name.bytes.length <= MAX_PLAYER_NAME_LENGTH
+        ), "Player name too long"
+        name_key = op.sha256(player_name.bytes)
+        assert name_key not in self.name_owners, "Player name already taken"
+
+        # The payment just before this call covers the MBR of both name boxes
+        assert Txn.group_index > 0, "Registration requires an MBR payment"
+        mbr_payment = gtxn.PaymentTransaction(Txn.group_index - 1)
+        assert (
+            mbr_payment.receiver == Global.current_application_address
+        ), "MBR payment must go to the game contract"
+        assert mbr_payment.sender == Txn.sender, "MBR payment must come from the player"
+        assert (
+            mbr_payment.amount
+            >= PLAYER_NAME_BOX_MBR + PLAYER_NAME_BYTE_MBR * player_name.bytes.length
+        ), "Insufficient MBR payment"
+        self.name_owners[name_key] = Txn.sender
+        self.player_names[Txn.sender] = player_name
+
         # Initialize player stats for actual registration
         self.player_level[Txn.sender] = UInt64(1)
         self.player_experience[Txn.sender] = UInt64(0)
         self.player_recovery_count[Txn.sender] = UInt64(0)
+        self.player_season[Txn.sender] = self.current_season.value
         self.is_registered[Txn.sender] = Bool(True)
 
         self.total_players.value += UInt64(1)
 
-        log(player_name.bytes)
+        arc4.emit(PlayerRegistered(Address(Txn.sender)))
         return String("Welcome to AlgoRealm!")
 
+    @abimethod(readonly=True)
+    def resolve_name(self, player_name: String) -> Address:
+        """Player registered under a name, or the zero address if none is"""
+        return Address(
+            self.name_owners.get(
+                op.sha256(player_name.bytes), default=Global.zero_address
+            )
+        )
+
+    @abimethod(readonly=True)
+    def name_of(self, player: Account) -> String:
+        """Name a player registered with, or an empty string if none"""
+        return self.player_names.get(player, default=String())
+
     @abimethod()
     def create_game_item(
         self,
@@ -87,10 +333,83 @@ class AlgoRealmGameManager(ARC4Contract):
         special_effect: String,
     ) -> UInt64:
         """Create a new game item as an ASA"""
+        return self._create_game_item(
+            recipient,
+            item_name,
+            item_type,
+            rarity,
+            attack_power,
+            defense_power,
+            special_effect,
+        )
+
+    @abimethod()
+    def create_game_item_with_key(
+        self,
+        request_key: Bytes,
+        recipient: Account,
+        item_name: String,
+        item_type: String,
+        rarity: String,
+        attack_power: UInt64,
+        defense_power: UInt64,
+        special_effect: String,
+    ) -> UInt64:
+        """
+        create_game_item that mints at most once per request key: a retried
+        request returns the asset ID its first successful call minted
+        """
+        assert Txn.sender == self.game_master.value, "Only game master can create items"
+        assert request_key != Bytes(), "Must provide a request key"
+        key = op.sha256(request_key)
+        minted_item, exists = self.minted_requests.maybe(key)
+        if exists:
+            return minted_item
+
+        item_id = self._create_game_item(
+            recipient,
+            item_name,
+            item_type,
+            rarity,
+            attack_power,
+            defense_power,
+            special_effect,
+        )
+        self.minted_requests[key] = item_id
+        return item_id
+
+    @abimethod(readonly=True)
+    def get_minted_item(self, request_key: Bytes) -> UInt64:
+        """Asset ID minted for a request key, or 0 if none was"""
+        return self.minted_requests.get(op.sha256(request_key), default=UInt64(0))
+
+    @subroutine
+    def _create_game_item(
+        self,
+        recipient: Account,
+        item_name: String,
+        item_type: String,
+        rarity: String,
+        attack_power: UInt64,
+        defense_power: UInt64,
+        special_effect: String,
+    ) -> UInt64:
         assert Txn.sender == self.game_master.value, "Only game master can create items"
         assert self.is_registered[recipient], "Recipient must be registered player"
 
-        # Create ASA for the item (simplified without complex metadata struct)
+        assert attack_power <= MAX_ITEM_STAT, "Attack power does not fit in uint16"
+        assert defense_power <= MAX_ITEM_STAT, "Defense power does not fit in uint16"
+        metadata = ItemMetadata(
+            item_type=arc4.UInt8(self._item_type_code(item_type)),
+            rarity=arc4.UInt8(self._rarity_code(rarity)),
+            attack_power=arc4.UInt16(attack_power),
+            defense_power=arc4.UInt16(defense_power),
+            effect_id=arc4.UInt16(self._intern_effect(special_effect)),
+            is_recovered=arc4.Bool(False),
+            recovery_count=arc4.UInt8(0),
+            original_creation_time=arc4.UInt64(Global.latest_timestamp),
+        )
+
         item_unit_name = String("ALGITEM")
         item_asa = itxn.AssetConfig(
             asset_name=item_name,
@@ -102,17 +421,24 @@ class AlgoRealmGameManager(ARC4Contract):
             reserve=Global.current_application_address,
             freeze=Global.current_application_address,
             clawback=Global.current_application_address,
-            fee=Global.min_txn_fee,  # Use minimum transaction fee
-            # Store basic item info in note field
-            note=op.concat(item_name.bytes, rarity.bytes),
+            fee=self._inner_fee(),
+            # The same compact record, so indexers need no box reads
+            note=Bytes(ITEM_NOTE_PREFIX) + metadata.bytes,
         ).submit()
+        self.item_metadata[item_asa.created_asset.id] = metadata.copy()
 
         # Note: Item is created but stays with the contract
         # Recipient needs to opt-in and then call claim_item to receive it
 
         self.total_items_created.value += UInt64(1)
 
-        log(Bytes(b"Item created"))
+        arc4.emit(
+            ItemMinted(
+                arc4.UInt64(item_asa.created_asset.id),
+                Address(recipient),
+                arc4.UInt8(ITEM_SOURCE_CREATED),
+            )
+        )
         return item_asa.created_asset.id
 
     @abimethod()
@@ -136,14 +462,23 @@ class AlgoRealmGameManager(ARC4Contract):
         )
         assert original_metadata_response[0], "Original item not found"
 
-        # Verify recovery quest completion (simplified - in real game, check quest system)
+        # Verify recovery quest completion with the quest system (proof is single use)
         assert recovery_quest_proof != Bytes(), "Must provide recovery quest proof"
+        assert self.quest_system_app.value.id != 0, "Quest system not configured"
+        proof_valid, _proof_txn = arc4.abi_call(
+            AlgoRealmQuestSystem.consume_recovery_proof,
+            Txn.sender,
+            recovery_quest_proof,
+            app_id=self.quest_system_app.value,
+            fee=self._inner_fee(),
+        )
+        assert proof_valid, "Recovery quest not completed"
 
-        # Check recovery limits
-        current_recovery_count = self.player_recovery_count[Txn.sender]
+        # Check recovery limits (counts reset lazily at the start of each season)
+        current_recovery_count = self._season_recovery_count(Txn.sender)
         assert (
             current_recovery_count < self.max_recovery_per_item.value
-        ), "Recovery limit reached - max 3 recoveries per player"
+        ), "Recovery limit reached - max 3 recoveries per player per season"
 
         # Get original item name for new ASA
         original_name_response = op.AssetParamsGet.asset_name(original_item_id)
@@ -162,17 +497,38 @@ class AlgoRealmGameManager(ARC4Contract):
             reserve=Global.current_application_address,
             freeze=Global.current_application_address,
             clawback=Global.current_application_address,
-            fee=Global.min_txn_fee,  # Use minimum transaction fee
+            fee=self._inner_fee(),
             note=recovery_note,
         ).submit()
 
+        # Recovered copies keep the original's compact metadata, marked recovered
+        if original_item_id.id in self.item_metadata:
+            recovered_metadata = self.item_metadata[original_item_id.id].copy()
+            assert (
+                recovered_metadata.recovery_count.native < MAX_RECOVERY_COUNT
+            ), "Item recovered too many times"
+            recovered_metadata.is_recovered = arc4.Bool(True)
+            recovered_metadata.recovery_count = arc4.UInt8(
+                recovered_metadata.recovery_count.native + 1
+            )
+            self.item_metadata[recovered_item_asa.created_asset.id] = (
+                recovered_metadata.copy()
+            )
+
         # Note: Recovered item stays with the contract
         # New recipient needs to opt-in and then call claim_item to receive it
 
-        # Update player recovery count
+        # Update player recovery count and stamp it with the current season
         self.player_recovery_count[Txn.sender] = current_recovery_count + UInt64(1)
-
-        log(Bytes(b"Item recovered"))
+        self.player_season[Txn.sender] = self.current_season.value
+
+        arc4.emit(
+            ItemRecovered(
+                arc4.UInt64(original_item_id.id),
+                arc4.UInt64(recovered_item_asa.created_asset.id),
+                Address(new_recipient),
+            )
+        )
         return recovered_item_asa.created_asset.id
 
     @abimethod()
@@ -185,6 +541,9 @@ class AlgoRealmGameManager(ARC4Contract):
         """
         assert self.is_registered[Txn.sender], "Only registered players can participate"
         assert participation_proof != Bytes(), "Must provide participation proof"
+        self._consume_rate_limit(
+            UInt64(ACTION_SEASONAL_REISSUE), self.seasonal_reissue_interval.value
+        )
 
         # Create seasonal item based on event
         seasonal_item_name = String("SEASONAL_ITEM")
@@ -198,14 +557,22 @@ class AlgoRealmGameManager(ARC4Contract):
             default_frozen=False,
             manager=Global.current_application_address,
             reserve=Global.current_application_address,
-            fee=Global.min_txn_fee,  # Use minimum transaction fee
+            freeze=Global.current_application_address,
+            clawback=Global.current_application_address,
+            fee=self._inner_fee(),
             note=seasonal_note,
         ).submit()
 
         # Note: Seasonal item stays with the contract
         # Recipient needs to opt-in and then call claim_item to receive it
 
-        log(Bytes(b"Seasonal item issued"))
+        arc4.emit(
+            ItemMinted(
+                arc4.UInt64(seasonal_asa.created_asset.id),
+                Address(recipient),
+                arc4.UInt8(ITEM_SOURCE_SEASONAL),
+            )
+        )
         return seasonal_asa.created_asset.id
 
     @abimethod()
@@ -217,6 +584,7 @@ class AlgoRealmGameManager(ARC4Contract):
         Demonstrates atomic transactions
         """
         assert self.is_registered[Txn.sender], "Only registered players can craft"
+        self._consume_rate_limit(UInt64(ACTION_CRAFT_ITEMS), self.craft_interval.value)
 
         # Verify player owns both materials (simplified check)
         # In full implementation, verify asset holdings
@@ -231,7 +599,10 @@ class AlgoRealmGameManager(ARC4Contract):
             decimals=UInt64(0),
             default_frozen=False,
             manager=Global.current_application_address,
-            fee=Global.min_txn_fee,  # Use minimum transaction fee
+            reserve=Global.current_application_address,
+            freeze=Global.current_application_address,
+            clawback=Global.current_application_address,
+            fee=self._inner_fee(),
             note=Bytes(b"CRAFTED_ITEM"),
         ).submit()
 
@@ -239,9 +610,224 @@ class AlgoRealmGameManager(ARC4Contract):
         # Player needs to opt-in and then call claim_item to receive it
         # Note: In full implementation, would destroy/transfer material ASAs here
 
-        log(Bytes(b"Item crafted"))
+        arc4.emit(
+            ItemMinted(
+                arc4.UInt64(crafted_asa.created_asset.id),
+                Address(Txn.sender),
+                arc4.UInt8(ITEM_SOURCE_CRAFTED),
+            )
+        )
         return crafted_asa.created_asset.id
 
+    @abimethod()
+    def create_item_stack(self, item_type: String, rarity: String) -> UInt64:
+        """
+        Mint the fungible ASA for a stackable item template (only game master)
+        Common consumables and materials share one ASA per type and rarity
+        instead of one ASA per item; unique items still use create_game_item.
+        Returns the existing ASA if the template already has one
+        """
+        assert (
+            Txn.sender == self.game_master.value
+        ), "Only game master can create item stacks"
+
+        stack_key = self._stack_key(item_type, rarity)
+        if stack_key in self.item_stacks:
+            return self.item_stacks[stack_key]
+
+        stack_name = item_type.bytes + b":" + rarity.bytes
+        assert stack_name.length <= MAX_ASSET_NAME_LENGTH, "Stack name too long"
+        stack_asa = itxn.AssetConfig(
+            asset_name=stack_name,
+            unit_name=String("ALGSTACK"),
+            total=UInt64(ITEM_STACK_SUPPLY),
+            decimals=UInt64(0),
+            default_frozen=False,
+            manager=Global.current_application_address,
+            reserve=Global.current_application_address,
+            freeze=Global.current_application_address,
+            clawback=Global.current_application_address,
+            fee=self._inner_fee(),
+            note=b"STACK_" + stack_name,
+        ).submit()
+
+        self.item_stacks[stack_key] = stack_asa.created_asset.id
+        arc4.emit(
+            ItemStackCreated(
+                arc4.UInt64(stack_asa.created_asset.id),
+                arc4.UInt64(ITEM_STACK_SUPPLY),
+            )
+        )
+        return stack_asa.created_asset.id
+
+    @abimethod()
+    def dispense_stack_items(
+        self, recipient: Account, item_type: String, rarity: String, amount: UInt64
+    ) -> UInt64:
+        """
+        Send units of a stackable item to a registered player (only game master)
+        The recipient opts in to each template's ASA once, not once per item
+        """
+        assert (
+            Txn.sender == self.game_master.value
+        ), "Only game master can dispense items"
+        assert self.is_registered[recipient], "Recipient must be registered player"
+        assert amount > 0, "Amount must be positive"
+
+        stack_key = self._stack_key(item_type, rarity)
+        assert stack_key in self.item_stacks, "Item stack does not exist"
+        stack_asset = Asset(self.item_stacks[stack_key])
+
+        itxn.AssetTransfer(
+            asset_receiver=recipient,
+            asset_amount=amount,
+            xfer_asset=stack_asset,
+            fee=self._inner_fee(),
+        ).submit()
+
+        arc4.emit(
+            StackItemsDispensed(
+                arc4.UInt64(stack_asset.id), Address(recipient), arc4.UInt64(amount)
+            )
+        )
+        return stack_asset.id
+
+    @abimethod()
+    def recycle_items(
+        self, items: DynamicArray[arc4.UInt64], holders: DynamicArray[Address]
+    ) -> UInt64:
+        """
+        Destroy abandoned or expired unique items to release their MBR
+        (only game master)
+        Items held by players are clawed back first; each item adds one or two
+        inner transactions, submitted in groups of up to 16. Inner fees are
+        covered by the outer transaction fee (see item_recycler.py)
+        """
+        assert (
+            Txn.sender == self.game_master.value
+        ), "Only game master can recycle items"
+        assert items.length == holders.length, "Items and holders arrays must match"
+        assert items.length > 0, "Nothing to recycle"
+
+        app_address = Global.current_application_address
+        group_size = UInt64(0)
+        clawed_back = UInt64(0)
+        for i in urange(items.length):
+            item = Asset(items[i].native)
+            holder = holders[i].native
+            assert item.creator == app_address, "Item was not minted by AlgoRealm"
+            assert item.total == 1, "Only unique items can be recycled"
+
+            if holder != app_address:
+                # Items minted before every kind set the app as clawback
+                assert item.clawback == app_address, "Item cannot be clawed back"
+                self._next_inner_txn(group_size)
+                op.ITxnCreate.set_type_enum(TransactionType.AssetTransfer)
+                op.ITxnCreate.set_xfer_asset(item)
+                op.ITxnCreate.set_asset_sender(holder)
+                op.ITxnCreate.set_asset_receiver(app_address)
+                op.ITxnCreate.set_asset_amount(1)
+                op.ITxnCreate.set_fee(0)  # Covered by the outer transaction fee
+                group_size += 1
+                clawed_back += 1
+
+            # Release the metadata box along with the ASA
+            if item.id in self.item_metadata:
+                del self.item_metadata[item.id]
+
+            # An asset config with only the asset set destroys it
+            self._next_inner_txn(group_size)
+            op.ITxnCreate.set_type_enum(TransactionType.AssetConfig)
+            op.ITxnCreate.set_config_asset(item)
+            op.ITxnCreate.set_fee(0)  # Covered by the outer transaction fee
+            group_size += 1
+
+            # Leave room for the next item's clawback and destroy
+            if group_size >= MAX_INNER_GROUP_SIZE - 1 or i + 1 == items.length:
+                op.ITxnCreate.submit()
+                group_size = UInt64(0)
+
+        self.total_items_recycled.value += items.length
+        arc4.emit(ItemsRecycled(arc4.UInt64(items.length), arc4.UInt64(clawed_back)))
+        return items.length
+
+    @subroutine
+    def _inner_fee(self) -> UInt64:
+        # 0 draws on the fee credit pooled by the outer transaction
+        if self.pool_inner_fees.value:
+            return UInt64(0)
+        return Global.min_txn_fee
+
+    @subroutine
+    def _next_inner_txn(self, group_size: UInt64) -> None:
+        if group_size == 0:
+            op.ITxnCreate.begin()
+        else:
+            op.ITxnCreate.next()
+
+    @abimethod(readonly=True)
+    def get_item_stack(self, item_type: String, rarity: String) -> UInt64:
+        """Get the ASA of a stackable item template, or 0 if it has none"""
+        return self.item_stacks.get(
+            self._stack_key(item_type, rarity), default=UInt64(0)
+        )
+
+    @subroutine
+    def _stack_key(self, item_type: String, rarity: String) -> Bytes:
+        return op.sha256(item_type.bytes + b":" + rarity.bytes)
+
+    @abimethod(readonly=True)
+    def get_item_metadata(self, item_id: UInt64) -> ItemMetadata:
+        """Get the compact metadata of a unique item"""
+        assert item_id in self.item_metadata, "Item has no metadata"
+        return self.item_metadata[item_id]
+
+    @abimethod(readonly=True)
+    def get_effect(self, effect_id: UInt64) -> String:
+        """Get the text of an interned special effect ("" for no effect)"""
+        return self.effect_table.get(effect_id, default=String())
+
+    @subroutine
+    def _intern_effect(self, effect: String) -> UInt64:
+        """ID of effect in the effect table, adding it on first use"""
+        if effect == "":
+            return UInt64(NO_EFFECT)
+        effect_key = op.sha256(effect.bytes)
+        if effect_key in self.effect_ids:
+            return self.effect_ids[effect_key]
+
+        effect_id = self.total_effects.value + 1
+        assert effect_id <= MAX_ITEM_STAT, "Effect table is full"
+        self.total_effects.value = effect_id
+        self.effect_ids[effect_key] = effect_id
+        self.effect_table[effect_id] = effect
+        return effect_id
+
+    @subroutine
+    def _item_type_code(self, item_type: String) -> UInt64:
+        if item_type == "weapon" or item_type == "Weapon":
+            return UInt64(ITEM_TYPE_WEAPON)
+        if item_type == "armor" or item_type == "Armor":
+            return UInt64(ITEM_TYPE_ARMOR)
+        if item_type == "consumable" or item_type == "Consumable":
+            return UInt64(ITEM_TYPE_CONSUMABLE)
+        if item_type == "badge" or item_type == "Badge":
+            return UInt64(ITEM_TYPE_BADGE)
+        # Rejected rather than stored as OTHER, which would lose the name
+        assert item_type == "other" or item_type == "Other", "Unknown item type"
+        return UInt64(ITEM_TYPE_OTHER)
+
+    @subroutine
+    def _rarity_code(self, rarity: String) -> UInt64:
+        if rarity == "common" or rarity == "Common":
+            return UInt64(RARITY_COMMON)
+        if rarity == "rare" or rarity == "Rare":
+            return UInt64(RARITY_RARE)
+        if rarity == "epic" or rarity == "Epic":
+            return UInt64(RARITY_EPIC)
+        assert rarity == "legendary" or rarity == "Legendary", "Unknown rarity"
+        return UInt64(RARITY_LEGENDARY)
+
     @abimethod(readonly=True)
     def get_player_stats(self, player: Account) -> tuple[UInt64, UInt64, UInt64]:
         """Get player statistics"""
@@ -249,17 +835,20 @@ class AlgoRealmGameManager(ARC4Contract):
         return (
             self.player_level[player],
             self.player_experience[player],
-            self.player_recovery_count[player],
+            self._season_recovery_count(player),
         )
 
     @abimethod()
     def advance_season(self) -> UInt64:
-        """Advance to next season (only game master)"""
+        """
+        Advance to next season (only game master)
+        Per-player season counters reset lazily on their next use
+        """
         assert (
             Txn.sender == self.game_master.value
         ), "Only game master can advance season"
         self.current_season.value += 1
-        log(Bytes(b"Season advanced"))
+        arc4.emit(SeasonAdvanced(arc4.UInt64(self.current_season.value)))
         return self.current_season.value
 
     @abimethod(readonly=True)
@@ -283,20 +872,94 @@ class AlgoRealmGameManager(ARC4Contract):
         manager_response = op.AssetParamsGet.asset_manager(item_id)
         assert manager_response[0], "Asset not found"
         # Note: In production, should verify asset is managed by this contract
+        # Stackable items are sent with dispense_stack_items, never claimed
+        total, _exists = op.AssetParamsGet.asset_total(item_id)
+        assert total == 1, "Stackable items cannot be claimed"
 
         # Transfer item to the player
         itxn.AssetTransfer(
             asset_receiver=Txn.sender,
             asset_amount=UInt64(1),
             xfer_asset=item_id,
-            fee=Global.min_txn_fee,
+            fee=self._inner_fee(),
         ).submit()
 
-        log(Bytes(b"Item claimed"))
+        arc4.emit(ItemClaimed(arc4.UInt64(item_id.id), Address(Txn.sender)))
         return String("Item successfully claimed!")
 
+    @abimethod()
+    def deliver_item(self, item_id: Asset, player: Account) -> None:
+        """
+        Transfer an AlgoRealm item to a player (only game master).
+        The player's opt-in usually precedes this call in the same group,
+        signed with the AlgoRealmItemOptIn delegated logic signature.
+        """
+        assert (
+            Txn.sender == self.game_master.value
+        ), "Only game master can deliver items"
+        assert self.is_registered[player], "Player not registered"
+
+        creator, exists = op.AssetParamsGet.asset_creator(item_id)
+        assert exists, "Asset not found"
+        assert (
+            creator == Global.current_application_address
+        ), "Item was not created by AlgoRealm"
+        total, _exists = op.AssetParamsGet.asset_total(item_id)
+        assert total == 1, "Stackable items cannot be claimed"
+
+        itxn.AssetTransfer(
+            asset_receiver=player,
+            asset_amount=UInt64(1),
+            xfer_asset=item_id,
+            fee=self._inner_fee(),
+        ).submit()
+
+        arc4.emit(ItemClaimed(arc4.UInt64(item_id.id), Address(player)))
+
     @abimethod(readonly=True)
     def get_recovery_status(self, player: Account) -> tuple[UInt64, UInt64]:
         """Get player's current recovery count and max allowed recoveries"""
         assert self.is_registered[player], "Player not registered"
-        return self.player_recovery_count[player], self.max_recovery_per_item.value
+        return self._season_recovery_count(player), self.max_recovery_per_item.value
+
+    @abimethod(readonly=True)
+    def get_action_cooldown(self, player: Account, action: UInt64) -> UInt64:
+        """Seconds until player may next take a rate-limited action (0 = now)"""
+        assert action < ACTION_CLOCK_SIZE // 8, "Unknown action"
+        interval = self.seasonal_reissue_interval.value
+        if action == ACTION_CRAFT_ITEMS:
+            interval = self.craft_interval.value
+
+        clock = self.action_clock.get(player, op.bzero(ACTION_CLOCK_SIZE))
+        earliest = op.extract_uint64(clock, action * 8) + interval
+        allowance = interval * self.rate_limit_burst.value
+        now = Global.latest_timestamp
+        if earliest <= now + allowance:
+            return UInt64(0)
+        return earliest - now - allowance
+
+    @subroutine
+    def _consume_rate_limit(self, action: UInt64, interval: UInt64) -> None:
+        # Token bucket kept as a single "theoretical arrival time" per action:
+        # each use pushes it interval seconds ahead of max(it, now), and a use
+        # is allowed while it stays within burst intervals of now. One read,
+        # one compare and one write, however many actions the player takes
+        clock = self.action_clock.get(Txn.sender, op.bzero(ACTION_CLOCK_SIZE))
+        offset = action * 8
+        now = Global.latest_timestamp
+        arrival = op.extract_uint64(clock, offset)
+        if arrival < now:
+            arrival = now
+        arrival += interval
+        assert (
+            arrival - now <= interval * self.rate_limit_burst.value
+        ), "Rate limit exceeded - try again later"
+        self.action_clock[Txn.sender] = op.replace(clock, offset, op.itob(arrival))
+
+    @subroutine
+    def _season_recovery_count(self, player: Account) -> UInt64:
+        # Counters stamped with an earlier season are stale and count as zero,
+        # so advance_season never has to touch player accounts
+        if self.player_season.get(player, UInt64(0)) != self.current_season.value:
+            return UInt64(0)
+        return self.player_recovery_count[player]
@@ -1,10 +1,38 @@
 import logging
+import os
+from typing import TYPE_CHECKING, cast
 
 import algokit_utils
 from algosdk.transaction import OnComplete
 
+from smart_contracts.algorealm.params_cache import shared_algorand_client
+
+if TYPE_CHECKING:
+    from smart_contracts.artifacts.algorealm.algo_realm_guild_system_client import (
+        AlgoRealmGuildSystemClient,
+    )
+    from smart_contracts.artifacts.algorealm.algo_realm_quest_system_client import (
+        AlgoRealmQuestSystemClient,
+    )
+
 logger = logging.getLogger(__name__)
 
+# MBR of the guild leaderboard box, mirrors guild_system.LEADERBOARD_BOX_MBR
+GUILD_LEADERBOARD_BOX_MBR = 198_900
+# MBR of a player registration, mirrors contract.PLAYER_NAME_BOX_MBR and
+# contract.PLAYER_NAME_BYTE_MBR
+PLAYER_NAME_BOX_MBR = 45_000
+PLAYER_NAME_BYTE_MBR = 400
+GAME_MASTER_NAME = "GameMaster"
+
+
+def player_name_mbr(player_name: str) -> algokit_utils.AlgoAmount:
+    """Payment to group right before the register_player NoOp call"""
+    return algokit_utils.AlgoAmount(
+        micro_algo=PLAYER_NAME_BOX_MBR
+        + PLAYER_NAME_BYTE_MBR * len(player_name.encode())
+    )
+
 
 def deploy() -> None:
     """Deploy the AlgoRealm Gaming System"""
@@ -12,7 +40,7 @@ def deploy() -> None:
         AlgoRealmGameManagerFactory,
     )
 
-    algorand = algokit_utils.AlgorandClient.from_environment()
+    algorand = shared_algorand_client()
     deployer = algorand.account.from_environment("DEPLOYER")
 
     # Create the game manager factory
@@ -55,16 +83,18 @@ def deploy() -> None:
         logger.info(f"📍 App Address: {app_client.app_address}")
         logger.info(f"👑 Game Master: {deployer.address}")
 
-        # Fund the contract to cover inner transaction fees
+        # Fund the contract for the MBR of minted items and boxes, and for
+        # inner transaction fees unless they are pooled (POOL_INNER_FEES)
         logger.info("💰 Funding contract for inner transactions...")
         try:
             fund_amount = 1_000_000  # 1 ALGO in microAlgos for inner transaction fees
-            fund_txn = algorand.create_transaction.payment(
-                sender=deployer.address,
-                receiver=app_client.app_address,
-                amount=fund_amount,
+            fund_result = algorand.send.payment(
+                algokit_utils.PaymentParams(
+                    amount=algokit_utils.AlgoAmount(micro_algo=fund_amount),
+                    sender=deployer.address,
+                    receiver=app_client.app_address,
+                )
             )
-            fund_result = algorand.send.payment(fund_txn)
             logger.info(f"✅ Contract funded with {fund_amount} microAlgos")
             logger.info(f"📝 Funding Transaction ID: {fund_result.tx_id}")
         except Exception as e:
@@ -75,7 +105,7 @@ def deploy() -> None:
             logger.info("🔐 Opting in to the application...")
             # First opt-in to the application
             opt_in_result = app_client.send.register_player(
-                ("GameMaster",),
+                (GAME_MASTER_NAME,),
                 params=algokit_utils.CommonAppCallParams(
                     on_complete=OnComplete.OptInOC
                 ),
@@ -85,9 +115,23 @@ def deploy() -> None:
 
             # Then register as Game Master
             logger.info("👑 Registering as Game Master...")
-            register_result = app_client.send.register_player(("GameMaster",))
-            logger.info(f"✅ Game Master registered: {register_result.abi_return}")
-            logger.info(f"📝 Registration Transaction ID: {register_result.tx_id}")
+            register_result = (
+                app_client.new_group()
+                .add_transaction(
+                    algorand.create_transaction.payment(
+                        algokit_utils.PaymentParams(
+                            amount=player_name_mbr(GAME_MASTER_NAME),
+                            sender=deployer.address,
+                            receiver=app_client.app_address,
+                        )
+                    )
+                )
+                .register_player((GAME_MASTER_NAME,))
+                .send()
+            )
+            welcome = cast(str, register_result.returns[-1].value)
+            logger.info(f"✅ Game Master registered: {welcome}")
+            logger.info(f"📝 Registration Transaction ID: {register_result.tx_ids[-1]}")
 
         except Exception as e:
             logger.warning(f"⚠️ Could not auto-register Game Master: {e}")
@@ -97,11 +141,27 @@ def deploy() -> None:
         logger.info("📦 AlgoRealm Game Manager already deployed")
         logger.info(f"📱 App ID: {app_client.app_id}")
 
+    quest_client, guild_client = deploy_systems(algorand, deployer.address)
+
+    # Wire the systems together so recoveries and guild joins are checked on-chain
+    logger.info("🔗 Linking quest and guild systems to the Game Manager...")
+    app_client.send.configure_systems(args=(quest_client.app_id, guild_client.app_id))
+    quest_client.send.set_game_manager(args=(app_client.app_id,))
+    guild_client.send.set_game_manager(args=(app_client.app_id,))
+
+    # Optionally make callers cover inner fees so minting no longer drains the app
+    pool_inner_fees = os.getenv("POOL_INNER_FEES", "").lower() in ("1", "true")
+    app_client.send.configure_fee_pooling(args=(pool_inner_fees,))
+    if pool_inner_fees:
+        logger.info("💸 Inner transaction fees are pooled into callers' outer fees")
+
     # Save deployment info for frontend
     deployment_info = {
         "app_id": app_client.app_id,
         "app_address": app_client.app_address,
         "game_master": deployer.address,
+        "quest_app_id": quest_client.app_id,
+        "guild_app_id": guild_client.app_id,
         "network": "localnet",
     }
 
@@ -114,7 +174,67 @@ def deploy() -> None:
     logger.info("🎉 AlgoRealm deployment complete!")
     logger.info("🌐 Ready for frontend integration!")
 
-    return app_client, result
+
+def deploy_systems(
+    algorand: algokit_utils.AlgorandClient, deployer_address: str
+) -> tuple[
+    "AlgoRealmQuestSystemClient",
+    "AlgoRealmGuildSystemClient",
+]:
+    """Deploy the quest and guild systems compiled alongside the Game Manager"""
+    from smart_contracts.artifacts.algorealm.algo_realm_guild_system_client import (
+        AlgoRealmGuildSystemFactory,
+    )
+    from smart_contracts.artifacts.algorealm.algo_realm_quest_system_client import (
+        AlgoRealmQuestSystemFactory,
+    )
+
+    quest_factory = algorand.client.get_typed_app_factory(
+        AlgoRealmQuestSystemFactory, default_sender=deployer_address
+    )
+    quest_client, _ = quest_factory.deploy(
+        on_update=algokit_utils.OnUpdate.AppendApp,
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+    )
+    logger.info(f"🗺️ Quest System App ID: {quest_client.app_id}")
+
+    guild_factory = algorand.client.get_typed_app_factory(
+        AlgoRealmGuildSystemFactory, default_sender=deployer_address
+    )
+    guild_client, guild_result = guild_factory.deploy(
+        on_update=algokit_utils.OnUpdate.AppendApp,
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+    )
+    logger.info(f"🛡️ Guild System App ID: {guild_client.app_id}")
+
+    if guild_result.operation_performed in [
+        algokit_utils.OperationPerformed.Create,
+        algokit_utils.OperationPerformed.Replace,
+    ]:
+        # Fund the app account's own minimum balance
+        algorand.send.payment(
+            algokit_utils.PaymentParams(
+                amount=algokit_utils.AlgoAmount(algo=1),
+                sender=deployer_address,
+                receiver=guild_client.app_address,
+            )
+        )
+        # The deployer pays for the leaderboard box up front
+        guild_client.send.create_leaderboard(
+            args=(
+                algorand.create_transaction.payment(
+                    algokit_utils.PaymentParams(
+                        amount=algokit_utils.AlgoAmount(
+                            micro_algo=GUILD_LEADERBOARD_BOX_MBR
+                        ),
+                        sender=deployer_address,
+                        receiver=guild_client.app_address,
+                    )
+                ),
+            )
+        )
+
+    return quest_client, guild_client
 
 
 if __name__ == "__main__":
@@ -0,0 +1,138 @@
+"""Decode AlgoRealm ARC-28 events from app call logs using the ARC-56 specs"""
+
+import dataclasses
+import functools
+import json
+import struct
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TypedDict, cast
+
+from algosdk import abi, encoding
+
+APP_SPEC_DIR = Path(__file__).parent.parent / "artifacts" / "algorealm"
+
+# Length of the event selector prefixed to every ARC-28 log
+SELECTOR_LENGTH = 4
+
+# struct formats of the static ABI types AlgoRealm events are built from
+_STATIC_FORMATS = {
+    "uint8": "B",
+    "uint16": "H",
+    "uint32": "I",
+    "uint64": "Q",
+    "byte": "B",
+    "bool": "?",
+    "address": "32s",
+}
+
+
+class _Arc56EventArg(TypedDict, total=False):
+    type: str
+    name: str
+
+
+class _Arc56Event(TypedDict):
+    name: str
+    args: list[_Arc56EventArg]
+
+
+class _AppSpec(TypedDict):
+    events: list[_Arc56Event]
+
+
+@dataclasses.dataclass(frozen=True)
+class Event:
+    """One decoded ARC-28 event"""
+
+    name: str
+    fields: dict[str, object]
+
+
+@dataclasses.dataclass(frozen=True)
+class EventSpec:
+    """
+    Layout of one ARC-28 event.
+    Events whose fields are all fixed-size are unpacked with a precompiled
+    struct format at fixed offsets; anything else falls back to ABI decoding.
+    """
+
+    name: str
+    arg_names: tuple[str, ...]
+    arg_types: tuple[str, ...]
+
+    @classmethod
+    def from_arc56(cls, event: _Arc56Event) -> "EventSpec":
+        args = event["args"]
+        return cls(
+            name=event["name"],
+            arg_names=tuple(
+                arg.get("name") or f"field{i}" for i, arg in enumerate(args)
+            ),
+            arg_types=tuple(arg["type"] for arg in args),
+        )
+
+    @property
+    def signature(self) -> str:
+        return f"{self.name}({','.join(self.arg_types)})"
+
+    @functools.cached_property
+    def selector(self) -> bytes:
+        return event_selector(self.signature)
+
+    @functools.cached_property
+    def layout(self) -> struct.Struct | None:
+        """Fixed-offset layout of the event body, or None if any field is dynamic"""
+        formats = [_STATIC_FORMATS.get(arg_type) for arg_type in self.arg_types]
+        if None in formats:
+            return None
+        return struct.Struct(">" + "".join(formats))  # type: ignore[arg-type]
+
+    def decode(self, body: bytes) -> Event:
+        """Decode an event body (the log without its selector)"""
+        layout = self.layout
+        if layout is not None:
+            unpacked: tuple[object, ...] = layout.unpack(body)
+            values = [
+                _encode_address(value) if arg_type == "address" else value
+                for arg_type, value in zip(self.arg_types, unpacked, strict=True)
+            ]
+        else:
+            tuple_type = abi.ABIType.from_string(f"({','.join(self.arg_types)})")
+            values = cast(list[object], tuple_type.decode(body))
+        return Event(self.name, dict(zip(self.arg_names, values, strict=True)))
+
+
+def event_selector(signature: str) -> bytes:
+    """ARC-28 selector: the first 4 bytes of sha512/256 of the event signature"""
+    return cast(bytes, encoding.checksum(signature.encode()))[:SELECTOR_LENGTH]
+
+
+def _encode_address(address_bytes: object) -> str:
+    return cast(str, encoding.encode_address(address_bytes))
+
+
+class EventDecoder:
+    """Maps log selectors to AlgoRealm event specs"""
+
+    def __init__(self, specs: Iterable[EventSpec]) -> None:
+        self._specs = {spec.selector: spec for spec in specs}
+
+    @classmethod
+    def from_app_specs(cls, spec_dir: Path = APP_SPEC_DIR) -> "EventDecoder":
+        """Collect the events declared by every ARC-56 spec in spec_dir"""
+        specs: list[EventSpec] = []
+        for spec_path in sorted(spec_dir.glob("*.arc56.json")):
+            app_spec = cast(_AppSpec, json.loads(spec_path.read_text()))
+            specs.extend(EventSpec.from_arc56(event) for event in app_spec["events"])
+        return cls(specs)
+
+    def decode(self, log: bytes) -> Event | None:
+        """Decode a log entry, or None if it is not a known event"""
+        spec = self._specs.get(log[:SELECTOR_LENGTH])
+        if spec is None:
+            return None
+        layout = spec.layout
+        if layout is not None and len(log) != SELECTOR_LENGTH + layout.size:
+            return None
+        return spec.decode(log[SELECTOR_LENGTH:])
@@ -0,0 +1,368 @@
+"""Follow algod blocks and index AlgoRealm app activity into SQLite"""
+
+import argparse
+import base64
+import dataclasses
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import cast
+
+from algosdk import abi
+from algosdk.v2client import algod
+
+from smart_contracts.algorealm.algod_types import (
+    ApplicationInfo,
+    BlockResponse,
+    BlockTransaction,
+    BlockTxids,
+    EvalDelta,
+    NodeStatus,
+    TransactionFields,
+)
+from smart_contracts.algorealm.async_client import ABI_RETURN_PREFIX, load_methods
+from smart_contracts.algorealm.event_decoder import Event, EventDecoder
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path("algorealm_events.db")
+DEPLOYMENT_INFO_PATH = Path("deployment_info.json")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    round INTEGER NOT NULL,
+    txid TEXT NOT NULL,
+    method TEXT NOT NULL,
+    sender TEXT NOT NULL,
+    player TEXT,
+    asset_id INTEGER,
+    season INTEGER NOT NULL,
+    message TEXT,
+    return_value TEXT,
+    arc28_events TEXT
+);
+CREATE INDEX IF NOT EXISTS events_player ON events (player);
+CREATE INDEX IF NOT EXISTS events_asset ON events (asset_id);
+CREATE INDEX IF NOT EXISTS events_season ON events (season);
+
+CREATE TABLE IF NOT EXISTS items (
+    asset_id INTEGER PRIMARY KEY,
+    method TEXT NOT NULL,
+    player TEXT,
+    round INTEGER NOT NULL,
+    season INTEGER NOT NULL,
+    txid TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_player ON items (player);
+CREATE INDEX IF NOT EXISTS items_season ON items (season);
+
+CREATE TABLE IF NOT EXISTS players (
+    address TEXT PRIMARY KEY,
+    name TEXT,
+    registered_round INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS cursor (
+    app_id INTEGER PRIMARY KEY,
+    next_round INTEGER NOT NULL,
+    season INTEGER NOT NULL
+);
+"""
+
+
+@dataclasses.dataclass
+class AppCallEvent:
+    """One decoded top-level AlgoRealm app call"""
+
+    round: int
+    txid: str
+    method: str
+    sender: str
+    player: str | None
+    arguments: dict[str, object]
+    created_assets: list[int]
+    referenced_asset: int | None
+    events: list[Event]
+    messages: list[str]
+    return_value: object
+
+    def recipient(self) -> str | None:
+        """Recipient named by an item mint event, falling back to the player"""
+        for event in self.events:
+            recipient = event.fields.get("recipient")
+            if isinstance(recipient, str):
+                return recipient
+        return self.player
+
+
+class EventStore:
+    """SQLite store of decoded AlgoRealm events, items and players"""
+
+    def __init__(self, path: Path = DEFAULT_DB_PATH) -> None:
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    def cursor(self, app_id: int) -> tuple[int, int] | None:
+        """(next_round, season) to resume from, if this app was indexed before"""
+        row: tuple[int, int] | None = self.db.execute(
+            "SELECT next_round, season FROM cursor WHERE app_id = ?", (app_id,)
+        ).fetchone()
+        return row
+
+    def save_round(
+        self, app_id: int, round_: int, season: int, events: list[AppCallEvent]
+    ) -> None:
+        """Write one round's events and advance the cursor atomically"""
+        with self.db:
+            for event in events:
+                asset_id = (
+                    event.created_assets[0]
+                    if event.created_assets
+                    else event.referenced_asset
+                )
+                arc28_events: list[dict[str, object]] = [
+                    {"name": e.name, "fields": e.fields} for e in event.events
+                ]
+                self.db.execute(
+                    "INSERT INTO events (round, txid, method, sender, player, asset_id,"
+                    " season, message, return_value, arc28_events)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        event.round,
+                        event.txid,
+                        event.method,
+                        event.sender,
+                        event.player,
+                        asset_id,
+                        season,
+                        "\n".join(event.messages) or None,
+                        json.dumps(event.return_value, default=str),
+                        json.dumps(arc28_events, default=str),
+                    ),
+                )
+                for created_asset in event.created_assets:
+                    self.db.execute(
+                        "INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            created_asset,
+                            event.method,
+                            event.recipient(),
+                            event.round,
+                            season,
+                            event.txid,
+                        ),
+                    )
+                if any(e.name == "PlayerRegistered" for e in event.events):
+                    self.db.execute(
+                        "INSERT OR IGNORE INTO players VALUES (?, ?, ?)",
+                        (event.sender, event.arguments.get("player_name"), event.round),
+                    )
+            self.db.execute(
+                "INSERT OR REPLACE INTO cursor VALUES (?, ?, ?)",
+                (app_id, round_ + 1, season),
+            )
+
+    def player_history(self, player: str) -> list[tuple[object, ...]]:
+        rows: list[tuple[object, ...]] = self.db.execute(
+            "SELECT round, method, asset_id, season FROM events WHERE player = ?"
+            " ORDER BY id",
+            (player,),
+        ).fetchall()
+        return rows
+
+    def item_history(self, asset_id: int) -> list[tuple[object, ...]]:
+        rows: list[tuple[object, ...]] = self.db.execute(
+            "SELECT round, method, player, season FROM events WHERE asset_id = ?"
+            " ORDER BY id",
+            (asset_id,),
+        ).fetchall()
+        return rows
+
+
+class EventIndexer:
+    """Follows blocks from algod and decodes AlgoRealm app calls"""
+
+    def __init__(
+        self,
+        algod_client: algod.AlgodClient,
+        app_id: int,
+        store: EventStore,
+        methods: dict[str, abi.Method] | None = None,
+        decoder: EventDecoder | None = None,
+    ) -> None:
+        self.algod = algod_client
+        self.app_id = app_id
+        self.store = store
+        self.decoder = decoder or EventDecoder.from_app_specs()
+        methods = methods or load_methods()
+        self.methods_by_selector = {
+            method.get_selector(): method for method in methods.values()
+        }
+
+    def run(self, from_round: int | None = None) -> None:
+        """Index blocks forever, resuming from the stored cursor"""
+        saved = self.store.cursor(self.app_id)
+        if from_round is not None:
+            next_round, season = from_round, self._current_season()
+        elif saved is not None:
+            next_round, season = saved
+        else:
+            next_round = cast(NodeStatus, self.algod.status())["last-round"]
+            season = self._current_season()
+
+        logger.info(f"📚 Indexing app {self.app_id} from round {next_round}")
+        last_round = cast(NodeStatus, self.algod.status())["last-round"]
+        while True:
+            while next_round <= last_round:
+                season = self.index_round(next_round, season)
+                next_round += 1
+            status = cast(NodeStatus, self.algod.status_after_block(last_round))
+            last_round = status["last-round"]
+
+    def index_round(self, round_: int, season: int) -> int:
+        """Index one block, returning the season in effect after it"""
+        block = cast(BlockResponse, self.algod.block_info(round_))["block"]
+        txids = cast(
+            BlockTxids, self.algod.algod_request("GET", f"/blocks/{round_}/txids")
+        )
+        events: list[AppCallEvent] = []
+        for stxn, txid in zip(
+            block.get("txns", []), txids.get("blockTxids") or [], strict=False
+        ):
+            event = self.decode_app_call(round_, txid, stxn)
+            if event is None:
+                continue
+            for arc28_event in event.events:
+                if arc28_event.name == "SeasonAdvanced":
+                    season = cast(int, arc28_event.fields["season"])
+            events.append(event)
+
+        self.store.save_round(self.app_id, round_, season, events)
+        if events:
+            logger.debug(f"Round {round_}: indexed {len(events)} AlgoRealm calls")
+        return season
+
+    def decode_app_call(
+        self, round_: int, txid: str, stxn: BlockTransaction
+    ) -> AppCallEvent | None:
+        txn = stxn["txn"]
+        if txn.get("type") != "appl" or txn.get("apid") != self.app_id:
+            return None
+        app_args = [base64.b64decode(arg) for arg in txn.get("apaa", [])]
+        if not app_args or app_args[0] not in self.methods_by_selector:
+            return None
+        method = self.methods_by_selector[app_args[0]]
+
+        eval_delta: EvalDelta = stxn.get("dt", {})
+        logs = [base64.b64decode(log) for log in eval_delta.get("lg", [])]
+        return_type = method.returns.type
+        return_value: object = None
+        events: list[Event] = []
+        messages: list[str] = []
+        for log in logs:
+            # Only abi.Returns.VOID is a plain string here
+            if log.startswith(ABI_RETURN_PREFIX) and isinstance(
+                return_type, abi.ABIType
+            ):
+                decoded: object = return_type.decode(log[len(ABI_RETURN_PREFIX) :])
+                return_value = decoded
+            elif (event := self.decoder.decode(log)) is not None:
+                events.append(event)
+            else:
+                messages.append(log.decode(errors="replace"))
+
+        sender = txn["snd"]
+        arguments = self._decode_arguments(txn, method, app_args)
+        references = self._first_references(method, arguments)
+        player = references.get(abi.ABIReferenceType.ACCOUNT)
+        referenced_asset = references.get(abi.ABIReferenceType.ASSET)
+        created_assets = [
+            inner["caid"] for inner in eval_delta.get("itx", []) if inner.get("caid")
+        ]
+        return AppCallEvent(
+            round=round_,
+            txid=txid,
+            method=method.name,
+            sender=sender,
+            player=player if isinstance(player, str) else sender,
+            arguments=arguments,
+            created_assets=created_assets,
+            referenced_asset=(
+                referenced_asset if isinstance(referenced_asset, int) else None
+            ),
+            events=events,
+            messages=messages,
+            return_value=return_value,
+        )
+
+    def _decode_arguments(
+        self, txn: TransactionFields, method: abi.Method, app_args: list[bytes]
+    ) -> dict[str, object]:
+        """ABI arguments by name, with account and asset references resolved"""
+        arguments: dict[str, object] = {}
+        for i, (arg, value) in enumerate(zip(method.args, app_args[1:], strict=False)):
+            name = _argument_name(arg, i)
+            if arg.type == abi.ABIReferenceType.ACCOUNT:
+                index = value[0]
+                arguments[name] = (
+                    txn["snd"] if index == 0 else txn.get("apat", [])[index - 1]
+                )
+            elif arg.type == abi.ABIReferenceType.ASSET:
+                arguments[name] = txn.get("apas", [])[value[0]]
+            elif isinstance(arg.type, abi.ABIType):
+                decoded: object = arg.type.decode(value)
+                arguments[name] = decoded
+        return arguments
+
+    def _first_references(
+        self, method: abi.Method, arguments: dict[str, object]
+    ) -> dict[str, object]:
+        """The first argument of each reference type (account, asset, application)"""
+        references: dict[str, object] = {}
+        for i, arg in enumerate(method.args):
+            if isinstance(arg.type, str) and arg.type not in references:
+                references[arg.type] = arguments.get(_argument_name(arg, i))
+        return references
+
+    def _current_season(self) -> int:
+        app = cast(ApplicationInfo, self.algod.application_info(self.app_id))
+        for item in app["params"].get("global-state", []):
+            if base64.b64decode(item["key"]) == b"current_season":
+                return item["value"].get("uint", 0)
+        return 1
+
+
+def _argument_name(arg: abi.Argument, index: int) -> str:
+    return arg.name or f"arg{index}"
+
+
+def _deployed_app_id() -> int:
+    deployment_info = cast(dict[str, int], json.loads(DEPLOYMENT_INFO_PATH.read_text()))
+    return deployment_info["app_id"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Index AlgoRealm events into SQLite")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB_PATH)
+    parser.add_argument("--app-id", type=int, default=None)
+    parser.add_argument("--from-round", type=int, default=None)
+    args = parser.parse_args()
+    db_path: Path = args.db
+    requested_app_id: int | None = args.app_id
+    from_round: int | None = args.from_round
+
+    import algokit_utils
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    app_id = requested_app_id or _deployed_app_id()
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    indexer = EventIndexer(algorand.client.algod, app_id, EventStore(db_path))
+    indexer.run(from_round)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
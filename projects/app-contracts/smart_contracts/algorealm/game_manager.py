@@ -57,7 +57,7 @@ class AlgoRealmGameManager(ARC4Contract):
         # Global game state
         self.total_players = GlobalState(UInt64(0))
         self.total_items_created = GlobalState(UInt64(0))
-        self.game_master = GlobalState(Account(Global.creator_address))
+        self.game_master = GlobalState(Global.creator_address)
         self.current_season = GlobalState(UInt64(1))
         self.max_recovery_per_item = GlobalState(UInt64(3))  # Max 3 recoveries per item
 
@@ -87,7 +87,7 @@ class AlgoRealmGameManager(ARC4Contract):
         self.total_players.value += 1
 
         log(f"Player {player_name} registered successfully!")
-        return f"Welcome to AlgoRealm, {player_name}!"
+        return String("Welcome to AlgoRealm, ") + player_name + "!"
 
     @abimethod()
     def create_game_item(
@@ -120,7 +120,7 @@ class AlgoRealmGameManager(ARC4Contract):
         # Create ASA for the item
         item_asa = itxn.AssetConfig(
             asset_name=item_name,
-            unit_name=f"ALG{item_type.upper()}",
+            unit_name=String("ALGITEM"),
             total=UInt64(1),  # Unique item
             decimals=UInt64(0),
             default_frozen=False,
@@ -166,7 +166,7 @@ class AlgoRealmGameManager(ARC4Contract):
         assert original_metadata_response[0], "Original item not found"
 
         # Verify recovery quest completion (simplified - in real game, check quest system)
-        assert len(recovery_quest_proof) > 0, "Must provide recovery quest proof"
+        assert recovery_quest_proof.length > 0, "Must provide recovery quest proof"
 
         # Check recovery limits
         player_stats = self.player_stats[Txn.sender]
@@ -190,7 +190,7 @@ class AlgoRealmGameManager(ARC4Contract):
             reserve=Global.current_application_address,
             freeze=Global.current_application_address,
             clawback=Global.current_application_address,
-            note=Bytes(b"RECOVERED_ITEM_" + recovery_quest_proof),
+            note=op.concat(Bytes(b"RECOVERED_ITEM_"), recovery_quest_proof),
         ).submit()
 
         # Transfer recovered item to new recipient
@@ -218,7 +218,7 @@ class AlgoRealmGameManager(ARC4Contract):
         Allows players to earn previous season items in new events
         """
         assert self.is_registered[Txn.sender], "Only registered players can participate"
-        assert len(participation_proof) > 0, "Must provide participation proof"
+        assert participation_proof.length > 0, "Must provide participation proof"
 
         # Create seasonal item based on event
         seasonal_item_name = f"{event_name}_Season_{self.current_season.value}"
@@ -231,7 +231,7 @@ class AlgoRealmGameManager(ARC4Contract):
             default_frozen=False,
             manager=Global.current_application_address,
             reserve=Global.current_application_address,
-            note=Bytes(b"SEASONAL_" + participation_proof),
+            note=op.concat(Bytes(b"SEASONAL_"), participation_proof),
         ).submit()
 
         # Transfer to recipient
@@ -0,0 +1,83 @@
+"""Build atomic guild reward payouts for AlgoRealmGuildSystem"""
+
+from typing import cast
+
+import algokit_utils
+
+DISTRIBUTE_METHOD = "distribute_guild_rewards(uint64,address[],uint64[])string"
+
+# Foreign references (accounts, assets, apps, boxes) one app call may carry,
+# of which at most 4 may be accounts
+MAX_CALL_REFERENCES = 8
+MAX_CALL_ACCOUNTS = 4
+# Every call references the reward asset and the guild's reward ledger box
+SHARED_REFERENCES = 2
+# Each member needs only their account: player_guild_id is local state of the
+# called app, and the reward asset is already shared by the group
+REFERENCES_PER_MEMBER = 1
+REWARDS_PER_CALL = min(
+    MAX_CALL_ACCOUNTS,
+    (MAX_CALL_REFERENCES - SHARED_REFERENCES) // REFERENCES_PER_MEMBER,
+)
+# Maximum number of transactions in an outer group
+MAX_GROUP_SIZE = 16
+
+
+def chunk_rewards(
+    members: list[str], amounts: list[int], chunk_size: int = REWARDS_PER_CALL
+) -> list[tuple[list[str], list[int]]]:
+    """Split a payout into per-call chunks of at most chunk_size transfers"""
+    if len(members) != len(amounts):
+        raise ValueError("Members and amounts must have the same length")
+    return [
+        (members[start : start + chunk_size], amounts[start : start + chunk_size])
+        for start in range(0, len(members), chunk_size)
+    ]
+
+
+def distribute_rewards(
+    app_client: algokit_utils.AppClient,
+    reward_asa_id: int,
+    payouts: dict[str, int],
+    sender: str | None = None,
+) -> algokit_utils.SendAtomicTransactionComposerResults:
+    """
+    Pay every member in a single atomic group.
+    Each app call distributes one chunk; inner transaction fees are pooled
+    onto the outer calls and resources are populated across the whole group.
+    A group holds at most MAX_GROUP_SIZE * REWARDS_PER_CALL (64) members, so a
+    larger guild (e.g. 100 members) must be paid as several groups, which are
+    not atomic with each other. The contract batching transfers into inner
+    groups of 16 does not raise this limit: member accounts must still be
+    referenced by the outer calls.
+    """
+    chunks = chunk_rewards(list(payouts), list(payouts.values()))
+    if len(chunks) > MAX_GROUP_SIZE:
+        raise ValueError(
+            f"Payout of {len(payouts)} members does not fit in one group "
+            f"(max {MAX_GROUP_SIZE * REWARDS_PER_CALL}), split it across groups"
+        )
+
+    inner_fee = _inner_fee(app_client)
+    composer = app_client.algorand.new_group()
+    for chunk_members, chunk_amounts in chunks:
+        composer.add_app_call_method_call(
+            app_client.params.call(
+                algokit_utils.AppClientMethodCallParams(
+                    method=DISTRIBUTE_METHOD,
+                    args=[reward_asa_id, [*chunk_members], [*chunk_amounts]],
+                    sender=sender,
+                    # Cover one inner transfer per member
+                    extra_fee=algokit_utils.AlgoAmount.from_micro_algo(
+                        len(chunk_members) * inner_fee
+                    ),
+                )
+            )
+        )
+
+    return composer.send(algokit_utils.SendParams(populate_app_call_resources=True))
+
+
+def _inner_fee(app_client: algokit_utils.AppClient) -> int:
+    # Reward transfers are sent with a zero fee, so each one pools min_fee
+    return cast(int, app_client.algorand.get_suggested_params().min_fee)
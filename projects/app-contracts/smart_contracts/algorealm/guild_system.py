@@ -1,37 +1,195 @@
+import typing
+
 from algopy import (
     Account,
+    Application,
     ARC4Contract,
-    Bytes,
+    Asset,
+    Box,
+    BoxMap,
     Global,
     GlobalState,
     LocalState,
     String,
+    TransactionType,
     Txn,
     UInt64,
-    log,
+    arc4,
+    gtxn,
+    itxn,
+    op,
+    subroutine,
+    urange,
 )
 from algopy.arc4 import Address, Bool, DynamicArray, Struct, abimethod
 
+# Maximum number of transactions in a single inner transaction group
+MAX_INNER_GROUP_SIZE = 16
+# Minimum guild treasury deposit (0.1 ALGO)
+MIN_GUILD_TREASURY = 100_000
+# Box MBR for one treasury entry: 2500 + 400 * (len(b"t") + 8 key + 8 value)
+TREASURY_BOX_MBR = 9_300
+# Box MBR for one guild name: 2500 + 400 * (len(b"n") + 8 key + 2 length prefix)
+# plus 400 per name byte
+GUILD_NAME_BOX_MBR = 6_900
+GUILD_NAME_BYTE_MBR = 400
+MAX_GUILD_NAME_LENGTH = 32
+# Box MBR for one reward ledger: 2500 + 400 * (len(b"w") + 8 key + 16 value)
+REWARD_LEDGER_BOX_MBR = 12_500
+
+# Officer approvals (including the proposer) needed to execute a guild action
+GUILD_APPROVAL_THRESHOLD = 2
+# Box MBR for one proposal: 2500 + 400 * (len(b"p") + 8 key + 114 value)
+PROPOSAL_BOX_MBR = 51_700
+
+# Guild action codes stored in proposals
+ACTION_TREASURY_PAYOUT = 1
+ACTION_PROMOTE_MEMBER = 2
+ACTION_GUILD_ITEM_TRANSFER = 3
+
+# Number of top contributors kept on the leaderboard
+LEADERBOARD_SIZE = 10
+# Encoded LeaderboardEntry: 32-byte address, guild ID and score
+LEADERBOARD_ENTRY_SIZE = 48
+# Box MBR for the leaderboard: 2500 + 400 * (len(b"leaderboard") + 10 * 48 value)
+LEADERBOARD_BOX_MBR = 198_900
+
 
 class Guild(Struct):
     """Guild structure"""
 
-    guild_id: UInt64
-    name: String
-    leader: Account
-    member_count: UInt64
-    guild_treasury: UInt64  # Amount of ALGO in guild treasury
+    guild_id: arc4.UInt64
+    name: arc4.String
+    leader: Address
+    member_count: arc4.UInt64
+    guild_treasury: arc4.UInt64  # Amount of ALGO in guild treasury
     is_active: Bool
-    creation_time: UInt64
+    creation_time: arc4.UInt64
 
 
 class GuildMember(Struct):
     """Guild member information"""
 
-    player: Account
-    role: String  # "leader", "officer", "member"
-    join_time: UInt64
-    contribution_score: UInt64
+    player: Address
+    role: arc4.String  # "leader", "officer", "member"
+    join_time: arc4.UInt64
+    contribution_score: arc4.UInt64
+
+
+class GuildProposal(Struct):
+    """Pending guild action awaiting officer approvals"""
+
+    guild_id: arc4.UInt64
+    action: arc4.UInt8
+    target: Address
+    amount: arc4.UInt64
+    approval_count: arc4.UInt8
+    approvers: arc4.StaticArray[Address, typing.Literal[2]]
+
+
+class LeaderboardEntry(Struct):
+    """Leaderboard slot, empty slots hold the zero address"""
+
+    player: Address
+    guild_id: arc4.UInt64
+    contribution_score: arc4.UInt64
+
+
+class RewardLedger(Struct):
+    """Reward tokens a guild has escrowed with the contract"""
+
+    reward_asset: arc4.UInt64
+    balance: arc4.UInt64
+
+
+class GuildCreated(Struct):
+    """ARC-28 event: a guild was founded with an initial treasury"""
+
+    guild_id: arc4.UInt64
+    leader: Address
+    treasury: arc4.UInt64
+
+
+class TreasuryDeposit(Struct):
+    """ARC-28 event: a member added to their guild treasury"""
+
+    guild_id: arc4.UInt64
+    player: Address
+    amount: arc4.UInt64
+    balance: arc4.UInt64
+
+
+class GuildJoined(Struct):
+    """ARC-28 event: a player joined a guild"""
+
+    guild_id: arc4.UInt64
+    player: Address
+
+
+class GuildLeft(Struct):
+    """ARC-28 event: a player left a guild"""
+
+    guild_id: arc4.UInt64
+    player: Address
+
+
+class OfficerPromoted(Struct):
+    """ARC-28 event: the guild leader made a member an officer"""
+
+    guild_id: arc4.UInt64
+    player: Address
+
+
+class ProposalCreated(Struct):
+    """ARC-28 event: an officer proposed a guild action"""
+
+    proposal_id: arc4.UInt64
+    guild_id: arc4.UInt64
+    action: arc4.UInt8
+    target: Address
+    amount: arc4.UInt64
+
+
+class ProposalApproved(Struct):
+    """ARC-28 event: an officer approved a pending proposal"""
+
+    proposal_id: arc4.UInt64
+    approver: Address
+    approval_count: arc4.UInt8
+
+
+class ProposalExecuted(Struct):
+    """ARC-28 event: a proposal reached the threshold and was executed"""
+
+    proposal_id: arc4.UInt64
+    guild_id: arc4.UInt64
+    action: arc4.UInt8
+    target: Address
+    amount: arc4.UInt64
+
+
+class ProposalCancelled(Struct):
+    """ARC-28 event: the guild leader cancelled a pending proposal"""
+
+    proposal_id: arc4.UInt64
+    guild_id: arc4.UInt64
+
+
+class RewardsDeposited(Struct):
+    """ARC-28 event: a member escrowed reward tokens for their guild"""
+
+    guild_id: arc4.UInt64
+    player: Address
+    amount: arc4.UInt64
+    balance: arc4.UInt64
+
+
+class RewardsDistributed(Struct):
+    """ARC-28 event: the guild leader paid out reward tokens"""
+
+    guild_id: arc4.UInt64
+    reward_asset: arc4.UInt64
+    recipient_count: arc4.UInt64
 
 
 class AlgoRealmGuildSystem(ARC4Contract):
@@ -41,27 +199,98 @@ class AlgoRealmGuildSystem(ARC4Contract):
     """
 
     def __init__(self) -> None:
-        self.guild_master = GlobalState(Account(Global.creator_address))
+        self.guild_master = GlobalState(Global.creator_address)
         self.total_guilds = GlobalState(UInt64(0))
         self.active_guilds_count = GlobalState(UInt64(0))
+        self.total_proposals = GlobalState(UInt64(0))
+        # Game manager app whose registered players may join guilds
+        self.game_manager_app = GlobalState(Application(0))
+
+        # Per-guild treasury balance in microALGO, held by the app account
+        self.guild_treasury = BoxMap(UInt64, UInt64, key_prefix=b"t")
+        self.guild_names = BoxMap(UInt64, String, key_prefix=b"n")
+        # Per-guild reward token escrow, the only source of distributed rewards
+        self.reward_ledger = BoxMap(UInt64, RewardLedger, key_prefix=b"w")
+        # Pending multisig proposals, deleted once executed or cancelled
+        self.guild_proposals = BoxMap(UInt64, GuildProposal, key_prefix=b"p")
+        # Top contributors across all guilds, sorted by contribution_score (desc)
+        self.leaderboard = Box(
+            arc4.StaticArray[LeaderboardEntry, typing.Literal[10]], key=b"leaderboard"
+        )
 
         # Local state for players
         self.player_guild_id = LocalState(UInt64)  # 0 means no guild
         self.player_role = LocalState(String)
         self.is_guild_member = LocalState(Bool)
+        self.contribution_score = LocalState(UInt64)
+
+    @abimethod(allow_actions=["OptIn"])
+    def opt_in(self) -> None:
+        """Opt in to the guild system (registered AlgoRealm players only)"""
+        self._assert_registered_player()
+        self.player_guild_id[Txn.sender] = UInt64(0)
+        self.player_role[Txn.sender] = String("")
+        self.is_guild_member[Txn.sender] = Bool(False)
+        self.contribution_score[Txn.sender] = UInt64(0)
 
     @abimethod()
-    def create_guild(self, guild_name: String, initial_treasury: UInt64) -> UInt64:
-        """Create a new guild"""
+    def set_game_manager(self, game_manager: Application) -> None:
+        """Link the game manager app used for player registration (guild master only)"""
+        assert (
+            Txn.sender == self.guild_master.value
+        ), "Only guild master can link the game manager"
+        self.game_manager_app.value = game_manager
+
+    @abimethod()
+    def create_leaderboard(self, mbr_payment: gtxn.PaymentTransaction) -> None:
+        """
+        Create the contribution leaderboard (guild master only)
+        The grouped payment covers the box MBR, so guild treasuries never do
+        """
+        assert (
+            Txn.sender == self.guild_master.value
+        ), "Only guild master can create the leaderboard"
+        assert (
+            mbr_payment.receiver == Global.current_application_address
+        ), "MBR payment must go to the guild contract"
+        assert mbr_payment.amount >= LEADERBOARD_BOX_MBR, "Insufficient MBR payment"
+        assert not self.leaderboard, "Leaderboard already exists"
+        # Every slot starts empty (zero address, zero score)
+        self.leaderboard.value = arc4.StaticArray[
+            LeaderboardEntry, typing.Literal[10]
+        ].from_bytes(op.bzero(LEADERBOARD_SIZE * LEADERBOARD_ENTRY_SIZE))
+
+    @abimethod()
+    def create_guild(
+        self, guild_name: String, treasury_payment: gtxn.PaymentTransaction
+    ) -> UInt64:
+        """
+        Create a new guild
+        The grouped payment funds the guild treasury, less the treasury and
+        name box MBR
+        """
         assert not self.is_guild_member[Txn.sender], "Already in a guild"
-        assert initial_treasury >= UInt64(
-            100000
-        ), "Minimum 0.1 ALGO required for guild creation"  # 0.1 ALGO
+        assert guild_name.bytes.length > 0, "Guild name cannot be empty"
+        assert guild_name.bytes.length <= MAX_GUILD_NAME_LENGTH, "Guild name too long"
+        assert (
+            treasury_payment.receiver == Global.current_application_address
+        ), "Treasury payment must go to the guild contract"
+        assert (
+            treasury_payment.sender == Txn.sender
+        ), "Treasury payment must come from the guild creator"
+        assert (
+            treasury_payment.amount >= MIN_GUILD_TREASURY
+        ), "Minimum 0.1 ALGO required for guild creation"
 
         guild_id = self.total_guilds.value + 1
 
-        # Transfer ALGO to contract for guild treasury
-        # In full implementation, handle ALGO payment
+        self.guild_names[guild_id] = guild_name
+        self.guild_treasury[guild_id] = (
+            treasury_payment.amount
+            - TREASURY_BOX_MBR
+            - GUILD_NAME_BOX_MBR
+            - GUILD_NAME_BYTE_MBR * guild_name.bytes.length
+        )
 
         # Set player as guild leader
         self.player_guild_id[Txn.sender] = guild_id
@@ -71,9 +300,44 @@ class AlgoRealmGuildSystem(ARC4Contract):
         self.total_guilds.value = guild_id
         self.active_guilds_count.value += 1
 
-        log(f"Guild '{guild_name}' created with ID {guild_id}")
+        arc4.emit(
+            GuildCreated(
+                arc4.UInt64(guild_id),
+                Address(Txn.sender),
+                arc4.UInt64(self.guild_treasury[guild_id]),
+            )
+        )
         return guild_id
 
+    @abimethod()
+    def deposit_to_treasury(self, payment: gtxn.PaymentTransaction) -> UInt64:
+        """Add a grouped payment to the sender's guild treasury"""
+        assert self.is_guild_member[Txn.sender], "Must be guild member"
+        assert (
+            payment.receiver == Global.current_application_address
+        ), "Deposit must go to the guild contract"
+        assert payment.sender == Txn.sender, "Deposit must come from the depositor"
+
+        guild_id = self.player_guild_id[Txn.sender]
+        new_balance = self.guild_treasury[guild_id] + payment.amount
+        self.guild_treasury[guild_id] = new_balance
+
+        # Deposits count towards the member's contribution score
+        new_score = self.contribution_score[Txn.sender] + payment.amount
+        self.contribution_score[Txn.sender] = new_score
+        self._remove_from_leaderboard(Txn.sender)
+        self._insert_into_leaderboard(Txn.sender, guild_id, new_score)
+
+        arc4.emit(
+            TreasuryDeposit(
+                arc4.UInt64(guild_id),
+                Address(Txn.sender),
+                arc4.UInt64(payment.amount),
+                arc4.UInt64(new_balance),
+            )
+        )
+        return new_balance
+
     @abimethod()
     def join_guild(self, guild_id: UInt64, application_message: String) -> String:
         """Apply to join a guild"""
@@ -87,96 +351,346 @@ class AlgoRealmGuildSystem(ARC4Contract):
         self.player_role[Txn.sender] = String("member")
         self.is_guild_member[Txn.sender] = Bool(True)
 
-        log(f"Player joined guild {guild_id}")
-        return f"Welcome to guild {guild_id}!"
+        arc4.emit(GuildJoined(arc4.UInt64(guild_id), Address(Txn.sender)))
+        return String("Welcome to the guild!")
+
+    @abimethod()
+    def promote_to_officer(self, member: Account) -> String:
+        """
+        Make a member of the leader's guild an officer (guild leader only)
+        A new guild's leader is its only officer, so proposals cannot reach
+        GUILD_APPROVAL_THRESHOLD until the leader appoints officers directly
+        """
+        assert self.is_guild_member[Txn.sender] and self.player_role[
+            Txn.sender
+        ] == String("leader"), "Only the guild leader can promote officers"
+        guild_id = self.player_guild_id[Txn.sender]
+        assert (
+            self.player_guild_id.get(member, UInt64(0)) == guild_id
+        ), "Target is not a member of this guild"
+        assert self.player_role[member] == String("member"), "Already an officer"
+
+        self.player_role[member] = String("officer")
+        arc4.emit(OfficerPromoted(arc4.UInt64(guild_id), Address(member)))
+        return String("Member promoted to officer")
 
     @abimethod()
-    def guild_multisig_action(
+    def propose_guild_action(
         self,
         action_type: String,
         target_player: Account,
         amount: UInt64,
-        approval_1: Bytes,
-        approval_2: Bytes,
-    ) -> String:
+    ) -> UInt64:
         """
-        MULTISIG FUNCTIONALITY: Guild actions requiring multiple approvals
-        This demonstrates Task 4 - Multisig Asset Management
+        MULTISIG FUNCTIONALITY: Propose a guild action requiring multiple approvals
+        The proposer's approval counts towards the threshold; other officers
+        approve with approve_guild_action and the action executes automatically
         """
+        self._assert_officer()
+        guild_id = self.player_guild_id[Txn.sender]
+
+        action = UInt64(0)
+        if action_type == String("treasury_payout"):
+            action = UInt64(ACTION_TREASURY_PAYOUT)
+        elif action_type == String("promote_member"):
+            action = UInt64(ACTION_PROMOTE_MEMBER)
+        elif action_type == String("guild_item_transfer"):
+            action = UInt64(ACTION_GUILD_ITEM_TRANSFER)
+        assert action != 0, "Unknown action type"
+
+        # The proposal box MBR is reserved from the guild treasury while pending
+        treasury_balance = self.guild_treasury[guild_id]
+        assert treasury_balance >= PROPOSAL_BOX_MBR, "Insufficient guild treasury"
+        self.guild_treasury[guild_id] = treasury_balance - PROPOSAL_BOX_MBR
+
+        proposal_id = self.total_proposals.value + 1
+        self.total_proposals.value = proposal_id
+        self.guild_proposals[proposal_id] = GuildProposal(
+            guild_id=arc4.UInt64(guild_id),
+            action=arc4.UInt8(action),
+            target=Address(target_player),
+            amount=arc4.UInt64(amount),
+            approval_count=arc4.UInt8(1),
+            approvers=arc4.StaticArray(
+                Address(Txn.sender), Address(Global.zero_address)
+            ),
+        )
+
+        arc4.emit(
+            ProposalCreated(
+                arc4.UInt64(proposal_id),
+                arc4.UInt64(guild_id),
+                arc4.UInt8(action),
+                Address(target_player),
+                arc4.UInt64(amount),
+            )
+        )
+        return proposal_id
+
+    @abimethod()
+    def approve_guild_action(self, proposal_id: UInt64) -> String:
+        """Approve a pending guild action, executing it once the threshold is met"""
+        self._assert_officer()
+        assert proposal_id in self.guild_proposals, "Proposal does not exist"
+
+        proposal = self.guild_proposals[proposal_id].copy()
+        guild_id = proposal.guild_id.native
+        assert (
+            self.player_guild_id[Txn.sender] == guild_id
+        ), "Proposal belongs to another guild"
+
+        approval_count = proposal.approval_count.native
+        for i in urange(approval_count):
+            assert proposal.approvers[i] != Address(Txn.sender), "Already approved"
+
+        proposal.approvers[approval_count] = Address(Txn.sender)
+        approval_count += 1
+
+        if approval_count < GUILD_APPROVAL_THRESHOLD:
+            proposal.approval_count = arc4.UInt8(approval_count)
+            self.guild_proposals[proposal_id] = proposal.copy()
+            arc4.emit(
+                ProposalApproved(
+                    arc4.UInt64(proposal_id),
+                    Address(Txn.sender),
+                    arc4.UInt8(approval_count),
+                )
+            )
+            return String("Approval recorded")
+
+        # Threshold met: release the proposal box and execute
+        del self.guild_proposals[proposal_id]
+        self.guild_treasury[guild_id] += PROPOSAL_BOX_MBR
+        arc4.emit(
+            ProposalExecuted(
+                arc4.UInt64(proposal_id),
+                proposal.guild_id,
+                proposal.action,
+                proposal.target,
+                proposal.amount,
+            )
+        )
+        return self._execute_guild_action(
+            guild_id,
+            proposal.action.native,
+            proposal.target.native,
+            proposal.amount.native,
+        )
+
+    @abimethod()
+    def cancel_guild_action(self, proposal_id: UInt64) -> String:
+        """Cancel a pending guild action (guild leader only)"""
+        assert proposal_id in self.guild_proposals, "Proposal does not exist"
+        guild_id = self.guild_proposals[proposal_id].guild_id.native
+        assert self.player_guild_id[Txn.sender] == guild_id and self.player_role[
+            Txn.sender
+        ] == String("leader"), "Only the guild leader can cancel proposals"
+
+        del self.guild_proposals[proposal_id]
+        self.guild_treasury[guild_id] += PROPOSAL_BOX_MBR
+
+        arc4.emit(ProposalCancelled(arc4.UInt64(proposal_id), arc4.UInt64(guild_id)))
+        return String("Proposal cancelled")
+
+    @subroutine
+    def _assert_registered_player(self) -> None:
+        # Read the player's registration flag straight from the game manager
+        is_registered, exists = op.AppLocal.get_ex_bytes(
+            Txn.sender, self.game_manager_app.value, b"is_registered"
+        )
+        assert exists and is_registered == Bool(True).bytes, "Player not registered"
+
+    @subroutine
+    def _assert_officer(self) -> None:
         assert self.is_guild_member[Txn.sender], "Must be guild member"
         current_role = self.player_role[Txn.sender]
         assert current_role == String("leader") or current_role == String(
             "officer"
         ), "Insufficient permissions"
 
-        # Verify multisig approvals (simplified)
-        assert len(approval_1) > 0 and len(approval_2) > 0, "Must have two approvals"
-
-        guild_id = self.player_guild_id[Txn.sender]
+    @subroutine
+    def _execute_guild_action(
+        self, guild_id: UInt64, action: UInt64, target_player: Account, amount: UInt64
+    ) -> String:
+        if action == ACTION_TREASURY_PAYOUT:
+            # Pay from guild treasury
+            treasury_balance = self.guild_treasury[guild_id]
+            assert amount <= treasury_balance, "Insufficient guild treasury"
+            self.guild_treasury[guild_id] = treasury_balance - amount
+
+            itxn.Payment(
+                receiver=target_player,
+                amount=amount,
+                fee=0,  # Covered by the outer transaction fee
+            ).submit()
+            return String("Treasury payout approved")
+
+        elif action == ACTION_PROMOTE_MEMBER:
+            # Promote member to officer
+            assert (
+                self.player_guild_id.get(target_player, UInt64(0)) == guild_id
+            ), "Target is not a member of this guild"
+            self.player_role[target_player] = String("officer")
+            return String("Member promoted to officer")
+
+        # ACTION_GUILD_ITEM_TRANSFER: transfer guild-owned items
+        return String("Guild item transferred")
 
-        if action_type == String("treasury_payout"):
-            # Pay from guild treasury (requires multisig)
-            # In full implementation, transfer ALGO from guild treasury
-            log(
-                f"Guild {guild_id} treasury payout of {amount} microALGO to {target_player}"
-            )
-            return f"Treasury payout approved: {amount} microALGO"
+    @abimethod(readonly=True)
+    def get_guild_proposal(self, proposal_id: UInt64) -> GuildProposal:
+        """Get a pending guild proposal"""
+        assert proposal_id in self.guild_proposals, "Proposal does not exist"
+        return self.guild_proposals[proposal_id]
 
-        elif action_type == String("promote_member"):
-            # Promote member to officer (requires multisig)
-            log(f"Member promotion approved in guild {guild_id}")
-            return "Member promoted to officer"
+    @abimethod()
+    def set_reward_asset(
+        self, reward_asset: Asset, mbr_payment: gtxn.PaymentTransaction
+    ) -> None:
+        """
+        Choose the token a guild escrows for rewards (guild leader only)
+        The grouped payment covers the ledger box MBR and, the first time any
+        guild uses the token, the contract's asset opt-in MBR
+        """
+        assert self.is_guild_member[Txn.sender], "Must be guild member"
+        assert self.player_role[Txn.sender] == String(
+            "leader"
+        ), "Only guild leader can set the reward asset"
+        assert (
+            mbr_payment.receiver == Global.current_application_address
+        ), "MBR payment must go to the guild contract"
+        assert (
+            mbr_payment.sender == Txn.sender
+        ), "MBR payment must come from the guild leader"
 
-        elif action_type == String("guild_item_transfer"):
-            # Transfer guild-owned items (requires multisig)
-            log(f"Guild item transfer approved in guild {guild_id}")
-            return "Guild item transferred"
+        guild_id = self.player_guild_id[Txn.sender]
+        required_mbr = UInt64(0)
+        if guild_id in self.reward_ledger:
+            assert (
+                self.reward_ledger[guild_id].balance.native == 0
+            ), "Reward ledger still holds rewards"
+        else:
+            required_mbr += REWARD_LEDGER_BOX_MBR
+
+        if not Global.current_application_address.is_opted_in(reward_asset):
+            required_mbr += Global.asset_opt_in_min_balance
+            itxn.AssetTransfer(
+                xfer_asset=reward_asset,
+                asset_receiver=Global.current_application_address,
+                asset_amount=0,
+                fee=0,  # Covered by the outer transaction fee
+            ).submit()
+        assert mbr_payment.amount >= required_mbr, "Insufficient MBR payment"
+
+        self.reward_ledger[guild_id] = RewardLedger(
+            reward_asset=arc4.UInt64(reward_asset.id), balance=arc4.UInt64(0)
+        )
 
-        return "Unknown action type"
+    @abimethod()
+    def deposit_guild_rewards(self, deposit: gtxn.AssetTransferTransaction) -> UInt64:
+        """Escrow a grouped reward token transfer in the sender's guild ledger"""
+        assert self.is_guild_member[Txn.sender], "Must be guild member"
+        guild_id = self.player_guild_id[Txn.sender]
+        assert guild_id in self.reward_ledger, "Guild has no reward asset"
+        ledger = self.reward_ledger[guild_id].copy()
+        assert (
+            deposit.asset_receiver == Global.current_application_address
+        ), "Deposit must go to the guild contract"
+        assert deposit.sender == Txn.sender, "Deposit must come from the depositor"
+        assert (
+            deposit.xfer_asset.id == ledger.reward_asset.native
+        ), "Deposit is not the guild reward asset"
+
+        new_balance = ledger.balance.native + deposit.asset_amount
+        self.reward_ledger[guild_id].balance = arc4.UInt64(new_balance)
+
+        arc4.emit(
+            RewardsDeposited(
+                arc4.UInt64(guild_id),
+                Address(Txn.sender),
+                arc4.UInt64(deposit.asset_amount),
+                arc4.UInt64(new_balance),
+            )
+        )
+        return new_balance
 
     @abimethod()
     def distribute_guild_rewards(
         self,
         reward_asa_id: UInt64,
         members: DynamicArray[Address],
-        amounts: DynamicArray[UInt64],
+        amounts: DynamicArray[arc4.UInt64],
     ) -> String:
         """
         Distribute guild rewards using atomic transactions
-        Demonstrates advanced Algorand features
+        Transfers are paid out of the guild's reward ledger and submitted as
+        inner groups of up to 16. Each member's account must be referenced, so
+        one call pays at most 4 members and one outer group at most 64; larger
+        payouts take several groups (see guild_rewards.py)
         """
         assert self.is_guild_member[Txn.sender], "Must be guild member"
         assert self.player_role[Txn.sender] == String(
             "leader"
         ), "Only guild leader can distribute rewards"
-        assert len(members) == len(amounts), "Members and amounts arrays must match"
-
-        # In full implementation, would use atomic transactions to distribute ASAs
-        # This would be multiple AssetTransfer transactions in a single group
+        assert members.length == amounts.length, "Members and amounts arrays must match"
+        assert members.length > 0, "Nothing to distribute"
 
-        total_distributed = UInt64(0)
-        for i in range(len(amounts)):
-            total_distributed += amounts[i]
-
-        log(
-            f"Distributed {total_distributed} guild reward tokens to {len(members)} members"
+        guild_id = self.player_guild_id[Txn.sender]
+        assert guild_id in self.reward_ledger, "Guild has no reward asset"
+        assert (
+            reward_asa_id == self.reward_ledger[guild_id].reward_asset.native
+        ), "Not the guild reward asset"
+        reward_asset = Asset(reward_asa_id)
+        balance = self.reward_ledger[guild_id].balance.native
+
+        for i in urange(members.length):
+            member = members[i].native
+            amount = amounts[i].native
+            assert (
+                self.player_guild_id.get(member, UInt64(0)) == guild_id
+            ), "Recipient is not a member of this guild"
+            assert amount <= balance, "Insufficient guild reward balance"
+            balance -= amount
+
+            # Open a new inner group every MAX_INNER_GROUP_SIZE transfers
+            if i % MAX_INNER_GROUP_SIZE == 0:
+                op.ITxnCreate.begin()
+            else:
+                op.ITxnCreate.next()
+            op.ITxnCreate.set_type_enum(TransactionType.AssetTransfer)
+            op.ITxnCreate.set_xfer_asset(reward_asset)
+            op.ITxnCreate.set_asset_receiver(member)
+            op.ITxnCreate.set_asset_amount(amount)
+            op.ITxnCreate.set_fee(0)  # Covered by the outer transaction fee
+
+            if (i + 1) % MAX_INNER_GROUP_SIZE == 0 or i + 1 == members.length:
+                op.ITxnCreate.submit()
+
+        self.reward_ledger[guild_id].balance = arc4.UInt64(balance)
+
+        arc4.emit(
+            RewardsDistributed(
+                arc4.UInt64(guild_id),
+                arc4.UInt64(reward_asa_id),
+                arc4.UInt64(members.length),
+            )
         )
-        return f"Guild rewards distributed to {len(members)} members"
+        return String("Guild rewards distributed")
 
     @abimethod()
     def leave_guild(self) -> String:
         """Leave current guild"""
         assert self.is_guild_member[Txn.sender], "Not in a guild"
-
         guild_id = self.player_guild_id[Txn.sender]
 
         # Reset player guild state
         self.player_guild_id[Txn.sender] = UInt64(0)
         self.player_role[Txn.sender] = String("")
         self.is_guild_member[Txn.sender] = Bool(False)
+        self.contribution_score[Txn.sender] = UInt64(0)
+        self._remove_from_leaderboard(Txn.sender)
 
-        log(f"Player left guild {guild_id}")
-        return f"Left guild {guild_id}"
+        arc4.emit(GuildLeft(arc4.UInt64(guild_id), Address(Txn.sender)))
+        return String("Left guild")
 
     @abimethod(readonly=True)
     def get_player_guild_info(self, player: Account) -> tuple[UInt64, String, Bool]:
@@ -187,6 +701,79 @@ class AlgoRealmGuildSystem(ARC4Contract):
             self.is_guild_member[player],
         )
 
+    @abimethod(readonly=True)
+    def get_leaderboard(
+        self,
+    ) -> arc4.StaticArray[LeaderboardEntry, typing.Literal[10]]:
+        """Get the top contributors, highest score first"""
+        assert self.leaderboard, "No contributions yet"
+        return self.leaderboard.value
+
+    @subroutine
+    def _remove_from_leaderboard(self, player: Account) -> None:
+        if not self.leaderboard:
+            return
+
+        board = self.leaderboard.value.copy()
+        for i in urange(LEADERBOARD_SIZE):
+            if board[i].player == Address(player):
+                # Shift the lower entries up and clear the last slot
+                for j in urange(i, LEADERBOARD_SIZE - 1):
+                    board[j] = board[j + 1].copy()
+                board[LEADERBOARD_SIZE - 1] = LeaderboardEntry(
+                    player=Address(Global.zero_address),
+                    guild_id=arc4.UInt64(0),
+                    contribution_score=arc4.UInt64(0),
+                )
+                self.leaderboard.value = board.copy()
+                return
+
+    @subroutine
+    def _insert_into_leaderboard(
+        self, player: Account, guild_id: UInt64, score: UInt64
+    ) -> None:
+        assert self.leaderboard, "Leaderboard not created"
+
+        board = self.leaderboard.value.copy()
+        # Ties keep the earlier contributor ahead
+        slot = UInt64(LEADERBOARD_SIZE)
+        for i in urange(LEADERBOARD_SIZE):
+            if board[i].contribution_score.native < score:
+                slot = i
+                break
+        if slot == LEADERBOARD_SIZE:
+            return
+
+        # Shift the lower entries down, dropping the last one
+        i = UInt64(LEADERBOARD_SIZE - 1)
+        while i > slot:
+            board[i] = board[i - 1].copy()
+            i -= 1
+        board[slot] = LeaderboardEntry(
+            player=Address(player),
+            guild_id=arc4.UInt64(guild_id),
+            contribution_score=arc4.UInt64(score),
+        )
+        self.leaderboard.value = board.copy()
+
+    @abimethod(readonly=True)
+    def get_guild_treasury(self, guild_id: UInt64) -> UInt64:
+        """Get a guild's treasury balance in microALGO"""
+        assert guild_id in self.guild_treasury, "Guild does not exist"
+        return self.guild_treasury[guild_id]
+
+    @abimethod(readonly=True)
+    def get_guild_name(self, guild_id: UInt64) -> String:
+        """Get a guild's name"""
+        assert guild_id in self.guild_names, "Guild does not exist"
+        return self.guild_names[guild_id]
+
+    @abimethod(readonly=True)
+    def get_reward_ledger(self, guild_id: UInt64) -> RewardLedger:
+        """Get a guild's reward asset and escrowed balance"""
+        assert guild_id in self.reward_ledger, "Guild has no reward asset"
+        return self.reward_ledger[guild_id]
+
     @abimethod(readonly=True)
     def get_guild_system_stats(self) -> tuple[UInt64, UInt64]:
         """Get guild system statistics"""
@@ -0,0 +1,290 @@
+"""Stream a snapshot of every AlgoRealm item ASA and its holder to CSV"""
+
+import argparse
+import base64
+import csv
+import json
+import logging
+import struct
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple, TextIO, cast
+
+from algosdk.logic import get_application_address
+from algosdk.v2client.indexer import IndexerClient
+
+from smart_contracts.algorealm import item_metadata
+from smart_contracts.algorealm.algod_types import (
+    AssetBalancesResponse,
+    AssetsResponse,
+    IndexerAsset,
+    IndexerTransaction,
+    TransactionsResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+DEPLOYMENT_INFO_PATH = Path("deployment_info.json")
+DEFAULT_PAGE_SIZE = 1_000
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Note prefixes written by the minting methods in contract.py
+RECOVERED_NOTE_PREFIX = b"RECOVERED_ITEM_"
+SEASONAL_NOTE_PREFIX = b"SEASONAL_"
+CRAFTED_NOTE = b"CRAFTED_ITEM"
+STACK_NOTE_PREFIX = b"STACK_"
+# Recovery proofs are b"RECOVERY_QUEST_" + itob(quest_id) + itob(timestamp)
+RECOVERY_PROOF_PREFIX = b"RECOVERY_QUEST_"
+
+CSV_COLUMNS = (
+    "asset_id",
+    "name",
+    "unit_name",
+    "kind",
+    "rarity",
+    "quest_id",
+    "proof_timestamp",
+    "proof",
+    "created_round",
+    "holder",
+    "contract_held",
+    "contract_clawback",
+)
+
+
+class ItemRecord(NamedTuple):
+    asset_id: int
+    name: str
+    unit_name: str
+    kind: str  # "created", "recovered", "seasonal", "crafted", "stack" or "unknown"
+    rarity: str
+    quest_id: int | None
+    proof_timestamp: int | None
+    proof: str  # hex of a seasonal participation proof
+    created_round: int
+    holder: str | None
+    contract_held: bool
+    contract_clawback: bool  # The contract can claw the item back from players
+
+
+class DecodedNote(NamedTuple):
+    kind: str
+    rarity: str = ""
+    quest_id: int | None = None
+    proof_timestamp: int | None = None
+    proof: str = ""
+
+
+def decode_item_note(note: bytes, asset_name: str) -> DecodedNote:
+    """Decode the note an AlgoRealm minting method attached to an item ASA"""
+    if note.startswith(RECOVERED_NOTE_PREFIX):
+        proof = note[len(RECOVERED_NOTE_PREFIX) :]
+        body = proof[len(RECOVERY_PROOF_PREFIX) :]
+        if proof.startswith(RECOVERY_PROOF_PREFIX) and len(body) == 16:
+            quest_id, timestamp = cast(tuple[int, int], struct.unpack(">QQ", body))
+            return DecodedNote(
+                "recovered", quest_id=quest_id, proof_timestamp=timestamp
+            )
+        return DecodedNote("recovered", proof=proof.hex())
+    if note.startswith(SEASONAL_NOTE_PREFIX):
+        return DecodedNote("seasonal", proof=note[len(SEASONAL_NOTE_PREFIX) :].hex())
+    if note == CRAFTED_NOTE:
+        return DecodedNote("crafted")
+    if note.startswith(STACK_NOTE_PREFIX):
+        # Stack notes are b"STACK_<item_type>:<rarity>"
+        _item_type, _, stack_rarity = note[len(STACK_NOTE_PREFIX) :].partition(b":")
+        return DecodedNote("stack", rarity=stack_rarity.decode(errors="replace"))
+
+    metadata = item_metadata.decode_item_note(note)
+    if metadata is not None:
+        return DecodedNote("created", rarity=metadata.rarity.name.lower())
+
+    # Items created before compact metadata carry item_name + rarity
+    name = asset_name.encode()
+    if note.startswith(name):
+        rarity = note[len(name) :].decode(errors="replace")
+        return DecodedNote("created", rarity=rarity)
+    return DecodedNote("unknown")
+
+
+class InventoryExporter:
+    """
+    Pages the AlgoRealm app account's created assets from the indexer and
+    joins each one with its creation note and current holder.
+    Memory stays bounded by one page: notes are merged in from the app's
+    transaction history as a second ascending stream (asset IDs increase with
+    creation order) and holders are looked up concurrently per page.
+    """
+
+    def __init__(
+        self,
+        indexer: IndexerClient,
+        app_id: int,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self.indexer = indexer
+        self.app_id = app_id
+        self.app_address = get_application_address(app_id)
+        self.page_size = page_size
+        self.max_concurrency = max_concurrency
+
+    def iter_items(self) -> Iterator[ItemRecord]:
+        notes = self._iter_creation_notes()
+        next_note: tuple[int, bytes] | None = next(notes, None)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            for page in self._iter_created_asset_pages():
+                asset_ids = [asset["index"] for asset in page]
+                holders = pool.map(self._holder, asset_ids)
+                for asset, asset_id, holder in zip(
+                    page, asset_ids, holders, strict=True
+                ):
+                    while next_note is not None and next_note[0] < asset_id:
+                        next_note = next(notes, None)
+                    note = (
+                        next_note[1]
+                        if next_note is not None and next_note[0] == asset_id
+                        else b""
+                    )
+                    yield self._record(asset, note, holder)
+
+    def export_csv(self, out: TextIO) -> int:
+        """Write the snapshot to out as CSV, returning the number of items"""
+        writer = csv.writer(out)
+        writer.writerow(CSV_COLUMNS)
+        count = 0
+        for count, item in enumerate(self.iter_items(), start=1):
+            row: list[object] = [_csv_value(value) for value in item]
+            writer.writerow(row)
+            if count % self.page_size == 0:
+                out.flush()
+                logger.info(f"📦 Exported {count} items")
+        return count
+
+    def _record(
+        self, asset: IndexerAsset, note: bytes, holder: str | None
+    ) -> ItemRecord:
+        params = asset["params"]
+        name = params.get("name", "")
+        decoded = decode_item_note(note, name)
+        if decoded.kind == "stack":
+            # Stacks are fungible and spread over many holders
+            holder = None
+        return ItemRecord(
+            asset_id=asset["index"],
+            name=name,
+            unit_name=params.get("unit-name", ""),
+            kind=decoded.kind,
+            rarity=decoded.rarity,
+            quest_id=decoded.quest_id,
+            proof_timestamp=decoded.proof_timestamp,
+            proof=decoded.proof,
+            created_round=asset.get("created-at-round", 0),
+            holder=holder,
+            contract_held=holder == self.app_address,
+            contract_clawback=params.get("clawback") == self.app_address,
+        )
+
+    def _iter_created_asset_pages(self) -> Iterator[list[IndexerAsset]]:
+        next_page: str | None = None
+        while True:
+            response = cast(
+                AssetsResponse,
+                self.indexer.lookup_account_asset_by_creator(
+                    self.app_address, limit=self.page_size, next_page=next_page
+                ),
+            )
+            assets = response.get("assets", [])
+            if assets:
+                yield assets
+            next_page = response.get("next-token")
+            if not next_page or len(assets) < self.page_size:
+                return
+
+    def _iter_creation_notes(self) -> Iterator[tuple[int, bytes]]:
+        """(asset_id, note) for every ASA created by an app call, in ID order"""
+        next_page: str | None = None
+        while True:
+            response = cast(
+                TransactionsResponse,
+                self.indexer.search_transactions(
+                    application_id=self.app_id,
+                    limit=self.page_size,
+                    next_page=next_page,
+                ),
+            )
+            transactions = response.get("transactions", [])
+            for txn in transactions:
+                yield from _created_asset_notes(txn.get("inner-txns", []))
+            next_page = response.get("next-token")
+            if not next_page or len(transactions) < self.page_size:
+                return
+
+    def _holder(self, asset_id: int) -> str | None:
+        # Items are single units, so the one positive balance is the holder
+        response = cast(
+            AssetBalancesResponse,
+            self.indexer.asset_balances(asset_id, min_balance=0, limit=1),
+        )
+        balances = response.get("balances", [])
+        return balances[0]["address"] if balances else None
+
+
+def _created_asset_notes(
+    inner_txns: list[IndexerTransaction],
+) -> Iterator[tuple[int, bytes]]:
+    for inner in inner_txns:
+        created_asset = inner.get("created-asset-index")
+        if created_asset:
+            note = base64.b64decode(inner.get("note", ""))
+            yield created_asset, note
+        yield from _created_asset_notes(inner.get("inner-txns", []))
+
+
+def _csv_value(value: object) -> object:
+    # Compact CSV: empty cells for missing values and 0/1 for flags
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return int(value)
+    return value
+
+
+def _deployed_app_id() -> int:
+    deployment_info = cast(dict[str, int], json.loads(DEPLOYMENT_INFO_PATH.read_text()))
+    return deployment_info["app_id"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export an AlgoRealm item snapshot")
+    parser.add_argument("--app-id", type=int, default=None)
+    parser.add_argument("--out", type=Path, default=None, help="CSV path (stdout)")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    args = parser.parse_args()
+    requested_app_id: int | None = args.app_id
+    out_path: Path | None = args.out
+    page_size: int = args.page_size
+
+    import algokit_utils
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    app_id = requested_app_id or _deployed_app_id()
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    exporter = InventoryExporter(algorand.client.indexer, app_id, page_size=page_size)
+
+    if out_path is None:
+        count = exporter.export_csv(sys.stdout)
+    else:
+        with out_path.open("w", newline="") as out:
+            count = exporter.export_csv(out)
+    logger.info(f"✅ Exported {count} AlgoRealm items")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,97 @@
+"""
+Delegated opt-in for AlgoRealm item delivery.
+A player signs the AlgoRealmItemOptIn logic signature once; the game server
+then opts them in to each item and delivers it in a single group
+(AsyncAlgoRealmClient.deliver_item) without a wallet prompt.
+"""
+
+import argparse
+import base64
+import json
+import logging
+from pathlib import Path
+from typing import cast
+
+from algosdk import encoding, transaction
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.algorealm.algod_types import CompileResponse
+
+logger = logging.getLogger(__name__)
+
+DEPLOYMENT_INFO_PATH = Path("deployment_info.json")
+DELEGATION_TEAL_PATH = (
+    Path(__file__).parent.parent / "artifacts" / "algorealm" / "AlgoRealmItemOptIn.teal"
+)
+APP_ID_TEMPLATE = "TMPL_ALGOREALM_APP_ID"
+
+
+def delegation_source(app_id: int, teal_path: Path = DELEGATION_TEAL_PATH) -> str:
+    """AlgoRealmItemOptIn TEAL bound to one AlgoRealmGameManager app"""
+    if app_id <= 0:
+        raise ValueError(f"Invalid app ID: {app_id}")
+    return teal_path.read_text().replace(APP_ID_TEMPLATE, str(app_id))
+
+
+def compile_delegation(algod: AlgodClient, app_id: int) -> bytes:
+    result = cast(CompileResponse, algod.compile(delegation_source(app_id)))
+    return base64.b64decode(result["result"])
+
+
+def sign_delegation(program: bytes, private_key: str) -> transaction.LogicSigAccount:
+    """Delegate the opt-in program from the player owning private_key"""
+    delegation = transaction.LogicSigAccount(program)
+    delegation.sign(private_key)
+    return delegation
+
+
+def encode_delegation(delegation: transaction.LogicSigAccount) -> str:
+    """Base64 msgpack form a player hands to the game server"""
+    if not delegation.is_delegated():
+        raise ValueError("Logic signature is not delegated by a player")
+    encoded: str = encoding.msgpack_encode(delegation)
+    return encoded
+
+
+def decode_delegation(encoded: str) -> transaction.LogicSigAccount:
+    delegation: object = encoding.msgpack_decode(encoded)
+    if not isinstance(delegation, transaction.LogicSigAccount):
+        raise ValueError("Not an encoded logic signature account")
+    verified: bool = delegation.verify()
+    if not verified:
+        raise ValueError("Delegation signature does not match its program")
+    return delegation
+
+
+def _deployed_app_id() -> int:
+    deployment_info = cast(dict[str, int], json.loads(DEPLOYMENT_INFO_PATH.read_text()))
+    return deployment_info["app_id"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Sign the AlgoRealm item opt-in delegation for the PLAYER account"
+    )
+    parser.add_argument("--app-id", type=int, default=None)
+    parser.add_argument("--out", type=Path, default=Path("opt_in_delegation.txt"))
+    args = parser.parse_args()
+    requested_app_id: int | None = args.app_id
+    out_path: Path = args.out
+
+    import algokit_utils
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    app_id = requested_app_id or _deployed_app_id()
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    player = algorand.account.from_environment("PLAYER")
+
+    program = compile_delegation(algorand.client.algod, app_id)
+    delegation = sign_delegation(program, player.private_key)
+    out_path.write_text(encode_delegation(delegation))
+    logger.info(f"✍️ Wrote the item opt-in delegation of {player.address} to {out_path}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,123 @@
+"""Encode and decode the compact ItemMetadata record stored by AlgoRealmGameManager"""
+
+import enum
+import hashlib
+import struct
+from typing import NamedTuple, cast
+
+# create_game_item notes are ITEM_NOTE_PREFIX + the encoded record
+ITEM_NOTE_PREFIX = b"ITEM_"
+# Box key prefixes of the item_metadata and effect_table box maps
+METADATA_BOX_PREFIX = b"m"
+EFFECT_BOX_PREFIX = b"e"
+# Box key prefix of the minted_requests box map (create_game_item_with_key)
+MINTED_REQUEST_BOX_PREFIX = b"r"
+
+NO_EFFECT = 0
+MAX_ITEM_STAT = 0xFFFF
+
+# ARC-4 layout: uint8, uint8, uint16, uint16, uint16, bool, uint8, uint64
+_LAYOUT = struct.Struct(">BBHHHBBQ")
+# ARC-4 encodes a standalone bool as its most significant bit
+_ARC4_TRUE = 0x80
+
+
+class ItemType(enum.IntEnum):
+    OTHER = 0
+    WEAPON = 1
+    ARMOR = 2
+    CONSUMABLE = 3
+    BADGE = 4
+
+    @classmethod
+    def parse(cls, name: str) -> "ItemType":
+        """Code create_game_item stores for an item type name"""
+        try:
+            return cls[name.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown item type: {name!r}") from None
+
+
+class Rarity(enum.IntEnum):
+    COMMON = 1
+    RARE = 2
+    EPIC = 3
+    LEGENDARY = 4
+
+    @classmethod
+    def parse(cls, name: str) -> "Rarity":
+        """Code create_game_item stores for a rarity name"""
+        try:
+            return cls[name.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown rarity: {name!r}") from None
+
+
+class ItemMetadata(NamedTuple):
+    item_type: ItemType
+    rarity: Rarity
+    attack_power: int
+    defense_power: int
+    effect_id: int
+    is_recovered: bool
+    recovery_count: int
+    original_creation_time: int
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ItemMetadata":
+        (
+            item_type,
+            rarity,
+            attack_power,
+            defense_power,
+            effect_id,
+            is_recovered,
+            recovery_count,
+            original_creation_time,
+        ) = cast(tuple[int, int, int, int, int, int, int, int], _LAYOUT.unpack(data))
+        return cls(
+            item_type=ItemType(item_type),
+            rarity=Rarity(rarity),
+            attack_power=attack_power,
+            defense_power=defense_power,
+            effect_id=effect_id,
+            is_recovered=bool(is_recovered & _ARC4_TRUE),
+            recovery_count=recovery_count,
+            original_creation_time=original_creation_time,
+        )
+
+    def to_bytes(self) -> bytes:
+        return _LAYOUT.pack(
+            self.item_type,
+            self.rarity,
+            self.attack_power,
+            self.defense_power,
+            self.effect_id,
+            _ARC4_TRUE if self.is_recovered else 0,
+            self.recovery_count,
+            self.original_creation_time,
+        )
+
+
+ENCODED_SIZE = _LAYOUT.size
+
+
+def decode_item_note(note: bytes) -> ItemMetadata | None:
+    """Metadata carried by a create_game_item note, or None for other notes"""
+    body = note[len(ITEM_NOTE_PREFIX) :]
+    if not note.startswith(ITEM_NOTE_PREFIX) or len(body) != ENCODED_SIZE:
+        return None
+    return ItemMetadata.from_bytes(body)
+
+
+def metadata_box_name(asset_id: int) -> bytes:
+    return METADATA_BOX_PREFIX + asset_id.to_bytes(8, "big")
+
+
+def effect_box_name(effect_id: int) -> bytes:
+    return EFFECT_BOX_PREFIX + effect_id.to_bytes(8, "big")
+
+
+def minted_request_box_name(request_key: bytes) -> bytes:
+    """Box create_game_item_with_key and get_minted_item read for a request key"""
+    return MINTED_REQUEST_BOX_PREFIX + hashlib.sha256(request_key).digest()
@@ -0,0 +1,249 @@
+"""Select abandoned AlgoRealm items and recycle them in atomic groups"""
+
+import argparse
+import dataclasses
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import cast
+
+import algokit_utils
+
+from smart_contracts.algorealm.algod_types import NodeStatus
+from smart_contracts.algorealm.inventory_export import InventoryExporter, ItemRecord
+
+logger = logging.getLogger(__name__)
+
+DEPLOYMENT_INFO_PATH = Path("deployment_info.json")
+APP_SPEC_PATH = (
+    Path(__file__).parent.parent
+    / "artifacts"
+    / "algorealm"
+    / "AlgoRealmGameManager.arc56.json"
+)
+
+RECYCLE_METHOD = "recycle_items(uint64[],address[])uint64"
+
+# Foreign references (accounts, assets, apps, boxes) one app call may carry.
+# The 4 account limit is never reached: a call fits at most two player holders
+MAX_CALL_REFERENCES = 8
+# Every item needs its asset and its item_metadata box referenced
+ITEM_REFERENCES = 2
+# Items held by a player also need the holder's account for the clawback
+HOLDER_REFERENCES = 1
+# Maximum number of transactions in an outer group
+MAX_GROUP_SIZE = 16
+# 4 contract-held items per call, so 64 per group (32 if all are player-held)
+MAX_GROUP_ITEMS = MAX_GROUP_SIZE * (MAX_CALL_REFERENCES // ITEM_REFERENCES)
+# About a week of rounds at 2.8s per block
+DEFAULT_MIN_AGE_ROUNDS = 216_000
+
+
+@dataclasses.dataclass(frozen=True)
+class SweepPolicy:
+    """
+    Which items are safe to recycle.
+    Unclaimed items still held by the contract past min_age_rounds are
+    abandoned. Player-held items are only reclaimed when explicitly enabled,
+    and only if the contract is their clawback (older seasonal and crafted
+    items were minted without one).
+    """
+
+    current_round: int
+    min_age_rounds: int = DEFAULT_MIN_AGE_ROUNDS
+    reclaim_from_players: bool = False
+
+    def selects(self, item: ItemRecord) -> bool:
+        if item.kind == "stack" or item.holder is None:
+            return False
+        if item.created_round > self.current_round - self.min_age_rounds:
+            return False
+        if item.contract_held:
+            return True
+        return self.reclaim_from_players and item.contract_clawback
+
+
+def select_candidates(
+    items: Iterable[ItemRecord], policy: SweepPolicy
+) -> Iterator[ItemRecord]:
+    return (item for item in items if policy.selects(item))
+
+
+def item_references(item: ItemRecord) -> int:
+    """Foreign references the recycle call needs for one item"""
+    return ITEM_REFERENCES + (0 if item.contract_held else HOLDER_REFERENCES)
+
+
+def chunk_items(
+    items: Iterable[ItemRecord], max_references: int = MAX_CALL_REFERENCES
+) -> list[list[ItemRecord]]:
+    """Split candidates into per-call chunks that fit max_references"""
+    return list(_iter_chunks(items, max_references))
+
+
+def group_items(items: Iterable[ItemRecord]) -> Iterator[list[ItemRecord]]:
+    """Split candidates into batches of at most MAX_GROUP_SIZE calls each"""
+    group: list[ItemRecord] = []
+    calls = 0
+    for chunk in _iter_chunks(items, MAX_CALL_REFERENCES):
+        if calls == MAX_GROUP_SIZE:
+            yield group
+            group = []
+            calls = 0
+        group.extend(chunk)
+        calls += 1
+    if group:
+        yield group
+
+
+def _iter_chunks(
+    items: Iterable[ItemRecord], max_references: int
+) -> Iterator[list[ItemRecord]]:
+    chunk: list[ItemRecord] = []
+    references = 0
+    for item in items:
+        needed = item_references(item)
+        if chunk and references + needed > max_references:
+            yield chunk
+            chunk = []
+            references = 0
+        chunk.append(item)
+        references += needed
+    if chunk:
+        yield chunk
+
+
+def recycle_group(
+    app_client: algokit_utils.AppClient,
+    items: list[ItemRecord],
+    sender: str | None = None,
+) -> algokit_utils.SendAtomicTransactionComposerResults:
+    """
+    Recycle items in one atomic group.
+    Each call carries as many items as fit its 8 foreign references, so a
+    group holds at most MAX_GROUP_ITEMS (64) contract-held items and fewer
+    when players hold them. Inner transaction fees are pooled onto the outer
+    calls and resources are populated across the whole group.
+    """
+    chunks = chunk_items(items)
+    if len(chunks) > MAX_GROUP_SIZE:
+        raise ValueError(
+            f"{len(items)} items do not fit in one group "
+            f"({len(chunks)} calls, max {MAX_GROUP_SIZE})"
+        )
+
+    inner_fee = _inner_fee(app_client)
+    composer = app_client.algorand.new_group()
+    for chunk in chunks:
+        # A destroy per item, after a clawback for player-held items
+        inner_transactions = sum(1 if item.contract_held else 2 for item in chunk)
+        composer.add_app_call_method_call(
+            app_client.params.call(
+                algokit_utils.AppClientMethodCallParams(
+                    method=RECYCLE_METHOD,
+                    args=[
+                        [item.asset_id for item in chunk],
+                        [_holder(item) for item in chunk],
+                    ],
+                    sender=sender,
+                    extra_fee=algokit_utils.AlgoAmount.from_micro_algo(
+                        inner_transactions * inner_fee
+                    ),
+                )
+            )
+        )
+
+    return composer.send(algokit_utils.SendParams(populate_app_call_resources=True))
+
+
+def _inner_fee(app_client: algokit_utils.AppClient) -> int:
+    # Clawbacks and destroys are sent with a zero fee, so each one pools min_fee
+    return cast(int, app_client.algorand.get_suggested_params().min_fee)
+
+
+def _holder(item: ItemRecord) -> str:
+    if item.holder is None:
+        raise ValueError(f"Item {item.asset_id} has no holder to recycle it from")
+    return item.holder
+
+
+def sweep(
+    app_client: algokit_utils.AppClient,
+    candidates: Iterable[ItemRecord],
+    sender: str | None = None,
+    *,
+    dry_run: bool = False,
+) -> int:
+    """Recycle candidates one full group at a time, returning how many were sent"""
+    recycled = 0
+    for batch in group_items(candidates):
+        recycled += _send_batch(app_client, batch, sender, dry_run=dry_run)
+    return recycled
+
+
+def _send_batch(
+    app_client: algokit_utils.AppClient,
+    batch: list[ItemRecord],
+    sender: str | None,
+    *,
+    dry_run: bool,
+) -> int:
+    if dry_run:
+        for item in batch:
+            logger.info(
+                f"Would recycle {item.asset_id} ({item.kind}) from {item.holder}"
+            )
+    else:
+        result = recycle_group(app_client, batch, sender)
+        logger.info(f"♻️ Recycled {len(batch)} items in group {result.group_id}")
+    return len(batch)
+
+
+def _deployed_app_id() -> int:
+    deployment_info = cast(dict[str, int], json.loads(DEPLOYMENT_INFO_PATH.read_text()))
+    return deployment_info["app_id"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recycle abandoned AlgoRealm items")
+    parser.add_argument("--app-id", type=int, default=None)
+    parser.add_argument("--min-age-rounds", type=int, default=DEFAULT_MIN_AGE_ROUNDS)
+    parser.add_argument("--reclaim-from-players", action="store_true")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    requested_app_id: int | None = args.app_id
+    min_age_rounds: int = args.min_age_rounds
+    reclaim_from_players: bool = args.reclaim_from_players
+    dry_run: bool = args.dry_run
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    app_id = requested_app_id or _deployed_app_id()
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    game_master = algorand.account.from_environment("DEPLOYER")
+    app_client = algorand.client.get_app_client_by_id(
+        app_spec=APP_SPEC_PATH.read_text(),
+        app_id=app_id,
+        default_sender=game_master.address,
+    )
+
+    status = cast(NodeStatus, algorand.client.algod.status())
+    policy = SweepPolicy(
+        current_round=status["last-round"],
+        min_age_rounds=min_age_rounds,
+        reclaim_from_players=reclaim_from_players,
+    )
+    exporter = InventoryExporter(algorand.client.indexer, app_id)
+    count = sweep(
+        app_client,
+        select_candidates(exporter.iter_items(), policy),
+        dry_run=dry_run,
+    )
+    logger.info(f"✅ {'Found' if dry_run else 'Recycled'} {count} items")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
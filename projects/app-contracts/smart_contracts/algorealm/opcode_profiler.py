@@ -0,0 +1,330 @@
+"""Profile AlgoRealm method calls per contract.py line from simulate exec traces"""
+
+import argparse
+import base64
+import dataclasses
+import json
+import logging
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple, TypedDict, cast
+
+from algosdk import encoding
+
+from smart_contracts.algorealm.algod_types import (
+    SimulateResponse,
+    SimulationOpcodeTraceUnit,
+    SimulationTransactionExecTrace,
+)
+
+logger = logging.getLogger(__name__)
+
+DEPLOYMENT_INFO_PATH = Path("deployment_info.json")
+APP_SPEC_DIR = Path(__file__).parent.parent / "artifacts" / "algorealm"
+
+_BASE64_DIGITS = {
+    char: value
+    for value, char in enumerate(
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+    )
+}
+
+# Opcodes costing more than 1 (AVM v10); byte-length dependent costs use the base
+OPCODE_COSTS = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1_900,
+    "ed25519verify_bare": 1_900,
+    "ecdsa_verify": 1_700,
+    "ecdsa_pk_decompress": 650,
+    "ecdsa_pk_recover": 2_000,
+    "vrf_verify": 5_700,
+    "falcon_verify": 1_700,
+    "bn256_add": 125,
+    "bn256_scalar_mul": 1_310,
+    "bn256_pairing": 8_700,
+    "b+": 10,
+    "b-": 10,
+    "b/": 20,
+    "b*": 20,
+    "b%": 20,
+    "b|": 6,
+    "b&": 6,
+    "b^": 6,
+    "b~": 4,
+    "bsqrt": 40,
+    "divmodw": 20,
+    "json_ref": 25,
+}
+
+
+class _PcEvent(TypedDict, total=False):
+    op: str
+    subroutine: str
+
+
+class _SourceMap(TypedDict, total=False):
+    sources: list[str]
+    mappings: str
+    op_pc_offset: int
+    pc_events: dict[str, _PcEvent]
+
+
+class _ByteCode(TypedDict):
+    approval: str  # base64
+
+
+class _AppSpec(TypedDict, total=False):
+    name: str
+    byteCode: _ByteCode
+
+
+class SourceLine(NamedTuple):
+    source: str
+    line: int
+
+    def __str__(self) -> str:
+        # Ops without a mapping are charged to line 0 of the program itself
+        if not self.line:
+            return f"{self.source} (unmapped)"
+        return f"{Path(self.source).name}:{self.line}"
+
+
+@dataclasses.dataclass(frozen=True)
+class ProgramMap:
+    """
+    A puya source map: each generated line of `mappings` is one program
+    counter, and `pc_events` names the op (and entered subroutine) at each pc.
+    """
+
+    name: str
+    lines: dict[int, SourceLine]
+    ops: dict[int, str]
+    subroutines: dict[int, str]
+
+    @classmethod
+    def load(cls, path: Path, name: str | None = None) -> "ProgramMap":
+        source_map = cast(_SourceMap, json.loads(path.read_text()))
+        sources = [
+            str((path.parent / source).resolve()) for source in source_map["sources"]
+        ]
+        pc_offset = source_map.get("op_pc_offset", 0)
+        lines: dict[int, SourceLine] = {}
+        source_index = source_line = 0
+        for pc, group in enumerate(source_map["mappings"].split(";")):
+            for segment in filter(None, group.split(",")):
+                fields = _decode_vlq(segment)
+                if len(fields) >= 4:
+                    source_index += fields[1]
+                    source_line += fields[2]
+                    lines[pc + pc_offset] = SourceLine(
+                        sources[source_index], source_line + 1
+                    )
+
+        ops: dict[int, str] = {}
+        subroutines: dict[int, str] = {}
+        for event_pc, event in source_map["pc_events"].items():
+            pc = int(event_pc) + pc_offset
+            ops[pc] = event.get("op", "")
+            if "subroutine" in event:
+                _, _, subroutine = event["subroutine"].rpartition(".")
+                subroutines[pc] = subroutine
+        return cls(name or path.name.split(".")[0], lines, ops, subroutines)
+
+    def cost(self, pc: int) -> int:
+        mnemonic = self.ops.get(pc, "").split(" ", 1)[0]
+        return OPCODE_COSTS.get(mnemonic, 1)
+
+
+@dataclasses.dataclass
+class Profile:
+    """Opcode cost per source line and per collapsed call stack"""
+
+    line_costs: Counter[SourceLine] = dataclasses.field(default_factory=Counter)
+    line_ops: Counter[SourceLine] = dataclasses.field(default_factory=Counter)
+    stack_costs: Counter[tuple[str, ...]] = dataclasses.field(default_factory=Counter)
+
+    @property
+    def total_cost(self) -> int:
+        return sum(self.line_costs.values())
+
+    def add_trace(
+        self,
+        program: ProgramMap,
+        trace: Iterable[SimulationOpcodeTraceUnit],
+        root: tuple[str, ...] = (),
+    ) -> None:
+        """Attribute every executed op of one program trace"""
+        frames = [*root, program.name]
+        entering = False
+        for unit in trace:
+            pc = unit["pc"]
+            if entering:
+                frames.append(program.subroutines.get(pc, f"pc{pc}"))
+                entering = False
+
+            cost = program.cost(pc)
+            line = program.lines.get(pc, SourceLine(program.name, 0))
+            self.line_costs[line] += cost
+            self.line_ops[line] += 1
+            self.stack_costs[(*frames, str(line))] += cost
+
+            op = program.ops.get(pc, "")
+            if op.startswith("callsub"):
+                entering = True
+            elif op.startswith("retsub") and len(frames) > len(root) + 1:
+                frames.pop()
+
+    def add_txn_trace(
+        self,
+        exec_trace: SimulationTransactionExecTrace,
+        programs: dict[bytes, ProgramMap],
+        root: tuple[str, ...] = (),
+    ) -> None:
+        """Attribute an app call's trace, recursing into inner app calls"""
+        program_hash = base64.b64decode(exec_trace.get("approval-program-hash", ""))
+        program = programs.get(program_hash)
+        if program is None:
+            logger.debug(f"No source map for program {program_hash.hex()[:16]}")
+        else:
+            self.add_trace(program, exec_trace.get("approval-program-trace", []), root)
+            root = (*root, program.name)
+        for inner in exec_trace.get("inner-trace", []):
+            self.add_txn_trace(inner, programs, root)
+
+    def format_table(self, limit: int = 30, width: int = 30) -> str:
+        """Per-line cost table, most expensive lines first, with a bar per line"""
+        total = self.total_cost or 1
+        source_cache: dict[str, list[str]] = {}
+        rows = [
+            f"{'cost':>7} {'%':>6} {'ops':>6}  {'line':<32} {'':<{width}}  source",
+        ]
+        for line, cost in self.line_costs.most_common(limit):
+            bar = "█" * max(1, round(width * cost / total))
+            rows.append(
+                f"{cost:>7} {100 * cost / total:>5.1f}% {self.line_ops[line]:>6}"
+                f"  {line!s:<32} {bar:<{width}}  {_source_text(line, source_cache)}"
+            )
+        rows.append(f"{self.total_cost:>7} total opcode cost")
+        return "\n".join(rows)
+
+    def write_collapsed(self, path: Path) -> None:
+        """Write `frame;frame;line cost` stacks for flamegraph.pl or speedscope"""
+        with path.open("w") as out:
+            for frames, cost in sorted(self.stack_costs.items()):
+                out.write(f"{';'.join(frames)} {cost}\n")
+
+
+def load_program_maps(spec_dir: Path = APP_SPEC_DIR) -> dict[bytes, ProgramMap]:
+    """Source maps of every built approval program, keyed by program hash"""
+    programs: dict[bytes, ProgramMap] = {}
+    for spec_path in sorted(spec_dir.glob("*.arc56.json")):
+        app_spec = cast(_AppSpec, json.loads(spec_path.read_text()))
+        contract_name = app_spec["name"]
+        map_path = spec_dir / f"{contract_name}.approval.puya.map"
+        if not map_path.exists() or not app_spec.get("byteCode"):
+            continue
+        program = base64.b64decode(app_spec["byteCode"]["approval"])
+        program_hash = cast(bytes, encoding.checksum(program))
+        programs[program_hash] = ProgramMap.load(map_path, contract_name)
+    return programs
+
+
+def profile_simulation(
+    simulate_response: SimulateResponse, programs: dict[bytes, ProgramMap]
+) -> Profile:
+    """Profile every app call in a simulate response made with exec-trace enabled"""
+    profile = Profile()
+    for group in simulate_response["txn-groups"]:
+        for txn_result in group["txn-results"]:
+            if "exec-trace" in txn_result:
+                profile.add_txn_trace(txn_result["exec-trace"], programs)
+    return profile
+
+
+def _decode_vlq(segment: str) -> list[int]:
+    values: list[int] = []
+    value = shift = 0
+    for char in segment:
+        digit = _BASE64_DIGITS[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+        else:
+            values.append(-(value >> 1) if value & 1 else value >> 1)
+            value = shift = 0
+    return values
+
+
+def _source_text(line: SourceLine, cache: dict[str, list[str]]) -> str:
+    if line.source not in cache:
+        path = Path(line.source)
+        cache[line.source] = path.read_text().splitlines() if path.exists() else []
+    lines = cache[line.source]
+    return lines[line.line - 1].strip() if 0 < line.line <= len(lines) else ""
+
+
+def _deployed_app_id() -> int:
+    deployment_info = cast(dict[str, int], json.loads(DEPLOYMENT_INFO_PATH.read_text()))
+    return deployment_info["app_id"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Profile an AlgoRealmGameManager method call per contract.py line"
+    )
+    parser.add_argument("method", help="ABI method name, e.g. recover_lost_item")
+    parser.add_argument("--args", default="[]", help="JSON list of method arguments")
+    parser.add_argument("--app-id", type=int, default=None)
+    parser.add_argument("--limit", type=int, default=30, help="lines in the table")
+    parser.add_argument(
+        "--collapsed", type=Path, default=None, help="write collapsed stacks here"
+    )
+    args = parser.parse_args()
+    method: str = args.method
+    args_json: str = args.args
+    requested_app_id: int | None = args.app_id
+    limit: int = args.limit
+    collapsed: Path | None = args.collapsed
+
+    import algokit_utils
+    from algosdk.v2client.models import SimulateTraceConfig
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    app_id = requested_app_id or _deployed_app_id()
+    method_args = cast(list[algokit_utils.ABIValue], json.loads(args_json))
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    sender = algorand.account.from_environment("DEPLOYER")
+    app_client = algorand.client.get_app_client_by_id(
+        app_spec=(APP_SPEC_DIR / "AlgoRealmGameManager.arc56.json").read_text(),
+        app_id=app_id,
+        default_sender=sender.address,
+    )
+
+    composer = algorand.new_group().add_app_call_method_call(
+        app_client.params.call(
+            algokit_utils.AppClientMethodCallParams(method=method, args=method_args)
+        )
+    )
+    result = composer.simulate(
+        allow_unnamed_resources=True,
+        exec_trace_config=SimulateTraceConfig(enable=True),
+        skip_signatures=True,
+    )
+    simulate_response = cast(SimulateResponse | None, result.simulate_response)
+    assert simulate_response is not None
+    profile = profile_simulation(simulate_response, load_program_maps())
+
+    print(profile.format_table(limit=limit))
+    if collapsed is not None:
+        profile.write_collapsed(collapsed)
+        logger.info(f"🔥 Wrote collapsed stacks to {collapsed}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
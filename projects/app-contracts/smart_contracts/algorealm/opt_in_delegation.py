@@ -0,0 +1,38 @@
+from algopy import (
+    Global,
+    TemplateVar,
+    TransactionType,
+    Txn,
+    UInt64,
+    arc4,
+    gtxn,
+    logicsig,
+    op,
+)
+
+
+@logicsig(name="AlgoRealmItemOptIn")
+def item_opt_in_delegation() -> bool:
+    """
+    Delegated logic signature a player signs once so the game server can opt
+    them in to an item it delivers in the same group.
+    Only approves a zero-amount, zero-fee asset transfer to the player itself,
+    with no close-to or rekey, immediately followed by a deliver_item call to
+    the AlgoRealm app for that asset and player. A logic signature cannot read
+    asset params, so the "created by AlgoRealm" check is left to deliver_item.
+    """
+    deliver = gtxn.ApplicationCallTransaction(Txn.group_index + 1)
+    return (
+        Txn.type_enum == TransactionType.AssetTransfer
+        and Txn.asset_receiver == Txn.sender
+        and Txn.asset_amount == 0
+        and Txn.fee == 0
+        and Txn.asset_close_to == Global.zero_address
+        and Txn.asset_sender == Global.zero_address
+        and Txn.rekey_to == Global.zero_address
+        and deliver.app_id.id == TemplateVar[UInt64]("ALGOREALM_APP_ID")
+        and deliver.app_args(0)
+        == arc4.arc4_signature("deliver_item(asset,account)void")
+        and deliver.assets(op.btoi(deliver.app_args(1))) == Txn.xfer_asset
+        and deliver.accounts(op.btoi(deliver.app_args(2))) == Txn.sender
+    )
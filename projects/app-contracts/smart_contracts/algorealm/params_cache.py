@@ -0,0 +1,94 @@
+"""Process-wide suggested params cache shared by every AlgoRealm client path"""
+
+import copy
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, cast
+
+import algokit_utils
+from algosdk import transaction
+
+if TYPE_CHECKING:
+    from algosdk.v2client.algod import AlgodClient
+
+# About one round; params are refreshed at most once per block
+DEFAULT_TTL_SECONDS = 2.8
+
+
+class SuggestedParamsCache:
+    """
+    Caches suggested params per algod endpoint.
+    Entries are refreshed once they are older than ttl_seconds, and callers
+    always get a copy so they can adjust fees and validity freely.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: dict[str, tuple[transaction.SuggestedParams, float]] = {}
+        self._lock = threading.Lock()
+
+    def get_fresh(self, key: str) -> transaction.SuggestedParams | None:
+        """Cached params for key, or None if missing or stale"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        sp, fetched_at = entry
+        if self._clock() - fetched_at >= self.ttl_seconds:
+            return None
+        return copy.copy(sp)
+
+    def put(self, key: str, sp: transaction.SuggestedParams) -> None:
+        with self._lock:
+            self._entries[key] = (copy.copy(sp), self._clock())
+
+    def get(
+        self, key: str, fetch: Callable[[], transaction.SuggestedParams]
+    ) -> transaction.SuggestedParams:
+        """Cached params for key, fetching them if missing or stale"""
+        sp = self.get_fresh(key)
+        if sp is None:
+            sp = fetch()
+            self.put(key, sp)
+        return copy.copy(sp)
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Force the next lookup for key (or every key) to refetch"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+suggested_params_cache = SuggestedParamsCache()
+
+
+def suggested_params(algod: "AlgodClient") -> transaction.SuggestedParams:
+    """suggested_params() for a raw algosdk client, served from the shared cache"""
+    fetch = cast(Callable[[], transaction.SuggestedParams], algod.suggested_params)
+    return suggested_params_cache.get(algod.algod_address, fetch)
+
+
+_shared_algorand: algokit_utils.AlgorandClient | None = None
+
+
+def shared_algorand_client() -> algokit_utils.AlgorandClient:
+    """
+    One AlgorandClient per process, configured from the environment.
+    Its composers reuse cached suggested params instead of fetching them for
+    every group.
+    """
+    global _shared_algorand
+    if _shared_algorand is None:
+        _shared_algorand = algokit_utils.AlgorandClient.from_environment()
+        _shared_algorand.set_suggested_params_cache_timeout(
+            int(DEFAULT_TTL_SECONDS * 1000)
+        )
+    return _shared_algorand
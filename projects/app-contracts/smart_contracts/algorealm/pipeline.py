@@ -0,0 +1,257 @@
+"""Pipelined transaction submission with per-round confirmation batching"""
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+from collections.abc import Callable
+from typing import cast
+
+import httpx
+from algosdk import transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+
+from smart_contracts.algorealm.async_client import (
+    AsyncAlgodClient,
+    AsyncAlgoRealmClient,
+)
+from smart_contracts.algorealm.params_cache import suggested_params_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PENDING = 1_000
+DEFAULT_MAX_ATTEMPTS = 3
+# Short validity so dead transactions are detected and retried quickly
+DEFAULT_VALIDITY_WINDOW = 10
+# Consecutive algod errors the block watcher retries before giving up
+DEFAULT_MAX_WATCH_RETRIES = 5
+# First block watcher retry delay, doubled after every further error
+DEFAULT_WATCH_RETRY_DELAY_SECONDS = 0.5
+
+# Builds and signs a group from fresh suggested params (called again on retry)
+TransactionBuilder = Callable[
+    [transaction.SuggestedParams], list[transaction.GenericSignedTransaction]
+]
+
+_DEAD_ERRORS = ("txn dead",)
+# algod's pool ("fee N below threshold M") and group ("txgroup had N in fees,
+# which is less than the minimum M") fee rejections
+_FEE_ERRORS = ("below threshold", "less than the minimum")
+
+
+@dataclasses.dataclass(frozen=True)
+class PipelineResult:
+    """Outcome of a confirmed submission"""
+
+    tx_id: str
+    confirmed_round: int
+    attempts: int
+
+
+@dataclasses.dataclass
+class _Submission:
+    build: TransactionBuilder
+    future: "asyncio.Future[PipelineResult]"
+    tx_id: str = ""
+    last_valid: int = 0
+    attempts: int = 0
+    fee_bumps: int = 0
+
+
+class SubmissionPipeline:
+    """
+    Submits independent transaction groups back-to-back without waiting for
+    each one to confirm.
+    Submitted groups are tracked in a pending set that is resolved once per
+    round from the block's transaction IDs. Submissions that expire
+    (`txn dead`) or are rejected for their fee are rebuilt and retried, and at
+    most max_pending groups are in flight at once. If algod keeps failing
+    the block watcher, every pending and later submission fails.
+    """
+
+    def __init__(
+        self,
+        algod: AsyncAlgodClient,
+        *,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        validity_window: int = DEFAULT_VALIDITY_WINDOW,
+        max_watch_retries: int = DEFAULT_MAX_WATCH_RETRIES,
+        watch_retry_delay: float = DEFAULT_WATCH_RETRY_DELAY_SECONDS,
+    ) -> None:
+        self.algod = algod
+        self.max_attempts = max_attempts
+        self.validity_window = validity_window
+        self.max_watch_retries = max_watch_retries
+        self.watch_retry_delay = watch_retry_delay
+        self._capacity = asyncio.Semaphore(max_pending)
+        self._pending: dict[str, _Submission] = {}
+        self._in_progress: set[asyncio.Future[PipelineResult]] = set()
+        self._watcher: asyncio.Task[None] | None = None
+        self._watch_error: Exception | None = None
+
+    async def __aenter__(self) -> "SubmissionPipeline":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.drain()
+        await self.stop()
+
+    def start(self) -> None:
+        """Start watching blocks for confirmations"""
+        if self._watcher is None:
+            self._watcher = asyncio.create_task(self._watch_blocks())
+
+    async def stop(self) -> None:
+        if self._watcher is not None:
+            self._watcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._watcher
+            self._watcher = None
+
+    async def drain(self) -> None:
+        """Wait until every submitted group is confirmed or has failed"""
+        if self._in_progress:
+            await asyncio.gather(*self._in_progress, return_exceptions=True)
+
+    async def submit(
+        self, build: TransactionBuilder
+    ) -> "asyncio.Future[PipelineResult]":
+        """
+        Sign and submit a group, returning a future resolved on confirmation.
+        Waits while max_pending groups are already in flight.
+        """
+        await self._capacity.acquire()
+        future: asyncio.Future[PipelineResult] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._in_progress.add(future)
+        future.add_done_callback(self._release)
+
+        await self._send(_Submission(build=build, future=future))
+        return future
+
+    async def submit_method_call(
+        self,
+        client: AsyncAlgoRealmClient,
+        method: str,
+        args: list[object] | None = None,
+        *,
+        sender: str,
+        signer: TransactionSigner,
+        inner_transactions: int = 0,
+    ) -> "asyncio.Future[PipelineResult]":
+        """Submit an AlgoRealm method call through the pipeline"""
+
+        def build(
+            sp: transaction.SuggestedParams,
+        ) -> list[transaction.GenericSignedTransaction]:
+            atc = client.compose_method_call(
+                sp,
+                method,
+                args,
+                sender=sender,
+                signer=signer,
+                inner_transactions=inner_transactions,
+            )
+            return atc.gather_signatures()
+
+        return await self.submit(build)
+
+    def _release(self, future: "asyncio.Future[PipelineResult]") -> None:
+        self._in_progress.discard(future)
+        self._capacity.release()
+
+    async def _send(self, submission: _Submission) -> None:
+        if self._watch_error is not None:
+            submission.future.set_exception(self._watcher_stopped())
+            return
+
+        # Served from the shared cache; the block watcher expires it each round
+        sp = await self.algod.suggested_params()
+        first_round = cast(int, sp.first)
+        sp.last = first_round + self.validity_window
+        sp.min_fee = cast(int, sp.min_fee) * (1 + submission.fee_bumps)
+
+        submission.attempts += 1
+        try:
+            signed_txns = submission.build(sp)
+            submission.last_valid = signed_txns[0].transaction.last_valid_round
+            submission.tx_id = await self.algod.send_transactions(signed_txns)
+        except httpx.HTTPStatusError as e:
+            await self._retry_or_fail(submission, e.response.text)
+            return
+        except Exception as e:
+            submission.future.set_exception(e)
+            return
+
+        self._pending[submission.tx_id] = submission
+
+    async def _retry_or_fail(self, submission: _Submission, error: str) -> None:
+        is_dead = any(message in error for message in _DEAD_ERRORS)
+        is_fee = any(message in error for message in _FEE_ERRORS)
+        if (is_dead or is_fee) and submission.attempts < self.max_attempts:
+            logger.debug(f"Retrying submission after: {error}")
+            if is_fee:
+                submission.fee_bumps += 1
+            suggested_params_cache.invalidate(self.algod.address)
+            await self._send(submission)
+            return
+        submission.future.set_exception(Exception(f"Submission failed: {error}"))
+
+    async def _watch_blocks(self) -> None:
+        last_round: int | None = None
+        errors = 0
+        while True:
+            try:
+                if last_round is None:
+                    last_round = (await self.algod.status())["last-round"]
+                status = await self.algod.status_after_block(last_round)
+                current_round = status["last-round"]
+                suggested_params_cache.invalidate(self.algod.address)
+
+                for round_ in range(last_round + 1, current_round + 1):
+                    if self._pending:
+                        await self._confirm_round(round_)
+                    # A retry resumes after the last fully processed round
+                    last_round = round_
+                errors = 0
+            except Exception as e:
+                errors += 1
+                if errors > self.max_watch_retries:
+                    logger.error(f"Block watcher stopped after {errors} errors: {e}")
+                    self._watch_error = e
+                    self._fail_pending()
+                    return
+                delay = self.watch_retry_delay * (1 << (errors - 1))
+                logger.warning(f"Block watcher error, retrying in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+
+    def _fail_pending(self) -> None:
+        pending = list(self._pending.values())
+        self._pending.clear()
+        for submission in pending:
+            if not submission.future.done():
+                submission.future.set_exception(self._watcher_stopped())
+
+    def _watcher_stopped(self) -> Exception:
+        return Exception(f"Block watcher stopped: {self._watch_error}")
+
+    async def _confirm_round(self, round_: int) -> None:
+        for tx_id in await self.algod.block_txids(round_):
+            submission = self._pending.pop(tx_id, None)
+            if submission is not None and not submission.future.done():
+                submission.future.set_result(
+                    PipelineResult(tx_id, round_, submission.attempts)
+                )
+
+        # Anything still pending past its last valid round can never confirm
+        expired = [
+            submission
+            for submission in self._pending.values()
+            if submission.last_valid <= round_
+        ]
+        for submission in expired:
+            del self._pending[submission.tx_id]
+            await self._retry_or_fail(submission, "txn dead")
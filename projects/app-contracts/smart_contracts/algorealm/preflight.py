@@ -0,0 +1,160 @@
+"""Plan references and opcode budget padding for AlgoRealm groups from a simulate pass"""
+
+import base64
+import copy
+import dataclasses
+import math
+from typing import NamedTuple, TypeVar, cast
+
+from algosdk import constants, transaction
+from algosdk.box_reference import BoxReference
+
+from smart_contracts.algorealm.algod_types import (
+    SimulateTransactionGroupResult,
+    UnnamedResourcesAccessed,
+)
+
+# Maximum number of transactions in a group
+MAX_GROUP_SIZE = 16
+# Per app call: accounts + assets + apps + boxes, of which at most 4 accounts
+MAX_REFERENCES = 8
+MAX_ACCOUNT_REFERENCES = 4
+# Opcode budget every app call adds to the group's pool
+APP_CALL_BUDGET = 700
+# Padding calls run PADDING_METHOD, which spends part of its own budget
+PADDING_METHOD = "get_game_info"
+PADDING_CALL_COST = 100
+# Extra budget the preflight simulation runs with so it can measure the need
+PREFLIGHT_EXTRA_BUDGET = APP_CALL_BUDGET * MAX_GROUP_SIZE
+
+_T = TypeVar("_T")
+
+
+@dataclasses.dataclass
+class References:
+    """Foreign arrays and box references of one app call"""
+
+    accounts: list[str] = dataclasses.field(default_factory=list)
+    assets: list[int] = dataclasses.field(default_factory=list)
+    apps: list[int] = dataclasses.field(default_factory=list)
+    boxes: list[tuple[int, bytes]] = dataclasses.field(default_factory=list)
+
+    @classmethod
+    def of(cls, txn: transaction.Transaction) -> "References":
+        """References an app call already carries (e.g. for reference-type args)"""
+        txn_type: str = txn.type
+        if txn_type != constants.APPCALL_TXN:
+            return cls()
+        app_call = cast(transaction.ApplicationCallTxn, txn)
+        # Some algosdk releases leave the foreign arrays untyped
+        accounts: list[str] | None = app_call.accounts
+        assets: list[int] | None = app_call.foreign_assets
+        foreign_apps: list[int] | None = app_call.foreign_apps
+        apps = list(foreign_apps or [])
+        # algosdk annotates boxes as tuples but stores translated BoxReferences
+        boxes = cast(list[BoxReference] | None, app_call.boxes) or []
+        return cls(
+            accounts=list(accounts or []),
+            assets=list(assets or []),
+            apps=apps,
+            boxes=[
+                (apps[box.app_index - 1] if box.app_index else 0, bytes(box.name))
+                for box in boxes
+            ],
+        )
+
+    def __len__(self) -> int:
+        return len(self.accounts) + len(self.assets) + len(self.apps) + len(self.boxes)
+
+    def has_room(self, slots: int = 1, accounts: int = 0) -> bool:
+        return (
+            len(self) + slots <= MAX_REFERENCES
+            and len(self.accounts) + accounts <= MAX_ACCOUNT_REFERENCES
+        )
+
+
+class PreflightPlan(NamedTuple):
+    # One entry per original call, then one per padding call
+    references: list[References]
+    padding_calls: int
+
+
+def plan_group(
+    group_result: SimulateTransactionGroupResult,
+    references: list[References],
+    extra_budget: int = PREFLIGHT_EXTRA_BUDGET,
+) -> PreflightPlan:
+    """
+    Place the resources a simulated group accessed without naming them, and
+    count the padding calls that cover any opcode budget shortfall.
+    Resources one transaction accessed stay on that transaction; resources
+    shared through the group go on whichever call has room, spilling onto
+    padding calls when every call is full.
+    """
+    planned = copy.deepcopy(references)
+
+    for index, txn_result in enumerate(group_result.get("txn-results", [])):
+        unnamed = txn_result.get("unnamed-resources-accessed")
+        if unnamed and index < len(planned):
+            _place(unnamed, [planned[index]], allow_padding=False)
+
+    budget_consumed = group_result.get("app-budget-consumed", 0)
+    budget_added = group_result.get("app-budget-added", 0) - extra_budget
+    shortfall = max(0, budget_consumed - budget_added)
+    padding_calls = math.ceil(shortfall / (APP_CALL_BUDGET - PADDING_CALL_COST))
+    planned.extend(References() for _ in range(padding_calls))
+
+    unnamed = group_result.get("unnamed-resources-accessed")
+    if unnamed:
+        _place(unnamed, planned, allow_padding=True)
+
+    padding_calls = len(planned) - len(references)
+    if len(planned) > MAX_GROUP_SIZE:
+        raise ValueError(
+            f"Group needs {padding_calls} padding calls and does not fit in"
+            f" {MAX_GROUP_SIZE} transactions"
+        )
+    return PreflightPlan(planned, padding_calls)
+
+
+def _place(
+    unnamed: UnnamedResourcesAccessed, planned: list[References], *, allow_padding: bool
+) -> None:
+    def slot(slots: int = 1, accounts: int = 0) -> References:
+        for refs in planned:
+            if refs.has_room(slots, accounts):
+                return refs
+        if not allow_padding:
+            raise ValueError("Transaction accesses more resources than it can name")
+        planned.append(References())
+        return planned[-1]
+
+    # Holdings and local states need both halves named on the same call
+    for holding in unnamed.get("asset-holdings", []):
+        refs = slot(2, accounts=1)
+        _append(refs.accounts, holding["account"])
+        _append(refs.assets, holding["asset"])
+    for local in unnamed.get("app-locals", []):
+        refs = slot(2, accounts=1)
+        _append(refs.accounts, local["account"])
+        _append(refs.apps, local["app"])
+
+    for account in unnamed.get("accounts", []):
+        if not any(account in refs.accounts for refs in planned):
+            slot(accounts=1).accounts.append(account)
+    for asset in unnamed.get("assets", []):
+        if not any(asset in refs.assets for refs in planned):
+            slot().assets.append(asset)
+    for app in unnamed.get("apps", []):
+        if not any(app in refs.apps for refs in planned):
+            slot().apps.append(app)
+    for box in unnamed.get("boxes", []):
+        slot().boxes.append((box["app"], base64.b64decode(box.get("name", ""))))
+    # Each extra empty box reference adds 1KB of box read/write quota
+    for _ in range(unnamed.get("extra-box-refs", 0)):
+        slot().boxes.append((0, b""))
+
+
+def _append(values: list[_T], value: _T) -> None:
+    if value not in values:
+        values.append(value)
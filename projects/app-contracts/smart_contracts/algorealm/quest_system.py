@@ -1,5 +1,6 @@
 from algopy import (
     Account,
+    Application,
     ARC4Contract,
     Bytes,
     Global,
@@ -8,32 +9,53 @@ from algopy import (
     String,
     Txn,
     UInt64,
-    log,
+    arc4,
     op,
 )
-from algopy.arc4 import Bool, Struct, abimethod
+from algopy.arc4 import Address, Bool, Struct, abimethod
 
 
 class Quest(Struct):
     """Quest structure"""
 
-    quest_id: UInt64
-    name: String
-    description: String
-    reward_item_type: String
-    reward_rarity: String
-    experience_reward: UInt64
+    quest_id: arc4.UInt64
+    name: arc4.String
+    description: arc4.String
+    reward_item_type: arc4.String
+    reward_rarity: arc4.String
+    experience_reward: arc4.UInt64
     is_active: Bool
-    completion_count: UInt64
+    completion_count: arc4.UInt64
 
 
 class QuestProgress(Struct):
     """Player's quest progress"""
 
-    quest_id: UInt64
-    progress: UInt64
+    quest_id: arc4.UInt64
+    progress: arc4.UInt64
     is_completed: Bool
-    completion_time: UInt64
+    completion_time: arc4.UInt64
+
+
+class QuestCreated(Struct):
+    """ARC-28 event: the quest master added a quest"""
+
+    quest_id: arc4.UInt64
+    experience_reward: arc4.UInt64
+
+
+class QuestCompleted(Struct):
+    """ARC-28 event: a player completed a quest"""
+
+    quest_id: arc4.UInt64
+    player: Address
+
+
+class RecoveryProofGenerated(Struct):
+    """ARC-28 event: a player generated a single-use recovery proof"""
+
+    quest_id: arc4.UInt64
+    player: Address
 
 
 class AlgoRealmQuestSystem(ARC4Contract):
@@ -43,13 +65,31 @@ class AlgoRealmQuestSystem(ARC4Contract):
     """
 
     def __init__(self) -> None:
-        self.quest_master = GlobalState(Account(Global.creator_address))
+        self.quest_master = GlobalState(Global.creator_address)
         self.total_quests = GlobalState(UInt64(0))
         self.active_quests_count = GlobalState(UInt64(0))
+        # Game manager app allowed to consume recovery proofs
+        self.game_manager_app = GlobalState(Application(0))
 
         # Local state for players
         self.completed_quests_count = LocalState(UInt64)
         self.total_experience_earned = LocalState(UInt64)
+        self.recovery_proof_hash = LocalState(Bytes)  # sha256 of the pending proof
+
+    @abimethod(allow_actions=["OptIn"])
+    def opt_in(self) -> None:
+        """Opt in to track quest progress"""
+        self.completed_quests_count[Txn.sender] = UInt64(0)
+        self.total_experience_earned[Txn.sender] = UInt64(0)
+        self.recovery_proof_hash[Txn.sender] = Bytes()
+
+    @abimethod()
+    def set_game_manager(self, game_manager: Application) -> None:
+        """Link the game manager app that verifies recovery proofs (quest master only)"""
+        assert (
+            Txn.sender == self.quest_master.value
+        ), "Only quest master can link the game manager"
+        self.game_manager_app.value = game_manager
 
     @abimethod()
     def create_quest(
@@ -73,7 +113,7 @@ class AlgoRealmQuestSystem(ARC4Contract):
         self.total_quests.value = quest_id
         self.active_quests_count.value += 1
 
-        log(f"Quest '{name}' created with ID {quest_id}")
+        arc4.emit(QuestCreated(arc4.UInt64(quest_id), arc4.UInt64(experience_reward)))
         return quest_id
 
     @abimethod()
@@ -83,7 +123,7 @@ class AlgoRealmQuestSystem(ARC4Contract):
         This can be used as proof for item recovery
         """
         assert quest_id <= self.total_quests.value, "Quest does not exist"
-        assert len(completion_proof) > 0, "Must provide completion proof"
+        assert completion_proof.length > 0, "Must provide completion proof"
 
         # Verify quest completion (simplified)
         # In real implementation, check specific quest requirements
@@ -92,8 +132,8 @@ class AlgoRealmQuestSystem(ARC4Contract):
         self.completed_quests_count[Txn.sender] += 1
         self.total_experience_earned[Txn.sender] += UInt64(100)  # Base reward
 
-        log(f"Quest {quest_id} completed by player!")
-        return f"Quest {quest_id} completed! Earned experience."
+        arc4.emit(QuestCompleted(arc4.UInt64(quest_id), Address(Txn.sender)))
+        return String("Quest completed! Earned experience.")
 
     @abimethod()
     def generate_recovery_proof(self, quest_id: UInt64) -> Bytes:
@@ -111,10 +151,31 @@ class AlgoRealmQuestSystem(ARC4Contract):
             + op.itob(quest_id)
             + op.itob(Global.latest_timestamp)
         )
+        # Remember the proof so the game manager can verify it exactly once
+        self.recovery_proof_hash[Txn.sender] = op.sha256(proof)
 
-        log("Recovery proof generated")
+        arc4.emit(RecoveryProofGenerated(arc4.UInt64(quest_id), Address(Txn.sender)))
         return proof
 
+    @abimethod()
+    def consume_recovery_proof(self, player: Account, proof: Bytes) -> bool:
+        """
+        Verify and invalidate a player's recovery proof
+        Only callable by the linked game manager via an inner app call
+        """
+        # Top-level calls have caller ID 0, so an unset link must not match them
+        assert self.game_manager_app.value.id != 0, "Game manager not linked"
+        assert (
+            Global.caller_application_id == self.game_manager_app.value.id
+        ), "Only the game manager can consume recovery proofs"
+
+        expected_hash = self.recovery_proof_hash.get(player, Bytes())
+        if expected_hash == Bytes() or expected_hash != op.sha256(proof):
+            return False
+
+        self.recovery_proof_hash[player] = Bytes()
+        return True
+
     @abimethod(readonly=True)
     def get_player_quest_stats(self, player: Account) -> tuple[UInt64, UInt64]:
         """Get player's quest statistics"""
@@ -0,0 +1,125 @@
+"""Report on per-player season counters around an AlgoRealm season rollover"""
+
+import argparse
+import base64
+import dataclasses
+import json
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import cast
+
+from smart_contracts.algorealm.algod_types import ApplicationInfo
+from smart_contracts.algorealm.event_indexer import DEFAULT_DB_PATH, EventStore
+from smart_contracts.algorealm.state_cache import PlayerState, PlayerStateCache
+
+logger = logging.getLogger(__name__)
+
+DEPLOYMENT_INFO_PATH = Path("deployment_info.json")
+
+
+@dataclasses.dataclass
+class RolloverReport:
+    """
+    Where players' season counters stand relative to the current season.
+    Stale counters need no migration: the contract treats them as zero and
+    restamps them on the player's next recovery.
+    """
+
+    season: int
+    max_recoveries: int
+    players: int = 0
+    not_opted_in: int = 0
+    current: int = 0
+    stale: int = 0
+    capped_current: int = 0
+    capped_stale: int = 0
+    stamps_by_season: Counter[int] = dataclasses.field(default_factory=Counter)
+
+    def add(self, state: PlayerState) -> None:
+        self.players += 1
+        if not state.is_opted_in:
+            self.not_opted_in += 1
+            return
+
+        self.stamps_by_season[state.player_season] += 1
+        capped = state.player_recovery_count >= self.max_recoveries
+        if state.player_season == self.season:
+            self.current += 1
+            self.capped_current += capped
+        else:
+            self.stale += 1
+            self.capped_stale += capped
+
+    def format(self) -> str:
+        lines = [
+            f"Season {self.season} rollover report ({self.players} players)",
+            f"  not opted in:              {self.not_opted_in}",
+            f"  stamped this season:       {self.current}"
+            f" ({self.capped_current} at the recovery cap)",
+            f"  stale, reset on next use:  {self.stale}"
+            f" ({self.capped_stale} were at the cap)",
+            "  stamps by season:",
+        ]
+        lines.extend(
+            f"    season {season}: {count}"
+            for season, count in sorted(self.stamps_by_season.items())
+        )
+        return "\n".join(lines)
+
+
+def read_season_config(cache: PlayerStateCache) -> tuple[int, int]:
+    """(current_season, max_recovery_per_item) from the app's global state"""
+    app = cast(ApplicationInfo, cache.algod.application_info(cache.app_id))
+    values = {
+        base64.b64decode(item["key"]): item["value"].get("uint", 0)
+        for item in app["params"].get("global-state", [])
+    }
+    return values.get(b"current_season", 1), values.get(b"max_recovery_per_item", 3)
+
+
+def _deployed_app_id() -> int:
+    deployment_info = cast(dict[str, int], json.loads(DEPLOYMENT_INFO_PATH.read_text()))
+    return deployment_info["app_id"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="AlgoRealm season rollover report")
+    parser.add_argument("--app-id", type=int, default=None)
+    parser.add_argument(
+        "--db", type=Path, default=DEFAULT_DB_PATH, help="event index to read players"
+    )
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    args = parser.parse_args()
+    requested_app_id: int | None = args.app_id
+    db_path: Path = args.db
+    batch_size: int = args.batch_size
+
+    import algokit_utils
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    app_id = requested_app_id or _deployed_app_id()
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    cache = PlayerStateCache(algorand.client.algod, app_id, max_entries=batch_size)
+    season, max_recoveries = read_season_config(cache)
+
+    # Players are read in batches so the cache never holds more than one
+    report = RolloverReport(season=season, max_recoveries=max_recoveries)
+    store = EventStore(db_path)
+    rows = store.db.execute("SELECT address FROM players ORDER BY address")
+    while True:
+        page: list[tuple[str]] = rows.fetchmany(batch_size)
+        if not page:
+            break
+        batch = [address for (address,) in page]
+        for state in cache.get_many(batch).values():
+            report.add(state)
+        cache.invalidate()
+
+    print(report.format())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,207 @@
+"""Round-aware read cache for AlgoRealm player local state"""
+
+import base64
+import dataclasses
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, TypedDict, Unpack, cast
+
+from smart_contracts.algorealm.algod_types import (
+    AccountApplicationInfo,
+    NodeStatus,
+    TealKeyValue,
+)
+
+if TYPE_CHECKING:
+    from algosdk.v2client.algod import AlgodClient
+
+    from smart_contracts.artifacts.algorealm.algo_realm_game_manager_client import (
+        AlgoRealmGameManagerClient,
+    )
+
+# Average block time; the current round is re-read at most this often
+DEFAULT_ROUND_TTL_SECONDS = 2.8
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_FETCH_WORKERS = 8
+
+# arc4.Bool encoding of True
+_ARC4_TRUE = b"\x80"
+
+
+@dataclasses.dataclass(frozen=True)
+class PlayerState:
+    """Decoded AlgoRealm local state for one player"""
+
+    address: str
+    player_level: int = 0
+    player_experience: int = 0
+    player_recovery_count: int = 0
+    player_season: int = 0
+    is_registered: bool = False
+    is_opted_in: bool = False
+    round: int = 0
+
+    def recovery_count_in(self, season: int) -> int:
+        """Recoveries used in season; counters stamped with another season are stale"""
+        return self.player_recovery_count if self.player_season == season else 0
+
+
+def decode_local_state(
+    address: str, key_values: list[TealKeyValue], round_: int
+) -> PlayerState:
+    """Decode an algod app-local-state key-value list into a PlayerState"""
+    values: dict[str, int | bytes] = {}
+    for item in key_values:
+        key = base64.b64decode(item["key"]).decode()
+        value = item["value"]
+        if value.get("type") == 2:
+            values[key] = value.get("uint", 0)
+        else:
+            values[key] = base64.b64decode(value.get("bytes", ""))
+
+    def uint(key: str) -> int:
+        value = values.get(key, 0)
+        return value if isinstance(value, int) else 0
+
+    return PlayerState(
+        address=address,
+        player_level=uint("player_level"),
+        player_experience=uint("player_experience"),
+        player_recovery_count=uint("player_recovery_count"),
+        player_season=uint("player_season"),
+        is_registered=values.get("is_registered") == _ARC4_TRUE,
+        is_opted_in=True,
+        round=round_,
+    )
+
+
+class CacheOptions(TypedDict, total=False):
+    """Keyword options of PlayerStateCache"""
+
+    max_entries: int
+    round_ttl_seconds: float
+    fetch_workers: int
+    clock: Callable[[], float]
+
+
+class PlayerStateCache:
+    """
+    Caches decoded player state per round.
+    Each player is fetched from algod with a single account_application_info
+    call, at most once per round; least recently used entries are evicted
+    beyond max_entries.
+    """
+
+    def __init__(
+        self,
+        algod: "AlgodClient",
+        app_id: int,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        round_ttl_seconds: float = DEFAULT_ROUND_TTL_SECONDS,
+        fetch_workers: int = DEFAULT_FETCH_WORKERS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.algod = algod
+        self.app_id = app_id
+        self.max_entries = max_entries
+        self.round_ttl_seconds = round_ttl_seconds
+        self.fetch_workers = fetch_workers
+        self._clock = clock
+        self._entries: OrderedDict[str, PlayerState] = OrderedDict()
+        self._lock = threading.Lock()
+        self._round = 0
+        self._round_checked_at: float | None = None
+
+    @classmethod
+    def from_client(
+        cls, client: "AlgoRealmGameManagerClient", **kwargs: Unpack[CacheOptions]
+    ) -> "PlayerStateCache":
+        """Create a cache for the app behind a generated AlgoRealm client"""
+        return cls(client.algorand.client.algod, client.app_id, **kwargs)
+
+    def current_round(self) -> int:
+        """Last known round, refreshed from algod at most once per TTL"""
+        now = self._clock()
+        with self._lock:
+            if (
+                self._round_checked_at is not None
+                and now - self._round_checked_at < self.round_ttl_seconds
+            ):
+                return self._round
+        status = cast(NodeStatus, self.algod.status())
+        last_round = status["last-round"]
+        with self._lock:
+            self._round = max(self._round, last_round)
+            self._round_checked_at = now
+            return self._round
+
+    def get(self, address: str) -> PlayerState:
+        """Get one player's state, fetching it if the cached copy is stale"""
+        return self.get_many([address])[address]
+
+    def get_many(self, addresses: Iterable[str]) -> dict[str, PlayerState]:
+        """Get several players' state, fetching only stale or missing entries"""
+        wanted = list(dict.fromkeys(addresses, True))
+        round_ = self.current_round()
+
+        results: dict[str, PlayerState] = {}
+        missing: list[str] = []
+        with self._lock:
+            for address in wanted:
+                cached = self._entries.get(address)
+                if cached is not None and cached.round >= round_:
+                    self._entries.move_to_end(address)
+                    results[address] = cached
+                else:
+                    missing.append(address)
+
+        if missing:
+            if len(missing) == 1:
+                fetched = [self._fetch(missing[0])]
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.fetch_workers, len(missing))
+                ) as pool:
+                    fetched = list(pool.map(self._fetch, missing))
+            with self._lock:
+                for state in fetched:
+                    self._store(state)
+                    results[state.address] = state
+
+        return {address: results[address] for address in wanted}
+
+    def invalidate(self, address: str | None = None) -> None:
+        """Drop one player's cached state, or everything when no address is given"""
+        with self._lock:
+            if address is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(address, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _fetch(self, address: str) -> PlayerState:
+        try:
+            info = cast(
+                AccountApplicationInfo,
+                self.algod.account_application_info(address, self.app_id),
+            )
+        except Exception as e:
+            # algod answers 404 when the player is not opted in to the app
+            code: object = getattr(e, "code", None)
+            if code == 404:
+                return PlayerState(address=address, round=self.current_round())
+            raise
+        key_values = info.get("app-local-state", {}).get("key-value", [])
+        return decode_local_state(address, key_values, info.get("round", 0))
+
+    def _store(self, state: PlayerState) -> None:
+        self._entries[state.address] = state
+        self._entries.move_to_end(state.address)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "initialize_game", "returns": {"type": "string"}, "desc": "Initialize the game state - called once when contract is created", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp", "OptIn"], "create": []}, "args": [{"type": "string", "name": "player_name"}], "name": "register_player", "returns": {"type": "string"}, "desc": "Register a new player in the game", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "recipient"}, {"type": "string", "name": "item_name"}, {"type": "string", "name": "item_type"}, {"type": "string", "name": "rarity"}, {"type": "uint64", "name": "attack_power"}, {"type": "uint64", "name": "defense_power"}, {"type": "string", "name": "special_effect"}], "name": "create_game_item", "returns": {"type": "uint64"}, "desc": "Create a new game item as an ASA", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "asset", "name": "original_item_id"}, {"type": "byte[]", "name": "recovery_quest_proof"}, {"type": "account", "name": "new_recipient"}], "name": "recover_lost_item", "returns": {"type": "uint64"}, "desc": "ON-DEMAND TOKENIZATION: Recover a lost game item\nThis is the core feature for Task 6", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "event_name"}, {"type": "byte[]", "name": "participation_proof"}, {"type": "account", "name": "recipient"}], "name": "seasonal_event_reissue", "returns": {"type": "uint64"}, "desc": "ON-DEMAND TOKENIZATION: Reissue seasonal event items\nAllows players to earn previous season items in new events", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "asset", "name": "material_1"}, {"type": "asset", "name": "material_2"}, {"type": "uint64", "name": "recipe_id"}], "name": "craft_items", "returns": {"type": "uint64"}, "desc": "Craft new items by combining existing ones\nDemonstrates atomic transactions", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "player"}], "name": "get_player_stats", "returns": {"type": "(uint64,uint64,uint64)"}, "desc": "Get player statistics", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "advance_season", "returns": {"type": "uint64"}, "desc": "Advance to next season (only game master)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_game_info", "returns": {"type": "(uint64,uint64,uint64)"}, "desc": "Get current game information", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "asset", "name": "item_id"}], "name": "claim_item", "returns": {"type": "string"}, "desc": "Claim an item that was created for the player.\nPlayer must have opted-in to the asset before calling this.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "player"}], "name": "get_recovery_status", "returns": {"type": "(uint64,uint64)"}, "desc": "Get player's current recovery count and max allowed recoveries", "events": [], "readonly": true, "recommendations": {}}], "name": "AlgoRealmGameManager", "state": {"keys": {"box": {}, "global": {"total_players": {"key": "dG90YWxfcGxheWVycw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_items_created": {"key": "dG90YWxfaXRlbXNfY3JlYXRlZA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "game_master": {"key": "Z2FtZV9tYXN0ZXI=", "keyType": "AVMString", "valueType": "address"}, "current_season": {"key": "Y3VycmVudF9zZWFzb24=", "keyType": "AVMString", "valueType": "AVMUint64"}, "max_recovery_per_item": {"key": "bWF4X3JlY292ZXJ5X3Blcl9pdGVt", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {"player_level": {"key": "cGxheWVyX2xldmVs", "keyType": "AVMString", "valueType": "AVMUint64"}, "player_experience": {"key": "cGxheWVyX2V4cGVyaWVuY2U=", "keyType": "AVMString", "valueType": "AVMUint64"}, "player_recovery_count": {"key": "cGxheWVyX3JlY292ZXJ5X2NvdW50", "keyType": "AVMString", "valueType": "AVMUint64"}, "is_registered": {"key": "aXNfcmVnaXN0ZXJlZA==", "keyType": "AVMString", "valueType": "bool"}}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 4}, "local": {"bytes": 1, "ints": 3}}}, "structs": {}, "byteCode": {"approval": "CiADAAEDJgwEFR98dQ1pc19yZWdpc3RlcmVkAQAVcGxheWVyX3JlY292ZXJ5X2NvdW50DXRvdGFsX3BsYXllcnMTdG90YWxfaXRlbXNfY3JlYXRlZA5jdXJyZW50X3NlYXNvbhVtYXhfcmVjb3ZlcnlfcGVyX2l0ZW0LZ2FtZV9tYXN0ZXIMcGxheWVyX2xldmVsEXBsYXllcl9leHBlcmllbmNlDENSQUZURURfSVRFTTEbQQBUggsEs1qsOwSEPRjVBCphhIAE6+k/iwSg0TTQBIvN45YERdZeywQ7UnUfBEeaf5cEOtXt1QQCuD0ANhoAjgsBTQEsAPUA0gCvAI4AagBZADsAHQACIkMxGRREMRhENhoBF8AciASRTBZMFlAoTFCwI0MxGRREMRhENhoBF8AwiAQgSRUWVwYCTFAoTFCwI0MxGRREMRhEiAP4TwIWTwIWTwIWTgJQTFAoTFCwI0MxGRREMRhEiAOyFihMULAjQzEZFEQxGEQ2GgEXwByIA3pPAhZPAhZPAhZOAlBMUChMULAjQzEZFEQxGEQ2GgEXwDA2GgIXwDA2GgMXiAMEFihMULAjQzEZFEQxGEQ2GgFXAgA2GgJXAgA2GgMXwByIAm0WKExQsCNDMRkURDEYRDYaARfAMDYaAlcCADYaAxfAHIgBqhYoTFCwI0MxGRREMRhENhoBF8AcNhoCVwIANhoDVwIANhoEVwIANhoFFzYaBhc2GgdXAgCIAQ0WKExQsCNDIzEZkCQaRDEYRDYaAVcCAIgAVUkVFlcGAkxQKExQsCNDMRkURDEYFESIAA5JFRZXBgJMUChMULAjQycEImcnBSJnJwYjZycHJGcnCDEAZ4AWQWxnb1JlYWxtIGluaXRpYWxpemVkIYmKAQExGSMSQQAvMQAnCSJmMQAnCiJmMQArImYxACkqZoAWT3B0ZWQgaW4gdG8gQWxnb1JlYWxtIYkxACIpY0QqE0EAHIAZUGxheWVyIGFscmVhZHkgcmVnaXN0ZXJlZIkxACcJI2YxACcKImYxACsiZjEAKYABgGYiJwRlRCMIJwRMZ4v/sIAVV2VsY29tZSB0byBBbGdvUmVhbG0hiYoHATEAIicIZUQSRIv5IiljRCoTRLEyADIKRwOL+ov8ULIFsiyyK7IqsikisiQisiMjsiKAB0FMR0lURU2yJYv6siYkshCyAbO0PCInBWVEIwgnBUxngAxJdGVtIGNyZWF0ZWSwiYoDATEAIiljRCoTRIv9cQZIFUSL/oAAE0QxACIrY0QiJwdlREsBDUSL/XEESBVEgA9SRUNPVkVSRURfSVRFTV+L/lCxMgAyCkcDTwWyBbIssiuyKrIpIrIkIrIjI7IigAhBTEdSRUNPVrIlgA5SRUNPVkVSRURfSVRFTbImJLIQsgGztDxMIwgxACtPAmaADkl0ZW0gcmVjb3ZlcmVksImKAwExACIpY0QqE0SL/oAAE0SACVNFQVNPTkFMX4v+ULEyADIKSU8DsgWyKrIpIrIkIrIjI7IigAhBTEdTRUFTTrIlgA1TRUFTT05BTF9JVEVNsiYkshCyAbO0PIAUU2Vhc29uYWwgaXRlbSBpc3N1ZWSwiYoDATEAIiljRCoTRLEyADIKJwuyBbIpIrIkIrIjI7IigAhBTEdDUkFGVLIlJwuyJiSyELIBs7Q8gAxJdGVtIGNyYWZ0ZWSwiYoBA4v/IiljRCoTRIv/IicJY0SL/yInCmNEi/8iK2NEiTEAIicIZUQSRCInBmVEIwgnBksBZ4APU2Vhc29uIGFkdmFuY2VksIkiJwRlRCInBWVEIicGZUSJigEBMQAiKWNEKhNEi/9xB0gyAxNEsTIAMQCL/7IRI7ISshSBBLIQsgGzgAxJdGVtIGNsYWltZWSwgBpJdGVtIHN1Y2Nlc3NmdWxseSBjbGFpbWVkIYmKAQKL/yIpY0QqE0SL/yIrY0QiJwdlRIk=", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 9, "patch": 0}}, "desc": "\n    Main game manager contract for AlgoRealm\n    Handles player registration, item management, and on-demand tokenization\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDAgMSAzCiAgICBieXRlY2Jsb2NrIDB4MTUxZjdjNzUgImlzX3JlZ2lzdGVyZWQiIDB4MDAgInBsYXllcl9yZWNvdmVyeV9jb3VudCIgInRvdGFsX3BsYXllcnMiICJ0b3RhbF9pdGVtc19jcmVhdGVkIiAiY3VycmVudF9zZWFzb24iICJtYXhfcmVjb3ZlcnlfcGVyX2l0ZW0iICJnYW1lX21hc3RlciIgInBsYXllcl9sZXZlbCIgInBsYXllcl9leHBlcmllbmNlIiAweDQzNTI0MTQ2NTQ0NTQ0NWY0OTU0NDU0ZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2FmdGVyX2lmX2Vsc2VAMTYKICAgIHB1c2hieXRlc3MgMHhiMzVhYWMzYiAweDg0M2QxOGQ1IDB4MmE2MTg0ODAgMHhlYmU5M2Y4YiAweGEwZDEzNGQwIDB4OGJjZGUzOTYgMHg0NWQ2NWVjYiAweDNiNTI3NTFmIDB4NDc5YTdmOTcgMHgzYWQ1ZWRkNSAweDAyYjgzZDAwIC8vIG1ldGhvZCAiaW5pdGlhbGl6ZV9nYW1lKClzdHJpbmciLCBtZXRob2QgInJlZ2lzdGVyX3BsYXllcihzdHJpbmcpc3RyaW5nIiwgbWV0aG9kICJjcmVhdGVfZ2FtZV9pdGVtKGFjY291bnQsc3RyaW5nLHN0cmluZyxzdHJpbmcsdWludDY0LHVpbnQ2NCxzdHJpbmcpdWludDY0IiwgbWV0aG9kICJyZWNvdmVyX2xvc3RfaXRlbShhc3NldCxieXRlW10sYWNjb3VudCl1aW50NjQiLCBtZXRob2QgInNlYXNvbmFsX2V2ZW50X3JlaXNzdWUoc3RyaW5nLGJ5dGVbXSxhY2NvdW50KXVpbnQ2NCIsIG1ldGhvZCAiY3JhZnRfaXRlbXMoYXNzZXQsYXNzZXQsdWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3BsYXllcl9zdGF0cyhhY2NvdW50KSh1aW50NjQsdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImFkdmFuY2Vfc2Vhc29uKCl1aW50NjQiLCBtZXRob2QgImdldF9nYW1lX2luZm8oKSh1aW50NjQsdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImNsYWltX2l0ZW0oYXNzZXQpc3RyaW5nIiwgbWV0aG9kICJnZXRfcmVjb3Zlcnlfc3RhdHVzKGFjY291bnQpKHVpbnQ2NCx1aW50NjQpIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9pbml0aWFsaXplX2dhbWVfcm91dGVANSBtYWluX3JlZ2lzdGVyX3BsYXllcl9yb3V0ZUA2IG1haW5fY3JlYXRlX2dhbWVfaXRlbV9yb3V0ZUA3IG1haW5fcmVjb3Zlcl9sb3N0X2l0ZW1fcm91dGVAOCBtYWluX3NlYXNvbmFsX2V2ZW50X3JlaXNzdWVfcm91dGVAOSBtYWluX2NyYWZ0X2l0ZW1zX3JvdXRlQDEwIG1haW5fZ2V0X3BsYXllcl9zdGF0c19yb3V0ZUAxMSBtYWluX2FkdmFuY2Vfc2Vhc29uX3JvdXRlQDEyIG1haW5fZ2V0X2dhbWVfaW5mb19yb3V0ZUAxMyBtYWluX2NsYWltX2l0ZW1fcm91dGVAMTQgbWFpbl9nZXRfcmVjb3Zlcnlfc3RhdHVzX3JvdXRlQDE1CgptYWluX2FmdGVyX2lmX2Vsc2VAMTY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HYW1lTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl9nZXRfcmVjb3Zlcnlfc3RhdHVzX3JvdXRlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyOTgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI5OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfcmVjb3Zlcnlfc3RhdHVzCiAgICBzd2FwCiAgICBpdG9iCiAgICBzd2FwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY2xhaW1faXRlbV9yb3V0ZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Mjc0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNzQKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjbGFpbV9pdGVtCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfZ2FtZV9pbmZvX3JvdXRlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNjUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfZ2FtZV9pbmZvCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9hZHZhbmNlX3NlYXNvbl9yb3V0ZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjU1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBhZHZhbmNlX3NlYXNvbgogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfcGxheWVyX3N0YXRzX3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNDUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI0NQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfcGxheWVyX3N0YXRzCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmFmdF9pdGVtc19yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjExCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIxMQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNyYWZ0X2l0ZW1zCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3NlYXNvbmFsX2V2ZW50X3JlaXNzdWVfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTc4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTc4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgc2Vhc29uYWxfZXZlbnRfcmVpc3N1ZQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZWNvdmVyX2xvc3RfaXRlbV9yb3V0ZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxMTgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HYW1lTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTE4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcmVjb3Zlcl9sb3N0X2l0ZW0KICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX2dhbWVfaXRlbV9yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIEFsZ29SZWFsbUdhbWVNYW5hZ2VyKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNgogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNwogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzgKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjcmVhdGVfZ2FtZV9pdGVtCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3JlZ2lzdGVyX3BsYXllcl9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1MAogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiTm9PcCIsICJPcHRJbiJdKQogICAgaW50Y18xIC8vIDEKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHNobAogICAgaW50Y18yIC8vIDMKICAgICYKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IG9uZSBvZiBOb09wLCBPcHRJbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HYW1lTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTAKICAgIC8vIEBhYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIk5vT3AiLCAiT3B0SW4iXSkKICAgIGNhbGxzdWIgcmVnaXN0ZXJfcGxheWVyCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9pbml0aWFsaXplX2dhbWVfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDAKICAgIC8vIEBhYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBjYWxsc3ViIGluaXRpYWxpemVfZ2FtZQogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLmluaXRpYWxpemVfZ2FtZSgpIC0+IGJ5dGVzOgppbml0aWFsaXplX2dhbWU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBzZWxmLnRvdGFsX3BsYXllcnMudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDQgLy8gInRvdGFsX3BsYXllcnMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDQKICAgIC8vIHNlbGYudG90YWxfaXRlbXNfY3JlYXRlZC52YWx1ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNSAvLyAidG90YWxfaXRlbXNfY3JlYXRlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0NQogICAgLy8gc2VsZi5jdXJyZW50X3NlYXNvbi52YWx1ZSA9IFVJbnQ2NCgxKQogICAgYnl0ZWMgNiAvLyAiY3VycmVudF9zZWFzb24iCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDYKICAgIC8vIHNlbGYubWF4X3JlY292ZXJ5X3Blcl9pdGVtLnZhbHVlID0gVUludDY0KDMpCiAgICBieXRlYyA3IC8vICJtYXhfcmVjb3ZlcnlfcGVyX2l0ZW0iCiAgICBpbnRjXzIgLy8gMwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDcKICAgIC8vIHNlbGYuZ2FtZV9tYXN0ZXIudmFsdWUgPSBUeG4uc2VuZGVyICAjIFNldCB0aGUgY3JlYXRvciBhcyBnYW1lIG1hc3RlcgogICAgYnl0ZWMgOCAvLyAiZ2FtZV9tYXN0ZXIiCiAgICB0eG4gU2VuZGVyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0OAogICAgLy8gcmV0dXJuIFN0cmluZygiQWxnb1JlYWxtIGluaXRpYWxpemVkISIpCiAgICBwdXNoYnl0ZXMgIkFsZ29SZWFsbSBpbml0aWFsaXplZCEiCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLnJlZ2lzdGVyX3BsYXllcihwbGF5ZXJfbmFtZTogYnl0ZXMpIC0+IGJ5dGVzOgpyZWdpc3Rlcl9wbGF5ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjUwLTUxCiAgICAvLyBAYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJOb09wIiwgIk9wdEluIl0pCiAgICAvLyBkZWYgcmVnaXN0ZXJfcGxheWVyKHNlbGYsIHBsYXllcl9uYW1lOiBTdHJpbmcpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1My01NAogICAgLy8gIyBDaGVjayBpZiB0aGlzIGlzIGFuIG9wdC1pbiBjYWxsCiAgICAvLyBpZiBUeG4ub25fY29tcGxldGlvbiA9PSBPbkNvbXBsZXRlQWN0aW9uLk9wdEluOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgaW50Y18xIC8vIE9wdEluCiAgICA9PQogICAgYnogcmVnaXN0ZXJfcGxheWVyX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1NS01NgogICAgLy8gIyBJbml0aWFsaXplIGRlZmF1bHQgdmFsdWVzIGZvciBsb2NhbCBzdGF0ZSB3aGVuIG9wdGluZyBpbgogICAgLy8gc2VsZi5wbGF5ZXJfbGV2ZWxbVHhuLnNlbmRlcl0gPSBVSW50NjQoMCkKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjIDkgLy8gInBsYXllcl9sZXZlbCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBzZWxmLnBsYXllcl9leHBlcmllbmNlW1R4bi5zZW5kZXJdID0gVUludDY0KDApCiAgICB0eG4gU2VuZGVyCiAgICBieXRlYyAxMCAvLyAicGxheWVyX2V4cGVyaWVuY2UiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1OAogICAgLy8gc2VsZi5wbGF5ZXJfcmVjb3ZlcnlfY291bnRbVHhuLnNlbmRlcl0gPSBVSW50NjQoMCkKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjXzMgLy8gInBsYXllcl9yZWNvdmVyeV9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjU5CiAgICAvLyBzZWxmLmlzX3JlZ2lzdGVyZWRbVHhuLnNlbmRlcl0gPSBCb29sKEZhbHNlKQogICAgdHhuIFNlbmRlcgogICAgYnl0ZWNfMSAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGJ5dGVjXzIgLy8gMHgwMAogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2MAogICAgLy8gcmV0dXJuIFN0cmluZygiT3B0ZWQgaW4gdG8gQWxnb1JlYWxtISIpCiAgICBwdXNoYnl0ZXMgIk9wdGVkIGluIHRvIEFsZ29SZWFsbSEiCiAgICByZXRzdWIKCnJlZ2lzdGVyX3BsYXllcl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjYyLTY0CiAgICAvLyAjIEZvciBOb09wIGNhbGxzLCBoYW5kbGUgcmVnaXN0cmF0aW9uCiAgICAvLyAjIE5vdyB3ZSBjYW4gc2FmZWx5IGFjY2VzcyBsb2NhbCBzdGF0ZSBzaW5jZSBpdCB3YXMgaW5pdGlhbGl6ZWQgb24gb3B0LWluCiAgICAvLyBpZiBzZWxmLmlzX3JlZ2lzdGVyZWRbVHhuLnNlbmRlcl06CiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX3JlZ2lzdGVyZWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBieXRlY18yIC8vIDB4MDAKICAgICE9CiAgICBieiByZWdpc3Rlcl9wbGF5ZXJfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjY1CiAgICAvLyByZXR1cm4gU3RyaW5nKCJQbGF5ZXIgYWxyZWFkeSByZWdpc3RlcmVkIikKICAgIHB1c2hieXRlcyAiUGxheWVyIGFscmVhZHkgcmVnaXN0ZXJlZCIKICAgIHJldHN1YgoKcmVnaXN0ZXJfcGxheWVyX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjctNjgKICAgIC8vICMgSW5pdGlhbGl6ZSBwbGF5ZXIgc3RhdHMgZm9yIGFjdHVhbCByZWdpc3RyYXRpb24KICAgIC8vIHNlbGYucGxheWVyX2xldmVsW1R4bi5zZW5kZXJdID0gVUludDY0KDEpCiAgICB0eG4gU2VuZGVyCiAgICBieXRlYyA5IC8vICJwbGF5ZXJfbGV2ZWwiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2OQogICAgLy8gc2VsZi5wbGF5ZXJfZXhwZXJpZW5jZVtUeG4uc2VuZGVyXSA9IFVJbnQ2NCgwKQogICAgdHhuIFNlbmRlcgogICAgYnl0ZWMgMTAgLy8gInBsYXllcl9leHBlcmllbmNlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzAKICAgIC8vIHNlbGYucGxheWVyX3JlY292ZXJ5X2NvdW50W1R4bi5zZW5kZXJdID0gVUludDY0KDApCiAgICB0eG4gU2VuZGVyCiAgICBieXRlY18zIC8vICJwbGF5ZXJfcmVjb3ZlcnlfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3MQogICAgLy8gc2VsZi5pc19yZWdpc3RlcmVkW1R4bi5zZW5kZXJdID0gQm9vbChUcnVlKQogICAgdHhuIFNlbmRlcgogICAgYnl0ZWNfMSAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIHB1c2hieXRlcyAweDgwCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjczCiAgICAvLyBzZWxmLnRvdGFsX3BsYXllcnMudmFsdWUgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAidG90YWxfcGxheWVycyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9wbGF5ZXJzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDQgLy8gInRvdGFsX3BsYXllcnMiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3NQogICAgLy8gbG9nKHBsYXllcl9uYW1lLmJ5dGVzKQogICAgZnJhbWVfZGlnIC0xCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzYKICAgIC8vIHJldHVybiBTdHJpbmcoIldlbGNvbWUgdG8gQWxnb1JlYWxtISIpCiAgICBwdXNoYnl0ZXMgIldlbGNvbWUgdG8gQWxnb1JlYWxtISIKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uY29udHJhY3QuQWxnb1JlYWxtR2FtZU1hbmFnZXIuY3JlYXRlX2dhbWVfaXRlbShyZWNpcGllbnQ6IGJ5dGVzLCBpdGVtX25hbWU6IGJ5dGVzLCBpdGVtX3R5cGU6IGJ5dGVzLCByYXJpdHk6IGJ5dGVzLCBhdHRhY2tfcG93ZXI6IHVpbnQ2NCwgZGVmZW5zZV9wb3dlcjogdWludDY0LCBzcGVjaWFsX2VmZmVjdDogYnl0ZXMpIC0+IHVpbnQ2NDoKY3JlYXRlX2dhbWVfaXRlbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzgtODgKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNyZWF0ZV9nYW1lX2l0ZW0oCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICByZWNpcGllbnQ6IEFjY291bnQsCiAgICAvLyAgICAgaXRlbV9uYW1lOiBTdHJpbmcsCiAgICAvLyAgICAgaXRlbV90eXBlOiBTdHJpbmcsCiAgICAvLyAgICAgcmFyaXR5OiBTdHJpbmcsCiAgICAvLyAgICAgYXR0YWNrX3Bvd2VyOiBVSW50NjQsCiAgICAvLyAgICAgZGVmZW5zZV9wb3dlcjogVUludDY0LAogICAgLy8gICAgIHNwZWNpYWxfZWZmZWN0OiBTdHJpbmcsCiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5nYW1lX21hc3Rlci52YWx1ZSwgIk9ubHkgZ2FtZSBtYXN0ZXIgY2FuIGNyZWF0ZSBpdGVtcyIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJnYW1lX21hc3RlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nYW1lX21hc3RlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBnYW1lIG1hc3RlciBjYW4gY3JlYXRlIGl0ZW1zCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjkxCiAgICAvLyBhc3NlcnQgc2VsZi5pc19yZWdpc3RlcmVkW3JlY2lwaWVudF0sICJSZWNpcGllbnQgbXVzdCBiZSByZWdpc3RlcmVkIHBsYXllciIKICAgIGZyYW1lX2RpZyAtNwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImlzX3JlZ2lzdGVyZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19yZWdpc3RlcmVkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgYnl0ZWNfMiAvLyAweDAwCiAgICAhPQogICAgYXNzZXJ0IC8vIFJlY2lwaWVudCBtdXN0IGJlIHJlZ2lzdGVyZWQgcGxheWVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojk1LTEwOAogICAgLy8gaXRlbV9hc2EgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGFzc2V0X25hbWU9aXRlbV9uYW1lLAogICAgLy8gICAgIHVuaXRfbmFtZT1pdGVtX3VuaXRfbmFtZSwKICAgIC8vICAgICB0b3RhbD1VSW50NjQoMSksICAjIFVuaXF1ZSBpdGVtCiAgICAvLyAgICAgZGVjaW1hbHM9VUludDY0KDApLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9R2xvYmFsLm1pbl90eG5fZmVlLCAgIyBVc2UgbWluaW11bSB0cmFuc2FjdGlvbiBmZWUKICAgIC8vICAgICAjIFN0b3JlIGJhc2ljIGl0ZW0gaW5mbyBpbiBub3RlIGZpZWxkCiAgICAvLyAgICAgbm90ZT1vcC5jb25jYXQoaXRlbV9uYW1lLmJ5dGVzLCByYXJpdHkuYnl0ZXMpLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxMDUKICAgIC8vIGZlZT1HbG9iYWwubWluX3R4bl9mZWUsICAjIFVzZSBtaW5pbXVtIHRyYW5zYWN0aW9uIGZlZQogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxMDEKICAgIC8vIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjEwMi0xMDQKICAgIC8vIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGR1cG4gMwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxMDYtMTA3CiAgICAvLyAjIFN0b3JlIGJhc2ljIGl0ZW0gaW5mbyBpbiBub3RlIGZpZWxkCiAgICAvLyBub3RlPW9wLmNvbmNhdChpdGVtX25hbWUuYnl0ZXMsIHJhcml0eS5ieXRlcyksCiAgICBmcmFtZV9kaWcgLTYKICAgIGZyYW1lX2RpZyAtNAogICAgY29uY2F0CiAgICBpdHhuX2ZpZWxkIE5vdGUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRDbGF3YmFjawogICAgaXR4bl9maWVsZCBDb25maWdBc3NldEZyZWV6ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFJlc2VydmUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRNYW5hZ2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjEwMAogICAgLy8gZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlZmF1bHRGcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTkKICAgIC8vIGRlY2ltYWxzPVVJbnQ2NCgwKSwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVjaW1hbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTgKICAgIC8vIHRvdGFsPVVJbnQ2NCgxKSwgICMgVW5pcXVlIGl0ZW0KICAgIGludGNfMSAvLyAxCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTMtOTQKICAgIC8vICMgQ3JlYXRlIEFTQSBmb3IgdGhlIGl0ZW0gKHNpbXBsaWZpZWQgd2l0aG91dCBjb21wbGV4IG1ldGFkYXRhIHN0cnVjdCkKICAgIC8vIGl0ZW1fdW5pdF9uYW1lID0gU3RyaW5nKCJBTEdJVEVNIikKICAgIHB1c2hieXRlcyAiQUxHSVRFTSIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVbml0TmFtZQogICAgZnJhbWVfZGlnIC02CiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5NQogICAgLy8gaXRlbV9hc2EgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgaW50Y18yIC8vIGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojk1LTEwOAogICAgLy8gaXRlbV9hc2EgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGFzc2V0X25hbWU9aXRlbV9uYW1lLAogICAgLy8gICAgIHVuaXRfbmFtZT1pdGVtX3VuaXRfbmFtZSwKICAgIC8vICAgICB0b3RhbD1VSW50NjQoMSksICAjIFVuaXF1ZSBpdGVtCiAgICAvLyAgICAgZGVjaW1hbHM9VUludDY0KDApLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9R2xvYmFsLm1pbl90eG5fZmVlLCAgIyBVc2UgbWluaW11bSB0cmFuc2FjdGlvbiBmZWUKICAgIC8vICAgICAjIFN0b3JlIGJhc2ljIGl0ZW0gaW5mbyBpbiBub3RlIGZpZWxkCiAgICAvLyAgICAgbm90ZT1vcC5jb25jYXQoaXRlbV9uYW1lLmJ5dGVzLCByYXJpdHkuYnl0ZXMpLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gQ3JlYXRlZEFzc2V0SUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTEzCiAgICAvLyBzZWxmLnRvdGFsX2l0ZW1zX2NyZWF0ZWQudmFsdWUgKz0gVUludDY0KDEpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAidG90YWxfaXRlbXNfY3JlYXRlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9pdGVtc19jcmVhdGVkIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDUgLy8gInRvdGFsX2l0ZW1zX2NyZWF0ZWQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxMTUKICAgIC8vIGxvZyhCeXRlcyhiIkl0ZW0gY3JlYXRlZCIpKQogICAgcHVzaGJ5dGVzIDB4NDk3NDY1NmQyMDYzNzI2NTYxNzQ2NTY0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTE2CiAgICAvLyByZXR1cm4gaXRlbV9hc2EuY3JlYXRlZF9hc3NldC5pZAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5yZWNvdmVyX2xvc3RfaXRlbShvcmlnaW5hbF9pdGVtX2lkOiB1aW50NjQsIHJlY292ZXJ5X3F1ZXN0X3Byb29mOiBieXRlcywgbmV3X3JlY2lwaWVudDogYnl0ZXMpIC0+IHVpbnQ2NDoKcmVjb3Zlcl9sb3N0X2l0ZW06CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjExOC0xMjQKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHJlY292ZXJfbG9zdF9pdGVtKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgb3JpZ2luYWxfaXRlbV9pZDogQXNzZXQsCiAgICAvLyAgICAgcmVjb3ZlcnlfcXVlc3RfcHJvb2Y6IEJ5dGVzLAogICAgLy8gICAgIG5ld19yZWNpcGllbnQ6IEFjY291bnQsCiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxMzAKICAgIC8vIFR4bi5zZW5kZXIKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTI5LTEzMQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfcmVnaXN0ZXJlZFsKICAgIC8vICAgICBUeG4uc2VuZGVyCiAgICAvLyBdLCAiT25seSByZWdpc3RlcmVkIHBsYXllcnMgY2FuIHJlY292ZXIgaXRlbXMiCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxMjkKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlZ2lzdGVyZWRbCiAgICBieXRlY18xIC8vICJpc19yZWdpc3RlcmVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxMjktMTMxCiAgICAvLyBhc3NlcnQgc2VsZi5pc19yZWdpc3RlcmVkWwogICAgLy8gICAgIFR4bi5zZW5kZXIKICAgIC8vIF0sICJPbmx5IHJlZ2lzdGVyZWQgcGxheWVycyBjYW4gcmVjb3ZlciBpdGVtcyIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX3JlZ2lzdGVyZWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBieXRlY18yIC8vIDB4MDAKICAgICE9CiAgICBhc3NlcnQgLy8gT25seSByZWdpc3RlcmVkIHBsYXllcnMgY2FuIHJlY292ZXIgaXRlbXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTMzLTEzNgogICAgLy8gIyBHZXQgb3JpZ2luYWwgaXRlbSBtZXRhZGF0YQogICAgLy8gb3JpZ2luYWxfbWV0YWRhdGFfcmVzcG9uc2UgPSBvcC5Bc3NldFBhcmFtc0dldC5hc3NldF9tZXRhZGF0YV9oYXNoKAogICAgLy8gICAgIG9yaWdpbmFsX2l0ZW1faWQKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMwogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldE1ldGFkYXRhSGFzaAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjEzNwogICAgLy8gYXNzZXJ0IG9yaWdpbmFsX21ldGFkYXRhX3Jlc3BvbnNlWzBdLCAiT3JpZ2luYWwgaXRlbSBub3QgZm91bmQiCiAgICBsZW4KICAgIGFzc2VydCAvLyBPcmlnaW5hbCBpdGVtIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxMzktMTQwCiAgICAvLyAjIFZlcmlmeSByZWNvdmVyeSBxdWVzdCBjb21wbGV0aW9uIChzaW1wbGlmaWVkIC0gaW4gcmVhbCBnYW1lLCBjaGVjayBxdWVzdCBzeXN0ZW0pCiAgICAvLyBhc3NlcnQgcmVjb3ZlcnlfcXVlc3RfcHJvb2YgIT0gQnl0ZXMoKSwgIk11c3QgcHJvdmlkZSByZWNvdmVyeSBxdWVzdCBwcm9vZiIKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGJ5dGVzIDB4CiAgICAhPQogICAgYXNzZXJ0IC8vIE11c3QgcHJvdmlkZSByZWNvdmVyeSBxdWVzdCBwcm9vZgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxNDItMTQzCiAgICAvLyAjIENoZWNrIHJlY292ZXJ5IGxpbWl0cwogICAgLy8gY3VycmVudF9yZWNvdmVyeV9jb3VudCA9IHNlbGYucGxheWVyX3JlY292ZXJ5X2NvdW50W1R4bi5zZW5kZXJdCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAicGxheWVyX3JlY292ZXJ5X2NvdW50IgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGxheWVyX3JlY292ZXJ5X2NvdW50IGV4aXN0cyBmb3IgYWNjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxNDUKICAgIC8vIGN1cnJlbnRfcmVjb3ZlcnlfY291bnQgPCBzZWxmLm1heF9yZWNvdmVyeV9wZXJfaXRlbS52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gIm1heF9yZWNvdmVyeV9wZXJfaXRlbSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXhfcmVjb3ZlcnlfcGVyX2l0ZW0gZXhpc3RzCiAgICBkaWcgMQogICAgPgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxNDQtMTQ2CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGN1cnJlbnRfcmVjb3ZlcnlfY291bnQgPCBzZWxmLm1heF9yZWNvdmVyeV9wZXJfaXRlbS52YWx1ZQogICAgLy8gKSwgIlJlY292ZXJ5IGxpbWl0IHJlYWNoZWQgLSBtYXggMyByZWNvdmVyaWVzIHBlciBwbGF5ZXIiCiAgICBhc3NlcnQgLy8gUmVjb3ZlcnkgbGltaXQgcmVhY2hlZCAtIG1heCAzIHJlY292ZXJpZXMgcGVyIHBsYXllcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxNDgtMTQ5CiAgICAvLyAjIEdldCBvcmlnaW5hbCBpdGVtIG5hbWUgZm9yIG5ldyBBU0EKICAgIC8vIG9yaWdpbmFsX25hbWVfcmVzcG9uc2UgPSBvcC5Bc3NldFBhcmFtc0dldC5hc3NldF9uYW1lKG9yaWdpbmFsX2l0ZW1faWQpCiAgICBmcmFtZV9kaWcgLTMKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXROYW1lCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTUwCiAgICAvLyBhc3NlcnQgb3JpZ2luYWxfbmFtZV9yZXNwb25zZVswXSwgIkNhbm5vdCBnZXQgb3JpZ2luYWwgaXRlbSBuYW1lIgogICAgbGVuCiAgICBhc3NlcnQgLy8gQ2Fubm90IGdldCBvcmlnaW5hbCBpdGVtIG5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTU0CiAgICAvLyByZWNvdmVyeV9ub3RlID0gb3AuY29uY2F0KEJ5dGVzKGIiUkVDT1ZFUkVEX0lURU1fIiksIHJlY292ZXJ5X3F1ZXN0X3Byb29mKQogICAgcHVzaGJ5dGVzIDB4NTI0NTQzNGY1NjQ1NTI0NTQ0NWY0OTU0NDU0ZDVmCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxNTUtMTY3CiAgICAvLyByZWNvdmVyZWRfaXRlbV9hc2EgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGFzc2V0X25hbWU9cmVjb3ZlcmVkX25hbWUsCiAgICAvLyAgICAgdW5pdF9uYW1lPVN0cmluZygiQUxHUkVDT1YiKSwKICAgIC8vICAgICB0b3RhbD1VSW50NjQoMSksCiAgICAvLyAgICAgZGVjaW1hbHM9VUludDY0KDApLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9R2xvYmFsLm1pbl90eG5fZmVlLCAgIyBVc2UgbWluaW11bSB0cmFuc2FjdGlvbiBmZWUKICAgIC8vICAgICBub3RlPXJlY292ZXJ5X25vdGUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE2NQogICAgLy8gZmVlPUdsb2JhbC5taW5fdHhuX2ZlZSwgICMgVXNlIG1pbmltdW0gdHJhbnNhY3Rpb24gZmVlCiAgICBnbG9iYWwgTWluVHhuRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE2MQogICAgLy8gbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTYyLTE2NAogICAgLy8gcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZHVwbiAzCiAgICB1bmNvdmVyIDUKICAgIGl0eG5fZmllbGQgTm90ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldENsYXdiYWNrCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RnJlZXplCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0UmVzZXJ2ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE1hbmFnZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTYwCiAgICAvLyBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVmYXVsdEZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxNTkKICAgIC8vIGRlY2ltYWxzPVVJbnQ2NCgwKSwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVjaW1hbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTU4CiAgICAvLyB0b3RhbD1VSW50NjQoMSksCiAgICBpbnRjXzEgLy8gMQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFRvdGFsCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE1NwogICAgLy8gdW5pdF9uYW1lPVN0cmluZygiQUxHUkVDT1YiKSwKICAgIHB1c2hieXRlcyAiQUxHUkVDT1YiCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VW5pdE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTUyLTE1MwogICAgLy8gIyBDcmVhdGUgTkVXIEFTQSB3aXRoIHNhbWUgcHJvcGVydGllcyBidXQgbWFya2VkIGFzIHJlY292ZXJlZAogICAgLy8gcmVjb3ZlcmVkX25hbWUgPSBTdHJpbmcoIlJFQ09WRVJFRF9JVEVNIikKICAgIHB1c2hieXRlcyAiUkVDT1ZFUkVEX0lURU0iCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxNTUKICAgIC8vIHJlY292ZXJlZF9pdGVtX2FzYSA9IGl0eG4uQXNzZXRDb25maWcoCiAgICBpbnRjXzIgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTU1LTE2NwogICAgLy8gcmVjb3ZlcmVkX2l0ZW1fYXNhID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBhc3NldF9uYW1lPXJlY292ZXJlZF9uYW1lLAogICAgLy8gICAgIHVuaXRfbmFtZT1TdHJpbmcoIkFMR1JFQ09WIiksCiAgICAvLyAgICAgdG90YWw9VUludDY0KDEpLAogICAgLy8gICAgIGRlY2ltYWxzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPUdsb2JhbC5taW5fdHhuX2ZlZSwgICMgVXNlIG1pbmltdW0gdHJhbnNhY3Rpb24gZmVlCiAgICAvLyAgICAgbm90ZT1yZWNvdmVyeV9ub3RlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gQ3JlYXRlZEFzc2V0SUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTcyLTE3MwogICAgLy8gIyBVcGRhdGUgcGxheWVyIHJlY292ZXJ5IGNvdW50CiAgICAvLyBzZWxmLnBsYXllcl9yZWNvdmVyeV9jb3VudFtUeG4uc2VuZGVyXSA9IGN1cnJlbnRfcmVjb3ZlcnlfY291bnQgKyBVSW50NjQoMSkKICAgIHN3YXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICB0eG4gU2VuZGVyCiAgICBieXRlY18zIC8vICJwbGF5ZXJfcmVjb3ZlcnlfY291bnQiCiAgICB1bmNvdmVyIDIKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTc1CiAgICAvLyBsb2coQnl0ZXMoYiJJdGVtIHJlY292ZXJlZCIpKQogICAgcHVzaGJ5dGVzIDB4NDk3NDY1NmQyMDcyNjU2MzZmNzY2NTcyNjU2NAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE3NgogICAgLy8gcmV0dXJuIHJlY292ZXJlZF9pdGVtX2FzYS5jcmVhdGVkX2Fzc2V0LmlkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLnNlYXNvbmFsX2V2ZW50X3JlaXNzdWUoZXZlbnRfbmFtZTogYnl0ZXMsIHBhcnRpY2lwYXRpb25fcHJvb2Y6IGJ5dGVzLCByZWNpcGllbnQ6IGJ5dGVzKSAtPiB1aW50NjQ6CnNlYXNvbmFsX2V2ZW50X3JlaXNzdWU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE3OC0xODEKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHNlYXNvbmFsX2V2ZW50X3JlaXNzdWUoCiAgICAvLyAgICAgc2VsZiwgZXZlbnRfbmFtZTogU3RyaW5nLCBwYXJ0aWNpcGF0aW9uX3Byb29mOiBCeXRlcywgcmVjaXBpZW50OiBBY2NvdW50CiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxODYKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlZ2lzdGVyZWRbVHhuLnNlbmRlcl0sICJPbmx5IHJlZ2lzdGVyZWQgcGxheWVycyBjYW4gcGFydGljaXBhdGUiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX3JlZ2lzdGVyZWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBieXRlY18yIC8vIDB4MDAKICAgICE9CiAgICBhc3NlcnQgLy8gT25seSByZWdpc3RlcmVkIHBsYXllcnMgY2FuIHBhcnRpY2lwYXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE4NwogICAgLy8gYXNzZXJ0IHBhcnRpY2lwYXRpb25fcHJvb2YgIT0gQnl0ZXMoKSwgIk11c3QgcHJvdmlkZSBwYXJ0aWNpcGF0aW9uIHByb29mIgogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoYnl0ZXMgMHgKICAgICE9CiAgICBhc3NlcnQgLy8gTXVzdCBwcm92aWRlIHBhcnRpY2lwYXRpb24gcHJvb2YKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTkxCiAgICAvLyBzZWFzb25hbF9ub3RlID0gb3AuY29uY2F0KEJ5dGVzKGIiU0VBU09OQUxfIiksIHBhcnRpY2lwYXRpb25fcHJvb2YpCiAgICBwdXNoYnl0ZXMgMHg1MzQ1NDE1MzRmNGU0MTRjNWYKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE5My0yMDMKICAgIC8vIHNlYXNvbmFsX2FzYSA9IGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgYXNzZXRfbmFtZT1zZWFzb25hbF9pdGVtX25hbWUsCiAgICAvLyAgICAgdW5pdF9uYW1lPVN0cmluZygiQUxHU0VBU04iKSwKICAgIC8vICAgICB0b3RhbD1VSW50NjQoMSksCiAgICAvLyAgICAgZGVjaW1hbHM9VUludDY0KDApLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPUdsb2JhbC5taW5fdHhuX2ZlZSwgICMgVXNlIG1pbmltdW0gdHJhbnNhY3Rpb24gZmVlCiAgICAvLyAgICAgbm90ZT1zZWFzb25hbF9ub3RlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMDEKICAgIC8vIGZlZT1HbG9iYWwubWluX3R4bl9mZWUsICAjIFVzZSBtaW5pbXVtIHRyYW5zYWN0aW9uIGZlZQogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxOTkKICAgIC8vIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIwMAogICAgLy8gcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZHVwCiAgICB1bmNvdmVyIDMKICAgIGl0eG5fZmllbGQgTm90ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFJlc2VydmUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRNYW5hZ2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE5OAogICAgLy8gZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlZmF1bHRGcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTk3CiAgICAvLyBkZWNpbWFscz1VSW50NjQoMCksCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlY2ltYWxzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE5NgogICAgLy8gdG90YWw9VUludDY0KDEpLAogICAgaW50Y18xIC8vIDEKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRUb3RhbAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxOTUKICAgIC8vIHVuaXRfbmFtZT1TdHJpbmcoIkFMR1NFQVNOIiksCiAgICBwdXNoYnl0ZXMgIkFMR1NFQVNOIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVuaXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE4OS0xOTAKICAgIC8vICMgQ3JlYXRlIHNlYXNvbmFsIGl0ZW0gYmFzZWQgb24gZXZlbnQKICAgIC8vIHNlYXNvbmFsX2l0ZW1fbmFtZSA9IFN0cmluZygiU0VBU09OQUxfSVRFTSIpCiAgICBwdXNoYnl0ZXMgIlNFQVNPTkFMX0lURU0iCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxOTMKICAgIC8vIHNlYXNvbmFsX2FzYSA9IGl0eG4uQXNzZXRDb25maWcoCiAgICBpbnRjXzIgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTkzLTIwMwogICAgLy8gc2Vhc29uYWxfYXNhID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBhc3NldF9uYW1lPXNlYXNvbmFsX2l0ZW1fbmFtZSwKICAgIC8vICAgICB1bml0X25hbWU9U3RyaW5nKCJBTEdTRUFTTiIpLAogICAgLy8gICAgIHRvdGFsPVVJbnQ2NCgxKSwKICAgIC8vICAgICBkZWNpbWFscz1VSW50NjQoMCksCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9R2xvYmFsLm1pbl90eG5fZmVlLCAgIyBVc2UgbWluaW11bSB0cmFuc2FjdGlvbiBmZWUKICAgIC8vICAgICBub3RlPXNlYXNvbmFsX25vdGUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXNzZXRJRAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMDgKICAgIC8vIGxvZyhCeXRlcyhiIlNlYXNvbmFsIGl0ZW0gaXNzdWVkIikpCiAgICBwdXNoYnl0ZXMgMHg1MzY1NjE3MzZmNmU2MTZjMjA2OTc0NjU2ZDIwNjk3MzczNzU2NTY0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjA5CiAgICAvLyByZXR1cm4gc2Vhc29uYWxfYXNhLmNyZWF0ZWRfYXNzZXQuaWQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uY29udHJhY3QuQWxnb1JlYWxtR2FtZU1hbmFnZXIuY3JhZnRfaXRlbXMobWF0ZXJpYWxfMTogdWludDY0LCBtYXRlcmlhbF8yOiB1aW50NjQsIHJlY2lwZV9pZDogdWludDY0KSAtPiB1aW50NjQ6CmNyYWZ0X2l0ZW1zOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMTEtMjE0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjcmFmdF9pdGVtcygKICAgIC8vICAgICBzZWxmLCBtYXRlcmlhbF8xOiBBc3NldCwgbWF0ZXJpYWxfMjogQXNzZXQsIHJlY2lwZV9pZDogVUludDY0CiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMTkKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlZ2lzdGVyZWRbVHhuLnNlbmRlcl0sICJPbmx5IHJlZ2lzdGVyZWQgcGxheWVycyBjYW4gY3JhZnQiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX3JlZ2lzdGVyZWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBieXRlY18yIC8vIDB4MDAKICAgICE9CiAgICBhc3NlcnQgLy8gT25seSByZWdpc3RlcmVkIHBsYXllcnMgY2FuIGNyYWZ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIyNy0yMzYKICAgIC8vIGNyYWZ0ZWRfYXNhID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBhc3NldF9uYW1lPWNyYWZ0ZWRfaXRlbV9uYW1lLAogICAgLy8gICAgIHVuaXRfbmFtZT1TdHJpbmcoIkFMR0NSQUZUIiksCiAgICAvLyAgICAgdG90YWw9VUludDY0KDEpLAogICAgLy8gICAgIGRlY2ltYWxzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPUdsb2JhbC5taW5fdHhuX2ZlZSwgICMgVXNlIG1pbmltdW0gdHJhbnNhY3Rpb24gZmVlCiAgICAvLyAgICAgbm90ZT1CeXRlcyhiIkNSQUZURURfSVRFTSIpLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMzQKICAgIC8vIGZlZT1HbG9iYWwubWluX3R4bl9mZWUsICAjIFVzZSBtaW5pbXVtIHRyYW5zYWN0aW9uIGZlZQogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMzMKICAgIC8vIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIzNQogICAgLy8gbm90ZT1CeXRlcyhiIkNSQUZURURfSVRFTSIpLAogICAgYnl0ZWMgMTEgLy8gMHg0MzUyNDE0NjU0NDU0NDVmNDk1NDQ1NGQKICAgIGl0eG5fZmllbGQgTm90ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE1hbmFnZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjMyCiAgICAvLyBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVmYXVsdEZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMzEKICAgIC8vIGRlY2ltYWxzPVVJbnQ2NCgwKSwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVjaW1hbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjMwCiAgICAvLyB0b3RhbD1VSW50NjQoMSksCiAgICBpbnRjXzEgLy8gMQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFRvdGFsCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIyOQogICAgLy8gdW5pdF9uYW1lPVN0cmluZygiQUxHQ1JBRlQiKSwKICAgIHB1c2hieXRlcyAiQUxHQ1JBRlQiCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VW5pdE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjI0LTIyNQogICAgLy8gIyBDcmVhdGUgY3JhZnRlZCBpdGVtIGJhc2VkIG9uIHJlY2lwZQogICAgLy8gY3JhZnRlZF9pdGVtX25hbWUgPSBTdHJpbmcoIkNSQUZURURfSVRFTSIpCiAgICBieXRlYyAxMSAvLyAiQ1JBRlRFRF9JVEVNIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjI3CiAgICAvLyBjcmFmdGVkX2FzYSA9IGl0eG4uQXNzZXRDb25maWcoCiAgICBpbnRjXzIgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjI3LTIzNgogICAgLy8gY3JhZnRlZF9hc2EgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGFzc2V0X25hbWU9Y3JhZnRlZF9pdGVtX25hbWUsCiAgICAvLyAgICAgdW5pdF9uYW1lPVN0cmluZygiQUxHQ1JBRlQiKSwKICAgIC8vICAgICB0b3RhbD1VSW50NjQoMSksCiAgICAvLyAgICAgZGVjaW1hbHM9VUludDY0KDApLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9R2xvYmFsLm1pbl90eG5fZmVlLCAgIyBVc2UgbWluaW11bSB0cmFuc2FjdGlvbiBmZWUKICAgIC8vICAgICBub3RlPUJ5dGVzKGIiQ1JBRlRFRF9JVEVNIiksCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXNzZXRJRAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNDIKICAgIC8vIGxvZyhCeXRlcyhiIkl0ZW0gY3JhZnRlZCIpKQogICAgcHVzaGJ5dGVzIDB4NDk3NDY1NmQyMDYzNzI2MTY2NzQ2NTY0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjQzCiAgICAvLyByZXR1cm4gY3JhZnRlZF9hc2EuY3JlYXRlZF9hc3NldC5pZAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5nZXRfcGxheWVyX3N0YXRzKHBsYXllcjogYnl0ZXMpIC0+IHVpbnQ2NCwgdWludDY0LCB1aW50NjQ6CmdldF9wbGF5ZXJfc3RhdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI0NS0yNDYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfcGxheWVyX3N0YXRzKHNlbGYsIHBsYXllcjogQWNjb3VudCkgLT4gdHVwbGVbVUludDY0LCBVSW50NjQsIFVJbnQ2NF06CiAgICBwcm90byAxIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjQ4CiAgICAvLyBhc3NlcnQgc2VsZi5pc19yZWdpc3RlcmVkW3BsYXllcl0sICJQbGF5ZXIgbm90IHJlZ2lzdGVyZWQiCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJpc19yZWdpc3RlcmVkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXNfcmVnaXN0ZXJlZCBleGlzdHMgZm9yIGFjY291bnQKICAgIGJ5dGVjXzIgLy8gMHgwMAogICAgIT0KICAgIGFzc2VydCAvLyBQbGF5ZXIgbm90IHJlZ2lzdGVyZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjUwCiAgICAvLyBzZWxmLnBsYXllcl9sZXZlbFtwbGF5ZXJdLAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAicGxheWVyX2xldmVsIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGxheWVyX2xldmVsIGV4aXN0cyBmb3IgYWNjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNTEKICAgIC8vIHNlbGYucGxheWVyX2V4cGVyaWVuY2VbcGxheWVyXSwKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJwbGF5ZXJfZXhwZXJpZW5jZSIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBsYXllcl9leHBlcmllbmNlIGV4aXN0cyBmb3IgYWNjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNTIKICAgIC8vIHNlbGYucGxheWVyX3JlY292ZXJ5X2NvdW50W3BsYXllcl0sCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJwbGF5ZXJfcmVjb3ZlcnlfY291bnQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wbGF5ZXJfcmVjb3ZlcnlfY291bnQgZXhpc3RzIGZvciBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI0OS0yNTMKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgc2VsZi5wbGF5ZXJfbGV2ZWxbcGxheWVyXSwKICAgIC8vICAgICBzZWxmLnBsYXllcl9leHBlcmllbmNlW3BsYXllcl0sCiAgICAvLyAgICAgc2VsZi5wbGF5ZXJfcmVjb3ZlcnlfY291bnRbcGxheWVyXSwKICAgIC8vICkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uY29udHJhY3QuQWxnb1JlYWxtR2FtZU1hbmFnZXIuYWR2YW5jZV9zZWFzb24oKSAtPiB1aW50NjQ6CmFkdmFuY2Vfc2Vhc29uOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNTkKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5nYW1lX21hc3Rlci52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gImdhbWVfbWFzdGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVfbWFzdGVyIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjU4LTI2MAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IHNlbGYuZ2FtZV9tYXN0ZXIudmFsdWUKICAgIC8vICksICJPbmx5IGdhbWUgbWFzdGVyIGNhbiBhZHZhbmNlIHNlYXNvbiIKICAgIGFzc2VydCAvLyBPbmx5IGdhbWUgbWFzdGVyIGNhbiBhZHZhbmNlIHNlYXNvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNjEKICAgIC8vIHNlbGYuY3VycmVudF9zZWFzb24udmFsdWUgKz0gMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gImN1cnJlbnRfc2Vhc29uIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN1cnJlbnRfc2Vhc29uIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDYgLy8gImN1cnJlbnRfc2Vhc29uIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI2MgogICAgLy8gbG9nKEJ5dGVzKGIiU2Vhc29uIGFkdmFuY2VkIikpCiAgICBwdXNoYnl0ZXMgMHg1MzY1NjE3MzZmNmUyMDYxNjQ3NjYxNmU2MzY1NjQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNjMKICAgIC8vIHJldHVybiBzZWxmLmN1cnJlbnRfc2Vhc29uLnZhbHVlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLmdldF9nYW1lX2luZm8oKSAtPiB1aW50NjQsIHVpbnQ2NCwgdWludDY0OgpnZXRfZ2FtZV9pbmZvOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNjkKICAgIC8vIHNlbGYudG90YWxfcGxheWVycy52YWx1ZSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJ0b3RhbF9wbGF5ZXJzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3BsYXllcnMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI3MAogICAgLy8gc2VsZi50b3RhbF9pdGVtc19jcmVhdGVkLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInRvdGFsX2l0ZW1zX2NyZWF0ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfaXRlbXNfY3JlYXRlZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjcxCiAgICAvLyBzZWxmLmN1cnJlbnRfc2Vhc29uLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gImN1cnJlbnRfc2Vhc29uIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN1cnJlbnRfc2Vhc29uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNjgtMjcyCiAgICAvLyByZXR1cm4gKAogICAgLy8gICAgIHNlbGYudG90YWxfcGxheWVycy52YWx1ZSwKICAgIC8vICAgICBzZWxmLnRvdGFsX2l0ZW1zX2NyZWF0ZWQudmFsdWUsCiAgICAvLyAgICAgc2VsZi5jdXJyZW50X3NlYXNvbi52YWx1ZSwKICAgIC8vICkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uY29udHJhY3QuQWxnb1JlYWxtR2FtZU1hbmFnZXIuY2xhaW1faXRlbShpdGVtX2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpjbGFpbV9pdGVtOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNzQtMjc1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjbGFpbV9pdGVtKHNlbGYsIGl0ZW1faWQ6IEFzc2V0KSAtPiBTdHJpbmc6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjgwCiAgICAvLyBhc3NlcnQgc2VsZi5pc19yZWdpc3RlcmVkW1R4bi5zZW5kZXJdLCAiT25seSByZWdpc3RlcmVkIHBsYXllcnMgY2FuIGNsYWltIGl0ZW1zIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImlzX3JlZ2lzdGVyZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19yZWdpc3RlcmVkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgYnl0ZWNfMiAvLyAweDAwCiAgICAhPQogICAgYXNzZXJ0IC8vIE9ubHkgcmVnaXN0ZXJlZCBwbGF5ZXJzIGNhbiBjbGFpbSBpdGVtcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyODItMjgzCiAgICAvLyAjIFZlcmlmeSB0aGUgYXNzZXQgZXhpc3RzCiAgICAvLyBtYW5hZ2VyX3Jlc3BvbnNlID0gb3AuQXNzZXRQYXJhbXNHZXQuYXNzZXRfbWFuYWdlcihpdGVtX2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0TWFuYWdlcgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI4NAogICAgLy8gYXNzZXJ0IG1hbmFnZXJfcmVzcG9uc2VbMF0sICJBc3NldCBub3QgZm91bmQiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICBhc3NlcnQgLy8gQXNzZXQgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI4Ny0yOTMKICAgIC8vICMgVHJhbnNmZXIgaXRlbSB0byB0aGUgcGxheWVyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9VUludDY0KDEpLAogICAgLy8gICAgIHhmZXJfYXNzZXQ9aXRlbV9pZCwKICAgIC8vICAgICBmZWU9R2xvYmFsLm1pbl90eG5fZmVlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyOTIKICAgIC8vIGZlZT1HbG9iYWwubWluX3R4bl9mZWUsCiAgICBnbG9iYWwgTWluVHhuRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI4OQogICAgLy8gYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjkwCiAgICAvLyBhc3NldF9hbW91bnQ9VUludDY0KDEpLAogICAgaW50Y18xIC8vIDEKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyODctMjg4CiAgICAvLyAjIFRyYW5zZmVyIGl0ZW0gdG8gdGhlIHBsYXllcgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyODctMjkzCiAgICAvLyAjIFRyYW5zZmVyIGl0ZW0gdG8gdGhlIHBsYXllcgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PVVJbnQ2NCgxKSwKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWl0ZW1faWQsCiAgICAvLyAgICAgZmVlPUdsb2JhbC5taW5fdHhuX2ZlZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI5NQogICAgLy8gbG9nKEJ5dGVzKGIiSXRlbSBjbGFpbWVkIikpCiAgICBwdXNoYnl0ZXMgMHg0OTc0NjU2ZDIwNjM2YzYxNjk2ZDY1NjQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyOTYKICAgIC8vIHJldHVybiBTdHJpbmcoIkl0ZW0gc3VjY2Vzc2Z1bGx5IGNsYWltZWQhIikKICAgIHB1c2hieXRlcyAiSXRlbSBzdWNjZXNzZnVsbHkgY2xhaW1lZCEiCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLmdldF9yZWNvdmVyeV9zdGF0dXMocGxheWVyOiBieXRlcykgLT4gdWludDY0LCB1aW50NjQ6CmdldF9yZWNvdmVyeV9zdGF0dXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI5OC0yOTkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfcmVjb3Zlcnlfc3RhdHVzKHNlbGYsIHBsYXllcjogQWNjb3VudCkgLT4gdHVwbGVbVUludDY0LCBVSW50NjRdOgogICAgcHJvdG8gMSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjMwMQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfcmVnaXN0ZXJlZFtwbGF5ZXJdLCAiUGxheWVyIG5vdCByZWdpc3RlcmVkIgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX3JlZ2lzdGVyZWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBieXRlY18yIC8vIDB4MDAKICAgICE9CiAgICBhc3NlcnQgLy8gUGxheWVyIG5vdCByZWdpc3RlcmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjMwMgogICAgLy8gcmV0dXJuIHNlbGYucGxheWVyX3JlY292ZXJ5X2NvdW50W3BsYXllcl0sIHNlbGYubWF4X3JlY292ZXJ5X3Blcl9pdGVtLnZhbHVlCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJwbGF5ZXJfcmVjb3ZlcnlfY291bnQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wbGF5ZXJfcmVjb3ZlcnlfY291bnQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAibWF4X3JlY292ZXJ5X3Blcl9pdGVtIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm1heF9yZWNvdmVyeV9wZXJfaXRlbSBleGlzdHMKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1388], "errorMessage": "Asset not found"}, {"pc": [977], "errorMessage": "Cannot get original item name"}, {"pc": [1108], "errorMessage": "Must provide participation proof"}, {"pc": [955], "errorMessage": "Must provide recovery quest proof"}, {"pc": [272, 299, 329, 359, 376, 412, 445, 480, 515, 603], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [573], "errorMessage": "OnCompletion is not one of NoOp, OptIn"}, {"pc": [1320], "errorMessage": "Only game master can advance season"}, {"pc": [840], "errorMessage": "Only game master can create items"}, {"pc": [1379], "errorMessage": "Only registered players can claim items"}, {"pc": [1218], "errorMessage": "Only registered players can craft"}, {"pc": [1102], "errorMessage": "Only registered players can participate"}, {"pc": [942], "errorMessage": "Only registered players can recover items"}, {"pc": [949], "errorMessage": "Original item not found"}, {"pc": [1290, 1465], "errorMessage": "Player not registered"}, {"pc": [849], "errorMessage": "Recipient must be registered player"}, {"pc": [970], "errorMessage": "Recovery limit reached - max 3 recoveries per player"}, {"pc": [607], "errorMessage": "can only call when creating"}, {"pc": [275, 302, 332, 362, 379, 415, 448, 483, 518, 576], "errorMessage": "can only call when not creating"}, {"pc": [1325, 1366], "errorMessage": "check self.current_season exists"}, {"pc": [838, 1318], "errorMessage": "check self.game_master exists"}, {"pc": [733, 846, 939, 1099, 1215, 1287, 1376, 1462], "errorMessage": "check self.is_registered exists for account"}, {"pc": [966, 1476], "errorMessage": "check self.max_recovery_per_item exists"}, {"pc": [1304], "errorMessage": "check self.player_experience exists for account"}, {"pc": [1297], "errorMessage": "check self.player_level exists for account"}, {"pc": [961, 1310, 1471], "errorMessage": "check self.player_recovery_count exists for account"}, {"pc": [908, 1361], "errorMessage": "check self.total_items_created exists"}, {"pc": [795, 1356], "errorMessage": "check self.total_players exists"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [], "name": "initialize_game", "returns": {"type": "string"}, "desc": "Initialize the game state - called once when contract is created", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "application", "name": "quest_system"}, {"type": "application", "name": "guild_system"}], "name": "configure_systems", "returns": {"type": "void"}, "desc": "Link the quest and guild system apps (only game master)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "seasonal_reissue_interval"}, {"type": "uint64", "name": "craft_interval"}, {"type": "uint64", "name": "burst"}], "name": "configure_rate_limits", "returns": {"type": "void"}, "desc": "Set the minimum seconds between seasonal reissues and crafts, and how\nmany of each a player may take back-to-back (only game master) An interval of 0 disables the limit for that action", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "bool", "name": "enabled"}], "name": "configure_fee_pooling", "returns": {"type": "void"}, "desc": "Choose who pays inner transaction fees (only game master)\nEnabled: inner fees are 0 and callers must cover them through the outer fee. Disabled: the app account pays them", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp", "OptIn"], "create": []}, "args": [{"type": "string", "name": "player_name"}], "name": "register_player", "returns": {"type": "string"}, "desc": "Register a new player in the game\nOpt in first, then call again as NoOp right after a payment to the app covering the MBR of the name boxes", "events": [{"args": [{"type": "address", "name": "player"}], "name": "PlayerRegistered", "desc": "ARC-28 event: a player completed registration"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "player_name"}], "name": "resolve_name", "returns": {"type": "address"}, "desc": "Player registered under a name, or the zero address if none is", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "player"}], "name": "name_of", "returns": {"type": "string"}, "desc": "Name a player registered with, or an empty string if none", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "recipient"}, {"type": "string", "name": "item_name"}, {"type": "string", "name": "item_type"}, {"type": "string", "name": "rarity"}, {"type": "uint64", "name": "attack_power"}, {"type": "uint64", "name": "defense_power"}, {"type": "string", "name": "special_effect"}], "name": "create_game_item", "returns": {"type": "uint64"}, "desc": "Create a new game item as an ASA", "events": [{"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "recipient"}, {"type": "uint8", "name": "source"}], "name": "ItemMinted", "desc": "ARC-28 event: a new item ASA is held by the contract for recipient"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "request_key"}, {"type": "account", "name": "recipient"}, {"type": "string", "name": "item_name"}, {"type": "string", "name": "item_type"}, {"type": "string", "name": "rarity"}, {"type": "uint64", "name": "attack_power"}, {"type": "uint64", "name": "defense_power"}, {"type": "string", "name": "special_effect"}], "name": "create_game_item_with_key", "returns": {"type": "uint64"}, "desc": "create_game_item that mints at most once per request key: a retried\nrequest returns the asset ID its first successful call minted", "events": [{"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "recipient"}, {"type": "uint8", "name": "source"}], "name": "ItemMinted", "desc": "ARC-28 event: a new item ASA is held by the contract for recipient"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[]", "name": "request_key"}], "name": "get_minted_item", "returns": {"type": "uint64"}, "desc": "Asset ID minted for a request key, or 0 if none was", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "asset", "name": "original_item_id"}, {"type": "byte[]", "name": "recovery_quest_proof"}, {"type": "account", "name": "new_recipient"}], "name": "recover_lost_item", "returns": {"type": "uint64"}, "desc": "ON-DEMAND TOKENIZATION: Recover a lost game item\nThis is the core feature for Task 6", "events": [{"args": [{"type": "uint64", "name": "original_asset_id"}, {"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "recipient"}], "name": "ItemRecovered", "desc": "ARC-28 event: a lost item was reissued as a new ASA"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "event_name"}, {"type": "byte[]", "name": "participation_proof"}, {"type": "account", "name": "recipient"}], "name": "seasonal_event_reissue", "returns": {"type": "uint64"}, "desc": "ON-DEMAND TOKENIZATION: Reissue seasonal event items\nAllows players to earn previous season items in new events", "events": [{"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "recipient"}, {"type": "uint8", "name": "source"}], "name": "ItemMinted", "desc": "ARC-28 event: a new item ASA is held by the contract for recipient"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "asset", "name": "material_1"}, {"type": "asset", "name": "material_2"}, {"type": "uint64", "name": "recipe_id"}], "name": "craft_items", "returns": {"type": "uint64"}, "desc": "Craft new items by combining existing ones\nDemonstrates atomic transactions", "events": [{"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "recipient"}, {"type": "uint8", "name": "source"}], "name": "ItemMinted", "desc": "ARC-28 event: a new item ASA is held by the contract for recipient"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "item_type"}, {"type": "string", "name": "rarity"}], "name": "create_item_stack", "returns": {"type": "uint64"}, "desc": "Mint the fungible ASA for a stackable item template (only game master)\nCommon consumables and materials share one ASA per type and rarity instead of one ASA per item; unique items still use create_game_item. Returns the existing ASA if the template already has one", "events": [{"args": [{"type": "uint64", "name": "asset_id"}, {"type": "uint64", "name": "supply"}], "name": "ItemStackCreated", "desc": "ARC-28 event: the fungible ASA for an item template was minted"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "recipient"}, {"type": "string", "name": "item_type"}, {"type": "string", "name": "rarity"}, {"type": "uint64", "name": "amount"}], "name": "dispense_stack_items", "returns": {"type": "uint64"}, "desc": "Send units of a stackable item to a registered player (only game master)\nThe recipient opts in to each template's ASA once, not once per item", "events": [{"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "recipient"}, {"type": "uint64", "name": "amount"}], "name": "StackItemsDispensed", "desc": "ARC-28 event: units of a stackable item were sent to a player"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "items"}, {"type": "address[]", "name": "holders"}], "name": "recycle_items", "returns": {"type": "uint64"}, "desc": "Destroy abandoned or expired unique items to release their MBR\n(only game master) Items held by players are clawed back first; each item adds one or two inner transactions, submitted in groups of up to 16. Inner fees are covered by the outer transaction fee (see item_recycler.py)", "events": [{"args": [{"type": "uint64", "name": "count"}, {"type": "uint64", "name": "clawed_back"}], "name": "ItemsRecycled", "desc": "ARC-28 event: item ASAs were clawed back and destroyed"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "item_type"}, {"type": "string", "name": "rarity"}], "name": "get_item_stack", "returns": {"type": "uint64"}, "desc": "Get the ASA of a stackable item template, or 0 if it has none", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "item_id"}], "name": "get_item_metadata", "returns": {"type": "(uint8,uint8,uint16,uint16,uint16,bool,uint8,uint64)", "struct": "ItemMetadata"}, "desc": "Get the compact metadata of a unique item", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "effect_id"}], "name": "get_effect", "returns": {"type": "string"}, "desc": "Get the text of an interned special effect (\"\" for no effect)", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "player"}], "name": "get_player_stats", "returns": {"type": "(uint64,uint64,uint64)"}, "desc": "Get player statistics", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "advance_season", "returns": {"type": "uint64"}, "desc": "Advance to next season (only game master)\nPer-player season counters reset lazily on their next use", "events": [{"args": [{"type": "uint64", "name": "season"}], "name": "SeasonAdvanced", "desc": "ARC-28 event: a new season started"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_game_info", "returns": {"type": "(uint64,uint64,uint64)"}, "desc": "Get current game information", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "asset", "name": "item_id"}], "name": "claim_item", "returns": {"type": "string"}, "desc": "Claim an item that was created for the player.\nPlayer must have opted-in to the asset before calling this.", "events": [{"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "player"}], "name": "ItemClaimed", "desc": "ARC-28 event: an item was transferred to the player"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "asset", "name": "item_id"}, {"type": "account", "name": "player"}], "name": "deliver_item", "returns": {"type": "void"}, "desc": "Transfer an AlgoRealm item to a player (only game master).\nThe player's opt-in usually precedes this call in the same group, signed with the AlgoRealmItemOptIn delegated logic signature.", "events": [{"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "player"}], "name": "ItemClaimed", "desc": "ARC-28 event: an item was transferred to the player"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "player"}], "name": "get_recovery_status", "returns": {"type": "(uint64,uint64)"}, "desc": "Get player's current recovery count and max allowed recoveries", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "player"}, {"type": "uint64", "name": "action"}], "name": "get_action_cooldown", "returns": {"type": "uint64"}, "desc": "Seconds until player may next take a rate-limited action (0 = now)", "events": [], "readonly": true, "recommendations": {}}], "name": "AlgoRealmGameManager", "state": {"keys": {"box": {}, "global": {"total_players": {"key": "dG90YWxfcGxheWVycw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_items_created": {"key": "dG90YWxfaXRlbXNfY3JlYXRlZA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_items_recycled": {"key": "dG90YWxfaXRlbXNfcmVjeWNsZWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "game_master": {"key": "Z2FtZV9tYXN0ZXI=", "keyType": "AVMString", "valueType": "address"}, "current_season": {"key": "Y3VycmVudF9zZWFzb24=", "keyType": "AVMString", "valueType": "AVMUint64"}, "max_recovery_per_item": {"key": "bWF4X3JlY292ZXJ5X3Blcl9pdGVt", "keyType": "AVMString", "valueType": "AVMUint64"}, "quest_system_app": {"key": "cXVlc3Rfc3lzdGVtX2FwcA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "guild_system_app": {"key": "Z3VpbGRfc3lzdGVtX2FwcA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "seasonal_reissue_interval": {"key": "c2Vhc29uYWxfcmVpc3N1ZV9pbnRlcnZhbA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "craft_interval": {"key": "Y3JhZnRfaW50ZXJ2YWw=", "keyType": "AVMString", "valueType": "AVMUint64"}, "rate_limit_burst": {"key": "cmF0ZV9saW1pdF9idXJzdA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_effects": {"key": "dG90YWxfZWZmZWN0cw==", "keyType": "AVMString", "valueType": "AVMUint64"}, "pool_inner_fees": {"key": "cG9vbF9pbm5lcl9mZWVz", "keyType": "AVMString", "valueType": "bool"}}, "local": {"player_level": {"key": "cGxheWVyX2xldmVs", "keyType": "AVMString", "valueType": "AVMUint64"}, "player_experience": {"key": "cGxheWVyX2V4cGVyaWVuY2U=", "keyType": "AVMString", "valueType": "AVMUint64"}, "player_recovery_count": {"key": "cGxheWVyX3JlY292ZXJ5X2NvdW50", "keyType": "AVMString", "valueType": "AVMUint64"}, "player_season": {"key": "cGxheWVyX3NlYXNvbg==", "keyType": "AVMString", "valueType": "AVMUint64"}, "is_registered": {"key": "aXNfcmVnaXN0ZXJlZA==", "keyType": "AVMString", "valueType": "bool"}, "action_clock": {"key": "YWN0aW9uX2Nsb2Nr", "keyType": "AVMString", "valueType": "AVMBytes"}}}, "maps": {"box": {"item_stacks": {"keyType": "AVMBytes", "valueType": "uint64", "prefix": "cw=="}, "item_metadata": {"keyType": "uint64", "valueType": "ItemMetadata", "prefix": "bQ=="}, "effect_table": {"keyType": "uint64", "valueType": "AVMString", "prefix": "ZQ=="}, "effect_ids": {"keyType": "AVMBytes", "valueType": "uint64", "prefix": "aQ=="}, "minted_requests": {"keyType": "AVMBytes", "valueType": "uint64", "prefix": "cg=="}, "name_owners": {"keyType": "AVMBytes", "valueType": "address", "prefix": "bg=="}, "player_names": {"keyType": "address", "valueType": "AVMString", "prefix": "YQ=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 2, "ints": 11}, "local": {"bytes": 2, "ints": 4}}}, "structs": {"ItemMetadata": [{"name": "item_type", "type": "uint8"}, {"name": "rarity", "type": "uint8"}, {"name": "attack_power", "type": "uint16"}, {"name": "defense_power", "type": "uint16"}, {"name": "effect_id", "type": "uint16"}, {"name": "is_recovered", "type": "bool"}, {"name": "recovery_count", "type": "uint8"}, {"name": "original_creation_time", "type": "uint64"}]}, "byteCode": {"approval": "CiAFAAEDEP//AyYbBBUffHUBAA1pc19yZWdpc3RlcmVkC2dhbWVfbWFzdGVyDmN1cnJlbnRfc2Vhc29uAW0NdG90YWxfcGxheWVycxN0b3RhbF9pdGVtc19jcmVhdGVkEHF1ZXN0X3N5c3RlbV9hcHAZc2Vhc29uYWxfcmVpc3N1ZV9pbnRlcnZhbA5jcmFmdF9pbnRlcnZhbBByYXRlX2xpbWl0X2J1cnN0FXBsYXllcl9yZWNvdmVyeV9jb3VudA1wbGF5ZXJfc2Vhc29uDGFjdGlvbl9jbG9jaxR0b3RhbF9pdGVtc19yZWN5Y2xlZBVtYXhfcmVjb3ZlcnlfcGVyX2l0ZW0NdG90YWxfZWZmZWN0cw9wb29sX2lubmVyX2ZlZXMMcGxheWVyX2xldmVsEXBsYXllcl9leHBlcmllbmNlBJUFajQBOgFzEGd1aWxkX3N5c3RlbV9hcHAMQ1JBRlRFRF9JVEVNBFQmUIYxG0EAvYIaBLNarDsEgnMp4gREjwpmBKlMcRAEhD0Y1QT/lkuSBBSi8CkEKmGEgATcLi0KBLN4CCME6+k/iwSg0TTQBIvN45YELqtQ7wTmh3JgBDOxnEkETYkgcwTJXsFcBOBFLKkERdZeywQ7UnUfBEeaf5cEOtXt1QRNn392BAK4PQAEgKabCzYaAI4aAu8C1wK/ArACjwJ5AlsCJAHnAdABrQGKAWkBTAElAQ4A8QDdAMEAnQCMAG4AUAA4AB0AAiJDMRkURDEYRDYaARfAHDYaAheIDMkWKExQsCNDMRkURDEYRDYaARfAHIgMm0wWTBZQKExQsCNDMRkURDEYRDYaARfAMDYaAhfAHIgMMyNDMRkURDEYRDYaARfAMIgLxkkVFlcGAkxQKExQsCNDMRkURDEYRIgLnk8CFk8CFk8CFk4CUExQKExQsCNDMRkURDEYRIgLYBYoTFCwI0MxGRREMRhENhoBF8AciAspTwIWTwIWTwIWTgJQTFAoTFCwI0MxGRREMRhENhoBF4gK9UkVFlcGAkxQKExQsCNDMRkURDEYRDYaAReICscoTFCwI0MxGRREMRhENhoBVwIANhoCVwIAiAqSFihMULAjQzEZFEQxGEQ2GgE2GgKICVEWKExQsCNDMRkURDEYRDYaARfAHDYaAlcCADYaA1cCADYaBBeICNIWKExQsCNDMRkURDEYRDYaAVcCADYaAlcCAIgIKBYoTFCwI0MxGRREMRhENhoBF8AwNhoCF8AwNhoDF4gHrRYoTFCwI0MxGRREMRhENhoBVwIANhoCVwIANhoDF8AciAcPFihMULAjQzEZFEQxGEQ2GgEXwDA2GgJXAgA2GgMXwByIBboWKExQsCNDMRkURDEYRDYaAVcCAIgDTBYoTFCwI0MxGRREMRhENhoBVwIANhoCF8AcNhoDVwIANhoEVwIANhoFVwIANhoGFzYaBxc2GghXAgCIAs8WKExQsCNDMRkURDEYRDYaARfAHDYaAlcCADYaA1cCADYaBFcCADYaBRc2GgYXNhoHVwIAiAKDFihMULAjQzEZFEQxGEQ2GgEXwByIAlxJFRZXBgJMUChMULAjQzEZFEQxGEQ2GgFXAgCIAi0oTFCwI0MjMRmQJBpEMRhENhoBVwIAiAD7SRUWVwYCTFAoTFCwI0MxGRREMRhENhoBiADPI0MxGRREMRhENhoBFzYaAhc2GgMXiACZI0MxGRREMRhENhoBF8AyNhoCF8AyiABrI0MxGRREMRgURIgADkkVFlcGAkxQKExQsCNDJwYiZycHImcnDyJnJwQjZycQJGcrMQBnJwgiZycYImcnCYGQHGcnCoE8ZycLJGcnESJnJxIpZ4AWQWxnb1JlYWxtIGluaXRpYWxpemVkIYmKAgAxACIrZUQSRCcIi/5nJxiL/2eJigMAMQAiK2VEEkSL/0QnCYv9ZycKi/5nJwuL/2eJigEAMQAiK2VEEkQnEov/Z4mKAQExGSMSQQBFMQAnEyJmMQAnFCJmMQAnDCJmIicEZUQxACcNTwJmMQAqKWYlrzEAJw5PAmaAFk9wdGVkIGluIHRvIEFsZ29SZWFsbSGJMQAiKmNEKRNBAByAGVBsYXllciBhbHJlYWR5IHJlZ2lzdGVyZWSJi/8VSURJgSAORIv/AYABbkxQSb1FARREMRZEMRYjCUk4ECMSREk4BzIKEkRJOAAxABJEOAiBkANPAwuByN8CCA9EMQC/gAFhMQBQSbxIi/+/MQAnEyNmMQAnFCJmMQAnDCJmIicEZUQxACcNTwJmMQAqgAGAZiInBmVEIwgnBkxngAReOvlXMQBQsIAVV2VsY29tZSB0byBBbGdvUmVhbG0hiYoBAYv/AYABbkxQMgNMvk2JigEBgAFhi/9QvoAATgJNiYoHAYv5i/qL+4v8i/2L/ov/iABViYoIATEAIitlRBJEi/iAABNEi/gBgAFyTFBJvkwXTEEABYsBjACJi/mL+ov7i/yL/Yv+i/+IAB1JFosATL+MAImKAQGL/wGAAXJMUL5MFyJMTwJNiYoHASJHAzEAIitlRBJEi/kiKmNEKRNEi/0hBA5Ei/4hBA5Ei/uABndlYXBvbhJAAA6L+4AGV2VhcG9uEkEBeiMWSZOBCA5EVwcBjAKL/IAGY29tbW9uEkAADov8gAZDb21tb24SQQDrIxZJk4EIDkRXBwGMA4v9FkmTJQ5EVwYCjACL/hZJkyUORFcGAowBi/+AABJBAIEiFkmTJQ5EVwYCMgcWiwKLA1CLAFCLAVBPAlApUClQTFCxiAWCMgpHA4AFSVRFTV9LBlCyBbIssiuyKrIpIrIkIrIjI7IigAdBTEdJVEVNsiWL+rImJLIQsgGztDxJFicFSwFQTwO/IicHZUQjCCcHTGeL+VCAAQFQJxVMULCMAImL/wGAAWlMUEm9RQFBAAa+RBdC/2siJxFlRCMISSEEDkQnEUsBZ0kWTwJLAb+AAWVMUEm8SIv/v0L/RYv8gARyYXJlEkAADIv8gARSYXJlEkEABYECQv75i/yABGVwaWMSQAAMi/yABEVwaWMSQQAEJEL+3Yv8gAlsZWdlbmRhcnkSQAARi/yACUxlZ2VuZGFyeRJBAAcjRIEEQv60IkL/9ov7gAVhcm1vchJAAA2L+4AFQXJtb3ISQQAFgQJC/miL+4AKY29uc3VtYWJsZRJAABKL+4AKQ29uc3VtYWJsZRJBAAQkQv5Ai/uABWJhZGdlEkAADYv7gAVCYWRnZRJBAAWBBEL+IYv7gAVvdGhlchJAAA2L+4AFT3RoZXISQQAGI0QiQv4BIkL/94oDATEAIipjRCkTRIv9cQZIFUSL/oAAE0QiJwhlRESxiAPYi/4VFlcGAov+UDEAIicIZUSyGLIcgARgTeFNshqAAQGyGrIagQayELIBs7Q+SVcEAExXAAQoEkQiU0QxAIgFpUkiJxBlRAxEi/1xBEgVRIAPUkVDT1ZFUkVEX0lURU1fi/5QsYgDcTIKRwNPBbIFsiyyK7IqsikisiQisiMjsiKACEFMR1JFQ09WsiWADlJFQ09WRVJFRF9JVEVNsiYkshCyAbO0PIv9FkknBUxQSb1FAUEALIsDvkRJgQlVgf8BDESBQCNUSYEJVSMIFkmTgQgORFcHAVwJiwEWJwVMUEy/iwAjCDEAJwxPAmYiJwRlRDEAJw1PAmaLAUkWiwJMUIv/UIAEqjsUF0xQsIwAiYoDATEAIipjRCkTRIv+gAATRCInCWVEIkyIBGuACVNFQVNPTkFMX4v+ULGIApsyCkcDTwWyBbIssiuyKrIpIrIkIrIjI7IigAhBTEdTRUFTTrIlgA1TRUFTT05BTF9JVEVNsiYkshCyAbO0PEkWi/9QgAECUCcVTFCwiYoDATEAIipjRCkTRCInCmVEI0yIA/axiAI0MgpHAycZsgWyLLIrsiqyKSKyJCKyIyOyIoAIQUxHQ1JBRlSyJScZsiYkshCyAbO0PEkWMQBQgAEDUCcVTFCwiYoCATEAIitlRBJEi/4nFlCL/1BJAScXTFBJvUUBQQAFvkQXTImLAEkVgSAORLGIAcMyCkcDgAZTVEFDS19LBlCyBbIssiuyKrIpIrIkIrIjgYCglKWNHbIigAhBTEdTVEFDS7IlTLImJLIQsgGztDxJFk8CSwG/gAgAAADo1KUQAFCABK1VTO5MULBMiYoEATEAIitlRBJEi/wiKmNEKRNEi/9Ei/0nFlCL/lABJxdMUEm9RQFEvkQXsYgBN0sBshGL/7ISi/yyFIEEshCyAbNJFov/FkyL/FBMUIAE5XCl4kxQsImKAgEiSYAARwIxACIrZUQSRIv+IllJi/8iWUsBEkREMgoiRwKLCYsFDEEAwov+VwIAiwlJTgKBCAtbSU4CjASL/1cCAEyBIAuBIFhJTgKMAUlxC0SLBklOAxJEcQBEIxJEE4sIjAKLB4wDQQAziwRJcQpEiwZJTgISRIsHSU4CiACcgQSyEE8CshGLAbITshQjshIisgEjCIsIIwiMAowDiwKMCIsDjAeLBBYnBUxQSYwAvUUBQQAEiwC8SIsHSYgAXCSyEIsEsiEisgEjCEmMB4EPD0AACosJIwiLBRJBAASzIowHiwkjCIwJQv82IicPZUSLBUlOAggnD0xnSRaLCBZQgATrAhR1TFCwjACJIicSZUQpE0EAAiKJMgCJigEAi/9AAAKxibaJigIBi/4nFlCL/1ABJxdMUL5MFyJMTwJNiYoBAYv/FicFTFBJvUUBRL5EiYoBAYv/FoABZUxQvoAATgJNiYoBA4v/IipjRCkTRIv/IicTY0SL/yInFGNEi/+IAZaJMQAiK2VEEkQiJwRlRCMIJwRLAWdJFoAEw/laAExQsIkiJwZlRCInB2VEIicEZUSJigEBMQAiKmNEKRNEi/9xB0gyAxNEi/9xAEgjEkSxiP83MQCL/7IRI7ISshSBBLIQsgGzi/8WMQBQJxpMULCAGkl0ZW0gc3VjY2Vzc2Z1bGx5IGNsYWltZWQhiYoCADEAIitlRBJEi/8iKmNEKRNEi/5xC0QyChJEi/5xAEgjEkSxiP7Ui/6yESOyEov/shSBBLIQsgGzi/4Wi/9QJxpMULCJigECi/8iKmNEKRNEi/+IALIiJxBlRImKAgGAAEcCi/+BAgxEIicJZUSL/yMSQQAIIicKZUyMA0Qlr4v+IicOY02L/4EIC1uLA0lOAghJTgKMASInC2VEC0mMADIHSYwCCA5BAAQijACJiwGLAgmLAAmMAImKAgAxACWvTCInDmNNSYv+gQgLSU4CMgdJTgJOA08CTFtJTwIMQQAEiwKMA4sDi/8ISYsCCSInC2VEi/8LDkQWiwCLAU8CXTEAJw5PAmaJigEBi/8iJw1jIk4CTSInBGVEE0EAAiKJi/8iJwxjRIk=", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 9, "patch": 0}}, "desc": "\n    Main game manager contract for AlgoRealm\n    Handles player registration, item management, and on-demand tokenization\n    ", "events": [{"args": [{"type": "address", "name": "player"}], "name": "PlayerRegistered", "desc": "ARC-28 event: a player completed registration"}, {"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "recipient"}, {"type": "uint8", "name": "source"}], "name": "ItemMinted", "desc": "ARC-28 event: a new item ASA is held by the contract for recipient"}, {"args": [{"type": "uint64", "name": "original_asset_id"}, {"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "recipient"}], "name": "ItemRecovered", "desc": "ARC-28 event: a lost item was reissued as a new ASA"}, {"args": [{"type": "uint64", "name": "asset_id"}, {"type": "uint64", "name": "supply"}], "name": "ItemStackCreated", "desc": "ARC-28 event: the fungible ASA for an item template was minted"}, {"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "recipient"}, {"type": "uint64", "name": "amount"}], "name": "StackItemsDispensed", "desc": "ARC-28 event: units of a stackable item were sent to a player"}, {"args": [{"type": "uint64", "name": "count"}, {"type": "uint64", "name": "clawed_back"}], "name": "ItemsRecycled", "desc": "ARC-28 event: item ASAs were clawed back and destroyed"}, {"args": [{"type": "uint64", "name": "season"}], "name": "SeasonAdvanced", "desc": "ARC-28 event: a new season started"}, {"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "player"}], "name": "ItemClaimed", "desc": "ARC-28 event: an item was transferred to the player"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDAgMSAzIDE2IDY1NTM1CiAgICBieXRlY2Jsb2NrIDB4MTUxZjdjNzUgMHgwMCAiaXNfcmVnaXN0ZXJlZCIgImdhbWVfbWFzdGVyIiAiY3VycmVudF9zZWFzb24iIDB4NmQgInRvdGFsX3BsYXllcnMiICJ0b3RhbF9pdGVtc19jcmVhdGVkIiAicXVlc3Rfc3lzdGVtX2FwcCIgInNlYXNvbmFsX3JlaXNzdWVfaW50ZXJ2YWwiICJjcmFmdF9pbnRlcnZhbCIgInJhdGVfbGltaXRfYnVyc3QiICJwbGF5ZXJfcmVjb3ZlcnlfY291bnQiICJwbGF5ZXJfc2Vhc29uIiAiYWN0aW9uX2Nsb2NrIiAidG90YWxfaXRlbXNfcmVjeWNsZWQiICJtYXhfcmVjb3ZlcnlfcGVyX2l0ZW0iICJ0b3RhbF9lZmZlY3RzIiAicG9vbF9pbm5lcl9mZWVzIiAicGxheWVyX2xldmVsIiAicGxheWVyX2V4cGVyaWVuY2UiIDB4OTUwNTZhMzQgMHgzYSAweDczICJndWlsZF9zeXN0ZW1fYXBwIiAweDQzNTI0MTQ2NTQ0NTQ0NWY0OTU0NDU0ZCAweDU0MjY1MDg2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2FmdGVyX2lmX2Vsc2VAMzEKICAgIHB1c2hieXRlc3MgMHhiMzVhYWMzYiAweDgyNzMyOWUyIDB4NDQ4ZjBhNjYgMHhhOTRjNzExMCAweDg0M2QxOGQ1IDB4ZmY5NjRiOTIgMHgxNGEyZjAyOSAweDJhNjE4NDgwIDB4ZGMyZTJkMGEgMHhiMzc4MDgyMyAweGViZTkzZjhiIDB4YTBkMTM0ZDAgMHg4YmNkZTM5NiAweDJlYWI1MGVmIDB4ZTY4NzcyNjAgMHgzM2IxOWM0OSAweDRkODkyMDczIDB4Yzk1ZWMxNWMgMHhlMDQ1MmNhOSAweDQ1ZDY1ZWNiIDB4M2I1Mjc1MWYgMHg0NzlhN2Y5NyAweDNhZDVlZGQ1IDB4NGQ5ZjdmNzYgMHgwMmI4M2QwMCAweDgwYTY5YjBiIC8vIG1ldGhvZCAiaW5pdGlhbGl6ZV9nYW1lKClzdHJpbmciLCBtZXRob2QgImNvbmZpZ3VyZV9zeXN0ZW1zKGFwcGxpY2F0aW9uLGFwcGxpY2F0aW9uKXZvaWQiLCBtZXRob2QgImNvbmZpZ3VyZV9yYXRlX2xpbWl0cyh1aW50NjQsdWludDY0LHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJjb25maWd1cmVfZmVlX3Bvb2xpbmcoYm9vbCl2b2lkIiwgbWV0aG9kICJyZWdpc3Rlcl9wbGF5ZXIoc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAicmVzb2x2ZV9uYW1lKHN0cmluZylhZGRyZXNzIiwgbWV0aG9kICJuYW1lX29mKGFjY291bnQpc3RyaW5nIiwgbWV0aG9kICJjcmVhdGVfZ2FtZV9pdGVtKGFjY291bnQsc3RyaW5nLHN0cmluZyxzdHJpbmcsdWludDY0LHVpbnQ2NCxzdHJpbmcpdWludDY0IiwgbWV0aG9kICJjcmVhdGVfZ2FtZV9pdGVtX3dpdGhfa2V5KGJ5dGVbXSxhY2NvdW50LHN0cmluZyxzdHJpbmcsc3RyaW5nLHVpbnQ2NCx1aW50NjQsc3RyaW5nKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X21pbnRlZF9pdGVtKGJ5dGVbXSl1aW50NjQiLCBtZXRob2QgInJlY292ZXJfbG9zdF9pdGVtKGFzc2V0LGJ5dGVbXSxhY2NvdW50KXVpbnQ2NCIsIG1ldGhvZCAic2Vhc29uYWxfZXZlbnRfcmVpc3N1ZShzdHJpbmcsYnl0ZVtdLGFjY291bnQpdWludDY0IiwgbWV0aG9kICJjcmFmdF9pdGVtcyhhc3NldCxhc3NldCx1aW50NjQpdWludDY0IiwgbWV0aG9kICJjcmVhdGVfaXRlbV9zdGFjayhzdHJpbmcsc3RyaW5nKXVpbnQ2NCIsIG1ldGhvZCAiZGlzcGVuc2Vfc3RhY2tfaXRlbXMoYWNjb3VudCxzdHJpbmcsc3RyaW5nLHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgInJlY3ljbGVfaXRlbXModWludDY0W10sYWRkcmVzc1tdKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2l0ZW1fc3RhY2soc3RyaW5nLHN0cmluZyl1aW50NjQiLCBtZXRob2QgImdldF9pdGVtX21ldGFkYXRhKHVpbnQ2NCkodWludDgsdWludDgsdWludDE2LHVpbnQxNix1aW50MTYsYm9vbCx1aW50OCx1aW50NjQpIiwgbWV0aG9kICJnZXRfZWZmZWN0KHVpbnQ2NClzdHJpbmciLCBtZXRob2QgImdldF9wbGF5ZXJfc3RhdHMoYWNjb3VudCkodWludDY0LHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJhZHZhbmNlX3NlYXNvbigpdWludDY0IiwgbWV0aG9kICJnZXRfZ2FtZV9pbmZvKCkodWludDY0LHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJjbGFpbV9pdGVtKGFzc2V0KXN0cmluZyIsIG1ldGhvZCAiZGVsaXZlcl9pdGVtKGFzc2V0LGFjY291bnQpdm9pZCIsIG1ldGhvZCAiZ2V0X3JlY292ZXJ5X3N0YXR1cyhhY2NvdW50KSh1aW50NjQsdWludDY0KSIsIG1ldGhvZCAiZ2V0X2FjdGlvbl9jb29sZG93bihhY2NvdW50LHVpbnQ2NCl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2luaXRpYWxpemVfZ2FtZV9yb3V0ZUA1IG1haW5fY29uZmlndXJlX3N5c3RlbXNfcm91dGVANiBtYWluX2NvbmZpZ3VyZV9yYXRlX2xpbWl0c19yb3V0ZUA3IG1haW5fY29uZmlndXJlX2ZlZV9wb29saW5nX3JvdXRlQDggbWFpbl9yZWdpc3Rlcl9wbGF5ZXJfcm91dGVAOSBtYWluX3Jlc29sdmVfbmFtZV9yb3V0ZUAxMCBtYWluX25hbWVfb2Zfcm91dGVAMTEgbWFpbl9jcmVhdGVfZ2FtZV9pdGVtX3JvdXRlQDEyIG1haW5fY3JlYXRlX2dhbWVfaXRlbV93aXRoX2tleV9yb3V0ZUAxMyBtYWluX2dldF9taW50ZWRfaXRlbV9yb3V0ZUAxNCBtYWluX3JlY292ZXJfbG9zdF9pdGVtX3JvdXRlQDE1IG1haW5fc2Vhc29uYWxfZXZlbnRfcmVpc3N1ZV9yb3V0ZUAxNiBtYWluX2NyYWZ0X2l0ZW1zX3JvdXRlQDE3IG1haW5fY3JlYXRlX2l0ZW1fc3RhY2tfcm91dGVAMTggbWFpbl9kaXNwZW5zZV9zdGFja19pdGVtc19yb3V0ZUAxOSBtYWluX3JlY3ljbGVfaXRlbXNfcm91dGVAMjAgbWFpbl9nZXRfaXRlbV9zdGFja19yb3V0ZUAyMSBtYWluX2dldF9pdGVtX21ldGFkYXRhX3JvdXRlQDIyIG1haW5fZ2V0X2VmZmVjdF9yb3V0ZUAyMyBtYWluX2dldF9wbGF5ZXJfc3RhdHNfcm91dGVAMjQgbWFpbl9hZHZhbmNlX3NlYXNvbl9yb3V0ZUAyNSBtYWluX2dldF9nYW1lX2luZm9fcm91dGVAMjYgbWFpbl9jbGFpbV9pdGVtX3JvdXRlQDI3IG1haW5fZGVsaXZlcl9pdGVtX3JvdXRlQDI4IG1haW5fZ2V0X3JlY292ZXJ5X3N0YXR1c19yb3V0ZUAyOSBtYWluX2dldF9hY3Rpb25fY29vbGRvd25fcm91dGVAMzAKCm1haW5fYWZ0ZXJfaWZfZWxzZUAzMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTQ3CiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HYW1lTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl9nZXRfYWN0aW9uX2Nvb2xkb3duX3JvdXRlQDMwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MjUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxNDcKICAgIC8vIGNsYXNzIEFsZ29SZWFsbUdhbWVNYW5hZ2VyKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MjUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2FjdGlvbl9jb29sZG93bgogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfcmVjb3Zlcnlfc3RhdHVzX3JvdXRlQDI5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MTkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxNDcKICAgIC8vIGNsYXNzIEFsZ29SZWFsbUdhbWVNYW5hZ2VyKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MTkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X3JlY292ZXJ5X3N0YXR1cwogICAgc3dhcAogICAgaXRvYgogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2RlbGl2ZXJfaXRlbV9yb3V0ZUAyODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODkwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxNDcKICAgIC8vIGNsYXNzIEFsZ29SZWFsbUdhbWVNYW5hZ2VyKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojg5MAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGRlbGl2ZXJfaXRlbQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jbGFpbV9pdGVtX3JvdXRlQDI3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4NjMKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4NjMKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjbGFpbV9pdGVtCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfZ2FtZV9pbmZvX3JvdXRlQDI2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4NTQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfZ2FtZV9pbmZvCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBjb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9hZHZhbmNlX3NlYXNvbl9yb3V0ZUAyNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODQxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBhZHZhbmNlX3NlYXNvbgogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfcGxheWVyX3N0YXRzX3JvdXRlQDI0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4MzEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxNDcKICAgIC8vIGNsYXNzIEFsZ29SZWFsbUdhbWVNYW5hZ2VyKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4MzEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X3BsYXllcl9zdGF0cwogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2VmZmVjdF9yb3V0ZUAyMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Nzg1CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTQ3CiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HYW1lTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3ODUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2VmZmVjdAogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2l0ZW1fbWV0YWRhdGFfcm91dGVAMjI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojc3OQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Nzc5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9pdGVtX21ldGFkYXRhCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9pdGVtX3N0YWNrX3JvdXRlQDIxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3NjgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToxNDcKICAgIC8vIGNsYXNzIEFsZ29SZWFsbUdhbWVNYW5hZ2VyKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzY4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9pdGVtX3N0YWNrCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3JlY3ljbGVfaXRlbXNfcm91dGVAMjA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjY5NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTQ3CiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HYW1lTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2OTUKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiByZWN5Y2xlX2l0ZW1zCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2Rpc3BlbnNlX3N0YWNrX2l0ZW1zX3JvdXRlQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2NjMKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjYzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgZGlzcGVuc2Vfc3RhY2tfaXRlbXMKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX2l0ZW1fc3RhY2tfcm91dGVAMTg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjYyMgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTQ3CiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HYW1lTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjYyMgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNyZWF0ZV9pdGVtX3N0YWNrCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NyYWZ0X2l0ZW1zX3JvdXRlQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1NzgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjU3OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNyYWZ0X2l0ZW1zCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3NlYXNvbmFsX2V2ZW50X3JlaXNzdWVfcm91dGVAMTY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjUzNAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTQ3CiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HYW1lTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1MzQKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBzZWFzb25hbF9ldmVudF9yZWlzc3VlCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3JlY292ZXJfbG9zdF9pdGVtX3JvdXRlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0NDQKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQ0NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHJlY292ZXJfbG9zdF9pdGVtCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9taW50ZWRfaXRlbV9yb3V0ZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MzgxCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTQ3CiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HYW1lTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MzgxCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9taW50ZWRfaXRlbQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfZ2FtZV9pdGVtX3dpdGhfa2V5X3JvdXRlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozNDYKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNgogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNwogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgOAogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MzQ2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX2dhbWVfaXRlbV93aXRoX2tleQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfZ2FtZV9pdGVtX3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozMjQKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA1CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA2CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA3CiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozMjQKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjcmVhdGVfZ2FtZV9pdGVtCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX25hbWVfb2Zfcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjMxOQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjMxOQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBuYW1lX29mCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZXNvbHZlX25hbWVfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjMxMAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjMxMAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiByZXNvbHZlX25hbWUKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fcmVnaXN0ZXJfcGxheWVyX3JvdXRlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI1MwogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiTm9PcCIsICJPcHRJbiJdKQogICAgaW50Y18xIC8vIDEKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHNobAogICAgaW50Y18yIC8vIDMKICAgICYKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IG9uZSBvZiBOb09wLCBPcHRJbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI1MwogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiTm9PcCIsICJPcHRJbiJdKQogICAgY2FsbHN1YiByZWdpc3Rlcl9wbGF5ZXIKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NvbmZpZ3VyZV9mZWVfcG9vbGluZ19yb3V0ZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNDEKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjQxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY29uZmlndXJlX2ZlZV9wb29saW5nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NvbmZpZ3VyZV9yYXRlX2xpbWl0c19yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMjQKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gY2xhc3MgQWxnb1JlYWxtR2FtZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjI0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY29uZmlndXJlX3JhdGVfbGltaXRzCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NvbmZpZ3VyZV9zeXN0ZW1zX3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIxMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTQ3CiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HYW1lTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXBwbGljYXRpb25zCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hcyBBcHBsaWNhdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjEzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY29uZmlndXJlX3N5c3RlbXMKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5faW5pdGlhbGl6ZV9nYW1lX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjE5NQogICAgLy8gQGFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGNhbGxzdWIgaW5pdGlhbGl6ZV9nYW1lCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uY29udHJhY3QuQWxnb1JlYWxtR2FtZU1hbmFnZXIuaW5pdGlhbGl6ZV9nYW1lKCkgLT4gYnl0ZXM6CmluaXRpYWxpemVfZ2FtZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTk4CiAgICAvLyBzZWxmLnRvdGFsX3BsYXllcnMudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDYgLy8gInRvdGFsX3BsYXllcnMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MTk5CiAgICAvLyBzZWxmLnRvdGFsX2l0ZW1zX2NyZWF0ZWQudmFsdWUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDcgLy8gInRvdGFsX2l0ZW1zX2NyZWF0ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjAwCiAgICAvLyBzZWxmLnRvdGFsX2l0ZW1zX3JlY3ljbGVkLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlYyAxNSAvLyAidG90YWxfaXRlbXNfcmVjeWNsZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjAxCiAgICAvLyBzZWxmLmN1cnJlbnRfc2Vhc29uLnZhbHVlID0gVUludDY0KDEpCiAgICBieXRlYyA0IC8vICJjdXJyZW50X3NlYXNvbiIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMDIKICAgIC8vIHNlbGYubWF4X3JlY292ZXJ5X3Blcl9pdGVtLnZhbHVlID0gVUludDY0KDMpCiAgICBieXRlYyAxNiAvLyAibWF4X3JlY292ZXJ5X3Blcl9pdGVtIgogICAgaW50Y18yIC8vIDMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIwMwogICAgLy8gc2VsZi5nYW1lX21hc3Rlci52YWx1ZSA9IFR4bi5zZW5kZXIgICMgU2V0IHRoZSBjcmVhdG9yIGFzIGdhbWUgbWFzdGVyCiAgICBieXRlY18zIC8vICJnYW1lX21hc3RlciIKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIwNAogICAgLy8gc2VsZi5xdWVzdF9zeXN0ZW1fYXBwLnZhbHVlID0gQXBwbGljYXRpb24oMCkKICAgIGJ5dGVjIDggLy8gInF1ZXN0X3N5c3RlbV9hcHAiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjA1CiAgICAvLyBzZWxmLmd1aWxkX3N5c3RlbV9hcHAudmFsdWUgPSBBcHBsaWNhdGlvbigwKQogICAgYnl0ZWMgMjQgLy8gImd1aWxkX3N5c3RlbV9hcHAiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjA2CiAgICAvLyBzZWxmLnNlYXNvbmFsX3JlaXNzdWVfaW50ZXJ2YWwudmFsdWUgPSBVSW50NjQoREVGQVVMVF9TRUFTT05BTF9SRUlTU1VFX0lOVEVSVkFMKQogICAgYnl0ZWMgOSAvLyAic2Vhc29uYWxfcmVpc3N1ZV9pbnRlcnZhbCIKICAgIHB1c2hpbnQgMzYwMCAvLyAzNjAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMDcKICAgIC8vIHNlbGYuY3JhZnRfaW50ZXJ2YWwudmFsdWUgPSBVSW50NjQoREVGQVVMVF9DUkFGVF9JTlRFUlZBTCkKICAgIGJ5dGVjIDEwIC8vICJjcmFmdF9pbnRlcnZhbCIKICAgIHB1c2hpbnQgNjAgLy8gNjAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIwOAogICAgLy8gc2VsZi5yYXRlX2xpbWl0X2J1cnN0LnZhbHVlID0gVUludDY0KERFRkFVTFRfUkFURV9MSU1JVF9CVVJTVCkKICAgIGJ5dGVjIDExIC8vICJyYXRlX2xpbWl0X2J1cnN0IgogICAgaW50Y18yIC8vIDMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIwOQogICAgLy8gc2VsZi50b3RhbF9lZmZlY3RzLnZhbHVlID0gVUludDY0KDApCiAgICBieXRlYyAxNyAvLyAidG90YWxfZWZmZWN0cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMTAKICAgIC8vIHNlbGYucG9vbF9pbm5lcl9mZWVzLnZhbHVlID0gQm9vbChGYWxzZSkKICAgIGJ5dGVjIDE4IC8vICJwb29sX2lubmVyX2ZlZXMiCiAgICBieXRlY18xIC8vIDB4MDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIxMQogICAgLy8gcmV0dXJuIFN0cmluZygiQWxnb1JlYWxtIGluaXRpYWxpemVkISIpCiAgICBwdXNoYnl0ZXMgIkFsZ29SZWFsbSBpbml0aWFsaXplZCEiCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLmNvbmZpZ3VyZV9zeXN0ZW1zKHF1ZXN0X3N5c3RlbTogdWludDY0LCBndWlsZF9zeXN0ZW06IHVpbnQ2NCkgLT4gdm9pZDoKY29uZmlndXJlX3N5c3RlbXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIxMy0yMTYKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNvbmZpZ3VyZV9zeXN0ZW1zKAogICAgLy8gICAgIHNlbGYsIHF1ZXN0X3N5c3RlbTogQXBwbGljYXRpb24sIGd1aWxkX3N5c3RlbTogQXBwbGljYXRpb24KICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMTkKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5nYW1lX21hc3Rlci52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImdhbWVfbWFzdGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVfbWFzdGVyIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjE4LTIyMAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IHNlbGYuZ2FtZV9tYXN0ZXIudmFsdWUKICAgIC8vICksICJPbmx5IGdhbWUgbWFzdGVyIGNhbiBjb25maWd1cmUgc3lzdGVtcyIKICAgIGFzc2VydCAvLyBPbmx5IGdhbWUgbWFzdGVyIGNhbiBjb25maWd1cmUgc3lzdGVtcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMjEKICAgIC8vIHNlbGYucXVlc3Rfc3lzdGVtX2FwcC52YWx1ZSA9IHF1ZXN0X3N5c3RlbQogICAgYnl0ZWMgOCAvLyAicXVlc3Rfc3lzdGVtX2FwcCIKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjIyCiAgICAvLyBzZWxmLmd1aWxkX3N5c3RlbV9hcHAudmFsdWUgPSBndWlsZF9zeXN0ZW0KICAgIGJ5dGVjIDI0IC8vICJndWlsZF9zeXN0ZW1fYXBwIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5jb25maWd1cmVfcmF0ZV9saW1pdHMoc2Vhc29uYWxfcmVpc3N1ZV9pbnRlcnZhbDogdWludDY0LCBjcmFmdF9pbnRlcnZhbDogdWludDY0LCBidXJzdDogdWludDY0KSAtPiB2b2lkOgpjb25maWd1cmVfcmF0ZV9saW1pdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIyNC0yMjcKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNvbmZpZ3VyZV9yYXRlX2xpbWl0cygKICAgIC8vICAgICBzZWxmLCBzZWFzb25hbF9yZWlzc3VlX2ludGVydmFsOiBVSW50NjQsIGNyYWZ0X2ludGVydmFsOiBVSW50NjQsIGJ1cnN0OiBVSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMzQKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5nYW1lX21hc3Rlci52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImdhbWVfbWFzdGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVfbWFzdGVyIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjMzLTIzNQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IHNlbGYuZ2FtZV9tYXN0ZXIudmFsdWUKICAgIC8vICksICJPbmx5IGdhbWUgbWFzdGVyIGNhbiBjb25maWd1cmUgcmF0ZSBsaW1pdHMiCiAgICBhc3NlcnQgLy8gT25seSBnYW1lIG1hc3RlciBjYW4gY29uZmlndXJlIHJhdGUgbGltaXRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIzNgogICAgLy8gYXNzZXJ0IGJ1cnN0ID4gMCwgIkJ1cnN0IG11c3QgYmUgYXQgbGVhc3QgMSIKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXJ0IC8vIEJ1cnN0IG11c3QgYmUgYXQgbGVhc3QgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyMzcKICAgIC8vIHNlbGYuc2Vhc29uYWxfcmVpc3N1ZV9pbnRlcnZhbC52YWx1ZSA9IHNlYXNvbmFsX3JlaXNzdWVfaW50ZXJ2YWwKICAgIGJ5dGVjIDkgLy8gInNlYXNvbmFsX3JlaXNzdWVfaW50ZXJ2YWwiCiAgICBmcmFtZV9kaWcgLTMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIzOAogICAgLy8gc2VsZi5jcmFmdF9pbnRlcnZhbC52YWx1ZSA9IGNyYWZ0X2ludGVydmFsCiAgICBieXRlYyAxMCAvLyAiY3JhZnRfaW50ZXJ2YWwiCiAgICBmcmFtZV9kaWcgLTIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjIzOQogICAgLy8gc2VsZi5yYXRlX2xpbWl0X2J1cnN0LnZhbHVlID0gYnVyc3QKICAgIGJ5dGVjIDExIC8vICJyYXRlX2xpbWl0X2J1cnN0IgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5jb25maWd1cmVfZmVlX3Bvb2xpbmcoZW5hYmxlZDogYnl0ZXMpIC0+IHZvaWQ6CmNvbmZpZ3VyZV9mZWVfcG9vbGluZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjQxLTI0MgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY29uZmlndXJlX2ZlZV9wb29saW5nKHNlbGYsIGVuYWJsZWQ6IEJvb2wpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjQ5CiAgICAvLyBUeG4uc2VuZGVyID09IHNlbGYuZ2FtZV9tYXN0ZXIudmFsdWUKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJnYW1lX21hc3RlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nYW1lX21hc3RlciBleGlzdHMKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI0OC0yNTAKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBzZWxmLmdhbWVfbWFzdGVyLnZhbHVlCiAgICAvLyApLCAiT25seSBnYW1lIG1hc3RlciBjYW4gY29uZmlndXJlIGZlZSBwb29saW5nIgogICAgYXNzZXJ0IC8vIE9ubHkgZ2FtZSBtYXN0ZXIgY2FuIGNvbmZpZ3VyZSBmZWUgcG9vbGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNTEKICAgIC8vIHNlbGYucG9vbF9pbm5lcl9mZWVzLnZhbHVlID0gZW5hYmxlZAogICAgYnl0ZWMgMTggLy8gInBvb2xfaW5uZXJfZmVlcyIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uY29udHJhY3QuQWxnb1JlYWxtR2FtZU1hbmFnZXIucmVnaXN0ZXJfcGxheWVyKHBsYXllcl9uYW1lOiBieXRlcykgLT4gYnl0ZXM6CnJlZ2lzdGVyX3BsYXllcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjUzLTI1NAogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiTm9PcCIsICJPcHRJbiJdKQogICAgLy8gZGVmIHJlZ2lzdGVyX3BsYXllcihzZWxmLCBwbGF5ZXJfbmFtZTogU3RyaW5nKSAtPiBTdHJpbmc6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjYwLTI2MQogICAgLy8gIyBDaGVjayBpZiB0aGlzIGlzIGFuIG9wdC1pbiBjYWxsCiAgICAvLyBpZiBUeG4ub25fY29tcGxldGlvbiA9PSBPbkNvbXBsZXRlQWN0aW9uLk9wdEluOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgaW50Y18xIC8vIE9wdEluCiAgICA9PQogICAgYnogcmVnaXN0ZXJfcGxheWVyX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNjItMjYzCiAgICAvLyAjIEluaXRpYWxpemUgZGVmYXVsdCB2YWx1ZXMgZm9yIGxvY2FsIHN0YXRlIHdoZW4gb3B0aW5nIGluCiAgICAvLyBzZWxmLnBsYXllcl9sZXZlbFtUeG4uc2VuZGVyXSA9IFVJbnQ2NCgwKQogICAgdHhuIFNlbmRlcgogICAgYnl0ZWMgMTkgLy8gInBsYXllcl9sZXZlbCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI2NAogICAgLy8gc2VsZi5wbGF5ZXJfZXhwZXJpZW5jZVtUeG4uc2VuZGVyXSA9IFVJbnQ2NCgwKQogICAgdHhuIFNlbmRlcgogICAgYnl0ZWMgMjAgLy8gInBsYXllcl9leHBlcmllbmNlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjY1CiAgICAvLyBzZWxmLnBsYXllcl9yZWNvdmVyeV9jb3VudFtUeG4uc2VuZGVyXSA9IFVJbnQ2NCgwKQogICAgdHhuIFNlbmRlcgogICAgYnl0ZWMgMTIgLy8gInBsYXllcl9yZWNvdmVyeV9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI2NgogICAgLy8gc2VsZi5wbGF5ZXJfc2Vhc29uW1R4bi5zZW5kZXJdID0gc2VsZi5jdXJyZW50X3NlYXNvbi52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gImN1cnJlbnRfc2Vhc29uIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN1cnJlbnRfc2Vhc29uIGV4aXN0cwogICAgdHhuIFNlbmRlcgogICAgYnl0ZWMgMTMgLy8gInBsYXllcl9zZWFzb24iCiAgICB1bmNvdmVyIDIKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjY3CiAgICAvLyBzZWxmLmlzX3JlZ2lzdGVyZWRbVHhuLnNlbmRlcl0gPSBCb29sKEZhbHNlKQogICAgdHhuIFNlbmRlcgogICAgYnl0ZWNfMiAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGJ5dGVjXzEgLy8gMHgwMAogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyNjgKICAgIC8vIHNlbGYuYWN0aW9uX2Nsb2NrW1R4bi5zZW5kZXJdID0gb3AuYnplcm8oQUNUSU9OX0NMT0NLX1NJWkUpCiAgICBpbnRjXzMgLy8gMTYKICAgIGJ6ZXJvCiAgICB0eG4gU2VuZGVyCiAgICBieXRlYyAxNCAvLyAiYWN0aW9uX2Nsb2NrIgogICAgdW5jb3ZlciAyCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI2OQogICAgLy8gcmV0dXJuIFN0cmluZygiT3B0ZWQgaW4gdG8gQWxnb1JlYWxtISIpCiAgICBwdXNoYnl0ZXMgIk9wdGVkIGluIHRvIEFsZ29SZWFsbSEiCiAgICByZXRzdWIKCnJlZ2lzdGVyX3BsYXllcl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI3MS0yNzMKICAgIC8vICMgRm9yIE5vT3AgY2FsbHMsIGhhbmRsZSByZWdpc3RyYXRpb24KICAgIC8vICMgTm93IHdlIGNhbiBzYWZlbHkgYWNjZXNzIGxvY2FsIHN0YXRlIHNpbmNlIGl0IHdhcyBpbml0aWFsaXplZCBvbiBvcHQtaW4KICAgIC8vIGlmIHNlbGYuaXNfcmVnaXN0ZXJlZFtUeG4uc2VuZGVyXToKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJpc19yZWdpc3RlcmVkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXNfcmVnaXN0ZXJlZCBleGlzdHMgZm9yIGFjY291bnQKICAgIGJ5dGVjXzEgLy8gMHgwMAogICAgIT0KICAgIGJ6IHJlZ2lzdGVyX3BsYXllcl9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Mjc0CiAgICAvLyByZXR1cm4gU3RyaW5nKCJQbGF5ZXIgYWxyZWFkeSByZWdpc3RlcmVkIikKICAgIHB1c2hieXRlcyAiUGxheWVyIGFscmVhZHkgcmVnaXN0ZXJlZCIKICAgIHJldHN1YgoKcmVnaXN0ZXJfcGxheWVyX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Mjc2LTI3NwogICAgLy8gIyBDbGFpbSB0aGUgbmFtZTsgdGhlIGhhc2hlZCBrZXkgbWFrZXMgdGhlIHVuaXF1ZW5lc3MgY2hlY2sgb25lIGJveCByZWFkCiAgICAvLyBhc3NlcnQgcGxheWVyX25hbWUuYnl0ZXMubGVuZ3RoID4gMCwgIlBsYXllciBuYW1lIG11c3Qgbm90IGJlIGVtcHR5IgogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGR1cAogICAgYXNzZXJ0IC8vIFBsYXllciBuYW1lIG11c3Qgbm90IGJlIGVtcHR5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI3OQogICAgLy8gcGxheWVyX25hbWUuYnl0ZXMubGVuZ3RoIDw9IE1BWF9QTEFZRVJfTkFNRV9MRU5HVEgKICAgIGR1cAogICAgcHVzaGludCAzMiAvLyAzMgogICAgPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Mjc4LTI4MAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwbGF5ZXJfbmFtZS5ieXRlcy5sZW5ndGggPD0gTUFYX1BMQVlFUl9OQU1FX0xFTkdUSAogICAgLy8gKSwgIlBsYXllciBuYW1lIHRvbyBsb25nIgogICAgYXNzZXJ0IC8vIFBsYXllciBuYW1lIHRvbyBsb25nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI4MQogICAgLy8gbmFtZV9rZXkgPSBvcC5zaGEyNTYocGxheWVyX25hbWUuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTEKICAgIHNoYTI1NgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyODIKICAgIC8vIGFzc2VydCBuYW1lX2tleSBub3QgaW4gc2VsZi5uYW1lX293bmVycywgIlBsYXllciBuYW1lIGFscmVhZHkgdGFrZW4iCiAgICBwdXNoYnl0ZXMgMHg2ZQogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0IC8vIFBsYXllciBuYW1lIGFscmVhZHkgdGFrZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Mjg0LTI4NQogICAgLy8gIyBUaGUgcGF5bWVudCBqdXN0IGJlZm9yZSB0aGlzIGNhbGwgY292ZXJzIHRoZSBNQlIgb2YgYm90aCBuYW1lIGJveGVzCiAgICAvLyBhc3NlcnQgVHhuLmdyb3VwX2luZGV4ID4gMCwgIlJlZ2lzdHJhdGlvbiByZXF1aXJlcyBhbiBNQlIgcGF5bWVudCIKICAgIHR4biBHcm91cEluZGV4CiAgICBhc3NlcnQgLy8gUmVnaXN0cmF0aW9uIHJlcXVpcmVzIGFuIE1CUiBwYXltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI4NgogICAgLy8gbWJyX3BheW1lbnQgPSBndHhuLlBheW1lbnRUcmFuc2FjdGlvbihUeG4uZ3JvdXBfaW5kZXggLSAxKQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI4OAogICAgLy8gbWJyX3BheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZHVwCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI4Ny0yODkKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbWJyX3BheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgIk1CUiBwYXltZW50IG11c3QgZ28gdG8gdGhlIGdhbWUgY29udHJhY3QiCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgbXVzdCBnbyB0byB0aGUgZ2FtZSBjb250cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyOTAKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5zZW5kZXIgPT0gVHhuLnNlbmRlciwgIk1CUiBwYXltZW50IG11c3QgY29tZSBmcm9tIHRoZSBwbGF5ZXIiCiAgICBkdXAKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBNQlIgcGF5bWVudCBtdXN0IGNvbWUgZnJvbSB0aGUgcGxheWVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI5MgogICAgLy8gbWJyX3BheW1lbnQuYW1vdW50CiAgICBndHhucyBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MjkzCiAgICAvLyA+PSBQTEFZRVJfTkFNRV9CT1hfTUJSICsgUExBWUVSX05BTUVfQllURV9NQlIgKiBwbGF5ZXJfbmFtZS5ieXRlcy5sZW5ndGgKICAgIHB1c2hpbnQgNDAwIC8vIDQwMAogICAgdW5jb3ZlciAzCiAgICAqCiAgICBwdXNoaW50IDQ1MDAwIC8vIDQ1MDAwCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI5Mi0yOTMKICAgIC8vIG1icl9wYXltZW50LmFtb3VudAogICAgLy8gPj0gUExBWUVSX05BTUVfQk9YX01CUiArIFBMQVlFUl9OQU1FX0JZVEVfTUJSICogcGxheWVyX25hbWUuYnl0ZXMubGVuZ3RoCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weToyOTEtMjk0CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1icl9wYXltZW50LmFtb3VudAogICAgLy8gICAgID49IFBMQVlFUl9OQU1FX0JPWF9NQlIgKyBQTEFZRVJfTkFNRV9CWVRFX01CUiAqIHBsYXllcl9uYW1lLmJ5dGVzLmxlbmd0aAogICAgLy8gKSwgIkluc3VmZmljaWVudCBNQlIgcGF5bWVudCIKICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgTUJSIHBheW1lbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Mjk1CiAgICAvLyBzZWxmLm5hbWVfb3duZXJzW25hbWVfa2V5XSA9IFR4bi5zZW5kZXIKICAgIHR4biBTZW5kZXIKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Mjk2CiAgICAvLyBzZWxmLnBsYXllcl9uYW1lc1tUeG4uc2VuZGVyXSA9IHBsYXllcl9uYW1lCiAgICBwdXNoYnl0ZXMgMHg2MQogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjI5OC0yOTkKICAgIC8vICMgSW5pdGlhbGl6ZSBwbGF5ZXIgc3RhdHMgZm9yIGFjdHVhbCByZWdpc3RyYXRpb24KICAgIC8vIHNlbGYucGxheWVyX2xldmVsW1R4bi5zZW5kZXJdID0gVUludDY0KDEpCiAgICB0eG4gU2VuZGVyCiAgICBieXRlYyAxOSAvLyAicGxheWVyX2xldmVsIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MzAwCiAgICAvLyBzZWxmLnBsYXllcl9leHBlcmllbmNlW1R4bi5zZW5kZXJdID0gVUludDY0KDApCiAgICB0eG4gU2VuZGVyCiAgICBieXRlYyAyMCAvLyAicGxheWVyX2V4cGVyaWVuY2UiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozMDEKICAgIC8vIHNlbGYucGxheWVyX3JlY292ZXJ5X2NvdW50W1R4bi5zZW5kZXJdID0gVUludDY0KDApCiAgICB0eG4gU2VuZGVyCiAgICBieXRlYyAxMiAvLyAicGxheWVyX3JlY292ZXJ5X2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MzAyCiAgICAvLyBzZWxmLnBsYXllcl9zZWFzb25bVHhuLnNlbmRlcl0gPSBzZWxmLmN1cnJlbnRfc2Vhc29uLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiY3VycmVudF9zZWFzb24iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3VycmVudF9zZWFzb24gZXhpc3RzCiAgICB0eG4gU2VuZGVyCiAgICBieXRlYyAxMyAvLyAicGxheWVyX3NlYXNvbiIKICAgIHVuY292ZXIgMgogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozMDMKICAgIC8vIHNlbGYuaXNfcmVnaXN0ZXJlZFtUeG4uc2VuZGVyXSA9IEJvb2woVHJ1ZSkKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjXzIgLy8gImlzX3JlZ2lzdGVyZWQiCiAgICBwdXNoYnl0ZXMgMHg4MAogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozMDUKICAgIC8vIHNlbGYudG90YWxfcGxheWVycy52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJ0b3RhbF9wbGF5ZXJzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX3BsYXllcnMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgNiAvLyAidG90YWxfcGxheWVycyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjMwNwogICAgLy8gYXJjNC5lbWl0KFBsYXllclJlZ2lzdGVyZWQoQWRkcmVzcyhUeG4uc2VuZGVyKSkpCiAgICBwdXNoYnl0ZXMgMHg1ZTNhZjk1NyAvLyBtZXRob2QgIlBsYXllclJlZ2lzdGVyZWQoYWRkcmVzcykiCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozMDgKICAgIC8vIHJldHVybiBTdHJpbmcoIldlbGNvbWUgdG8gQWxnb1JlYWxtISIpCiAgICBwdXNoYnl0ZXMgIldlbGNvbWUgdG8gQWxnb1JlYWxtISIKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uY29udHJhY3QuQWxnb1JlYWxtR2FtZU1hbmFnZXIucmVzb2x2ZV9uYW1lKHBsYXllcl9uYW1lOiBieXRlcykgLT4gYnl0ZXM6CnJlc29sdmVfbmFtZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MzEwLTMxMQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIHJlc29sdmVfbmFtZShzZWxmLCBwbGF5ZXJfbmFtZTogU3RyaW5nKSAtPiBBZGRyZXNzOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjMxNQogICAgLy8gb3Auc2hhMjU2KHBsYXllcl9uYW1lLmJ5dGVzKSwgZGVmYXVsdD1HbG9iYWwuemVyb19hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIHNoYTI1NgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozMTQKICAgIC8vIHNlbGYubmFtZV9vd25lcnMuZ2V0KAogICAgcHVzaGJ5dGVzIDB4NmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MzE0LTMxNgogICAgLy8gc2VsZi5uYW1lX293bmVycy5nZXQoCiAgICAvLyAgICAgb3Auc2hhMjU2KHBsYXllcl9uYW1lLmJ5dGVzKSwgZGVmYXVsdD1HbG9iYWwuemVyb19hZGRyZXNzCiAgICAvLyApCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MzE1CiAgICAvLyBvcC5zaGEyNTYocGxheWVyX25hbWUuYnl0ZXMpLCBkZWZhdWx0PUdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozMTQtMzE2CiAgICAvLyBzZWxmLm5hbWVfb3duZXJzLmdldCgKICAgIC8vICAgICBvcC5zaGEyNTYocGxheWVyX25hbWUuYnl0ZXMpLCBkZWZhdWx0PUdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIC8vICkKICAgIHN3YXAKICAgIGJveF9nZXQKICAgIHNlbGVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozMTMtMzE3CiAgICAvLyByZXR1cm4gQWRkcmVzcygKICAgIC8vICAgICBzZWxmLm5hbWVfb3duZXJzLmdldCgKICAgIC8vICAgICAgICAgb3Auc2hhMjU2KHBsYXllcl9uYW1lLmJ5dGVzKSwgZGVmYXVsdD1HbG9iYWwuemVyb19hZGRyZXNzCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5uYW1lX29mKHBsYXllcjogYnl0ZXMpIC0+IGJ5dGVzOgpuYW1lX29mOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozMTktMzIwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgbmFtZV9vZihzZWxmLCBwbGF5ZXI6IEFjY291bnQpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozMjIKICAgIC8vIHJldHVybiBzZWxmLnBsYXllcl9uYW1lcy5nZXQocGxheWVyLCBkZWZhdWx0PVN0cmluZygpKQogICAgcHVzaGJ5dGVzIDB4NjEKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBwdXNoYnl0ZXMgIiIKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5jcmVhdGVfZ2FtZV9pdGVtKHJlY2lwaWVudDogYnl0ZXMsIGl0ZW1fbmFtZTogYnl0ZXMsIGl0ZW1fdHlwZTogYnl0ZXMsIHJhcml0eTogYnl0ZXMsIGF0dGFja19wb3dlcjogdWludDY0LCBkZWZlbnNlX3Bvd2VyOiB1aW50NjQsIHNwZWNpYWxfZWZmZWN0OiBieXRlcykgLT4gdWludDY0OgpjcmVhdGVfZ2FtZV9pdGVtOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozMjQtMzM0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjcmVhdGVfZ2FtZV9pdGVtKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcmVjaXBpZW50OiBBY2NvdW50LAogICAgLy8gICAgIGl0ZW1fbmFtZTogU3RyaW5nLAogICAgLy8gICAgIGl0ZW1fdHlwZTogU3RyaW5nLAogICAgLy8gICAgIHJhcml0eTogU3RyaW5nLAogICAgLy8gICAgIGF0dGFja19wb3dlcjogVUludDY0LAogICAgLy8gICAgIGRlZmVuc2VfcG93ZXI6IFVJbnQ2NCwKICAgIC8vICAgICBzcGVjaWFsX2VmZmVjdDogU3RyaW5nLAogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byA3IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MzM2LTM0NAogICAgLy8gcmV0dXJuIHNlbGYuX2NyZWF0ZV9nYW1lX2l0ZW0oCiAgICAvLyAgICAgcmVjaXBpZW50LAogICAgLy8gICAgIGl0ZW1fbmFtZSwKICAgIC8vICAgICBpdGVtX3R5cGUsCiAgICAvLyAgICAgcmFyaXR5LAogICAgLy8gICAgIGF0dGFja19wb3dlciwKICAgIC8vICAgICBkZWZlbnNlX3Bvd2VyLAogICAgLy8gICAgIHNwZWNpYWxfZWZmZWN0LAogICAgLy8gKQogICAgZnJhbWVfZGlnIC03CiAgICBmcmFtZV9kaWcgLTYKICAgIGZyYW1lX2RpZyAtNQogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9jcmVhdGVfZ2FtZV9pdGVtCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLmNyZWF0ZV9nYW1lX2l0ZW1fd2l0aF9rZXkocmVxdWVzdF9rZXk6IGJ5dGVzLCByZWNpcGllbnQ6IGJ5dGVzLCBpdGVtX25hbWU6IGJ5dGVzLCBpdGVtX3R5cGU6IGJ5dGVzLCByYXJpdHk6IGJ5dGVzLCBhdHRhY2tfcG93ZXI6IHVpbnQ2NCwgZGVmZW5zZV9wb3dlcjogdWludDY0LCBzcGVjaWFsX2VmZmVjdDogYnl0ZXMpIC0+IHVpbnQ2NDoKY3JlYXRlX2dhbWVfaXRlbV93aXRoX2tleToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6MzQ2LTM1NwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY3JlYXRlX2dhbWVfaXRlbV93aXRoX2tleSgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHJlcXVlc3Rfa2V5OiBCeXRlcywKICAgIC8vICAgICByZWNpcGllbnQ6IEFjY291bnQsCiAgICAvLyAgICAgaXRlbV9uYW1lOiBTdHJpbmcsCiAgICAvLyAgICAgaXRlbV90eXBlOiBTdHJpbmcsCiAgICAvLyAgICAgcmFyaXR5OiBTdHJpbmcsCiAgICAvLyAgICAgYXR0YWNrX3Bvd2VyOiBVSW50NjQsCiAgICAvLyAgICAgZGVmZW5zZV9wb3dlcjogVUludDY0LAogICAgLy8gICAgIHNwZWNpYWxfZWZmZWN0OiBTdHJpbmcsCiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDggMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozNjIKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuZ2FtZV9tYXN0ZXIudmFsdWUsICJPbmx5IGdhbWUgbWFzdGVyIGNhbiBjcmVhdGUgaXRlbXMiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiZ2FtZV9tYXN0ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2FtZV9tYXN0ZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgZ2FtZSBtYXN0ZXIgY2FuIGNyZWF0ZSBpdGVtcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozNjMKICAgIC8vIGFzc2VydCByZXF1ZXN0X2tleSAhPSBCeXRlcygpLCAiTXVzdCBwcm92aWRlIGEgcmVxdWVzdCBrZXkiCiAgICBmcmFtZV9kaWcgLTgKICAgIHB1c2hieXRlcyAweAogICAgIT0KICAgIGFzc2VydCAvLyBNdXN0IHByb3ZpZGUgYSByZXF1ZXN0IGtleQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozNjQKICAgIC8vIGtleSA9IG9wLnNoYTI1NihyZXF1ZXN0X2tleSkKICAgIGZyYW1lX2RpZyAtOAogICAgc2hhMjU2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjM2NQogICAgLy8gbWludGVkX2l0ZW0sIGV4aXN0cyA9IHNlbGYubWludGVkX3JlcXVlc3RzLm1heWJlKGtleSkKICAgIHB1c2hieXRlcyAweDcyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozNjYKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IGNyZWF0ZV9nYW1lX2l0ZW1fd2l0aF9rZXlfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjM2NwogICAgLy8gcmV0dXJuIG1pbnRlZF9pdGVtCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmNyZWF0ZV9nYW1lX2l0ZW1fd2l0aF9rZXlfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozNjktMzc3CiAgICAvLyBpdGVtX2lkID0gc2VsZi5fY3JlYXRlX2dhbWVfaXRlbSgKICAgIC8vICAgICByZWNpcGllbnQsCiAgICAvLyAgICAgaXRlbV9uYW1lLAogICAgLy8gICAgIGl0ZW1fdHlwZSwKICAgIC8vICAgICByYXJpdHksCiAgICAvLyAgICAgYXR0YWNrX3Bvd2VyLAogICAgLy8gICAgIGRlZmVuc2VfcG93ZXIsCiAgICAvLyAgICAgc3BlY2lhbF9lZmZlY3QsCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTcKICAgIGZyYW1lX2RpZyAtNgogICAgZnJhbWVfZGlnIC01CiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2NyZWF0ZV9nYW1lX2l0ZW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Mzc4CiAgICAvLyBzZWxmLm1pbnRlZF9yZXF1ZXN0c1trZXldID0gaXRlbV9pZAogICAgZHVwCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozNzkKICAgIC8vIHJldHVybiBpdGVtX2lkCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uY29udHJhY3QuQWxnb1JlYWxtR2FtZU1hbmFnZXIuZ2V0X21pbnRlZF9pdGVtKHJlcXVlc3Rfa2V5OiBieXRlcykgLT4gdWludDY0OgpnZXRfbWludGVkX2l0ZW06CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjM4MS0zODIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfbWludGVkX2l0ZW0oc2VsZiwgcmVxdWVzdF9rZXk6IEJ5dGVzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Mzg0CiAgICAvLyByZXR1cm4gc2VsZi5taW50ZWRfcmVxdWVzdHMuZ2V0KG9wLnNoYTI1NihyZXF1ZXN0X2tleSksIGRlZmF1bHQ9VUludDY0KDApKQogICAgZnJhbWVfZGlnIC0xCiAgICBzaGEyNTYKICAgIHB1c2hieXRlcyAweDcyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5fY3JlYXRlX2dhbWVfaXRlbShyZWNpcGllbnQ6IGJ5dGVzLCBpdGVtX25hbWU6IGJ5dGVzLCBpdGVtX3R5cGU6IGJ5dGVzLCByYXJpdHk6IGJ5dGVzLCBhdHRhY2tfcG93ZXI6IHVpbnQ2NCwgZGVmZW5zZV9wb3dlcjogdWludDY0LCBzcGVjaWFsX2VmZmVjdDogYnl0ZXMpIC0+IHVpbnQ2NDoKX2NyZWF0ZV9nYW1lX2l0ZW06CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjM4Ni0zOTYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2NyZWF0ZV9nYW1lX2l0ZW0oCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICByZWNpcGllbnQ6IEFjY291bnQsCiAgICAvLyAgICAgaXRlbV9uYW1lOiBTdHJpbmcsCiAgICAvLyAgICAgaXRlbV90eXBlOiBTdHJpbmcsCiAgICAvLyAgICAgcmFyaXR5OiBTdHJpbmcsCiAgICAvLyAgICAgYXR0YWNrX3Bvd2VyOiBVSW50NjQsCiAgICAvLyAgICAgZGVmZW5zZV9wb3dlcjogVUludDY0LAogICAgLy8gICAgIHNwZWNpYWxfZWZmZWN0OiBTdHJpbmcsCiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDcgMQogICAgaW50Y18wIC8vIDAKICAgIGR1cG4gMwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozOTcKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuZ2FtZV9tYXN0ZXIudmFsdWUsICJPbmx5IGdhbWUgbWFzdGVyIGNhbiBjcmVhdGUgaXRlbXMiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiZ2FtZV9tYXN0ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2FtZV9tYXN0ZXIgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgZ2FtZSBtYXN0ZXIgY2FuIGNyZWF0ZSBpdGVtcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTozOTgKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlZ2lzdGVyZWRbcmVjaXBpZW50XSwgIlJlY2lwaWVudCBtdXN0IGJlIHJlZ2lzdGVyZWQgcGxheWVyIgogICAgZnJhbWVfZGlnIC03CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX3JlZ2lzdGVyZWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBieXRlY18xIC8vIDB4MDAKICAgICE9CiAgICBhc3NlcnQgLy8gUmVjaXBpZW50IG11c3QgYmUgcmVnaXN0ZXJlZCBwbGF5ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDAwCiAgICAvLyBhc3NlcnQgYXR0YWNrX3Bvd2VyIDw9IE1BWF9JVEVNX1NUQVQsICJBdHRhY2sgcG93ZXIgZG9lcyBub3QgZml0IGluIHVpbnQxNiIKICAgIGZyYW1lX2RpZyAtMwogICAgaW50YyA0IC8vIDY1NTM1CiAgICA8PQogICAgYXNzZXJ0IC8vIEF0dGFjayBwb3dlciBkb2VzIG5vdCBmaXQgaW4gdWludDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQwMQogICAgLy8gYXNzZXJ0IGRlZmVuc2VfcG93ZXIgPD0gTUFYX0lURU1fU1RBVCwgIkRlZmVuc2UgcG93ZXIgZG9lcyBub3QgZml0IGluIHVpbnQxNiIKICAgIGZyYW1lX2RpZyAtMgogICAgaW50YyA0IC8vIDY1NTM1CiAgICA8PQogICAgYXNzZXJ0IC8vIERlZmVuc2UgcG93ZXIgZG9lcyBub3QgZml0IGluIHVpbnQxNgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4MDgKICAgIC8vIGlmIGl0ZW1fdHlwZSA9PSAid2VhcG9uIiBvciBpdGVtX3R5cGUgPT0gIldlYXBvbiI6CiAgICBmcmFtZV9kaWcgLTUKICAgIHB1c2hieXRlcyAid2VhcG9uIgogICAgPT0KICAgIGJueiBfY3JlYXRlX2dhbWVfaXRlbV9pZl9ib2R5QDQKICAgIGZyYW1lX2RpZyAtNQogICAgcHVzaGJ5dGVzICJXZWFwb24iCiAgICA9PQogICAgYnogX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaWZfZWxzZUA1CgpfY3JlYXRlX2dhbWVfaXRlbV9pZl9ib2R5QDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjgwOQogICAgLy8gcmV0dXJuIFVJbnQ2NChJVEVNX1RZUEVfV0VBUE9OKQogICAgaW50Y18xIC8vIDEKCl9jcmVhdGVfZ2FtZV9pdGVtX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5faXRlbV90eXBlX2NvZGVAMTk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQwMwogICAgLy8gaXRlbV90eXBlPWFyYzQuVUludDgoc2VsZi5faXRlbV90eXBlX2NvZGUoaXRlbV90eXBlKSksCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCA4IC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODIyCiAgICAvLyBpZiByYXJpdHkgPT0gImNvbW1vbiIgb3IgcmFyaXR5ID09ICJDb21tb24iOgogICAgZnJhbWVfZGlnIC00CiAgICBwdXNoYnl0ZXMgImNvbW1vbiIKICAgID09CiAgICBibnogX2NyZWF0ZV9nYW1lX2l0ZW1faWZfYm9keUAyMgogICAgZnJhbWVfZGlnIC00CiAgICBwdXNoYnl0ZXMgIkNvbW1vbiIKICAgID09CiAgICBieiBfY3JlYXRlX2dhbWVfaXRlbV9hZnRlcl9pZl9lbHNlQDIzCgpfY3JlYXRlX2dhbWVfaXRlbV9pZl9ib2R5QDIyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4MjMKICAgIC8vIHJldHVybiBVSW50NjQoUkFSSVRZX0NPTU1PTikKICAgIGludGNfMSAvLyAxCgpfY3JlYXRlX2dhbWVfaXRlbV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uY29udHJhY3QuQWxnb1JlYWxtR2FtZU1hbmFnZXIuX3Jhcml0eV9jb2RlQDM0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MDQKICAgIC8vIHJhcml0eT1hcmM0LlVJbnQ4KHNlbGYuX3Jhcml0eV9jb2RlKHJhcml0eSkpLAogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIHB1c2hpbnQgOCAvLyA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgZnJhbWVfYnVyeSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQwNQogICAgLy8gYXR0YWNrX3Bvd2VyPWFyYzQuVUludDE2KGF0dGFja19wb3dlciksCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzMgLy8gMTYKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDA2CiAgICAvLyBkZWZlbnNlX3Bvd2VyPWFyYzQuVUludDE2KGRlZmVuc2VfcG93ZXIpLAogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18zIC8vIDE2CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojc5MwogICAgLy8gaWYgZWZmZWN0ID09ICIiOgogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoYnl0ZXMgIiIKICAgID09CiAgICBieiBfY3JlYXRlX2dhbWVfaXRlbV9hZnRlcl9pZl9lbHNlQDM3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojc5NAogICAgLy8gcmV0dXJuIFVJbnQ2NChOT19FRkZFQ1QpCiAgICBpbnRjXzAgLy8gMAoKX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLl9pbnRlcm5fZWZmZWN0QDQwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MDcKICAgIC8vIGVmZmVjdF9pZD1hcmM0LlVJbnQxNihzZWxmLl9pbnRlcm5fZWZmZWN0KHNwZWNpYWxfZWZmZWN0KSksCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18zIC8vIDE2CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDYgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MTAKICAgIC8vIG9yaWdpbmFsX2NyZWF0aW9uX3RpbWU9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MDItNDExCiAgICAvLyBtZXRhZGF0YSA9IEl0ZW1NZXRhZGF0YSgKICAgIC8vICAgICBpdGVtX3R5cGU9YXJjNC5VSW50OChzZWxmLl9pdGVtX3R5cGVfY29kZShpdGVtX3R5cGUpKSwKICAgIC8vICAgICByYXJpdHk9YXJjNC5VSW50OChzZWxmLl9yYXJpdHlfY29kZShyYXJpdHkpKSwKICAgIC8vICAgICBhdHRhY2tfcG93ZXI9YXJjNC5VSW50MTYoYXR0YWNrX3Bvd2VyKSwKICAgIC8vICAgICBkZWZlbnNlX3Bvd2VyPWFyYzQuVUludDE2KGRlZmVuc2VfcG93ZXIpLAogICAgLy8gICAgIGVmZmVjdF9pZD1hcmM0LlVJbnQxNihzZWxmLl9pbnRlcm5fZWZmZWN0KHNwZWNpYWxfZWZmZWN0KSksCiAgICAvLyAgICAgaXNfcmVjb3ZlcmVkPWFyYzQuQm9vbChGYWxzZSksCiAgICAvLyAgICAgcmVjb3ZlcnlfY291bnQ9YXJjNC5VSW50OCgwKSwKICAgIC8vICAgICBvcmlnaW5hbF9jcmVhdGlvbl90aW1lPWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMwogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMQogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MDgKICAgIC8vIGlzX3JlY292ZXJlZD1hcmM0LkJvb2woRmFsc2UpLAogICAgYnl0ZWNfMSAvLyAweDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQwMi00MTEKICAgIC8vIG1ldGFkYXRhID0gSXRlbU1ldGFkYXRhKAogICAgLy8gICAgIGl0ZW1fdHlwZT1hcmM0LlVJbnQ4KHNlbGYuX2l0ZW1fdHlwZV9jb2RlKGl0ZW1fdHlwZSkpLAogICAgLy8gICAgIHJhcml0eT1hcmM0LlVJbnQ4KHNlbGYuX3Jhcml0eV9jb2RlKHJhcml0eSkpLAogICAgLy8gICAgIGF0dGFja19wb3dlcj1hcmM0LlVJbnQxNihhdHRhY2tfcG93ZXIpLAogICAgLy8gICAgIGRlZmVuc2VfcG93ZXI9YXJjNC5VSW50MTYoZGVmZW5zZV9wb3dlciksCiAgICAvLyAgICAgZWZmZWN0X2lkPWFyYzQuVUludDE2KHNlbGYuX2ludGVybl9lZmZlY3Qoc3BlY2lhbF9lZmZlY3QpKSwKICAgIC8vICAgICBpc19yZWNvdmVyZWQ9YXJjNC5Cb29sKEZhbHNlKSwKICAgIC8vICAgICByZWNvdmVyeV9jb3VudD1hcmM0LlVJbnQ4KDApLAogICAgLy8gICAgIG9yaWdpbmFsX2NyZWF0aW9uX3RpbWU9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQwOQogICAgLy8gcmVjb3ZlcnlfY291bnQ9YXJjNC5VSW50OCgwKSwKICAgIGJ5dGVjXzEgLy8gMHgwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MDItNDExCiAgICAvLyBtZXRhZGF0YSA9IEl0ZW1NZXRhZGF0YSgKICAgIC8vICAgICBpdGVtX3R5cGU9YXJjNC5VSW50OChzZWxmLl9pdGVtX3R5cGVfY29kZShpdGVtX3R5cGUpKSwKICAgIC8vICAgICByYXJpdHk9YXJjNC5VSW50OChzZWxmLl9yYXJpdHlfY29kZShyYXJpdHkpKSwKICAgIC8vICAgICBhdHRhY2tfcG93ZXI9YXJjNC5VSW50MTYoYXR0YWNrX3Bvd2VyKSwKICAgIC8vICAgICBkZWZlbnNlX3Bvd2VyPWFyYzQuVUludDE2KGRlZmVuc2VfcG93ZXIpLAogICAgLy8gICAgIGVmZmVjdF9pZD1hcmM0LlVJbnQxNihzZWxmLl9pbnRlcm5fZWZmZWN0KHNwZWNpYWxfZWZmZWN0KSksCiAgICAvLyAgICAgaXNfcmVjb3ZlcmVkPWFyYzQuQm9vbChGYWxzZSksCiAgICAvLyAgICAgcmVjb3ZlcnlfY291bnQ9YXJjNC5VSW50OCgwKSwKICAgIC8vICAgICBvcmlnaW5hbF9jcmVhdGlvbl90aW1lPWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQxNC00MjcKICAgIC8vIGl0ZW1fYXNhID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBhc3NldF9uYW1lPWl0ZW1fbmFtZSwKICAgIC8vICAgICB1bml0X25hbWU9aXRlbV91bml0X25hbWUsCiAgICAvLyAgICAgdG90YWw9VUludDY0KDEpLCAgIyBVbmlxdWUgaXRlbQogICAgLy8gICAgIGRlY2ltYWxzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPXNlbGYuX2lubmVyX2ZlZSgpLAogICAgLy8gICAgICMgVGhlIHNhbWUgY29tcGFjdCByZWNvcmQsIHNvIGluZGV4ZXJzIG5lZWQgbm8gYm94IHJlYWRzCiAgICAvLyAgICAgbm90ZT1CeXRlcyhJVEVNX05PVEVfUFJFRklYKSArIG1ldGFkYXRhLmJ5dGVzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MjQKICAgIC8vIGZlZT1zZWxmLl9pbm5lcl9mZWUoKSwKICAgIGNhbGxzdWIgX2lubmVyX2ZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MjAKICAgIC8vIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQyMS00MjMKICAgIC8vIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGR1cG4gMwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MjUtNDI2CiAgICAvLyAjIFRoZSBzYW1lIGNvbXBhY3QgcmVjb3JkLCBzbyBpbmRleGVycyBuZWVkIG5vIGJveCByZWFkcwogICAgLy8gbm90ZT1CeXRlcyhJVEVNX05PVEVfUFJFRklYKSArIG1ldGFkYXRhLmJ5dGVzLAogICAgcHVzaGJ5dGVzIDB4NDk1NDQ1NGQ1ZgogICAgZGlnIDYKICAgIGNvbmNhdAogICAgaXR4bl9maWVsZCBOb3RlCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0Q2xhd2JhY2sKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRGcmVlemUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRSZXNlcnZlCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TWFuYWdlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MTkKICAgIC8vIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWZhdWx0RnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQxOAogICAgLy8gZGVjaW1hbHM9VUludDY0KDApLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWNpbWFscwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MTcKICAgIC8vIHRvdGFsPVVJbnQ2NCgxKSwgICMgVW5pcXVlIGl0ZW0KICAgIGludGNfMSAvLyAxCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDEzCiAgICAvLyBpdGVtX3VuaXRfbmFtZSA9IFN0cmluZygiQUxHSVRFTSIpCiAgICBwdXNoYnl0ZXMgIkFMR0lURU0iCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VW5pdE5hbWUKICAgIGZyYW1lX2RpZyAtNgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDE0CiAgICAvLyBpdGVtX2FzYSA9IGl0eG4uQXNzZXRDb25maWcoCiAgICBpbnRjXzIgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDE0LTQyNwogICAgLy8gaXRlbV9hc2EgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGFzc2V0X25hbWU9aXRlbV9uYW1lLAogICAgLy8gICAgIHVuaXRfbmFtZT1pdGVtX3VuaXRfbmFtZSwKICAgIC8vICAgICB0b3RhbD1VSW50NjQoMSksICAjIFVuaXF1ZSBpdGVtCiAgICAvLyAgICAgZGVjaW1hbHM9VUludDY0KDApLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9c2VsZi5faW5uZXJfZmVlKCksCiAgICAvLyAgICAgIyBUaGUgc2FtZSBjb21wYWN0IHJlY29yZCwgc28gaW5kZXhlcnMgbmVlZCBubyBib3ggcmVhZHMKICAgIC8vICAgICBub3RlPUJ5dGVzKElURU1fTk9URV9QUkVGSVgpICsgbWV0YWRhdGEuYnl0ZXMsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXNzZXRJRAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MjgKICAgIC8vIHNlbGYuaXRlbV9tZXRhZGF0YVtpdGVtX2FzYS5jcmVhdGVkX2Fzc2V0LmlkXSA9IG1ldGFkYXRhLmNvcHkoKQogICAgZHVwCiAgICBpdG9iCiAgICBieXRlYyA1IC8vIDB4NmQKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MzMKICAgIC8vIHNlbGYudG90YWxfaXRlbXNfY3JlYXRlZC52YWx1ZSArPSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJ0b3RhbF9pdGVtc19jcmVhdGVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2l0ZW1zX2NyZWF0ZWQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgNyAvLyAidG90YWxfaXRlbXNfY3JlYXRlZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQzNi00NDAKICAgIC8vIEl0ZW1NaW50ZWQoCiAgICAvLyAgICAgYXJjNC5VSW50NjQoaXRlbV9hc2EuY3JlYXRlZF9hc3NldC5pZCksCiAgICAvLyAgICAgQWRkcmVzcyhyZWNpcGllbnQpLAogICAgLy8gICAgIGFyYzQuVUludDgoSVRFTV9TT1VSQ0VfQ1JFQVRFRCksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTcKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MzkKICAgIC8vIGFyYzQuVUludDgoSVRFTV9TT1VSQ0VfQ1JFQVRFRCksCiAgICBwdXNoYnl0ZXMgMHgwMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MzYtNDQwCiAgICAvLyBJdGVtTWludGVkKAogICAgLy8gICAgIGFyYzQuVUludDY0KGl0ZW1fYXNhLmNyZWF0ZWRfYXNzZXQuaWQpLAogICAgLy8gICAgIEFkZHJlc3MocmVjaXBpZW50KSwKICAgIC8vICAgICBhcmM0LlVJbnQ4KElURU1fU09VUkNFX0NSRUFURUQpLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQzNS00NDEKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBJdGVtTWludGVkKAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChpdGVtX2FzYS5jcmVhdGVkX2Fzc2V0LmlkKSwKICAgIC8vICAgICAgICAgQWRkcmVzcyhyZWNpcGllbnQpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ4KElURU1fU09VUkNFX0NSRUFURUQpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIGJ5dGVjIDIxIC8vIG1ldGhvZCAiSXRlbU1pbnRlZCh1aW50NjQsYWRkcmVzcyx1aW50OCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0NDIKICAgIC8vIHJldHVybiBpdGVtX2FzYS5jcmVhdGVkX2Fzc2V0LmlkCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaWZfZWxzZUAzNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Nzk1CiAgICAvLyBlZmZlY3Rfa2V5ID0gb3Auc2hhMjU2KGVmZmVjdC5ieXRlcykKICAgIGZyYW1lX2RpZyAtMQogICAgc2hhMjU2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojc5NgogICAgLy8gaWYgZWZmZWN0X2tleSBpbiBzZWxmLmVmZmVjdF9pZHM6CiAgICBwdXNoYnl0ZXMgMHg2OQogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaWZfZWxzZUAzOQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3OTcKICAgIC8vIHJldHVybiBzZWxmLmVmZmVjdF9pZHNbZWZmZWN0X2tleV0KICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmVmZmVjdF9pZHMgZW50cnkgZXhpc3RzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQwNwogICAgLy8gZWZmZWN0X2lkPWFyYzQuVUludDE2KHNlbGYuX2ludGVybl9lZmZlY3Qoc3BlY2lhbF9lZmZlY3QpKSwKICAgIGIgX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLl9pbnRlcm5fZWZmZWN0QDQwCgpfY3JlYXRlX2dhbWVfaXRlbV9hZnRlcl9pZl9lbHNlQDM5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3OTkKICAgIC8vIGVmZmVjdF9pZCA9IHNlbGYudG90YWxfZWZmZWN0cy52YWx1ZSArIDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNyAvLyAidG90YWxfZWZmZWN0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9lZmZlY3RzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODAwCiAgICAvLyBhc3NlcnQgZWZmZWN0X2lkIDw9IE1BWF9JVEVNX1NUQVQsICJFZmZlY3QgdGFibGUgaXMgZnVsbCIKICAgIGR1cAogICAgaW50YyA0IC8vIDY1NTM1CiAgICA8PQogICAgYXNzZXJ0IC8vIEVmZmVjdCB0YWJsZSBpcyBmdWxsCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjgwMQogICAgLy8gc2VsZi50b3RhbF9lZmZlY3RzLnZhbHVlID0gZWZmZWN0X2lkCiAgICBieXRlYyAxNyAvLyAidG90YWxfZWZmZWN0cyIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4MDIKICAgIC8vIHNlbGYuZWZmZWN0X2lkc1tlZmZlY3Rfa2V5XSA9IGVmZmVjdF9pZAogICAgZHVwCiAgICBpdG9iCiAgICB1bmNvdmVyIDIKICAgIGRpZyAxCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjgwMwogICAgLy8gc2VsZi5lZmZlY3RfdGFibGVbZWZmZWN0X2lkXSA9IGVmZmVjdAogICAgcHVzaGJ5dGVzIDB4NjUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGZyYW1lX2RpZyAtMQogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MDcKICAgIC8vIGVmZmVjdF9pZD1hcmM0LlVJbnQxNihzZWxmLl9pbnRlcm5fZWZmZWN0KHNwZWNpYWxfZWZmZWN0KSksCiAgICBiIF9jcmVhdGVfZ2FtZV9pdGVtX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5faW50ZXJuX2VmZmVjdEA0MAoKX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaWZfZWxzZUAyMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODI0CiAgICAvLyBpZiByYXJpdHkgPT0gInJhcmUiIG9yIHJhcml0eSA9PSAiUmFyZSI6CiAgICBmcmFtZV9kaWcgLTQKICAgIHB1c2hieXRlcyAicmFyZSIKICAgID09CiAgICBibnogX2NyZWF0ZV9nYW1lX2l0ZW1faWZfYm9keUAyNQogICAgZnJhbWVfZGlnIC00CiAgICBwdXNoYnl0ZXMgIlJhcmUiCiAgICA9PQogICAgYnogX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaWZfZWxzZUAyNgoKX2NyZWF0ZV9nYW1lX2l0ZW1faWZfYm9keUAyNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODI1CiAgICAvLyByZXR1cm4gVUludDY0KFJBUklUWV9SQVJFKQogICAgcHVzaGludCAyIC8vIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDA0CiAgICAvLyByYXJpdHk9YXJjNC5VSW50OChzZWxmLl9yYXJpdHlfY29kZShyYXJpdHkpKSwKICAgIGIgX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLl9yYXJpdHlfY29kZUAzNAoKX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaWZfZWxzZUAyNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODI2CiAgICAvLyBpZiByYXJpdHkgPT0gImVwaWMiIG9yIHJhcml0eSA9PSAiRXBpYyI6CiAgICBmcmFtZV9kaWcgLTQKICAgIHB1c2hieXRlcyAiZXBpYyIKICAgID09CiAgICBibnogX2NyZWF0ZV9nYW1lX2l0ZW1faWZfYm9keUAyOAogICAgZnJhbWVfZGlnIC00CiAgICBwdXNoYnl0ZXMgIkVwaWMiCiAgICA9PQogICAgYnogX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaWZfZWxzZUAyOQoKX2NyZWF0ZV9nYW1lX2l0ZW1faWZfYm9keUAyODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODI3CiAgICAvLyByZXR1cm4gVUludDY0KFJBUklUWV9FUElDKQogICAgaW50Y18yIC8vIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDA0CiAgICAvLyByYXJpdHk9YXJjNC5VSW50OChzZWxmLl9yYXJpdHlfY29kZShyYXJpdHkpKSwKICAgIGIgX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLl9yYXJpdHlfY29kZUAzNAoKX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaWZfZWxzZUAyOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODI4CiAgICAvLyBhc3NlcnQgcmFyaXR5ID09ICJsZWdlbmRhcnkiIG9yIHJhcml0eSA9PSAiTGVnZW5kYXJ5IiwgIlVua25vd24gcmFyaXR5IgogICAgZnJhbWVfZGlnIC00CiAgICBwdXNoYnl0ZXMgImxlZ2VuZGFyeSIKICAgID09CiAgICBibnogX2NyZWF0ZV9nYW1lX2l0ZW1fYm9vbF90cnVlQDMxCiAgICBmcmFtZV9kaWcgLTQKICAgIHB1c2hieXRlcyAiTGVnZW5kYXJ5IgogICAgPT0KICAgIGJ6IF9jcmVhdGVfZ2FtZV9pdGVtX2Jvb2xfZmFsc2VAMzIKCl9jcmVhdGVfZ2FtZV9pdGVtX2Jvb2xfdHJ1ZUAzMToKICAgIGludGNfMSAvLyAxCgpfY3JlYXRlX2dhbWVfaXRlbV9ib29sX21lcmdlQDMzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4MjgKICAgIC8vIGFzc2VydCByYXJpdHkgPT0gImxlZ2VuZGFyeSIgb3IgcmFyaXR5ID09ICJMZWdlbmRhcnkiLCAiVW5rbm93biByYXJpdHkiCiAgICBhc3NlcnQgLy8gVW5rbm93biByYXJpdHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODI5CiAgICAvLyByZXR1cm4gVUludDY0KFJBUklUWV9MRUdFTkRBUlkpCiAgICBwdXNoaW50IDQgLy8gNAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MDQKICAgIC8vIHJhcml0eT1hcmM0LlVJbnQ4KHNlbGYuX3Jhcml0eV9jb2RlKHJhcml0eSkpLAogICAgYiBfY3JlYXRlX2dhbWVfaXRlbV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uY29udHJhY3QuQWxnb1JlYWxtR2FtZU1hbmFnZXIuX3Jhcml0eV9jb2RlQDM0CgpfY3JlYXRlX2dhbWVfaXRlbV9ib29sX2ZhbHNlQDMyOgogICAgaW50Y18wIC8vIDAKICAgIGIgX2NyZWF0ZV9nYW1lX2l0ZW1fYm9vbF9tZXJnZUAzMwoKX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4MTAKICAgIC8vIGlmIGl0ZW1fdHlwZSA9PSAiYXJtb3IiIG9yIGl0ZW1fdHlwZSA9PSAiQXJtb3IiOgogICAgZnJhbWVfZGlnIC01CiAgICBwdXNoYnl0ZXMgImFybW9yIgogICAgPT0KICAgIGJueiBfY3JlYXRlX2dhbWVfaXRlbV9pZl9ib2R5QDcKICAgIGZyYW1lX2RpZyAtNQogICAgcHVzaGJ5dGVzICJBcm1vciIKICAgID09CiAgICBieiBfY3JlYXRlX2dhbWVfaXRlbV9hZnRlcl9pZl9lbHNlQDgKCl9jcmVhdGVfZ2FtZV9pdGVtX2lmX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODExCiAgICAvLyByZXR1cm4gVUludDY0KElURU1fVFlQRV9BUk1PUikKICAgIHB1c2hpbnQgMiAvLyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQwMwogICAgLy8gaXRlbV90eXBlPWFyYzQuVUludDgoc2VsZi5faXRlbV90eXBlX2NvZGUoaXRlbV90eXBlKSksCiAgICBiIF9jcmVhdGVfZ2FtZV9pdGVtX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5faXRlbV90eXBlX2NvZGVAMTkKCl9jcmVhdGVfZ2FtZV9pdGVtX2FmdGVyX2lmX2Vsc2VAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODEyCiAgICAvLyBpZiBpdGVtX3R5cGUgPT0gImNvbnN1bWFibGUiIG9yIGl0ZW1fdHlwZSA9PSAiQ29uc3VtYWJsZSI6CiAgICBmcmFtZV9kaWcgLTUKICAgIHB1c2hieXRlcyAiY29uc3VtYWJsZSIKICAgID09CiAgICBibnogX2NyZWF0ZV9nYW1lX2l0ZW1faWZfYm9keUAxMAogICAgZnJhbWVfZGlnIC01CiAgICBwdXNoYnl0ZXMgIkNvbnN1bWFibGUiCiAgICA9PQogICAgYnogX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaWZfZWxzZUAxMQoKX2NyZWF0ZV9nYW1lX2l0ZW1faWZfYm9keUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODEzCiAgICAvLyByZXR1cm4gVUludDY0KElURU1fVFlQRV9DT05TVU1BQkxFKQogICAgaW50Y18yIC8vIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDAzCiAgICAvLyBpdGVtX3R5cGU9YXJjNC5VSW50OChzZWxmLl9pdGVtX3R5cGVfY29kZShpdGVtX3R5cGUpKSwKICAgIGIgX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLl9pdGVtX3R5cGVfY29kZUAxOQoKX2NyZWF0ZV9nYW1lX2l0ZW1fYWZ0ZXJfaWZfZWxzZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODE0CiAgICAvLyBpZiBpdGVtX3R5cGUgPT0gImJhZGdlIiBvciBpdGVtX3R5cGUgPT0gIkJhZGdlIjoKICAgIGZyYW1lX2RpZyAtNQogICAgcHVzaGJ5dGVzICJiYWRnZSIKICAgID09CiAgICBibnogX2NyZWF0ZV9nYW1lX2l0ZW1faWZfYm9keUAxMwogICAgZnJhbWVfZGlnIC01CiAgICBwdXNoYnl0ZXMgIkJhZGdlIgogICAgPT0KICAgIGJ6IF9jcmVhdGVfZ2FtZV9pdGVtX2FmdGVyX2lmX2Vsc2VAMTQKCl9jcmVhdGVfZ2FtZV9pdGVtX2lmX2JvZHlAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjgxNQogICAgLy8gcmV0dXJuIFVJbnQ2NChJVEVNX1RZUEVfQkFER0UpCiAgICBwdXNoaW50IDQgLy8gNAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0MDMKICAgIC8vIGl0ZW1fdHlwZT1hcmM0LlVJbnQ4KHNlbGYuX2l0ZW1fdHlwZV9jb2RlKGl0ZW1fdHlwZSkpLAogICAgYiBfY3JlYXRlX2dhbWVfaXRlbV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uY29udHJhY3QuQWxnb1JlYWxtR2FtZU1hbmFnZXIuX2l0ZW1fdHlwZV9jb2RlQDE5CgpfY3JlYXRlX2dhbWVfaXRlbV9hZnRlcl9pZl9lbHNlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4MTYtODE3CiAgICAvLyAjIFJlamVjdGVkIHJhdGhlciB0aGFuIHN0b3JlZCBhcyBPVEhFUiwgd2hpY2ggd291bGQgbG9zZSB0aGUgbmFtZQogICAgLy8gYXNzZXJ0IGl0ZW1fdHlwZSA9PSAib3RoZXIiIG9yIGl0ZW1fdHlwZSA9PSAiT3RoZXIiLCAiVW5rbm93biBpdGVtIHR5cGUiCiAgICBmcmFtZV9kaWcgLTUKICAgIHB1c2hieXRlcyAib3RoZXIiCiAgICA9PQogICAgYm56IF9jcmVhdGVfZ2FtZV9pdGVtX2Jvb2xfdHJ1ZUAxNgogICAgZnJhbWVfZGlnIC01CiAgICBwdXNoYnl0ZXMgIk90aGVyIgogICAgPT0KICAgIGJ6IF9jcmVhdGVfZ2FtZV9pdGVtX2Jvb2xfZmFsc2VAMTcKCl9jcmVhdGVfZ2FtZV9pdGVtX2Jvb2xfdHJ1ZUAxNjoKICAgIGludGNfMSAvLyAxCgpfY3JlYXRlX2dhbWVfaXRlbV9ib29sX21lcmdlQDE4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4MTYtODE3CiAgICAvLyAjIFJlamVjdGVkIHJhdGhlciB0aGFuIHN0b3JlZCBhcyBPVEhFUiwgd2hpY2ggd291bGQgbG9zZSB0aGUgbmFtZQogICAgLy8gYXNzZXJ0IGl0ZW1fdHlwZSA9PSAib3RoZXIiIG9yIGl0ZW1fdHlwZSA9PSAiT3RoZXIiLCAiVW5rbm93biBpdGVtIHR5cGUiCiAgICBhc3NlcnQgLy8gVW5rbm93biBpdGVtIHR5cGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODE4CiAgICAvLyByZXR1cm4gVUludDY0KElURU1fVFlQRV9PVEhFUikKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQwMwogICAgLy8gaXRlbV90eXBlPWFyYzQuVUludDgoc2VsZi5faXRlbV90eXBlX2NvZGUoaXRlbV90eXBlKSksCiAgICBiIF9jcmVhdGVfZ2FtZV9pdGVtX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5faXRlbV90eXBlX2NvZGVAMTkKCl9jcmVhdGVfZ2FtZV9pdGVtX2Jvb2xfZmFsc2VAMTc6CiAgICBpbnRjXzAgLy8gMAogICAgYiBfY3JlYXRlX2dhbWVfaXRlbV9ib29sX21lcmdlQDE4CgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5yZWNvdmVyX2xvc3RfaXRlbShvcmlnaW5hbF9pdGVtX2lkOiB1aW50NjQsIHJlY292ZXJ5X3F1ZXN0X3Byb29mOiBieXRlcywgbmV3X3JlY2lwaWVudDogYnl0ZXMpIC0+IHVpbnQ2NDoKcmVjb3Zlcl9sb3N0X2l0ZW06CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQ0NC00NTAKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHJlY292ZXJfbG9zdF9pdGVtKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgb3JpZ2luYWxfaXRlbV9pZDogQXNzZXQsCiAgICAvLyAgICAgcmVjb3ZlcnlfcXVlc3RfcHJvb2Y6IEJ5dGVzLAogICAgLy8gICAgIG5ld19yZWNpcGllbnQ6IEFjY291bnQsCiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0NTYKICAgIC8vIFR4bi5zZW5kZXIKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDU1LTQ1NwogICAgLy8gYXNzZXJ0IHNlbGYuaXNfcmVnaXN0ZXJlZFsKICAgIC8vICAgICBUeG4uc2VuZGVyCiAgICAvLyBdLCAiT25seSByZWdpc3RlcmVkIHBsYXllcnMgY2FuIHJlY292ZXIgaXRlbXMiCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0NTUKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlZ2lzdGVyZWRbCiAgICBieXRlY18yIC8vICJpc19yZWdpc3RlcmVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0NTUtNDU3CiAgICAvLyBhc3NlcnQgc2VsZi5pc19yZWdpc3RlcmVkWwogICAgLy8gICAgIFR4bi5zZW5kZXIKICAgIC8vIF0sICJPbmx5IHJlZ2lzdGVyZWQgcGxheWVycyBjYW4gcmVjb3ZlciBpdGVtcyIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX3JlZ2lzdGVyZWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBieXRlY18xIC8vIDB4MDAKICAgICE9CiAgICBhc3NlcnQgLy8gT25seSByZWdpc3RlcmVkIHBsYXllcnMgY2FuIHJlY292ZXIgaXRlbXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDU5LTQ2MgogICAgLy8gIyBHZXQgb3JpZ2luYWwgaXRlbSBtZXRhZGF0YQogICAgLy8gb3JpZ2luYWxfbWV0YWRhdGFfcmVzcG9uc2UgPSBvcC5Bc3NldFBhcmFtc0dldC5hc3NldF9tZXRhZGF0YV9oYXNoKAogICAgLy8gICAgIG9yaWdpbmFsX2l0ZW1faWQKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMwogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldE1ldGFkYXRhSGFzaAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQ2MwogICAgLy8gYXNzZXJ0IG9yaWdpbmFsX21ldGFkYXRhX3Jlc3BvbnNlWzBdLCAiT3JpZ2luYWwgaXRlbSBub3QgZm91bmQiCiAgICBsZW4KICAgIGFzc2VydCAvLyBPcmlnaW5hbCBpdGVtIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0NjUtNDY2CiAgICAvLyAjIFZlcmlmeSByZWNvdmVyeSBxdWVzdCBjb21wbGV0aW9uIHdpdGggdGhlIHF1ZXN0IHN5c3RlbSAocHJvb2YgaXMgc2luZ2xlIHVzZSkKICAgIC8vIGFzc2VydCByZWNvdmVyeV9xdWVzdF9wcm9vZiAhPSBCeXRlcygpLCAiTXVzdCBwcm92aWRlIHJlY292ZXJ5IHF1ZXN0IHByb29mIgogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoYnl0ZXMgMHgKICAgICE9CiAgICBhc3NlcnQgLy8gTXVzdCBwcm92aWRlIHJlY292ZXJ5IHF1ZXN0IHByb29mCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQ2NwogICAgLy8gYXNzZXJ0IHNlbGYucXVlc3Rfc3lzdGVtX2FwcC52YWx1ZS5pZCAhPSAwLCAiUXVlc3Qgc3lzdGVtIG5vdCBjb25maWd1cmVkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gInF1ZXN0X3N5c3RlbV9hcHAiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucXVlc3Rfc3lzdGVtX2FwcCBleGlzdHMKICAgIGFzc2VydCAvLyBRdWVzdCBzeXN0ZW0gbm90IGNvbmZpZ3VyZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDY4LTQ3NAogICAgLy8gcHJvb2ZfdmFsaWQsIF9wcm9vZl90eG4gPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIEFsZ29SZWFsbVF1ZXN0U3lzdGVtLmNvbnN1bWVfcmVjb3ZlcnlfcHJvb2YsCiAgICAvLyAgICAgVHhuLnNlbmRlciwKICAgIC8vICAgICByZWNvdmVyeV9xdWVzdF9wcm9vZiwKICAgIC8vICAgICBhcHBfaWQ9c2VsZi5xdWVzdF9zeXN0ZW1fYXBwLnZhbHVlLAogICAgLy8gICAgIGZlZT1zZWxmLl9pbm5lcl9mZWUoKSwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDczCiAgICAvLyBmZWU9c2VsZi5faW5uZXJfZmVlKCksCiAgICBjYWxsc3ViIF9pbm5lcl9mZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDcxCiAgICAvLyByZWNvdmVyeV9xdWVzdF9wcm9vZiwKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDcwCiAgICAvLyBUeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0NzIKICAgIC8vIGFwcF9pZD1zZWxmLnF1ZXN0X3N5c3RlbV9hcHAudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAicXVlc3Rfc3lzdGVtX2FwcCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5xdWVzdF9zeXN0ZW1fYXBwIGV4aXN0cwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICBpdHhuX2ZpZWxkIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQ2OC00NzQKICAgIC8vIHByb29mX3ZhbGlkLCBfcHJvb2ZfdHhuID0gYXJjNC5hYmlfY2FsbCgKICAgIC8vICAgICBBbGdvUmVhbG1RdWVzdFN5c3RlbS5jb25zdW1lX3JlY292ZXJ5X3Byb29mLAogICAgLy8gICAgIFR4bi5zZW5kZXIsCiAgICAvLyAgICAgcmVjb3ZlcnlfcXVlc3RfcHJvb2YsCiAgICAvLyAgICAgYXBwX2lkPXNlbGYucXVlc3Rfc3lzdGVtX2FwcC52YWx1ZSwKICAgIC8vICAgICBmZWU9c2VsZi5faW5uZXJfZmVlKCksCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg2MDRkZTE0ZCAvLyBtZXRob2QgImNvbnN1bWVfcmVjb3ZlcnlfcHJvb2YoYWNjb3VudCxieXRlW10pYm9vbCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQ3MAogICAgLy8gVHhuLnNlbmRlciwKICAgIHB1c2hieXRlcyAweDAxCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDY4LTQ3NAogICAgLy8gcHJvb2ZfdmFsaWQsIF9wcm9vZl90eG4gPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIEFsZ29SZWFsbVF1ZXN0U3lzdGVtLmNvbnN1bWVfcmVjb3ZlcnlfcHJvb2YsCiAgICAvLyAgICAgVHhuLnNlbmRlciwKICAgIC8vICAgICByZWNvdmVyeV9xdWVzdF9wcm9vZiwKICAgIC8vICAgICBhcHBfaWQ9c2VsZi5xdWVzdF9zeXN0ZW1fYXBwLnZhbHVlLAogICAgLy8gICAgIGZlZT1zZWxmLl9pbm5lcl9mZWUoKSwKICAgIC8vICkKICAgIHB1c2hpbnQgNiAvLyBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gTGFzdExvZwogICAgZHVwCiAgICBleHRyYWN0IDQgMAogICAgc3dhcAogICAgZXh0cmFjdCAwIDQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgPT0KICAgIGFzc2VydCAvLyBhcHBsaWNhdGlvbiBsb2cgdmFsdWUgaXMgbm90IHRoZSByZXN1bHQgb2YgYW4gQUJJIHJldHVybgogICAgaW50Y18wIC8vIDAKICAgIGdldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0NzUKICAgIC8vIGFzc2VydCBwcm9vZl92YWxpZCwgIlJlY292ZXJ5IHF1ZXN0IG5vdCBjb21wbGV0ZWQiCiAgICBhc3NlcnQgLy8gUmVjb3ZlcnkgcXVlc3Qgbm90IGNvbXBsZXRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0NzctNDc4CiAgICAvLyAjIENoZWNrIHJlY292ZXJ5IGxpbWl0cyAoY291bnRzIHJlc2V0IGxhemlseSBhdCB0aGUgc3RhcnQgb2YgZWFjaCBzZWFzb24pCiAgICAvLyBjdXJyZW50X3JlY292ZXJ5X2NvdW50ID0gc2VsZi5fc2Vhc29uX3JlY292ZXJ5X2NvdW50KFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICBjYWxsc3ViIF9zZWFzb25fcmVjb3ZlcnlfY291bnQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0ODAKICAgIC8vIGN1cnJlbnRfcmVjb3ZlcnlfY291bnQgPCBzZWxmLm1heF9yZWNvdmVyeV9wZXJfaXRlbS52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE2IC8vICJtYXhfcmVjb3ZlcnlfcGVyX2l0ZW0iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWF4X3JlY292ZXJ5X3Blcl9pdGVtIGV4aXN0cwogICAgPAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0NzktNDgxCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGN1cnJlbnRfcmVjb3ZlcnlfY291bnQgPCBzZWxmLm1heF9yZWNvdmVyeV9wZXJfaXRlbS52YWx1ZQogICAgLy8gKSwgIlJlY292ZXJ5IGxpbWl0IHJlYWNoZWQgLSBtYXggMyByZWNvdmVyaWVzIHBlciBwbGF5ZXIgcGVyIHNlYXNvbiIKICAgIGFzc2VydCAvLyBSZWNvdmVyeSBsaW1pdCByZWFjaGVkIC0gbWF4IDMgcmVjb3ZlcmllcyBwZXIgcGxheWVyIHBlciBzZWFzb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDgzLTQ4NAogICAgLy8gIyBHZXQgb3JpZ2luYWwgaXRlbSBuYW1lIGZvciBuZXcgQVNBCiAgICAvLyBvcmlnaW5hbF9uYW1lX3Jlc3BvbnNlID0gb3AuQXNzZXRQYXJhbXNHZXQuYXNzZXRfbmFtZShvcmlnaW5hbF9pdGVtX2lkKQogICAgZnJhbWVfZGlnIC0zCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0TmFtZQogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQ4NQogICAgLy8gYXNzZXJ0IG9yaWdpbmFsX25hbWVfcmVzcG9uc2VbMF0sICJDYW5ub3QgZ2V0IG9yaWdpbmFsIGl0ZW0gbmFtZSIKICAgIGxlbgogICAgYXNzZXJ0IC8vIENhbm5vdCBnZXQgb3JpZ2luYWwgaXRlbSBuYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQ4OQogICAgLy8gcmVjb3Zlcnlfbm90ZSA9IG9wLmNvbmNhdChCeXRlcyhiIlJFQ09WRVJFRF9JVEVNXyIpLCByZWNvdmVyeV9xdWVzdF9wcm9vZikKICAgIHB1c2hieXRlcyAweDUyNDU0MzRmNTY0NTUyNDU0NDVmNDk1NDQ1NGQ1ZgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDkwLTUwMgogICAgLy8gcmVjb3ZlcmVkX2l0ZW1fYXNhID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBhc3NldF9uYW1lPXJlY292ZXJlZF9uYW1lLAogICAgLy8gICAgIHVuaXRfbmFtZT1TdHJpbmcoIkFMR1JFQ09WIiksCiAgICAvLyAgICAgdG90YWw9VUludDY0KDEpLAogICAgLy8gICAgIGRlY2ltYWxzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPXNlbGYuX2lubmVyX2ZlZSgpLAogICAgLy8gICAgIG5vdGU9cmVjb3Zlcnlfbm90ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTAwCiAgICAvLyBmZWU9c2VsZi5faW5uZXJfZmVlKCksCiAgICBjYWxsc3ViIF9pbm5lcl9mZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDk2CiAgICAvLyBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0OTctNDk5CiAgICAvLyByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBkdXBuIDMKICAgIHVuY292ZXIgNQogICAgaXR4bl9maWVsZCBOb3RlCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0Q2xhd2JhY2sKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRGcmVlemUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRSZXNlcnZlCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TWFuYWdlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0OTUKICAgIC8vIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWZhdWx0RnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQ5NAogICAgLy8gZGVjaW1hbHM9VUludDY0KDApLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWNpbWFscwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0OTMKICAgIC8vIHRvdGFsPVVJbnQ2NCgxKSwKICAgIGludGNfMSAvLyAxCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NDkyCiAgICAvLyB1bml0X25hbWU9U3RyaW5nKCJBTEdSRUNPViIpLAogICAgcHVzaGJ5dGVzICJBTEdSRUNPViIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVbml0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0ODctNDg4CiAgICAvLyAjIENyZWF0ZSBORVcgQVNBIHdpdGggc2FtZSBwcm9wZXJ0aWVzIGJ1dCBtYXJrZWQgYXMgcmVjb3ZlcmVkCiAgICAvLyByZWNvdmVyZWRfbmFtZSA9IFN0cmluZygiUkVDT1ZFUkVEX0lURU0iKQogICAgcHVzaGJ5dGVzICJSRUNPVkVSRURfSVRFTSIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjQ5MAogICAgLy8gcmVjb3ZlcmVkX2l0ZW1fYXNhID0gaXR4bi5Bc3NldENvbmZpZygKICAgIGludGNfMiAvLyBhY2ZnCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo0OTAtNTAyCiAgICAvLyByZWNvdmVyZWRfaXRlbV9hc2EgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIGFzc2V0X25hbWU9cmVjb3ZlcmVkX25hbWUsCiAgICAvLyAgICAgdW5pdF9uYW1lPVN0cmluZygiQUxHUkVDT1YiKSwKICAgIC8vICAgICB0b3RhbD1VSW50NjQoMSksCiAgICAvLyAgICAgZGVjaW1hbHM9VUludDY0KDApLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9c2VsZi5faW5uZXJfZmVlKCksCiAgICAvLyAgICAgbm90ZT1yZWNvdmVyeV9ub3RlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gQ3JlYXRlZEFzc2V0SUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTA0LTUwNQogICAgLy8gIyBSZWNvdmVyZWQgY29waWVzIGtlZXAgdGhlIG9yaWdpbmFsJ3MgY29tcGFjdCBtZXRhZGF0YSwgbWFya2VkIHJlY292ZXJlZAogICAgLy8gaWYgb3JpZ2luYWxfaXRlbV9pZC5pZCBpbiBzZWxmLml0ZW1fbWV0YWRhdGE6CiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGR1cAogICAgYnl0ZWMgNSAvLyAweDZkCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiByZWNvdmVyX2xvc3RfaXRlbV9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTA2CiAgICAvLyByZWNvdmVyZWRfbWV0YWRhdGEgPSBzZWxmLml0ZW1fbWV0YWRhdGFbb3JpZ2luYWxfaXRlbV9pZC5pZF0uY29weSgpCiAgICBmcmFtZV9kaWcgMwogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXRlbV9tZXRhZGF0YSBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTA4CiAgICAvLyByZWNvdmVyZWRfbWV0YWRhdGEucmVjb3ZlcnlfY291bnQubmF0aXZlIDwgTUFYX1JFQ09WRVJZX0NPVU5UCiAgICBkdXAKICAgIHB1c2hpbnQgOSAvLyA5CiAgICBnZXRieXRlCiAgICBwdXNoaW50IDI1NSAvLyAyNTUKICAgIDwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTA3LTUwOQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICByZWNvdmVyZWRfbWV0YWRhdGEucmVjb3ZlcnlfY291bnQubmF0aXZlIDwgTUFYX1JFQ09WRVJZX0NPVU5UCiAgICAvLyApLCAiSXRlbSByZWNvdmVyZWQgdG9vIG1hbnkgdGltZXMiCiAgICBhc3NlcnQgLy8gSXRlbSByZWNvdmVyZWQgdG9vIG1hbnkgdGltZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTEwCiAgICAvLyByZWNvdmVyZWRfbWV0YWRhdGEuaXNfcmVjb3ZlcmVkID0gYXJjNC5Cb29sKFRydWUpCiAgICBwdXNoaW50IDY0IC8vIDY0CiAgICBpbnRjXzEgLy8gMQogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjUxMgogICAgLy8gcmVjb3ZlcmVkX21ldGFkYXRhLnJlY292ZXJ5X2NvdW50Lm5hdGl2ZSArIDEKICAgIGR1cAogICAgcHVzaGludCA5IC8vIDkKICAgIGdldGJ5dGUKICAgIGludGNfMSAvLyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjUxMS01MTMKICAgIC8vIHJlY292ZXJlZF9tZXRhZGF0YS5yZWNvdmVyeV9jb3VudCA9IGFyYzQuVUludDgoCiAgICAvLyAgICAgcmVjb3ZlcmVkX21ldGFkYXRhLnJlY292ZXJ5X2NvdW50Lm5hdGl2ZSArIDEKICAgIC8vICkKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDggLy8gOAogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA3IDEKICAgIHJlcGxhY2UyIDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTE0CiAgICAvLyBzZWxmLml0ZW1fbWV0YWRhdGFbcmVjb3ZlcmVkX2l0ZW1fYXNhLmNyZWF0ZWRfYXNzZXQuaWRdID0gKAogICAgZnJhbWVfZGlnIDEKICAgIGl0b2IKICAgIGJ5dGVjIDUgLy8gMHg2ZAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjUxNC01MTYKICAgIC8vIHNlbGYuaXRlbV9tZXRhZGF0YVtyZWNvdmVyZWRfaXRlbV9hc2EuY3JlYXRlZF9hc3NldC5pZF0gPSAoCiAgICAvLyAgICAgcmVjb3ZlcmVkX21ldGFkYXRhLmNvcHkoKQogICAgLy8gKQogICAgc3dhcAogICAgYm94X3B1dAoKcmVjb3Zlcl9sb3N0X2l0ZW1fYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1MjEtNTIyCiAgICAvLyAjIFVwZGF0ZSBwbGF5ZXIgcmVjb3ZlcnkgY291bnQgYW5kIHN0YW1wIGl0IHdpdGggdGhlIGN1cnJlbnQgc2Vhc29uCiAgICAvLyBzZWxmLnBsYXllcl9yZWNvdmVyeV9jb3VudFtUeG4uc2VuZGVyXSA9IGN1cnJlbnRfcmVjb3ZlcnlfY291bnQgKyBVSW50NjQoMSkKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgdHhuIFNlbmRlcgogICAgYnl0ZWMgMTIgLy8gInBsYXllcl9yZWNvdmVyeV9jb3VudCIKICAgIHVuY292ZXIgMgogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1MjMKICAgIC8vIHNlbGYucGxheWVyX3NlYXNvbltUeG4uc2VuZGVyXSA9IHNlbGYuY3VycmVudF9zZWFzb24udmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJjdXJyZW50X3NlYXNvbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jdXJyZW50X3NlYXNvbiBleGlzdHMKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjIDEzIC8vICJwbGF5ZXJfc2Vhc29uIgogICAgdW5jb3ZlciAyCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjUyOAogICAgLy8gYXJjNC5VSW50NjQocmVjb3ZlcmVkX2l0ZW1fYXNhLmNyZWF0ZWRfYXNzZXQuaWQpLAogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1MjYtNTMwCiAgICAvLyBJdGVtUmVjb3ZlcmVkKAogICAgLy8gICAgIGFyYzQuVUludDY0KG9yaWdpbmFsX2l0ZW1faWQuaWQpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHJlY292ZXJlZF9pdGVtX2FzYS5jcmVhdGVkX2Fzc2V0LmlkKSwKICAgIC8vICAgICBBZGRyZXNzKG5ld19yZWNpcGllbnQpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTI1LTUzMQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIEl0ZW1SZWNvdmVyZWQoCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KG9yaWdpbmFsX2l0ZW1faWQuaWQpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChyZWNvdmVyZWRfaXRlbV9hc2EuY3JlYXRlZF9hc3NldC5pZCksCiAgICAvLyAgICAgICAgIEFkZHJlc3MobmV3X3JlY2lwaWVudCksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4YWEzYjE0MTcgLy8gbWV0aG9kICJJdGVtUmVjb3ZlcmVkKHVpbnQ2NCx1aW50NjQsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1MzIKICAgIC8vIHJldHVybiByZWNvdmVyZWRfaXRlbV9hc2EuY3JlYXRlZF9hc3NldC5pZAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLnNlYXNvbmFsX2V2ZW50X3JlaXNzdWUoZXZlbnRfbmFtZTogYnl0ZXMsIHBhcnRpY2lwYXRpb25fcHJvb2Y6IGJ5dGVzLCByZWNpcGllbnQ6IGJ5dGVzKSAtPiB1aW50NjQ6CnNlYXNvbmFsX2V2ZW50X3JlaXNzdWU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjUzNC01MzcKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHNlYXNvbmFsX2V2ZW50X3JlaXNzdWUoCiAgICAvLyAgICAgc2VsZiwgZXZlbnRfbmFtZTogU3RyaW5nLCBwYXJ0aWNpcGF0aW9uX3Byb29mOiBCeXRlcywgcmVjaXBpZW50OiBBY2NvdW50CiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1NDIKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlZ2lzdGVyZWRbVHhuLnNlbmRlcl0sICJPbmx5IHJlZ2lzdGVyZWQgcGxheWVycyBjYW4gcGFydGljaXBhdGUiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX3JlZ2lzdGVyZWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBieXRlY18xIC8vIDB4MDAKICAgICE9CiAgICBhc3NlcnQgLy8gT25seSByZWdpc3RlcmVkIHBsYXllcnMgY2FuIHBhcnRpY2lwYXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjU0MwogICAgLy8gYXNzZXJ0IHBhcnRpY2lwYXRpb25fcHJvb2YgIT0gQnl0ZXMoKSwgIk11c3QgcHJvdmlkZSBwYXJ0aWNpcGF0aW9uIHByb29mIgogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoYnl0ZXMgMHgKICAgICE9CiAgICBhc3NlcnQgLy8gTXVzdCBwcm92aWRlIHBhcnRpY2lwYXRpb24gcHJvb2YKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTQ1CiAgICAvLyBVSW50NjQoQUNUSU9OX1NFQVNPTkFMX1JFSVNTVUUpLCBzZWxmLnNlYXNvbmFsX3JlaXNzdWVfaW50ZXJ2YWwudmFsdWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJzZWFzb25hbF9yZWlzc3VlX2ludGVydmFsIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnNlYXNvbmFsX3JlaXNzdWVfaW50ZXJ2YWwgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1NDQtNTQ2CiAgICAvLyBzZWxmLl9jb25zdW1lX3JhdGVfbGltaXQoCiAgICAvLyAgICAgVUludDY0KEFDVElPTl9TRUFTT05BTF9SRUlTU1VFKSwgc2VsZi5zZWFzb25hbF9yZWlzc3VlX2ludGVydmFsLnZhbHVlCiAgICAvLyApCiAgICBzd2FwCiAgICBjYWxsc3ViIF9jb25zdW1lX3JhdGVfbGltaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTUwCiAgICAvLyBzZWFzb25hbF9ub3RlID0gb3AuY29uY2F0KEJ5dGVzKGIiU0VBU09OQUxfIiksIHBhcnRpY2lwYXRpb25fcHJvb2YpCiAgICBwdXNoYnl0ZXMgMHg1MzQ1NDE1MzRmNGU0MTRjNWYKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjU1Mi01NjQKICAgIC8vIHNlYXNvbmFsX2FzYSA9IGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgYXNzZXRfbmFtZT1zZWFzb25hbF9pdGVtX25hbWUsCiAgICAvLyAgICAgdW5pdF9uYW1lPVN0cmluZygiQUxHU0VBU04iKSwKICAgIC8vICAgICB0b3RhbD1VSW50NjQoMSksCiAgICAvLyAgICAgZGVjaW1hbHM9VUludDY0KDApLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9c2VsZi5faW5uZXJfZmVlKCksCiAgICAvLyAgICAgbm90ZT1zZWFzb25hbF9ub3RlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1NjIKICAgIC8vIGZlZT1zZWxmLl9pbm5lcl9mZWUoKSwKICAgIGNhbGxzdWIgX2lubmVyX2ZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1NTgKICAgIC8vIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjU1OS01NjEKICAgIC8vIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGR1cG4gMwogICAgdW5jb3ZlciA1CiAgICBpdHhuX2ZpZWxkIE5vdGUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRDbGF3YmFjawogICAgaXR4bl9maWVsZCBDb25maWdBc3NldEZyZWV6ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFJlc2VydmUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRNYW5hZ2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjU1NwogICAgLy8gZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlZmF1bHRGcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTU2CiAgICAvLyBkZWNpbWFscz1VSW50NjQoMCksCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlY2ltYWxzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjU1NQogICAgLy8gdG90YWw9VUludDY0KDEpLAogICAgaW50Y18xIC8vIDEKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRUb3RhbAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1NTQKICAgIC8vIHVuaXRfbmFtZT1TdHJpbmcoIkFMR1NFQVNOIiksCiAgICBwdXNoYnl0ZXMgIkFMR1NFQVNOIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVuaXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjU0OC01NDkKICAgIC8vICMgQ3JlYXRlIHNlYXNvbmFsIGl0ZW0gYmFzZWQgb24gZXZlbnQKICAgIC8vIHNlYXNvbmFsX2l0ZW1fbmFtZSA9IFN0cmluZygiU0VBU09OQUxfSVRFTSIpCiAgICBwdXNoYnl0ZXMgIlNFQVNPTkFMX0lURU0iCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1NTIKICAgIC8vIHNlYXNvbmFsX2FzYSA9IGl0eG4uQXNzZXRDb25maWcoCiAgICBpbnRjXzIgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTUyLTU2NAogICAgLy8gc2Vhc29uYWxfYXNhID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBhc3NldF9uYW1lPXNlYXNvbmFsX2l0ZW1fbmFtZSwKICAgIC8vICAgICB1bml0X25hbWU9U3RyaW5nKCJBTEdTRUFTTiIpLAogICAgLy8gICAgIHRvdGFsPVVJbnQ2NCgxKSwKICAgIC8vICAgICBkZWNpbWFscz1VSW50NjQoMCksCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZlZT1zZWxmLl9pbm5lcl9mZWUoKSwKICAgIC8vICAgICBub3RlPXNlYXNvbmFsX25vdGUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXNzZXRJRAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1NzEKICAgIC8vIGFyYzQuVUludDY0KHNlYXNvbmFsX2FzYS5jcmVhdGVkX2Fzc2V0LmlkKSwKICAgIGR1cAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1NzAtNTc0CiAgICAvLyBJdGVtTWludGVkKAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlYXNvbmFsX2FzYS5jcmVhdGVkX2Fzc2V0LmlkKSwKICAgIC8vICAgICBBZGRyZXNzKHJlY2lwaWVudCksCiAgICAvLyAgICAgYXJjNC5VSW50OChJVEVNX1NPVVJDRV9TRUFTT05BTCksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1NzMKICAgIC8vIGFyYzQuVUludDgoSVRFTV9TT1VSQ0VfU0VBU09OQUwpLAogICAgcHVzaGJ5dGVzIDB4MDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTcwLTU3NAogICAgLy8gSXRlbU1pbnRlZCgKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzZWFzb25hbF9hc2EuY3JlYXRlZF9hc3NldC5pZCksCiAgICAvLyAgICAgQWRkcmVzcyhyZWNpcGllbnQpLAogICAgLy8gICAgIGFyYzQuVUludDgoSVRFTV9TT1VSQ0VfU0VBU09OQUwpLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjU2OS01NzUKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBJdGVtTWludGVkKAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChzZWFzb25hbF9hc2EuY3JlYXRlZF9hc3NldC5pZCksCiAgICAvLyAgICAgICAgIEFkZHJlc3MocmVjaXBpZW50KSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50OChJVEVNX1NPVVJDRV9TRUFTT05BTCksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgYnl0ZWMgMjEgLy8gbWV0aG9kICJJdGVtTWludGVkKHVpbnQ2NCxhZGRyZXNzLHVpbnQ4KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjU3NgogICAgLy8gcmV0dXJuIHNlYXNvbmFsX2FzYS5jcmVhdGVkX2Fzc2V0LmlkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLmNyYWZ0X2l0ZW1zKG1hdGVyaWFsXzE6IHVpbnQ2NCwgbWF0ZXJpYWxfMjogdWludDY0LCByZWNpcGVfaWQ6IHVpbnQ2NCkgLT4gdWludDY0OgpjcmFmdF9pdGVtczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTc4LTU4MQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY3JhZnRfaXRlbXMoCiAgICAvLyAgICAgc2VsZiwgbWF0ZXJpYWxfMTogQXNzZXQsIG1hdGVyaWFsXzI6IEFzc2V0LCByZWNpcGVfaWQ6IFVJbnQ2NAogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTg2CiAgICAvLyBhc3NlcnQgc2VsZi5pc19yZWdpc3RlcmVkW1R4bi5zZW5kZXJdLCAiT25seSByZWdpc3RlcmVkIHBsYXllcnMgY2FuIGNyYWZ0IgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImlzX3JlZ2lzdGVyZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19yZWdpc3RlcmVkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgYnl0ZWNfMSAvLyAweDAwCiAgICAhPQogICAgYXNzZXJ0IC8vIE9ubHkgcmVnaXN0ZXJlZCBwbGF5ZXJzIGNhbiBjcmFmdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1ODcKICAgIC8vIHNlbGYuX2NvbnN1bWVfcmF0ZV9saW1pdChVSW50NjQoQUNUSU9OX0NSQUZUX0lURU1TKSwgc2VsZi5jcmFmdF9pbnRlcnZhbC52YWx1ZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMCAvLyAiY3JhZnRfaW50ZXJ2YWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JhZnRfaW50ZXJ2YWwgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgc3dhcAogICAgY2FsbHN1YiBfY29uc3VtZV9yYXRlX2xpbWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjU5NS02MDcKICAgIC8vIGNyYWZ0ZWRfYXNhID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBhc3NldF9uYW1lPWNyYWZ0ZWRfaXRlbV9uYW1lLAogICAgLy8gICAgIHVuaXRfbmFtZT1TdHJpbmcoIkFMR0NSQUZUIiksCiAgICAvLyAgICAgdG90YWw9VUludDY0KDEpLAogICAgLy8gICAgIGRlY2ltYWxzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPXNlbGYuX2lubmVyX2ZlZSgpLAogICAgLy8gICAgIG5vdGU9Qnl0ZXMoYiJDUkFGVEVEX0lURU0iKSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjA1CiAgICAvLyBmZWU9c2VsZi5faW5uZXJfZmVlKCksCiAgICBjYWxsc3ViIF9pbm5lcl9mZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjAxCiAgICAvLyBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2MDItNjA0CiAgICAvLyByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBkdXBuIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjA2CiAgICAvLyBub3RlPUJ5dGVzKGIiQ1JBRlRFRF9JVEVNIiksCiAgICBieXRlYyAyNSAvLyAweDQzNTI0MTQ2NTQ0NTQ0NWY0OTU0NDU0ZAogICAgaXR4bl9maWVsZCBOb3RlCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0Q2xhd2JhY2sKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRGcmVlemUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRSZXNlcnZlCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TWFuYWdlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2MDAKICAgIC8vIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWZhdWx0RnJvemVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjU5OQogICAgLy8gZGVjaW1hbHM9VUludDY0KDApLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWNpbWFscwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1OTgKICAgIC8vIHRvdGFsPVVJbnQ2NCgxKSwKICAgIGludGNfMSAvLyAxCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NTk3CiAgICAvLyB1bml0X25hbWU9U3RyaW5nKCJBTEdDUkFGVCIpLAogICAgcHVzaGJ5dGVzICJBTEdDUkFGVCIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVbml0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1OTItNTkzCiAgICAvLyAjIENyZWF0ZSBjcmFmdGVkIGl0ZW0gYmFzZWQgb24gcmVjaXBlCiAgICAvLyBjcmFmdGVkX2l0ZW1fbmFtZSA9IFN0cmluZygiQ1JBRlRFRF9JVEVNIikKICAgIGJ5dGVjIDI1IC8vICJDUkFGVEVEX0lURU0iCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1OTUKICAgIC8vIGNyYWZ0ZWRfYXNhID0gaXR4bi5Bc3NldENvbmZpZygKICAgIGludGNfMiAvLyBhY2ZnCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo1OTUtNjA3CiAgICAvLyBjcmFmdGVkX2FzYSA9IGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgYXNzZXRfbmFtZT1jcmFmdGVkX2l0ZW1fbmFtZSwKICAgIC8vICAgICB1bml0X25hbWU9U3RyaW5nKCJBTEdDUkFGVCIpLAogICAgLy8gICAgIHRvdGFsPVVJbnQ2NCgxKSwKICAgIC8vICAgICBkZWNpbWFscz1VSW50NjQoMCksCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZlZT1zZWxmLl9pbm5lcl9mZWUoKSwKICAgIC8vICAgICBub3RlPUJ5dGVzKGIiQ1JBRlRFRF9JVEVNIiksCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXNzZXRJRAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2MTUKICAgIC8vIGFyYzQuVUludDY0KGNyYWZ0ZWRfYXNhLmNyZWF0ZWRfYXNzZXQuaWQpLAogICAgZHVwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjYxNgogICAgLy8gQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjE0LTYxOAogICAgLy8gSXRlbU1pbnRlZCgKICAgIC8vICAgICBhcmM0LlVJbnQ2NChjcmFmdGVkX2FzYS5jcmVhdGVkX2Fzc2V0LmlkKSwKICAgIC8vICAgICBBZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFyYzQuVUludDgoSVRFTV9TT1VSQ0VfQ1JBRlRFRCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjE3CiAgICAvLyBhcmM0LlVJbnQ4KElURU1fU09VUkNFX0NSQUZURUQpLAogICAgcHVzaGJ5dGVzIDB4MDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjE0LTYxOAogICAgLy8gSXRlbU1pbnRlZCgKICAgIC8vICAgICBhcmM0LlVJbnQ2NChjcmFmdGVkX2FzYS5jcmVhdGVkX2Fzc2V0LmlkKSwKICAgIC8vICAgICBBZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFyYzQuVUludDgoSVRFTV9TT1VSQ0VfQ1JBRlRFRCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjEzLTYxOQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIEl0ZW1NaW50ZWQoCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KGNyYWZ0ZWRfYXNhLmNyZWF0ZWRfYXNzZXQuaWQpLAogICAgLy8gICAgICAgICBBZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ4KElURU1fU09VUkNFX0NSQUZURUQpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIGJ5dGVjIDIxIC8vIG1ldGhvZCAiSXRlbU1pbnRlZCh1aW50NjQsYWRkcmVzcyx1aW50OCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2MjAKICAgIC8vIHJldHVybiBjcmFmdGVkX2FzYS5jcmVhdGVkX2Fzc2V0LmlkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLmNyZWF0ZV9pdGVtX3N0YWNrKGl0ZW1fdHlwZTogYnl0ZXMsIHJhcml0eTogYnl0ZXMpIC0+IHVpbnQ2NDoKY3JlYXRlX2l0ZW1fc3RhY2s6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjYyMi02MjMKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNyZWF0ZV9pdGVtX3N0YWNrKHNlbGYsIGl0ZW1fdHlwZTogU3RyaW5nLCByYXJpdHk6IFN0cmluZykgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjYzMQogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLmdhbWVfbWFzdGVyLnZhbHVlCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiZ2FtZV9tYXN0ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2FtZV9tYXN0ZXIgZXhpc3RzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2MzAtNjMyCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0gc2VsZi5nYW1lX21hc3Rlci52YWx1ZQogICAgLy8gKSwgIk9ubHkgZ2FtZSBtYXN0ZXIgY2FuIGNyZWF0ZSBpdGVtIHN0YWNrcyIKICAgIGFzc2VydCAvLyBPbmx5IGdhbWUgbWFzdGVyIGNhbiBjcmVhdGUgaXRlbSBzdGFja3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Nzc3CiAgICAvLyByZXR1cm4gb3Auc2hhMjU2KGl0ZW1fdHlwZS5ieXRlcyArIGIiOiIgKyByYXJpdHkuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ5dGVjIDIyIC8vIDB4M2EKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGR1cAogICAgc2hhMjU2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjYzNQogICAgLy8gaWYgc3RhY2tfa2V5IGluIHNlbGYuaXRlbV9zdGFja3M6CiAgICBieXRlYyAyMyAvLyAweDczCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBjcmVhdGVfaXRlbV9zdGFja19hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjM2CiAgICAvLyByZXR1cm4gc2VsZi5pdGVtX3N0YWNrc1tzdGFja19rZXldCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pdGVtX3N0YWNrcyBlbnRyeSBleGlzdHMKICAgIGJ0b2kKICAgIHN3YXAKICAgIHJldHN1YgoKY3JlYXRlX2l0ZW1fc3RhY2tfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2MzkKICAgIC8vIGFzc2VydCBzdGFja19uYW1lLmxlbmd0aCA8PSBNQVhfQVNTRVRfTkFNRV9MRU5HVEgsICJTdGFjayBuYW1lIHRvbyBsb25nIgogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIFN0YWNrIG5hbWUgdG9vIGxvbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjQwLTY1MgogICAgLy8gc3RhY2tfYXNhID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBhc3NldF9uYW1lPXN0YWNrX25hbWUsCiAgICAvLyAgICAgdW5pdF9uYW1lPVN0cmluZygiQUxHU1RBQ0siKSwKICAgIC8vICAgICB0b3RhbD1VSW50NjQoSVRFTV9TVEFDS19TVVBQTFkpLAogICAgLy8gICAgIGRlY2ltYWxzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPXNlbGYuX2lubmVyX2ZlZSgpLAogICAgLy8gICAgIG5vdGU9YiJTVEFDS18iICsgc3RhY2tfbmFtZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjUwCiAgICAvLyBmZWU9c2VsZi5faW5uZXJfZmVlKCksCiAgICBjYWxsc3ViIF9pbm5lcl9mZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjQ2CiAgICAvLyBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2NDctNjQ5CiAgICAvLyByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBkdXBuIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjUxCiAgICAvLyBub3RlPWIiU1RBQ0tfIiArIHN0YWNrX25hbWUsCiAgICBwdXNoYnl0ZXMgMHg1MzU0NDE0MzRiNWYKICAgIGRpZyA2CiAgICBjb25jYXQKICAgIGl0eG5fZmllbGQgTm90ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldENsYXdiYWNrCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RnJlZXplCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0UmVzZXJ2ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE1hbmFnZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjQ1CiAgICAvLyBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVmYXVsdEZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2NDQKICAgIC8vIGRlY2ltYWxzPVVJbnQ2NCgwKSwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVjaW1hbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjQzCiAgICAvLyB0b3RhbD1VSW50NjQoSVRFTV9TVEFDS19TVVBQTFkpLAogICAgcHVzaGludCAxMDAwMDAwMDAwMDAwIC8vIDEwMDAwMDAwMDAwMDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRUb3RhbAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2NDIKICAgIC8vIHVuaXRfbmFtZT1TdHJpbmcoIkFMR1NUQUNLIiksCiAgICBwdXNoYnl0ZXMgIkFMR1NUQUNLIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVuaXROYW1lCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2NDAKICAgIC8vIHN0YWNrX2FzYSA9IGl0eG4uQXNzZXRDb25maWcoCiAgICBpbnRjXzIgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjQwLTY1MgogICAgLy8gc3RhY2tfYXNhID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBhc3NldF9uYW1lPXN0YWNrX25hbWUsCiAgICAvLyAgICAgdW5pdF9uYW1lPVN0cmluZygiQUxHU1RBQ0siKSwKICAgIC8vICAgICB0b3RhbD1VSW50NjQoSVRFTV9TVEFDS19TVVBQTFkpLAogICAgLy8gICAgIGRlY2ltYWxzPVVJbnQ2NCgwKSwKICAgIC8vICAgICBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGZyZWV6ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGNsYXdiYWNrPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPXNlbGYuX2lubmVyX2ZlZSgpLAogICAgLy8gICAgIG5vdGU9YiJTVEFDS18iICsgc3RhY2tfbmFtZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIENyZWF0ZWRBc3NldElECiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjY1NAogICAgLy8gc2VsZi5pdGVtX3N0YWNrc1tzdGFja19rZXldID0gc3RhY2tfYXNhLmNyZWF0ZWRfYXNzZXQuaWQKICAgIGR1cAogICAgaXRvYgogICAgdW5jb3ZlciAyCiAgICBkaWcgMQogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2NTgKICAgIC8vIGFyYzQuVUludDY0KElURU1fU1RBQ0tfU1VQUExZKSwKICAgIHB1c2hieXRlcyAweDAwMDAwMGU4ZDRhNTEwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjU2LTY1OQogICAgLy8gSXRlbVN0YWNrQ3JlYXRlZCgKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzdGFja19hc2EuY3JlYXRlZF9hc3NldC5pZCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoSVRFTV9TVEFDS19TVVBQTFkpLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjY1NS02NjAKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBJdGVtU3RhY2tDcmVhdGVkKAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChzdGFja19hc2EuY3JlYXRlZF9hc3NldC5pZCksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KElURU1fU1RBQ0tfU1VQUExZKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhhZDU1NGNlZSAvLyBtZXRob2QgIkl0ZW1TdGFja0NyZWF0ZWQodWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2NjEKICAgIC8vIHJldHVybiBzdGFja19hc2EuY3JlYXRlZF9hc3NldC5pZAogICAgc3dhcAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5kaXNwZW5zZV9zdGFja19pdGVtcyhyZWNpcGllbnQ6IGJ5dGVzLCBpdGVtX3R5cGU6IGJ5dGVzLCByYXJpdHk6IGJ5dGVzLCBhbW91bnQ6IHVpbnQ2NCkgLT4gdWludDY0OgpkaXNwZW5zZV9zdGFja19pdGVtczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjYzLTY2NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgZGlzcGVuc2Vfc3RhY2tfaXRlbXMoCiAgICAvLyAgICAgc2VsZiwgcmVjaXBpZW50OiBBY2NvdW50LCBpdGVtX3R5cGU6IFN0cmluZywgcmFyaXR5OiBTdHJpbmcsIGFtb3VudDogVUludDY0CiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDQgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2NzIKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5nYW1lX21hc3Rlci52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImdhbWVfbWFzdGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVfbWFzdGVyIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjcxLTY3MwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IHNlbGYuZ2FtZV9tYXN0ZXIudmFsdWUKICAgIC8vICksICJPbmx5IGdhbWUgbWFzdGVyIGNhbiBkaXNwZW5zZSBpdGVtcyIKICAgIGFzc2VydCAvLyBPbmx5IGdhbWUgbWFzdGVyIGNhbiBkaXNwZW5zZSBpdGVtcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2NzQKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlZ2lzdGVyZWRbcmVjaXBpZW50XSwgIlJlY2lwaWVudCBtdXN0IGJlIHJlZ2lzdGVyZWQgcGxheWVyIgogICAgZnJhbWVfZGlnIC00CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX3JlZ2lzdGVyZWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBieXRlY18xIC8vIDB4MDAKICAgICE9CiAgICBhc3NlcnQgLy8gUmVjaXBpZW50IG11c3QgYmUgcmVnaXN0ZXJlZCBwbGF5ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Njc1CiAgICAvLyBhc3NlcnQgYW1vdW50ID4gMCwgIkFtb3VudCBtdXN0IGJlIHBvc2l0aXZlIgogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NlcnQgLy8gQW1vdW50IG11c3QgYmUgcG9zaXRpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Nzc3CiAgICAvLyByZXR1cm4gb3Auc2hhMjU2KGl0ZW1fdHlwZS5ieXRlcyArIGIiOiIgKyByYXJpdHkuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTMKICAgIGJ5dGVjIDIyIC8vIDB4M2EKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2NzgKICAgIC8vIGFzc2VydCBzdGFja19rZXkgaW4gc2VsZi5pdGVtX3N0YWNrcywgIkl0ZW0gc3RhY2sgZG9lcyBub3QgZXhpc3QiCiAgICBieXRlYyAyMyAvLyAweDczCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gSXRlbSBzdGFjayBkb2VzIG5vdCBleGlzdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2NzkKICAgIC8vIHN0YWNrX2Fzc2V0ID0gQXNzZXQoc2VsZi5pdGVtX3N0YWNrc1tzdGFja19rZXldKQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXRlbV9zdGFja3MgZW50cnkgZXhpc3RzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjY4MS02ODYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1yZWNpcGllbnQsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFtb3VudCwKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXN0YWNrX2Fzc2V0LAogICAgLy8gICAgIGZlZT1zZWxmLl9pbm5lcl9mZWUoKSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Njg1CiAgICAvLyBmZWU9c2VsZi5faW5uZXJfZmVlKCksCiAgICBjYWxsc3ViIF9pbm5lcl9mZWUKICAgIGRpZyAxCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBmcmFtZV9kaWcgLTQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2ODEKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjgxLTY4NgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXJlY2lwaWVudCwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9YW1vdW50LAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c3RhY2tfYXNzZXQsCiAgICAvLyAgICAgZmVlPXNlbGYuX2lubmVyX2ZlZSgpLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NjkwCiAgICAvLyBhcmM0LlVJbnQ2NChzdGFja19hc3NldC5pZCksIEFkZHJlc3MocmVjaXBpZW50KSwgYXJjNC5VSW50NjQoYW1vdW50KQogICAgZHVwCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Njg5LTY5MQogICAgLy8gU3RhY2tJdGVtc0Rpc3BlbnNlZCgKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzdGFja19hc3NldC5pZCksIEFkZHJlc3MocmVjaXBpZW50KSwgYXJjNC5VSW50NjQoYW1vdW50KQogICAgLy8gKQogICAgc3dhcAogICAgZnJhbWVfZGlnIC00CiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2ODgtNjkyCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgU3RhY2tJdGVtc0Rpc3BlbnNlZCgKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoc3RhY2tfYXNzZXQuaWQpLCBBZGRyZXNzKHJlY2lwaWVudCksIGFyYzQuVUludDY0KGFtb3VudCkKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhlNTcwYTVlMiAvLyBtZXRob2QgIlN0YWNrSXRlbXNEaXNwZW5zZWQodWludDY0LGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjY5MwogICAgLy8gcmV0dXJuIHN0YWNrX2Fzc2V0LmlkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLnJlY3ljbGVfaXRlbXMoaXRlbXM6IGJ5dGVzLCBob2xkZXJzOiBieXRlcykgLT4gdWludDY0OgpyZWN5Y2xlX2l0ZW1zOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo2OTUtNjk4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiByZWN5Y2xlX2l0ZW1zKAogICAgLy8gICAgIHNlbGYsIGl0ZW1zOiBEeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdLCBob2xkZXJzOiBEeW5hbWljQXJyYXlbQWRkcmVzc10KICAgIC8vICkgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3MDcKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5nYW1lX21hc3Rlci52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gImdhbWVfbWFzdGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVfbWFzdGVyIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzA2LTcwOAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IHNlbGYuZ2FtZV9tYXN0ZXIudmFsdWUKICAgIC8vICksICJPbmx5IGdhbWUgbWFzdGVyIGNhbiByZWN5Y2xlIGl0ZW1zIgogICAgYXNzZXJ0IC8vIE9ubHkgZ2FtZSBtYXN0ZXIgY2FuIHJlY3ljbGUgaXRlbXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzA5CiAgICAvLyBhc3NlcnQgaXRlbXMubGVuZ3RoID09IGhvbGRlcnMubGVuZ3RoLCAiSXRlbXMgYW5kIGhvbGRlcnMgYXJyYXlzIG11c3QgbWF0Y2giCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDEKICAgID09CiAgICBhc3NlcnQgLy8gSXRlbXMgYW5kIGhvbGRlcnMgYXJyYXlzIG11c3QgbWF0Y2gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzEwCiAgICAvLyBhc3NlcnQgaXRlbXMubGVuZ3RoID4gMCwgIk5vdGhpbmcgdG8gcmVjeWNsZSIKICAgIGFzc2VydCAvLyBOb3RoaW5nIHRvIHJlY3ljbGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzEyCiAgICAvLyBhcHBfYWRkcmVzcyA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjcxMwogICAgLy8gZ3JvdXBfc2l6ZSA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzE0LTcxNQogICAgLy8gY2xhd2VkX2JhY2sgPSBVSW50NjQoMCkKICAgIC8vIGZvciBpIGluIHVyYW5nZShpdGVtcy5sZW5ndGgpOgogICAgZHVwbiAyCgpyZWN5Y2xlX2l0ZW1zX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzE1CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoaXRlbXMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyA5CiAgICBmcmFtZV9kaWcgNQogICAgPAogICAgYnogcmVjeWNsZV9pdGVtc19hZnRlcl9mb3JAMTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzE2CiAgICAvLyBpdGVtID0gQXNzZXQoaXRlbXNbaV0ubmF0aXZlKQogICAgZnJhbWVfZGlnIC0yCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDkKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCA4IC8vIDgKICAgICoKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3MTcKICAgIC8vIGhvbGRlciA9IGhvbGRlcnNbaV0ubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBzd2FwCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICAqCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjcxOAogICAgLy8gYXNzZXJ0IGl0ZW0uY3JlYXRvciA9PSBhcHBfYWRkcmVzcywgIkl0ZW0gd2FzIG5vdCBtaW50ZWQgYnkgQWxnb1JlYWxtIgogICAgZHVwCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0Q3JlYXRvcgogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgZnJhbWVfZGlnIDYKICAgIGR1cAogICAgY292ZXIgMwogICAgPT0KICAgIGFzc2VydCAvLyBJdGVtIHdhcyBub3QgbWludGVkIGJ5IEFsZ29SZWFsbQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3MTkKICAgIC8vIGFzc2VydCBpdGVtLnRvdGFsID09IDEsICJPbmx5IHVuaXF1ZSBpdGVtcyBjYW4gYmUgcmVjeWNsZWQiCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0VG90YWwKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgdW5pcXVlIGl0ZW1zIGNhbiBiZSByZWN5Y2xlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3MjEKICAgIC8vIGlmIGhvbGRlciAhPSBhcHBfYWRkcmVzczoKICAgICE9CiAgICBmcmFtZV9kaWcgOAogICAgZnJhbWVfYnVyeSAyCiAgICBmcmFtZV9kaWcgNwogICAgZnJhbWVfYnVyeSAzCiAgICBieiByZWN5Y2xlX2l0ZW1zX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3MjItNzIzCiAgICAvLyAjIEl0ZW1zIG1pbnRlZCBiZWZvcmUgZXZlcnkga2luZCBzZXQgdGhlIGFwcCBhcyBjbGF3YmFjawogICAgLy8gYXNzZXJ0IGl0ZW0uY2xhd2JhY2sgPT0gYXBwX2FkZHJlc3MsICJJdGVtIGNhbm5vdCBiZSBjbGF3ZWQgYmFjayIKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRDbGF3YmFjawogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgZnJhbWVfZGlnIDYKICAgIGR1cAogICAgY292ZXIgMgogICAgPT0KICAgIGFzc2VydCAvLyBJdGVtIGNhbm5vdCBiZSBjbGF3ZWQgYmFjawogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3MjQKICAgIC8vIHNlbGYuX25leHRfaW5uZXJfdHhuKGdyb3VwX3NpemUpCiAgICBmcmFtZV9kaWcgNwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBjYWxsc3ViIF9uZXh0X2lubmVyX3R4bgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3MjUKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X3R5cGVfZW51bShUcmFuc2FjdGlvblR5cGUuQXNzZXRUcmFuc2ZlcikKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3MjYKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X3hmZXJfYXNzZXQoaXRlbSkKICAgIHVuY292ZXIgMgogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzI3CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9hc3NldF9zZW5kZXIoaG9sZGVyKQogICAgZnJhbWVfZGlnIDEKICAgIGl0eG5fZmllbGQgQXNzZXRTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzI4CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9hc3NldF9yZWNlaXZlcihhcHBfYWRkcmVzcykKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3MjkKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2Fzc2V0X2Ftb3VudCgxKQogICAgaW50Y18xIC8vIDEKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzMwCiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9mZWUoMCkgICMgQ292ZXJlZCBieSB0aGUgb3V0ZXIgdHJhbnNhY3Rpb24gZmVlCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzMxCiAgICAvLyBncm91cF9zaXplICs9IDEKICAgIGludGNfMSAvLyAxCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjczMgogICAgLy8gY2xhd2VkX2JhY2sgKz0gMQogICAgZnJhbWVfZGlnIDgKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGZyYW1lX2J1cnkgMwoKcmVjeWNsZV9pdGVtc19hZnRlcl9pZl9lbHNlQDQ6CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfYnVyeSA4CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjczNC03MzUKICAgIC8vICMgUmVsZWFzZSB0aGUgbWV0YWRhdGEgYm94IGFsb25nIHdpdGggdGhlIEFTQQogICAgLy8gaWYgaXRlbS5pZCBpbiBzZWxmLml0ZW1fbWV0YWRhdGE6CiAgICBmcmFtZV9kaWcgNAogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAweDZkCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IHJlY3ljbGVfaXRlbXNfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjczNgogICAgLy8gZGVsIHNlbGYuaXRlbV9tZXRhZGF0YVtpdGVtLmlkXQogICAgZnJhbWVfZGlnIDAKICAgIGJveF9kZWwKICAgIHBvcAoKcmVjeWNsZV9pdGVtc19hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjczOC03MzkKICAgIC8vICMgQW4gYXNzZXQgY29uZmlnIHdpdGggb25seSB0aGUgYXNzZXQgc2V0IGRlc3Ryb3lzIGl0CiAgICAvLyBzZWxmLl9uZXh0X2lubmVyX3R4bihncm91cF9zaXplKQogICAgZnJhbWVfZGlnIDcKICAgIGR1cAogICAgY2FsbHN1YiBfbmV4dF9pbm5lcl90eG4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzQwCiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF90eXBlX2VudW0oVHJhbnNhY3Rpb25UeXBlLkFzc2V0Q29uZmlnKQogICAgaW50Y18yIC8vIGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzQxCiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9jb25maWdfYXNzZXQoaXRlbSkKICAgIGZyYW1lX2RpZyA0CiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojc0MgogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfZmVlKDApICAjIENvdmVyZWQgYnkgdGhlIG91dGVyIHRyYW5zYWN0aW9uIGZlZQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojc0MwogICAgLy8gZ3JvdXBfc2l6ZSArPSAxCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzQ1LTc0NgogICAgLy8gIyBMZWF2ZSByb29tIGZvciB0aGUgbmV4dCBpdGVtJ3MgY2xhd2JhY2sgYW5kIGRlc3Ryb3kKICAgIC8vIGlmIGdyb3VwX3NpemUgPj0gTUFYX0lOTkVSX0dST1VQX1NJWkUgLSAxIG9yIGkgKyAxID09IGl0ZW1zLmxlbmd0aDoKICAgIHB1c2hpbnQgMTUgLy8gMTUKICAgID49CiAgICBibnogcmVjeWNsZV9pdGVtc19pZl9ib2R5QDgKICAgIGZyYW1lX2RpZyA5CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfZGlnIDUKICAgID09CiAgICBieiByZWN5Y2xlX2l0ZW1zX2FmdGVyX2lmX2Vsc2VAOQoKcmVjeWNsZV9pdGVtc19pZl9ib2R5QDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojc0NwogICAgLy8gb3AuSVR4bkNyZWF0ZS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzQ4CiAgICAvLyBncm91cF9zaXplID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSA3CgpyZWN5Y2xlX2l0ZW1zX2FmdGVyX2lmX2Vsc2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzE1CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoaXRlbXMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyA5CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA5CiAgICBiIHJlY3ljbGVfaXRlbXNfZm9yX2hlYWRlckAxCgpyZWN5Y2xlX2l0ZW1zX2FmdGVyX2ZvckAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzUwCiAgICAvLyBzZWxmLnRvdGFsX2l0ZW1zX3JlY3ljbGVkLnZhbHVlICs9IGl0ZW1zLmxlbmd0aAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE1IC8vICJ0b3RhbF9pdGVtc19yZWN5Y2xlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9pdGVtc19yZWN5Y2xlZCBleGlzdHMKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGNvdmVyIDIKICAgICsKICAgIGJ5dGVjIDE1IC8vICJ0b3RhbF9pdGVtc19yZWN5Y2xlZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojc1MQogICAgLy8gYXJjNC5lbWl0KEl0ZW1zUmVjeWNsZWQoYXJjNC5VSW50NjQoaXRlbXMubGVuZ3RoKSwgYXJjNC5VSW50NjQoY2xhd2VkX2JhY2spKSkKICAgIGR1cAogICAgaXRvYgogICAgZnJhbWVfZGlnIDgKICAgIGl0b2IKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4ZWIwMjE0NzUgLy8gbWV0aG9kICJJdGVtc1JlY3ljbGVkKHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzUyCiAgICAvLyByZXR1cm4gaXRlbXMubGVuZ3RoCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uY29udHJhY3QuQWxnb1JlYWxtR2FtZU1hbmFnZXIuX2lubmVyX2ZlZSgpIC0+IHVpbnQ2NDoKX2lubmVyX2ZlZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzU2LTc1NwogICAgLy8gIyAwIGRyYXdzIG9uIHRoZSBmZWUgY3JlZGl0IHBvb2xlZCBieSB0aGUgb3V0ZXIgdHJhbnNhY3Rpb24KICAgIC8vIGlmIHNlbGYucG9vbF9pbm5lcl9mZWVzLnZhbHVlOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE4IC8vICJwb29sX2lubmVyX2ZlZXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucG9vbF9pbm5lcl9mZWVzIGV4aXN0cwogICAgYnl0ZWNfMSAvLyAweDAwCiAgICAhPQogICAgYnogX2lubmVyX2ZlZV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzU4CiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgcmV0c3ViCgpfaW5uZXJfZmVlX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzU5CiAgICAvLyByZXR1cm4gR2xvYmFsLm1pbl90eG5fZmVlCiAgICBnbG9iYWwgTWluVHhuRmVlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLl9uZXh0X2lubmVyX3R4bihncm91cF9zaXplOiB1aW50NjQpIC0+IHZvaWQ6Cl9uZXh0X2lubmVyX3R4bjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzYxLTc2MgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfbmV4dF9pbm5lcl90eG4oc2VsZiwgZ3JvdXBfc2l6ZTogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojc2MwogICAgLy8gaWYgZ3JvdXBfc2l6ZSA9PSAwOgogICAgZnJhbWVfZGlnIC0xCiAgICBibnogX25leHRfaW5uZXJfdHhuX2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojc2NAogICAgLy8gb3AuSVR4bkNyZWF0ZS5iZWdpbigpCiAgICBpdHhuX2JlZ2luCiAgICByZXRzdWIKCl9uZXh0X2lubmVyX3R4bl9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzY2CiAgICAvLyBvcC5JVHhuQ3JlYXRlLm5leHQoKQogICAgaXR4bl9uZXh0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLmdldF9pdGVtX3N0YWNrKGl0ZW1fdHlwZTogYnl0ZXMsIHJhcml0eTogYnl0ZXMpIC0+IHVpbnQ2NDoKZ2V0X2l0ZW1fc3RhY2s6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojc2OC03NjkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfaXRlbV9zdGFjayhzZWxmLCBpdGVtX3R5cGU6IFN0cmluZywgcmFyaXR5OiBTdHJpbmcpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3NzcKICAgIC8vIHJldHVybiBvcC5zaGEyNTYoaXRlbV90eXBlLmJ5dGVzICsgYiI6IiArIHJhcml0eS5ieXRlcykKICAgIGZyYW1lX2RpZyAtMgogICAgYnl0ZWMgMjIgLy8gMHgzYQogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojc3MQogICAgLy8gcmV0dXJuIHNlbGYuaXRlbV9zdGFja3MuZ2V0KAogICAgYnl0ZWMgMjMgLy8gMHg3MwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3NzEtNzczCiAgICAvLyByZXR1cm4gc2VsZi5pdGVtX3N0YWNrcy5nZXQoCiAgICAvLyAgICAgc2VsZi5fc3RhY2tfa2V5KGl0ZW1fdHlwZSwgcmFyaXR5KSwgZGVmYXVsdD1VSW50NjQoMCkKICAgIC8vICkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3NzIKICAgIC8vIHNlbGYuX3N0YWNrX2tleShpdGVtX3R5cGUsIHJhcml0eSksIGRlZmF1bHQ9VUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3NzEtNzczCiAgICAvLyByZXR1cm4gc2VsZi5pdGVtX3N0YWNrcy5nZXQoCiAgICAvLyAgICAgc2VsZi5fc3RhY2tfa2V5KGl0ZW1fdHlwZSwgcmFyaXR5KSwgZGVmYXVsdD1VSW50NjQoMCkKICAgIC8vICkKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLmdldF9pdGVtX21ldGFkYXRhKGl0ZW1faWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF9pdGVtX21ldGFkYXRhOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3NzktNzgwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2l0ZW1fbWV0YWRhdGEoc2VsZiwgaXRlbV9pZDogVUludDY0KSAtPiBJdGVtTWV0YWRhdGE6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzgyCiAgICAvLyBhc3NlcnQgaXRlbV9pZCBpbiBzZWxmLml0ZW1fbWV0YWRhdGEsICJJdGVtIGhhcyBubyBtZXRhZGF0YSIKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAweDZkCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gSXRlbSBoYXMgbm8gbWV0YWRhdGEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6NzgzCiAgICAvLyByZXR1cm4gc2VsZi5pdGVtX21ldGFkYXRhW2l0ZW1faWRdCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pdGVtX21ldGFkYXRhIGVudHJ5IGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5nZXRfZWZmZWN0KGVmZmVjdF9pZDogdWludDY0KSAtPiBieXRlczoKZ2V0X2VmZmVjdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6Nzg1LTc4NgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9lZmZlY3Qoc2VsZiwgZWZmZWN0X2lkOiBVSW50NjQpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo3ODgKICAgIC8vIHJldHVybiBzZWxmLmVmZmVjdF90YWJsZS5nZXQoZWZmZWN0X2lkLCBkZWZhdWx0PVN0cmluZygpKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBwdXNoYnl0ZXMgMHg2NQogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBwdXNoYnl0ZXMgIiIKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5nZXRfcGxheWVyX3N0YXRzKHBsYXllcjogYnl0ZXMpIC0+IHVpbnQ2NCwgdWludDY0LCB1aW50NjQ6CmdldF9wbGF5ZXJfc3RhdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjgzMS04MzIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfcGxheWVyX3N0YXRzKHNlbGYsIHBsYXllcjogQWNjb3VudCkgLT4gdHVwbGVbVUludDY0LCBVSW50NjQsIFVJbnQ2NF06CiAgICBwcm90byAxIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODM0CiAgICAvLyBhc3NlcnQgc2VsZi5pc19yZWdpc3RlcmVkW3BsYXllcl0sICJQbGF5ZXIgbm90IHJlZ2lzdGVyZWQiCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJpc19yZWdpc3RlcmVkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXNfcmVnaXN0ZXJlZCBleGlzdHMgZm9yIGFjY291bnQKICAgIGJ5dGVjXzEgLy8gMHgwMAogICAgIT0KICAgIGFzc2VydCAvLyBQbGF5ZXIgbm90IHJlZ2lzdGVyZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODM2CiAgICAvLyBzZWxmLnBsYXllcl9sZXZlbFtwbGF5ZXJdLAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTkgLy8gInBsYXllcl9sZXZlbCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBsYXllcl9sZXZlbCBleGlzdHMgZm9yIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODM3CiAgICAvLyBzZWxmLnBsYXllcl9leHBlcmllbmNlW3BsYXllcl0sCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMCAvLyAicGxheWVyX2V4cGVyaWVuY2UiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wbGF5ZXJfZXhwZXJpZW5jZSBleGlzdHMgZm9yIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODM4CiAgICAvLyBzZWxmLl9zZWFzb25fcmVjb3ZlcnlfY291bnQocGxheWVyKSwKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfc2Vhc29uX3JlY292ZXJ5X2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjgzNS04MzkKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgc2VsZi5wbGF5ZXJfbGV2ZWxbcGxheWVyXSwKICAgIC8vICAgICBzZWxmLnBsYXllcl9leHBlcmllbmNlW3BsYXllcl0sCiAgICAvLyAgICAgc2VsZi5fc2Vhc29uX3JlY292ZXJ5X2NvdW50KHBsYXllciksCiAgICAvLyApCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLmFkdmFuY2Vfc2Vhc29uKCkgLT4gdWludDY0OgphZHZhbmNlX3NlYXNvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODQ4CiAgICAvLyBUeG4uc2VuZGVyID09IHNlbGYuZ2FtZV9tYXN0ZXIudmFsdWUKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJnYW1lX21hc3RlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nYW1lX21hc3RlciBleGlzdHMKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojg0Ny04NDkKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBzZWxmLmdhbWVfbWFzdGVyLnZhbHVlCiAgICAvLyApLCAiT25seSBnYW1lIG1hc3RlciBjYW4gYWR2YW5jZSBzZWFzb24iCiAgICBhc3NlcnQgLy8gT25seSBnYW1lIG1hc3RlciBjYW4gYWR2YW5jZSBzZWFzb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODUwCiAgICAvLyBzZWxmLmN1cnJlbnRfc2Vhc29uLnZhbHVlICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJjdXJyZW50X3NlYXNvbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jdXJyZW50X3NlYXNvbiBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyA0IC8vICJjdXJyZW50X3NlYXNvbiIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4NTEKICAgIC8vIGFyYzQuZW1pdChTZWFzb25BZHZhbmNlZChhcmM0LlVJbnQ2NChzZWxmLmN1cnJlbnRfc2Vhc29uLnZhbHVlKSkpCiAgICBkdXAKICAgIGl0b2IKICAgIHB1c2hieXRlcyAweGMzZjk1YTAwIC8vIG1ldGhvZCAiU2Vhc29uQWR2YW5jZWQodWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojg1MgogICAgLy8gcmV0dXJuIHNlbGYuY3VycmVudF9zZWFzb24udmFsdWUKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uY29udHJhY3QuQWxnb1JlYWxtR2FtZU1hbmFnZXIuZ2V0X2dhbWVfaW5mbygpIC0+IHVpbnQ2NCwgdWludDY0LCB1aW50NjQ6CmdldF9nYW1lX2luZm86CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojg1OAogICAgLy8gc2VsZi50b3RhbF9wbGF5ZXJzLnZhbHVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gInRvdGFsX3BsYXllcnMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfcGxheWVycyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODU5CiAgICAvLyBzZWxmLnRvdGFsX2l0ZW1zX2NyZWF0ZWQudmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAidG90YWxfaXRlbXNfY3JlYXRlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9pdGVtc19jcmVhdGVkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4NjAKICAgIC8vIHNlbGYuY3VycmVudF9zZWFzb24udmFsdWUsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiY3VycmVudF9zZWFzb24iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3VycmVudF9zZWFzb24gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojg1Ny04NjEKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgc2VsZi50b3RhbF9wbGF5ZXJzLnZhbHVlLAogICAgLy8gICAgIHNlbGYudG90YWxfaXRlbXNfY3JlYXRlZC52YWx1ZSwKICAgIC8vICAgICBzZWxmLmN1cnJlbnRfc2Vhc29uLnZhbHVlLAogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5jbGFpbV9pdGVtKGl0ZW1faWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmNsYWltX2l0ZW06CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojg2My04NjQKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNsYWltX2l0ZW0oc2VsZiwgaXRlbV9pZDogQXNzZXQpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4NjkKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlZ2lzdGVyZWRbVHhuLnNlbmRlcl0sICJPbmx5IHJlZ2lzdGVyZWQgcGxheWVycyBjYW4gY2xhaW0gaXRlbXMiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiaXNfcmVnaXN0ZXJlZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX3JlZ2lzdGVyZWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBieXRlY18xIC8vIDB4MDAKICAgICE9CiAgICBhc3NlcnQgLy8gT25seSByZWdpc3RlcmVkIHBsYXllcnMgY2FuIGNsYWltIGl0ZW1zCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojg3MS04NzIKICAgIC8vICMgVmVyaWZ5IHRoZSBhc3NldCBleGlzdHMKICAgIC8vIG1hbmFnZXJfcmVzcG9uc2UgPSBvcC5Bc3NldFBhcmFtc0dldC5hc3NldF9tYW5hZ2VyKGl0ZW1faWQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRNYW5hZ2VyCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODczCiAgICAvLyBhc3NlcnQgbWFuYWdlcl9yZXNwb25zZVswXSwgIkFzc2V0IG5vdCBmb3VuZCIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgIT0KICAgIGFzc2VydCAvLyBBc3NldCBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODc0LTg3NgogICAgLy8gIyBOb3RlOiBJbiBwcm9kdWN0aW9uLCBzaG91bGQgdmVyaWZ5IGFzc2V0IGlzIG1hbmFnZWQgYnkgdGhpcyBjb250cmFjdAogICAgLy8gIyBTdGFja2FibGUgaXRlbXMgYXJlIHNlbnQgd2l0aCBkaXNwZW5zZV9zdGFja19pdGVtcywgbmV2ZXIgY2xhaW1lZAogICAgLy8gdG90YWwsIF9leGlzdHMgPSBvcC5Bc3NldFBhcmFtc0dldC5hc3NldF90b3RhbChpdGVtX2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0VG90YWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4NzcKICAgIC8vIGFzc2VydCB0b3RhbCA9PSAxLCAiU3RhY2thYmxlIGl0ZW1zIGNhbm5vdCBiZSBjbGFpbWVkIgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gU3RhY2thYmxlIGl0ZW1zIGNhbm5vdCBiZSBjbGFpbWVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojg3OS04ODUKICAgIC8vICMgVHJhbnNmZXIgaXRlbSB0byB0aGUgcGxheWVyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9VUludDY0KDEpLAogICAgLy8gICAgIHhmZXJfYXNzZXQ9aXRlbV9pZCwKICAgIC8vICAgICBmZWU9c2VsZi5faW5uZXJfZmVlKCksCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojg4NAogICAgLy8gZmVlPXNlbGYuX2lubmVyX2ZlZSgpLAogICAgY2FsbHN1YiBfaW5uZXJfZmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojg4MQogICAgLy8gYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODgyCiAgICAvLyBhc3NldF9hbW91bnQ9VUludDY0KDEpLAogICAgaW50Y18xIC8vIDEKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4NzktODgwCiAgICAvLyAjIFRyYW5zZmVyIGl0ZW0gdG8gdGhlIHBsYXllcgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4NzktODg1CiAgICAvLyAjIFRyYW5zZmVyIGl0ZW0gdG8gdGhlIHBsYXllcgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PVVJbnQ2NCgxKSwKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWl0ZW1faWQsCiAgICAvLyAgICAgZmVlPXNlbGYuX2lubmVyX2ZlZSgpLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODg3CiAgICAvLyBhcmM0LmVtaXQoSXRlbUNsYWltZWQoYXJjNC5VSW50NjQoaXRlbV9pZC5pZCksIEFkZHJlc3MoVHhuLnNlbmRlcikpKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJ5dGVjIDI2IC8vIG1ldGhvZCAiSXRlbUNsYWltZWQodWludDY0LGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6ODg4CiAgICAvLyByZXR1cm4gU3RyaW5nKCJJdGVtIHN1Y2Nlc3NmdWxseSBjbGFpbWVkISIpCiAgICBwdXNoYnl0ZXMgIkl0ZW0gc3VjY2Vzc2Z1bGx5IGNsYWltZWQhIgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5kZWxpdmVyX2l0ZW0oaXRlbV9pZDogdWludDY0LCBwbGF5ZXI6IGJ5dGVzKSAtPiB2b2lkOgpkZWxpdmVyX2l0ZW06CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojg5MC04OTEKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGRlbGl2ZXJfaXRlbShzZWxmLCBpdGVtX2lkOiBBc3NldCwgcGxheWVyOiBBY2NvdW50KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojg5OAogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLmdhbWVfbWFzdGVyLnZhbHVlCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiZ2FtZV9tYXN0ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ2FtZV9tYXN0ZXIgZXhpc3RzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo4OTctODk5CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0gc2VsZi5nYW1lX21hc3Rlci52YWx1ZQogICAgLy8gKSwgIk9ubHkgZ2FtZSBtYXN0ZXIgY2FuIGRlbGl2ZXIgaXRlbXMiCiAgICBhc3NlcnQgLy8gT25seSBnYW1lIG1hc3RlciBjYW4gZGVsaXZlciBpdGVtcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MDAKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlZ2lzdGVyZWRbcGxheWVyXSwgIlBsYXllciBub3QgcmVnaXN0ZXJlZCIKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImlzX3JlZ2lzdGVyZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19yZWdpc3RlcmVkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgYnl0ZWNfMSAvLyAweDAwCiAgICAhPQogICAgYXNzZXJ0IC8vIFBsYXllciBub3QgcmVnaXN0ZXJlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MDIKICAgIC8vIGNyZWF0b3IsIGV4aXN0cyA9IG9wLkFzc2V0UGFyYW1zR2V0LmFzc2V0X2NyZWF0b3IoaXRlbV9pZCkKICAgIGZyYW1lX2RpZyAtMgogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldENyZWF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTAzCiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiQXNzZXQgbm90IGZvdW5kIgogICAgYXNzZXJ0IC8vIEFzc2V0IG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MDUKICAgIC8vIGNyZWF0b3IgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjkwNC05MDYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgY3JlYXRvciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAiSXRlbSB3YXMgbm90IGNyZWF0ZWQgYnkgQWxnb1JlYWxtIgogICAgYXNzZXJ0IC8vIEl0ZW0gd2FzIG5vdCBjcmVhdGVkIGJ5IEFsZ29SZWFsbQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MDcKICAgIC8vIHRvdGFsLCBfZXhpc3RzID0gb3AuQXNzZXRQYXJhbXNHZXQuYXNzZXRfdG90YWwoaXRlbV9pZCkKICAgIGZyYW1lX2RpZyAtMgogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldFRvdGFsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTA4CiAgICAvLyBhc3NlcnQgdG90YWwgPT0gMSwgIlN0YWNrYWJsZSBpdGVtcyBjYW5ub3QgYmUgY2xhaW1lZCIKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIFN0YWNrYWJsZSBpdGVtcyBjYW5ub3QgYmUgY2xhaW1lZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MTAtOTE1CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9cGxheWVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1VSW50NjQoMSksCiAgICAvLyAgICAgeGZlcl9hc3NldD1pdGVtX2lkLAogICAgLy8gICAgIGZlZT1zZWxmLl9pbm5lcl9mZWUoKSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTE0CiAgICAvLyBmZWU9c2VsZi5faW5uZXJfZmVlKCksCiAgICBjYWxsc3ViIF9pbm5lcl9mZWUKICAgIGZyYW1lX2RpZyAtMgogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTEyCiAgICAvLyBhc3NldF9hbW91bnQ9VUludDY0KDEpLAogICAgaW50Y18xIC8vIDEKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjkxMAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MTAtOTE1CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9cGxheWVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1VSW50NjQoMSksCiAgICAvLyAgICAgeGZlcl9hc3NldD1pdGVtX2lkLAogICAgLy8gICAgIGZlZT1zZWxmLl9pbm5lcl9mZWUoKSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjkxNwogICAgLy8gYXJjNC5lbWl0KEl0ZW1DbGFpbWVkKGFyYzQuVUludDY0KGl0ZW1faWQuaWQpLCBBZGRyZXNzKHBsYXllcikpKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYnl0ZWMgMjYgLy8gbWV0aG9kICJJdGVtQ2xhaW1lZCh1aW50NjQsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5nZXRfcmVjb3Zlcnlfc3RhdHVzKHBsYXllcjogYnl0ZXMpIC0+IHVpbnQ2NCwgdWludDY0OgpnZXRfcmVjb3Zlcnlfc3RhdHVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MTktOTIwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3JlY292ZXJ5X3N0YXR1cyhzZWxmLCBwbGF5ZXI6IEFjY291bnQpIC0+IHR1cGxlW1VJbnQ2NCwgVUludDY0XToKICAgIHByb3RvIDEgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MjIKICAgIC8vIGFzc2VydCBzZWxmLmlzX3JlZ2lzdGVyZWRbcGxheWVyXSwgIlBsYXllciBub3QgcmVnaXN0ZXJlZCIKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImlzX3JlZ2lzdGVyZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19yZWdpc3RlcmVkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgYnl0ZWNfMSAvLyAweDAwCiAgICAhPQogICAgYXNzZXJ0IC8vIFBsYXllciBub3QgcmVnaXN0ZXJlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MjMKICAgIC8vIHJldHVybiBzZWxmLl9zZWFzb25fcmVjb3ZlcnlfY291bnQocGxheWVyKSwgc2VsZi5tYXhfcmVjb3ZlcnlfcGVyX2l0ZW0udmFsdWUKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfc2Vhc29uX3JlY292ZXJ5X2NvdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTYgLy8gIm1heF9yZWNvdmVyeV9wZXJfaXRlbSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5tYXhfcmVjb3ZlcnlfcGVyX2l0ZW0gZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmNvbnRyYWN0LkFsZ29SZWFsbUdhbWVNYW5hZ2VyLmdldF9hY3Rpb25fY29vbGRvd24ocGxheWVyOiBieXRlcywgYWN0aW9uOiB1aW50NjQpIC0+IHVpbnQ2NDoKZ2V0X2FjdGlvbl9jb29sZG93bjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTI1LTkyNgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hY3Rpb25fY29vbGRvd24oc2VsZiwgcGxheWVyOiBBY2NvdW50LCBhY3Rpb246IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MjgKICAgIC8vIGFzc2VydCBhY3Rpb24gPCBBQ1RJT05fQ0xPQ0tfU0laRSAvLyA4LCAiVW5rbm93biBhY3Rpb24iCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgMiAvLyAyCiAgICA8CiAgICBhc3NlcnQgLy8gVW5rbm93biBhY3Rpb24KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTI5CiAgICAvLyBpbnRlcnZhbCA9IHNlbGYuc2Vhc29uYWxfcmVpc3N1ZV9pbnRlcnZhbC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDkgLy8gInNlYXNvbmFsX3JlaXNzdWVfaW50ZXJ2YWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc2Vhc29uYWxfcmVpc3N1ZV9pbnRlcnZhbCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTMwCiAgICAvLyBpZiBhY3Rpb24gPT0gQUNUSU9OX0NSQUZUX0lURU1TOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IGdldF9hY3Rpb25fY29vbGRvd25fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjkzMQogICAgLy8gaW50ZXJ2YWwgPSBzZWxmLmNyYWZ0X2ludGVydmFsLnZhbHVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTAgLy8gImNyYWZ0X2ludGVydmFsIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMwogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JhZnRfaW50ZXJ2YWwgZXhpc3RzCgpnZXRfYWN0aW9uX2Nvb2xkb3duX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTMzCiAgICAvLyBjbG9jayA9IHNlbGYuYWN0aW9uX2Nsb2NrLmdldChwbGF5ZXIsIG9wLmJ6ZXJvKEFDVElPTl9DTE9DS19TSVpFKSkKICAgIGludGNfMyAvLyAxNgogICAgYnplcm8KICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE0IC8vICJhY3Rpb25fY2xvY2siCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTM0CiAgICAvLyBlYXJsaWVzdCA9IG9wLmV4dHJhY3RfdWludDY0KGNsb2NrLCBhY3Rpb24gKiA4KSArIGludGVydmFsCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgOCAvLyA4CiAgICAqCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIDMKICAgIGR1cAogICAgY292ZXIgMgogICAgKwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTM1CiAgICAvLyBhbGxvd2FuY2UgPSBpbnRlcnZhbCAqIHNlbGYucmF0ZV9saW1pdF9idXJzdC52YWx1ZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJyYXRlX2xpbWl0X2J1cnN0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJhdGVfbGltaXRfYnVyc3QgZXhpc3RzCiAgICAqCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MzYKICAgIC8vIG5vdyA9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MzcKICAgIC8vIGlmIGVhcmxpZXN0IDw9IG5vdyArIGFsbG93YW5jZToKICAgICsKICAgIDw9CiAgICBieiBnZXRfYWN0aW9uX2Nvb2xkb3duX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5MzgKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKZ2V0X2FjdGlvbl9jb29sZG93bl9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5OjkzOQogICAgLy8gcmV0dXJuIGVhcmxpZXN0IC0gbm93IC0gYWxsb3dhbmNlCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDIKICAgIC0KICAgIGZyYW1lX2RpZyAwCiAgICAtCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uY29udHJhY3QuQWxnb1JlYWxtR2FtZU1hbmFnZXIuX2NvbnN1bWVfcmF0ZV9saW1pdChhY3Rpb246IHVpbnQ2NCwgaW50ZXJ2YWw6IHVpbnQ2NCkgLT4gdm9pZDoKX2NvbnN1bWVfcmF0ZV9saW1pdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTQxLTk0MgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfY29uc3VtZV9yYXRlX2xpbWl0KHNlbGYsIGFjdGlvbjogVUludDY0LCBpbnRlcnZhbDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojk0My05NDcKICAgIC8vICMgVG9rZW4gYnVja2V0IGtlcHQgYXMgYSBzaW5nbGUgInRoZW9yZXRpY2FsIGFycml2YWwgdGltZSIgcGVyIGFjdGlvbjoKICAgIC8vICMgZWFjaCB1c2UgcHVzaGVzIGl0IGludGVydmFsIHNlY29uZHMgYWhlYWQgb2YgbWF4KGl0LCBub3cpLCBhbmQgYSB1c2UKICAgIC8vICMgaXMgYWxsb3dlZCB3aGlsZSBpdCBzdGF5cyB3aXRoaW4gYnVyc3QgaW50ZXJ2YWxzIG9mIG5vdy4gT25lIHJlYWQsCiAgICAvLyAjIG9uZSBjb21wYXJlIGFuZCBvbmUgd3JpdGUsIGhvd2V2ZXIgbWFueSBhY3Rpb25zIHRoZSBwbGF5ZXIgdGFrZXMKICAgIC8vIGNsb2NrID0gc2VsZi5hY3Rpb25fY2xvY2suZ2V0KFR4bi5zZW5kZXIsIG9wLmJ6ZXJvKEFDVElPTl9DTE9DS19TSVpFKSkKICAgIHR4biBTZW5kZXIKICAgIGludGNfMyAvLyAxNgogICAgYnplcm8KICAgIHN3YXAKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNCAvLyAiYWN0aW9uX2Nsb2NrIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgc2VsZWN0CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTQ4CiAgICAvLyBvZmZzZXQgPSBhY3Rpb24gKiA4CiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hpbnQgOCAvLyA4CiAgICAqCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTQ5CiAgICAvLyBub3cgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojk1MAogICAgLy8gYXJyaXZhbCA9IG9wLmV4dHJhY3RfdWludDY0KGNsb2NrLCBvZmZzZXQpCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5NTEKICAgIC8vIGlmIGFycml2YWwgPCBub3c6CiAgICA8CiAgICBieiBfY29uc3VtZV9yYXRlX2xpbWl0X2FmdGVyX2lmX2Vsc2VAMgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2J1cnkgMwoKX2NvbnN1bWVfcmF0ZV9saW1pdF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojk1MwogICAgLy8gYXJyaXZhbCArPSBpbnRlcnZhbAogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5NTUKICAgIC8vIGFycml2YWwgLSBub3cgPD0gaW50ZXJ2YWwgKiBzZWxmLnJhdGVfbGltaXRfYnVyc3QudmFsdWUKICAgIGR1cAogICAgZnJhbWVfZGlnIDIKICAgIC0KICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAicmF0ZV9saW1pdF9idXJzdCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yYXRlX2xpbWl0X2J1cnN0IGV4aXN0cwogICAgZnJhbWVfZGlnIC0xCiAgICAqCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9jb250cmFjdC5weTo5NTQtOTU2CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGFycml2YWwgLSBub3cgPD0gaW50ZXJ2YWwgKiBzZWxmLnJhdGVfbGltaXRfYnVyc3QudmFsdWUKICAgIC8vICksICJSYXRlIGxpbWl0IGV4Y2VlZGVkIC0gdHJ5IGFnYWluIGxhdGVyIgogICAgYXNzZXJ0IC8vIFJhdGUgbGltaXQgZXhjZWVkZWQgLSB0cnkgYWdhaW4gbGF0ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTU3CiAgICAvLyBzZWxmLmFjdGlvbl9jbG9ja1tUeG4uc2VuZGVyXSA9IG9wLnJlcGxhY2UoY2xvY2ssIG9mZnNldCwgb3AuaXRvYihhcnJpdmFsKSkKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMQogICAgdW5jb3ZlciAyCiAgICByZXBsYWNlMwogICAgdHhuIFNlbmRlcgogICAgYnl0ZWMgMTQgLy8gImFjdGlvbl9jbG9jayIKICAgIHVuY292ZXIgMgogICAgYXBwX2xvY2FsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5jb250cmFjdC5BbGdvUmVhbG1HYW1lTWFuYWdlci5fc2Vhc29uX3JlY292ZXJ5X2NvdW50KHBsYXllcjogYnl0ZXMpIC0+IHVpbnQ2NDoKX3NlYXNvbl9yZWNvdmVyeV9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vY29udHJhY3QucHk6OTU5LTk2MAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfc2Vhc29uX3JlY292ZXJ5X2NvdW50KHNlbGYsIHBsYXllcjogQWNjb3VudCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojk2MS05NjMKICAgIC8vICMgQ291bnRlcnMgc3RhbXBlZCB3aXRoIGFuIGVhcmxpZXIgc2Vhc29uIGFyZSBzdGFsZSBhbmQgY291bnQgYXMgemVybywKICAgIC8vICMgc28gYWR2YW5jZV9zZWFzb24gbmV2ZXIgaGFzIHRvIHRvdWNoIHBsYXllciBhY2NvdW50cwogICAgLy8gaWYgc2VsZi5wbGF5ZXJfc2Vhc29uLmdldChwbGF5ZXIsIFVJbnQ2NCgwKSkgIT0gc2VsZi5jdXJyZW50X3NlYXNvbi52YWx1ZToKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vICJwbGF5ZXJfc2Vhc29uIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gImN1cnJlbnRfc2Vhc29uIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmN1cnJlbnRfc2Vhc29uIGV4aXN0cwogICAgIT0KICAgIGJ6IF9zZWFzb25fcmVjb3ZlcnlfY291bnRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojk2NAogICAgLy8gcmV0dXJuIFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIHJldHN1YgoKX3NlYXNvbl9yZWNvdmVyeV9jb3VudF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2NvbnRyYWN0LnB5Ojk2NQogICAgLy8gcmV0dXJuIHNlbGYucGxheWVyX3JlY292ZXJ5X2NvdW50W3BsYXllcl0KICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEyIC8vICJwbGF5ZXJfcmVjb3ZlcnlfY291bnQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wbGF5ZXJfcmVjb3ZlcnlfY291bnQgZXhpc3RzIGZvciBhY2NvdW50CiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [3167], "errorMessage": "Amount must be positive"}, {"pc": [3692, 3787], "errorMessage": "Asset not found"}, {"pc": [1934], "errorMessage": "Attack power does not fit in uint16"}, {"pc": [1453], "errorMessage": "Burst must be at least 1"}, {"pc": [2598], "errorMessage": "Cannot get original item name"}, {"pc": [1940], "errorMessage": "Defense power does not fit in uint16"}, {"pc": [2218], "errorMessage": "Effect table is full"}, {"pc": [3307], "errorMessage": "Index access is out of bounds"}, {"pc": [1670], "errorMessage": "Insufficient MBR payment"}, {"pc": [3354], "errorMessage": "Item cannot be clawed back"}, {"pc": [3570], "errorMessage": "Item has no metadata"}, {"pc": [2713], "errorMessage": "Item recovered too many times"}, {"pc": [3185], "errorMessage": "Item stack does not exist"}, {"pc": [3791], "errorMessage": "Item was not created by AlgoRealm"}, {"pc": [3323], "errorMessage": "Item was not minted by AlgoRealm"}, {"pc": [3262], "errorMessage": "Items and holders arrays must match"}, {"pc": [1655], "errorMessage": "MBR payment must come from the player"}, {"pc": [1648], "errorMessage": "MBR payment must go to the game contract"}, {"pc": [1838], "errorMessage": "Must provide a request key"}, {"pc": [2808], "errorMessage": "Must provide participation proof"}, {"pc": [2509], "errorMessage": "Must provide recovery quest proof"}, {"pc": [3263], "errorMessage": "Nothing to recycle"}, {"pc": [567, 594, 621, 645, 675, 705, 722, 758, 786, 806, 835, 858, 897, 926, 959, 994, 1029, 1052, 1113, 1168, 1198, 1253, 1268, 1292, 1316], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [1223], "errorMessage": "OnCompletion is not one of NoOp, OptIn"}, {"pc": [3631], "errorMessage": "Only game master can advance season"}, {"pc": [1480], "errorMessage": "Only game master can configure fee pooling"}, {"pc": [1450], "errorMessage": "Only game master can configure rate limits"}, {"pc": [1428], "errorMessage": "Only game master can configure systems"}, {"pc": [3014], "errorMessage": "Only game master can create item stacks"}, {"pc": [1832, 1919], "errorMessage": "Only game master can create items"}, {"pc": [3773], "errorMessage": "Only game master can deliver items"}, {"pc": [3155], "errorMessage": "Only game master can dispense items"}, {"pc": [3249], "errorMessage": "Only game master can recycle items"}, {"pc": [3683], "errorMessage": "Only registered players can claim items"}, {"pc": [2925], "errorMessage": "Only registered players can craft"}, {"pc": [2802], "errorMessage": "Only registered players can participate"}, {"pc": [2496], "errorMessage": "Only registered players can recover items"}, {"pc": [3329], "errorMessage": "Only unique items can be recycled"}, {"pc": [2503], "errorMessage": "Original item not found"}, {"pc": [1628], "errorMessage": "Player name already taken"}, {"pc": [1609], "errorMessage": "Player name must not be empty"}, {"pc": [1614], "errorMessage": "Player name too long"}, {"pc": [3603, 3782, 3845], "errorMessage": "Player not registered"}, {"pc": [2515], "errorMessage": "Quest system not configured"}, {"pc": [4012], "errorMessage": "Rate limit exceeded - try again later"}, {"pc": [1928, 3164], "errorMessage": "Recipient must be registered player"}, {"pc": [2591], "errorMessage": "Recovery limit reached - max 3 recoveries per player per season"}, {"pc": [2578], "errorMessage": "Recovery quest not completed"}, {"pc": [1631], "errorMessage": "Registration requires an MBR payment"}, {"pc": [3048], "errorMessage": "Stack name too long"}, {"pc": [3700, 3799], "errorMessage": "Stackable items cannot be claimed"}, {"pc": [3869], "errorMessage": "Unknown action"}, {"pc": [2476], "errorMessage": "Unknown item type"}, {"pc": [2337], "errorMessage": "Unknown rarity"}, {"pc": [2575], "errorMessage": "application log value is not the result of an ABI return"}, {"pc": [3316, 3326, 3347], "errorMessage": "asset exists"}, {"pc": [1320], "errorMessage": "can only call when creating"}, {"pc": [570, 597, 624, 648, 678, 708, 725, 761, 789, 809, 838, 861, 900, 929, 962, 997, 1032, 1055, 1116, 1171, 1201, 1226, 1256, 1271, 1295], "errorMessage": "can only call when not creating"}, {"pc": [2930, 3889], "errorMessage": "check self.craft_interval exists"}, {"pc": [1519, 1708, 2760, 3636, 3670, 4046], "errorMessage": "check self.current_season exists"}, {"pc": [2202], "errorMessage": "check self.effect_ids entry exists"}, {"pc": [1426, 1448, 1478, 1830, 1917, 3012, 3153, 3247, 3629, 3771], "errorMessage": "check self.game_master exists"}, {"pc": [1571, 1925, 2493, 2799, 2922, 3161, 3600, 3680, 3779, 3842], "errorMessage": "check self.is_registered exists for account"}, {"pc": [2704, 3572], "errorMessage": "check self.item_metadata entry exists"}, {"pc": [3037, 3187], "errorMessage": "check self.item_stacks entry exists"}, {"pc": [2589, 3855], "errorMessage": "check self.max_recovery_per_item exists"}, {"pc": [3617], "errorMessage": "check self.player_experience exists for account"}, {"pc": [3610], "errorMessage": "check self.player_level exists for account"}, {"pc": [4059], "errorMessage": "check self.player_recovery_count exists for account"}, {"pc": [3508], "errorMessage": "check self.pool_inner_fees exists"}, {"pc": [2514, 2536], "errorMessage": "check self.quest_system_app exists"}, {"pc": [3920, 4007], "errorMessage": "check self.rate_limit_burst exists"}, {"pc": [2813, 3874], "errorMessage": "check self.seasonal_reissue_interval exists"}, {"pc": [2211], "errorMessage": "check self.total_effects exists"}, {"pc": [2164, 3665], "errorMessage": "check self.total_items_created exists"}, {"pc": [3475], "errorMessage": "check self.total_items_recycled exists"}, {"pc": [1727, 3660], "errorMessage": "check self.total_players exists"}, {"pc": [1976, 2017, 2030, 2043, 2063, 2730], "errorMessage": "overflow"}, {"pc": [1641], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,6 +64,49 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class ItemMetadata:
+    """Struct for ItemMetadata"""
+    item_type: int
+    rarity: int
+    attack_power: int
+    defense_power: int
+    effect_id: int
+    is_recovered: bool
+    recovery_count: int
+    original_creation_time: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ConfigureSystemsArgs:
+    """Dataclass for configure_systems arguments"""
+    quest_system: int
+    guild_system: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "configure_systems(application,application)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ConfigureRateLimitsArgs:
+    """Dataclass for configure_rate_limits arguments"""
+    seasonal_reissue_interval: int
+    craft_interval: int
+    burst: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "configure_rate_limits(uint64,uint64,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ConfigureFeePoolingArgs:
+    """Dataclass for configure_fee_pooling arguments"""
+    enabled: bool
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "configure_fee_pooling(bool)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class RegisterPlayerArgs:
     """Dataclass for register_player arguments"""
@@ -73,6 +116,24 @@ class RegisterPlayerArgs:
     def abi_method_signature(self) -> str:
         return "register_player(string)string"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ResolveNameArgs:
+    """Dataclass for resolve_name arguments"""
+    player_name: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "resolve_name(string)address"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class NameOfArgs:
+    """Dataclass for name_of arguments"""
+    player: str | bytes
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "name_of(account)string"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CreateGameItemArgs:
     """Dataclass for create_game_item arguments"""
@@ -88,6 +149,31 @@ class CreateGameItemArgs:
     def abi_method_signature(self) -> str:
         return "create_game_item(account,string,string,string,uint64,uint64,string)uint64"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateGameItemWithKeyArgs:
+    """Dataclass for create_game_item_with_key arguments"""
+    request_key: bytes | str
+    recipient: str | bytes
+    item_name: str
+    item_type: str
+    rarity: str
+    attack_power: int
+    defense_power: int
+    special_effect: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_game_item_with_key(byte[],account,string,string,string,uint64,uint64,string)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetMintedItemArgs:
+    """Dataclass for get_minted_item arguments"""
+    request_key: bytes | str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_minted_item(byte[])uint64"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class RecoverLostItemArgs:
     """Dataclass for recover_lost_item arguments"""
@@ -121,6 +207,66 @@ class CraftItemsArgs:
     def abi_method_signature(self) -> str:
         return "craft_items(asset,asset,uint64)uint64"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateItemStackArgs:
+    """Dataclass for create_item_stack arguments"""
+    item_type: str
+    rarity: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_item_stack(string,string)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DispenseStackItemsArgs:
+    """Dataclass for dispense_stack_items arguments"""
+    recipient: str | bytes
+    item_type: str
+    rarity: str
+    amount: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "dispense_stack_items(account,string,string,uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RecycleItemsArgs:
+    """Dataclass for recycle_items arguments"""
+    items: list[int]
+    holders: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "recycle_items(uint64[],address[])uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetItemStackArgs:
+    """Dataclass for get_item_stack arguments"""
+    item_type: str
+    rarity: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_item_stack(string,string)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetItemMetadataArgs:
+    """Dataclass for get_item_metadata arguments"""
+    item_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_item_metadata(uint64)(uint8,uint8,uint16,uint16,uint16,bool,uint8,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetEffectArgs:
+    """Dataclass for get_effect arguments"""
+    effect_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_effect(uint64)string"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetPlayerStatsArgs:
     """Dataclass for get_player_stats arguments"""
@@ -139,6 +285,16 @@ class ClaimItemArgs:
     def abi_method_signature(self) -> str:
         return "claim_item(asset)string"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DeliverItemArgs:
+    """Dataclass for deliver_item arguments"""
+    item_id: int
+    player: str | bytes
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "deliver_item(asset,account)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetRecoveryStatusArgs:
     """Dataclass for get_recovery_status arguments"""
@@ -148,6 +304,16 @@ class GetRecoveryStatusArgs:
     def abi_method_signature(self) -> str:
         return "get_recovery_status(account)(uint64,uint64)"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetActionCooldownArgs:
+    """Dataclass for get_action_cooldown arguments"""
+    player: str | bytes
+    action: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_action_cooldown(account,uint64)uint64"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class RegisterPlayerArgs:
     """Dataclass for register_player arguments"""
@@ -184,242 +350,237 @@ class AlgoRealmGameManagerParams:
     def opt_in(self) -> "_AlgoRealmGameManagerOptIn":
         return _AlgoRealmGameManagerOptIn(self.app_client)
 
-    def register_player(
+    def configure_systems(
         self,
-        args: tuple[str] | RegisterPlayerArgs,
+        args: tuple[int, int] | ConfigureSystemsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "register_player(string)string",
+            "method": "configure_systems(application,application)void",
             "args": method_args,
         }))
 
-    def create_game_item(
+    def configure_rate_limits(
         self,
-        args: tuple[str | bytes, str, str, str, int, int, str] | CreateGameItemArgs,
+        args: tuple[int, int, int] | ConfigureRateLimitsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_game_item(account,string,string,string,uint64,uint64,string)uint64",
+            "method": "configure_rate_limits(uint64,uint64,uint64)void",
             "args": method_args,
         }))
 
-    def recover_lost_item(
+    def configure_fee_pooling(
         self,
-        args: tuple[int, bytes | str, str | bytes] | RecoverLostItemArgs,
+        args: tuple[bool] | ConfigureFeePoolingArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "recover_lost_item(asset,byte[],account)uint64",
+            "method": "configure_fee_pooling(bool)void",
             "args": method_args,
         }))
 
-    def seasonal_event_reissue(
+    def register_player(
         self,
-        args: tuple[str, bytes | str, str | bytes] | SeasonalEventReissueArgs,
+        args: tuple[str] | RegisterPlayerArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "seasonal_event_reissue(string,byte[],account)uint64",
+            "method": "register_player(string)string",
             "args": method_args,
         }))
 
-    def craft_items(
+    def resolve_name(
         self,
-        args: tuple[int, int, int] | CraftItemsArgs,
+        args: tuple[str] | ResolveNameArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "craft_items(asset,asset,uint64)uint64",
+            "method": "resolve_name(string)address",
             "args": method_args,
         }))
 
-    def get_player_stats(
+    def name_of(
         self,
-        args: tuple[str | bytes] | GetPlayerStatsArgs,
+        args: tuple[str | bytes] | NameOfArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_player_stats(account)(uint64,uint64,uint64)",
+            "method": "name_of(account)string",
             "args": method_args,
         }))
 
-    def advance_season(
+    def create_game_item(
         self,
+        args: tuple[str | bytes, str, str, str, int, int, str] | CreateGameItemArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "advance_season()uint64",
+            "method": "create_game_item(account,string,string,string,uint64,uint64,string)uint64",
+            "args": method_args,
         }))
 
-    def get_game_info(
+    def create_game_item_with_key(
         self,
+        args: tuple[bytes | str, str | bytes, str, str, str, int, int, str] | CreateGameItemWithKeyArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_game_info()(uint64,uint64,uint64)",
+            "method": "create_game_item_with_key(byte[],account,string,string,string,uint64,uint64,string)uint64",
+            "args": method_args,
         }))
 
-    def claim_item(
+    def get_minted_item(
         self,
-        args: tuple[int] | ClaimItemArgs,
+        args: tuple[bytes | str] | GetMintedItemArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "claim_item(asset)string",
+            "method": "get_minted_item(byte[])uint64",
             "args": method_args,
         }))
 
-    def get_recovery_status(
+    def recover_lost_item(
         self,
-        args: tuple[str | bytes] | GetRecoveryStatusArgs,
+        args: tuple[int, bytes | str, str | bytes] | RecoverLostItemArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_recovery_status(account)(uint64,uint64)",
+            "method": "recover_lost_item(asset,byte[],account)uint64",
             "args": method_args,
         }))
 
-    def initialize_game(
+    def seasonal_event_reissue(
         self,
+        args: tuple[str, bytes | str, str | bytes] | SeasonalEventReissueArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
-    
+        method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "initialize_game()string",
+            "method": "seasonal_event_reissue(string,byte[],account)uint64",
+            "args": method_args,
         }))
 
-    def clear_state(
+    def craft_items(
         self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
-        
-    ) -> algokit_utils.AppCallParams:
-        return self.app_client.params.bare.clear_state(
-            params,
-            
-        )
-
-
-class _AlgoRealmGameManagerOptInTransaction:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+        args: tuple[int, int, int] | CraftItemsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "craft_items(asset,asset,uint64)uint64",
+            "args": method_args,
+        }))
 
-    def register_player(
+    def create_item_stack(
         self,
-        args: tuple[str] | RegisterPlayerArgs,
+        args: tuple[str, str] | CreateItemStackArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "register_player(string)string",
+            "method": "create_item_stack(string,string)uint64",
             "args": method_args,
         }))
 
-
-class AlgoRealmGameManagerCreateTransactionParams:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
-
-    @property
-    def opt_in(self) -> "_AlgoRealmGameManagerOptInTransaction":
-        return _AlgoRealmGameManagerOptInTransaction(self.app_client)
-
-    def register_player(
+    def dispense_stack_items(
         self,
-        args: tuple[str] | RegisterPlayerArgs,
+        args: tuple[str | bytes, str, str, int] | DispenseStackItemsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "register_player(string)string",
+            "method": "dispense_stack_items(account,string,string,uint64)uint64",
             "args": method_args,
         }))
 
-    def create_game_item(
+    def recycle_items(
         self,
-        args: tuple[str | bytes, str, str, str, int, int, str] | CreateGameItemArgs,
+        args: tuple[list[int], list[str]] | RecycleItemsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_game_item(account,string,string,string,uint64,uint64,string)uint64",
+            "method": "recycle_items(uint64[],address[])uint64",
             "args": method_args,
         }))
 
-    def recover_lost_item(
+    def get_item_stack(
         self,
-        args: tuple[int, bytes | str, str | bytes] | RecoverLostItemArgs,
+        args: tuple[str, str] | GetItemStackArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "recover_lost_item(asset,byte[],account)uint64",
+            "method": "get_item_stack(string,string)uint64",
             "args": method_args,
         }))
 
-    def seasonal_event_reissue(
+    def get_item_metadata(
         self,
-        args: tuple[str, bytes | str, str | bytes] | SeasonalEventReissueArgs,
+        args: tuple[int] | GetItemMetadataArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "seasonal_event_reissue(string,byte[],account)uint64",
+            "method": "get_item_metadata(uint64)(uint8,uint8,uint16,uint16,uint16,bool,uint8,uint64)",
             "args": method_args,
         }))
 
-    def craft_items(
+    def get_effect(
         self,
-        args: tuple[int, int, int] | CraftItemsArgs,
+        args: tuple[int] | GetEffectArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "craft_items(asset,asset,uint64)uint64",
+            "method": "get_effect(uint64)string",
             "args": method_args,
         }))
 
@@ -427,10 +588,10 @@ class AlgoRealmGameManagerCreateTransactionParams:
         self,
         args: tuple[str | bytes] | GetPlayerStatsArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
             "method": "get_player_stats(account)(uint64,uint64,uint64)",
             "args": method_args,
@@ -439,10 +600,10 @@ class AlgoRealmGameManagerCreateTransactionParams:
     def advance_season(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
             "method": "advance_season()uint64",
         }))
@@ -450,10 +611,10 @@ class AlgoRealmGameManagerCreateTransactionParams:
     def get_game_info(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
             "method": "get_game_info()(uint64,uint64,uint64)",
         }))
@@ -462,33 +623,428 @@ class AlgoRealmGameManagerCreateTransactionParams:
         self,
         args: tuple[int] | ClaimItemArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
             "method": "claim_item(asset)string",
             "args": method_args,
         }))
 
-    def get_recovery_status(
+    def deliver_item(
         self,
-        args: tuple[str | bytes] | GetRecoveryStatusArgs,
+        args: tuple[int, str | bytes] | DeliverItemArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
+    ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_recovery_status(account)(uint64,uint64)",
+            "method": "deliver_item(asset,account)void",
             "args": method_args,
         }))
 
-    def initialize_game(
+    def get_recovery_status(
         self,
+        args: tuple[str | bytes] | GetRecoveryStatusArgs,
         params: algokit_utils.CommonAppCallParams | None = None
-    ) -> algokit_utils.BuiltTransactions:
-    
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_recovery_status(account)(uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_action_cooldown(
+        self,
+        args: tuple[str | bytes, int] | GetActionCooldownArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_action_cooldown(account,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def initialize_game(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "initialize_game()string",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class _AlgoRealmGameManagerOptInTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def register_player(
+        self,
+        args: tuple[str] | RegisterPlayerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "register_player(string)string",
+            "args": method_args,
+        }))
+
+
+class AlgoRealmGameManagerCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_AlgoRealmGameManagerOptInTransaction":
+        return _AlgoRealmGameManagerOptInTransaction(self.app_client)
+
+    def configure_systems(
+        self,
+        args: tuple[int, int] | ConfigureSystemsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "configure_systems(application,application)void",
+            "args": method_args,
+        }))
+
+    def configure_rate_limits(
+        self,
+        args: tuple[int, int, int] | ConfigureRateLimitsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "configure_rate_limits(uint64,uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def configure_fee_pooling(
+        self,
+        args: tuple[bool] | ConfigureFeePoolingArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "configure_fee_pooling(bool)void",
+            "args": method_args,
+        }))
+
+    def register_player(
+        self,
+        args: tuple[str] | RegisterPlayerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "register_player(string)string",
+            "args": method_args,
+        }))
+
+    def resolve_name(
+        self,
+        args: tuple[str] | ResolveNameArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "resolve_name(string)address",
+            "args": method_args,
+        }))
+
+    def name_of(
+        self,
+        args: tuple[str | bytes] | NameOfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "name_of(account)string",
+            "args": method_args,
+        }))
+
+    def create_game_item(
+        self,
+        args: tuple[str | bytes, str, str, str, int, int, str] | CreateGameItemArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_game_item(account,string,string,string,uint64,uint64,string)uint64",
+            "args": method_args,
+        }))
+
+    def create_game_item_with_key(
+        self,
+        args: tuple[bytes | str, str | bytes, str, str, str, int, int, str] | CreateGameItemWithKeyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_game_item_with_key(byte[],account,string,string,string,uint64,uint64,string)uint64",
+            "args": method_args,
+        }))
+
+    def get_minted_item(
+        self,
+        args: tuple[bytes | str] | GetMintedItemArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_minted_item(byte[])uint64",
+            "args": method_args,
+        }))
+
+    def recover_lost_item(
+        self,
+        args: tuple[int, bytes | str, str | bytes] | RecoverLostItemArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "recover_lost_item(asset,byte[],account)uint64",
+            "args": method_args,
+        }))
+
+    def seasonal_event_reissue(
+        self,
+        args: tuple[str, bytes | str, str | bytes] | SeasonalEventReissueArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "seasonal_event_reissue(string,byte[],account)uint64",
+            "args": method_args,
+        }))
+
+    def craft_items(
+        self,
+        args: tuple[int, int, int] | CraftItemsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "craft_items(asset,asset,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def create_item_stack(
+        self,
+        args: tuple[str, str] | CreateItemStackArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_item_stack(string,string)uint64",
+            "args": method_args,
+        }))
+
+    def dispense_stack_items(
+        self,
+        args: tuple[str | bytes, str, str, int] | DispenseStackItemsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "dispense_stack_items(account,string,string,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def recycle_items(
+        self,
+        args: tuple[list[int], list[str]] | RecycleItemsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "recycle_items(uint64[],address[])uint64",
+            "args": method_args,
+        }))
+
+    def get_item_stack(
+        self,
+        args: tuple[str, str] | GetItemStackArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_item_stack(string,string)uint64",
+            "args": method_args,
+        }))
+
+    def get_item_metadata(
+        self,
+        args: tuple[int] | GetItemMetadataArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_item_metadata(uint64)(uint8,uint8,uint16,uint16,uint16,bool,uint8,uint64)",
+            "args": method_args,
+        }))
+
+    def get_effect(
+        self,
+        args: tuple[int] | GetEffectArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_effect(uint64)string",
+            "args": method_args,
+        }))
+
+    def get_player_stats(
+        self,
+        args: tuple[str | bytes] | GetPlayerStatsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_player_stats(account)(uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def advance_season(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "advance_season()uint64",
+        }))
+
+    def get_game_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_game_info()(uint64,uint64,uint64)",
+        }))
+
+    def claim_item(
+        self,
+        args: tuple[int] | ClaimItemArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_item(asset)string",
+            "args": method_args,
+        }))
+
+    def deliver_item(
+        self,
+        args: tuple[int, str | bytes] | DeliverItemArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "deliver_item(asset,account)void",
+            "args": method_args,
+        }))
+
+    def get_recovery_status(
+        self,
+        args: tuple[str | bytes] | GetRecoveryStatusArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_recovery_status(account)(uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_action_cooldown(
+        self,
+        args: tuple[str | bytes, int] | GetActionCooldownArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_action_cooldown(account,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def initialize_game(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
@@ -510,50 +1066,226 @@ class _AlgoRealmGameManagerOptInSend:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
-    def register_player(
+    def register_player(
+        self,
+        args: tuple[str] | RegisterPlayerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "register_player(string)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+
+class AlgoRealmGameManagerSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_AlgoRealmGameManagerOptInSend":
+        return _AlgoRealmGameManagerOptInSend(self.app_client)
+
+    def configure_systems(
+        self,
+        args: tuple[int, int] | ConfigureSystemsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "configure_systems(application,application)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def configure_rate_limits(
+        self,
+        args: tuple[int, int, int] | ConfigureRateLimitsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "configure_rate_limits(uint64,uint64,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def configure_fee_pooling(
+        self,
+        args: tuple[bool] | ConfigureFeePoolingArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "configure_fee_pooling(bool)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def register_player(
+        self,
+        args: tuple[str] | RegisterPlayerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "register_player(string)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def resolve_name(
+        self,
+        args: tuple[str] | ResolveNameArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "resolve_name(string)address",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def name_of(
+        self,
+        args: tuple[str | bytes] | NameOfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "name_of(account)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def create_game_item(
+        self,
+        args: tuple[str | bytes, str, str, str, int, int, str] | CreateGameItemArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_game_item(account,string,string,string,uint64,uint64,string)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def create_game_item_with_key(
+        self,
+        args: tuple[bytes | str, str | bytes, str, str, str, int, int, str] | CreateGameItemWithKeyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_game_item_with_key(byte[],account,string,string,string,uint64,uint64,string)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_minted_item(
         self,
-        args: tuple[str] | RegisterPlayerArgs,
+        args: tuple[bytes | str] | GetMintedItemArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
-        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(**{
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "register_player(string)string",
+            "method": "get_minted_item(byte[])uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
-
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-class AlgoRealmGameManagerSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+    def recover_lost_item(
+        self,
+        args: tuple[int, bytes | str, str | bytes] | RecoverLostItemArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "recover_lost_item(asset,byte[],account)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    @property
-    def opt_in(self) -> "_AlgoRealmGameManagerOptInSend":
-        return _AlgoRealmGameManagerOptInSend(self.app_client)
+    def seasonal_event_reissue(
+        self,
+        args: tuple[str, bytes | str, str | bytes] | SeasonalEventReissueArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "seasonal_event_reissue(string,byte[],account)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def register_player(
+    def craft_items(
         self,
-        args: tuple[str] | RegisterPlayerArgs,
+        args: tuple[int, int, int] | CraftItemsArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "register_player(string)string",
+            "method": "craft_items(asset,asset,uint64)uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def create_game_item(
+    def create_item_stack(
         self,
-        args: tuple[str | bytes, str, str, str, int, int, str] | CreateGameItemArgs,
+        args: tuple[str, str] | CreateItemStackArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
@@ -561,15 +1293,15 @@ class AlgoRealmGameManagerSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_game_item(account,string,string,string,uint64,uint64,string)uint64",
+            "method": "create_item_stack(string,string)uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def recover_lost_item(
+    def dispense_stack_items(
         self,
-        args: tuple[int, bytes | str, str | bytes] | RecoverLostItemArgs,
+        args: tuple[str | bytes, str, str, int] | DispenseStackItemsArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
@@ -577,15 +1309,15 @@ class AlgoRealmGameManagerSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "recover_lost_item(asset,byte[],account)uint64",
+            "method": "dispense_stack_items(account,string,string,uint64)uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def seasonal_event_reissue(
+    def recycle_items(
         self,
-        args: tuple[str, bytes | str, str | bytes] | SeasonalEventReissueArgs,
+        args: tuple[list[int], list[str]] | RecycleItemsArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
@@ -593,15 +1325,15 @@ class AlgoRealmGameManagerSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "seasonal_event_reissue(string,byte[],account)uint64",
+            "method": "recycle_items(uint64[],address[])uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def craft_items(
+    def get_item_stack(
         self,
-        args: tuple[int, int, int] | CraftItemsArgs,
+        args: tuple[str, str] | GetItemStackArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
@@ -609,12 +1341,44 @@ class AlgoRealmGameManagerSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "craft_items(asset,asset,uint64)uint64",
+            "method": "get_item_stack(string,string)uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
+    def get_item_metadata(
+        self,
+        args: tuple[int] | GetItemMetadataArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[ItemMetadata]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_item_metadata(uint64)(uint8,uint8,uint16,uint16,uint16,bool,uint8,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ItemMetadata, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[ItemMetadata], parsed_response)
+
+    def get_effect(
+        self,
+        args: tuple[int] | GetEffectArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_effect(uint64)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
     def get_player_stats(
         self,
         args: tuple[str | bytes] | GetPlayerStatsArgs,
@@ -675,6 +1439,22 @@ class AlgoRealmGameManagerSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
+    def deliver_item(
+        self,
+        args: tuple[int, str | bytes] | DeliverItemArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "deliver_item(asset,account)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def get_recovery_status(
         self,
         args: tuple[str | bytes] | GetRecoveryStatusArgs,
@@ -691,6 +1471,22 @@ class AlgoRealmGameManagerSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[tuple[int, int]], parsed_response)
 
+    def get_action_cooldown(
+        self,
+        args: tuple[str | bytes, int] | GetActionCooldownArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_action_cooldown(account,uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
     def initialize_game(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -720,16 +1516,26 @@ class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
     total_players: int
     total_items_created: int
+    total_items_recycled: int
     game_master: str
     current_season: int
     max_recovery_per_item: int
+    quest_system_app: int
+    guild_system_app: int
+    seasonal_reissue_interval: int
+    craft_interval: int
+    rate_limit_burst: int
+    total_effects: int
+    pool_inner_fees: bool
 
 class LocalStateValue(typing.TypedDict):
     """Shape of local_state state key values"""
     player_level: int
     player_experience: int
     player_recovery_count: int
+    player_season: int
     is_registered: bool
+    action_clock: bytes
 
 class AlgoRealmGameManagerState:
     """Methods to access state for the current AlgoRealmGameManager app"""
@@ -750,6 +1556,13 @@ class AlgoRealmGameManagerState:
             """Methods to access local_state for the current app"""
             return _LocalState(self.app_client, address)
 
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
 class _GlobalState:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -789,6 +1602,14 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def total_items_recycled(self) -> int:
+        """Get the current value of the total_items_recycled key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_items_recycled")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
     @property
     def game_master(self) -> str:
         """Get the current value of the game_master key in global_state state"""
@@ -813,6 +1634,62 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def quest_system_app(self) -> int:
+        """Get the current value of the quest_system_app key in global_state state"""
+        value = self.app_client.state.global_state.get_value("quest_system_app")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def guild_system_app(self) -> int:
+        """Get the current value of the guild_system_app key in global_state state"""
+        value = self.app_client.state.global_state.get_value("guild_system_app")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def seasonal_reissue_interval(self) -> int:
+        """Get the current value of the seasonal_reissue_interval key in global_state state"""
+        value = self.app_client.state.global_state.get_value("seasonal_reissue_interval")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def craft_interval(self) -> int:
+        """Get the current value of the craft_interval key in global_state state"""
+        value = self.app_client.state.global_state.get_value("craft_interval")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def rate_limit_burst(self) -> int:
+        """Get the current value of the rate_limit_burst key in global_state state"""
+        value = self.app_client.state.global_state.get_value("rate_limit_burst")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def total_effects(self) -> int:
+        """Get the current value of the total_effects key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_effects")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def pool_inner_fees(self) -> bool:
+        """Get the current value of the pool_inner_fees key in global_state state"""
+        value = self.app_client.state.global_state.get_value("pool_inner_fees")
+        if isinstance(value, dict) and "bool" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["bool"], value)  # type: ignore
+        return typing.cast(bool, value)
+
 class _LocalState:
     def __init__(self, app_client: algokit_utils.AppClient, address: str):
         self.app_client = app_client
@@ -860,6 +1737,14 @@ class _LocalState:
             return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
         return typing.cast(int, value)
 
+    @property
+    def player_season(self) -> int:
+        """Get the current value of the player_season key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("player_season")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
     @property
     def is_registered(self) -> bool:
         """Get the current value of the is_registered key in local_state state"""
@@ -868,6 +1753,137 @@ class _LocalState:
             return _init_dataclass(self._struct_classes["bool"], value)  # type: ignore
         return typing.cast(bool, value)
 
+    @property
+    def action_clock(self) -> bytes:
+        """Get the current value of the action_clock key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("action_clock")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "ItemMetadata": ItemMetadata
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def item_stacks(self) -> "_MapState[bytes, int]":
+        """Get values from the item_stacks map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "item_stacks",
+            None
+        )
+
+    @property
+    def item_metadata(self) -> "_MapState[int, ItemMetadata]":
+        """Get values from the item_metadata map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "item_metadata",
+            self._struct_classes.get("ItemMetadata")
+        )
+
+    @property
+    def effect_table(self) -> "_MapState[int, str]":
+        """Get values from the effect_table map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "effect_table",
+            None
+        )
+
+    @property
+    def effect_ids(self) -> "_MapState[bytes, int]":
+        """Get values from the effect_ids map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "effect_ids",
+            None
+        )
+
+    @property
+    def minted_requests(self) -> "_MapState[bytes, int]":
+        """Get values from the minted_requests map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "minted_requests",
+            None
+        )
+
+    @property
+    def name_owners(self) -> "_MapState[bytes, str]":
+        """Get values from the name_owners map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "name_owners",
+            None
+        )
+
+    @property
+    def player_names(self) -> "_MapState[str, str]":
+        """Get values from the player_names map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "player_names",
+            None
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
 class AlgoRealmGameManagerClient:
     """Client for interacting with AlgoRealmGameManager smart contract"""
 
@@ -1014,34 +2030,112 @@ class AlgoRealmGameManagerClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["register_player(string)string"],
+        method: typing.Literal["configure_systems(application,application)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["configure_rate_limits(uint64,uint64,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["configure_fee_pooling(bool)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["register_player(string)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["resolve_name(string)address"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["name_of(account)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_game_item(account,string,string,string,uint64,uint64,string)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_game_item_with_key(byte[],account,string,string,string,uint64,uint64,string)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_minted_item(byte[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["recover_lost_item(asset,byte[],account)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["seasonal_event_reissue(string,byte[],account)uint64"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> str | None: ...
+    ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["create_game_item(account,string,string,string,uint64,uint64,string)uint64"],
+        method: typing.Literal["craft_items(asset,asset,uint64)uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["recover_lost_item(asset,byte[],account)uint64"],
+        method: typing.Literal["create_item_stack(string,string)uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["seasonal_event_reissue(string,byte[],account)uint64"],
+        method: typing.Literal["dispense_stack_items(account,string,string,uint64)uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["craft_items(asset,asset,uint64)uint64"],
+        method: typing.Literal["recycle_items(uint64[],address[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_item_stack(string,string)uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_item_metadata(uint64)(uint8,uint8,uint16,uint16,uint16,bool,uint8,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> ItemMetadata | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_effect(uint64)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_player_stats(account)(uint64,uint64,uint64)"],
@@ -1066,12 +2160,24 @@ class AlgoRealmGameManagerClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> str | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["deliver_item(asset,account)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_recovery_status(account)(uint64,uint64)"],
         return_value: algokit_utils.ABIReturn | None
     ) -> tuple[int, int] | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_action_cooldown(account,uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["initialize_game()string"],
@@ -1094,7 +2200,7 @@ class AlgoRealmGameManagerClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int | str | tuple[int, int, int] | tuple[int, int]:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | ItemMetadata | None | int | str | tuple[int, int, int] | tuple[int, int]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -1278,6 +2384,66 @@ class AlgoRealmGameManagerFactoryCreateParams:
             algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
             compilation_params=compilation_params)
 
+    def configure_systems(
+        self,
+        args: tuple[int, int] | ConfigureSystemsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the configure_systems(application,application)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "configure_systems(application,application)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def configure_rate_limits(
+        self,
+        args: tuple[int, int, int] | ConfigureRateLimitsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the configure_rate_limits(uint64,uint64,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "configure_rate_limits(uint64,uint64,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def configure_fee_pooling(
+        self,
+        args: tuple[bool] | ConfigureFeePoolingArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the configure_fee_pooling(bool)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "configure_fee_pooling(bool)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def register_player(
         self,
         args: tuple[str] | RegisterPlayerArgs,
@@ -1298,6 +2464,46 @@ class AlgoRealmGameManagerFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def resolve_name(
+        self,
+        args: tuple[str] | ResolveNameArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the resolve_name(string)address ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "resolve_name(string)address",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def name_of(
+        self,
+        args: tuple[str | bytes] | NameOfArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the name_of(account)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "name_of(account)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def create_game_item(
         self,
         args: tuple[str | bytes, str, str, str, int, int, str] | CreateGameItemArgs,
@@ -1305,73 +2511,233 @@ class AlgoRealmGameManagerFactoryCreateParams:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the create_game_item(account,string,string,string,uint64,uint64,string)uint64 ABI method"""
+        """Creates a new instance using the create_game_item(account,string,string,string,uint64,uint64,string)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_game_item(account,string,string,string,uint64,uint64,string)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_game_item_with_key(
+        self,
+        args: tuple[bytes | str, str | bytes, str, str, str, int, int, str] | CreateGameItemWithKeyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_game_item_with_key(byte[],account,string,string,string,uint64,uint64,string)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_game_item_with_key(byte[],account,string,string,string,uint64,uint64,string)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_minted_item(
+        self,
+        args: tuple[bytes | str] | GetMintedItemArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_minted_item(byte[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_minted_item(byte[])uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def recover_lost_item(
+        self,
+        args: tuple[int, bytes | str, str | bytes] | RecoverLostItemArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the recover_lost_item(asset,byte[],account)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "recover_lost_item(asset,byte[],account)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def seasonal_event_reissue(
+        self,
+        args: tuple[str, bytes | str, str | bytes] | SeasonalEventReissueArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the seasonal_event_reissue(string,byte[],account)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "seasonal_event_reissue(string,byte[],account)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def craft_items(
+        self,
+        args: tuple[int, int, int] | CraftItemsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the craft_items(asset,asset,uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "craft_items(asset,asset,uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_item_stack(
+        self,
+        args: tuple[str, str] | CreateItemStackArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_item_stack(string,string)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_item_stack(string,string)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def dispense_stack_items(
+        self,
+        args: tuple[str | bytes, str, str, int] | DispenseStackItemsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the dispense_stack_items(account,string,string,uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "dispense_stack_items(account,string,string,uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def recycle_items(
+        self,
+        args: tuple[list[int], list[str]] | RecycleItemsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the recycle_items(uint64[],address[])uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "create_game_item(account,string,string,string,uint64,uint64,string)uint64",
+                "method": "recycle_items(uint64[],address[])uint64",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def recover_lost_item(
+    def get_item_stack(
         self,
-        args: tuple[int, bytes | str, str | bytes] | RecoverLostItemArgs,
+        args: tuple[str, str] | GetItemStackArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the recover_lost_item(asset,byte[],account)uint64 ABI method"""
+        """Creates a new instance using the get_item_stack(string,string)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "recover_lost_item(asset,byte[],account)uint64",
+                "method": "get_item_stack(string,string)uint64",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def seasonal_event_reissue(
+    def get_item_metadata(
         self,
-        args: tuple[str, bytes | str, str | bytes] | SeasonalEventReissueArgs,
+        args: tuple[int] | GetItemMetadataArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the seasonal_event_reissue(string,byte[],account)uint64 ABI method"""
+        """Creates a new instance using the get_item_metadata(uint64)(uint8,uint8,uint16,uint16,uint16,bool,uint8,uint64) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "seasonal_event_reissue(string,byte[],account)uint64",
+                "method": "get_item_metadata(uint64)(uint8,uint8,uint16,uint16,uint16,bool,uint8,uint64)",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def craft_items(
+    def get_effect(
         self,
-        args: tuple[int, int, int] | CraftItemsArgs,
+        args: tuple[int] | GetEffectArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the craft_items(asset,asset,uint64)uint64 ABI method"""
+        """Creates a new instance using the get_effect(uint64)string ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "craft_items(asset,asset,uint64)uint64",
+                "method": "get_effect(uint64)string",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -1456,6 +2822,26 @@ class AlgoRealmGameManagerFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def deliver_item(
+        self,
+        args: tuple[int, str | bytes] | DeliverItemArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the deliver_item(asset,account)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "deliver_item(asset,account)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def get_recovery_status(
         self,
         args: tuple[str | bytes] | GetRecoveryStatusArgs,
@@ -1476,6 +2862,26 @@ class AlgoRealmGameManagerFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def get_action_cooldown(
+        self,
+        args: tuple[str | bytes, int] | GetActionCooldownArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_action_cooldown(account,uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_action_cooldown(account,uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def initialize_game(
         self,
         *,
@@ -1680,6 +3086,60 @@ class AlgoRealmGameManagerComposer:
     def opt_in(self) -> "_AlgoRealmGameManagerOptInComposer":
         return _AlgoRealmGameManagerOptInComposer(self)
 
+    def configure_systems(
+        self,
+        args: tuple[int, int] | ConfigureSystemsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGameManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.configure_systems(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "configure_systems(application,application)void", v
+            )
+        )
+        return self
+
+    def configure_rate_limits(
+        self,
+        args: tuple[int, int, int] | ConfigureRateLimitsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGameManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.configure_rate_limits(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "configure_rate_limits(uint64,uint64,uint64)void", v
+            )
+        )
+        return self
+
+    def configure_fee_pooling(
+        self,
+        args: tuple[bool] | ConfigureFeePoolingArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGameManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.configure_fee_pooling(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "configure_fee_pooling(bool)void", v
+            )
+        )
+        return self
+
     def register_player(
         self,
         args: tuple[str] | RegisterPlayerArgs,
@@ -1698,6 +3158,42 @@ class AlgoRealmGameManagerComposer:
         )
         return self
 
+    def resolve_name(
+        self,
+        args: tuple[str] | ResolveNameArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGameManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.resolve_name(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "resolve_name(string)address", v
+            )
+        )
+        return self
+
+    def name_of(
+        self,
+        args: tuple[str | bytes] | NameOfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGameManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.name_of(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "name_of(account)string", v
+            )
+        )
+        return self
+
     def create_game_item(
         self,
         args: tuple[str | bytes, str, str, str, int, int, str] | CreateGameItemArgs,
@@ -1716,6 +3212,42 @@ class AlgoRealmGameManagerComposer:
         )
         return self
 
+    def create_game_item_with_key(
+        self,
+        args: tuple[bytes | str, str | bytes, str, str, str, int, int, str] | CreateGameItemWithKeyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGameManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_game_item_with_key(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_game_item_with_key(byte[],account,string,string,string,uint64,uint64,string)uint64", v
+            )
+        )
+        return self
+
+    def get_minted_item(
+        self,
+        args: tuple[bytes | str] | GetMintedItemArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGameManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_minted_item(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_minted_item(byte[])uint64", v
+            )
+        )
+        return self
+
     def recover_lost_item(
         self,
         args: tuple[int, bytes | str, str | bytes] | RecoverLostItemArgs,
@@ -1770,6 +3302,114 @@ class AlgoRealmGameManagerComposer:
         )
         return self
 
+    def create_item_stack(
+        self,
+        args: tuple[str, str] | CreateItemStackArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGameManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_item_stack(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_item_stack(string,string)uint64", v
+            )
+        )
+        return self
+
+    def dispense_stack_items(
+        self,
+        args: tuple[str | bytes, str, str, int] | DispenseStackItemsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGameManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.dispense_stack_items(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "dispense_stack_items(account,string,string,uint64)uint64", v
+            )
+        )
+        return self
+
+    def recycle_items(
+        self,
+        args: tuple[list[int], list[str]] | RecycleItemsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGameManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.recycle_items(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "recycle_items(uint64[],address[])uint64", v
+            )
+        )
+        return self
+
+    def get_item_stack(
+        self,
+        args: tuple[str, str] | GetItemStackArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGameManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_item_stack(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_item_stack(string,string)uint64", v
+            )
+        )
+        return self
+
+    def get_item_metadata(
+        self,
+        args: tuple[int] | GetItemMetadataArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGameManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_item_metadata(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_item_metadata(uint64)(uint8,uint8,uint16,uint16,uint16,bool,uint8,uint64)", v
+            )
+        )
+        return self
+
+    def get_effect(
+        self,
+        args: tuple[int] | GetEffectArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGameManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_effect(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_effect(uint64)string", v
+            )
+        )
+        return self
+
     def get_player_stats(
         self,
         args: tuple[str | bytes] | GetPlayerStatsArgs,
@@ -1840,6 +3480,24 @@ class AlgoRealmGameManagerComposer:
         )
         return self
 
+    def deliver_item(
+        self,
+        args: tuple[int, str | bytes] | DeliverItemArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGameManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.deliver_item(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "deliver_item(asset,account)void", v
+            )
+        )
+        return self
+
     def get_recovery_status(
         self,
         args: tuple[str | bytes] | GetRecoveryStatusArgs,
@@ -1858,6 +3516,24 @@ class AlgoRealmGameManagerComposer:
         )
         return self
 
+    def get_action_cooldown(
+        self,
+        args: tuple[str | bytes, int] | GetActionCooldownArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGameManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_action_cooldown(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_action_cooldown(account,uint64)uint64", v
+            )
+        )
+        return self
+
     def initialize_game(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
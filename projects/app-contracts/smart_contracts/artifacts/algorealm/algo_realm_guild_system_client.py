@@ -0,0 +1,2846 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["OptIn"], "create": []}, "args": [], "name": "opt_in", "returns": {"type": "void"}, "desc": "Opt in to the guild system (registered AlgoRealm players only)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "application", "name": "game_manager"}], "name": "set_game_manager", "returns": {"type": "void"}, "desc": "Link the game manager app used for player registration (guild master only)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "mbr_payment"}], "name": "create_leaderboard", "returns": {"type": "void"}, "desc": "Create the contribution leaderboard (guild master only)\nThe grouped payment covers the box MBR, so guild treasuries never do", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "guild_name"}, {"type": "pay", "name": "treasury_payment"}], "name": "create_guild", "returns": {"type": "uint64"}, "desc": "Create a new guild\nThe grouped payment funds the guild treasury, less the treasury and name box MBR", "events": [{"args": [{"type": "uint64", "name": "guild_id"}, {"type": "address", "name": "leader"}, {"type": "uint64", "name": "treasury"}], "name": "GuildCreated", "desc": "ARC-28 event: a guild was founded with an initial treasury"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}], "name": "deposit_to_treasury", "returns": {"type": "uint64"}, "desc": "Add a grouped payment to the sender's guild treasury", "events": [{"args": [{"type": "uint64", "name": "guild_id"}, {"type": "address", "name": "player"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "balance"}], "name": "TreasuryDeposit", "desc": "ARC-28 event: a member added to their guild treasury"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "guild_id"}, {"type": "string", "name": "application_message"}], "name": "join_guild", "returns": {"type": "string"}, "desc": "Apply to join a guild", "events": [{"args": [{"type": "uint64", "name": "guild_id"}, {"type": "address", "name": "player"}], "name": "GuildJoined", "desc": "ARC-28 event: a player joined a guild"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "member"}], "name": "promote_to_officer", "returns": {"type": "string"}, "desc": "Make a member of the leader's guild an officer (guild leader only)\nA new guild's leader is its only officer, so proposals cannot reach GUILD_APPROVAL_THRESHOLD until the leader appoints officers directly", "events": [{"args": [{"type": "uint64", "name": "guild_id"}, {"type": "address", "name": "player"}], "name": "OfficerPromoted", "desc": "ARC-28 event: the guild leader made a member an officer"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "action_type"}, {"type": "account", "name": "target_player"}, {"type": "uint64", "name": "amount"}], "name": "propose_guild_action", "returns": {"type": "uint64"}, "desc": "MULTISIG FUNCTIONALITY: Propose a guild action requiring multiple approvals\nThe proposer's approval counts towards the threshold; other officers approve with approve_guild_action and the action executes automatically", "events": [{"args": [{"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "guild_id"}, {"type": "uint8", "name": "action"}, {"type": "address", "name": "target"}, {"type": "uint64", "name": "amount"}], "name": "ProposalCreated", "desc": "ARC-28 event: an officer proposed a guild action"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "approve_guild_action", "returns": {"type": "string"}, "desc": "Approve a pending guild action, executing it once the threshold is met", "events": [{"args": [{"type": "uint64", "name": "proposal_id"}, {"type": "address", "name": "approver"}, {"type": "uint8", "name": "approval_count"}], "name": "ProposalApproved", "desc": "ARC-28 event: an officer approved a pending proposal"}, {"args": [{"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "guild_id"}, {"type": "uint8", "name": "action"}, {"type": "address", "name": "target"}, {"type": "uint64", "name": "amount"}], "name": "ProposalExecuted", "desc": "ARC-28 event: a proposal reached the threshold and was executed"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "cancel_guild_action", "returns": {"type": "string"}, "desc": "Cancel a pending guild action (guild leader only)", "events": [{"args": [{"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "guild_id"}], "name": "ProposalCancelled", "desc": "ARC-28 event: the guild leader cancelled a pending proposal"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "proposal_id"}], "name": "get_guild_proposal", "returns": {"type": "(uint64,uint8,address,uint64,uint8,address[2])", "struct": "GuildProposal"}, "desc": "Get a pending guild proposal", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "asset", "name": "reward_asset"}, {"type": "pay", "name": "mbr_payment"}], "name": "set_reward_asset", "returns": {"type": "void"}, "desc": "Choose the token a guild escrows for rewards (guild leader only)\nThe grouped payment covers the ledger box MBR and, the first time any guild uses the token, the contract's asset opt-in MBR", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "axfer", "name": "deposit"}], "name": "deposit_guild_rewards", "returns": {"type": "uint64"}, "desc": "Escrow a grouped reward token transfer in the sender's guild ledger", "events": [{"args": [{"type": "uint64", "name": "guild_id"}, {"type": "address", "name": "player"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "balance"}], "name": "RewardsDeposited", "desc": "ARC-28 event: a member escrowed reward tokens for their guild"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "reward_asa_id"}, {"type": "address[]", "name": "members"}, {"type": "uint64[]", "name": "amounts"}], "name": "distribute_guild_rewards", "returns": {"type": "string"}, "desc": "Distribute guild rewards using atomic transactions\nTransfers are paid out of the guild's reward ledger and submitted as inner groups of up to 16. Each member's account must be referenced, so one call pays at most 4 members and one outer group at most 64; larger payouts take several groups (see guild_rewards.py)", "events": [{"args": [{"type": "uint64", "name": "guild_id"}, {"type": "uint64", "name": "reward_asset"}, {"type": "uint64", "name": "recipient_count"}], "name": "RewardsDistributed", "desc": "ARC-28 event: the guild leader paid out reward tokens"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "leave_guild", "returns": {"type": "string"}, "desc": "Leave current guild", "events": [{"args": [{"type": "uint64", "name": "guild_id"}, {"type": "address", "name": "player"}], "name": "GuildLeft", "desc": "ARC-28 event: a player left a guild"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "player"}], "name": "get_player_guild_info", "returns": {"type": "(uint64,string,bool)"}, "desc": "Get player's guild information", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_leaderboard", "returns": {"type": "(address,uint64,uint64)[10]"}, "desc": "Get the top contributors, highest score first", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "guild_id"}], "name": "get_guild_treasury", "returns": {"type": "uint64"}, "desc": "Get a guild's treasury balance in microALGO", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "guild_id"}], "name": "get_guild_name", "returns": {"type": "string"}, "desc": "Get a guild's name", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "guild_id"}], "name": "get_reward_ledger", "returns": {"type": "(uint64,uint64)", "struct": "RewardLedger"}, "desc": "Get a guild's reward asset and escrowed balance", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_guild_system_stats", "returns": {"type": "(uint64,uint64)"}, "desc": "Get guild system statistics", "events": [], "readonly": true, "recommendations": {}}], "name": "AlgoRealmGuildSystem", "state": {"keys": {"box": {"leaderboard": {"key": "bGVhZGVyYm9hcmQ=", "keyType": "AVMBytes", "valueType": "(address,uint64,uint64)[10]"}}, "global": {"guild_master": {"key": "Z3VpbGRfbWFzdGVy", "keyType": "AVMString", "valueType": "address"}, "total_guilds": {"key": "dG90YWxfZ3VpbGRz", "keyType": "AVMString", "valueType": "AVMUint64"}, "active_guilds_count": {"key": "YWN0aXZlX2d1aWxkc19jb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_proposals": {"key": "dG90YWxfcHJvcG9zYWxz", "keyType": "AVMString", "valueType": "AVMUint64"}, "game_manager_app": {"key": "Z2FtZV9tYW5hZ2VyX2FwcA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {"player_guild_id": {"key": "cGxheWVyX2d1aWxkX2lk", "keyType": "AVMString", "valueType": "AVMUint64"}, "player_role": {"key": "cGxheWVyX3JvbGU=", "keyType": "AVMString", "valueType": "AVMString"}, "is_guild_member": {"key": "aXNfZ3VpbGRfbWVtYmVy", "keyType": "AVMString", "valueType": "bool"}, "contribution_score": {"key": "Y29udHJpYnV0aW9uX3Njb3Jl", "keyType": "AVMString", "valueType": "AVMUint64"}}}, "maps": {"box": {"guild_treasury": {"keyType": "uint64", "valueType": "uint64", "prefix": "dA=="}, "guild_names": {"keyType": "uint64", "valueType": "AVMString", "prefix": "bg=="}, "reward_ledger": {"keyType": "uint64", "valueType": "RewardLedger", "prefix": "dw=="}, "guild_proposals": {"keyType": "uint64", "valueType": "GuildProposal", "prefix": "cA=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 4}, "local": {"bytes": 2, "ints": 2}}}, "structs": {"GuildProposal": [{"name": "guild_id", "type": "uint64"}, {"name": "action", "type": "uint8"}, {"name": "target", "type": "address"}, {"name": "amount", "type": "uint64"}, {"name": "approval_count", "type": "uint8"}, {"name": "approvers", "type": "address[2]"}], "RewardLedger": [{"name": "reward_asset", "type": "uint64"}, {"name": "balance", "type": "uint64"}]}, "byteCode": {"approval": "CiAFAAEwCvSTAyYUBBUffHUPcGxheWVyX2d1aWxkX2lkD2lzX2d1aWxkX21lbWJlcgtwbGF5ZXJfcm9sZQEAC2xlYWRlcmJvYXJkAXQGbGVhZGVyDHRvdGFsX2d1aWxkcxNhY3RpdmVfZ3VpbGRzX2NvdW50EmNvbnRyaWJ1dGlvbl9zY29yZQFwAXcMZ3VpbGRfbWFzdGVyD3RvdGFsX3Byb3Bvc2FscxBnYW1lX21hbmFnZXJfYXBwAYAHb2ZmaWNlcgZtZW1iZXIaTWVtYmVyIHByb21vdGVkIHRvIG9mZmljZXIxGEAAFScNMglnJwgiZycJImcnDiJnJw8iZzEbQQLEghUEMMbVigQRqNL+BAa3qysEVV/qDQQcmW3BBALi9cIEWc3ZwQTA0i/zBF1UHpwEz8XMCgSG9UESBIx66WwEtVKjxATM70VGBI4I+hIE/6EEzgSmEL5YBEkioSME7F5rpQTo2N73BMipMrQ2GgCOFQIdAgsB9QHUAbkBlwF5AVgBPAEgAQwA8ADUALIAmgBsAFwARwArABcAAiJDMRkURDEYRIgLUUwWTBZQKExQsCNDMRkURDEYRDYaAReICyYoTFCwI0MxGRREMRhENhoBF4gK/0kVFlcGAkxQKExQsCNDMRkURDEYRDYaAReICtAWKExQsCNDMRkURDEYRIgKCChMULAjQzEZFEQxGEQ2GgEXwByICdxPAhZLAhUWVwYCTwNQTIACAAtQTwJQTFAoTFCwI0MxGRREMRhEiAluSRUWVwYCTFAoTFCwI0MxGRREMRhENhoBFzYaAjYaA4gIQEkVFlcGAkxQKExQsCNDMRkURDEYRDEWIwlJOBCBBBJEiAeyFihMULAjQzEZFEQxGEQ2GgEXwDAxFiMJSTgQIxJEiAb+I0MxGRREMRhENhoBF4gG3ChMULAjQzEZFEQxGEQ2GgEXiAYxSRUWVwYCTFAoTFCwI0MxGRREMRhENhoBF4gEhEkVFlcGAkxQKExQsCNDMRkURDEYRDYaAVcCADYaAhfAHDYaAxeIA4kWKExQsCNDMRkURDEYRDYaARfAHIgDHkkVFlcGAkxQKExQsCNDMRkURDEYRDYaARc2GgJXAgCIAq1JFRZXBgJMUChMULAjQzEZFEQxGEQxFiMJSTgQIxJEiAGEFihMULAjQzEZFEQxGEQ2GgFXAgAxFiMJSTgQIxJEiADKFihMULAjQzEZFEQxGEQxFiMJSTgQIxJEiACBI0MxGRREMRhENhoBF8AyiABdI0MxGSMSRDEYRIgADSNDMRlA/dExGBREI0OKAAAxACInD2VEgA1pc19yZWdpc3RlcmVkY0EAIosAJxASQQAaI0QxACkiZjEAK4AAZjEAKicEZjEAJwoiZokiQv/jigEAMQAiJw1lRBJEJw+L/2eJigEAMQAiJw1lRBJEi/84BzIKEkSL/zgIgfSRDA9EJwW9RQEURIHgA68nBUy/iYoCATEAIipjRCcEEkSL/hVJREmBIA5Ei/84BzIKEkSL/zgAMQASRIv/OAhJgaCNBg9EIicIZUQjCEkWgAFuSwFQSbxIi/6/TwKB1EgJgfQ1CYGQA08ECwknBksCUEwWTEsBvzEAKUsEZjEAKycHZjEAKicQZicISwNnIicJZUQjCCcJTGcxAEwXFk4CUExQgATN9jKZTFCwiYoBAYAAMQAiKmNEJwQTRIv/OAcyChJEi/84ADEAEkQxACIpY0QWSScGTFBJvkQXi/84CElOA0xLAQhJTgMWSU4DTwJMvzEAIicKY0QISTEAJwpPAmYxAIgGzjEAJwW9RQFEJwW+RCUiiwklDIsIjABBABaLCSQLiwdMJFiBKFuLBQxBAHmLCYwAiwBJjAglEkAAToEJjAmLCYsIDUEAJosJSSMJSSQLiwdJTgNMJFhLAyUMRE8DJAtPA0xPAl2MB4wJQv/SiwUWiwaLAVBMUIsISSUMRCQLiwdMTwJdJwVMvzEAiwIWiwFPAlBMUIsEUIAEIS9sPkxQsIsDjACJiwkjCIwJQv9higIBMQAiKmNEJwQSRCInCGVEi/4PRDEAKYv+ZjEAKycSZjEAKicQZov+FjEAUIAEybSWtkxQsIAVV2VsY29tZSB0byB0aGUgZ3VpbGQhiYoBATEAIipjRCcEE0EAQTEAIitjRCcHEkEANSNEMQAiKWNEi/8iKWMiTgJNSwESRIv/IitjRCcSEkSL/ysnEWYWi/9QgARI2pTTTFCwJxOJIkL/yIoDAYgCyTEAIiljRCKL/YAPdHJlYXN1cnlfcGF5b3V0EkEAcCOMAYsBSUSLABYnBksBUEm+RBdJIQQPRCEECRa/IicOZUQjCCcOSwFnTwIWSZOBCA5EVwcBi/8WMQAyA1BLBEsDUIv+UEsCUIABAVBMUEsDFicLSwFQTwK/TwRQTwJQi/5QTFCABH57IGhMULCMAImL/YAOcHJvbW90ZV9tZW1iZXISQQAHgQKMAUL/dov9gBNndWlsZF9pdGVtX3RyYW5zZmVyEkH/W4EDjAFC/1SKAQEiSYAASYgB8Yv/FkknC0xQRwK9RQFEvkxJTwJESSJbSU4CMQAiKWNEEkSBMVUiiwmLCAxBABuLBlcyQIsJSU4CgSALgSBYMQATRCMIjAlC/92LBklXMkAxAIsISYECDERJgSALTwNMTwNdTwJMXDKMBiMISYwIgQIMQQA8iwgWSZOBCA5EVwcBiwZLAVwxiwVMv4sEMQBQTFCABP0nuSNMULCAEUFwcHJvdmFsIHJlY29yZGVkjACJiwW8SIsHFicGTFBJjABJvkQXIQQIFr+LBklXAAhLAVcIAUsCVwkgSU4EjAFLAlcpCIsETwNQTwJQTwNQTFCABHf5eahMULBJgQhVSU4CjAKBKVuMAyMSQQBCiwBJvkQXiwNJTgJLAQ5ESwEJFk8CTL+xsgiLAbIHI7IQIrIBs4AYVHJlYXN1cnkgcGF5b3V0IGFwcHJvdmVkjACJiwKBAhJBABeLAUkiKWMiTgJNiwcSRCsnEWYnE0L/3oAWR3VpbGQgaXRlbSB0cmFuc2ZlcnJlZEL/w4oBAYv/FkknC0xQRwK9RQFEvkQiW0kxACIpY0QSQQBHMQAiK2NEJwcSQQA7I0SLAbxIiwIWJwZLAVBJvkQXIQQIFr+LAExQgATtj5P/TFCwgBJQcm9wb3NhbCBjYW5jZWxsZWSMAIkiQv/CigAAMQAiKmNEJwQTRDEAIitjTElPAkQnBxJAAAiLACcREkEAAyNEiSJC//qKAQGL/xYnC0xQSb1FAUS+RImKAgCAADEAIipjRCcEE0QxACIrY0QnBxJEi/84BzIKEkSL/zgAMQASRDEAIiljRCJMFicMTFBJvUUBQQBOiwK+RIEIWxREMgqL/nAARQGLAYwAQAAbiwEyEAixMgoishKyFIv+shGBBLIQIrIBs4wAiwCL/zgIDkSL/haACAAAAAAAAAAAUIsCTL+JgdRhjAFC/7OKAQExACIqY0QnBBNEMQAiKWNEFicMSwFQSb1FAURJvkSL/zgUMgoSRIv/OAAxABJEi/84EUsBIlsSREmBCFuL/zgSTEsBCEkWTwNLAVwITwRMvzEATwMWTwRPAlBMUExQgATpd/PRTFCwiYoDASKAADEAIipjRCcEE0QxACIrY0QnBxJEi/4iWUmL/yJZSwESREQxACIpY0xJTwJEFkknDExQRwK9RQFEvkRJIluL/RJEgQhbIosHiwIMQQB3i/5XAgCLB0lOAoEgC4EgWElOAowAi/9XAgBLAYEIC1tJTgKMAU8CIiljIk4CTYsDEkRLAYsGSU4CDkRPAgmMBoEQGEAALbGBBLIQi/2yEYsAshSLAbISIrIBiwcjCEmMB4EQGEEACIsHiwISQf+Js0L/hbZC/9CLBhaLBUlOAr5ETFwIv4v9FosCFosETwJQTFCABAZP5YdMULCAGUd1aWxkIHJld2FyZHMgZGlzdHJpYnV0ZWSMAIkxACIqY0QnBBNEMQAiKWNEMQApImYxACuAAGYxAConBGYxACcKImYxAIgAOxYxAFCABM/sFR5MULCACkxlZnQgZ3VpbGSJigEDi/8iKWNEi/8iK2NEi/8iKmNEiScFvUUBRCcFvkSJigEAIoAASScFvUUBQAABiScFvkyMAEQijAGLASUMQQCKiwEkC4sATCRYVwAgi/8SQQBviwGMAosCgQkMQQAmiwJJIwhJJAuLAElOA0wkWEsDJQxETwMkC08DTE8CXYwAjAJC/9KLAIGwA4AwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAXScFTL+JiwEjCIwBQv9viYoBAYv/FicGTFBJvUUBRL5EF4mKAQGL/xaAAW5MUEm9RQFEvkSJigEBi/8WJwxMUEm9RQFEvkSJIicIZUQiJwllRIk=", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 9, "patch": 0}}, "desc": "\n    Guild system for AlgoRealm\n    Demonstrates multisig functionality for guild management\n    ", "events": [{"args": [{"type": "uint64", "name": "guild_id"}, {"type": "address", "name": "leader"}, {"type": "uint64", "name": "treasury"}], "name": "GuildCreated", "desc": "ARC-28 event: a guild was founded with an initial treasury"}, {"args": [{"type": "uint64", "name": "guild_id"}, {"type": "address", "name": "player"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "balance"}], "name": "TreasuryDeposit", "desc": "ARC-28 event: a member added to their guild treasury"}, {"args": [{"type": "uint64", "name": "guild_id"}, {"type": "address", "name": "player"}], "name": "GuildJoined", "desc": "ARC-28 event: a player joined a guild"}, {"args": [{"type": "uint64", "name": "guild_id"}, {"type": "address", "name": "player"}], "name": "OfficerPromoted", "desc": "ARC-28 event: the guild leader made a member an officer"}, {"args": [{"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "guild_id"}, {"type": "uint8", "name": "action"}, {"type": "address", "name": "target"}, {"type": "uint64", "name": "amount"}], "name": "ProposalCreated", "desc": "ARC-28 event: an officer proposed a guild action"}, {"args": [{"type": "uint64", "name": "proposal_id"}, {"type": "address", "name": "approver"}, {"type": "uint8", "name": "approval_count"}], "name": "ProposalApproved", "desc": "ARC-28 event: an officer approved a pending proposal"}, {"args": [{"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "guild_id"}, {"type": "uint8", "name": "action"}, {"type": "address", "name": "target"}, {"type": "uint64", "name": "amount"}], "name": "ProposalExecuted", "desc": "ARC-28 event: a proposal reached the threshold and was executed"}, {"args": [{"type": "uint64", "name": "proposal_id"}, {"type": "uint64", "name": "guild_id"}], "name": "ProposalCancelled", "desc": "ARC-28 event: the guild leader cancelled a pending proposal"}, {"args": [{"type": "uint64", "name": "guild_id"}, {"type": "address", "name": "player"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "balance"}], "name": "RewardsDeposited", "desc": "ARC-28 event: a member escrowed reward tokens for their guild"}, {"args": [{"type": "uint64", "name": "guild_id"}, {"type": "uint64", "name": "reward_asset"}, {"type": "uint64", "name": "recipient_count"}], "name": "RewardsDistributed", "desc": "ARC-28 event: the guild leader paid out reward tokens"}, {"args": [{"type": "uint64", "name": "guild_id"}, {"type": "address", "name": "player"}], "name": "GuildLeft", "desc": "ARC-28 event: a player left a guild"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmd1aWxkX3N5c3RlbS5BbGdvUmVhbG1HdWlsZFN5c3RlbS5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgNDggMTAgNTE3MDAKICAgIGJ5dGVjYmxvY2sgMHgxNTFmN2M3NSAicGxheWVyX2d1aWxkX2lkIiAiaXNfZ3VpbGRfbWVtYmVyIiAicGxheWVyX3JvbGUiIDB4MDAgMHg2YzY1NjE2NDY1NzI2MjZmNjE3MjY0IDB4NzQgImxlYWRlciIgInRvdGFsX2d1aWxkcyIgImFjdGl2ZV9ndWlsZHNfY291bnQiICJjb250cmlidXRpb25fc2NvcmUiIDB4NzAgMHg3NyAiZ3VpbGRfbWFzdGVyIiAidG90YWxfcHJvcG9zYWxzIiAiZ2FtZV9tYW5hZ2VyX2FwcCIgMHg4MCAib2ZmaWNlciIgIm1lbWJlciIgIk1lbWJlciBwcm9tb3RlZCB0byBvZmZpY2VyIgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MjAyCiAgICAvLyBzZWxmLmd1aWxkX21hc3RlciA9IEdsb2JhbFN0YXRlKEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MpCiAgICBieXRlYyAxMyAvLyAiZ3VpbGRfbWFzdGVyIgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MjAzCiAgICAvLyBzZWxmLnRvdGFsX2d1aWxkcyA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjIDggLy8gInRvdGFsX2d1aWxkcyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MjA0CiAgICAvLyBzZWxmLmFjdGl2ZV9ndWlsZHNfY291bnQgPSBHbG9iYWxTdGF0ZShVSW50NjQoMCkpCiAgICBieXRlYyA5IC8vICJhY3RpdmVfZ3VpbGRzX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weToyMDUKICAgIC8vIHNlbGYudG90YWxfcHJvcG9zYWxzID0gR2xvYmFsU3RhdGUoVUludDY0KDApKQogICAgYnl0ZWMgMTQgLy8gInRvdGFsX3Byb3Bvc2FscyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MjA2LTIwNwogICAgLy8gIyBHYW1lIG1hbmFnZXIgYXBwIHdob3NlIHJlZ2lzdGVyZWQgcGxheWVycyBtYXkgam9pbiBndWlsZHMKICAgIC8vIHNlbGYuZ2FtZV9tYW5hZ2VyX2FwcCA9IEdsb2JhbFN0YXRlKEFwcGxpY2F0aW9uKDApKQogICAgYnl0ZWMgMTUgLy8gImdhbWVfbWFuYWdlcl9hcHAiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MTk1CiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HdWlsZFN5c3RlbShBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDI2CiAgICBwdXNoYnl0ZXNzIDB4MzBjNmQ1OGEgMHgxMWE4ZDJmZSAweDA2YjdhYjJiIDB4NTU1ZmVhMGQgMHgxYzk5NmRjMSAweDAyZTJmNWMyIDB4NTljZGQ5YzEgMHhjMGQyMmZmMyAweDVkNTQxZTljIDB4Y2ZjNWNjMGEgMHg4NmY1NDExMiAweDhjN2FlOTZjIDB4YjU1MmEzYzQgMHhjY2VmNDU0NiAweDhlMDhmYTEyIDB4ZmZhMTA0Y2UgMHhhNjEwYmU1OCAweDQ5MjJhMTIzIDB4ZWM1ZTZiYTUgMHhlOGQ4ZGVmNyAweGM4YTkzMmI0IC8vIG1ldGhvZCAib3B0X2luKCl2b2lkIiwgbWV0aG9kICJzZXRfZ2FtZV9tYW5hZ2VyKGFwcGxpY2F0aW9uKXZvaWQiLCBtZXRob2QgImNyZWF0ZV9sZWFkZXJib2FyZChwYXkpdm9pZCIsIG1ldGhvZCAiY3JlYXRlX2d1aWxkKHN0cmluZyxwYXkpdWludDY0IiwgbWV0aG9kICJkZXBvc2l0X3RvX3RyZWFzdXJ5KHBheSl1aW50NjQiLCBtZXRob2QgImpvaW5fZ3VpbGQodWludDY0LHN0cmluZylzdHJpbmciLCBtZXRob2QgInByb21vdGVfdG9fb2ZmaWNlcihhY2NvdW50KXN0cmluZyIsIG1ldGhvZCAicHJvcG9zZV9ndWlsZF9hY3Rpb24oc3RyaW5nLGFjY291bnQsdWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiYXBwcm92ZV9ndWlsZF9hY3Rpb24odWludDY0KXN0cmluZyIsIG1ldGhvZCAiY2FuY2VsX2d1aWxkX2FjdGlvbih1aW50NjQpc3RyaW5nIiwgbWV0aG9kICJnZXRfZ3VpbGRfcHJvcG9zYWwodWludDY0KSh1aW50NjQsdWludDgsYWRkcmVzcyx1aW50NjQsdWludDgsYWRkcmVzc1syXSkiLCBtZXRob2QgInNldF9yZXdhcmRfYXNzZXQoYXNzZXQscGF5KXZvaWQiLCBtZXRob2QgImRlcG9zaXRfZ3VpbGRfcmV3YXJkcyhheGZlcil1aW50NjQiLCBtZXRob2QgImRpc3RyaWJ1dGVfZ3VpbGRfcmV3YXJkcyh1aW50NjQsYWRkcmVzc1tdLHVpbnQ2NFtdKXN0cmluZyIsIG1ldGhvZCAibGVhdmVfZ3VpbGQoKXN0cmluZyIsIG1ldGhvZCAiZ2V0X3BsYXllcl9ndWlsZF9pbmZvKGFjY291bnQpKHVpbnQ2NCxzdHJpbmcsYm9vbCkiLCBtZXRob2QgImdldF9sZWFkZXJib2FyZCgpKGFkZHJlc3MsdWludDY0LHVpbnQ2NClbMTBdIiwgbWV0aG9kICJnZXRfZ3VpbGRfdHJlYXN1cnkodWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2d1aWxkX25hbWUodWludDY0KXN0cmluZyIsIG1ldGhvZCAiZ2V0X3Jld2FyZF9sZWRnZXIodWludDY0KSh1aW50NjQsdWludDY0KSIsIG1ldGhvZCAiZ2V0X2d1aWxkX3N5c3RlbV9zdGF0cygpKHVpbnQ2NCx1aW50NjQpIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9vcHRfaW5fcm91dGVANSBtYWluX3NldF9nYW1lX21hbmFnZXJfcm91dGVANiBtYWluX2NyZWF0ZV9sZWFkZXJib2FyZF9yb3V0ZUA3IG1haW5fY3JlYXRlX2d1aWxkX3JvdXRlQDggbWFpbl9kZXBvc2l0X3RvX3RyZWFzdXJ5X3JvdXRlQDkgbWFpbl9qb2luX2d1aWxkX3JvdXRlQDEwIG1haW5fcHJvbW90ZV90b19vZmZpY2VyX3JvdXRlQDExIG1haW5fcHJvcG9zZV9ndWlsZF9hY3Rpb25fcm91dGVAMTIgbWFpbl9hcHByb3ZlX2d1aWxkX2FjdGlvbl9yb3V0ZUAxMyBtYWluX2NhbmNlbF9ndWlsZF9hY3Rpb25fcm91dGVAMTQgbWFpbl9nZXRfZ3VpbGRfcHJvcG9zYWxfcm91dGVAMTUgbWFpbl9zZXRfcmV3YXJkX2Fzc2V0X3JvdXRlQDE2IG1haW5fZGVwb3NpdF9ndWlsZF9yZXdhcmRzX3JvdXRlQDE3IG1haW5fZGlzdHJpYnV0ZV9ndWlsZF9yZXdhcmRzX3JvdXRlQDE4IG1haW5fbGVhdmVfZ3VpbGRfcm91dGVAMTkgbWFpbl9nZXRfcGxheWVyX2d1aWxkX2luZm9fcm91dGVAMjAgbWFpbl9nZXRfbGVhZGVyYm9hcmRfcm91dGVAMjEgbWFpbl9nZXRfZ3VpbGRfdHJlYXN1cnlfcm91dGVAMjIgbWFpbl9nZXRfZ3VpbGRfbmFtZV9yb3V0ZUAyMyBtYWluX2dldF9yZXdhcmRfbGVkZ2VyX3JvdXRlQDI0IG1haW5fZ2V0X2d1aWxkX3N5c3RlbV9zdGF0c19yb3V0ZUAyNQoKbWFpbl9hZnRlcl9pZl9lbHNlQDI4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MTk1CiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HdWlsZFN5c3RlbShBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl9nZXRfZ3VpbGRfc3lzdGVtX3N0YXRzX3JvdXRlQDI1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6Nzc3CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X2d1aWxkX3N5c3RlbV9zdGF0cwogICAgc3dhcAogICAgaXRvYgogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9yZXdhcmRfbGVkZ2VyX3JvdXRlQDI0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NzcxCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjE5NQogICAgLy8gY2xhc3MgQWxnb1JlYWxtR3VpbGRTeXN0ZW0oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5Ojc3MQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfcmV3YXJkX2xlZGdlcgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfZ3VpbGRfbmFtZV9yb3V0ZUAyMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5Ojc2NQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weToxOTUKICAgIC8vIGNsYXNzIEFsZ29SZWFsbUd1aWxkU3lzdGVtKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3NjUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2d1aWxkX25hbWUKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9ndWlsZF90cmVhc3VyeV9yb3V0ZUAyMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5Ojc1OQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weToxOTUKICAgIC8vIGNsYXNzIEFsZ29SZWFsbUd1aWxkU3lzdGVtKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3NTkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2d1aWxkX3RyZWFzdXJ5CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9sZWFkZXJib2FyZF9yb3V0ZUAyMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjcwNAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9sZWFkZXJib2FyZAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfcGxheWVyX2d1aWxkX2luZm9fcm91dGVAMjA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2OTUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MTk1CiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HdWlsZFN5c3RlbShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjY5NQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfcGxheWVyX2d1aWxkX2luZm8KICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgZGlnIDIKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICBzd2FwCiAgICBwdXNoYnl0ZXMgMHgwMDBiCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fbGVhdmVfZ3VpbGRfcm91dGVAMTk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2NzkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGxlYXZlX2d1aWxkCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9kaXN0cmlidXRlX2d1aWxkX3Jld2FyZHNfcm91dGVAMTg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2MTYKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weToxOTUKICAgIC8vIGNsYXNzIEFsZ29SZWFsbUd1aWxkU3lzdGVtKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2MTYKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBkaXN0cmlidXRlX2d1aWxkX3Jld2FyZHMKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2RlcG9zaXRfZ3VpbGRfcmV3YXJkc19yb3V0ZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU4OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjE5NQogICAgLy8gY2xhc3MgQWxnb1JlYWxtR3VpbGRTeXN0ZW0oQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgYXhmZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU4OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGRlcG9zaXRfZ3VpbGRfcmV3YXJkcwogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9zZXRfcmV3YXJkX2Fzc2V0X3JvdXRlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTQ1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MTk1CiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HdWlsZFN5c3RlbShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU0NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHNldF9yZXdhcmRfYXNzZXQKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2d1aWxkX3Byb3Bvc2FsX3JvdXRlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTM5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjE5NQogICAgLy8gY2xhc3MgQWxnb1JlYWxtR3VpbGRTeXN0ZW0oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjUzOQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfZ3VpbGRfcHJvcG9zYWwKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY2FuY2VsX2d1aWxkX2FjdGlvbl9yb3V0ZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ4MAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjE5NQogICAgLy8gY2xhc3MgQWxnb1JlYWxtR3VpbGRTeXN0ZW0oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ4MAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNhbmNlbF9ndWlsZF9hY3Rpb24KICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2FwcHJvdmVfZ3VpbGRfYWN0aW9uX3JvdXRlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDMwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MTk1CiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HdWlsZFN5c3RlbShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDMwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgYXBwcm92ZV9ndWlsZF9hY3Rpb24KICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3Byb3Bvc2VfZ3VpbGRfYWN0aW9uX3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6Mzc3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MTk1CiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HdWlsZFN5c3RlbShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozNzcKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBwcm9wb3NlX2d1aWxkX2FjdGlvbgogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9wcm9tb3RlX3RvX29mZmljZXJfcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozNTcKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weToxOTUKICAgIC8vIGNsYXNzIEFsZ29SZWFsbUd1aWxkU3lzdGVtKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzU3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcHJvbW90ZV90b19vZmZpY2VyCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9qb2luX2d1aWxkX3JvdXRlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzQxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MTk1CiAgICAvLyBjbGFzcyBBbGdvUmVhbG1HdWlsZFN5c3RlbShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjM0MQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGpvaW5fZ3VpbGQKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2RlcG9zaXRfdG9fdHJlYXN1cnlfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjMxMgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjE5NQogICAgLy8gY2xhc3MgQWxnb1JlYWxtR3VpbGRTeXN0ZW0oQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzEyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgZGVwb3NpdF90b190cmVhc3VyeQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfZ3VpbGRfcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI2MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjE5NQogICAgLy8gY2xhc3MgQWxnb1JlYWxtR3VpbGRTeXN0ZW0oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI2MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNyZWF0ZV9ndWlsZAogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfbGVhZGVyYm9hcmRfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI0NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjE5NQogICAgLy8gY2xhc3MgQWxnb1JlYWxtR3VpbGRTeXN0ZW0oQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MjQ0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX2xlYWRlcmJvYXJkCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3NldF9nYW1lX21hbmFnZXJfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjIzNgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjE5NQogICAgLy8gY2xhc3MgQWxnb1JlYWxtR3VpbGRTeXN0ZW0oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFwcGxpY2F0aW9ucwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MjM2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgc2V0X2dhbWVfbWFuYWdlcgogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9vcHRfaW5fcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjIyNwogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiT3B0SW4iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGludGNfMSAvLyBPcHRJbgogICAgPT0KICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE9wdEluCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgb3B0X2luCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AyNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjE5NQogICAgLy8gY2xhc3MgQWxnb1JlYWxtR3VpbGRTeXN0ZW0oQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMjgKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5ndWlsZF9zeXN0ZW0uQWxnb1JlYWxtR3VpbGRTeXN0ZW0ub3B0X2luKCkgLT4gdm9pZDoKb3B0X2luOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MjI3LTIyOAogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiT3B0SW4iXSkKICAgIC8vIGRlZiBvcHRfaW4oc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDk5CiAgICAvLyBUeG4uc2VuZGVyLCBzZWxmLmdhbWVfbWFuYWdlcl9hcHAudmFsdWUsIGIiaXNfcmVnaXN0ZXJlZCIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNSAvLyAiZ2FtZV9tYW5hZ2VyX2FwcCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nYW1lX21hbmFnZXJfYXBwIGV4aXN0cwogICAgcHVzaGJ5dGVzIDB4Njk3MzVmNzI2NTY3Njk3Mzc0NjU3MjY1NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ5Ny01MDAKICAgIC8vICMgUmVhZCB0aGUgcGxheWVyJ3MgcmVnaXN0cmF0aW9uIGZsYWcgc3RyYWlnaHQgZnJvbSB0aGUgZ2FtZSBtYW5hZ2VyCiAgICAvLyBpc19yZWdpc3RlcmVkLCBleGlzdHMgPSBvcC5BcHBMb2NhbC5nZXRfZXhfYnl0ZXMoCiAgICAvLyAgICAgVHhuLnNlbmRlciwgc2VsZi5nYW1lX21hbmFnZXJfYXBwLnZhbHVlLCBiImlzX3JlZ2lzdGVyZWQiCiAgICAvLyApCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1MDEKICAgIC8vIGFzc2VydCBleGlzdHMgYW5kIGlzX3JlZ2lzdGVyZWQgPT0gQm9vbChUcnVlKS5ieXRlcywgIlBsYXllciBub3QgcmVnaXN0ZXJlZCIKICAgIGJ6IG9wdF9pbl9ib29sX2ZhbHNlQDQKICAgIGZyYW1lX2RpZyAwCiAgICBieXRlYyAxNiAvLyAweDgwCiAgICA9PQogICAgYnogb3B0X2luX2Jvb2xfZmFsc2VANAogICAgaW50Y18xIC8vIDEKCm9wdF9pbl9ib29sX21lcmdlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1MDEKICAgIC8vIGFzc2VydCBleGlzdHMgYW5kIGlzX3JlZ2lzdGVyZWQgPT0gQm9vbChUcnVlKS5ieXRlcywgIlBsYXllciBub3QgcmVnaXN0ZXJlZCIKICAgIGFzc2VydCAvLyBQbGF5ZXIgbm90IHJlZ2lzdGVyZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjIzMQogICAgLy8gc2VsZi5wbGF5ZXJfZ3VpbGRfaWRbVHhuLnNlbmRlcl0gPSBVSW50NjQoMCkKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjXzEgLy8gInBsYXllcl9ndWlsZF9pZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weToyMzIKICAgIC8vIHNlbGYucGxheWVyX3JvbGVbVHhuLnNlbmRlcl0gPSBTdHJpbmcoIiIpCiAgICB0eG4gU2VuZGVyCiAgICBieXRlY18zIC8vICJwbGF5ZXJfcm9sZSIKICAgIHB1c2hieXRlcyAiIgogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MjMzCiAgICAvLyBzZWxmLmlzX2d1aWxkX21lbWJlcltUeG4uc2VuZGVyXSA9IEJvb2woRmFsc2UpCiAgICB0eG4gU2VuZGVyCiAgICBieXRlY18yIC8vICJpc19ndWlsZF9tZW1iZXIiCiAgICBieXRlYyA0IC8vIDB4MDAKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjIzNAogICAgLy8gc2VsZi5jb250cmlidXRpb25fc2NvcmVbVHhuLnNlbmRlcl0gPSBVSW50NjQoMCkKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjIDEwIC8vICJjb250cmlidXRpb25fc2NvcmUiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2xvY2FsX3B1dAogICAgcmV0c3ViCgpvcHRfaW5fYm9vbF9mYWxzZUA0OgogICAgaW50Y18wIC8vIDAKICAgIGIgb3B0X2luX2Jvb2xfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uZ3VpbGRfc3lzdGVtLkFsZ29SZWFsbUd1aWxkU3lzdGVtLnNldF9nYW1lX21hbmFnZXIoZ2FtZV9tYW5hZ2VyOiB1aW50NjQpIC0+IHZvaWQ6CnNldF9nYW1lX21hbmFnZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weToyMzYtMjM3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBzZXRfZ2FtZV9tYW5hZ2VyKHNlbGYsIGdhbWVfbWFuYWdlcjogQXBwbGljYXRpb24pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI0MAogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLmd1aWxkX21hc3Rlci52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vICJndWlsZF9tYXN0ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ3VpbGRfbWFzdGVyIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjIzOS0yNDEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBzZWxmLmd1aWxkX21hc3Rlci52YWx1ZQogICAgLy8gKSwgIk9ubHkgZ3VpbGQgbWFzdGVyIGNhbiBsaW5rIHRoZSBnYW1lIG1hbmFnZXIiCiAgICBhc3NlcnQgLy8gT25seSBndWlsZCBtYXN0ZXIgY2FuIGxpbmsgdGhlIGdhbWUgbWFuYWdlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MjQyCiAgICAvLyBzZWxmLmdhbWVfbWFuYWdlcl9hcHAudmFsdWUgPSBnYW1lX21hbmFnZXIKICAgIGJ5dGVjIDE1IC8vICJnYW1lX21hbmFnZXJfYXBwIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5ndWlsZF9zeXN0ZW0uQWxnb1JlYWxtR3VpbGRTeXN0ZW0uY3JlYXRlX2xlYWRlcmJvYXJkKG1icl9wYXltZW50OiB1aW50NjQpIC0+IHZvaWQ6CmNyZWF0ZV9sZWFkZXJib2FyZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI0NC0yNDUKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNyZWF0ZV9sZWFkZXJib2FyZChzZWxmLCBtYnJfcGF5bWVudDogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI1MQogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLmd1aWxkX21hc3Rlci52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vICJndWlsZF9tYXN0ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ3VpbGRfbWFzdGVyIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI1MC0yNTIKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgVHhuLnNlbmRlciA9PSBzZWxmLmd1aWxkX21hc3Rlci52YWx1ZQogICAgLy8gKSwgIk9ubHkgZ3VpbGQgbWFzdGVyIGNhbiBjcmVhdGUgdGhlIGxlYWRlcmJvYXJkIgogICAgYXNzZXJ0IC8vIE9ubHkgZ3VpbGQgbWFzdGVyIGNhbiBjcmVhdGUgdGhlIGxlYWRlcmJvYXJkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weToyNTQKICAgIC8vIG1icl9wYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MjUzLTI1NQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBtYnJfcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAiTUJSIHBheW1lbnQgbXVzdCBnbyB0byB0aGUgZ3VpbGQgY29udHJhY3QiCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgbXVzdCBnbyB0byB0aGUgZ3VpbGQgY29udHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI1NgogICAgLy8gYXNzZXJ0IG1icl9wYXltZW50LmFtb3VudCA+PSBMRUFERVJCT0FSRF9CT1hfTUJSLCAiSW5zdWZmaWNpZW50IE1CUiBwYXltZW50IgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIHB1c2hpbnQgMTk4OTAwIC8vIDE5ODkwMAogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgTUJSIHBheW1lbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI1NwogICAgLy8gYXNzZXJ0IG5vdCBzZWxmLmxlYWRlcmJvYXJkLCAiTGVhZGVyYm9hcmQgYWxyZWFkeSBleGlzdHMiCiAgICBieXRlYyA1IC8vIDB4NmM2NTYxNjQ2NTcyNjI2ZjYxNzI2NAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQgLy8gTGVhZGVyYm9hcmQgYWxyZWFkeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI2MQogICAgLy8gXS5mcm9tX2J5dGVzKG9wLmJ6ZXJvKExFQURFUkJPQVJEX1NJWkUgKiBMRUFERVJCT0FSRF9FTlRSWV9TSVpFKSkKICAgIHB1c2hpbnQgNDgwIC8vIDQ4MAogICAgYnplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI1OC0yNTkKICAgIC8vICMgRXZlcnkgc2xvdCBzdGFydHMgZW1wdHkgKHplcm8gYWRkcmVzcywgemVybyBzY29yZSkKICAgIC8vIHNlbGYubGVhZGVyYm9hcmQudmFsdWUgPSBhcmM0LlN0YXRpY0FycmF5WwogICAgYnl0ZWMgNSAvLyAweDZjNjU2MTY0NjU3MjYyNmY2MTcyNjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI1OC0yNjEKICAgIC8vICMgRXZlcnkgc2xvdCBzdGFydHMgZW1wdHkgKHplcm8gYWRkcmVzcywgemVybyBzY29yZSkKICAgIC8vIHNlbGYubGVhZGVyYm9hcmQudmFsdWUgPSBhcmM0LlN0YXRpY0FycmF5WwogICAgLy8gICAgIExlYWRlcmJvYXJkRW50cnksIHR5cGluZy5MaXRlcmFsWzEwXQogICAgLy8gXS5mcm9tX2J5dGVzKG9wLmJ6ZXJvKExFQURFUkJPQVJEX1NJWkUgKiBMRUFERVJCT0FSRF9FTlRSWV9TSVpFKSkKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uZ3VpbGRfc3lzdGVtLkFsZ29SZWFsbUd1aWxkU3lzdGVtLmNyZWF0ZV9ndWlsZChndWlsZF9uYW1lOiBieXRlcywgdHJlYXN1cnlfcGF5bWVudDogdWludDY0KSAtPiB1aW50NjQ6CmNyZWF0ZV9ndWlsZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI2My0yNjYKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNyZWF0ZV9ndWlsZCgKICAgIC8vICAgICBzZWxmLCBndWlsZF9uYW1lOiBTdHJpbmcsIHRyZWFzdXJ5X3BheW1lbnQ6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uCiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MjcyCiAgICAvLyBhc3NlcnQgbm90IHNlbGYuaXNfZ3VpbGRfbWVtYmVyW1R4bi5zZW5kZXJdLCAiQWxyZWFkeSBpbiBhIGd1aWxkIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImlzX2d1aWxkX21lbWJlciIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX2d1aWxkX21lbWJlciBleGlzdHMgZm9yIGFjY291bnQKICAgIGJ5dGVjIDQgLy8gMHgwMAogICAgPT0KICAgIGFzc2VydCAvLyBBbHJlYWR5IGluIGEgZ3VpbGQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI3MwogICAgLy8gYXNzZXJ0IGd1aWxkX25hbWUuYnl0ZXMubGVuZ3RoID4gMCwgIkd1aWxkIG5hbWUgY2Fubm90IGJlIGVtcHR5IgogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGR1cAogICAgYXNzZXJ0IC8vIEd1aWxkIG5hbWUgY2Fubm90IGJlIGVtcHR5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weToyNzQKICAgIC8vIGFzc2VydCBndWlsZF9uYW1lLmJ5dGVzLmxlbmd0aCA8PSBNQVhfR1VJTERfTkFNRV9MRU5HVEgsICJHdWlsZCBuYW1lIHRvbyBsb25nIgogICAgZHVwCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICA8PQogICAgYXNzZXJ0IC8vIEd1aWxkIG5hbWUgdG9vIGxvbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI3NgogICAgLy8gdHJlYXN1cnlfcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI3NS0yNzcKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgdHJlYXN1cnlfcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAiVHJlYXN1cnkgcGF5bWVudCBtdXN0IGdvIHRvIHRoZSBndWlsZCBjb250cmFjdCIKICAgIGFzc2VydCAvLyBUcmVhc3VyeSBwYXltZW50IG11c3QgZ28gdG8gdGhlIGd1aWxkIGNvbnRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weToyNzkKICAgIC8vIHRyZWFzdXJ5X3BheW1lbnQuc2VuZGVyID09IFR4bi5zZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6Mjc4LTI4MAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICB0cmVhc3VyeV9wYXltZW50LnNlbmRlciA9PSBUeG4uc2VuZGVyCiAgICAvLyApLCAiVHJlYXN1cnkgcGF5bWVudCBtdXN0IGNvbWUgZnJvbSB0aGUgZ3VpbGQgY3JlYXRvciIKICAgIGFzc2VydCAvLyBUcmVhc3VyeSBwYXltZW50IG11c3QgY29tZSBmcm9tIHRoZSBndWlsZCBjcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weToyODIKICAgIC8vIHRyZWFzdXJ5X3BheW1lbnQuYW1vdW50ID49IE1JTl9HVUlMRF9UUkVBU1VSWQogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIGR1cAogICAgcHVzaGludCAxMDAwMDAgLy8gMTAwMDAwCiAgICA+PQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MjgxLTI4MwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICB0cmVhc3VyeV9wYXltZW50LmFtb3VudCA+PSBNSU5fR1VJTERfVFJFQVNVUlkKICAgIC8vICksICJNaW5pbXVtIDAuMSBBTEdPIHJlcXVpcmVkIGZvciBndWlsZCBjcmVhdGlvbiIKICAgIGFzc2VydCAvLyBNaW5pbXVtIDAuMSBBTEdPIHJlcXVpcmVkIGZvciBndWlsZCBjcmVhdGlvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6Mjg1CiAgICAvLyBndWlsZF9pZCA9IHNlbGYudG90YWxfZ3VpbGRzLnZhbHVlICsgMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gInRvdGFsX2d1aWxkcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9ndWlsZHMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6Mjg3CiAgICAvLyBzZWxmLmd1aWxkX25hbWVzW2d1aWxkX2lkXSA9IGd1aWxkX25hbWUKICAgIGR1cAogICAgaXRvYgogICAgcHVzaGJ5dGVzIDB4NmUKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI4OS0yOTAKICAgIC8vIHRyZWFzdXJ5X3BheW1lbnQuYW1vdW50CiAgICAvLyAtIFRSRUFTVVJZX0JPWF9NQlIKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MjkwCiAgICAvLyAtIFRSRUFTVVJZX0JPWF9NQlIKICAgIHB1c2hpbnQgOTMwMCAvLyA5MzAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weToyODktMjkwCiAgICAvLyB0cmVhc3VyeV9wYXltZW50LmFtb3VudAogICAgLy8gLSBUUkVBU1VSWV9CT1hfTUJSCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weToyOTEKICAgIC8vIC0gR1VJTERfTkFNRV9CT1hfTUJSCiAgICBwdXNoaW50IDY5MDAgLy8gNjkwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6Mjg5LTI5MQogICAgLy8gdHJlYXN1cnlfcGF5bWVudC5hbW91bnQKICAgIC8vIC0gVFJFQVNVUllfQk9YX01CUgogICAgLy8gLSBHVUlMRF9OQU1FX0JPWF9NQlIKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI5MgogICAgLy8gLSBHVUlMRF9OQU1FX0JZVEVfTUJSICogZ3VpbGRfbmFtZS5ieXRlcy5sZW5ndGgKICAgIHB1c2hpbnQgNDAwIC8vIDQwMAogICAgdW5jb3ZlciA0CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weToyODktMjkyCiAgICAvLyB0cmVhc3VyeV9wYXltZW50LmFtb3VudAogICAgLy8gLSBUUkVBU1VSWV9CT1hfTUJSCiAgICAvLyAtIEdVSUxEX05BTUVfQk9YX01CUgogICAgLy8gLSBHVUlMRF9OQU1FX0JZVEVfTUJSICogZ3VpbGRfbmFtZS5ieXRlcy5sZW5ndGgKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI4OAogICAgLy8gc2VsZi5ndWlsZF90cmVhc3VyeVtndWlsZF9pZF0gPSAoCiAgICBieXRlYyA2IC8vIDB4NzQKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI4OC0yOTMKICAgIC8vIHNlbGYuZ3VpbGRfdHJlYXN1cnlbZ3VpbGRfaWRdID0gKAogICAgLy8gICAgIHRyZWFzdXJ5X3BheW1lbnQuYW1vdW50CiAgICAvLyAgICAgLSBUUkVBU1VSWV9CT1hfTUJSCiAgICAvLyAgICAgLSBHVUlMRF9OQU1FX0JPWF9NQlIKICAgIC8vICAgICAtIEdVSUxEX05BTUVfQllURV9NQlIgKiBndWlsZF9uYW1lLmJ5dGVzLmxlbmd0aAogICAgLy8gKQogICAgc3dhcAogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI5NS0yOTYKICAgIC8vICMgU2V0IHBsYXllciBhcyBndWlsZCBsZWFkZXIKICAgIC8vIHNlbGYucGxheWVyX2d1aWxkX2lkW1R4bi5zZW5kZXJdID0gZ3VpbGRfaWQKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjXzEgLy8gInBsYXllcl9ndWlsZF9pZCIKICAgIGRpZyA0CiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weToyOTcKICAgIC8vIHNlbGYucGxheWVyX3JvbGVbVHhuLnNlbmRlcl0gPSBTdHJpbmcoImxlYWRlciIpCiAgICB0eG4gU2VuZGVyCiAgICBieXRlY18zIC8vICJwbGF5ZXJfcm9sZSIKICAgIGJ5dGVjIDcgLy8gImxlYWRlciIKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjI5OAogICAgLy8gc2VsZi5pc19ndWlsZF9tZW1iZXJbVHhuLnNlbmRlcl0gPSBCb29sKFRydWUpCiAgICB0eG4gU2VuZGVyCiAgICBieXRlY18yIC8vICJpc19ndWlsZF9tZW1iZXIiCiAgICBieXRlYyAxNiAvLyAweDgwCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozMDAKICAgIC8vIHNlbGYudG90YWxfZ3VpbGRzLnZhbHVlID0gZ3VpbGRfaWQKICAgIGJ5dGVjIDggLy8gInRvdGFsX2d1aWxkcyIKICAgIGRpZyAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzAxCiAgICAvLyBzZWxmLmFjdGl2ZV9ndWlsZHNfY291bnQudmFsdWUgKz0gMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDkgLy8gImFjdGl2ZV9ndWlsZHNfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWN0aXZlX2d1aWxkc19jb3VudCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyA5IC8vICJhY3RpdmVfZ3VpbGRzX2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjMwNgogICAgLy8gQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjMwNwogICAgLy8gYXJjNC5VSW50NjQoc2VsZi5ndWlsZF90cmVhc3VyeVtndWlsZF9pZF0pLAogICAgc3dhcAogICAgYnRvaQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzA0LTMwOAogICAgLy8gR3VpbGRDcmVhdGVkKAogICAgLy8gICAgIGFyYzQuVUludDY0KGd1aWxkX2lkKSwKICAgIC8vICAgICBBZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYuZ3VpbGRfdHJlYXN1cnlbZ3VpbGRfaWRdKSwKICAgIC8vICkKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozMDMtMzA5CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgR3VpbGRDcmVhdGVkKAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChndWlsZF9pZCksCiAgICAvLyAgICAgICAgIEFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHNlbGYuZ3VpbGRfdHJlYXN1cnlbZ3VpbGRfaWRdKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhjZGY2MzI5OSAvLyBtZXRob2QgIkd1aWxkQ3JlYXRlZCh1aW50NjQsYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjMxMAogICAgLy8gcmV0dXJuIGd1aWxkX2lkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmd1aWxkX3N5c3RlbS5BbGdvUmVhbG1HdWlsZFN5c3RlbS5kZXBvc2l0X3RvX3RyZWFzdXJ5KHBheW1lbnQ6IHVpbnQ2NCkgLT4gdWludDY0OgpkZXBvc2l0X3RvX3RyZWFzdXJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzEyLTMxMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgZGVwb3NpdF90b190cmVhc3VyeShzZWxmLCBwYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbikgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjMxNQogICAgLy8gYXNzZXJ0IHNlbGYuaXNfZ3VpbGRfbWVtYmVyW1R4bi5zZW5kZXJdLCAiTXVzdCBiZSBndWlsZCBtZW1iZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiaXNfZ3VpbGRfbWVtYmVyIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXNfZ3VpbGRfbWVtYmVyIGV4aXN0cyBmb3IgYWNjb3VudAogICAgYnl0ZWMgNCAvLyAweDAwCiAgICAhPQogICAgYXNzZXJ0IC8vIE11c3QgYmUgZ3VpbGQgbWVtYmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozMTcKICAgIC8vIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozMTYtMzE4CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgIkRlcG9zaXQgbXVzdCBnbyB0byB0aGUgZ3VpbGQgY29udHJhY3QiCiAgICBhc3NlcnQgLy8gRGVwb3NpdCBtdXN0IGdvIHRvIHRoZSBndWlsZCBjb250cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzE5CiAgICAvLyBhc3NlcnQgcGF5bWVudC5zZW5kZXIgPT0gVHhuLnNlbmRlciwgIkRlcG9zaXQgbXVzdCBjb21lIGZyb20gdGhlIGRlcG9zaXRvciIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIERlcG9zaXQgbXVzdCBjb21lIGZyb20gdGhlIGRlcG9zaXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzIxCiAgICAvLyBndWlsZF9pZCA9IHNlbGYucGxheWVyX2d1aWxkX2lkW1R4bi5zZW5kZXJdCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAicGxheWVyX2d1aWxkX2lkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGxheWVyX2d1aWxkX2lkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzIyCiAgICAvLyBuZXdfYmFsYW5jZSA9IHNlbGYuZ3VpbGRfdHJlYXN1cnlbZ3VpbGRfaWRdICsgcGF5bWVudC5hbW91bnQKICAgIGl0b2IKICAgIGR1cAogICAgYnl0ZWMgNiAvLyAweDc0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ3VpbGRfdHJlYXN1cnkgZW50cnkgZXhpc3RzCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgZHVwCiAgICBjb3ZlciAzCiAgICBzd2FwCiAgICBkaWcgMQogICAgKwogICAgZHVwCiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozMjMKICAgIC8vIHNlbGYuZ3VpbGRfdHJlYXN1cnlbZ3VpbGRfaWRdID0gbmV3X2JhbGFuY2UKICAgIGl0b2IKICAgIGR1cAogICAgY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozMjUtMzI2CiAgICAvLyAjIERlcG9zaXRzIGNvdW50IHRvd2FyZHMgdGhlIG1lbWJlcidzIGNvbnRyaWJ1dGlvbiBzY29yZQogICAgLy8gbmV3X3Njb3JlID0gc2VsZi5jb250cmlidXRpb25fc2NvcmVbVHhuLnNlbmRlcl0gKyBwYXltZW50LmFtb3VudAogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJjb250cmlidXRpb25fc2NvcmUiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb250cmlidXRpb25fc2NvcmUgZXhpc3RzIGZvciBhY2NvdW50CiAgICArCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjMyNwogICAgLy8gc2VsZi5jb250cmlidXRpb25fc2NvcmVbVHhuLnNlbmRlcl0gPSBuZXdfc2NvcmUKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjIDEwIC8vICJjb250cmlidXRpb25fc2NvcmUiCiAgICB1bmNvdmVyIDIKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjMyOAogICAgLy8gc2VsZi5fcmVtb3ZlX2Zyb21fbGVhZGVyYm9hcmQoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgX3JlbW92ZV9mcm9tX2xlYWRlcmJvYXJkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozMjkKICAgIC8vIHNlbGYuX2luc2VydF9pbnRvX2xlYWRlcmJvYXJkKFR4bi5zZW5kZXIsIGd1aWxkX2lkLCBuZXdfc2NvcmUpCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3MzUKICAgIC8vIGFzc2VydCBzZWxmLmxlYWRlcmJvYXJkLCAiTGVhZGVyYm9hcmQgbm90IGNyZWF0ZWQiCiAgICBieXRlYyA1IC8vIDB4NmM2NTYxNjQ2NTcyNjI2ZjYxNzI2NAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTGVhZGVyYm9hcmQgbm90IGNyZWF0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjczNwogICAgLy8gYm9hcmQgPSBzZWxmLmxlYWRlcmJvYXJkLnZhbHVlLmNvcHkoKQogICAgYnl0ZWMgNSAvLyAweDZjNjU2MTY0NjU3MjYyNmY2MTcyNjQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxlYWRlcmJvYXJkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NzM4LTczOQogICAgLy8gIyBUaWVzIGtlZXAgdGhlIGVhcmxpZXIgY29udHJpYnV0b3IgYWhlYWQKICAgIC8vIHNsb3QgPSBVSW50NjQoTEVBREVSQk9BUkRfU0laRSkKICAgIGludGNfMyAvLyAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NzQwCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoTEVBREVSQk9BUkRfU0laRSk6CiAgICBpbnRjXzAgLy8gMAoKZGVwb3NpdF90b190cmVhc3VyeV9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3NDAKICAgIC8vIGZvciBpIGluIHVyYW5nZShMRUFERVJCT0FSRF9TSVpFKToKICAgIGZyYW1lX2RpZyA5CiAgICBpbnRjXzMgLy8gMTAKICAgIDwKICAgIGZyYW1lX2RpZyA4CiAgICBmcmFtZV9idXJ5IDAKICAgIGJ6IGRlcG9zaXRfdG9fdHJlYXN1cnlfYWZ0ZXJfZm9yQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5Ojc0MQogICAgLy8gaWYgYm9hcmRbaV0uY29udHJpYnV0aW9uX3Njb3JlLm5hdGl2ZSA8IHNjb3JlOgogICAgZnJhbWVfZGlnIDkKICAgIGludGNfMiAvLyA0OAogICAgKgogICAgZnJhbWVfZGlnIDcKICAgIHN3YXAKICAgIGludGNfMiAvLyA0OAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIDUKICAgIDwKICAgIGJ6IGRlcG9zaXRfdG9fdHJlYXN1cnlfYWZ0ZXJfaWZfZWxzZUA1CiAgICBmcmFtZV9kaWcgOQogICAgZnJhbWVfYnVyeSAwCgpkZXBvc2l0X3RvX3RyZWFzdXJ5X2FmdGVyX2ZvckA3OgogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgZnJhbWVfYnVyeSA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3NDQKICAgIC8vIGlmIHNsb3QgPT0gTEVBREVSQk9BUkRfU0laRToKICAgIGludGNfMyAvLyAxMAogICAgPT0KICAgIGJueiBkZXBvc2l0X3RvX3RyZWFzdXJ5X2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5ndWlsZF9zeXN0ZW0uQWxnb1JlYWxtR3VpbGRTeXN0ZW0uX2luc2VydF9pbnRvX2xlYWRlcmJvYXJkQDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3NDctNzQ4CiAgICAvLyAjIFNoaWZ0IHRoZSBsb3dlciBlbnRyaWVzIGRvd24sIGRyb3BwaW5nIHRoZSBsYXN0IG9uZQogICAgLy8gaSA9IFVJbnQ2NChMRUFERVJCT0FSRF9TSVpFIC0gMSkKICAgIHB1c2hpbnQgOSAvLyA5CiAgICBmcmFtZV9idXJ5IDkKCmRlcG9zaXRfdG9fdHJlYXN1cnlfd2hpbGVfdG9wQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NzQ5CiAgICAvLyB3aGlsZSBpID4gc2xvdDoKICAgIGZyYW1lX2RpZyA5CiAgICBmcmFtZV9kaWcgOAogICAgPgogICAgYnogZGVwb3NpdF90b190cmVhc3VyeV9hZnRlcl93aGlsZUAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NzUwCiAgICAvLyBib2FyZFtpXSA9IGJvYXJkW2kgLSAxXS5jb3B5KCkKICAgIGZyYW1lX2RpZyA5CiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGludGNfMiAvLyA0OAogICAgKgogICAgZnJhbWVfZGlnIDcKICAgIGR1cAogICAgY292ZXIgMwogICAgc3dhcAogICAgaW50Y18yIC8vIDQ4CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGRpZyAzCiAgICBpbnRjXzMgLy8gMTAKICAgIDwKICAgIGFzc2VydCAvLyBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgdW5jb3ZlciAzCiAgICBpbnRjXzIgLy8gNDgKICAgICoKICAgIHVuY292ZXIgMwogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICByZXBsYWNlMwogICAgZnJhbWVfYnVyeSA3CiAgICBmcmFtZV9idXJ5IDkKICAgIGIgZGVwb3NpdF90b190cmVhc3VyeV93aGlsZV90b3BAMTAKCmRlcG9zaXRfdG9fdHJlYXN1cnlfYWZ0ZXJfd2hpbGVAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3NTUKICAgIC8vIGNvbnRyaWJ1dGlvbl9zY29yZT1hcmM0LlVJbnQ2NChzY29yZSksCiAgICBmcmFtZV9kaWcgNQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NzUyLTc1NgogICAgLy8gYm9hcmRbc2xvdF0gPSBMZWFkZXJib2FyZEVudHJ5KAogICAgLy8gICAgIHBsYXllcj1BZGRyZXNzKHBsYXllciksCiAgICAvLyAgICAgZ3VpbGRfaWQ9YXJjNC5VSW50NjQoZ3VpbGRfaWQpLAogICAgLy8gICAgIGNvbnRyaWJ1dGlvbl9zY29yZT1hcmM0LlVJbnQ2NChzY29yZSksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgNgogICAgZnJhbWVfZGlnIDEKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgOAogICAgZHVwCiAgICBpbnRjXzMgLy8gMTAKICAgIDwKICAgIGFzc2VydCAvLyBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgaW50Y18yIC8vIDQ4CiAgICAqCiAgICBmcmFtZV9kaWcgNwogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICByZXBsYWNlMwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NzU3CiAgICAvLyBzZWxmLmxlYWRlcmJvYXJkLnZhbHVlID0gYm9hcmQuY29weSgpCiAgICBieXRlYyA1IC8vIDB4NmM2NTYxNjQ2NTcyNjI2ZjYxNzI2NAogICAgc3dhcAogICAgYm94X3B1dAoKZGVwb3NpdF90b190cmVhc3VyeV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uZ3VpbGRfc3lzdGVtLkFsZ29SZWFsbUd1aWxkU3lzdGVtLl9pbnNlcnRfaW50b19sZWFkZXJib2FyZEAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjMzNAogICAgLy8gQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjMzNQogICAgLy8gYXJjNC5VSW50NjQocGF5bWVudC5hbW91bnQpLAogICAgZnJhbWVfZGlnIDIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjMzMi0zMzcKICAgIC8vIFRyZWFzdXJ5RGVwb3NpdCgKICAgIC8vICAgICBhcmM0LlVJbnQ2NChndWlsZF9pZCksCiAgICAvLyAgICAgQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChwYXltZW50LmFtb3VudCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQobmV3X2JhbGFuY2UpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIDEKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyA0CiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjMzMS0zMzgKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBUcmVhc3VyeURlcG9zaXQoCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KGd1aWxkX2lkKSwKICAgIC8vICAgICAgICAgQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQocGF5bWVudC5hbW91bnQpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChuZXdfYmFsYW5jZSksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MjEyZjZjM2UgLy8gbWV0aG9kICJUcmVhc3VyeURlcG9zaXQodWludDY0LGFkZHJlc3MsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzM5CiAgICAvLyByZXR1cm4gbmV3X2JhbGFuY2UKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKZGVwb3NpdF90b190cmVhc3VyeV9hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3NDAKICAgIC8vIGZvciBpIGluIHVyYW5nZShMRUFERVJCT0FSRF9TSVpFKToKICAgIGZyYW1lX2RpZyA5CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA5CiAgICBiIGRlcG9zaXRfdG9fdHJlYXN1cnlfZm9yX2hlYWRlckAyCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5ndWlsZF9zeXN0ZW0uQWxnb1JlYWxtR3VpbGRTeXN0ZW0uam9pbl9ndWlsZChndWlsZF9pZDogdWludDY0LCBhcHBsaWNhdGlvbl9tZXNzYWdlOiBieXRlcykgLT4gYnl0ZXM6CmpvaW5fZ3VpbGQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozNDEtMzQyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBqb2luX2d1aWxkKHNlbGYsIGd1aWxkX2lkOiBVSW50NjQsIGFwcGxpY2F0aW9uX21lc3NhZ2U6IFN0cmluZykgLT4gU3RyaW5nOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozNDQKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5pc19ndWlsZF9tZW1iZXJbVHhuLnNlbmRlcl0sICJBbHJlYWR5IGluIGEgZ3VpbGQiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiaXNfZ3VpbGRfbWVtYmVyIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXNfZ3VpbGRfbWVtYmVyIGV4aXN0cyBmb3IgYWNjb3VudAogICAgYnl0ZWMgNCAvLyAweDAwCiAgICA9PQogICAgYXNzZXJ0IC8vIEFscmVhZHkgaW4gYSBndWlsZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzQ1CiAgICAvLyBhc3NlcnQgZ3VpbGRfaWQgPD0gc2VsZi50b3RhbF9ndWlsZHMudmFsdWUsICJHdWlsZCBkb2VzIG5vdCBleGlzdCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJ0b3RhbF9ndWlsZHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfZ3VpbGRzIGV4aXN0cwogICAgZnJhbWVfZGlnIC0yCiAgICA+PQogICAgYXNzZXJ0IC8vIEd1aWxkIGRvZXMgbm90IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozNTAKICAgIC8vIHNlbGYucGxheWVyX2d1aWxkX2lkW1R4bi5zZW5kZXJdID0gZ3VpbGRfaWQKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjXzEgLy8gInBsYXllcl9ndWlsZF9pZCIKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzUxCiAgICAvLyBzZWxmLnBsYXllcl9yb2xlW1R4bi5zZW5kZXJdID0gU3RyaW5nKCJtZW1iZXIiKQogICAgdHhuIFNlbmRlcgogICAgYnl0ZWNfMyAvLyAicGxheWVyX3JvbGUiCiAgICBieXRlYyAxOCAvLyAibWVtYmVyIgogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzUyCiAgICAvLyBzZWxmLmlzX2d1aWxkX21lbWJlcltUeG4uc2VuZGVyXSA9IEJvb2woVHJ1ZSkKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjXzIgLy8gImlzX2d1aWxkX21lbWJlciIKICAgIGJ5dGVjIDE2IC8vIDB4ODAKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjM1NAogICAgLy8gYXJjNC5lbWl0KEd1aWxkSm9pbmVkKGFyYzQuVUludDY0KGd1aWxkX2lkKSwgQWRkcmVzcyhUeG4uc2VuZGVyKSkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4YzliNDk2YjYgLy8gbWV0aG9kICJHdWlsZEpvaW5lZCh1aW50NjQsYWRkcmVzcykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzU1CiAgICAvLyByZXR1cm4gU3RyaW5nKCJXZWxjb21lIHRvIHRoZSBndWlsZCEiKQogICAgcHVzaGJ5dGVzICJXZWxjb21lIHRvIHRoZSBndWlsZCEiCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmd1aWxkX3N5c3RlbS5BbGdvUmVhbG1HdWlsZFN5c3RlbS5wcm9tb3RlX3RvX29mZmljZXIobWVtYmVyOiBieXRlcykgLT4gYnl0ZXM6CnByb21vdGVfdG9fb2ZmaWNlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjM1Ny0zNTgKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHByb21vdGVfdG9fb2ZmaWNlcihzZWxmLCBtZW1iZXI6IEFjY291bnQpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzY0CiAgICAvLyBhc3NlcnQgc2VsZi5pc19ndWlsZF9tZW1iZXJbVHhuLnNlbmRlcl0gYW5kIHNlbGYucGxheWVyX3JvbGVbCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiaXNfZ3VpbGRfbWVtYmVyIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXNfZ3VpbGRfbWVtYmVyIGV4aXN0cyBmb3IgYWNjb3VudAogICAgYnl0ZWMgNCAvLyAweDAwCiAgICAhPQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzY0LTM2NgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfZ3VpbGRfbWVtYmVyW1R4bi5zZW5kZXJdIGFuZCBzZWxmLnBsYXllcl9yb2xlWwogICAgLy8gICAgIFR4bi5zZW5kZXIKICAgIC8vIF0gPT0gU3RyaW5nKCJsZWFkZXIiKSwgIk9ubHkgdGhlIGd1aWxkIGxlYWRlciBjYW4gcHJvbW90ZSBvZmZpY2VycyIKICAgIGJ6IHByb21vdGVfdG9fb2ZmaWNlcl9ib29sX2ZhbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjM2NQogICAgLy8gVHhuLnNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzY0LTM2NgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfZ3VpbGRfbWVtYmVyW1R4bi5zZW5kZXJdIGFuZCBzZWxmLnBsYXllcl9yb2xlWwogICAgLy8gICAgIFR4bi5zZW5kZXIKICAgIC8vIF0gPT0gU3RyaW5nKCJsZWFkZXIiKSwgIk9ubHkgdGhlIGd1aWxkIGxlYWRlciBjYW4gcHJvbW90ZSBvZmZpY2VycyIKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozNjQKICAgIC8vIGFzc2VydCBzZWxmLmlzX2d1aWxkX21lbWJlcltUeG4uc2VuZGVyXSBhbmQgc2VsZi5wbGF5ZXJfcm9sZVsKICAgIGJ5dGVjXzMgLy8gInBsYXllcl9yb2xlIgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzY0LTM2NgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfZ3VpbGRfbWVtYmVyW1R4bi5zZW5kZXJdIGFuZCBzZWxmLnBsYXllcl9yb2xlWwogICAgLy8gICAgIFR4bi5zZW5kZXIKICAgIC8vIF0gPT0gU3RyaW5nKCJsZWFkZXIiKSwgIk9ubHkgdGhlIGd1aWxkIGxlYWRlciBjYW4gcHJvbW90ZSBvZmZpY2VycyIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBsYXllcl9yb2xlIGV4aXN0cyBmb3IgYWNjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzY2CiAgICAvLyBdID09IFN0cmluZygibGVhZGVyIiksICJPbmx5IHRoZSBndWlsZCBsZWFkZXIgY2FuIHByb21vdGUgb2ZmaWNlcnMiCiAgICBieXRlYyA3IC8vICJsZWFkZXIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozNjQtMzY2CiAgICAvLyBhc3NlcnQgc2VsZi5pc19ndWlsZF9tZW1iZXJbVHhuLnNlbmRlcl0gYW5kIHNlbGYucGxheWVyX3JvbGVbCiAgICAvLyAgICAgVHhuLnNlbmRlcgogICAgLy8gXSA9PSBTdHJpbmcoImxlYWRlciIpLCAiT25seSB0aGUgZ3VpbGQgbGVhZGVyIGNhbiBwcm9tb3RlIG9mZmljZXJzIgogICAgPT0KICAgIGJ6IHByb21vdGVfdG9fb2ZmaWNlcl9ib29sX2ZhbHNlQDMKICAgIGludGNfMSAvLyAxCgpwcm9tb3RlX3RvX29mZmljZXJfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzY0LTM2NgogICAgLy8gYXNzZXJ0IHNlbGYuaXNfZ3VpbGRfbWVtYmVyW1R4bi5zZW5kZXJdIGFuZCBzZWxmLnBsYXllcl9yb2xlWwogICAgLy8gICAgIFR4bi5zZW5kZXIKICAgIC8vIF0gPT0gU3RyaW5nKCJsZWFkZXIiKSwgIk9ubHkgdGhlIGd1aWxkIGxlYWRlciBjYW4gcHJvbW90ZSBvZmZpY2VycyIKICAgIGFzc2VydCAvLyBPbmx5IHRoZSBndWlsZCBsZWFkZXIgY2FuIHByb21vdGUgb2ZmaWNlcnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjM2NwogICAgLy8gZ3VpbGRfaWQgPSBzZWxmLnBsYXllcl9ndWlsZF9pZFtUeG4uc2VuZGVyXQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInBsYXllcl9ndWlsZF9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBsYXllcl9ndWlsZF9pZCBleGlzdHMgZm9yIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjM2OQogICAgLy8gc2VsZi5wbGF5ZXJfZ3VpbGRfaWQuZ2V0KG1lbWJlciwgVUludDY0KDApKSA9PSBndWlsZF9pZAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAicGxheWVyX2d1aWxkX2lkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDEKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozNjgtMzcwCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYucGxheWVyX2d1aWxkX2lkLmdldChtZW1iZXIsIFVJbnQ2NCgwKSkgPT0gZ3VpbGRfaWQKICAgIC8vICksICJUYXJnZXQgaXMgbm90IGEgbWVtYmVyIG9mIHRoaXMgZ3VpbGQiCiAgICBhc3NlcnQgLy8gVGFyZ2V0IGlzIG5vdCBhIG1lbWJlciBvZiB0aGlzIGd1aWxkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozNzEKICAgIC8vIGFzc2VydCBzZWxmLnBsYXllcl9yb2xlW21lbWJlcl0gPT0gU3RyaW5nKCJtZW1iZXIiKSwgIkFscmVhZHkgYW4gb2ZmaWNlciIKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInBsYXllcl9yb2xlIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGxheWVyX3JvbGUgZXhpc3RzIGZvciBhY2NvdW50CiAgICBieXRlYyAxOCAvLyAibWVtYmVyIgogICAgPT0KICAgIGFzc2VydCAvLyBBbHJlYWR5IGFuIG9mZmljZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjM3MwogICAgLy8gc2VsZi5wbGF5ZXJfcm9sZVttZW1iZXJdID0gU3RyaW5nKCJvZmZpY2VyIikKICAgIGZyYW1lX2RpZyAtMQogICAgYnl0ZWNfMyAvLyAicGxheWVyX3JvbGUiCiAgICBieXRlYyAxNyAvLyAib2ZmaWNlciIKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjM3NAogICAgLy8gYXJjNC5lbWl0KE9mZmljZXJQcm9tb3RlZChhcmM0LlVJbnQ2NChndWlsZF9pZCksIEFkZHJlc3MobWVtYmVyKSkpCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4NDhkYTk0ZDMgLy8gbWV0aG9kICJPZmZpY2VyUHJvbW90ZWQodWludDY0LGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjM3NQogICAgLy8gcmV0dXJuIFN0cmluZygiTWVtYmVyIHByb21vdGVkIHRvIG9mZmljZXIiKQogICAgYnl0ZWMgMTkgLy8gIk1lbWJlciBwcm9tb3RlZCB0byBvZmZpY2VyIgogICAgcmV0c3ViCgpwcm9tb3RlX3RvX29mZmljZXJfYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIGIgcHJvbW90ZV90b19vZmZpY2VyX2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uZ3VpbGRfc3lzdGVtLkFsZ29SZWFsbUd1aWxkU3lzdGVtLnByb3Bvc2VfZ3VpbGRfYWN0aW9uKGFjdGlvbl90eXBlOiBieXRlcywgdGFyZ2V0X3BsYXllcjogYnl0ZXMsIGFtb3VudDogdWludDY0KSAtPiB1aW50NjQ6CnByb3Bvc2VfZ3VpbGRfYWN0aW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6Mzc3LTM4MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcHJvcG9zZV9ndWlsZF9hY3Rpb24oCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBhY3Rpb25fdHlwZTogU3RyaW5nLAogICAgLy8gICAgIHRhcmdldF9wbGF5ZXI6IEFjY291bnQsCiAgICAvLyAgICAgYW1vdW50OiBVSW50NjQsCiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6Mzg5CiAgICAvLyBzZWxmLl9hc3NlcnRfb2ZmaWNlcigpCiAgICBjYWxsc3ViIF9hc3NlcnRfb2ZmaWNlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzkwCiAgICAvLyBndWlsZF9pZCA9IHNlbGYucGxheWVyX2d1aWxkX2lkW1R4bi5zZW5kZXJdCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAicGxheWVyX2d1aWxkX2lkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGxheWVyX2d1aWxkX2lkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6MzkyCiAgICAvLyBhY3Rpb24gPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozOTMKICAgIC8vIGlmIGFjdGlvbl90eXBlID09IFN0cmluZygidHJlYXN1cnlfcGF5b3V0Iik6CiAgICBmcmFtZV9kaWcgLTMKICAgIHB1c2hieXRlcyAidHJlYXN1cnlfcGF5b3V0IgogICAgPT0KICAgIGJ6IHByb3Bvc2VfZ3VpbGRfYWN0aW9uX2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTozOTQKICAgIC8vIGFjdGlvbiA9IFVJbnQ2NChBQ1RJT05fVFJFQVNVUllfUEFZT1VUKQogICAgaW50Y18xIC8vIDEKICAgIGZyYW1lX2J1cnkgMQoKcHJvcG9zZV9ndWlsZF9hY3Rpb25fYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6Mzk5CiAgICAvLyBhc3NlcnQgYWN0aW9uICE9IDAsICJVbmtub3duIGFjdGlvbiB0eXBlIgogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgYXNzZXJ0IC8vIFVua25vd24gYWN0aW9uIHR5cGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQwMS00MDIKICAgIC8vICMgVGhlIHByb3Bvc2FsIGJveCBNQlIgaXMgcmVzZXJ2ZWQgZnJvbSB0aGUgZ3VpbGQgdHJlYXN1cnkgd2hpbGUgcGVuZGluZwogICAgLy8gdHJlYXN1cnlfYmFsYW5jZSA9IHNlbGYuZ3VpbGRfdHJlYXN1cnlbZ3VpbGRfaWRdCiAgICBmcmFtZV9kaWcgMAogICAgaXRvYgogICAgYnl0ZWMgNiAvLyAweDc0CiAgICBkaWcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmd1aWxkX3RyZWFzdXJ5IGVudHJ5IGV4aXN0cwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDAzCiAgICAvLyBhc3NlcnQgdHJlYXN1cnlfYmFsYW5jZSA+PSBQUk9QT1NBTF9CT1hfTUJSLCAiSW5zdWZmaWNpZW50IGd1aWxkIHRyZWFzdXJ5IgogICAgZHVwCiAgICBpbnRjIDQgLy8gNTE3MDAKICAgID49CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IGd1aWxkIHRyZWFzdXJ5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0MDQKICAgIC8vIHNlbGYuZ3VpbGRfdHJlYXN1cnlbZ3VpbGRfaWRdID0gdHJlYXN1cnlfYmFsYW5jZSAtIFBST1BPU0FMX0JPWF9NQlIKICAgIGludGMgNCAvLyA1MTcwMAogICAgLQogICAgaXRvYgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDA2CiAgICAvLyBwcm9wb3NhbF9pZCA9IHNlbGYudG90YWxfcHJvcG9zYWxzLnZhbHVlICsgMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE0IC8vICJ0b3RhbF9wcm9wb3NhbHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfcHJvcG9zYWxzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQwNwogICAgLy8gc2VsZi50b3RhbF9wcm9wb3NhbHMudmFsdWUgPSBwcm9wb3NhbF9pZAogICAgYnl0ZWMgMTQgLy8gInRvdGFsX3Byb3Bvc2FscyIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDEwCiAgICAvLyBhY3Rpb249YXJjNC5VSW50OChhY3Rpb24pLAogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCA4IC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0MTIKICAgIC8vIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0MTUKICAgIC8vIEFkZHJlc3MoVHhuLnNlbmRlciksIEFkZHJlc3MoR2xvYmFsLnplcm9fYWRkcmVzcykKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDE0LTQxNgogICAgLy8gYXBwcm92ZXJzPWFyYzQuU3RhdGljQXJyYXkoCiAgICAvLyAgICAgQWRkcmVzcyhUeG4uc2VuZGVyKSwgQWRkcmVzcyhHbG9iYWwuemVyb19hZGRyZXNzKQogICAgLy8gKSwKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDA4LTQxNwogICAgLy8gc2VsZi5ndWlsZF9wcm9wb3NhbHNbcHJvcG9zYWxfaWRdID0gR3VpbGRQcm9wb3NhbCgKICAgIC8vICAgICBndWlsZF9pZD1hcmM0LlVJbnQ2NChndWlsZF9pZCksCiAgICAvLyAgICAgYWN0aW9uPWFyYzQuVUludDgoYWN0aW9uKSwKICAgIC8vICAgICB0YXJnZXQ9QWRkcmVzcyh0YXJnZXRfcGxheWVyKSwKICAgIC8vICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIC8vICAgICBhcHByb3ZhbF9jb3VudD1hcmM0LlVJbnQ4KDEpLAogICAgLy8gICAgIGFwcHJvdmVycz1hcmM0LlN0YXRpY0FycmF5KAogICAgLy8gICAgICAgICBBZGRyZXNzKFR4bi5zZW5kZXIpLCBBZGRyZXNzKEdsb2JhbC56ZXJvX2FkZHJlc3MpCiAgICAvLyAgICAgKSwKICAgIC8vICkKICAgIGRpZyA0CiAgICBkaWcgMwogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDEzCiAgICAvLyBhcHByb3ZhbF9jb3VudD1hcmM0LlVJbnQ4KDEpLAogICAgcHVzaGJ5dGVzIDB4MDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQwOC00MTcKICAgIC8vIHNlbGYuZ3VpbGRfcHJvcG9zYWxzW3Byb3Bvc2FsX2lkXSA9IEd1aWxkUHJvcG9zYWwoCiAgICAvLyAgICAgZ3VpbGRfaWQ9YXJjNC5VSW50NjQoZ3VpbGRfaWQpLAogICAgLy8gICAgIGFjdGlvbj1hcmM0LlVJbnQ4KGFjdGlvbiksCiAgICAvLyAgICAgdGFyZ2V0PUFkZHJlc3ModGFyZ2V0X3BsYXllciksCiAgICAvLyAgICAgYW1vdW50PWFyYzQuVUludDY0KGFtb3VudCksCiAgICAvLyAgICAgYXBwcm92YWxfY291bnQ9YXJjNC5VSW50OCgxKSwKICAgIC8vICAgICBhcHByb3ZlcnM9YXJjNC5TdGF0aWNBcnJheSgKICAgIC8vICAgICAgICAgQWRkcmVzcyhUeG4uc2VuZGVyKSwgQWRkcmVzcyhHbG9iYWwuemVyb19hZGRyZXNzKQogICAgLy8gICAgICksCiAgICAvLyApCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDA4CiAgICAvLyBzZWxmLmd1aWxkX3Byb3Bvc2Fsc1twcm9wb3NhbF9pZF0gPSBHdWlsZFByb3Bvc2FsKAogICAgZGlnIDMKICAgIGl0b2IKICAgIGJ5dGVjIDExIC8vIDB4NzAKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQwOC00MTcKICAgIC8vIHNlbGYuZ3VpbGRfcHJvcG9zYWxzW3Byb3Bvc2FsX2lkXSA9IEd1aWxkUHJvcG9zYWwoCiAgICAvLyAgICAgZ3VpbGRfaWQ9YXJjNC5VSW50NjQoZ3VpbGRfaWQpLAogICAgLy8gICAgIGFjdGlvbj1hcmM0LlVJbnQ4KGFjdGlvbiksCiAgICAvLyAgICAgdGFyZ2V0PUFkZHJlc3ModGFyZ2V0X3BsYXllciksCiAgICAvLyAgICAgYW1vdW50PWFyYzQuVUludDY0KGFtb3VudCksCiAgICAvLyAgICAgYXBwcm92YWxfY291bnQ9YXJjNC5VSW50OCgxKSwKICAgIC8vICAgICBhcHByb3ZlcnM9YXJjNC5TdGF0aWNBcnJheSgKICAgIC8vICAgICAgICAgQWRkcmVzcyhUeG4uc2VuZGVyKSwgQWRkcmVzcyhHbG9iYWwuemVyb19hZGRyZXNzKQogICAgLy8gICAgICksCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQyMC00MjYKICAgIC8vIFByb3Bvc2FsQ3JlYXRlZCgKICAgIC8vICAgICBhcmM0LlVJbnQ2NChwcm9wb3NhbF9pZCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoZ3VpbGRfaWQpLAogICAgLy8gICAgIGFyYzQuVUludDgoYWN0aW9uKSwKICAgIC8vICAgICBBZGRyZXNzKHRhcmdldF9wbGF5ZXIpLAogICAgLy8gICAgIGFyYzQuVUludDY0KGFtb3VudCksCiAgICAvLyApCiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQxOS00MjcKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBQcm9wb3NhbENyZWF0ZWQoCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHByb3Bvc2FsX2lkKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoZ3VpbGRfaWQpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ4KGFjdGlvbiksCiAgICAvLyAgICAgICAgIEFkZHJlc3ModGFyZ2V0X3BsYXllciksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KGFtb3VudCksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4N2U3YjIwNjggLy8gbWV0aG9kICJQcm9wb3NhbENyZWF0ZWQodWludDY0LHVpbnQ2NCx1aW50OCxhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDI4CiAgICAvLyByZXR1cm4gcHJvcG9zYWxfaWQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpwcm9wb3NlX2d1aWxkX2FjdGlvbl9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjM5NQogICAgLy8gZWxpZiBhY3Rpb25fdHlwZSA9PSBTdHJpbmcoInByb21vdGVfbWVtYmVyIik6CiAgICBmcmFtZV9kaWcgLTMKICAgIHB1c2hieXRlcyAicHJvbW90ZV9tZW1iZXIiCiAgICA9PQogICAgYnogcHJvcG9zZV9ndWlsZF9hY3Rpb25fZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjM5NgogICAgLy8gYWN0aW9uID0gVUludDY0KEFDVElPTl9QUk9NT1RFX01FTUJFUikKICAgIHB1c2hpbnQgMiAvLyAyCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgcHJvcG9zZV9ndWlsZF9hY3Rpb25fYWZ0ZXJfaWZfZWxzZUA4Cgpwcm9wb3NlX2d1aWxkX2FjdGlvbl9lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjM5NwogICAgLy8gZWxpZiBhY3Rpb25fdHlwZSA9PSBTdHJpbmcoImd1aWxkX2l0ZW1fdHJhbnNmZXIiKToKICAgIGZyYW1lX2RpZyAtMwogICAgcHVzaGJ5dGVzICJndWlsZF9pdGVtX3RyYW5zZmVyIgogICAgPT0KICAgIGJ6IHByb3Bvc2VfZ3VpbGRfYWN0aW9uX2FmdGVyX2lmX2Vsc2VAOAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6Mzk4CiAgICAvLyBhY3Rpb24gPSBVSW50NjQoQUNUSU9OX0dVSUxEX0lURU1fVFJBTlNGRVIpCiAgICBwdXNoaW50IDMgLy8gMwogICAgZnJhbWVfYnVyeSAxCiAgICBiIHByb3Bvc2VfZ3VpbGRfYWN0aW9uX2FmdGVyX2lmX2Vsc2VAOAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uZ3VpbGRfc3lzdGVtLkFsZ29SZWFsbUd1aWxkU3lzdGVtLmFwcHJvdmVfZ3VpbGRfYWN0aW9uKHByb3Bvc2FsX2lkOiB1aW50NjQpIC0+IGJ5dGVzOgphcHByb3ZlX2d1aWxkX2FjdGlvbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQzMC00MzEKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGFwcHJvdmVfZ3VpbGRfYWN0aW9uKHNlbGYsIHByb3Bvc2FsX2lkOiBVSW50NjQpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgaW50Y18wIC8vIDAKICAgIGR1cAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQzMwogICAgLy8gc2VsZi5fYXNzZXJ0X29mZmljZXIoKQogICAgY2FsbHN1YiBfYXNzZXJ0X29mZmljZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQzNAogICAgLy8gYXNzZXJ0IHByb3Bvc2FsX2lkIGluIHNlbGYuZ3VpbGRfcHJvcG9zYWxzLCAiUHJvcG9zYWwgZG9lcyBub3QgZXhpc3QiCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGR1cAogICAgYnl0ZWMgMTEgLy8gMHg3MAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXBuIDIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFByb3Bvc2FsIGRvZXMgbm90IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0MzYKICAgIC8vIHByb3Bvc2FsID0gc2VsZi5ndWlsZF9wcm9wb3NhbHNbcHJvcG9zYWxfaWRdLmNvcHkoKQogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmd1aWxkX3Byb3Bvc2FscyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQzNwogICAgLy8gZ3VpbGRfaWQgPSBwcm9wb3NhbC5ndWlsZF9pZC5uYXRpdmUKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQzOQogICAgLy8gc2VsZi5wbGF5ZXJfZ3VpbGRfaWRbVHhuLnNlbmRlcl0gPT0gZ3VpbGRfaWQKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJwbGF5ZXJfZ3VpbGRfaWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wbGF5ZXJfZ3VpbGRfaWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDM4LTQ0MAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnBsYXllcl9ndWlsZF9pZFtUeG4uc2VuZGVyXSA9PSBndWlsZF9pZAogICAgLy8gKSwgIlByb3Bvc2FsIGJlbG9uZ3MgdG8gYW5vdGhlciBndWlsZCIKICAgIGFzc2VydCAvLyBQcm9wb3NhbCBiZWxvbmdzIHRvIGFub3RoZXIgZ3VpbGQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ0MgogICAgLy8gYXBwcm92YWxfY291bnQgPSBwcm9wb3NhbC5hcHByb3ZhbF9jb3VudC5uYXRpdmUKICAgIHB1c2hpbnQgNDkgLy8gNDkKICAgIGdldGJ5dGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ0MwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFwcHJvdmFsX2NvdW50KToKICAgIGludGNfMCAvLyAwCgphcHByb3ZlX2d1aWxkX2FjdGlvbl9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0NDMKICAgIC8vIGZvciBpIGluIHVyYW5nZShhcHByb3ZhbF9jb3VudCk6CiAgICBmcmFtZV9kaWcgOQogICAgZnJhbWVfZGlnIDgKICAgIDwKICAgIGJ6IGFwcHJvdmVfZ3VpbGRfYWN0aW9uX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0NDQKICAgIC8vIGFzc2VydCBwcm9wb3NhbC5hcHByb3ZlcnNbaV0gIT0gQWRkcmVzcyhUeG4uc2VuZGVyKSwgIkFscmVhZHkgYXBwcm92ZWQiCiAgICBmcmFtZV9kaWcgNgogICAgZXh0cmFjdCA1MCA2NCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyA5CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgICoKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgdHhuIFNlbmRlcgogICAgIT0KICAgIGFzc2VydCAvLyBBbHJlYWR5IGFwcHJvdmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0NDMKICAgIC8vIGZvciBpIGluIHVyYW5nZShhcHByb3ZhbF9jb3VudCk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA5CiAgICBiIGFwcHJvdmVfZ3VpbGRfYWN0aW9uX2Zvcl9oZWFkZXJAMQoKYXBwcm92ZV9ndWlsZF9hY3Rpb25fYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0NDYKICAgIC8vIHByb3Bvc2FsLmFwcHJvdmVyc1thcHByb3ZhbF9jb3VudF0gPSBBZGRyZXNzKFR4bi5zZW5kZXIpCiAgICBmcmFtZV9kaWcgNgogICAgZHVwCiAgICBleHRyYWN0IDUwIDY0IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIDgKICAgIGR1cAogICAgcHVzaGludCAyIC8vIDIKICAgIDwKICAgIGFzc2VydCAvLyBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBwdXNoaW50IDMyIC8vIDMyCiAgICAqCiAgICB1bmNvdmVyIDMKICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgcmVwbGFjZTMKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgcmVwbGFjZTIgNTAKICAgIGZyYW1lX2J1cnkgNgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDQ3CiAgICAvLyBhcHByb3ZhbF9jb3VudCArPSAxCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ0OQogICAgLy8gaWYgYXBwcm92YWxfY291bnQgPCBHVUlMRF9BUFBST1ZBTF9USFJFU0hPTEQ6CiAgICBwdXNoaW50IDIgLy8gMgogICAgPAogICAgYnogYXBwcm92ZV9ndWlsZF9hY3Rpb25fYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0NTAKICAgIC8vIHByb3Bvc2FsLmFwcHJvdmFsX2NvdW50ID0gYXJjNC5VSW50OChhcHByb3ZhbF9jb3VudCkKICAgIGZyYW1lX2RpZyA4CiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgcHVzaGludCA4IC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICBmcmFtZV9kaWcgNgogICAgZGlnIDEKICAgIHJlcGxhY2UyIDQ5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0NTEKICAgIC8vIHNlbGYuZ3VpbGRfcHJvcG9zYWxzW3Byb3Bvc2FsX2lkXSA9IHByb3Bvc2FsLmNvcHkoKQogICAgZnJhbWVfZGlnIDUKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ1My00NTcKICAgIC8vIFByb3Bvc2FsQXBwcm92ZWQoCiAgICAvLyAgICAgYXJjNC5VSW50NjQocHJvcG9zYWxfaWQpLAogICAgLy8gICAgIEFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgYXJjNC5VSW50OChhcHByb3ZhbF9jb3VudCksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDU1CiAgICAvLyBBZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDUzLTQ1NwogICAgLy8gUHJvcG9zYWxBcHByb3ZlZCgKICAgIC8vICAgICBhcmM0LlVJbnQ2NChwcm9wb3NhbF9pZCksCiAgICAvLyAgICAgQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhcmM0LlVJbnQ4KGFwcHJvdmFsX2NvdW50KSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0NTItNDU4CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgUHJvcG9zYWxBcHByb3ZlZCgKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQocHJvcG9zYWxfaWQpLAogICAgLy8gICAgICAgICBBZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ4KGFwcHJvdmFsX2NvdW50KSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhmZDI3YjkyMyAvLyBtZXRob2QgIlByb3Bvc2FsQXBwcm92ZWQodWludDY0LGFkZHJlc3MsdWludDgpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ1OQogICAgLy8gcmV0dXJuIFN0cmluZygiQXBwcm92YWwgcmVjb3JkZWQiKQogICAgcHVzaGJ5dGVzICJBcHByb3ZhbCByZWNvcmRlZCIKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgphcHByb3ZlX2d1aWxkX2FjdGlvbl9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0NjEtNDYyCiAgICAvLyAjIFRocmVzaG9sZCBtZXQ6IHJlbGVhc2UgdGhlIHByb3Bvc2FsIGJveCBhbmQgZXhlY3V0ZQogICAgLy8gZGVsIHNlbGYuZ3VpbGRfcHJvcG9zYWxzW3Byb3Bvc2FsX2lkXQogICAgZnJhbWVfZGlnIDUKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDYzCiAgICAvLyBzZWxmLmd1aWxkX3RyZWFzdXJ5W2d1aWxkX2lkXSArPSBQUk9QT1NBTF9CT1hfTUJSCiAgICBmcmFtZV9kaWcgNwogICAgaXRvYgogICAgYnl0ZWMgNiAvLyAweDc0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmd1aWxkX3RyZWFzdXJ5IGVudHJ5IGV4aXN0cwogICAgYnRvaQogICAgaW50YyA0IC8vIDUxNzAwCiAgICArCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0NjcKICAgIC8vIHByb3Bvc2FsLmd1aWxkX2lkLAogICAgZnJhbWVfZGlnIDYKICAgIGR1cAogICAgZXh0cmFjdCAwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0NjgKICAgIC8vIHByb3Bvc2FsLmFjdGlvbiwKICAgIGRpZyAxCiAgICBleHRyYWN0IDggMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ2OQogICAgLy8gcHJvcG9zYWwudGFyZ2V0LAogICAgZGlnIDIKICAgIGV4dHJhY3QgOSAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgY292ZXIgNAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0NzAKICAgIC8vIHByb3Bvc2FsLmFtb3VudCwKICAgIGRpZyAyCiAgICBleHRyYWN0IDQxIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0NjUtNDcxCiAgICAvLyBQcm9wb3NhbEV4ZWN1dGVkKAogICAgLy8gICAgIGFyYzQuVUludDY0KHByb3Bvc2FsX2lkKSwKICAgIC8vICAgICBwcm9wb3NhbC5ndWlsZF9pZCwKICAgIC8vICAgICBwcm9wb3NhbC5hY3Rpb24sCiAgICAvLyAgICAgcHJvcG9zYWwudGFyZ2V0LAogICAgLy8gICAgIHByb3Bvc2FsLmFtb3VudCwKICAgIC8vICkKICAgIGZyYW1lX2RpZyA0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ2NC00NzIKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBQcm9wb3NhbEV4ZWN1dGVkKAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChwcm9wb3NhbF9pZCksCiAgICAvLyAgICAgICAgIHByb3Bvc2FsLmd1aWxkX2lkLAogICAgLy8gICAgICAgICBwcm9wb3NhbC5hY3Rpb24sCiAgICAvLyAgICAgICAgIHByb3Bvc2FsLnRhcmdldCwKICAgIC8vICAgICAgICAgcHJvcG9zYWwuYW1vdW50LAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDc3Zjk3OWE4IC8vIG1ldGhvZCAiUHJvcG9zYWxFeGVjdXRlZCh1aW50NjQsdWludDY0LHVpbnQ4LGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0NzUKICAgIC8vIHByb3Bvc2FsLmFjdGlvbi5uYXRpdmUsCiAgICBkdXAKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBnZXRieXRlCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDc3CiAgICAvLyBwcm9wb3NhbC5hbW91bnQubmF0aXZlLAogICAgcHVzaGludCA0MSAvLyA0MQogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTE1CiAgICAvLyBpZiBhY3Rpb24gPT0gQUNUSU9OX1RSRUFTVVJZX1BBWU9VVDoKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYnogYXBwcm92ZV9ndWlsZF9hY3Rpb25fZWxzZV9ib2R5QDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1MTYtNTE3CiAgICAvLyAjIFBheSBmcm9tIGd1aWxkIHRyZWFzdXJ5CiAgICAvLyB0cmVhc3VyeV9iYWxhbmNlID0gc2VsZi5ndWlsZF90cmVhc3VyeVtndWlsZF9pZF0KICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmd1aWxkX3RyZWFzdXJ5IGVudHJ5IGV4aXN0cwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTE4CiAgICAvLyBhc3NlcnQgYW1vdW50IDw9IHRyZWFzdXJ5X2JhbGFuY2UsICJJbnN1ZmZpY2llbnQgZ3VpbGQgdHJlYXN1cnkiCiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkaWcgMQogICAgPD0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgZ3VpbGQgdHJlYXN1cnkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjUxOQogICAgLy8gc2VsZi5ndWlsZF90cmVhc3VyeVtndWlsZF9pZF0gPSB0cmVhc3VyeV9iYWxhbmNlIC0gYW1vdW50CiAgICBkaWcgMQogICAgLQogICAgaXRvYgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1MjEtNTI1CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9dGFyZ2V0X3BsYXllciwKICAgIC8vICAgICBhbW91bnQ9YW1vdW50LAogICAgLy8gICAgIGZlZT0wLCAgIyBDb3ZlcmVkIGJ5IHRoZSBvdXRlciB0cmFuc2FjdGlvbiBmZWUKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBmcmFtZV9kaWcgMQogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTIxCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1MjQKICAgIC8vIGZlZT0wLCAgIyBDb3ZlcmVkIGJ5IHRoZSBvdXRlciB0cmFuc2FjdGlvbiBmZWUKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTIxLTUyNQogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXRhcmdldF9wbGF5ZXIsCiAgICAvLyAgICAgYW1vdW50PWFtb3VudCwKICAgIC8vICAgICBmZWU9MCwgICMgQ292ZXJlZCBieSB0aGUgb3V0ZXIgdHJhbnNhY3Rpb24gZmVlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTI2CiAgICAvLyByZXR1cm4gU3RyaW5nKCJUcmVhc3VyeSBwYXlvdXQgYXBwcm92ZWQiKQogICAgcHVzaGJ5dGVzICJUcmVhc3VyeSBwYXlvdXQgYXBwcm92ZWQiCgphcHByb3ZlX2d1aWxkX2FjdGlvbl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uZ3VpbGRfc3lzdGVtLkFsZ29SZWFsbUd1aWxkU3lzdGVtLl9leGVjdXRlX2d1aWxkX2FjdGlvbkAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ3My00NzgKICAgIC8vIHJldHVybiBzZWxmLl9leGVjdXRlX2d1aWxkX2FjdGlvbigKICAgIC8vICAgICBndWlsZF9pZCwKICAgIC8vICAgICBwcm9wb3NhbC5hY3Rpb24ubmF0aXZlLAogICAgLy8gICAgIHByb3Bvc2FsLnRhcmdldC5uYXRpdmUsCiAgICAvLyAgICAgcHJvcG9zYWwuYW1vdW50Lm5hdGl2ZSwKICAgIC8vICkKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgphcHByb3ZlX2d1aWxkX2FjdGlvbl9lbHNlX2JvZHlAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1MjgKICAgIC8vIGVsaWYgYWN0aW9uID09IEFDVElPTl9QUk9NT1RFX01FTUJFUjoKICAgIGZyYW1lX2RpZyAyCiAgICBwdXNoaW50IDIgLy8gMgogICAgPT0KICAgIGJ6IGFwcHJvdmVfZ3VpbGRfYWN0aW9uX2FmdGVyX2lmX2Vsc2VAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjUzMQogICAgLy8gc2VsZi5wbGF5ZXJfZ3VpbGRfaWQuZ2V0KHRhcmdldF9wbGF5ZXIsIFVJbnQ2NCgwKSkgPT0gZ3VpbGRfaWQKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJwbGF5ZXJfZ3VpbGRfaWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBpbnRjXzAgLy8gMAogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICBmcmFtZV9kaWcgNwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjUyOS01MzIKICAgIC8vICMgUHJvbW90ZSBtZW1iZXIgdG8gb2ZmaWNlcgogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnBsYXllcl9ndWlsZF9pZC5nZXQodGFyZ2V0X3BsYXllciwgVUludDY0KDApKSA9PSBndWlsZF9pZAogICAgLy8gKSwgIlRhcmdldCBpcyBub3QgYSBtZW1iZXIgb2YgdGhpcyBndWlsZCIKICAgIGFzc2VydCAvLyBUYXJnZXQgaXMgbm90IGEgbWVtYmVyIG9mIHRoaXMgZ3VpbGQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjUzMwogICAgLy8gc2VsZi5wbGF5ZXJfcm9sZVt0YXJnZXRfcGxheWVyXSA9IFN0cmluZygib2ZmaWNlciIpCiAgICBieXRlY18zIC8vICJwbGF5ZXJfcm9sZSIKICAgIGJ5dGVjIDE3IC8vICJvZmZpY2VyIgogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTM0CiAgICAvLyByZXR1cm4gU3RyaW5nKCJNZW1iZXIgcHJvbW90ZWQgdG8gb2ZmaWNlciIpCiAgICBieXRlYyAxOSAvLyAiTWVtYmVyIHByb21vdGVkIHRvIG9mZmljZXIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0NzMtNDc4CiAgICAvLyByZXR1cm4gc2VsZi5fZXhlY3V0ZV9ndWlsZF9hY3Rpb24oCiAgICAvLyAgICAgZ3VpbGRfaWQsCiAgICAvLyAgICAgcHJvcG9zYWwuYWN0aW9uLm5hdGl2ZSwKICAgIC8vICAgICBwcm9wb3NhbC50YXJnZXQubmF0aXZlLAogICAgLy8gICAgIHByb3Bvc2FsLmFtb3VudC5uYXRpdmUsCiAgICAvLyApCiAgICBiIGFwcHJvdmVfZ3VpbGRfYWN0aW9uX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5ndWlsZF9zeXN0ZW0uQWxnb1JlYWxtR3VpbGRTeXN0ZW0uX2V4ZWN1dGVfZ3VpbGRfYWN0aW9uQDE0CgphcHByb3ZlX2d1aWxkX2FjdGlvbl9hZnRlcl9pZl9lbHNlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTM2LTUzNwogICAgLy8gIyBBQ1RJT05fR1VJTERfSVRFTV9UUkFOU0ZFUjogdHJhbnNmZXIgZ3VpbGQtb3duZWQgaXRlbXMKICAgIC8vIHJldHVybiBTdHJpbmcoIkd1aWxkIGl0ZW0gdHJhbnNmZXJyZWQiKQogICAgcHVzaGJ5dGVzICJHdWlsZCBpdGVtIHRyYW5zZmVycmVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDczLTQ3OAogICAgLy8gcmV0dXJuIHNlbGYuX2V4ZWN1dGVfZ3VpbGRfYWN0aW9uKAogICAgLy8gICAgIGd1aWxkX2lkLAogICAgLy8gICAgIHByb3Bvc2FsLmFjdGlvbi5uYXRpdmUsCiAgICAvLyAgICAgcHJvcG9zYWwudGFyZ2V0Lm5hdGl2ZSwKICAgIC8vICAgICBwcm9wb3NhbC5hbW91bnQubmF0aXZlLAogICAgLy8gKQogICAgYiBhcHByb3ZlX2d1aWxkX2FjdGlvbl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uZ3VpbGRfc3lzdGVtLkFsZ29SZWFsbUd1aWxkU3lzdGVtLl9leGVjdXRlX2d1aWxkX2FjdGlvbkAxNAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uZ3VpbGRfc3lzdGVtLkFsZ29SZWFsbUd1aWxkU3lzdGVtLmNhbmNlbF9ndWlsZF9hY3Rpb24ocHJvcG9zYWxfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmNhbmNlbF9ndWlsZF9hY3Rpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0ODAtNDgxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjYW5jZWxfZ3VpbGRfYWN0aW9uKHNlbGYsIHByb3Bvc2FsX2lkOiBVSW50NjQpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDgzCiAgICAvLyBhc3NlcnQgcHJvcG9zYWxfaWQgaW4gc2VsZi5ndWlsZF9wcm9wb3NhbHMsICJQcm9wb3NhbCBkb2VzIG5vdCBleGlzdCIKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZHVwCiAgICBieXRlYyAxMSAvLyAweDcwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cG4gMgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gUHJvcG9zYWwgZG9lcyBub3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ4NAogICAgLy8gZ3VpbGRfaWQgPSBzZWxmLmd1aWxkX3Byb3Bvc2Fsc1twcm9wb3NhbF9pZF0uZ3VpbGRfaWQubmF0aXZlCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ndWlsZF9wcm9wb3NhbHMgZW50cnkgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDg1CiAgICAvLyBhc3NlcnQgc2VsZi5wbGF5ZXJfZ3VpbGRfaWRbVHhuLnNlbmRlcl0gPT0gZ3VpbGRfaWQgYW5kIHNlbGYucGxheWVyX3JvbGVbCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAicGxheWVyX2d1aWxkX2lkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGxheWVyX2d1aWxkX2lkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ4NS00ODcKICAgIC8vIGFzc2VydCBzZWxmLnBsYXllcl9ndWlsZF9pZFtUeG4uc2VuZGVyXSA9PSBndWlsZF9pZCBhbmQgc2VsZi5wbGF5ZXJfcm9sZVsKICAgIC8vICAgICBUeG4uc2VuZGVyCiAgICAvLyBdID09IFN0cmluZygibGVhZGVyIiksICJPbmx5IHRoZSBndWlsZCBsZWFkZXIgY2FuIGNhbmNlbCBwcm9wb3NhbHMiCiAgICBieiBjYW5jZWxfZ3VpbGRfYWN0aW9uX2Jvb2xfZmFsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDg2CiAgICAvLyBUeG4uc2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0ODUtNDg3CiAgICAvLyBhc3NlcnQgc2VsZi5wbGF5ZXJfZ3VpbGRfaWRbVHhuLnNlbmRlcl0gPT0gZ3VpbGRfaWQgYW5kIHNlbGYucGxheWVyX3JvbGVbCiAgICAvLyAgICAgVHhuLnNlbmRlcgogICAgLy8gXSA9PSBTdHJpbmcoImxlYWRlciIpLCAiT25seSB0aGUgZ3VpbGQgbGVhZGVyIGNhbiBjYW5jZWwgcHJvcG9zYWxzIgogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ4NQogICAgLy8gYXNzZXJ0IHNlbGYucGxheWVyX2d1aWxkX2lkW1R4bi5zZW5kZXJdID09IGd1aWxkX2lkIGFuZCBzZWxmLnBsYXllcl9yb2xlWwogICAgYnl0ZWNfMyAvLyAicGxheWVyX3JvbGUiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0ODUtNDg3CiAgICAvLyBhc3NlcnQgc2VsZi5wbGF5ZXJfZ3VpbGRfaWRbVHhuLnNlbmRlcl0gPT0gZ3VpbGRfaWQgYW5kIHNlbGYucGxheWVyX3JvbGVbCiAgICAvLyAgICAgVHhuLnNlbmRlcgogICAgLy8gXSA9PSBTdHJpbmcoImxlYWRlciIpLCAiT25seSB0aGUgZ3VpbGQgbGVhZGVyIGNhbiBjYW5jZWwgcHJvcG9zYWxzIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGxheWVyX3JvbGUgZXhpc3RzIGZvciBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0ODcKICAgIC8vIF0gPT0gU3RyaW5nKCJsZWFkZXIiKSwgIk9ubHkgdGhlIGd1aWxkIGxlYWRlciBjYW4gY2FuY2VsIHByb3Bvc2FscyIKICAgIGJ5dGVjIDcgLy8gImxlYWRlciIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ4NS00ODcKICAgIC8vIGFzc2VydCBzZWxmLnBsYXllcl9ndWlsZF9pZFtUeG4uc2VuZGVyXSA9PSBndWlsZF9pZCBhbmQgc2VsZi5wbGF5ZXJfcm9sZVsKICAgIC8vICAgICBUeG4uc2VuZGVyCiAgICAvLyBdID09IFN0cmluZygibGVhZGVyIiksICJPbmx5IHRoZSBndWlsZCBsZWFkZXIgY2FuIGNhbmNlbCBwcm9wb3NhbHMiCiAgICA9PQogICAgYnogY2FuY2VsX2d1aWxkX2FjdGlvbl9ib29sX2ZhbHNlQDMKICAgIGludGNfMSAvLyAxCgpjYW5jZWxfZ3VpbGRfYWN0aW9uX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ4NS00ODcKICAgIC8vIGFzc2VydCBzZWxmLnBsYXllcl9ndWlsZF9pZFtUeG4uc2VuZGVyXSA9PSBndWlsZF9pZCBhbmQgc2VsZi5wbGF5ZXJfcm9sZVsKICAgIC8vICAgICBUeG4uc2VuZGVyCiAgICAvLyBdID09IFN0cmluZygibGVhZGVyIiksICJPbmx5IHRoZSBndWlsZCBsZWFkZXIgY2FuIGNhbmNlbCBwcm9wb3NhbHMiCiAgICBhc3NlcnQgLy8gT25seSB0aGUgZ3VpbGQgbGVhZGVyIGNhbiBjYW5jZWwgcHJvcG9zYWxzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0ODkKICAgIC8vIGRlbCBzZWxmLmd1aWxkX3Byb3Bvc2Fsc1twcm9wb3NhbF9pZF0KICAgIGZyYW1lX2RpZyAxCiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjQ5MAogICAgLy8gc2VsZi5ndWlsZF90cmVhc3VyeVtndWlsZF9pZF0gKz0gUFJPUE9TQUxfQk9YX01CUgogICAgZnJhbWVfZGlnIDIKICAgIGl0b2IKICAgIGJ5dGVjIDYgLy8gMHg3NAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ndWlsZF90cmVhc3VyeSBlbnRyeSBleGlzdHMKICAgIGJ0b2kKICAgIGludGMgNCAvLyA1MTcwMAogICAgKwogICAgaXRvYgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NDkyCiAgICAvLyBhcmM0LmVtaXQoUHJvcG9zYWxDYW5jZWxsZWQoYXJjNC5VSW50NjQocHJvcG9zYWxfaWQpLCBhcmM0LlVJbnQ2NChndWlsZF9pZCkpKQogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4ZWQ4ZjkzZmYgLy8gbWV0aG9kICJQcm9wb3NhbENhbmNlbGxlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo0OTMKICAgIC8vIHJldHVybiBTdHJpbmcoIlByb3Bvc2FsIGNhbmNlbGxlZCIpCiAgICBwdXNoYnl0ZXMgIlByb3Bvc2FsIGNhbmNlbGxlZCIKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpjYW5jZWxfZ3VpbGRfYWN0aW9uX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICBiIGNhbmNlbF9ndWlsZF9hY3Rpb25fYm9vbF9tZXJnZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5ndWlsZF9zeXN0ZW0uQWxnb1JlYWxtR3VpbGRTeXN0ZW0uX2Fzc2VydF9vZmZpY2VyKCkgLT4gdm9pZDoKX2Fzc2VydF9vZmZpY2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTAzLTUwNAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfYXNzZXJ0X29mZmljZXIoc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTA1CiAgICAvLyBhc3NlcnQgc2VsZi5pc19ndWlsZF9tZW1iZXJbVHhuLnNlbmRlcl0sICJNdXN0IGJlIGd1aWxkIG1lbWJlciIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJpc19ndWlsZF9tZW1iZXIiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19ndWlsZF9tZW1iZXIgZXhpc3RzIGZvciBhY2NvdW50CiAgICBieXRlYyA0IC8vIDB4MDAKICAgICE9CiAgICBhc3NlcnQgLy8gTXVzdCBiZSBndWlsZCBtZW1iZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjUwNgogICAgLy8gY3VycmVudF9yb2xlID0gc2VsZi5wbGF5ZXJfcm9sZVtUeG4uc2VuZGVyXQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInBsYXllcl9yb2xlIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBsYXllcl9yb2xlIGV4aXN0cyBmb3IgYWNjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTA3CiAgICAvLyBhc3NlcnQgY3VycmVudF9yb2xlID09IFN0cmluZygibGVhZGVyIikgb3IgY3VycmVudF9yb2xlID09IFN0cmluZygKICAgIGJ5dGVjIDcgLy8gImxlYWRlciIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1MDctNTA5CiAgICAvLyBhc3NlcnQgY3VycmVudF9yb2xlID09IFN0cmluZygibGVhZGVyIikgb3IgY3VycmVudF9yb2xlID09IFN0cmluZygKICAgIC8vICAgICAib2ZmaWNlciIKICAgIC8vICksICJJbnN1ZmZpY2llbnQgcGVybWlzc2lvbnMiCiAgICBibnogX2Fzc2VydF9vZmZpY2VyX2Jvb2xfdHJ1ZUAyCiAgICBmcmFtZV9kaWcgMAogICAgYnl0ZWMgMTcgLy8gIm9mZmljZXIiCiAgICA9PQogICAgYnogX2Fzc2VydF9vZmZpY2VyX2Jvb2xfZmFsc2VAMwoKX2Fzc2VydF9vZmZpY2VyX2Jvb2xfdHJ1ZUAyOgogICAgaW50Y18xIC8vIDEKCl9hc3NlcnRfb2ZmaWNlcl9ib29sX21lcmdlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1MDctNTA5CiAgICAvLyBhc3NlcnQgY3VycmVudF9yb2xlID09IFN0cmluZygibGVhZGVyIikgb3IgY3VycmVudF9yb2xlID09IFN0cmluZygKICAgIC8vICAgICAib2ZmaWNlciIKICAgIC8vICksICJJbnN1ZmZpY2llbnQgcGVybWlzc2lvbnMiCiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IHBlcm1pc3Npb25zCiAgICByZXRzdWIKCl9hc3NlcnRfb2ZmaWNlcl9ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzAgLy8gMAogICAgYiBfYXNzZXJ0X29mZmljZXJfYm9vbF9tZXJnZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5ndWlsZF9zeXN0ZW0uQWxnb1JlYWxtR3VpbGRTeXN0ZW0uZ2V0X2d1aWxkX3Byb3Bvc2FsKHByb3Bvc2FsX2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpnZXRfZ3VpbGRfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1MzktNTQwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2d1aWxkX3Byb3Bvc2FsKHNlbGYsIHByb3Bvc2FsX2lkOiBVSW50NjQpIC0+IEd1aWxkUHJvcG9zYWw6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU0MgogICAgLy8gYXNzZXJ0IHByb3Bvc2FsX2lkIGluIHNlbGYuZ3VpbGRfcHJvcG9zYWxzLCAiUHJvcG9zYWwgZG9lcyBub3QgZXhpc3QiCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjIDExIC8vIDB4NzAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBQcm9wb3NhbCBkb2VzIG5vdCBleGlzdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTQzCiAgICAvLyByZXR1cm4gc2VsZi5ndWlsZF9wcm9wb3NhbHNbcHJvcG9zYWxfaWRdCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ndWlsZF9wcm9wb3NhbHMgZW50cnkgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmd1aWxkX3N5c3RlbS5BbGdvUmVhbG1HdWlsZFN5c3RlbS5zZXRfcmV3YXJkX2Fzc2V0KHJld2FyZF9hc3NldDogdWludDY0LCBtYnJfcGF5bWVudDogdWludDY0KSAtPiB2b2lkOgpzZXRfcmV3YXJkX2Fzc2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTQ1LTU0OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgc2V0X3Jld2FyZF9hc3NldCgKICAgIC8vICAgICBzZWxmLCByZXdhcmRfYXNzZXQ6IEFzc2V0LCBtYnJfcGF5bWVudDogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24KICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgcHVzaGJ5dGVzICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1NTQKICAgIC8vIGFzc2VydCBzZWxmLmlzX2d1aWxkX21lbWJlcltUeG4uc2VuZGVyXSwgIk11c3QgYmUgZ3VpbGQgbWVtYmVyIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImlzX2d1aWxkX21lbWJlciIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmlzX2d1aWxkX21lbWJlciBleGlzdHMgZm9yIGFjY291bnQKICAgIGJ5dGVjIDQgLy8gMHgwMAogICAgIT0KICAgIGFzc2VydCAvLyBNdXN0IGJlIGd1aWxkIG1lbWJlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTU1CiAgICAvLyBhc3NlcnQgc2VsZi5wbGF5ZXJfcm9sZVtUeG4uc2VuZGVyXSA9PSBTdHJpbmcoCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAicGxheWVyX3JvbGUiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wbGF5ZXJfcm9sZSBleGlzdHMgZm9yIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU1NS01NTcKICAgIC8vIGFzc2VydCBzZWxmLnBsYXllcl9yb2xlW1R4bi5zZW5kZXJdID09IFN0cmluZygKICAgIC8vICAgICAibGVhZGVyIgogICAgLy8gKSwgIk9ubHkgZ3VpbGQgbGVhZGVyIGNhbiBzZXQgdGhlIHJld2FyZCBhc3NldCIKICAgIGJ5dGVjIDcgLy8gImxlYWRlciIKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBndWlsZCBsZWFkZXIgY2FuIHNldCB0aGUgcmV3YXJkIGFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1NTkKICAgIC8vIG1icl9wYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTU4LTU2MAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBtYnJfcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAiTUJSIHBheW1lbnQgbXVzdCBnbyB0byB0aGUgZ3VpbGQgY29udHJhY3QiCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgbXVzdCBnbyB0byB0aGUgZ3VpbGQgY29udHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU2MgogICAgLy8gbWJyX3BheW1lbnQuc2VuZGVyID09IFR4bi5zZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTYxLTU2MwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBtYnJfcGF5bWVudC5zZW5kZXIgPT0gVHhuLnNlbmRlcgogICAgLy8gKSwgIk1CUiBwYXltZW50IG11c3QgY29tZSBmcm9tIHRoZSBndWlsZCBsZWFkZXIiCiAgICBhc3NlcnQgLy8gTUJSIHBheW1lbnQgbXVzdCBjb21lIGZyb20gdGhlIGd1aWxkIGxlYWRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTY1CiAgICAvLyBndWlsZF9pZCA9IHNlbGYucGxheWVyX2d1aWxkX2lkW1R4bi5zZW5kZXJdCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAicGxheWVyX2d1aWxkX2lkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGxheWVyX2d1aWxkX2lkIGV4aXN0cyBmb3IgYWNjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTY2CiAgICAvLyByZXF1aXJlZF9tYnIgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1NjcKICAgIC8vIGlmIGd1aWxkX2lkIGluIHNlbGYucmV3YXJkX2xlZGdlcjoKICAgIGl0b2IKICAgIGJ5dGVjIDEyIC8vIDB4NzcKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IHNldF9yZXdhcmRfYXNzZXRfZWxzZV9ib2R5QDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU2OQogICAgLy8gc2VsZi5yZXdhcmRfbGVkZ2VyW2d1aWxkX2lkXS5iYWxhbmNlLm5hdGl2ZSA9PSAwCiAgICBmcmFtZV9kaWcgMgogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmV3YXJkX2xlZGdlciBlbnRyeSBleGlzdHMKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgIQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTY4LTU3MAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnJld2FyZF9sZWRnZXJbZ3VpbGRfaWRdLmJhbGFuY2UubmF0aXZlID09IDAKICAgIC8vICksICJSZXdhcmQgbGVkZ2VyIHN0aWxsIGhvbGRzIHJld2FyZHMiCiAgICBhc3NlcnQgLy8gUmV3YXJkIGxlZGdlciBzdGlsbCBob2xkcyByZXdhcmRzCgpzZXRfcmV3YXJkX2Fzc2V0X2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU3NAogICAgLy8gaWYgbm90IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuaXNfb3B0ZWRfaW4ocmV3YXJkX2Fzc2V0KToKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBmcmFtZV9kaWcgLTIKICAgIGFzc2V0X2hvbGRpbmdfZ2V0IEFzc2V0QmFsYW5jZQogICAgYnVyeSAxCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfYnVyeSAwCiAgICBibnogc2V0X3Jld2FyZF9hc3NldF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU3NQogICAgLy8gcmVxdWlyZWRfbWJyICs9IEdsb2JhbC5hc3NldF9vcHRfaW5fbWluX2JhbGFuY2UKICAgIGZyYW1lX2RpZyAxCiAgICBnbG9iYWwgQXNzZXRPcHRJbk1pbkJhbGFuY2UKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU3Ni01ODEKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXJld2FyZF9hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0wLAogICAgLy8gICAgIGZlZT0wLCAgIyBDb3ZlcmVkIGJ5IHRoZSBvdXRlciB0cmFuc2FjdGlvbiBmZWUKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU3OAogICAgLy8gYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1NzkKICAgIC8vIGFzc2V0X2Ftb3VudD0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTc2CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU4MAogICAgLy8gZmVlPTAsICAjIENvdmVyZWQgYnkgdGhlIG91dGVyIHRyYW5zYWN0aW9uIGZlZQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1NzYtNTgxCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1yZXdhcmRfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9hbW91bnQ9MCwKICAgIC8vICAgICBmZWU9MCwgICMgQ292ZXJlZCBieSB0aGUgb3V0ZXIgdHJhbnNhY3Rpb24gZmVlCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgZnJhbWVfYnVyeSAwCgpzZXRfcmV3YXJkX2Fzc2V0X2FmdGVyX2lmX2Vsc2VANjoKICAgIGZyYW1lX2RpZyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1ODIKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5hbW91bnQgPj0gcmVxdWlyZWRfbWJyLCAiSW5zdWZmaWNpZW50IE1CUiBwYXltZW50IgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBbW91bnQKICAgIDw9CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IE1CUiBwYXltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1ODUKICAgIC8vIHJld2FyZF9hc3NldD1hcmM0LlVJbnQ2NChyZXdhcmRfYXNzZXQuaWQpLCBiYWxhbmNlPWFyYzQuVUludDY0KDApCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU4NC01ODYKICAgIC8vIHNlbGYucmV3YXJkX2xlZGdlcltndWlsZF9pZF0gPSBSZXdhcmRMZWRnZXIoCiAgICAvLyAgICAgcmV3YXJkX2Fzc2V0PWFyYzQuVUludDY0KHJld2FyZF9hc3NldC5pZCksIGJhbGFuY2U9YXJjNC5VSW50NjQoMCkKICAgIC8vICkKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKc2V0X3Jld2FyZF9hc3NldF9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU3MgogICAgLy8gcmVxdWlyZWRfbWJyICs9IFJFV0FSRF9MRURHRVJfQk9YX01CUgogICAgcHVzaGludCAxMjUwMCAvLyAxMjUwMAogICAgZnJhbWVfYnVyeSAxCiAgICBiIHNldF9yZXdhcmRfYXNzZXRfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5ndWlsZF9zeXN0ZW0uQWxnb1JlYWxtR3VpbGRTeXN0ZW0uZGVwb3NpdF9ndWlsZF9yZXdhcmRzKGRlcG9zaXQ6IHVpbnQ2NCkgLT4gdWludDY0OgpkZXBvc2l0X2d1aWxkX3Jld2FyZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo1ODgtNTg5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBkZXBvc2l0X2d1aWxkX3Jld2FyZHMoc2VsZiwgZGVwb3NpdDogZ3R4bi5Bc3NldFRyYW5zZmVyVHJhbnNhY3Rpb24pIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTkxCiAgICAvLyBhc3NlcnQgc2VsZi5pc19ndWlsZF9tZW1iZXJbVHhuLnNlbmRlcl0sICJNdXN0IGJlIGd1aWxkIG1lbWJlciIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJpc19ndWlsZF9tZW1iZXIiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19ndWlsZF9tZW1iZXIgZXhpc3RzIGZvciBhY2NvdW50CiAgICBieXRlYyA0IC8vIDB4MDAKICAgICE9CiAgICBhc3NlcnQgLy8gTXVzdCBiZSBndWlsZCBtZW1iZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU5MgogICAgLy8gZ3VpbGRfaWQgPSBzZWxmLnBsYXllcl9ndWlsZF9pZFtUeG4uc2VuZGVyXQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInBsYXllcl9ndWlsZF9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBsYXllcl9ndWlsZF9pZCBleGlzdHMgZm9yIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU5MwogICAgLy8gYXNzZXJ0IGd1aWxkX2lkIGluIHNlbGYucmV3YXJkX2xlZGdlciwgIkd1aWxkIGhhcyBubyByZXdhcmQgYXNzZXQiCiAgICBpdG9iCiAgICBieXRlYyAxMiAvLyAweDc3CiAgICBkaWcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIEd1aWxkIGhhcyBubyByZXdhcmQgYXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU5NAogICAgLy8gbGVkZ2VyID0gc2VsZi5yZXdhcmRfbGVkZ2VyW2d1aWxkX2lkXS5jb3B5KCkKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmV3YXJkX2xlZGdlciBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU5NgogICAgLy8gZGVwb3NpdC5hc3NldF9yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFzc2V0UmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NTk1LTU5NwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBkZXBvc2l0LmFzc2V0X3JlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksICJEZXBvc2l0IG11c3QgZ28gdG8gdGhlIGd1aWxkIGNvbnRyYWN0IgogICAgYXNzZXJ0IC8vIERlcG9zaXQgbXVzdCBnbyB0byB0aGUgZ3VpbGQgY29udHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU5OAogICAgLy8gYXNzZXJ0IGRlcG9zaXQuc2VuZGVyID09IFR4bi5zZW5kZXIsICJEZXBvc2l0IG11c3QgY29tZSBmcm9tIHRoZSBkZXBvc2l0b3IiCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBEZXBvc2l0IG11c3QgY29tZSBmcm9tIHRoZSBkZXBvc2l0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjYwMAogICAgLy8gZGVwb3NpdC54ZmVyX2Fzc2V0LmlkID09IGxlZGdlci5yZXdhcmRfYXNzZXQubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFhmZXJBc3NldAogICAgZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjU5OS02MDEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZGVwb3NpdC54ZmVyX2Fzc2V0LmlkID09IGxlZGdlci5yZXdhcmRfYXNzZXQubmF0aXZlCiAgICAvLyApLCAiRGVwb3NpdCBpcyBub3QgdGhlIGd1aWxkIHJld2FyZCBhc3NldCIKICAgIGFzc2VydCAvLyBEZXBvc2l0IGlzIG5vdCB0aGUgZ3VpbGQgcmV3YXJkIGFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2MDMKICAgIC8vIG5ld19iYWxhbmNlID0gbGVkZ2VyLmJhbGFuY2UubmF0aXZlICsgZGVwb3NpdC5hc3NldF9hbW91bnQKICAgIGR1cAogICAgcHVzaGludCA4IC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFzc2V0QW1vdW50CiAgICBzd2FwCiAgICBkaWcgMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NjA0CiAgICAvLyBzZWxmLnJld2FyZF9sZWRnZXJbZ3VpbGRfaWRdLmJhbGFuY2UgPSBhcmM0LlVJbnQ2NChuZXdfYmFsYW5jZSkKICAgIGR1cAogICAgaXRvYgogICAgdW5jb3ZlciAzCiAgICBkaWcgMQogICAgcmVwbGFjZTIgOAogICAgdW5jb3ZlciA0CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2MDkKICAgIC8vIEFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2MTAKICAgIC8vIGFyYzQuVUludDY0KGRlcG9zaXQuYXNzZXRfYW1vdW50KSwKICAgIHVuY292ZXIgMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NjA3LTYxMgogICAgLy8gUmV3YXJkc0RlcG9zaXRlZCgKICAgIC8vICAgICBhcmM0LlVJbnQ2NChndWlsZF9pZCksCiAgICAvLyAgICAgQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChkZXBvc2l0LmFzc2V0X2Ftb3VudCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQobmV3X2JhbGFuY2UpLAogICAgLy8gKQogICAgdW5jb3ZlciA0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjYwNi02MTMKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBSZXdhcmRzRGVwb3NpdGVkKAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChndWlsZF9pZCksCiAgICAvLyAgICAgICAgIEFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KGRlcG9zaXQuYXNzZXRfYW1vdW50KSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQobmV3X2JhbGFuY2UpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGU5NzdmM2QxIC8vIG1ldGhvZCAiUmV3YXJkc0RlcG9zaXRlZCh1aW50NjQsYWRkcmVzcyx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2MTQKICAgIC8vIHJldHVybiBuZXdfYmFsYW5jZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5ndWlsZF9zeXN0ZW0uQWxnb1JlYWxtR3VpbGRTeXN0ZW0uZGlzdHJpYnV0ZV9ndWlsZF9yZXdhcmRzKHJld2FyZF9hc2FfaWQ6IHVpbnQ2NCwgbWVtYmVyczogYnl0ZXMsIGFtb3VudHM6IGJ5dGVzKSAtPiBieXRlczoKZGlzdHJpYnV0ZV9ndWlsZF9yZXdhcmRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NjE2LTYyMgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgZGlzdHJpYnV0ZV9ndWlsZF9yZXdhcmRzKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcmV3YXJkX2FzYV9pZDogVUludDY0LAogICAgLy8gICAgIG1lbWJlcnM6IER5bmFtaWNBcnJheVtBZGRyZXNzXSwKICAgIC8vICAgICBhbW91bnRzOiBEeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdLAogICAgLy8gKSAtPiBTdHJpbmc6CiAgICBwcm90byAzIDEKICAgIGludGNfMCAvLyAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjYzMAogICAgLy8gYXNzZXJ0IHNlbGYuaXNfZ3VpbGRfbWVtYmVyW1R4bi5zZW5kZXJdLCAiTXVzdCBiZSBndWlsZCBtZW1iZXIiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiaXNfZ3VpbGRfbWVtYmVyIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuaXNfZ3VpbGRfbWVtYmVyIGV4aXN0cyBmb3IgYWNjb3VudAogICAgYnl0ZWMgNCAvLyAweDAwCiAgICAhPQogICAgYXNzZXJ0IC8vIE11c3QgYmUgZ3VpbGQgbWVtYmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2MzEKICAgIC8vIGFzc2VydCBzZWxmLnBsYXllcl9yb2xlW1R4bi5zZW5kZXJdID09IFN0cmluZygKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJwbGF5ZXJfcm9sZSIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBsYXllcl9yb2xlIGV4aXN0cyBmb3IgYWNjb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NjMxLTYzMwogICAgLy8gYXNzZXJ0IHNlbGYucGxheWVyX3JvbGVbVHhuLnNlbmRlcl0gPT0gU3RyaW5nKAogICAgLy8gICAgICJsZWFkZXIiCiAgICAvLyApLCAiT25seSBndWlsZCBsZWFkZXIgY2FuIGRpc3RyaWJ1dGUgcmV3YXJkcyIKICAgIGJ5dGVjIDcgLy8gImxlYWRlciIKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBndWlsZCBsZWFkZXIgY2FuIGRpc3RyaWJ1dGUgcmV3YXJkcwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NjM0CiAgICAvLyBhc3NlcnQgbWVtYmVycy5sZW5ndGggPT0gYW1vdW50cy5sZW5ndGgsICJNZW1iZXJzIGFuZCBhbW91bnRzIGFycmF5cyBtdXN0IG1hdGNoIgogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIE1lbWJlcnMgYW5kIGFtb3VudHMgYXJyYXlzIG11c3QgbWF0Y2gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjYzNQogICAgLy8gYXNzZXJ0IG1lbWJlcnMubGVuZ3RoID4gMCwgIk5vdGhpbmcgdG8gZGlzdHJpYnV0ZSIKICAgIGFzc2VydCAvLyBOb3RoaW5nIHRvIGRpc3RyaWJ1dGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjYzNwogICAgLy8gZ3VpbGRfaWQgPSBzZWxmLnBsYXllcl9ndWlsZF9pZFtUeG4uc2VuZGVyXQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInBsYXllcl9ndWlsZF9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wbGF5ZXJfZ3VpbGRfaWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2MzgKICAgIC8vIGFzc2VydCBndWlsZF9pZCBpbiBzZWxmLnJld2FyZF9sZWRnZXIsICJHdWlsZCBoYXMgbm8gcmV3YXJkIGFzc2V0IgogICAgaXRvYgogICAgZHVwCiAgICBieXRlYyAxMiAvLyAweDc3CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cG4gMgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gR3VpbGQgaGFzIG5vIHJld2FyZCBhc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NjQwCiAgICAvLyByZXdhcmRfYXNhX2lkID09IHNlbGYucmV3YXJkX2xlZGdlcltndWlsZF9pZF0ucmV3YXJkX2Fzc2V0Lm5hdGl2ZQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucmV3YXJkX2xlZGdlciBlbnRyeSBleGlzdHMKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTMKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2MzktNjQxCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHJld2FyZF9hc2FfaWQgPT0gc2VsZi5yZXdhcmRfbGVkZ2VyW2d1aWxkX2lkXS5yZXdhcmRfYXNzZXQubmF0aXZlCiAgICAvLyApLCAiTm90IHRoZSBndWlsZCByZXdhcmQgYXNzZXQiCiAgICBhc3NlcnQgLy8gTm90IHRoZSBndWlsZCByZXdhcmQgYXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjY0MwogICAgLy8gYmFsYW5jZSA9IHNlbGYucmV3YXJkX2xlZGdlcltndWlsZF9pZF0uYmFsYW5jZS5uYXRpdmUKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NjQ1CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UobWVtYmVycy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKCmRpc3RyaWJ1dGVfZ3VpbGRfcmV3YXJkc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2NDUKICAgIC8vIGZvciBpIGluIHVyYW5nZShtZW1iZXJzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgNwogICAgZnJhbWVfZGlnIDIKICAgIDwKICAgIGJ6IGRpc3RyaWJ1dGVfZ3VpbGRfcmV3YXJkc19hZnRlcl9mb3JAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjY0NgogICAgLy8gbWVtYmVyID0gbWVtYmVyc1tpXS5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyA3CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgICoKICAgIHB1c2hpbnQgMzIgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjY0NwogICAgLy8gYW1vdW50ID0gYW1vdW50c1tpXS5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBwdXNoaW50IDggLy8gOAogICAgKgogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2NDkKICAgIC8vIHNlbGYucGxheWVyX2d1aWxkX2lkLmdldChtZW1iZXIsIFVJbnQ2NCgwKSkgPT0gZ3VpbGRfaWQKICAgIHVuY292ZXIgMgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInBsYXllcl9ndWlsZF9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIGZyYW1lX2RpZyAzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NjQ4LTY1MAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnBsYXllcl9ndWlsZF9pZC5nZXQobWVtYmVyLCBVSW50NjQoMCkpID09IGd1aWxkX2lkCiAgICAvLyApLCAiUmVjaXBpZW50IGlzIG5vdCBhIG1lbWJlciBvZiB0aGlzIGd1aWxkIgogICAgYXNzZXJ0IC8vIFJlY2lwaWVudCBpcyBub3QgYSBtZW1iZXIgb2YgdGhpcyBndWlsZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NjUxCiAgICAvLyBhc3NlcnQgYW1vdW50IDw9IGJhbGFuY2UsICJJbnN1ZmZpY2llbnQgZ3VpbGQgcmV3YXJkIGJhbGFuY2UiCiAgICBkaWcgMQogICAgZnJhbWVfZGlnIDYKICAgIGR1cAogICAgY292ZXIgMgogICAgPD0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgZ3VpbGQgcmV3YXJkIGJhbGFuY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjY1MgogICAgLy8gYmFsYW5jZSAtPSBhbW91bnQKICAgIHVuY292ZXIgMgogICAgLQogICAgZnJhbWVfYnVyeSA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2NTQtNjU1CiAgICAvLyAjIE9wZW4gYSBuZXcgaW5uZXIgZ3JvdXAgZXZlcnkgTUFYX0lOTkVSX0dST1VQX1NJWkUgdHJhbnNmZXJzCiAgICAvLyBpZiBpICUgTUFYX0lOTkVSX0dST1VQX1NJWkUgPT0gMDoKICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgICUKICAgIGJueiBkaXN0cmlidXRlX2d1aWxkX3Jld2FyZHNfZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjY1NgogICAgLy8gb3AuSVR4bkNyZWF0ZS5iZWdpbigpCiAgICBpdHhuX2JlZ2luCgpkaXN0cmlidXRlX2d1aWxkX3Jld2FyZHNfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NjU5CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF90eXBlX2VudW0oVHJhbnNhY3Rpb25UeXBlLkFzc2V0VHJhbnNmZXIpCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjY2MAogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfeGZlcl9hc3NldChyZXdhcmRfYXNzZXQpCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2NjEKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2Fzc2V0X3JlY2VpdmVyKG1lbWJlcikKICAgIGZyYW1lX2RpZyAwCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjY2MgogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfYXNzZXRfYW1vdW50KGFtb3VudCkKICAgIGZyYW1lX2RpZyAxCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2NjMKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2ZlZSgwKSAgIyBDb3ZlcmVkIGJ5IHRoZSBvdXRlciB0cmFuc2FjdGlvbiBmZWUKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NjY1CiAgICAvLyBpZiAoaSArIDEpICUgTUFYX0lOTkVSX0dST1VQX1NJWkUgPT0gMCBvciBpICsgMSA9PSBtZW1iZXJzLmxlbmd0aDoKICAgIGZyYW1lX2RpZyA3CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDcKICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgICUKICAgIGJ6IGRpc3RyaWJ1dGVfZ3VpbGRfcmV3YXJkc19pZl9ib2R5QDcKICAgIGZyYW1lX2RpZyA3CiAgICBmcmFtZV9kaWcgMgogICAgPT0KICAgIGJ6IGRpc3RyaWJ1dGVfZ3VpbGRfcmV3YXJkc19mb3JfaGVhZGVyQDEKCmRpc3RyaWJ1dGVfZ3VpbGRfcmV3YXJkc19pZl9ib2R5QDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2NjYKICAgIC8vIG9wLklUeG5DcmVhdGUuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICBiIGRpc3RyaWJ1dGVfZ3VpbGRfcmV3YXJkc19mb3JfaGVhZGVyQDEKCmRpc3RyaWJ1dGVfZ3VpbGRfcmV3YXJkc19lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjY1OAogICAgLy8gb3AuSVR4bkNyZWF0ZS5uZXh0KCkKICAgIGl0eG5fbmV4dAogICAgYiBkaXN0cmlidXRlX2d1aWxkX3Jld2FyZHNfYWZ0ZXJfaWZfZWxzZUA1CgpkaXN0cmlidXRlX2d1aWxkX3Jld2FyZHNfYWZ0ZXJfZm9yQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NjY4CiAgICAvLyBzZWxmLnJld2FyZF9sZWRnZXJbZ3VpbGRfaWRdLmJhbGFuY2UgPSBhcmM0LlVJbnQ2NChiYWxhbmNlKQogICAgZnJhbWVfZGlnIDYKICAgIGl0b2IKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnJld2FyZF9sZWRnZXIgZW50cnkgZXhpc3RzCiAgICBzd2FwCiAgICByZXBsYWNlMiA4CiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2NzMKICAgIC8vIGFyYzQuVUludDY0KHJld2FyZF9hc2FfaWQpLAogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2NzQKICAgIC8vIGFyYzQuVUludDY0KG1lbWJlcnMubGVuZ3RoKSwKICAgIGZyYW1lX2RpZyAyCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2NzEtNjc1CiAgICAvLyBSZXdhcmRzRGlzdHJpYnV0ZWQoCiAgICAvLyAgICAgYXJjNC5VSW50NjQoZ3VpbGRfaWQpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHJld2FyZF9hc2FfaWQpLAogICAgLy8gICAgIGFyYzQuVUludDY0KG1lbWJlcnMubGVuZ3RoKSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyA0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2NzAtNjc2CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgUmV3YXJkc0Rpc3RyaWJ1dGVkKAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChndWlsZF9pZCksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHJld2FyZF9hc2FfaWQpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChtZW1iZXJzLmxlbmd0aCksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4MDY0ZmU1ODcgLy8gbWV0aG9kICJSZXdhcmRzRGlzdHJpYnV0ZWQodWludDY0LHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjY3NwogICAgLy8gcmV0dXJuIFN0cmluZygiR3VpbGQgcmV3YXJkcyBkaXN0cmlidXRlZCIpCiAgICBwdXNoYnl0ZXMgIkd1aWxkIHJld2FyZHMgZGlzdHJpYnV0ZWQiCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uZ3VpbGRfc3lzdGVtLkFsZ29SZWFsbUd1aWxkU3lzdGVtLmxlYXZlX2d1aWxkKCkgLT4gYnl0ZXM6CmxlYXZlX2d1aWxkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NjgyCiAgICAvLyBhc3NlcnQgc2VsZi5pc19ndWlsZF9tZW1iZXJbVHhuLnNlbmRlcl0sICJOb3QgaW4gYSBndWlsZCIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJpc19ndWlsZF9tZW1iZXIiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19ndWlsZF9tZW1iZXIgZXhpc3RzIGZvciBhY2NvdW50CiAgICBieXRlYyA0IC8vIDB4MDAKICAgICE9CiAgICBhc3NlcnQgLy8gTm90IGluIGEgZ3VpbGQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjY4MwogICAgLy8gZ3VpbGRfaWQgPSBzZWxmLnBsYXllcl9ndWlsZF9pZFtUeG4uc2VuZGVyXQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInBsYXllcl9ndWlsZF9pZCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBsYXllcl9ndWlsZF9pZCBleGlzdHMgZm9yIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjY4NS02ODYKICAgIC8vICMgUmVzZXQgcGxheWVyIGd1aWxkIHN0YXRlCiAgICAvLyBzZWxmLnBsYXllcl9ndWlsZF9pZFtUeG4uc2VuZGVyXSA9IFVJbnQ2NCgwKQogICAgdHhuIFNlbmRlcgogICAgYnl0ZWNfMSAvLyAicGxheWVyX2d1aWxkX2lkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjY4NwogICAgLy8gc2VsZi5wbGF5ZXJfcm9sZVtUeG4uc2VuZGVyXSA9IFN0cmluZygiIikKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjXzMgLy8gInBsYXllcl9yb2xlIgogICAgcHVzaGJ5dGVzICIiCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2ODgKICAgIC8vIHNlbGYuaXNfZ3VpbGRfbWVtYmVyW1R4bi5zZW5kZXJdID0gQm9vbChGYWxzZSkKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjXzIgLy8gImlzX2d1aWxkX21lbWJlciIKICAgIGJ5dGVjIDQgLy8gMHgwMAogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6Njg5CiAgICAvLyBzZWxmLmNvbnRyaWJ1dGlvbl9zY29yZVtUeG4uc2VuZGVyXSA9IFVJbnQ2NCgwKQogICAgdHhuIFNlbmRlcgogICAgYnl0ZWMgMTAgLy8gImNvbnRyaWJ1dGlvbl9zY29yZSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2OTAKICAgIC8vIHNlbGYuX3JlbW92ZV9mcm9tX2xlYWRlcmJvYXJkKFR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICBjYWxsc3ViIF9yZW1vdmVfZnJvbV9sZWFkZXJib2FyZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NjkyCiAgICAvLyBhcmM0LmVtaXQoR3VpbGRMZWZ0KGFyYzQuVUludDY0KGd1aWxkX2lkKSwgQWRkcmVzcyhUeG4uc2VuZGVyKSkpCiAgICBpdG9iCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweGNmZWMxNTFlIC8vIG1ldGhvZCAiR3VpbGRMZWZ0KHVpbnQ2NCxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2OTMKICAgIC8vIHJldHVybiBTdHJpbmcoIkxlZnQgZ3VpbGQiKQogICAgcHVzaGJ5dGVzICJMZWZ0IGd1aWxkIgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5ndWlsZF9zeXN0ZW0uQWxnb1JlYWxtR3VpbGRTeXN0ZW0uZ2V0X3BsYXllcl9ndWlsZF9pbmZvKHBsYXllcjogYnl0ZXMpIC0+IHVpbnQ2NCwgYnl0ZXMsIGJ5dGVzOgpnZXRfcGxheWVyX2d1aWxkX2luZm86CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2OTUtNjk2CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3BsYXllcl9ndWlsZF9pbmZvKHNlbGYsIHBsYXllcjogQWNjb3VudCkgLT4gdHVwbGVbVUludDY0LCBTdHJpbmcsIEJvb2xdOgogICAgcHJvdG8gMSAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2OTkKICAgIC8vIHNlbGYucGxheWVyX2d1aWxkX2lkW3BsYXllcl0sCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJwbGF5ZXJfZ3VpbGRfaWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wbGF5ZXJfZ3VpbGRfaWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3MDAKICAgIC8vIHNlbGYucGxheWVyX3JvbGVbcGxheWVyXSwKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInBsYXllcl9yb2xlIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGxheWVyX3JvbGUgZXhpc3RzIGZvciBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3MDEKICAgIC8vIHNlbGYuaXNfZ3VpbGRfbWVtYmVyW3BsYXllcl0sCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJpc19ndWlsZF9tZW1iZXIiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5pc19ndWlsZF9tZW1iZXIgZXhpc3RzIGZvciBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo2OTgtNzAyCiAgICAvLyByZXR1cm4gKAogICAgLy8gICAgIHNlbGYucGxheWVyX2d1aWxkX2lkW3BsYXllcl0sCiAgICAvLyAgICAgc2VsZi5wbGF5ZXJfcm9sZVtwbGF5ZXJdLAogICAgLy8gICAgIHNlbGYuaXNfZ3VpbGRfbWVtYmVyW3BsYXllcl0sCiAgICAvLyApCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmd1aWxkX3N5c3RlbS5BbGdvUmVhbG1HdWlsZFN5c3RlbS5nZXRfbGVhZGVyYm9hcmQoKSAtPiBieXRlczoKZ2V0X2xlYWRlcmJvYXJkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NzA5CiAgICAvLyBhc3NlcnQgc2VsZi5sZWFkZXJib2FyZCwgIk5vIGNvbnRyaWJ1dGlvbnMgeWV0IgogICAgYnl0ZWMgNSAvLyAweDZjNjU2MTY0NjU3MjYyNmY2MTcyNjQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIE5vIGNvbnRyaWJ1dGlvbnMgeWV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3MTAKICAgIC8vIHJldHVybiBzZWxmLmxlYWRlcmJvYXJkLnZhbHVlCiAgICBieXRlYyA1IC8vIDB4NmM2NTYxNjQ2NTcyNjI2ZjYxNzI2NAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGVhZGVyYm9hcmQgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmd1aWxkX3N5c3RlbS5BbGdvUmVhbG1HdWlsZFN5c3RlbS5fcmVtb3ZlX2Zyb21fbGVhZGVyYm9hcmQocGxheWVyOiBieXRlcykgLT4gdm9pZDoKX3JlbW92ZV9mcm9tX2xlYWRlcmJvYXJkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NzEyLTcxMwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfcmVtb3ZlX2Zyb21fbGVhZGVyYm9hcmQoc2VsZiwgcGxheWVyOiBBY2NvdW50KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICBpbnRjXzAgLy8gMAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjcxNAogICAgLy8gaWYgbm90IHNlbGYubGVhZGVyYm9hcmQ6CiAgICBieXRlYyA1IC8vIDB4NmM2NTYxNjQ2NTcyNjI2ZjYxNzI2NAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBibnogX3JlbW92ZV9mcm9tX2xlYWRlcmJvYXJkX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NzE1CiAgICAvLyByZXR1cm4KICAgIHJldHN1YgoKX3JlbW92ZV9mcm9tX2xlYWRlcmJvYXJkX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjcxNwogICAgLy8gYm9hcmQgPSBzZWxmLmxlYWRlcmJvYXJkLnZhbHVlLmNvcHkoKQogICAgYnl0ZWMgNSAvLyAweDZjNjU2MTY0NjU3MjYyNmY2MTcyNjQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGVhZGVyYm9hcmQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3MTgKICAgIC8vIGZvciBpIGluIHVyYW5nZShMRUFERVJCT0FSRF9TSVpFKToKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDEKCl9yZW1vdmVfZnJvbV9sZWFkZXJib2FyZF9mb3JfaGVhZGVyQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3MTgKICAgIC8vIGZvciBpIGluIHVyYW5nZShMRUFERVJCT0FSRF9TSVpFKToKICAgIGZyYW1lX2RpZyAxCiAgICBpbnRjXzMgLy8gMTAKICAgIDwKICAgIGJ6IF9yZW1vdmVfZnJvbV9sZWFkZXJib2FyZF9hZnRlcl9mb3JAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjcxOQogICAgLy8gaWYgYm9hcmRbaV0ucGxheWVyID09IEFkZHJlc3MocGxheWVyKToKICAgIGZyYW1lX2RpZyAxCiAgICBpbnRjXzIgLy8gNDgKICAgICoKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICBpbnRjXzIgLy8gNDgKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZXh0cmFjdCAwIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYnogX3JlbW92ZV9mcm9tX2xlYWRlcmJvYXJkX2FmdGVyX2lmX2Vsc2VAMTAKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9idXJ5IDIKCl9yZW1vdmVfZnJvbV9sZWFkZXJib2FyZF9mb3JfaGVhZGVyQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3MjAtNzIxCiAgICAvLyAjIFNoaWZ0IHRoZSBsb3dlciBlbnRyaWVzIHVwIGFuZCBjbGVhciB0aGUgbGFzdCBzbG90CiAgICAvLyBmb3IgaiBpbiB1cmFuZ2UoaSwgTEVBREVSQk9BUkRfU0laRSAtIDEpOgogICAgZnJhbWVfZGlnIDIKICAgIHB1c2hpbnQgOSAvLyA5CiAgICA8CiAgICBieiBfcmVtb3ZlX2Zyb21fbGVhZGVyYm9hcmRfYWZ0ZXJfZm9yQDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjcyMgogICAgLy8gYm9hcmRbal0gPSBib2FyZFtqICsgMV0uY29weSgpCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZHVwCiAgICBpbnRjXzIgLy8gNDgKICAgICoKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIHN3YXAKICAgIGludGNfMiAvLyA0OAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMwogICAgaW50Y18zIC8vIDEwCiAgICA8CiAgICBhc3NlcnQgLy8gSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHVuY292ZXIgMwogICAgaW50Y18yIC8vIDQ4CiAgICAqCiAgICB1bmNvdmVyIDMKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgcmVwbGFjZTMKICAgIGZyYW1lX2J1cnkgMAogICAgZnJhbWVfYnVyeSAyCiAgICBiIF9yZW1vdmVfZnJvbV9sZWFkZXJib2FyZF9mb3JfaGVhZGVyQDYKCl9yZW1vdmVfZnJvbV9sZWFkZXJib2FyZF9hZnRlcl9mb3JAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjcyMy03MjcKICAgIC8vIGJvYXJkW0xFQURFUkJPQVJEX1NJWkUgLSAxXSA9IExlYWRlcmJvYXJkRW50cnkoCiAgICAvLyAgICAgcGxheWVyPUFkZHJlc3MoR2xvYmFsLnplcm9fYWRkcmVzcyksCiAgICAvLyAgICAgZ3VpbGRfaWQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgY29udHJpYnV0aW9uX3Njb3JlPWFyYzQuVUludDY0KDApLAogICAgLy8gKQogICAgZnJhbWVfZGlnIDAKICAgIHB1c2hpbnQgNDMyIC8vIDQzMgogICAgcHVzaGJ5dGVzIGJhc2UzMihBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQSkKICAgIHJlcGxhY2UzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3MjgKICAgIC8vIHNlbGYubGVhZGVyYm9hcmQudmFsdWUgPSBib2FyZC5jb3B5KCkKICAgIGJ5dGVjIDUgLy8gMHg2YzY1NjE2NDY1NzI2MjZmNjE3MjY0CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3MjkKICAgIC8vIHJldHVybgogICAgcmV0c3ViCgpfcmVtb3ZlX2Zyb21fbGVhZGVyYm9hcmRfYWZ0ZXJfaWZfZWxzZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5OjcxOAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKExFQURFUkJPQVJEX1NJWkUpOgogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgX3JlbW92ZV9mcm9tX2xlYWRlcmJvYXJkX2Zvcl9oZWFkZXJAMwoKX3JlbW92ZV9mcm9tX2xlYWRlcmJvYXJkX2FmdGVyX2ZvckAxMjoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uZ3VpbGRfc3lzdGVtLkFsZ29SZWFsbUd1aWxkU3lzdGVtLmdldF9ndWlsZF90cmVhc3VyeShndWlsZF9pZDogdWludDY0KSAtPiB1aW50NjQ6CmdldF9ndWlsZF90cmVhc3VyeToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5Ojc1OS03NjAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfZ3VpbGRfdHJlYXN1cnkoc2VsZiwgZ3VpbGRfaWQ6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3NjIKICAgIC8vIGFzc2VydCBndWlsZF9pZCBpbiBzZWxmLmd1aWxkX3RyZWFzdXJ5LCAiR3VpbGQgZG9lcyBub3QgZXhpc3QiCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjIDYgLy8gMHg3NAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIEd1aWxkIGRvZXMgbm90IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3NjMKICAgIC8vIHJldHVybiBzZWxmLmd1aWxkX3RyZWFzdXJ5W2d1aWxkX2lkXQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ3VpbGRfdHJlYXN1cnkgZW50cnkgZXhpc3RzCiAgICBidG9pCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLmd1aWxkX3N5c3RlbS5BbGdvUmVhbG1HdWlsZFN5c3RlbS5nZXRfZ3VpbGRfbmFtZShndWlsZF9pZDogdWludDY0KSAtPiBieXRlczoKZ2V0X2d1aWxkX25hbWU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3NjUtNzY2CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2d1aWxkX25hbWUoc2VsZiwgZ3VpbGRfaWQ6IFVJbnQ2NCkgLT4gU3RyaW5nOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3NjgKICAgIC8vIGFzc2VydCBndWlsZF9pZCBpbiBzZWxmLmd1aWxkX25hbWVzLCAiR3VpbGQgZG9lcyBub3QgZXhpc3QiCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIHB1c2hieXRlcyAweDZlCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gR3VpbGQgZG9lcyBub3QgZXhpc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5Ojc2OQogICAgLy8gcmV0dXJuIHNlbGYuZ3VpbGRfbmFtZXNbZ3VpbGRfaWRdCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ndWlsZF9uYW1lcyBlbnRyeSBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0uZ3VpbGRfc3lzdGVtLkFsZ29SZWFsbUd1aWxkU3lzdGVtLmdldF9yZXdhcmRfbGVkZ2VyKGd1aWxkX2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpnZXRfcmV3YXJkX2xlZGdlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5Ojc3MS03NzIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfcmV3YXJkX2xlZGdlcihzZWxmLCBndWlsZF9pZDogVUludDY0KSAtPiBSZXdhcmRMZWRnZXI6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vZ3VpbGRfc3lzdGVtLnB5Ojc3NAogICAgLy8gYXNzZXJ0IGd1aWxkX2lkIGluIHNlbGYucmV3YXJkX2xlZGdlciwgIkd1aWxkIGhhcyBubyByZXdhcmQgYXNzZXQiCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjIDEyIC8vIDB4NzcKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBHdWlsZCBoYXMgbm8gcmV3YXJkIGFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL2d1aWxkX3N5c3RlbS5weTo3NzUKICAgIC8vIHJldHVybiBzZWxmLnJld2FyZF9sZWRnZXJbZ3VpbGRfaWRdCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5yZXdhcmRfbGVkZ2VyIGVudHJ5IGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5ndWlsZF9zeXN0ZW0uQWxnb1JlYWxtR3VpbGRTeXN0ZW0uZ2V0X2d1aWxkX3N5c3RlbV9zdGF0cygpIC0+IHVpbnQ2NCwgdWludDY0OgpnZXRfZ3VpbGRfc3lzdGVtX3N0YXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9ndWlsZF9zeXN0ZW0ucHk6NzgwCiAgICAvLyByZXR1cm4gKHNlbGYudG90YWxfZ3VpbGRzLnZhbHVlLCBzZWxmLmFjdGl2ZV9ndWlsZHNfY291bnQudmFsdWUpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAidG90YWxfZ3VpbGRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2d1aWxkcyBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJhY3RpdmVfZ3VpbGRzX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFjdGl2ZV9ndWlsZHNfY291bnQgZXhpc3RzCiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1663], "errorMessage": "Already an officer"}, {"pc": [1977], "errorMessage": "Already approved"}, {"pc": [1123, 1539], "errorMessage": "Already in a guild"}, {"pc": [2676], "errorMessage": "Deposit is not the guild reward asset"}, {"pc": [1294, 2666], "errorMessage": "Deposit must come from the depositor"}, {"pc": [1286, 2658], "errorMessage": "Deposit must go to the guild contract"}, {"pc": [1548, 3282, 3302], "errorMessage": "Guild does not exist"}, {"pc": [2647, 2786, 3320], "errorMessage": "Guild has no reward asset"}, {"pc": [1128], "errorMessage": "Guild name cannot be empty"}, {"pc": [1133], "errorMessage": "Guild name too long"}, {"pc": [1387, 1438, 1443, 1476, 1960, 1973, 1988, 1999, 2114, 2119, 2124, 2134, 2823, 3137, 3138, 3174, 3179], "errorMessage": "Index access is out of bounds"}, {"pc": [1094, 2590], "errorMessage": "Insufficient MBR payment"}, {"pc": [2866], "errorMessage": "Insufficient guild reward balance"}, {"pc": [1749, 2192], "errorMessage": "Insufficient guild treasury"}, {"pc": [2447], "errorMessage": "Insufficient permissions"}, {"pc": [1101], "errorMessage": "Leaderboard already exists"}, {"pc": [1361], "errorMessage": "Leaderboard not created"}, {"pc": [2511], "errorMessage": "MBR payment must come from the guild leader"}, {"pc": [1084, 2503], "errorMessage": "MBR payment must go to the guild contract"}, {"pc": [2763], "errorMessage": "Members and amounts arrays must match"}, {"pc": [1160], "errorMessage": "Minimum 0.1 ALGO required for guild creation"}, {"pc": [1278, 2421, 2485, 2630, 2740], "errorMessage": "Must be guild member"}, {"pc": [3090], "errorMessage": "No contributions yet"}, {"pc": [3002], "errorMessage": "Not in a guild"}, {"pc": [2795], "errorMessage": "Not the guild reward asset"}, {"pc": [2764], "errorMessage": "Nothing to distribute"}, {"pc": [420, 441, 461, 489, 510, 526, 572, 596, 630, 658, 686, 706, 734, 762, 795, 825, 859, 886, 919, 941], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [960], "errorMessage": "OnCompletion is not OptIn"}, {"pc": [2750], "errorMessage": "Only guild leader can distribute rewards"}, {"pc": [2495], "errorMessage": "Only guild leader can set the reward asset"}, {"pc": [1076], "errorMessage": "Only guild master can create the leaderboard"}, {"pc": [1058], "errorMessage": "Only guild master can link the game manager"}, {"pc": [2347], "errorMessage": "Only the guild leader can cancel proposals"}, {"pc": [1634], "errorMessage": "Only the guild leader can promote officers"}, {"pc": [1018], "errorMessage": "Player not registered"}, {"pc": [1945], "errorMessage": "Proposal belongs to another guild"}, {"pc": [1925, 2318, 2467], "errorMessage": "Proposal does not exist"}, {"pc": [2857], "errorMessage": "Recipient is not a member of this guild"}, {"pc": [2540], "errorMessage": "Reward ledger still holds rewards"}, {"pc": [1653, 2265], "errorMessage": "Target is not a member of this guild"}, {"pc": [1149], "errorMessage": "Treasury payment must come from the guild creator"}, {"pc": [1141], "errorMessage": "Treasury payment must go to the guild contract"}, {"pc": [1732], "errorMessage": "Unknown action type"}, {"pc": [977], "errorMessage": "can only call when creating"}, {"pc": [423, 444, 464, 492, 513, 529, 575, 599, 633, 661, 689, 709, 737, 765, 798, 828, 862, 889, 922, 944, 963], "errorMessage": "can only call when not creating"}, {"pc": [1237, 3333], "errorMessage": "check self.active_guilds_count exists"}, {"pc": [1339], "errorMessage": "check self.contribution_score exists for account"}, {"pc": [989], "errorMessage": "check self.game_manager_app exists"}, {"pc": [1056, 1074], "errorMessage": "check self.guild_master exists"}, {"pc": [3304], "errorMessage": "check self.guild_names entry exists"}, {"pc": [1931, 2320, 2469], "errorMessage": "check self.guild_proposals entry exists"}, {"pc": [1309, 1743, 2104, 2182, 2362, 3284], "errorMessage": "check self.guild_treasury entry exists"}, {"pc": [1119, 1274, 1535, 1614, 2417, 2481, 2626, 2736, 2998, 3083], "errorMessage": "check self.is_guild_member exists for account"}, {"pc": [1365, 3094, 3118], "errorMessage": "check self.leaderboard exists"}, {"pc": [1300, 1640, 1701, 1943, 2329, 2517, 2636, 2774, 3008, 3071], "errorMessage": "check self.player_guild_id exists for account"}, {"pc": [1626, 1659, 2339, 2431, 2491, 2746, 3077], "errorMessage": "check self.player_role exists for account"}, {"pc": [2535, 2650, 2788, 2936, 3322], "errorMessage": "check self.reward_ledger entry exists"}, {"pc": [1165, 1544, 3328], "errorMessage": "check self.total_guilds exists"}, {"pc": [1759], "errorMessage": "check self.total_proposals exists"}, {"pc": [1775, 2036], "errorMessage": "overflow"}, {"pc": [644], "errorMessage": "transaction type is axfer"}, {"pc": [677, 872, 905, 932], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True)
+class GuildProposal:
+    """Struct for GuildProposal"""
+    guild_id: int
+    action: int
+    target: str
+    amount: int
+    approval_count: int
+    approvers: tuple[str, str]
+
+@dataclasses.dataclass(frozen=True)
+class RewardLedger:
+    """Struct for RewardLedger"""
+    reward_asset: int
+    balance: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetGameManagerArgs:
+    """Dataclass for set_game_manager arguments"""
+    game_manager: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_game_manager(application)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateLeaderboardArgs:
+    """Dataclass for create_leaderboard arguments"""
+    mbr_payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_leaderboard(pay)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateGuildArgs:
+    """Dataclass for create_guild arguments"""
+    guild_name: str
+    treasury_payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_guild(string,pay)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DepositToTreasuryArgs:
+    """Dataclass for deposit_to_treasury arguments"""
+    payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "deposit_to_treasury(pay)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class JoinGuildArgs:
+    """Dataclass for join_guild arguments"""
+    guild_id: int
+    application_message: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "join_guild(uint64,string)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PromoteToOfficerArgs:
+    """Dataclass for promote_to_officer arguments"""
+    member: str | bytes
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "promote_to_officer(account)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ProposeGuildActionArgs:
+    """Dataclass for propose_guild_action arguments"""
+    action_type: str
+    target_player: str | bytes
+    amount: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "propose_guild_action(string,account,uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ApproveGuildActionArgs:
+    """Dataclass for approve_guild_action arguments"""
+    proposal_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "approve_guild_action(uint64)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CancelGuildActionArgs:
+    """Dataclass for cancel_guild_action arguments"""
+    proposal_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "cancel_guild_action(uint64)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetGuildProposalArgs:
+    """Dataclass for get_guild_proposal arguments"""
+    proposal_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_guild_proposal(uint64)(uint64,uint8,address,uint64,uint8,address[2])"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetRewardAssetArgs:
+    """Dataclass for set_reward_asset arguments"""
+    reward_asset: int
+    mbr_payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_reward_asset(asset,pay)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DepositGuildRewardsArgs:
+    """Dataclass for deposit_guild_rewards arguments"""
+    deposit: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "deposit_guild_rewards(axfer)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DistributeGuildRewardsArgs:
+    """Dataclass for distribute_guild_rewards arguments"""
+    reward_asa_id: int
+    members: list[str]
+    amounts: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "distribute_guild_rewards(uint64,address[],uint64[])string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetPlayerGuildInfoArgs:
+    """Dataclass for get_player_guild_info arguments"""
+    player: str | bytes
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_player_guild_info(account)(uint64,string,bool)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetGuildTreasuryArgs:
+    """Dataclass for get_guild_treasury arguments"""
+    guild_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_guild_treasury(uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetGuildNameArgs:
+    """Dataclass for get_guild_name arguments"""
+    guild_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_guild_name(uint64)string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetRewardLedgerArgs:
+    """Dataclass for get_reward_ledger arguments"""
+    guild_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_reward_ledger(uint64)(uint64,uint64)"
+
+
+class _AlgoRealmGuildSystemOptIn:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "opt_in()void",
+        }))
+
+
+class AlgoRealmGuildSystemParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_AlgoRealmGuildSystemOptIn":
+        return _AlgoRealmGuildSystemOptIn(self.app_client)
+
+    def set_game_manager(
+        self,
+        args: tuple[int] | SetGameManagerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_game_manager(application)void",
+            "args": method_args,
+        }))
+
+    def create_leaderboard(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | CreateLeaderboardArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_leaderboard(pay)void",
+            "args": method_args,
+        }))
+
+    def create_guild(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | CreateGuildArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_guild(string,pay)uint64",
+            "args": method_args,
+        }))
+
+    def deposit_to_treasury(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DepositToTreasuryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "deposit_to_treasury(pay)uint64",
+            "args": method_args,
+        }))
+
+    def join_guild(
+        self,
+        args: tuple[int, str] | JoinGuildArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "join_guild(uint64,string)string",
+            "args": method_args,
+        }))
+
+    def promote_to_officer(
+        self,
+        args: tuple[str | bytes] | PromoteToOfficerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "promote_to_officer(account)string",
+            "args": method_args,
+        }))
+
+    def propose_guild_action(
+        self,
+        args: tuple[str, str | bytes, int] | ProposeGuildActionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "propose_guild_action(string,account,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def approve_guild_action(
+        self,
+        args: tuple[int] | ApproveGuildActionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve_guild_action(uint64)string",
+            "args": method_args,
+        }))
+
+    def cancel_guild_action(
+        self,
+        args: tuple[int] | CancelGuildActionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "cancel_guild_action(uint64)string",
+            "args": method_args,
+        }))
+
+    def get_guild_proposal(
+        self,
+        args: tuple[int] | GetGuildProposalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_guild_proposal(uint64)(uint64,uint8,address,uint64,uint8,address[2])",
+            "args": method_args,
+        }))
+
+    def set_reward_asset(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | SetRewardAssetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_reward_asset(asset,pay)void",
+            "args": method_args,
+        }))
+
+    def deposit_guild_rewards(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DepositGuildRewardsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "deposit_guild_rewards(axfer)uint64",
+            "args": method_args,
+        }))
+
+    def distribute_guild_rewards(
+        self,
+        args: tuple[int, list[str], list[int]] | DistributeGuildRewardsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "distribute_guild_rewards(uint64,address[],uint64[])string",
+            "args": method_args,
+        }))
+
+    def leave_guild(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "leave_guild()string",
+        }))
+
+    def get_player_guild_info(
+        self,
+        args: tuple[str | bytes] | GetPlayerGuildInfoArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_player_guild_info(account)(uint64,string,bool)",
+            "args": method_args,
+        }))
+
+    def get_leaderboard(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_leaderboard()(address,uint64,uint64)[10]",
+        }))
+
+    def get_guild_treasury(
+        self,
+        args: tuple[int] | GetGuildTreasuryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_guild_treasury(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def get_guild_name(
+        self,
+        args: tuple[int] | GetGuildNameArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_guild_name(uint64)string",
+            "args": method_args,
+        }))
+
+    def get_reward_ledger(
+        self,
+        args: tuple[int] | GetRewardLedgerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_reward_ledger(uint64)(uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_guild_system_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_guild_system_stats()(uint64,uint64)",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class _AlgoRealmGuildSystemOptInTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "opt_in()void",
+        }))
+
+
+class AlgoRealmGuildSystemCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_AlgoRealmGuildSystemOptInTransaction":
+        return _AlgoRealmGuildSystemOptInTransaction(self.app_client)
+
+    def set_game_manager(
+        self,
+        args: tuple[int] | SetGameManagerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_game_manager(application)void",
+            "args": method_args,
+        }))
+
+    def create_leaderboard(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | CreateLeaderboardArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_leaderboard(pay)void",
+            "args": method_args,
+        }))
+
+    def create_guild(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | CreateGuildArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_guild(string,pay)uint64",
+            "args": method_args,
+        }))
+
+    def deposit_to_treasury(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DepositToTreasuryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "deposit_to_treasury(pay)uint64",
+            "args": method_args,
+        }))
+
+    def join_guild(
+        self,
+        args: tuple[int, str] | JoinGuildArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "join_guild(uint64,string)string",
+            "args": method_args,
+        }))
+
+    def promote_to_officer(
+        self,
+        args: tuple[str | bytes] | PromoteToOfficerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "promote_to_officer(account)string",
+            "args": method_args,
+        }))
+
+    def propose_guild_action(
+        self,
+        args: tuple[str, str | bytes, int] | ProposeGuildActionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "propose_guild_action(string,account,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def approve_guild_action(
+        self,
+        args: tuple[int] | ApproveGuildActionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve_guild_action(uint64)string",
+            "args": method_args,
+        }))
+
+    def cancel_guild_action(
+        self,
+        args: tuple[int] | CancelGuildActionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "cancel_guild_action(uint64)string",
+            "args": method_args,
+        }))
+
+    def get_guild_proposal(
+        self,
+        args: tuple[int] | GetGuildProposalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_guild_proposal(uint64)(uint64,uint8,address,uint64,uint8,address[2])",
+            "args": method_args,
+        }))
+
+    def set_reward_asset(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | SetRewardAssetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_reward_asset(asset,pay)void",
+            "args": method_args,
+        }))
+
+    def deposit_guild_rewards(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DepositGuildRewardsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "deposit_guild_rewards(axfer)uint64",
+            "args": method_args,
+        }))
+
+    def distribute_guild_rewards(
+        self,
+        args: tuple[int, list[str], list[int]] | DistributeGuildRewardsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "distribute_guild_rewards(uint64,address[],uint64[])string",
+            "args": method_args,
+        }))
+
+    def leave_guild(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "leave_guild()string",
+        }))
+
+    def get_player_guild_info(
+        self,
+        args: tuple[str | bytes] | GetPlayerGuildInfoArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_player_guild_info(account)(uint64,string,bool)",
+            "args": method_args,
+        }))
+
+    def get_leaderboard(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_leaderboard()(address,uint64,uint64)[10]",
+        }))
+
+    def get_guild_treasury(
+        self,
+        args: tuple[int] | GetGuildTreasuryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_guild_treasury(uint64)uint64",
+            "args": method_args,
+        }))
+
+    def get_guild_name(
+        self,
+        args: tuple[int] | GetGuildNameArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_guild_name(uint64)string",
+            "args": method_args,
+        }))
+
+    def get_reward_ledger(
+        self,
+        args: tuple[int] | GetRewardLedgerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_reward_ledger(uint64)(uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_guild_system_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_guild_system_stats()(uint64,uint64)",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class _AlgoRealmGuildSystemOptInSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "opt_in()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+
+class AlgoRealmGuildSystemSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_AlgoRealmGuildSystemOptInSend":
+        return _AlgoRealmGuildSystemOptInSend(self.app_client)
+
+    def set_game_manager(
+        self,
+        args: tuple[int] | SetGameManagerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_game_manager(application)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def create_leaderboard(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | CreateLeaderboardArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_leaderboard(pay)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def create_guild(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | CreateGuildArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_guild(string,pay)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def deposit_to_treasury(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DepositToTreasuryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "deposit_to_treasury(pay)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def join_guild(
+        self,
+        args: tuple[int, str] | JoinGuildArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "join_guild(uint64,string)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def promote_to_officer(
+        self,
+        args: tuple[str | bytes] | PromoteToOfficerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "promote_to_officer(account)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def propose_guild_action(
+        self,
+        args: tuple[str, str | bytes, int] | ProposeGuildActionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "propose_guild_action(string,account,uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def approve_guild_action(
+        self,
+        args: tuple[int] | ApproveGuildActionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve_guild_action(uint64)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def cancel_guild_action(
+        self,
+        args: tuple[int] | CancelGuildActionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "cancel_guild_action(uint64)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def get_guild_proposal(
+        self,
+        args: tuple[int] | GetGuildProposalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[GuildProposal]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_guild_proposal(uint64)(uint64,uint8,address,uint64,uint8,address[2])",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(GuildProposal, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[GuildProposal], parsed_response)
+
+    def set_reward_asset(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | SetRewardAssetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_reward_asset(asset,pay)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def deposit_guild_rewards(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DepositGuildRewardsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "deposit_guild_rewards(axfer)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def distribute_guild_rewards(
+        self,
+        args: tuple[int, list[str], list[int]] | DistributeGuildRewardsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "distribute_guild_rewards(uint64,address[],uint64[])string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def leave_guild(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "leave_guild()string",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def get_player_guild_info(
+        self,
+        args: tuple[str | bytes] | GetPlayerGuildInfoArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[tuple[int, str, bool]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_player_guild_info(account)(uint64,string,bool)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[int, str, bool]], parsed_response)
+
+    def get_leaderboard(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[tuple[tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int]]]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_leaderboard()(address,uint64,uint64)[10]",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int]]], parsed_response)
+
+    def get_guild_treasury(
+        self,
+        args: tuple[int] | GetGuildTreasuryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_guild_treasury(uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_guild_name(
+        self,
+        args: tuple[int] | GetGuildNameArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_guild_name(uint64)string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def get_reward_ledger(
+        self,
+        args: tuple[int] | GetRewardLedgerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[RewardLedger]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_reward_ledger(uint64)(uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(RewardLedger, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[RewardLedger], parsed_response)
+
+    def get_guild_system_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[tuple[int, int]]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_guild_system_stats()(uint64,uint64)",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[int, int]], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    guild_master: str
+    total_guilds: int
+    active_guilds_count: int
+    total_proposals: int
+    game_manager_app: int
+
+class LocalStateValue(typing.TypedDict):
+    """Shape of local_state state key values"""
+    player_guild_id: int
+    player_role: str
+    is_guild_member: bool
+    contribution_score: int
+
+class BoxStateValue(typing.TypedDict):
+    """Shape of box state key values"""
+    leaderboard: tuple[tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int]]
+
+class AlgoRealmGuildSystemState:
+    """Methods to access state for the current AlgoRealmGuildSystem app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    def local_state(
+        self, address: str
+    ) -> "_LocalState":
+            """Methods to access local_state for the current app"""
+            return _LocalState(self.app_client, address)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def guild_master(self) -> str:
+        """Get the current value of the guild_master key in global_state state"""
+        value = self.app_client.state.global_state.get_value("guild_master")
+        if isinstance(value, dict) and "address" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
+        return typing.cast(str, value)
+
+    @property
+    def total_guilds(self) -> int:
+        """Get the current value of the total_guilds key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_guilds")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def active_guilds_count(self) -> int:
+        """Get the current value of the active_guilds_count key in global_state state"""
+        value = self.app_client.state.global_state.get_value("active_guilds_count")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def total_proposals(self) -> int:
+        """Get the current value of the total_proposals key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_proposals")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def game_manager_app(self) -> int:
+        """Get the current value of the game_manager_app key in global_state state"""
+        value = self.app_client.state.global_state.get_value("game_manager_app")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _LocalState:
+    def __init__(self, app_client: algokit_utils.AppClient, address: str):
+        self.app_client = app_client
+        self.address = address
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> LocalStateValue:
+        """Get all current keyed values from local_state state"""
+        result = self.app_client.state.local_state(self.address).get_all()
+        if not result:
+            return typing.cast(LocalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.local_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(LocalStateValue, converted)
+
+    @property
+    def player_guild_id(self) -> int:
+        """Get the current value of the player_guild_id key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("player_guild_id")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def player_role(self) -> str:
+        """Get the current value of the player_role key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("player_role")
+        if isinstance(value, dict) and "AVMString" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMString"], value)  # type: ignore
+        return typing.cast(str, value)
+
+    @property
+    def is_guild_member(self) -> bool:
+        """Get the current value of the is_guild_member key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("is_guild_member")
+        if isinstance(value, dict) and "bool" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["bool"], value)  # type: ignore
+        return typing.cast(bool, value)
+
+    @property
+    def contribution_score(self) -> int:
+        """Get the current value of the contribution_score key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("contribution_score")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "RewardLedger": RewardLedger,
+            "GuildProposal": GuildProposal
+        }
+
+    def get_all(self) -> BoxStateValue:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return typing.cast(BoxStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(BoxStateValue, converted)
+
+    @property
+    def leaderboard(self) -> tuple[tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int]]:
+        """Get the current value of the leaderboard key in box state"""
+        value = self.app_client.state.box.get_value("leaderboard")
+        if isinstance(value, dict) and "(address,uint64,uint64)[10]" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["(address,uint64,uint64)[10]"], value)  # type: ignore
+        return typing.cast(tuple[tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int]], value)
+
+    @property
+    def guild_treasury(self) -> "_MapState[int, int]":
+        """Get values from the guild_treasury map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "guild_treasury",
+            None
+        )
+
+    @property
+    def guild_names(self) -> "_MapState[int, str]":
+        """Get values from the guild_names map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "guild_names",
+            None
+        )
+
+    @property
+    def reward_ledger(self) -> "_MapState[int, RewardLedger]":
+        """Get values from the reward_ledger map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "reward_ledger",
+            self._struct_classes.get("RewardLedger")
+        )
+
+    @property
+    def guild_proposals(self) -> "_MapState[int, GuildProposal]":
+        """Get values from the guild_proposals map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "guild_proposals",
+            self._struct_classes.get("GuildProposal")
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class AlgoRealmGuildSystemClient:
+    """Client for interacting with AlgoRealmGuildSystem smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = AlgoRealmGuildSystemParams(self.app_client)
+        self.create_transaction = AlgoRealmGuildSystemCreateTransactionParams(self.app_client)
+        self.send = AlgoRealmGuildSystemSend(self.app_client)
+        self.state = AlgoRealmGuildSystemState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "AlgoRealmGuildSystemClient":
+        return AlgoRealmGuildSystemClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AlgoRealmGuildSystemClient":
+        return AlgoRealmGuildSystemClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AlgoRealmGuildSystemClient":
+        return AlgoRealmGuildSystemClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "AlgoRealmGuildSystemComposer":
+        return AlgoRealmGuildSystemComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_game_manager(application)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_leaderboard(pay)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_guild(string,pay)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["deposit_to_treasury(pay)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["join_guild(uint64,string)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["promote_to_officer(account)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["propose_guild_action(string,account,uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["approve_guild_action(uint64)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["cancel_guild_action(uint64)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_guild_proposal(uint64)(uint64,uint8,address,uint64,uint8,address[2])"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> GuildProposal | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_reward_asset(asset,pay)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["deposit_guild_rewards(axfer)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["distribute_guild_rewards(uint64,address[],uint64[])string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["leave_guild()string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_player_guild_info(account)(uint64,string,bool)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> tuple[int, str, bool] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_leaderboard()(address,uint64,uint64)[10]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> tuple[tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_guild_treasury(uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_guild_name(uint64)string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_reward_ledger(uint64)(uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> RewardLedger | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_guild_system_stats()(uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> tuple[int, int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["opt_in()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | GuildProposal | None | RewardLedger | int | str | tuple[int, int] | tuple[int, str, bool] | tuple[tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int], tuple[str, int, int]]:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class AlgoRealmGuildSystemBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating AlgoRealmGuildSystem contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class AlgoRealmGuildSystemFactory(algokit_utils.TypedAppFactoryProtocol[AlgoRealmGuildSystemBareCallCreateParams, None, None]):
+    """Factory for deploying and managing AlgoRealmGuildSystemClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = AlgoRealmGuildSystemFactoryParams(self.app_factory)
+        self.create_transaction = AlgoRealmGuildSystemFactoryCreateTransaction(self.app_factory)
+        self.send = AlgoRealmGuildSystemFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: AlgoRealmGuildSystemBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[AlgoRealmGuildSystemClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return AlgoRealmGuildSystemClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AlgoRealmGuildSystemClient:
+        """Get an app client by creator address and name"""
+        return AlgoRealmGuildSystemClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AlgoRealmGuildSystemClient:
+        """Get an app client by app ID"""
+        return AlgoRealmGuildSystemClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class AlgoRealmGuildSystemFactoryParams:
+    """Parameters for creating transactions for AlgoRealmGuildSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AlgoRealmGuildSystemFactoryCreateParams(app_factory)
+        self.update = AlgoRealmGuildSystemFactoryUpdateParams(app_factory)
+        self.delete = AlgoRealmGuildSystemFactoryDeleteParams(app_factory)
+
+class AlgoRealmGuildSystemFactoryCreateParams:
+    """Parameters for 'create' operations of AlgoRealmGuildSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def set_game_manager(
+        self,
+        args: tuple[int] | SetGameManagerArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_game_manager(application)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_game_manager(application)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_leaderboard(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | CreateLeaderboardArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_leaderboard(pay)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_leaderboard(pay)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_guild(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | CreateGuildArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_guild(string,pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_guild(string,pay)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def deposit_to_treasury(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DepositToTreasuryArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the deposit_to_treasury(pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "deposit_to_treasury(pay)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def join_guild(
+        self,
+        args: tuple[int, str] | JoinGuildArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the join_guild(uint64,string)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "join_guild(uint64,string)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def promote_to_officer(
+        self,
+        args: tuple[str | bytes] | PromoteToOfficerArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the promote_to_officer(account)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "promote_to_officer(account)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def propose_guild_action(
+        self,
+        args: tuple[str, str | bytes, int] | ProposeGuildActionArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the propose_guild_action(string,account,uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "propose_guild_action(string,account,uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def approve_guild_action(
+        self,
+        args: tuple[int] | ApproveGuildActionArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the approve_guild_action(uint64)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "approve_guild_action(uint64)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def cancel_guild_action(
+        self,
+        args: tuple[int] | CancelGuildActionArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the cancel_guild_action(uint64)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "cancel_guild_action(uint64)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_guild_proposal(
+        self,
+        args: tuple[int] | GetGuildProposalArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_guild_proposal(uint64)(uint64,uint8,address,uint64,uint8,address[2]) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_guild_proposal(uint64)(uint64,uint8,address,uint64,uint8,address[2])",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def set_reward_asset(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | SetRewardAssetArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_reward_asset(asset,pay)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_reward_asset(asset,pay)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def deposit_guild_rewards(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DepositGuildRewardsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the deposit_guild_rewards(axfer)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "deposit_guild_rewards(axfer)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def distribute_guild_rewards(
+        self,
+        args: tuple[int, list[str], list[int]] | DistributeGuildRewardsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the distribute_guild_rewards(uint64,address[],uint64[])string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "distribute_guild_rewards(uint64,address[],uint64[])string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def leave_guild(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the leave_guild()string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "leave_guild()string",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_player_guild_info(
+        self,
+        args: tuple[str | bytes] | GetPlayerGuildInfoArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_player_guild_info(account)(uint64,string,bool) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_player_guild_info(account)(uint64,string,bool)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_leaderboard(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_leaderboard()(address,uint64,uint64)[10] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_leaderboard()(address,uint64,uint64)[10]",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_guild_treasury(
+        self,
+        args: tuple[int] | GetGuildTreasuryArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_guild_treasury(uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_guild_treasury(uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_guild_name(
+        self,
+        args: tuple[int] | GetGuildNameArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_guild_name(uint64)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_guild_name(uint64)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_reward_ledger(
+        self,
+        args: tuple[int] | GetRewardLedgerArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_reward_ledger(uint64)(uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_reward_ledger(uint64)(uint64,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_guild_system_stats(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_guild_system_stats()(uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_guild_system_stats()(uint64,uint64)",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def opt_in(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the opt_in()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "opt_in()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class AlgoRealmGuildSystemFactoryUpdateParams:
+    """Parameters for 'update' operations of AlgoRealmGuildSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class AlgoRealmGuildSystemFactoryDeleteParams:
+    """Parameters for 'delete' operations of AlgoRealmGuildSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class AlgoRealmGuildSystemFactoryCreateTransaction:
+    """Create transactions for AlgoRealmGuildSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AlgoRealmGuildSystemFactoryCreateTransactionCreate(app_factory)
+
+
+class AlgoRealmGuildSystemFactoryCreateTransactionCreate:
+    """Create new instances of AlgoRealmGuildSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class AlgoRealmGuildSystemFactorySend:
+    """Send calls to AlgoRealmGuildSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AlgoRealmGuildSystemFactorySendCreate(app_factory)
+
+
+class AlgoRealmGuildSystemFactorySendCreate:
+    """Send create calls to AlgoRealmGuildSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[AlgoRealmGuildSystemClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return AlgoRealmGuildSystemClient(result[0]), result[1]
+
+
+class _AlgoRealmGuildSystemOptInComposer:
+    def __init__(self, composer: "AlgoRealmGuildSystemComposer"):
+        self.composer = composer
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self.composer._composer.add_app_call_method_call(
+            self.composer.client.params.opt_in.opt_in(
+                
+                params=params,
+                
+            )
+        )
+        self.composer._result_mappers.append(
+            lambda v: self.composer.client.decode_return_value(
+                "opt_in()void", v
+            )
+        )
+        return self.composer
+
+
+class AlgoRealmGuildSystemComposer:
+    """Composer for creating transaction groups for AlgoRealmGuildSystem contract calls"""
+
+    def __init__(self, client: "AlgoRealmGuildSystemClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    @property
+    def opt_in(self) -> "_AlgoRealmGuildSystemOptInComposer":
+        return _AlgoRealmGuildSystemOptInComposer(self)
+
+    def set_game_manager(
+        self,
+        args: tuple[int] | SetGameManagerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_game_manager(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_game_manager(application)void", v
+            )
+        )
+        return self
+
+    def create_leaderboard(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | CreateLeaderboardArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_leaderboard(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_leaderboard(pay)void", v
+            )
+        )
+        return self
+
+    def create_guild(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | CreateGuildArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_guild(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_guild(string,pay)uint64", v
+            )
+        )
+        return self
+
+    def deposit_to_treasury(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DepositToTreasuryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.deposit_to_treasury(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "deposit_to_treasury(pay)uint64", v
+            )
+        )
+        return self
+
+    def join_guild(
+        self,
+        args: tuple[int, str] | JoinGuildArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.join_guild(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "join_guild(uint64,string)string", v
+            )
+        )
+        return self
+
+    def promote_to_officer(
+        self,
+        args: tuple[str | bytes] | PromoteToOfficerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.promote_to_officer(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "promote_to_officer(account)string", v
+            )
+        )
+        return self
+
+    def propose_guild_action(
+        self,
+        args: tuple[str, str | bytes, int] | ProposeGuildActionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.propose_guild_action(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "propose_guild_action(string,account,uint64)uint64", v
+            )
+        )
+        return self
+
+    def approve_guild_action(
+        self,
+        args: tuple[int] | ApproveGuildActionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.approve_guild_action(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "approve_guild_action(uint64)string", v
+            )
+        )
+        return self
+
+    def cancel_guild_action(
+        self,
+        args: tuple[int] | CancelGuildActionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.cancel_guild_action(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "cancel_guild_action(uint64)string", v
+            )
+        )
+        return self
+
+    def get_guild_proposal(
+        self,
+        args: tuple[int] | GetGuildProposalArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_guild_proposal(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_guild_proposal(uint64)(uint64,uint8,address,uint64,uint8,address[2])", v
+            )
+        )
+        return self
+
+    def set_reward_asset(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | SetRewardAssetArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_reward_asset(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_reward_asset(asset,pay)void", v
+            )
+        )
+        return self
+
+    def deposit_guild_rewards(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument] | DepositGuildRewardsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.deposit_guild_rewards(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "deposit_guild_rewards(axfer)uint64", v
+            )
+        )
+        return self
+
+    def distribute_guild_rewards(
+        self,
+        args: tuple[int, list[str], list[int]] | DistributeGuildRewardsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.distribute_guild_rewards(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "distribute_guild_rewards(uint64,address[],uint64[])string", v
+            )
+        )
+        return self
+
+    def leave_guild(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.leave_guild(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "leave_guild()string", v
+            )
+        )
+        return self
+
+    def get_player_guild_info(
+        self,
+        args: tuple[str | bytes] | GetPlayerGuildInfoArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_player_guild_info(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_player_guild_info(account)(uint64,string,bool)", v
+            )
+        )
+        return self
+
+    def get_leaderboard(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_leaderboard(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_leaderboard()(address,uint64,uint64)[10]", v
+            )
+        )
+        return self
+
+    def get_guild_treasury(
+        self,
+        args: tuple[int] | GetGuildTreasuryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_guild_treasury(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_guild_treasury(uint64)uint64", v
+            )
+        )
+        return self
+
+    def get_guild_name(
+        self,
+        args: tuple[int] | GetGuildNameArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_guild_name(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_guild_name(uint64)string", v
+            )
+        )
+        return self
+
+    def get_reward_ledger(
+        self,
+        args: tuple[int] | GetRewardLedgerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_reward_ledger(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_reward_ledger(uint64)(uint64,uint64)", v
+            )
+        )
+        return self
+
+    def get_guild_system_stats(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_guild_system_stats(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_guild_system_stats()(uint64,uint64)", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AlgoRealmGuildSystemComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "AlgoRealmGuildSystemComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
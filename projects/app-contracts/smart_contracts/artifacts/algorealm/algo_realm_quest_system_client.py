@@ -0,0 +1,1493 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["OptIn"], "create": []}, "args": [], "name": "opt_in", "returns": {"type": "void"}, "desc": "Opt in to track quest progress", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "application", "name": "game_manager"}], "name": "set_game_manager", "returns": {"type": "void"}, "desc": "Link the game manager app that verifies recovery proofs (quest master only)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "name"}, {"type": "string", "name": "description"}, {"type": "string", "name": "reward_item_type"}, {"type": "string", "name": "reward_rarity"}, {"type": "uint64", "name": "experience_reward"}], "name": "create_quest", "returns": {"type": "uint64"}, "desc": "Create a new quest (only quest master)", "events": [{"args": [{"type": "uint64", "name": "quest_id"}, {"type": "uint64", "name": "experience_reward"}], "name": "QuestCreated", "desc": "ARC-28 event: the quest master added a quest"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "quest_id"}, {"type": "byte[]", "name": "completion_proof"}], "name": "complete_quest", "returns": {"type": "string"}, "desc": "Complete a quest and earn rewards\nThis can be used as proof for item recovery", "events": [{"args": [{"type": "uint64", "name": "quest_id"}, {"type": "address", "name": "player"}], "name": "QuestCompleted", "desc": "ARC-28 event: a player completed a quest"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "quest_id"}], "name": "generate_recovery_proof", "returns": {"type": "byte[]"}, "desc": "Generate proof of quest completion for item recovery\nThis is used in the main game contract's recover_lost_item function", "events": [{"args": [{"type": "uint64", "name": "quest_id"}, {"type": "address", "name": "player"}], "name": "RecoveryProofGenerated", "desc": "ARC-28 event: a player generated a single-use recovery proof"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "player"}, {"type": "byte[]", "name": "proof"}], "name": "consume_recovery_proof", "returns": {"type": "bool"}, "desc": "Verify and invalidate a player's recovery proof\nOnly callable by the linked game manager via an inner app call", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "player"}], "name": "get_player_quest_stats", "returns": {"type": "(uint64,uint64)"}, "desc": "Get player's quest statistics", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_quest_system_info", "returns": {"type": "(uint64,uint64)"}, "desc": "Get quest system information", "events": [], "readonly": true, "recommendations": {}}], "name": "AlgoRealmQuestSystem", "state": {"keys": {"box": {}, "global": {"quest_master": {"key": "cXVlc3RfbWFzdGVy", "keyType": "AVMString", "valueType": "address"}, "total_quests": {"key": "dG90YWxfcXVlc3Rz", "keyType": "AVMString", "valueType": "AVMUint64"}, "active_quests_count": {"key": "YWN0aXZlX3F1ZXN0c19jb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "game_manager_app": {"key": "Z2FtZV9tYW5hZ2VyX2FwcA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {"completed_quests_count": {"key": "Y29tcGxldGVkX3F1ZXN0c19jb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "total_experience_earned": {"key": "dG90YWxfZXhwZXJpZW5jZV9lYXJuZWQ=", "keyType": "AVMString", "valueType": "AVMUint64"}, "recovery_proof_hash": {"key": "cmVjb3ZlcnlfcHJvb2ZfaGFzaA==", "keyType": "AVMString", "valueType": "AVMBytes"}}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 3}, "local": {"bytes": 1, "ints": 2}}}, "structs": {}, "byteCode": {"approval": "CiACAAEmCAQVH3x1DHRvdGFsX3F1ZXN0cxZjb21wbGV0ZWRfcXVlc3RzX2NvdW50E2FjdGl2ZV9xdWVzdHNfY291bnQXdG90YWxfZXhwZXJpZW5jZV9lYXJuZWQTcmVjb3ZlcnlfcHJvb2ZfaGFzaAxxdWVzdF9tYXN0ZXIQZ2FtZV9tYW5hZ2VyX2FwcDEYQAAPJwYyCWcpImcrImcnByJnMRtBAR6CCAQwxtWKBBGo0v4ESmAsAAQSUj3bBNJJOB4EYE3hTQQ3df/oBGb6/p02GgCOCADSAMAAkwBxAFUAMgAXAAIiQzEZFEQxGESIAhZMFkwWUChMULAjQzEZFEQxGEQ2GgEXwByIAepMFkwWUChMULAjQzEZFEQxGEQ2GgEXwBw2GgJXAgCIAZOAAQAiTwJUKExQsCNDMRkURDEYRDYaAReIATpJFRZXBgJMUChMULAjQzEZFEQxGEQ2GgEXNhoCVwIAiAC5SRUWVwYCTFAoTFCwI0MxGRREMRhENhoBVwIANhoCVwIANhoDVwIANhoEVwIANhoFF4gAVhYoTFCwI0MxGRREMRhENhoBF8AyiAAtI0MxGSMSRDEYRIgADSNDMRlA/xwxGBREI0MxACoiZjEAJwQiZjEAJwWAAGaJigEAMQAiJwZlRBJEJweL/2eJigUBMQAiJwZlRBJEIillRCMIKUsBZyIrZUQjCCtMZ0kWi/8WUIAEAVv8PUxQsImKAgEiKWVEi/4PRIv/FUQxAEkiKmNEIwgqTGYxAEkiJwRjRIFkCCcETGaL/hYxAFCABFXurNlMULCAI1F1ZXN0IGNvbXBsZXRlZCEgRWFybmVkIGV4cGVyaWVuY2UuiYoBATEAIipjRESL/xaAD1JFQ09WRVJZX1FVRVNUX0sBUDIHFlBJATEAJwVPAmYxAE8CTFCABP0tNSxMULCJigIBIicHZURJRDINEkSL/iInBWOAAE4CTUmAABJAAAmL/wGLABNBAAMiTImL/icFgABmI0yJigECi/8iKmNEi/8iJwRjRIkiKWVEIitlRIk=", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 9, "patch": 0}}, "desc": "\n    Quest system for AlgoRealm\n    Handles quest creation, completion, and rewards\n    ", "events": [{"args": [{"type": "uint64", "name": "quest_id"}, {"type": "uint64", "name": "experience_reward"}], "name": "QuestCreated", "desc": "ARC-28 event: the quest master added a quest"}, {"args": [{"type": "uint64", "name": "quest_id"}, {"type": "address", "name": "player"}], "name": "QuestCompleted", "desc": "ARC-28 event: a player completed a quest"}, {"args": [{"type": "uint64", "name": "quest_id"}, {"type": "address", "name": "player"}], "name": "RecoveryProofGenerated", "desc": "ARC-28 event: a player generated a single-use recovery proof"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLnF1ZXN0X3N5c3RlbS5BbGdvUmVhbG1RdWVzdFN5c3RlbS5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEKICAgIGJ5dGVjYmxvY2sgMHgxNTFmN2M3NSAidG90YWxfcXVlc3RzIiAiY29tcGxldGVkX3F1ZXN0c19jb3VudCIgImFjdGl2ZV9xdWVzdHNfY291bnQiICJ0b3RhbF9leHBlcmllbmNlX2Vhcm5lZCIgInJlY292ZXJ5X3Byb29mX2hhc2giICJxdWVzdF9tYXN0ZXIiICJnYW1lX21hbmFnZXJfYXBwIgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6NjgKICAgIC8vIHNlbGYucXVlc3RfbWFzdGVyID0gR2xvYmFsU3RhdGUoR2xvYmFsLmNyZWF0b3JfYWRkcmVzcykKICAgIGJ5dGVjIDYgLy8gInF1ZXN0X21hc3RlciIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjY5CiAgICAvLyBzZWxmLnRvdGFsX3F1ZXN0cyA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjXzEgLy8gInRvdGFsX3F1ZXN0cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6NzAKICAgIC8vIHNlbGYuYWN0aXZlX3F1ZXN0c19jb3VudCA9IEdsb2JhbFN0YXRlKFVJbnQ2NCgwKSkKICAgIGJ5dGVjXzMgLy8gImFjdGl2ZV9xdWVzdHNfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjcxLTcyCiAgICAvLyAjIEdhbWUgbWFuYWdlciBhcHAgYWxsb3dlZCB0byBjb25zdW1lIHJlY292ZXJ5IHByb29mcwogICAgLy8gc2VsZi5nYW1lX21hbmFnZXJfYXBwID0gR2xvYmFsU3RhdGUoQXBwbGljYXRpb24oMCkpCiAgICBieXRlYyA3IC8vICJnYW1lX21hbmFnZXJfYXBwIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjYxCiAgICAvLyBjbGFzcyBBbGdvUmVhbG1RdWVzdFN5c3RlbShBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDEzCiAgICBwdXNoYnl0ZXNzIDB4MzBjNmQ1OGEgMHgxMWE4ZDJmZSAweDRhNjAyYzAwIDB4MTI1MjNkZGIgMHhkMjQ5MzgxZSAweDYwNGRlMTRkIDB4Mzc3NWZmZTggMHg2NmZhZmU5ZCAvLyBtZXRob2QgIm9wdF9pbigpdm9pZCIsIG1ldGhvZCAic2V0X2dhbWVfbWFuYWdlcihhcHBsaWNhdGlvbil2b2lkIiwgbWV0aG9kICJjcmVhdGVfcXVlc3Qoc3RyaW5nLHN0cmluZyxzdHJpbmcsc3RyaW5nLHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgImNvbXBsZXRlX3F1ZXN0KHVpbnQ2NCxieXRlW10pc3RyaW5nIiwgbWV0aG9kICJnZW5lcmF0ZV9yZWNvdmVyeV9wcm9vZih1aW50NjQpYnl0ZVtdIiwgbWV0aG9kICJjb25zdW1lX3JlY292ZXJ5X3Byb29mKGFjY291bnQsYnl0ZVtdKWJvb2wiLCBtZXRob2QgImdldF9wbGF5ZXJfcXVlc3Rfc3RhdHMoYWNjb3VudCkodWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImdldF9xdWVzdF9zeXN0ZW1faW5mbygpKHVpbnQ2NCx1aW50NjQpIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9vcHRfaW5fcm91dGVANSBtYWluX3NldF9nYW1lX21hbmFnZXJfcm91dGVANiBtYWluX2NyZWF0ZV9xdWVzdF9yb3V0ZUA3IG1haW5fY29tcGxldGVfcXVlc3Rfcm91dGVAOCBtYWluX2dlbmVyYXRlX3JlY292ZXJ5X3Byb29mX3JvdXRlQDkgbWFpbl9jb25zdW1lX3JlY292ZXJ5X3Byb29mX3JvdXRlQDEwIG1haW5fZ2V0X3BsYXllcl9xdWVzdF9zdGF0c19yb3V0ZUAxMSBtYWluX2dldF9xdWVzdF9zeXN0ZW1faW5mb19yb3V0ZUAxMgoKbWFpbl9hZnRlcl9pZl9lbHNlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6NjEKICAgIC8vIGNsYXNzIEFsZ29SZWFsbVF1ZXN0U3lzdGVtKEFSQzRDb250cmFjdCk6CiAgICBpbnRjXzAgLy8gMAogICAgcmV0dXJuCgptYWluX2dldF9xdWVzdF9zeXN0ZW1faW5mb19yb3V0ZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjE4NwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9xdWVzdF9zeXN0ZW1faW5mbwogICAgc3dhcAogICAgaXRvYgogICAgc3dhcAogICAgaXRvYgogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9wbGF5ZXJfcXVlc3Rfc3RhdHNfcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weToxNzkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6NjEKICAgIC8vIGNsYXNzIEFsZ29SZWFsbVF1ZXN0U3lzdGVtKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6MTc5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9wbGF5ZXJfcXVlc3Rfc3RhdHMKICAgIHN3YXAKICAgIGl0b2IKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jb25zdW1lX3JlY292ZXJ5X3Byb29mX3JvdXRlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6MTYwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6NjEKICAgIC8vIGNsYXNzIEFsZ29SZWFsbVF1ZXN0U3lzdGVtKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjE2MAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNvbnN1bWVfcmVjb3ZlcnlfcHJvb2YKICAgIHB1c2hieXRlcyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2VuZXJhdGVfcmVjb3ZlcnlfcHJvb2Zfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjEzOAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjYxCiAgICAvLyBjbGFzcyBBbGdvUmVhbG1RdWVzdFN5c3RlbShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6MTM4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgZ2VuZXJhdGVfcmVjb3ZlcnlfcHJvb2YKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NvbXBsZXRlX3F1ZXN0X3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weToxMTkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weTo2MQogICAgLy8gY2xhc3MgQWxnb1JlYWxtUXVlc3RTeXN0ZW0oQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weToxMTkKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjb21wbGV0ZV9xdWVzdAogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX3F1ZXN0X3JvdXRlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weTo5NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjYxCiAgICAvLyBjbGFzcyBBbGdvUmVhbG1RdWVzdFN5c3RlbShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5Ojk0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX3F1ZXN0CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3NldF9nYW1lX21hbmFnZXJfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5Ojg2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6NjEKICAgIC8vIGNsYXNzIEFsZ29SZWFsbVF1ZXN0U3lzdGVtKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBcHBsaWNhdGlvbnMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5Ojg2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgc2V0X2dhbWVfbWFuYWdlcgogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9vcHRfaW5fcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5Ojc5CiAgICAvLyBAYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJPcHRJbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgaW50Y18xIC8vIE9wdEluCiAgICA9PQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgT3B0SW4KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBvcHRfaW4KICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6NjEKICAgIC8vIGNsYXNzIEFsZ29SZWFsbVF1ZXN0U3lzdGVtKEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDE1CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hbGdvcmVhbG0ucXVlc3Rfc3lzdGVtLkFsZ29SZWFsbVF1ZXN0U3lzdGVtLm9wdF9pbigpIC0+IHZvaWQ6Cm9wdF9pbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjgyCiAgICAvLyBzZWxmLmNvbXBsZXRlZF9xdWVzdHNfY291bnRbVHhuLnNlbmRlcl0gPSBVSW50NjQoMCkKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjXzIgLy8gImNvbXBsZXRlZF9xdWVzdHNfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6ODMKICAgIC8vIHNlbGYudG90YWxfZXhwZXJpZW5jZV9lYXJuZWRbVHhuLnNlbmRlcl0gPSBVSW50NjQoMCkKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjIDQgLy8gInRvdGFsX2V4cGVyaWVuY2VfZWFybmVkIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5Ojg0CiAgICAvLyBzZWxmLnJlY292ZXJ5X3Byb29mX2hhc2hbVHhuLnNlbmRlcl0gPSBCeXRlcygpCiAgICB0eG4gU2VuZGVyCiAgICBieXRlYyA1IC8vICJyZWNvdmVyeV9wcm9vZl9oYXNoIgogICAgcHVzaGJ5dGVzIDB4CiAgICBhcHBfbG9jYWxfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLnF1ZXN0X3N5c3RlbS5BbGdvUmVhbG1RdWVzdFN5c3RlbS5zZXRfZ2FtZV9tYW5hZ2VyKGdhbWVfbWFuYWdlcjogdWludDY0KSAtPiB2b2lkOgpzZXRfZ2FtZV9tYW5hZ2VyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6ODYtODcKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHNldF9nYW1lX21hbmFnZXIoc2VsZiwgZ2FtZV9tYW5hZ2VyOiBBcHBsaWNhdGlvbikgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6OTAKICAgIC8vIFR4bi5zZW5kZXIgPT0gc2VsZi5xdWVzdF9tYXN0ZXIudmFsdWUKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJxdWVzdF9tYXN0ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucXVlc3RfbWFzdGVyIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5Ojg5LTkxCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIFR4bi5zZW5kZXIgPT0gc2VsZi5xdWVzdF9tYXN0ZXIudmFsdWUKICAgIC8vICksICJPbmx5IHF1ZXN0IG1hc3RlciBjYW4gbGluayB0aGUgZ2FtZSBtYW5hZ2VyIgogICAgYXNzZXJ0IC8vIE9ubHkgcXVlc3QgbWFzdGVyIGNhbiBsaW5rIHRoZSBnYW1lIG1hbmFnZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjkyCiAgICAvLyBzZWxmLmdhbWVfbWFuYWdlcl9hcHAudmFsdWUgPSBnYW1lX21hbmFnZXIKICAgIGJ5dGVjIDcgLy8gImdhbWVfbWFuYWdlcl9hcHAiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLnF1ZXN0X3N5c3RlbS5BbGdvUmVhbG1RdWVzdFN5c3RlbS5jcmVhdGVfcXVlc3QobmFtZTogYnl0ZXMsIGRlc2NyaXB0aW9uOiBieXRlcywgcmV3YXJkX2l0ZW1fdHlwZTogYnl0ZXMsIHJld2FyZF9yYXJpdHk6IGJ5dGVzLCBleHBlcmllbmNlX3Jld2FyZDogdWludDY0KSAtPiB1aW50NjQ6CmNyZWF0ZV9xdWVzdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5Ojk0LTEwMgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY3JlYXRlX3F1ZXN0KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgbmFtZTogU3RyaW5nLAogICAgLy8gICAgIGRlc2NyaXB0aW9uOiBTdHJpbmcsCiAgICAvLyAgICAgcmV3YXJkX2l0ZW1fdHlwZTogU3RyaW5nLAogICAgLy8gICAgIHJld2FyZF9yYXJpdHk6IFN0cmluZywKICAgIC8vICAgICBleHBlcmllbmNlX3Jld2FyZDogVUludDY0LAogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byA1IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjEwNQogICAgLy8gVHhuLnNlbmRlciA9PSBzZWxmLnF1ZXN0X21hc3Rlci52YWx1ZQogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gInF1ZXN0X21hc3RlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5xdWVzdF9tYXN0ZXIgZXhpc3RzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6MTA0LTEwNgogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBUeG4uc2VuZGVyID09IHNlbGYucXVlc3RfbWFzdGVyLnZhbHVlCiAgICAvLyApLCAiT25seSBxdWVzdCBtYXN0ZXIgY2FuIGNyZWF0ZSBxdWVzdHMiCiAgICBhc3NlcnQgLy8gT25seSBxdWVzdCBtYXN0ZXIgY2FuIGNyZWF0ZSBxdWVzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjEwOAogICAgLy8gcXVlc3RfaWQgPSBzZWxmLnRvdGFsX3F1ZXN0cy52YWx1ZSArIDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJ0b3RhbF9xdWVzdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfcXVlc3RzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjExMwogICAgLy8gc2VsZi50b3RhbF9xdWVzdHMudmFsdWUgPSBxdWVzdF9pZAogICAgYnl0ZWNfMSAvLyAidG90YWxfcXVlc3RzIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weToxMTQKICAgIC8vIHNlbGYuYWN0aXZlX3F1ZXN0c19jb3VudC52YWx1ZSArPSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiYWN0aXZlX3F1ZXN0c19jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY3RpdmVfcXVlc3RzX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzMgLy8gImFjdGl2ZV9xdWVzdHNfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6MTE2CiAgICAvLyBhcmM0LmVtaXQoUXVlc3RDcmVhdGVkKGFyYzQuVUludDY0KHF1ZXN0X2lkKSwgYXJjNC5VSW50NjQoZXhwZXJpZW5jZV9yZXdhcmQpKSkKICAgIGR1cAogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAxNWJmYzNkIC8vIG1ldGhvZCAiUXVlc3RDcmVhdGVkKHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjExNwogICAgLy8gcmV0dXJuIHF1ZXN0X2lkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLnF1ZXN0X3N5c3RlbS5BbGdvUmVhbG1RdWVzdFN5c3RlbS5jb21wbGV0ZV9xdWVzdChxdWVzdF9pZDogdWludDY0LCBjb21wbGV0aW9uX3Byb29mOiBieXRlcykgLT4gYnl0ZXM6CmNvbXBsZXRlX3F1ZXN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6MTE5LTEyMAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY29tcGxldGVfcXVlc3Qoc2VsZiwgcXVlc3RfaWQ6IFVJbnQ2NCwgY29tcGxldGlvbl9wcm9vZjogQnl0ZXMpIC0+IFN0cmluZzoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6MTI1CiAgICAvLyBhc3NlcnQgcXVlc3RfaWQgPD0gc2VsZi50b3RhbF9xdWVzdHMudmFsdWUsICJRdWVzdCBkb2VzIG5vdCBleGlzdCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJ0b3RhbF9xdWVzdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfcXVlc3RzIGV4aXN0cwogICAgZnJhbWVfZGlnIC0yCiAgICA+PQogICAgYXNzZXJ0IC8vIFF1ZXN0IGRvZXMgbm90IGV4aXN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weToxMjYKICAgIC8vIGFzc2VydCBjb21wbGV0aW9uX3Byb29mLmxlbmd0aCA+IDAsICJNdXN0IHByb3ZpZGUgY29tcGxldGlvbiBwcm9vZiIKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBhc3NlcnQgLy8gTXVzdCBwcm92aWRlIGNvbXBsZXRpb24gcHJvb2YKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjEzMS0xMzIKICAgIC8vICMgVXBkYXRlIHBsYXllciBwcm9ncmVzcwogICAgLy8gc2VsZi5jb21wbGV0ZWRfcXVlc3RzX2NvdW50W1R4bi5zZW5kZXJdICs9IDEKICAgIHR4biBTZW5kZXIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNvbXBsZXRlZF9xdWVzdHNfY291bnQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb21wbGV0ZWRfcXVlc3RzX2NvdW50IGV4aXN0cyBmb3IgYWNjb3VudAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjXzIgLy8gImNvbXBsZXRlZF9xdWVzdHNfY291bnQiCiAgICBzd2FwCiAgICBhcHBfbG9jYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weToxMzMKICAgIC8vIHNlbGYudG90YWxfZXhwZXJpZW5jZV9lYXJuZWRbVHhuLnNlbmRlcl0gKz0gVUludDY0KDEwMCkgICMgQmFzZSByZXdhcmQKICAgIHR4biBTZW5kZXIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInRvdGFsX2V4cGVyaWVuY2VfZWFybmVkIgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfZXhwZXJpZW5jZV9lYXJuZWQgZXhpc3RzIGZvciBhY2NvdW50CiAgICBwdXNoaW50IDEwMCAvLyAxMDAKICAgICsKICAgIGJ5dGVjIDQgLy8gInRvdGFsX2V4cGVyaWVuY2VfZWFybmVkIgogICAgc3dhcAogICAgYXBwX2xvY2FsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6MTM1CiAgICAvLyBhcmM0LmVtaXQoUXVlc3RDb21wbGV0ZWQoYXJjNC5VSW50NjQocXVlc3RfaWQpLCBBZGRyZXNzKFR4bi5zZW5kZXIpKSkKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHg1NWVlYWNkOSAvLyBtZXRob2QgIlF1ZXN0Q29tcGxldGVkKHVpbnQ2NCxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weToxMzYKICAgIC8vIHJldHVybiBTdHJpbmcoIlF1ZXN0IGNvbXBsZXRlZCEgRWFybmVkIGV4cGVyaWVuY2UuIikKICAgIHB1c2hieXRlcyAiUXVlc3QgY29tcGxldGVkISBFYXJuZWQgZXhwZXJpZW5jZS4iCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLnF1ZXN0X3N5c3RlbS5BbGdvUmVhbG1RdWVzdFN5c3RlbS5nZW5lcmF0ZV9yZWNvdmVyeV9wcm9vZihxdWVzdF9pZDogdWludDY0KSAtPiBieXRlczoKZ2VuZXJhdGVfcmVjb3ZlcnlfcHJvb2Y6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weToxMzgtMTM5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBnZW5lcmF0ZV9yZWNvdmVyeV9wcm9vZihzZWxmLCBxdWVzdF9pZDogVUludDY0KSAtPiBCeXRlczoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6MTQ1CiAgICAvLyBzZWxmLmNvbXBsZXRlZF9xdWVzdHNfY291bnRbVHhuLnNlbmRlcl0gPiAwCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiY29tcGxldGVkX3F1ZXN0c19jb3VudCIKICAgIGFwcF9sb2NhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbXBsZXRlZF9xdWVzdHNfY291bnQgZXhpc3RzIGZvciBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weToxNDQtMTQ2CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHNlbGYuY29tcGxldGVkX3F1ZXN0c19jb3VudFtUeG4uc2VuZGVyXSA+IDAKICAgIC8vICksICJNdXN0IGNvbXBsZXRlIGF0IGxlYXN0IG9uZSBxdWVzdCIKICAgIGFzc2VydCAvLyBNdXN0IGNvbXBsZXRlIGF0IGxlYXN0IG9uZSBxdWVzdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6MTUxCiAgICAvLyArIG9wLml0b2IocXVlc3RfaWQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjE1MAogICAgLy8gQnl0ZXMoYiJSRUNPVkVSWV9RVUVTVF8iKQogICAgcHVzaGJ5dGVzIDB4NTI0NTQzNGY1NjQ1NTI1OTVmNTE1NTQ1NTM1NDVmCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weToxNTAtMTUxCiAgICAvLyBCeXRlcyhiIlJFQ09WRVJZX1FVRVNUXyIpCiAgICAvLyArIG9wLml0b2IocXVlc3RfaWQpCiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weToxNTIKICAgIC8vICsgb3AuaXRvYihHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCkKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjE1MC0xNTIKICAgIC8vIEJ5dGVzKGIiUkVDT1ZFUllfUVVFU1RfIikKICAgIC8vICsgb3AuaXRvYihxdWVzdF9pZCkKICAgIC8vICsgb3AuaXRvYihHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6MTU0LTE1NQogICAgLy8gIyBSZW1lbWJlciB0aGUgcHJvb2Ygc28gdGhlIGdhbWUgbWFuYWdlciBjYW4gdmVyaWZ5IGl0IGV4YWN0bHkgb25jZQogICAgLy8gc2VsZi5yZWNvdmVyeV9wcm9vZl9oYXNoW1R4bi5zZW5kZXJdID0gb3Auc2hhMjU2KHByb29mKQogICAgZHVwCiAgICBzaGEyNTYKICAgIHR4biBTZW5kZXIKICAgIGJ5dGVjIDUgLy8gInJlY292ZXJ5X3Byb29mX2hhc2giCiAgICB1bmNvdmVyIDIKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjE1NwogICAgLy8gYXJjNC5lbWl0KFJlY292ZXJ5UHJvb2ZHZW5lcmF0ZWQoYXJjNC5VSW50NjQocXVlc3RfaWQpLCBBZGRyZXNzKFR4bi5zZW5kZXIpKSkKICAgIHR4biBTZW5kZXIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHhmZDJkMzUyYyAvLyBtZXRob2QgIlJlY292ZXJ5UHJvb2ZHZW5lcmF0ZWQodWludDY0LGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjE1OAogICAgLy8gcmV0dXJuIHByb29mCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLnF1ZXN0X3N5c3RlbS5BbGdvUmVhbG1RdWVzdFN5c3RlbS5jb25zdW1lX3JlY292ZXJ5X3Byb29mKHBsYXllcjogYnl0ZXMsIHByb29mOiBieXRlcykgLT4gdWludDY0Ogpjb25zdW1lX3JlY292ZXJ5X3Byb29mOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6MTYwLTE2MQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY29uc3VtZV9yZWNvdmVyeV9wcm9vZihzZWxmLCBwbGF5ZXI6IEFjY291bnQsIHByb29mOiBCeXRlcykgLT4gYm9vbDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6MTY2LTE2NwogICAgLy8gIyBUb3AtbGV2ZWwgY2FsbHMgaGF2ZSBjYWxsZXIgSUQgMCwgc28gYW4gdW5zZXQgbGluayBtdXN0IG5vdCBtYXRjaCB0aGVtCiAgICAvLyBhc3NlcnQgc2VsZi5nYW1lX21hbmFnZXJfYXBwLnZhbHVlLmlkICE9IDAsICJHYW1lIG1hbmFnZXIgbm90IGxpbmtlZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJnYW1lX21hbmFnZXJfYXBwIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmdhbWVfbWFuYWdlcl9hcHAgZXhpc3RzCiAgICBkdXAKICAgIGFzc2VydCAvLyBHYW1lIG1hbmFnZXIgbm90IGxpbmtlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6MTY5CiAgICAvLyBHbG9iYWwuY2FsbGVyX2FwcGxpY2F0aW9uX2lkID09IHNlbGYuZ2FtZV9tYW5hZ2VyX2FwcC52YWx1ZS5pZAogICAgZ2xvYmFsIENhbGxlckFwcGxpY2F0aW9uSUQKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weToxNjgtMTcwCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIEdsb2JhbC5jYWxsZXJfYXBwbGljYXRpb25faWQgPT0gc2VsZi5nYW1lX21hbmFnZXJfYXBwLnZhbHVlLmlkCiAgICAvLyApLCAiT25seSB0aGUgZ2FtZSBtYW5hZ2VyIGNhbiBjb25zdW1lIHJlY292ZXJ5IHByb29mcyIKICAgIGFzc2VydCAvLyBPbmx5IHRoZSBnYW1lIG1hbmFnZXIgY2FuIGNvbnN1bWUgcmVjb3ZlcnkgcHJvb2ZzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weToxNzIKICAgIC8vIGV4cGVjdGVkX2hhc2ggPSBzZWxmLnJlY292ZXJ5X3Byb29mX2hhc2guZ2V0KHBsYXllciwgQnl0ZXMoKSkKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInJlY292ZXJ5X3Byb29mX2hhc2giCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBwdXNoYnl0ZXMgMHgKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWxnb3JlYWxtL3F1ZXN0X3N5c3RlbS5weToxNzMKICAgIC8vIGlmIGV4cGVjdGVkX2hhc2ggPT0gQnl0ZXMoKSBvciBleHBlY3RlZF9oYXNoICE9IG9wLnNoYTI1Nihwcm9vZik6CiAgICBwdXNoYnl0ZXMgMHgKICAgID09CiAgICBibnogY29uc3VtZV9yZWNvdmVyeV9wcm9vZl9pZl9ib2R5QDIKICAgIGZyYW1lX2RpZyAtMQogICAgc2hhMjU2CiAgICBmcmFtZV9kaWcgMAogICAgIT0KICAgIGJ6IGNvbnN1bWVfcmVjb3ZlcnlfcHJvb2ZfYWZ0ZXJfaWZfZWxzZUAzCgpjb25zdW1lX3JlY292ZXJ5X3Byb29mX2lmX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjE3NAogICAgLy8gcmV0dXJuIEZhbHNlCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgcmV0c3ViCgpjb25zdW1lX3JlY292ZXJ5X3Byb29mX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjE3NgogICAgLy8gc2VsZi5yZWNvdmVyeV9wcm9vZl9oYXNoW3BsYXllcl0gPSBCeXRlcygpCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ5dGVjIDUgLy8gInJlY292ZXJ5X3Byb29mX2hhc2giCiAgICBwdXNoYnl0ZXMgMHgKICAgIGFwcF9sb2NhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjE3NwogICAgLy8gcmV0dXJuIFRydWUKICAgIGludGNfMSAvLyAxCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWxnb3JlYWxtLnF1ZXN0X3N5c3RlbS5BbGdvUmVhbG1RdWVzdFN5c3RlbS5nZXRfcGxheWVyX3F1ZXN0X3N0YXRzKHBsYXllcjogYnl0ZXMpIC0+IHVpbnQ2NCwgdWludDY0OgpnZXRfcGxheWVyX3F1ZXN0X3N0YXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2FsZ29yZWFsbS9xdWVzdF9zeXN0ZW0ucHk6MTc5LTE4MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9wbGF5ZXJfcXVlc3Rfc3RhdHMoc2VsZiwgcGxheWVyOiBBY2NvdW50KSAtPiB0dXBsZVtVSW50NjQsIFVJbnQ2NF06CiAgICBwcm90byAxIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjE4MwogICAgLy8gc2VsZi5jb21wbGV0ZWRfcXVlc3RzX2NvdW50W3BsYXllcl0sCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjb21wbGV0ZWRfcXVlc3RzX2NvdW50IgogICAgYXBwX2xvY2FsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29tcGxldGVkX3F1ZXN0c19jb3VudCBleGlzdHMgZm9yIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjE4NAogICAgLy8gc2VsZi50b3RhbF9leHBlcmllbmNlX2Vhcm5lZFtwbGF5ZXJdLAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAidG90YWxfZXhwZXJpZW5jZV9lYXJuZWQiCiAgICBhcHBfbG9jYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9leHBlcmllbmNlX2Vhcm5lZCBleGlzdHMgZm9yIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjE4Mi0xODUKICAgIC8vIHJldHVybiAoCiAgICAvLyAgICAgc2VsZi5jb21wbGV0ZWRfcXVlc3RzX2NvdW50W3BsYXllcl0sCiAgICAvLyAgICAgc2VsZi50b3RhbF9leHBlcmllbmNlX2Vhcm5lZFtwbGF5ZXJdLAogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFsZ29yZWFsbS5xdWVzdF9zeXN0ZW0uQWxnb1JlYWxtUXVlc3RTeXN0ZW0uZ2V0X3F1ZXN0X3N5c3RlbV9pbmZvKCkgLT4gdWludDY0LCB1aW50NjQ6CmdldF9xdWVzdF9zeXN0ZW1faW5mbzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hbGdvcmVhbG0vcXVlc3Rfc3lzdGVtLnB5OjE5MAogICAgLy8gcmV0dXJuIChzZWxmLnRvdGFsX3F1ZXN0cy52YWx1ZSwgc2VsZi5hY3RpdmVfcXVlc3RzX2NvdW50LnZhbHVlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInRvdGFsX3F1ZXN0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9xdWVzdHMgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiYWN0aXZlX3F1ZXN0c19jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hY3RpdmVfcXVlc3RzX2NvdW50IGV4aXN0cwogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [714], "errorMessage": "Game manager not linked"}, {"pc": [652], "errorMessage": "Must complete at least one quest"}, {"pc": [562], "errorMessage": "Must provide completion proof"}, {"pc": [235, 256, 283, 318, 346, 380, 425], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [444], "errorMessage": "OnCompletion is not OptIn"}, {"pc": [512], "errorMessage": "Only quest master can create quests"}, {"pc": [494], "errorMessage": "Only quest master can link the game manager"}, {"pc": [718], "errorMessage": "Only the game manager can consume recovery proofs"}, {"pc": [558], "errorMessage": "Quest does not exist"}, {"pc": [461], "errorMessage": "can only call when creating"}, {"pc": [238, 259, 286, 321, 349, 383, 428, 447], "errorMessage": "can only call when not creating"}, {"pc": [526, 783], "errorMessage": "check self.active_quests_count exists"}, {"pc": [569, 651, 767], "errorMessage": "check self.completed_quests_count exists for account"}, {"pc": [712], "errorMessage": "check self.game_manager_app exists"}, {"pc": [492, 510], "errorMessage": "check self.quest_master exists"}, {"pc": [582, 774], "errorMessage": "check self.total_experience_earned exists for account"}, {"pc": [516, 554, 779], "errorMessage": "check self.total_quests exists"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetGameManagerArgs:
+    """Dataclass for set_game_manager arguments"""
+    game_manager: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_game_manager(application)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateQuestArgs:
+    """Dataclass for create_quest arguments"""
+    name: str
+    description: str
+    reward_item_type: str
+    reward_rarity: str
+    experience_reward: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_quest(string,string,string,string,uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CompleteQuestArgs:
+    """Dataclass for complete_quest arguments"""
+    quest_id: int
+    completion_proof: bytes | str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "complete_quest(uint64,byte[])string"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GenerateRecoveryProofArgs:
+    """Dataclass for generate_recovery_proof arguments"""
+    quest_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "generate_recovery_proof(uint64)byte[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ConsumeRecoveryProofArgs:
+    """Dataclass for consume_recovery_proof arguments"""
+    player: str | bytes
+    proof: bytes | str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "consume_recovery_proof(account,byte[])bool"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetPlayerQuestStatsArgs:
+    """Dataclass for get_player_quest_stats arguments"""
+    player: str | bytes
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_player_quest_stats(account)(uint64,uint64)"
+
+
+class _AlgoRealmQuestSystemOptIn:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "opt_in()void",
+        }))
+
+
+class AlgoRealmQuestSystemParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_AlgoRealmQuestSystemOptIn":
+        return _AlgoRealmQuestSystemOptIn(self.app_client)
+
+    def set_game_manager(
+        self,
+        args: tuple[int] | SetGameManagerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_game_manager(application)void",
+            "args": method_args,
+        }))
+
+    def create_quest(
+        self,
+        args: tuple[str, str, str, str, int] | CreateQuestArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_quest(string,string,string,string,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def complete_quest(
+        self,
+        args: tuple[int, bytes | str] | CompleteQuestArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "complete_quest(uint64,byte[])string",
+            "args": method_args,
+        }))
+
+    def generate_recovery_proof(
+        self,
+        args: tuple[int] | GenerateRecoveryProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "generate_recovery_proof(uint64)byte[]",
+            "args": method_args,
+        }))
+
+    def consume_recovery_proof(
+        self,
+        args: tuple[str | bytes, bytes | str] | ConsumeRecoveryProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "consume_recovery_proof(account,byte[])bool",
+            "args": method_args,
+        }))
+
+    def get_player_quest_stats(
+        self,
+        args: tuple[str | bytes] | GetPlayerQuestStatsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_player_quest_stats(account)(uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_quest_system_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_quest_system_info()(uint64,uint64)",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class _AlgoRealmQuestSystemOptInTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "opt_in()void",
+        }))
+
+
+class AlgoRealmQuestSystemCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_AlgoRealmQuestSystemOptInTransaction":
+        return _AlgoRealmQuestSystemOptInTransaction(self.app_client)
+
+    def set_game_manager(
+        self,
+        args: tuple[int] | SetGameManagerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_game_manager(application)void",
+            "args": method_args,
+        }))
+
+    def create_quest(
+        self,
+        args: tuple[str, str, str, str, int] | CreateQuestArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_quest(string,string,string,string,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def complete_quest(
+        self,
+        args: tuple[int, bytes | str] | CompleteQuestArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "complete_quest(uint64,byte[])string",
+            "args": method_args,
+        }))
+
+    def generate_recovery_proof(
+        self,
+        args: tuple[int] | GenerateRecoveryProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "generate_recovery_proof(uint64)byte[]",
+            "args": method_args,
+        }))
+
+    def consume_recovery_proof(
+        self,
+        args: tuple[str | bytes, bytes | str] | ConsumeRecoveryProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "consume_recovery_proof(account,byte[])bool",
+            "args": method_args,
+        }))
+
+    def get_player_quest_stats(
+        self,
+        args: tuple[str | bytes] | GetPlayerQuestStatsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_player_quest_stats(account)(uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_quest_system_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_quest_system_info()(uint64,uint64)",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class _AlgoRealmQuestSystemOptInSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.opt_in(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "opt_in()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+
+class AlgoRealmQuestSystemSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def opt_in(self) -> "_AlgoRealmQuestSystemOptInSend":
+        return _AlgoRealmQuestSystemOptInSend(self.app_client)
+
+    def set_game_manager(
+        self,
+        args: tuple[int] | SetGameManagerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_game_manager(application)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def create_quest(
+        self,
+        args: tuple[str, str, str, str, int] | CreateQuestArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_quest(string,string,string,string,uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def complete_quest(
+        self,
+        args: tuple[int, bytes | str] | CompleteQuestArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[str]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "complete_quest(uint64,byte[])string",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+
+    def generate_recovery_proof(
+        self,
+        args: tuple[int] | GenerateRecoveryProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bytes]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "generate_recovery_proof(uint64)byte[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bytes], parsed_response)
+
+    def consume_recovery_proof(
+        self,
+        args: tuple[str | bytes, bytes | str] | ConsumeRecoveryProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bool]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "consume_recovery_proof(account,byte[])bool",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bool], parsed_response)
+
+    def get_player_quest_stats(
+        self,
+        args: tuple[str | bytes] | GetPlayerQuestStatsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[tuple[int, int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_player_quest_stats(account)(uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[int, int]], parsed_response)
+
+    def get_quest_system_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[tuple[int, int]]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_quest_system_info()(uint64,uint64)",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[int, int]], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    quest_master: str
+    total_quests: int
+    active_quests_count: int
+    game_manager_app: int
+
+class LocalStateValue(typing.TypedDict):
+    """Shape of local_state state key values"""
+    completed_quests_count: int
+    total_experience_earned: int
+    recovery_proof_hash: bytes
+
+class AlgoRealmQuestSystemState:
+    """Methods to access state for the current AlgoRealmQuestSystem app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    def local_state(
+        self, address: str
+    ) -> "_LocalState":
+            """Methods to access local_state for the current app"""
+            return _LocalState(self.app_client, address)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def quest_master(self) -> str:
+        """Get the current value of the quest_master key in global_state state"""
+        value = self.app_client.state.global_state.get_value("quest_master")
+        if isinstance(value, dict) and "address" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
+        return typing.cast(str, value)
+
+    @property
+    def total_quests(self) -> int:
+        """Get the current value of the total_quests key in global_state state"""
+        value = self.app_client.state.global_state.get_value("total_quests")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def active_quests_count(self) -> int:
+        """Get the current value of the active_quests_count key in global_state state"""
+        value = self.app_client.state.global_state.get_value("active_quests_count")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def game_manager_app(self) -> int:
+        """Get the current value of the game_manager_app key in global_state state"""
+        value = self.app_client.state.global_state.get_value("game_manager_app")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _LocalState:
+    def __init__(self, app_client: algokit_utils.AppClient, address: str):
+        self.app_client = app_client
+        self.address = address
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> LocalStateValue:
+        """Get all current keyed values from local_state state"""
+        result = self.app_client.state.local_state(self.address).get_all()
+        if not result:
+            return typing.cast(LocalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.local_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(LocalStateValue, converted)
+
+    @property
+    def completed_quests_count(self) -> int:
+        """Get the current value of the completed_quests_count key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("completed_quests_count")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def total_experience_earned(self) -> int:
+        """Get the current value of the total_experience_earned key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("total_experience_earned")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def recovery_proof_hash(self) -> bytes:
+        """Get the current value of the recovery_proof_hash key in local_state state"""
+        value = self.app_client.state.local_state(self.address).get_value("recovery_proof_hash")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
+
+class AlgoRealmQuestSystemClient:
+    """Client for interacting with AlgoRealmQuestSystem smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = AlgoRealmQuestSystemParams(self.app_client)
+        self.create_transaction = AlgoRealmQuestSystemCreateTransactionParams(self.app_client)
+        self.send = AlgoRealmQuestSystemSend(self.app_client)
+        self.state = AlgoRealmQuestSystemState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "AlgoRealmQuestSystemClient":
+        return AlgoRealmQuestSystemClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AlgoRealmQuestSystemClient":
+        return AlgoRealmQuestSystemClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "AlgoRealmQuestSystemClient":
+        return AlgoRealmQuestSystemClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "AlgoRealmQuestSystemComposer":
+        return AlgoRealmQuestSystemComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_game_manager(application)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_quest(string,string,string,string,uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["complete_quest(uint64,byte[])string"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> str | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["generate_recovery_proof(uint64)byte[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bytes | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["consume_recovery_proof(account,byte[])bool"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bool | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_player_quest_stats(account)(uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> tuple[int, int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_quest_system_info()(uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> tuple[int, int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["opt_in()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | bool | bytes | int | str | tuple[int, int]:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class AlgoRealmQuestSystemBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating AlgoRealmQuestSystem contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class AlgoRealmQuestSystemFactory(algokit_utils.TypedAppFactoryProtocol[AlgoRealmQuestSystemBareCallCreateParams, None, None]):
+    """Factory for deploying and managing AlgoRealmQuestSystemClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = AlgoRealmQuestSystemFactoryParams(self.app_factory)
+        self.create_transaction = AlgoRealmQuestSystemFactoryCreateTransaction(self.app_factory)
+        self.send = AlgoRealmQuestSystemFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: AlgoRealmQuestSystemBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[AlgoRealmQuestSystemClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return AlgoRealmQuestSystemClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AlgoRealmQuestSystemClient:
+        """Get an app client by creator address and name"""
+        return AlgoRealmQuestSystemClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> AlgoRealmQuestSystemClient:
+        """Get an app client by app ID"""
+        return AlgoRealmQuestSystemClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class AlgoRealmQuestSystemFactoryParams:
+    """Parameters for creating transactions for AlgoRealmQuestSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AlgoRealmQuestSystemFactoryCreateParams(app_factory)
+        self.update = AlgoRealmQuestSystemFactoryUpdateParams(app_factory)
+        self.delete = AlgoRealmQuestSystemFactoryDeleteParams(app_factory)
+
+class AlgoRealmQuestSystemFactoryCreateParams:
+    """Parameters for 'create' operations of AlgoRealmQuestSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def set_game_manager(
+        self,
+        args: tuple[int] | SetGameManagerArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_game_manager(application)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_game_manager(application)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def create_quest(
+        self,
+        args: tuple[str, str, str, str, int] | CreateQuestArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_quest(string,string,string,string,uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_quest(string,string,string,string,uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def complete_quest(
+        self,
+        args: tuple[int, bytes | str] | CompleteQuestArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the complete_quest(uint64,byte[])string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "complete_quest(uint64,byte[])string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def generate_recovery_proof(
+        self,
+        args: tuple[int] | GenerateRecoveryProofArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the generate_recovery_proof(uint64)byte[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "generate_recovery_proof(uint64)byte[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def consume_recovery_proof(
+        self,
+        args: tuple[str | bytes, bytes | str] | ConsumeRecoveryProofArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the consume_recovery_proof(account,byte[])bool ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "consume_recovery_proof(account,byte[])bool",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_player_quest_stats(
+        self,
+        args: tuple[str | bytes] | GetPlayerQuestStatsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_player_quest_stats(account)(uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_player_quest_stats(account)(uint64,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_quest_system_info(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_quest_system_info()(uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_quest_system_info()(uint64,uint64)",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def opt_in(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the opt_in()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "opt_in()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class AlgoRealmQuestSystemFactoryUpdateParams:
+    """Parameters for 'update' operations of AlgoRealmQuestSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class AlgoRealmQuestSystemFactoryDeleteParams:
+    """Parameters for 'delete' operations of AlgoRealmQuestSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class AlgoRealmQuestSystemFactoryCreateTransaction:
+    """Create transactions for AlgoRealmQuestSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AlgoRealmQuestSystemFactoryCreateTransactionCreate(app_factory)
+
+
+class AlgoRealmQuestSystemFactoryCreateTransactionCreate:
+    """Create new instances of AlgoRealmQuestSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class AlgoRealmQuestSystemFactorySend:
+    """Send calls to AlgoRealmQuestSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = AlgoRealmQuestSystemFactorySendCreate(app_factory)
+
+
+class AlgoRealmQuestSystemFactorySendCreate:
+    """Send create calls to AlgoRealmQuestSystem contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[AlgoRealmQuestSystemClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return AlgoRealmQuestSystemClient(result[0]), result[1]
+
+
+class _AlgoRealmQuestSystemOptInComposer:
+    def __init__(self, composer: "AlgoRealmQuestSystemComposer"):
+        self.composer = composer
+    def opt_in(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmQuestSystemComposer":
+        self.composer._composer.add_app_call_method_call(
+            self.composer.client.params.opt_in.opt_in(
+                
+                params=params,
+                
+            )
+        )
+        self.composer._result_mappers.append(
+            lambda v: self.composer.client.decode_return_value(
+                "opt_in()void", v
+            )
+        )
+        return self.composer
+
+
+class AlgoRealmQuestSystemComposer:
+    """Composer for creating transaction groups for AlgoRealmQuestSystem contract calls"""
+
+    def __init__(self, client: "AlgoRealmQuestSystemClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    @property
+    def opt_in(self) -> "_AlgoRealmQuestSystemOptInComposer":
+        return _AlgoRealmQuestSystemOptInComposer(self)
+
+    def set_game_manager(
+        self,
+        args: tuple[int] | SetGameManagerArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmQuestSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_game_manager(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_game_manager(application)void", v
+            )
+        )
+        return self
+
+    def create_quest(
+        self,
+        args: tuple[str, str, str, str, int] | CreateQuestArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmQuestSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_quest(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_quest(string,string,string,string,uint64)uint64", v
+            )
+        )
+        return self
+
+    def complete_quest(
+        self,
+        args: tuple[int, bytes | str] | CompleteQuestArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmQuestSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.complete_quest(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "complete_quest(uint64,byte[])string", v
+            )
+        )
+        return self
+
+    def generate_recovery_proof(
+        self,
+        args: tuple[int] | GenerateRecoveryProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmQuestSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.generate_recovery_proof(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "generate_recovery_proof(uint64)byte[]", v
+            )
+        )
+        return self
+
+    def consume_recovery_proof(
+        self,
+        args: tuple[str | bytes, bytes | str] | ConsumeRecoveryProofArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmQuestSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.consume_recovery_proof(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "consume_recovery_proof(account,byte[])bool", v
+            )
+        )
+        return self
+
+    def get_player_quest_stats(
+        self,
+        args: tuple[str | bytes] | GetPlayerQuestStatsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmQuestSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_player_quest_stats(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_player_quest_stats(account)(uint64,uint64)", v
+            )
+        )
+        return self
+
+    def get_quest_system_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "AlgoRealmQuestSystemComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_quest_system_info(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_quest_system_info()(uint64,uint64)", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "AlgoRealmQuestSystemComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "AlgoRealmQuestSystemComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
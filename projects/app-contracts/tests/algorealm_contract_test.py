@@ -0,0 +1,497 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, Asset, Bytes, Global, String, UInt64, arc4, op
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.algorealm import contract as contract_module
+from smart_contracts.algorealm.contract import (
+    ACTION_CRAFT_ITEMS,
+    ITEM_TYPE_OTHER,
+    ITEM_TYPE_WEAPON,
+    RARITY_LEGENDARY,
+    AlgoRealmGameManager,
+)
+from smart_contracts.algorealm.deploy_config import (
+    GUILD_LEADERBOARD_BOX_MBR,
+    PLAYER_NAME_BOX_MBR,
+    PLAYER_NAME_BYTE_MBR,
+    player_name_mbr,
+)
+from smart_contracts.algorealm.guild_system import (
+    LEADERBOARD_BOX_MBR,
+    PROPOSAL_BOX_MBR,
+    REWARD_LEDGER_BOX_MBR,
+    AlgoRealmGuildSystem,
+)
+from smart_contracts.algorealm.item_metadata import (
+    ENCODED_SIZE,
+    minted_request_box_name,
+)
+from smart_contracts.algorealm.quest_system import AlgoRealmQuestSystem
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+@pytest.fixture()
+def contract(context: AlgopyTestContext) -> AlgoRealmGameManager:
+    contract = AlgoRealmGameManager()
+    contract.initialize_game()
+    player = context.default_sender
+    contract.is_registered[player] = arc4.Bool(True)  # noqa: FBT003
+    contract.player_recovery_count[player] = UInt64(0)
+    contract.action_clock[player] = Bytes(bytes(16))
+    return contract
+
+
+def _craft(context: AlgopyTestContext, contract: AlgoRealmGameManager) -> None:
+    contract.craft_items(context.any.asset(), context.any.asset(), UInt64(1))
+
+
+def test_craft_allows_a_burst_then_one_per_interval(
+    context: AlgopyTestContext, contract: AlgoRealmGameManager
+) -> None:
+    contract.configure_rate_limits(UInt64(0), UInt64(60), UInt64(2))
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(1_000))
+
+    _craft(context, contract)
+    _craft(context, contract)
+    with pytest.raises(AssertionError, match="Rate limit exceeded"):
+        _craft(context, contract)
+    assert contract.get_action_cooldown(
+        context.default_sender, UInt64(ACTION_CRAFT_ITEMS)
+    ) == UInt64(60)
+
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(1_060))
+    _craft(context, contract)
+    with pytest.raises(AssertionError, match="Rate limit exceeded"):
+        _craft(context, contract)
+
+
+def test_item_stacks_are_minted_once_per_template(
+    context: AlgopyTestContext, contract: AlgoRealmGameManager
+) -> None:
+    potion = contract.create_item_stack(String("potion"), String("common"))
+
+    assert contract.create_item_stack(String("potion"), String("common")) == potion
+    assert contract.get_item_stack(String("potion"), String("common")) == potion
+    assert contract.get_item_stack(String("potion"), String("rare")) == UInt64(0)
+
+    assert (
+        contract.dispense_stack_items(
+            context.default_sender, String("potion"), String("common"), UInt64(5)
+        )
+        == potion
+    )
+    transfer = context.txn.last_group.last_itxn.asset_transfer
+    assert transfer.asset_amount == UInt64(5)
+    assert transfer.xfer_asset.id == potion
+
+
+def test_created_items_store_compact_metadata(
+    context: AlgopyTestContext, contract: AlgoRealmGameManager
+) -> None:
+    context.ledger.patch_global_fields(latest_timestamp=UInt64(1_000))
+
+    def create(item_type: str, rarity: str, effect: str) -> UInt64:
+        return contract.create_game_item(
+            context.default_sender,
+            String("Sword"),
+            String(item_type),
+            String(rarity),
+            UInt64(300),
+            UInt64(5),
+            String(effect),
+        )
+
+    sword = create("Weapon", "Legendary", "Burns on hit")
+    charm = create("Other", "rare", "Burns on hit")
+    plain = create("armor", "common", "")
+
+    metadata = contract.get_item_metadata(sword)
+    assert metadata.item_type == arc4.UInt8(ITEM_TYPE_WEAPON)
+    assert metadata.rarity == arc4.UInt8(RARITY_LEGENDARY)
+    assert metadata.attack_power == arc4.UInt16(300)
+    assert metadata.original_creation_time == arc4.UInt64(1_000)
+    assert len(metadata.bytes) == ENCODED_SIZE
+    assert contract.get_item_metadata(charm).item_type == arc4.UInt8(ITEM_TYPE_OTHER)
+
+    # The effect text is stored once and shared by ID
+    assert metadata.effect_id == contract.get_item_metadata(charm).effect_id
+    assert contract.get_effect(metadata.effect_id.native) == String("Burns on hit")
+    assert contract.get_item_metadata(plain).effect_id == arc4.UInt16(0)
+    assert contract.total_effects.value == UInt64(1)
+
+    with pytest.raises(AssertionError, match="Unknown rarity"):
+        create("armor", "mythic", "")
+    with pytest.raises(AssertionError, match="Unknown item type"):
+        create("charm", "rare", "")
+
+
+def test_pooled_inner_fees_are_left_to_the_outer_transaction(
+    context: AlgopyTestContext, contract: AlgoRealmGameManager
+) -> None:
+    item = context.any.asset(total=UInt64(1), manager=context.default_sender)
+
+    contract.claim_item(item)
+    assert context.txn.last_group.last_itxn.asset_transfer.fee == UInt64(1_000)
+
+    contract.configure_fee_pooling(arc4.Bool(True))  # noqa: FBT003
+    contract.claim_item(item)
+    assert context.txn.last_group.last_itxn.asset_transfer.fee == UInt64(0)
+
+
+def test_items_are_delivered_only_if_created_by_the_app(
+    context: AlgopyTestContext, contract: AlgoRealmGameManager
+) -> None:
+    app_address = context.ledger.get_app(contract).address
+    item = context.any.asset(total=UInt64(1), creator=app_address)
+    player = context.default_sender
+
+    contract.deliver_item(item, player)
+    transfer = context.txn.last_group.last_itxn.asset_transfer
+    assert transfer.asset_receiver == player
+    assert transfer.xfer_asset == item
+
+    foreign = context.any.asset(total=UInt64(1), creator=context.any.account())
+    with pytest.raises(AssertionError, match="not created by AlgoRealm"):
+        contract.deliver_item(foreign, player)
+
+
+def test_crafted_items_can_be_clawed_back_and_recycled(
+    context: AlgopyTestContext, contract: AlgoRealmGameManager
+) -> None:
+    app_address = context.ledger.get_app(contract).address
+    player = context.default_sender
+    crafted = context.ledger.get_asset(
+        contract.craft_items(context.any.asset(), context.any.asset(), UInt64(1))
+    )
+    assert crafted.clawback == app_address
+    assert crafted.freeze == app_address
+    assert crafted.reserve == app_address
+
+    def recycle(item: Asset) -> UInt64:
+        return contract.recycle_items(
+            arc4.DynamicArray(arc4.UInt64(item.id)),
+            arc4.DynamicArray(arc4.Address(player)),
+        )
+
+    assert recycle(crafted) == UInt64(1)
+    assert contract.total_items_recycled.value == UInt64(1)
+
+    # Items minted before crafting set a clawback cannot be taken from players
+    legacy = context.any.asset(total=UInt64(1), creator=app_address)
+    with pytest.raises(AssertionError, match="Item cannot be clawed back"):
+        recycle(legacy)
+
+
+def test_keyed_item_requests_mint_once(
+    context: AlgopyTestContext, contract: AlgoRealmGameManager
+) -> None:
+    def create(request_key: bytes) -> UInt64:
+        return contract.create_game_item_with_key(
+            Bytes(request_key),
+            context.default_sender,
+            String("Sword"),
+            String("Weapon"),
+            String("Rare"),
+            UInt64(10),
+            UInt64(5),
+            String(""),
+        )
+
+    sword = create(b"order-1")
+    assert create(b"order-1") == sword
+    assert contract.total_items_created.value == UInt64(1)
+    assert contract.get_minted_item(Bytes(b"order-1")) == sword
+    assert contract.get_minted_item(Bytes(b"order-2")) == UInt64(0)
+    assert context.ledger.box_exists(contract, minted_request_box_name(b"order-1"))
+
+    assert create(b"order-2") != sword
+    assert contract.total_items_created.value == UInt64(2)
+    with pytest.raises(AssertionError, match="Must provide a request key"):
+        create(b"")
+
+
+def test_player_names_are_unique_and_resolvable(
+    context: AlgopyTestContext,
+    contract: AlgoRealmGameManager,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # algopy_testing cannot build single-field ARC-4 structs like PlayerRegistered
+    monkeypatch.setattr(contract_module, "PlayerRegistered", lambda player: player)
+    monkeypatch.setattr(arc4, "emit", lambda event: None)
+
+    app = context.ledger.get_app(contract)
+
+    def register(name: str, mbr: int | None = None) -> Account:
+        player = context.any.account()
+        contract.is_registered[player] = arc4.Bool(False)  # noqa: FBT003
+        payment = context.any.txn.payment(
+            sender=player,
+            receiver=app.address,
+            amount=UInt64(player_name_mbr(name).micro_algo if mbr is None else mbr),
+        )
+        app_call = context.any.txn.application_call(app_id=app, sender=player)
+        with context.txn.create_group([payment, app_call], active_txn_index=1):
+            contract.register_player(String(name))
+        return player
+
+    # deploy_config pays 2500 + 400 * (33 + 32) + 2500 + 400 * (33 + 2 + 5)
+    assert player_name_mbr("Alice").micro_algo == 47_000
+    assert PLAYER_NAME_BOX_MBR == contract_module.PLAYER_NAME_BOX_MBR
+    assert PLAYER_NAME_BYTE_MBR == contract_module.PLAYER_NAME_BYTE_MBR
+    with pytest.raises(AssertionError, match="Insufficient MBR payment"):
+        register("Alice", mbr=46_999)
+    unpaid = context.any.account()
+    contract.is_registered[unpaid] = arc4.Bool(False)  # noqa: FBT003
+    with context.txn.create_group(active_txn_overrides={"sender": unpaid}):
+        with pytest.raises(AssertionError, match="requires an MBR payment"):
+            contract.register_player(String("Alice"))
+
+    alice = register("Alice")
+    assert contract.resolve_name(String("Alice")) == arc4.Address(alice)
+    assert contract.name_of(alice) == String("Alice")
+    assert contract.resolve_name(String("Bob")) == arc4.Address(Global.zero_address)
+    assert contract.name_of(context.default_sender) == String("")
+
+    with pytest.raises(AssertionError, match="Player name already taken"):
+        register("Alice")
+    # Names are compared byte-for-byte
+    assert contract.resolve_name(String("alice")) == arc4.Address(Global.zero_address)
+    register("alice")
+
+
+def test_recovery_proofs_are_only_consumed_once_the_game_manager_is_linked(
+    context: AlgopyTestContext,
+) -> None:
+    quest = AlgoRealmQuestSystem()
+    player = context.any.account()
+    quest.recovery_proof_hash[player] = op.sha256(b"proof")
+
+    # A top-level call has caller ID 0, the same as an unset link
+    with pytest.raises(AssertionError, match="Game manager not linked"):
+        quest.consume_recovery_proof(player, Bytes(b"proof"))
+    assert quest.recovery_proof_hash[player] == op.sha256(b"proof")
+
+    quest.game_manager_app.value = context.any.application()
+    with pytest.raises(AssertionError, match="Only the game manager"):
+        quest.consume_recovery_proof(player, Bytes(b"proof"))
+
+
+@pytest.fixture()
+def guild(context: AlgopyTestContext) -> AlgoRealmGuildSystem:
+    guild = AlgoRealmGuildSystem()
+    _join(guild, context.default_sender, "leader")
+    return guild
+
+
+def _join(guild: AlgoRealmGuildSystem, player: Account, role: str = "member") -> None:
+    guild.player_guild_id[player] = UInt64(1)
+    guild.player_role[player] = String(role)
+    guild.is_guild_member[player] = arc4.Bool(True)  # noqa: FBT003
+    guild.contribution_score[player] = UInt64(0)
+
+
+def test_a_new_guild_appoints_officers_and_executes_proposals(
+    context: AlgopyTestContext,
+) -> None:
+    guild = AlgoRealmGuildSystem()
+    app_address = context.ledger.get_app(guild).address
+    leader, officer, member = (context.any.account() for _ in range(3))
+    for player in (leader, officer, member):
+        guild.is_guild_member[player] = arc4.Bool(False)  # noqa: FBT003
+
+    with context.txn.create_group(active_txn_overrides={"sender": leader}):
+        guild_id = guild.create_guild(
+            String("Knights"),
+            context.any.txn.payment(
+                sender=leader, receiver=app_address, amount=UInt64(200_000)
+            ),
+        )
+    for player in (officer, member):
+        with context.txn.create_group(active_txn_overrides={"sender": player}):
+            guild.join_guild(guild_id, String("Let me in"))
+
+    # Only the leader may appoint officers, and only from their own members
+    with context.txn.create_group(active_txn_overrides={"sender": member}):
+        with pytest.raises(AssertionError, match="Only the guild leader"):
+            guild.promote_to_officer(officer)
+    with context.txn.create_group(active_txn_overrides={"sender": leader}):
+        guild.promote_to_officer(officer)
+    assert guild.player_role[officer] == String("officer")
+
+    with context.txn.create_group(active_txn_overrides={"sender": leader}):
+        payout = guild.propose_guild_action(
+            String("treasury_payout"), member, UInt64(4_000)
+        )
+    with context.txn.create_group(active_txn_overrides={"sender": officer}):
+        guild.approve_guild_action(payout)
+
+    payment = context.txn.last_group.last_itxn.payment
+    assert (payment.receiver, payment.amount) == (member, UInt64(4_000))
+    assert payout not in guild.guild_proposals
+    assert guild.get_guild_treasury(guild_id) == UInt64(200_000 - 9_300 - 9_700 - 4_000)
+
+
+def test_guild_rewards_are_paid_from_the_escrowed_ledger(
+    context: AlgopyTestContext, guild: AlgoRealmGuildSystem
+) -> None:
+    app_address = context.ledger.get_app(guild).address
+    leader = context.default_sender
+    token = context.any.asset()
+    members = [context.any.account(), context.any.account()]
+    for member in members:
+        _join(guild, member)
+
+    def distribute(*amounts: int) -> None:
+        guild.distribute_guild_rewards(
+            token.id,
+            arc4.DynamicArray(*(arc4.Address(member) for member in members)),
+            arc4.DynamicArray(*(arc4.UInt64(amount) for amount in amounts)),
+        )
+
+    with pytest.raises(AssertionError, match="Guild has no reward asset"):
+        distribute(1, 1)
+
+    guild.set_reward_asset(
+        token,
+        context.any.txn.payment(
+            sender=leader,
+            receiver=app_address,
+            amount=UInt64(REWARD_LEDGER_BOX_MBR + 100_000),
+        ),
+    )
+    balance = guild.deposit_guild_rewards(
+        context.any.txn.asset_transfer(
+            sender=leader,
+            asset_receiver=app_address,
+            xfer_asset=token,
+            asset_amount=UInt64(500),
+        )
+    )
+    assert balance == UInt64(500)
+
+    distribute(200, 100)
+    assert guild.get_reward_ledger(UInt64(1)).balance == arc4.UInt64(200)
+
+    with pytest.raises(AssertionError, match="Insufficient guild reward balance"):
+        distribute(150, 100)
+
+
+def test_guild_names_are_stored_and_deposits_come_from_the_caller(
+    context: AlgopyTestContext, guild: AlgoRealmGuildSystem
+) -> None:
+    app_address = context.ledger.get_app(guild).address
+    founder = context.any.account()
+    guild.is_guild_member[founder] = arc4.Bool(False)  # noqa: FBT003
+    guild.total_guilds.value = UInt64(1)
+
+    with context.txn.create_group(active_txn_overrides={"sender": founder}):
+        guild_id = guild.create_guild(
+            String("Knights"),
+            context.any.txn.payment(
+                sender=founder, receiver=app_address, amount=UInt64(200_000)
+            ),
+        )
+    assert guild.get_guild_name(guild_id) == String("Knights")
+    # The MBR of the treasury box and the 7-byte name box comes out of the payment
+    assert guild.get_guild_treasury(guild_id) == UInt64(200_000 - 9_300 - 9_700)
+
+    with pytest.raises(AssertionError, match="Deposit must come from the depositor"):
+        guild.deposit_to_treasury(
+            context.any.txn.payment(
+                sender=founder, receiver=app_address, amount=UInt64(1_000)
+            )
+        )
+
+
+def test_treasury_deposits_rank_contributors_on_the_leaderboard(
+    context: AlgopyTestContext, guild: AlgoRealmGuildSystem
+) -> None:
+    app_address = context.ledger.get_app(guild).address
+    guild.guild_treasury[UInt64(1)] = UInt64(0)
+
+    def deposit(player: Account, amount: int) -> UInt64:
+        with context.txn.create_group(active_txn_overrides={"sender": player}):
+            return guild.deposit_to_treasury(
+                context.any.txn.payment(
+                    sender=player, receiver=app_address, amount=UInt64(amount)
+                )
+            )
+
+    def create_leaderboard(amount: int) -> None:
+        guild.create_leaderboard(
+            context.any.txn.payment(receiver=app_address, amount=UInt64(amount))
+        )
+
+    first, second, third = (context.any.account() for _ in range(3))
+    for player in (first, second, third):
+        _join(guild, player)
+
+    with pytest.raises(AssertionError, match="Leaderboard not created"):
+        deposit(first, 300)
+    # algopy_testing keeps the writes of a failed call, so undo them
+    guild.guild_treasury[UInt64(1)] = UInt64(0)
+    guild.contribution_score[first] = UInt64(0)
+    with pytest.raises(AssertionError, match="Insufficient MBR payment"):
+        create_leaderboard(LEADERBOARD_BOX_MBR - 1)
+    # deploy_systems pays exactly this much
+    assert GUILD_LEADERBOARD_BOX_MBR == LEADERBOARD_BOX_MBR
+    create_leaderboard(LEADERBOARD_BOX_MBR)
+    with pytest.raises(AssertionError, match="Leaderboard already exists"):
+        create_leaderboard(LEADERBOARD_BOX_MBR)
+
+    deposit(first, 300)
+    deposit(second, 500)
+    deposit(third, 100)
+    # Ties keep the earlier contributor ahead
+    assert deposit(third, 200) == UInt64(1_100)
+
+    board = guild.get_leaderboard()
+    assert [board[i].player for i in range(3)] == [
+        arc4.Address(second),
+        arc4.Address(first),
+        arc4.Address(third),
+    ]
+    assert board[3].player == arc4.Address(Global.zero_address)
+    assert guild.get_guild_treasury(UInt64(1)) == UInt64(1_100)
+
+
+def test_guild_proposals_execute_at_the_approval_threshold(
+    context: AlgopyTestContext, guild: AlgoRealmGuildSystem
+) -> None:
+    guild.guild_treasury[UInt64(1)] = UInt64(PROPOSAL_BOX_MBR + 5_000)
+    officer, member = context.any.account(), context.any.account()
+    _join(guild, officer, "officer")
+    _join(guild, member)
+
+    promotion = guild.propose_guild_action(String("promote_member"), member, UInt64(0))
+    # The pending proposal reserves its box MBR from the treasury
+    assert guild.get_guild_treasury(UInt64(1)) == UInt64(5_000)
+    with pytest.raises(AssertionError, match="Already approved"):
+        guild.approve_guild_action(promotion)
+
+    with context.txn.create_group(active_txn_overrides={"sender": member}):
+        with pytest.raises(AssertionError, match="Insufficient permissions"):
+            guild.approve_guild_action(promotion)
+    with context.txn.create_group(active_txn_overrides={"sender": officer}):
+        guild.approve_guild_action(promotion)
+
+    assert guild.player_role[member] == String("officer")
+    assert promotion not in guild.guild_proposals
+    assert guild.get_guild_treasury(UInt64(1)) == UInt64(PROPOSAL_BOX_MBR + 5_000)
+
+    payout = guild.propose_guild_action(
+        String("treasury_payout"), member, UInt64(4_000)
+    )
+    with context.txn.create_group(active_txn_overrides={"sender": officer}):
+        guild.approve_guild_action(payout)
+
+    payment = context.txn.last_group.last_itxn.payment
+    assert (payment.receiver, payment.amount) == (member, UInt64(4_000))
+    assert guild.get_guild_treasury(UInt64(1)) == UInt64(PROPOSAL_BOX_MBR + 1_000)
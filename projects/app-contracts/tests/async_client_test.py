@@ -0,0 +1,236 @@
+import asyncio
+import base64
+import hashlib
+from typing import Any
+
+from algosdk import abi, account, encoding, logic, transaction
+from algosdk.atomic_transaction_composer import EmptySigner
+from algosdk.v2client.models import SimulateRequest
+
+from smart_contracts.algorealm.async_client import (
+    ABI_RETURN_PREFIX,
+    MAX_POOLED_INNER_TRANSACTIONS,
+    AsyncAlgoRealmClient,
+    MethodCall,
+)
+from smart_contracts.algorealm.deploy_config import player_name_mbr
+from smart_contracts.algorealm.preflight import PADDING_METHOD, PREFLIGHT_EXTRA_BUDGET
+
+SENDER = encoding.encode_address(bytes(32))
+
+
+def _abi_return(abi_type: str, value: object) -> str:
+    encoded = abi.ABIType.from_string(abi_type).encode(value)
+    return base64.b64encode(ABI_RETURN_PREFIX + encoded).decode()
+
+
+def _inner(fee: int, *nested: dict[str, Any]) -> dict[str, Any]:
+    txn = {"type": "axfer", "fee": fee} if fee else {"type": "axfer"}
+    return {"txn": {"txn": txn}, "inner-txns": list(nested)}
+
+
+class FakeAlgod:
+    """Serves fixed params, app state and simulate results, recording requests"""
+
+    def __init__(
+        self,
+        logs: list[str] | None = None,
+        inner_txns: list[dict[str, Any]] | None = None,
+    ) -> None:
+        self.logs = logs or []
+        self.inner_txns = inner_txns or []
+        self.group_extras: dict[str, Any] = {}
+        self.global_state: list[dict[str, Any]] = []
+        self.requests: list[SimulateRequest] = []
+        self.simulated_fees: list[int] = []
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        return transaction.SuggestedParams(
+            fee=0, first=1, last=1001, gh="", min_fee=1_000, flat_fee=False
+        )
+
+    async def simulate(self, request: SimulateRequest) -> dict[str, Any]:
+        self.requests.append(request)
+        self.simulated_fees.append(request.txn_groups[0].txns[0].transaction.fee)
+        txn_results = [
+            {"txn-result": {"logs": self.logs, "inner-txns": self.inner_txns}}
+        ]
+        return {"txn-groups": [{"txn-results": txn_results, **self.group_extras}]}
+
+    async def application_info(self, app_id: int) -> dict[str, Any]:
+        return {"id": app_id, "params": {"global-state": self.global_state}}
+
+
+def test_simulate_decodes_the_abi_return_without_signing() -> None:
+    algod = FakeAlgod([_abi_return("(uint64,uint64,uint64)", [3, 7, 1])])
+    client = AsyncAlgoRealmClient(algod, 1001)  # type: ignore[arg-type]
+
+    assert asyncio.run(client.get_game_info(SENDER)) == (3, 7, 1)
+
+    (signed_txn,) = algod.requests[0].txn_groups[0].txns
+    assert signed_txn.signature is None
+    assert signed_txn.transaction.index == 1001
+    assert signed_txn.transaction.fee == 1_000
+
+
+def test_send_frees_its_in_flight_slot_before_confirmation() -> None:
+    algod = FakeAlgod()
+    client = AsyncAlgoRealmClient(algod, 1001, max_in_flight=1)  # type: ignore[arg-type]
+    submitted: list[int] = []
+
+    async def run() -> list[object]:
+        # Confirmations only arrive once both calls were submitted
+        both_submitted = asyncio.Event()
+
+        async def send_transactions(signed_txns: list[object]) -> str:
+            submitted.append(len(signed_txns))
+            if len(submitted) == 2:
+                both_submitted.set()
+            return f"TX{len(submitted)}"
+
+        async def wait_for_confirmation(tx_id: str, max_rounds: int) -> dict[str, Any]:
+            await both_submitted.wait()
+            return {"logs": [_abi_return("(uint64,uint64,uint64)", [1, 2, 3])]}
+
+        algod.send_transactions = send_transactions  # type: ignore[attr-defined]
+        algod.wait_for_confirmation = wait_for_confirmation  # type: ignore[attr-defined]
+        sends = (
+            client.send("get_game_info", sender=SENDER, signer=EmptySigner())
+            for _ in range(2)
+        )
+        return await asyncio.wait_for(asyncio.gather(*sends), timeout=5)
+
+    assert asyncio.run(run()) == [[1, 2, 3], [1, 2, 3]]
+    assert submitted == [1, 1]
+
+
+def test_global_state_decodes_uints_and_bytes() -> None:
+    algod = FakeAlgod()
+    algod.global_state = [
+        {
+            "key": base64.b64encode(b"total_players").decode(),
+            "value": {"type": 2, "uint": 42},
+        },
+        {
+            "key": base64.b64encode(b"game_master").decode(),
+            "value": {"type": 1, "bytes": base64.b64encode(bytes(32)).decode()},
+        },
+    ]
+    client = AsyncAlgoRealmClient(algod, 1001)  # type: ignore[arg-type]
+
+    state = asyncio.run(client.global_state())
+
+    assert state == {"total_players": 42, "game_master": bytes(32)}
+
+
+def test_pooled_inner_transactions_counts_unpaid_inner_fees() -> None:
+    algod = FakeAlgod(
+        inner_txns=[
+            _inner(0),
+            _inner(1_000),
+            # An inner app call whose own inner transaction is pooled too
+            _inner(0, _inner(0)),
+        ]
+    )
+    client = AsyncAlgoRealmClient(algod, 1001)  # type: ignore[arg-type]
+
+    count = asyncio.run(
+        client.pooled_inner_transactions("claim_item", [1], sender=SENDER)
+    )
+
+    assert count == 3
+    # The dry pass offers enough fee credit for any group
+    assert algod.simulated_fees == [1_000 * (1 + MAX_POOLED_INNER_TRANSACTIONS)]
+
+
+def test_preflight_names_resources_and_pads_budget() -> None:
+    algod = FakeAlgod()
+    algod.group_extras = {
+        "app-budget-added": 700 + PREFLIGHT_EXTRA_BUDGET,
+        "app-budget-consumed": 1_000,
+        "unnamed-resources-accessed": {"assets": [42]},
+    }
+    client = AsyncAlgoRealmClient(algod, 1001)  # type: ignore[arg-type]
+
+    atc = asyncio.run(
+        client.preflight(
+            [MethodCall("claim_item", [7])], sender=SENDER, signer=EmptySigner()
+        )
+    )
+
+    call, padding = (txn_with_signer.txn for txn_with_signer in atc.build_group())
+    assert call.foreign_assets == [7, 42]
+    assert padding.app_args[0] == client.methods[PADDING_METHOD].get_selector()
+
+
+def test_delivery_bundles_a_delegated_opt_in_paid_by_the_game_master() -> None:
+    private_key, player = account.generate_account()
+    delegation = transaction.LogicSigAccount(bytes.fromhex("0a8101"))
+    delegation.sign(private_key)
+    client = AsyncAlgoRealmClient(FakeAlgod(), 1001)  # type: ignore[arg-type]
+    sp = asyncio.run(client.algod.suggested_params())
+
+    atc = client.compose_delivery(
+        sp, 7, delegation, sender=SENDER, signer=EmptySigner()
+    )
+
+    opt_in, deliver = (txn_with_signer.txn for txn_with_signer in atc.build_group())
+    assert (opt_in.sender, opt_in.receiver, opt_in.amount) == (player, player, 0)
+    assert opt_in.fee == 0
+    # Outer call + opt-in + the inner transfer
+    assert deliver.fee == 3_000
+    assert deliver.foreign_assets == [7]
+    assert deliver.accounts == [player]
+    assert atc.gather_signatures()[0].lsig.sig is not None
+
+
+def test_resolve_name_maps_the_zero_address_to_none() -> None:
+    algod = FakeAlgod()
+    client = AsyncAlgoRealmClient(algod, 1001)  # type: ignore[arg-type]
+    _, player = account.generate_account()
+
+    def returning(address: str) -> list[str]:
+        log = ABI_RETURN_PREFIX + encoding.decode_address(address)
+        return [base64.b64encode(log).decode()]
+
+    algod.logs = returning(player)
+    assert asyncio.run(client.resolve_name("Alice", SENDER)) == player
+    algod.logs = returning(SENDER)
+    assert asyncio.run(client.resolve_name("Bob", SENDER)) is None
+
+
+def test_registration_pays_the_name_mbr_right_before_the_noop_call() -> None:
+    _, player = account.generate_account()
+    client = AsyncAlgoRealmClient(FakeAlgod(), 1001)  # type: ignore[arg-type]
+    sp = asyncio.run(client.algod.suggested_params())
+
+    atc = client.compose_registration(sp, "Alice", sender=player, signer=EmptySigner())
+
+    opt_in, payment, register = (
+        txn_with_signer.txn for txn_with_signer in atc.build_group()
+    )
+    assert opt_in.on_complete == transaction.OnComplete.OptInOC
+    assert (payment.sender, payment.receiver) == (
+        player,
+        logic.get_application_address(1001),
+    )
+    assert payment.amt == player_name_mbr("Alice").micro_algo
+    assert register.on_complete == transaction.OnComplete.NoOpOC
+    assert register.app_args[1] == abi.StringType().encode("Alice")
+    assert [box.name for box in register.boxes] == [
+        b"n" + hashlib.sha256(b"Alice").digest(),
+        b"a" + encoding.decode_address(player),
+    ]
+
+
+def test_registration_of_an_opted_in_player_skips_the_opt_in() -> None:
+    client = AsyncAlgoRealmClient(FakeAlgod(), 1001)  # type: ignore[arg-type]
+    sp = asyncio.run(client.algod.suggested_params())
+
+    atc = client.compose_registration(
+        sp, "Alice", sender=SENDER, signer=EmptySigner(), opt_in=False
+    )
+
+    payment, register = (txn_with_signer.txn for txn_with_signer in atc.build_group())
+    assert payment.type == transaction.constants.PAYMENT_TXN
+    assert register.on_complete == transaction.OnComplete.NoOpOC
@@ -0,0 +1,146 @@
+import importlib
+import shutil
+from pathlib import Path
+
+import algokit_utils
+import pytest
+from algosdk.transaction import OnComplete
+
+from smart_contracts.algorealm import benchmark_config
+from smart_contracts.algorealm.deploy_config import player_name_mbr
+
+build_script = importlib.import_module("smart_contracts.__main__")
+
+SPEC_DIR = Path(build_script.root_path) / "artifacts" / "algorealm"
+SENDER = "BENCHMARK"
+
+
+Sent = list[tuple[str, object]]
+
+
+class FakeSend:
+    def __init__(self, sent: Sent) -> None:
+        self.sent = sent
+
+    def opt_in(self, params: algokit_utils.AppClientMethodCallParams) -> None:
+        self.sent.append((params.method, params.on_complete))
+
+
+class FakeParams:
+    def call(
+        self, params: algokit_utils.AppClientMethodCallParams
+    ) -> algokit_utils.AppClientMethodCallParams:
+        return params
+
+
+class FakeComposer:
+    def __init__(self, sent: Sent) -> None:
+        self.sent = sent
+        self.group: Sent = []
+
+    def add_payment(self, params: algokit_utils.PaymentParams) -> "FakeComposer":
+        self.group.append(("payment", params.amount.micro_algo))
+        return self
+
+    def add_app_call_method_call(
+        self, params: algokit_utils.AppClientMethodCallParams
+    ) -> "FakeComposer":
+        self.group.append((params.method, params.on_complete))
+        return self
+
+    def send(self) -> None:
+        self.sent.append(("group", self.group))
+
+
+class FakeAlgorand:
+    def __init__(self, sent: Sent) -> None:
+        self.sent = sent
+
+    def new_group(self) -> FakeComposer:
+        return FakeComposer(self.sent)
+
+
+class FakeAppClient:
+    """Records the calls the benchmark sends for real"""
+
+    app_address = "APP"
+
+    def __init__(self) -> None:
+        self.sent: Sent = []
+        self.send = FakeSend(self.sent)
+        self.params = FakeParams()
+        self.algorand = FakeAlgorand(self.sent)
+
+
+def test_method_costs_register_the_player_and_skip_failing_methods(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def simulate_cost(
+        app_client: FakeAppClient, params: algokit_utils.AppClientMethodCallParams
+    ) -> int:
+        if params.method == "advance_season":
+            raise Exception("logic eval error: Only game master")
+        return len(params.method)
+
+    monkeypatch.setattr(benchmark_config, "_simulate_cost", simulate_cost)
+    app_client = FakeAppClient()
+
+    costs = benchmark_config.measure_app_costs(app_client, SENDER)  # type: ignore[arg-type]
+
+    # The NoOp registration, after its MBR payment, must follow the opt-in for
+    # player-only methods
+    assert app_client.sent == [
+        ("register_player", OnComplete.OptInOC),
+        (
+            "group",
+            [
+                ("payment", player_name_mbr(benchmark_config.PLAYER_NAME).micro_algo),
+                ("register_player", None),
+            ],
+        ),
+    ]
+    assert "advance_season" not in costs
+    assert costs["register_player"] == len("register_player")
+    assert costs["seasonal_event_reissue"] == len("seasonal_event_reissue")
+
+
+def test_benchmark_loads_the_config_hook_and_survives_failed_levels(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    (algorealm,) = [c for c in build_script.contracts if c.name == "algorealm"]
+    assert algorealm.measure_costs is benchmark_config.measure_method_costs
+
+    def compile_contract(
+        output_dir: Path,
+        contract_path: Path,
+        extra_sources: list[Path] | None = None,
+        optimization_level: int | None = None,
+    ) -> None:
+        for spec_path in SPEC_DIR.glob("*.arc56.json"):
+            shutil.copy(spec_path, output_dir)
+
+    measured_levels: list[Path] = []
+
+    def measure_costs(spec_dir: Path) -> dict[str, dict[str, int]]:
+        measured_levels.append(spec_dir)
+        if len(measured_levels) > 1:
+            raise Exception("LocalNet is not running")
+        return {"AlgoRealmGameManager": {"get_game_info": 42}}
+
+    monkeypatch.setattr(build_script, "compile_contract", compile_contract)
+    monkeypatch.setattr(build_script, "OPTIMIZATION_LEVELS", (0, 1))
+    contract = build_script.SmartContract(
+        path=algorealm.path, name="algorealm", measure_costs=measure_costs
+    )
+
+    results = build_script.benchmark(contract)
+
+    # Program sizes are still reported for the level whose costs failed
+    managers = [r for r in results if r.contract == "AlgoRealmGameManager"]
+    assert [r.optimization_level for r in managers] == [0, 1]
+    assert all(r.approval_size > 0 for r in managers)
+    assert [r.method_costs for r in managers] == [{"get_game_info": 42}, {}]
+    table = build_script.format_benchmark(results).splitlines()
+    manager_rows = [row for row in table if row.startswith("AlgoRealmGameManager")]
+    assert manager_rows[0].endswith(" 42")
+    assert manager_rows[1].endswith(" -")
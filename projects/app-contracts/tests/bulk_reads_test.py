@@ -0,0 +1,87 @@
+import pytest
+
+from smart_contracts.algorealm import bulk_reads
+from smart_contracts.algorealm.bulk_reads import MAX_GROUP_SIZE, bulk_read
+
+
+class FakeSimulator:
+    """Stands in for _simulate_group, failing at the calls for unknown players"""
+
+    def __init__(self, unknown: set[int]) -> None:
+        self.unknown = unknown
+        self.groups: list[list[int]] = []
+
+    def __call__(
+        self,
+        client: object,
+        method: str,
+        chunk: list[tuple[int]],
+        sender: str,
+    ) -> list[object | None]:
+        players = [player for (player,) in chunk]
+        self.groups.append(players)
+        for index, player in enumerate(players):
+            if player in self.unknown:
+                returns: list[object | None] = [p * 10 for p in players[:index]]
+                raise bulk_reads._ReadGroupError(index, "unknown player", returns)
+        return [player * 10 for player in players]
+
+
+@pytest.fixture()
+def simulator(monkeypatch: pytest.MonkeyPatch) -> FakeSimulator:
+    simulator = FakeSimulator(unknown=set())
+    monkeypatch.setattr(bulk_reads, "_simulate_group", simulator)
+    return simulator
+
+
+def test_bulk_read_batches_calls_into_full_groups(simulator: FakeSimulator) -> None:
+    players = list(range(1, 21))
+
+    values = bulk_read(None, "get_player_stats", [(p,) for p in players])  # type: ignore[arg-type]
+
+    assert values == [player * 10 for player in players]
+    assert sorted(len(group) for group in simulator.groups) == [4, MAX_GROUP_SIZE]
+
+
+def test_bulk_read_resumes_after_the_failed_call(simulator: FakeSimulator) -> None:
+    simulator.unknown = {3, 6}
+    players = list(range(1, 9))
+
+    values = bulk_read(None, "get_player_stats", [(p,) for p in players])  # type: ignore[arg-type]
+
+    assert values == [10, 20, None, 40, 50, None, 70, 80]
+    # Each retry starts right after the call that failed
+    assert simulator.groups == [players, [4, 5, 6, 7, 8], [7, 8]]
+
+
+def test_bulk_read_raises_failures_of_the_whole_group(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    message = (
+        "transaction AAA: overspend (account BBB, data {_struct:{} Status:Offline})"
+    )
+    simulated: list[int] = []
+
+    def unfunded(*args: object) -> list[object | None]:
+        simulated.append(1)
+        raise bulk_reads._group_failure(0, message, [])
+
+    monkeypatch.setattr(bulk_reads, "_simulate_group", unfunded)
+
+    with pytest.raises(Exception, match="overspend"):
+        bulk_read(None, "get_player_stats", [(1,), (2,)])  # type: ignore[arg-type]
+    # Not mistaken for a failed call and retried with the rest of the chunk
+    assert simulated == [1]
+
+
+def test_only_program_failures_are_read_as_missing_values() -> None:
+    call_failure = bulk_reads._group_failure(
+        2, "transaction AAA: logic eval error: assert failed pc=123", [10, 20]
+    )
+    assert isinstance(call_failure, bulk_reads._ReadGroupError)
+    assert (call_failure.failed_at, call_failure.returns) == (2, [10, 20])
+
+    fee_failure = bulk_reads._group_failure(
+        0, "txgroup had 0 in fees, which is less than the minimum 1000", []
+    )
+    assert not isinstance(fee_failure, bulk_reads._ReadGroupError)
@@ -0,0 +1,54 @@
+import struct
+
+from algosdk import abi, encoding
+
+from smart_contracts.algorealm.event_decoder import EventDecoder, EventSpec
+
+PLAYER = encoding.encode_address(bytes([7]) * 32)
+
+ITEM_CLAIMED = EventSpec.from_arc56(
+    {
+        "name": "ItemClaimed",
+        "args": [
+            {"type": "uint64", "name": "asset_id"},
+            {"type": "address", "name": "player"},
+        ],
+    }
+)
+
+
+def test_selector_hashes_the_event_signature() -> None:
+    assert ITEM_CLAIMED.signature == "ItemClaimed(uint64,address)"
+    assert ITEM_CLAIMED.selector == bytes.fromhex("54265086")
+
+
+def test_decodes_static_event_at_fixed_offsets() -> None:
+    decoder = EventDecoder([ITEM_CLAIMED])
+    log = ITEM_CLAIMED.selector + struct.pack(
+        ">Q32s", 42, encoding.decode_address(PLAYER)
+    )
+
+    event = decoder.decode(log)
+
+    assert event is not None
+    assert event.name == "ItemClaimed"
+    assert event.fields == {"asset_id": 42, "player": PLAYER}
+
+
+def test_falls_back_to_abi_decoding_for_dynamic_events() -> None:
+    spec = EventSpec("Renamed", ("asset_id", "name"), ("uint64", "string"))
+    log = spec.selector + abi.ABIType.from_string("(uint64,string)").encode(
+        [3, "Excalibur"]
+    )
+
+    event = EventDecoder([spec]).decode(log)
+
+    assert event is not None
+    assert event.fields == {"asset_id": 3, "name": "Excalibur"}
+
+
+def test_ignores_unknown_and_malformed_logs() -> None:
+    decoder = EventDecoder([ITEM_CLAIMED])
+
+    assert decoder.decode(b"Item claimed") is None
+    assert decoder.decode(ITEM_CLAIMED.selector + b"\x00" * 8) is None
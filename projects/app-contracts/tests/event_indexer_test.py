@@ -0,0 +1,128 @@
+import base64
+import struct
+from pathlib import Path
+
+from algosdk import abi, encoding
+
+from smart_contracts.algorealm.async_client import ABI_RETURN_PREFIX
+from smart_contracts.algorealm.event_decoder import EventDecoder, EventSpec
+from smart_contracts.algorealm.event_indexer import EventIndexer, EventStore
+
+APP_ID = 1234
+PLAYER = encoding.encode_address(bytes([1]) * 32)
+RECIPIENT = encoding.encode_address(bytes([2]) * 32)
+
+REGISTER = abi.Method.undictify(
+    {
+        "name": "register_player",
+        "args": [{"type": "string", "name": "player_name"}],
+        "returns": {"type": "string"},
+    }
+)
+CREATE_ITEM = abi.Method.from_signature(
+    "create_game_item(account,string,string,string,uint64,uint64,string)uint64"
+)
+
+PLAYER_REGISTERED = EventSpec("PlayerRegistered", ("player",), ("address",))
+ITEM_MINTED = EventSpec(
+    "ItemMinted", ("asset_id", "recipient", "source"), ("uint64", "address", "uint8")
+)
+
+
+def _b64(value: bytes) -> str:
+    return base64.b64encode(value).decode()
+
+
+def _app_call(method: abi.Method, args: list[bytes], **fields: object) -> dict:
+    return {
+        "type": "appl",
+        "apid": APP_ID,
+        "snd": PLAYER,
+        "apaa": [_b64(method.get_selector()), *(_b64(arg) for arg in args)],
+        **fields,
+    }
+
+
+def _indexer(tmp_path: Path) -> EventIndexer:
+    methods = {method.name: method for method in (REGISTER, CREATE_ITEM)}
+    return EventIndexer(
+        None,  # type: ignore[arg-type]
+        APP_ID,
+        EventStore(tmp_path / "events.db"),
+        methods,
+        EventDecoder([PLAYER_REGISTERED, ITEM_MINTED]),
+    )
+
+
+def test_decodes_player_registration(tmp_path: Path) -> None:
+    indexer = _indexer(tmp_path)
+    stxn = {
+        "txn": _app_call(REGISTER, [abi.StringType().encode("Alice")]),
+        "dt": {
+            "lg": [
+                _b64(PLAYER_REGISTERED.selector + encoding.decode_address(PLAYER)),
+                _b64(ABI_RETURN_PREFIX + abi.StringType().encode("Welcome!")),
+            ]
+        },
+    }
+
+    event = indexer.decode_app_call(10, "TXID", stxn)
+
+    assert event is not None
+    assert event.method == "register_player"
+    assert event.arguments == {"player_name": "Alice"}
+    assert [e.name for e in event.events] == ["PlayerRegistered"]
+    assert event.messages == []
+    assert event.return_value == "Welcome!"
+    indexer.store.save_round(APP_ID, 10, 1, [event])
+    assert indexer.store.db.execute("SELECT address, name FROM players").fetchall() == [
+        (PLAYER, "Alice")
+    ]
+
+
+def test_records_created_items_for_the_recipient(tmp_path: Path) -> None:
+    indexer = _indexer(tmp_path)
+    string = abi.StringType()
+    uint64 = abi.UintType(64)
+    minted = struct.pack(">Q32sB", 555, encoding.decode_address(RECIPIENT), 1)
+    stxn = {
+        "txn": _app_call(
+            CREATE_ITEM,
+            [
+                bytes([1]),
+                string.encode("Sword"),
+                string.encode("weapon"),
+                string.encode("rare"),
+                uint64.encode(10),
+                uint64.encode(5),
+                string.encode("none"),
+            ],
+            apat=[RECIPIENT],
+        ),
+        "dt": {
+            "lg": [
+                _b64(ITEM_MINTED.selector + minted),
+                _b64(ABI_RETURN_PREFIX + uint64.encode(555)),
+            ],
+            "itx": [{"txn": {"type": "acfg"}, "caid": 555}],
+        },
+    }
+
+    event = indexer.decode_app_call(11, "TXID2", stxn)
+    assert event is not None
+    assert event.events[0].fields == {
+        "asset_id": 555,
+        "recipient": RECIPIENT,
+        "source": 1,
+    }
+    indexer.store.save_round(APP_ID, 11, 2, [event])
+
+    assert indexer.store.item_history(555) == [(11, "create_game_item", RECIPIENT, 2)]
+    assert indexer.store.cursor(APP_ID) == (12, 2)
+
+
+def test_ignores_other_apps(tmp_path: Path) -> None:
+    indexer = _indexer(tmp_path)
+    stxn = {"txn": {**_app_call(REGISTER, []), "apid": APP_ID + 1}}
+
+    assert indexer.decode_app_call(12, "TXID3", stxn) is None
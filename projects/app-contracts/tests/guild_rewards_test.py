@@ -0,0 +1,38 @@
+import pytest
+
+from smart_contracts.algorealm.guild_rewards import (
+    MAX_CALL_ACCOUNTS,
+    MAX_CALL_REFERENCES,
+    MAX_GROUP_SIZE,
+    REWARDS_PER_CALL,
+    chunk_rewards,
+    distribute_rewards,
+)
+
+
+def test_chunk_rewards_fits_each_call_in_the_reference_budget() -> None:
+    members = [f"member_{i}" for i in range(100)]
+    amounts = list(range(100))
+
+    chunks = chunk_rewards(members, amounts)
+
+    # Asset and ledger box, then one account per member
+    assert REWARDS_PER_CALL == MAX_CALL_ACCOUNTS == 4
+    assert 2 + REWARDS_PER_CALL <= MAX_CALL_REFERENCES
+    assert len(chunks) == 25
+    assert all(len(chunk_members) == 4 for chunk_members, _ in chunks)
+    # 100 members take two groups
+    assert len(chunks) > MAX_GROUP_SIZE
+
+
+def test_chunk_rewards_rejects_mismatched_lengths() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        chunk_rewards(["a", "b"], [1])
+
+
+def test_distribute_rewards_rejects_payouts_larger_than_one_group() -> None:
+    payouts = {f"member_{i}": 1 for i in range(MAX_GROUP_SIZE * REWARDS_PER_CALL + 1)}
+
+    # Rejected before anything is sent, so no client is needed
+    with pytest.raises(ValueError, match="split it across groups"):
+        distribute_rewards(None, 1, payouts)  # type: ignore[arg-type]
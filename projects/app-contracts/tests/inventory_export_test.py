@@ -0,0 +1,111 @@
+import base64
+import io
+import struct
+from typing import Any
+
+from algosdk import encoding
+from algosdk.logic import get_application_address
+
+from smart_contracts.algorealm.inventory_export import (
+    DecodedNote,
+    InventoryExporter,
+    decode_item_note,
+)
+from smart_contracts.algorealm.item_metadata import ITEM_NOTE_PREFIX
+
+APP_ID = 1001
+PLAYER = encoding.encode_address(bytes([3]) * 32)
+
+
+class FakeIndexer:
+    """Serves fixed indexer pages, one item per page"""
+
+    def __init__(
+        self, assets: list[dict], notes: dict[int, bytes], holders: dict[int, str]
+    ) -> None:
+        self.assets = assets
+        self.notes = notes
+        self.holders = holders
+
+    def lookup_account_asset_by_creator(
+        self, address: str, limit: int, next_page: str | None
+    ) -> dict[str, Any]:
+        start = int(next_page or 0)
+        return {
+            "assets": self.assets[start : start + limit],
+            "next-token": str(start + limit),
+        }
+
+    def search_transactions(
+        self, application_id: int, limit: int, next_page: str | None
+    ) -> dict[str, Any]:
+        start = int(next_page or 0)
+        ids = sorted(self.notes)[start : start + limit]
+        transactions = [
+            {
+                "inner-txns": [
+                    {
+                        "created-asset-index": asset_id,
+                        "note": base64.b64encode(self.notes[asset_id]).decode(),
+                    }
+                ]
+            }
+            for asset_id in ids
+        ]
+        return {"transactions": transactions, "next-token": str(start + limit)}
+
+    def asset_balances(
+        self, asset_id: int, min_balance: int, limit: int
+    ) -> dict[str, Any]:
+        holder = self.holders.get(asset_id)
+        return {"balances": [{"address": holder, "amount": 1}] if holder else []}
+
+
+def _asset(asset_id: int, name: str, unit_name: str, clawback: str = "") -> dict:
+    params = {"name": name, "unit-name": unit_name}
+    if clawback:
+        params["clawback"] = clawback
+    return {"index": asset_id, "created-at-round": asset_id * 10, "params": params}
+
+
+def test_decodes_minting_notes() -> None:
+    proof = b"RECOVERY_QUEST_" + struct.pack(">QQ", 7, 1_700_000_000)
+
+    assert decode_item_note(b"Swordrare", "Sword") == DecodedNote("created", "rare")
+    assert decode_item_note(
+        ITEM_NOTE_PREFIX + bytes([1, 3]) + bytes(16), "Sword"
+    ) == DecodedNote("created", "epic")
+    assert decode_item_note(b"RECOVERED_ITEM_" + proof, "RECOVERED_ITEM") == (
+        DecodedNote("recovered", quest_id=7, proof_timestamp=1_700_000_000)
+    )
+    assert decode_item_note(b"SEASONAL_\x01\x02", "SEASONAL_ITEM") == DecodedNote(
+        "seasonal", proof="0102"
+    )
+    assert decode_item_note(b"CRAFTED_ITEM", "CRAFTED_ITEM") == DecodedNote("crafted")
+    assert decode_item_note(b"STACK_potion:common", "potion:common") == DecodedNote(
+        "stack", "common"
+    )
+
+
+def test_exports_items_with_notes_and_holders_across_pages() -> None:
+    app_address = get_application_address(APP_ID)
+    indexer = FakeIndexer(
+        assets=[
+            _asset(11, "Sword", "ALGITEM", clawback=app_address),
+            _asset(12, "CRAFTED_ITEM", "ALGCRAFT"),
+            _asset(14, "Shield", "ALGITEM"),
+        ],
+        # Asset 13 was created by another path and has no asset record
+        notes={11: b"Swordepic", 12: b"CRAFTED_ITEM", 13: b"x", 14: b"Shieldcommon"},
+        holders={11: PLAYER, 12: app_address},
+    )
+    exporter = InventoryExporter(indexer, APP_ID, page_size=1)  # type: ignore[arg-type]
+
+    out = io.StringIO()
+    assert exporter.export_csv(out) == 3
+
+    lines = out.getvalue().splitlines()
+    assert lines[0].startswith("asset_id,name,unit_name,kind,rarity")
+    assert lines[1] == f"11,Sword,ALGITEM,created,epic,,,,110,{PLAYER},0,1"
+    assert lines[2] == f"12,CRAFTED_ITEM,ALGCRAFT,crafted,,,,,120,{app_address},1,0"
+    assert lines[3] == "14,Shield,ALGITEM,created,common,,,,140,,0,0"
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import pytest
+from algosdk import account
+
+from smart_contracts.algorealm.item_delivery import (
+    APP_ID_TEMPLATE,
+    decode_delegation,
+    delegation_source,
+    encode_delegation,
+    sign_delegation,
+)
+
+
+def test_delegation_source_binds_the_app_id(tmp_path: Path) -> None:
+    teal = tmp_path / "AlgoRealmItemOptIn.teal"
+    teal.write_text(f"#pragma version 10\nintcblock 1 0 {APP_ID_TEMPLATE}\n")
+
+    source = delegation_source(1001, teal)
+
+    assert "intcblock 1 0 1001" in source
+    assert APP_ID_TEMPLATE not in source
+    with pytest.raises(ValueError, match="Invalid app ID"):
+        delegation_source(0, teal)
+
+
+def test_delegations_round_trip_with_their_player_signature() -> None:
+    private_key, player = account.generate_account()
+
+    delegation = decode_delegation(
+        encode_delegation(sign_delegation(bytes.fromhex("0a8101"), private_key))
+    )
+
+    assert delegation.is_delegated()
+    assert delegation.address() == player
@@ -0,0 +1,50 @@
+import pytest
+from algosdk import abi
+
+from smart_contracts.algorealm.item_metadata import (
+    ITEM_NOTE_PREFIX,
+    ItemMetadata,
+    ItemType,
+    Rarity,
+    decode_item_note,
+    metadata_box_name,
+)
+
+ARC4_LAYOUT = abi.ABIType.from_string(
+    "(uint8,uint8,uint16,uint16,uint16,bool,uint8,uint64)"
+)
+
+METADATA = ItemMetadata(
+    item_type=ItemType.ARMOR,
+    rarity=Rarity.EPIC,
+    attack_power=7,
+    defense_power=65_535,
+    effect_id=3,
+    is_recovered=True,
+    recovery_count=2,
+    original_creation_time=1_700_000_000,
+)
+
+
+def test_encoding_matches_the_arc4_struct() -> None:
+    encoded = METADATA.to_bytes()
+
+    assert len(encoded) == 18
+    assert encoded == ARC4_LAYOUT.encode(list(METADATA))
+    assert ItemMetadata.from_bytes(encoded) == METADATA
+
+
+def test_names_parse_like_the_contract() -> None:
+    assert ItemType.parse("Weapon") is ItemType.WEAPON
+    assert ItemType.parse("other") is ItemType.OTHER
+    with pytest.raises(ValueError, match="Unknown item type"):
+        ItemType.parse("Dragon Scale")
+    assert Rarity.parse("Legendary") is Rarity.LEGENDARY
+    with pytest.raises(ValueError, match="Unknown rarity"):
+        Rarity.parse("mythic")
+
+
+def test_decode_item_note() -> None:
+    assert decode_item_note(ITEM_NOTE_PREFIX + METADATA.to_bytes()) == METADATA
+    assert decode_item_note(b"Swordrare") is None
+    assert metadata_box_name(258) == b"m" + bytes(6) + b"\x01\x02"
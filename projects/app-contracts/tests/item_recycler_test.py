@@ -0,0 +1,154 @@
+import algokit_utils
+from algosdk import encoding
+
+from smart_contracts.algorealm.inventory_export import ItemRecord
+from smart_contracts.algorealm.item_recycler import (
+    MAX_GROUP_ITEMS,
+    SweepPolicy,
+    chunk_items,
+    group_items,
+    recycle_group,
+    select_candidates,
+)
+
+APP_ADDRESS = encoding.encode_address(bytes([1]) * 32)
+PLAYER = encoding.encode_address(bytes([2]) * 32)
+
+
+def _item(
+    asset_id: int,
+    kind: str,
+    holder: str | None,
+    created_round: int = 100,
+    *,
+    clawback: bool = True,
+) -> ItemRecord:
+    return ItemRecord(
+        asset_id=asset_id,
+        name=f"Item {asset_id}",
+        unit_name="ALGITEM",
+        kind=kind,
+        rarity="rare",
+        quest_id=None,
+        proof_timestamp=None,
+        proof="",
+        created_round=created_round,
+        holder=holder,
+        contract_held=holder == APP_ADDRESS,
+        contract_clawback=clawback,
+    )
+
+
+def test_only_old_contract_held_items_are_abandoned() -> None:
+    items = [
+        _item(1, "seasonal", APP_ADDRESS),
+        _item(2, "seasonal", APP_ADDRESS, created_round=950),
+        _item(3, "created", PLAYER),
+        _item(4, "stack", None),
+        _item(5, "crafted", None),
+    ]
+    policy = SweepPolicy(current_round=1_000, min_age_rounds=500)
+
+    assert [item.asset_id for item in select_candidates(items, policy)] == [1]
+
+
+def test_player_items_are_reclaimed_only_when_clawback_is_set() -> None:
+    items = [
+        _item(1, "created", PLAYER),
+        _item(2, "recovered", PLAYER),
+        _item(3, "seasonal", PLAYER, clawback=False),
+        _item(4, "crafted", PLAYER, clawback=False),
+        _item(5, "crafted", PLAYER),
+    ]
+    policy = SweepPolicy(
+        current_round=1_000, min_age_rounds=500, reclaim_from_players=True
+    )
+
+    assert [item.asset_id for item in select_candidates(items, policy)] == [1, 2, 5]
+
+
+def test_chunks_fit_the_reference_budget_of_one_call() -> None:
+    contract_held = [_item(asset_id, "seasonal", APP_ADDRESS) for asset_id in range(10)]
+    player_held = [_item(asset_id, "created", PLAYER) for asset_id in range(5)]
+    mixed = [
+        _item(1, "seasonal", APP_ADDRESS),
+        _item(2, "created", PLAYER),
+        _item(3, "created", PLAYER),
+        _item(4, "seasonal", APP_ADDRESS),
+    ]
+
+    # An asset and a metadata box per item, plus the holder for player items
+    assert [len(chunk) for chunk in chunk_items(contract_held)] == [4, 4, 2]
+    assert [len(chunk) for chunk in chunk_items(player_held)] == [2, 2, 1]
+    assert [len(chunk) for chunk in chunk_items(mixed)] == [3, 1]
+    assert [item for chunk in chunk_items(contract_held) for item in chunk] == (
+        contract_held
+    )
+
+
+def test_groups_hold_sixteen_calls() -> None:
+    contract_held = [
+        _item(asset_id, "seasonal", APP_ADDRESS) for asset_id in range(100)
+    ]
+    player_held = [_item(asset_id, "created", PLAYER) for asset_id in range(40)]
+
+    assert MAX_GROUP_ITEMS == 64
+    assert [len(group) for group in group_items(contract_held)] == [64, 36]
+    assert [len(group) for group in group_items(player_held)] == [32, 8]
+
+
+class FakeComposer:
+    def __init__(self) -> None:
+        self.calls: list[algokit_utils.AppClientMethodCallParams] = []
+
+    def add_app_call_method_call(
+        self, params: algokit_utils.AppClientMethodCallParams
+    ) -> "FakeComposer":
+        self.calls.append(params)
+        return self
+
+    def send(self, params: algokit_utils.SendParams) -> None:
+        pass
+
+
+class FakeSuggestedParams:
+    min_fee = 2_000
+
+
+class FakeAlgorand:
+    def __init__(self) -> None:
+        self.composer = FakeComposer()
+
+    def new_group(self) -> FakeComposer:
+        return self.composer
+
+    def get_suggested_params(self) -> FakeSuggestedParams:
+        return FakeSuggestedParams()
+
+
+class FakeParams:
+    def call(
+        self, params: algokit_utils.AppClientMethodCallParams
+    ) -> algokit_utils.AppClientMethodCallParams:
+        return params
+
+
+class FakeAppClient:
+    def __init__(self) -> None:
+        self.algorand = FakeAlgorand()
+        self.params = FakeParams()
+
+
+def test_recycle_fees_cover_every_inner_transaction_at_the_min_fee() -> None:
+    app_client = FakeAppClient()
+    items = [
+        _item(1, "seasonal", APP_ADDRESS),
+        _item(2, "created", PLAYER),
+        _item(3, "created", PLAYER),
+    ]
+
+    recycle_group(app_client, items)  # type: ignore[arg-type]
+
+    (call,) = app_client.algorand.composer.calls
+    # One destroy, then a clawback and a destroy for each player-held item
+    assert call.extra_fee == algokit_utils.AlgoAmount.from_micro_algo(5 * 2_000)
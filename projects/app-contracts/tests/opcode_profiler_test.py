@@ -0,0 +1,84 @@
+import base64
+import json
+from pathlib import Path
+
+from smart_contracts.algorealm.opcode_profiler import (
+    ProgramMap,
+    SourceLine,
+    _decode_vlq,
+    load_program_maps,
+    profile_simulation,
+)
+
+CONTRACT_SOURCE = Path("smart_contracts/algorealm/contract.py").resolve()
+
+
+def _write_map(tmp_path: Path) -> Path:
+    # pc 0 -> line 1, pc 2 -> line 3 (subroutine entry), pc 3 -> line 4
+    source_map = {
+        "version": 3,
+        "sources": ["contract.py"],
+        "mappings": "AAAA;;AAEA;AACA",
+        "op_pc_offset": 0,
+        "pc_events": {
+            "0": {"subroutine": "pkg.Contract.approval", "op": "callsub helper"},
+            "1": {"op": "return"},
+            "2": {"subroutine": "pkg.Contract.helper", "op": "sha256"},
+            "3": {"op": "retsub"},
+        },
+    }
+    path = tmp_path / "Contract.approval.puya.map"
+    path.write_text(json.dumps(source_map))
+    return path
+
+
+def test_decode_vlq() -> None:
+    assert _decode_vlq("AAgBC") == [0, 0, 16, 1]
+    assert _decode_vlq("D") == [-1]
+
+
+def test_trace_costs_are_attributed_per_line_and_stack(tmp_path: Path) -> None:
+    program = ProgramMap.load(_write_map(tmp_path))
+    source = str((tmp_path / "contract.py").resolve())
+    program_hash = b"\x01" * 32
+    response = {
+        "txn-groups": [
+            {
+                "txn-results": [
+                    {
+                        "exec-trace": {
+                            "approval-program-hash": base64.b64encode(
+                                program_hash
+                            ).decode(),
+                            "approval-program-trace": [
+                                {"pc": 0},
+                                {"pc": 2},
+                                {"pc": 3},
+                                {"pc": 1},
+                            ],
+                        }
+                    }
+                ]
+            }
+        ]
+    }
+
+    profile = profile_simulation(response, {program_hash: program})
+
+    assert profile.line_costs[SourceLine(source, 3)] == 35
+    assert profile.line_costs[SourceLine(source, 1)] == 1
+    # pc 1 has no mapping and is charged to the program itself
+    assert profile.line_costs[SourceLine("Contract", 0)] == 1
+    assert profile.total_cost == 38
+    assert profile.stack_costs[("Contract", "helper", "contract.py:3")] == 35
+    assert "sha256" not in profile.format_table()
+    assert profile.format_table().splitlines()[-1].split()[0] == "38"
+
+
+def test_built_source_maps_point_into_contract_py() -> None:
+    programs = {program.name: program for program in load_program_maps().values()}
+
+    game_manager = programs["AlgoRealmGameManager"]
+    sources = {line.source for line in game_manager.lines.values()}
+    assert sources == {str(CONTRACT_SOURCE)}
+    assert "recover_lost_item" in game_manager.subroutines.values()
@@ -0,0 +1,64 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, Application, Asset, Bytes, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.algorealm.opt_in_delegation import item_opt_in_delegation
+
+APP_ID = 1_234
+DELIVER_ITEM = arc4.arc4_signature("deliver_item(asset,account)void")
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        ctx.set_template_var("ALGOREALM_APP_ID", UInt64(APP_ID))
+        ctx.any.application(id=APP_ID)
+        yield ctx
+
+
+def _approves(
+    context: AlgopyTestContext,
+    *,
+    asset: Asset,
+    receiver: Account | None = None,
+    fee: int = 0,
+    app: Application | None = None,
+    method: Bytes = DELIVER_ITEM,
+    **opt_in_fields: object,
+) -> bool:
+    player = context.default_sender
+    opt_in = context.any.txn.asset_transfer(
+        sender=player,
+        asset_receiver=receiver or player,
+        xfer_asset=asset,
+        asset_amount=UInt64(0),
+        fee=UInt64(fee),
+        **opt_in_fields,
+    )
+    deliver = context.any.txn.application_call(
+        app_id=app or Application(APP_ID),
+        app_args=[method, Bytes(b"\x00"), Bytes(b"\x01")],
+        assets=[asset],
+        accounts=[context.any.account(), player],
+    )
+    with context.txn.create_group([opt_in, deliver], active_txn_index=0):
+        return bool(context.execute_logicsig(item_opt_in_delegation))
+
+
+def test_approves_a_free_opt_in_followed_by_its_delivery(
+    context: AlgopyTestContext,
+) -> None:
+    assert _approves(context, asset=context.any.asset())
+
+
+def test_rejects_anything_else(context: AlgopyTestContext) -> None:
+    asset = context.any.asset()
+
+    assert not _approves(context, asset=asset, fee=1_000)
+    assert not _approves(context, asset=asset, receiver=context.any.account())
+    assert not _approves(context, asset=asset, rekey_to=context.any.account())
+    assert not _approves(context, asset=asset, asset_close_to=context.any.account())
+    assert not _approves(context, asset=asset, app=context.any.application())
+    assert not _approves(context, asset=asset, method=Bytes(b"\x00\x00\x00\x00"))
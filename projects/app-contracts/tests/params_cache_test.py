@@ -0,0 +1,52 @@
+from algosdk import transaction
+
+from smart_contracts.algorealm.params_cache import SuggestedParamsCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _params(first: int) -> transaction.SuggestedParams:
+    return transaction.SuggestedParams(
+        fee=0,
+        first=first,
+        last=first + 1000,
+        gh="SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+        flat_fee=False,
+        min_fee=1000,
+    )
+
+
+def test_params_are_fetched_once_per_round() -> None:
+    clock = FakeClock()
+    cache = SuggestedParamsCache(ttl_seconds=2.8, clock=clock)
+    fetches: list[int] = []
+
+    def fetch() -> transaction.SuggestedParams:
+        fetches.append(1)
+        return _params(first=100 + len(fetches))
+
+    first = cache.get("algod", fetch)
+    first.fee = 5_000  # callers may mutate their copy
+    second = cache.get("algod", fetch)
+    clock.now = 3.0
+    third = cache.get("algod", fetch)
+
+    assert len(fetches) == 2
+    assert second.first == 101
+    assert second.fee == 0
+    assert third.first == 102
+
+
+def test_invalidate_forces_refetch() -> None:
+    cache = SuggestedParamsCache(clock=FakeClock())
+    cache.put("algod", _params(first=1))
+
+    cache.invalidate("algod")
+
+    assert cache.get_fresh("algod") is None
@@ -0,0 +1,176 @@
+import asyncio
+
+import httpx
+import pytest
+from algosdk import account, transaction
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+
+from smart_contracts.algorealm.pipeline import SubmissionPipeline
+
+PRIVATE_KEY, SENDER = account.generate_account()
+
+
+class FailingAlgod:
+    """Accepts submissions but loses the connection while waiting for blocks"""
+
+    address = "http://failing-algod"
+
+    def __init__(self) -> None:
+        self.block_waits = 0
+
+    async def status(self) -> dict[str, int]:
+        return {"last-round": 1}
+
+    async def status_after_block(self, round_: int) -> dict[str, int]:
+        self.block_waits += 1
+        raise httpx.ConnectError("algod unreachable")
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        return transaction.SuggestedParams(
+            fee=0, first=1, last=1_001, gh="A" * 44, min_fee=1_000, flat_fee=True
+        )
+
+    async def send_transactions(
+        self, signed_txns: list[transaction.GenericSignedTransaction]
+    ) -> str:
+        return signed_txns[0].get_txid()
+
+
+def _payment(
+    sp: transaction.SuggestedParams,
+) -> list[transaction.GenericSignedTransaction]:
+    txn = transaction.PaymentTxn(SENDER, sp, SENDER, 0)
+    return AccountTransactionSigner(PRIVATE_KEY).sign_transactions([txn], [0])
+
+
+def test_drain_finishes_when_the_block_watcher_gives_up() -> None:
+    algod = FailingAlgod()
+
+    async def run() -> tuple[asyncio.Future, asyncio.Future]:
+        pipeline = SubmissionPipeline(algod, max_watch_retries=2, watch_retry_delay=0)
+        async with pipeline:
+            pending = await pipeline.submit(_payment)
+            await pipeline.drain()
+            late = await pipeline.submit(_payment)
+        return pending, late
+
+    pending, late = asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+    assert algod.block_waits == 3
+    for future in (pending, late):
+        with pytest.raises(Exception, match="Block watcher stopped"):
+            future.result()
+
+
+class ScriptedAlgod:
+    """
+    Advances one round per block wait, rejects the first sends with scripted
+    errors and drops the first accepted submission so it expires
+    """
+
+    address = "http://scripted-algod"
+
+    def __init__(self, send_errors: list[str], *, drop_first: bool = False) -> None:
+        self.send_errors = send_errors
+        self.drop_first = drop_first
+        self.round = 1
+        self.min_fees: list[int] = []
+        self.sent: list[str] = []
+
+    async def status(self) -> dict[str, int]:
+        return {"last-round": self.round}
+
+    async def status_after_block(self, round_: int) -> dict[str, int]:
+        await asyncio.sleep(0)
+        self.round = round_ + 1
+        return {"last-round": self.round}
+
+    async def suggested_params(self) -> transaction.SuggestedParams:
+        return transaction.SuggestedParams(
+            fee=0,
+            first=self.round,
+            last=self.round + 1_000,
+            gh="A" * 44,
+            min_fee=1_000,
+            flat_fee=True,
+        )
+
+    async def send_transactions(
+        self, signed_txns: list[transaction.GenericSignedTransaction]
+    ) -> str:
+        if self.send_errors:
+            request = httpx.Request("POST", f"{self.address}/v2/transactions")
+            response = httpx.Response(
+                400, text=self.send_errors.pop(0), request=request
+            )
+            raise httpx.HTTPStatusError("rejected", request=request, response=response)
+        tx_id = signed_txns[0].get_txid()
+        self.sent.append(tx_id)
+        return tx_id
+
+    async def block_txids(self, round_: int) -> list[str]:
+        return self.sent[1:] if self.drop_first else self.sent
+
+
+def _run_payment(algod: ScriptedAlgod, **pipeline_args: int) -> asyncio.Future:
+    def build(
+        sp: transaction.SuggestedParams,
+    ) -> list[transaction.GenericSignedTransaction]:
+        algod.min_fees.append(sp.min_fee)
+        return _payment(sp)
+
+    async def run() -> asyncio.Future:
+        async with SubmissionPipeline(algod, **pipeline_args) as pipeline:
+            return await pipeline.submit(build)
+
+    return asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        "TransactionPool.Remember: transaction ABC: fee 1000 below threshold 2000",
+        "TransactionPool.Remember: txgroup had 1000 in fees, "
+        "which is less than the minimum 2*1000",
+    ],
+)
+def test_fee_rejections_are_retried_with_a_bumped_fee(error: str) -> None:
+    algod = ScriptedAlgod([error])
+
+    result = _run_payment(algod).result()
+
+    assert result.attempts == 2
+    assert algod.min_fees == [1_000, 2_000]
+    assert result.tx_id == algod.sent[0]
+
+
+def test_dead_submissions_are_resubmitted_without_a_fee_bump() -> None:
+    algod = ScriptedAlgod(["TransactionPool.Remember: txn dead: round 5 outside"])
+
+    result = _run_payment(algod).result()
+
+    assert result.attempts == 2
+    assert algod.min_fees == [1_000, 1_000]
+
+
+def test_expired_submissions_are_resubmitted() -> None:
+    algod = ScriptedAlgod([], drop_first=True)
+
+    result = _run_payment(algod, validity_window=2).result()
+
+    # The first submission is never included and is rebuilt once it expires
+    assert result.attempts == 2
+    assert len(algod.sent) == 2
+    assert result.tx_id == algod.sent[1]
+    assert result.confirmed_round > 3
+    assert algod.min_fees == [1_000, 1_000]
+
+
+def test_submissions_fail_once_out_of_attempts() -> None:
+    algod = ScriptedAlgod(["fee 1000 below threshold 2000"] * 3)
+
+    future = _run_payment(algod, max_attempts=3)
+
+    with pytest.raises(Exception, match="below threshold"):
+        future.result()
+    assert algod.min_fees == [1_000, 2_000, 3_000]
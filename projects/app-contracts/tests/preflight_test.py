@@ -0,0 +1,80 @@
+import base64
+
+import pytest
+from algosdk import encoding
+
+from smart_contracts.algorealm.preflight import (
+    APP_CALL_BUDGET,
+    MAX_REFERENCES,
+    PREFLIGHT_EXTRA_BUDGET,
+    References,
+    plan_group,
+)
+
+APP_ID = 1001
+PLAYERS = [encoding.encode_address(bytes([i]) * 32) for i in range(1, 12)]
+
+
+def _group(
+    unnamed: dict | None = None,
+    txn_unnamed: list[dict | None] | None = None,
+    app_calls: int = 1,
+    consumed: int = 100,
+) -> dict:
+    return {
+        "app-budget-added": APP_CALL_BUDGET * app_calls + PREFLIGHT_EXTRA_BUDGET,
+        "app-budget-consumed": consumed,
+        "unnamed-resources-accessed": unnamed or {},
+        "txn-results": [
+            {"unnamed-resources-accessed": txn} if txn else {}
+            for txn in txn_unnamed or [None] * app_calls
+        ],
+    }
+
+
+def test_resources_are_named_where_they_were_accessed() -> None:
+    box = {"app": APP_ID, "name": base64.b64encode(b"m" + bytes(8)).decode()}
+    group = _group(
+        unnamed={
+            "assets": [7],
+            "boxes": [box],
+            "asset-holdings": [{"account": PLAYERS[0], "asset": 9}],
+        },
+        txn_unnamed=[None, {"accounts": [PLAYERS[1]]}],
+        app_calls=2,
+    )
+
+    plan = plan_group(group, [References(), References()])
+
+    assert plan.padding_calls == 0
+    first, second = plan.references
+    assert second.accounts == [PLAYERS[1]]
+    assert first.accounts == [PLAYERS[0]]
+    assert first.assets == [9, 7]
+    assert first.boxes == [(APP_ID, b"m" + bytes(8))]
+
+
+def test_budget_shortfall_adds_padding_calls() -> None:
+    group = _group(consumed=APP_CALL_BUDGET * 2 + 50)
+
+    plan = plan_group(group, [References()])
+
+    # 750 short, and each padding call nets 600 after running itself
+    assert plan.padding_calls == 2
+    assert len(plan.references) == 3
+
+
+def test_references_spill_onto_padding_calls() -> None:
+    group = _group(unnamed={"accounts": PLAYERS[:6]})
+
+    plan = plan_group(group, [References(assets=list(range(1, MAX_REFERENCES - 1)))])
+
+    assert plan.padding_calls == 1
+    assert [refs.accounts for refs in plan.references] == [PLAYERS[:2], PLAYERS[2:6]]
+
+
+def test_groups_that_cannot_fit_are_rejected() -> None:
+    group = _group(consumed=APP_CALL_BUDGET * 20)
+
+    with pytest.raises(ValueError, match="does not fit"):
+        plan_group(group, [References()])
@@ -0,0 +1,37 @@
+from smart_contracts.algorealm.season_rollover import RolloverReport
+from smart_contracts.algorealm.state_cache import PlayerState
+
+
+def _player(name: str, season: int, recoveries: int) -> PlayerState:
+    return PlayerState(
+        address=name,
+        player_recovery_count=recoveries,
+        player_season=season,
+        is_registered=True,
+        is_opted_in=True,
+    )
+
+
+def test_stale_counters_read_as_zero_in_a_new_season() -> None:
+    capped_last_season = _player("A", season=1, recoveries=3)
+
+    assert capped_last_season.recovery_count_in(1) == 3
+    assert capped_last_season.recovery_count_in(2) == 0
+
+
+def test_report_splits_current_and_stale_players() -> None:
+    report = RolloverReport(season=2, max_recoveries=3)
+    for state in (
+        _player("A", season=1, recoveries=3),
+        _player("B", season=1, recoveries=1),
+        _player("C", season=2, recoveries=3),
+        PlayerState(address="D"),
+    ):
+        report.add(state)
+
+    assert report.players == 4
+    assert report.not_opted_in == 1
+    assert (report.current, report.capped_current) == (1, 1)
+    assert (report.stale, report.capped_stale) == (2, 1)
+    assert report.stamps_by_season == {1: 2, 2: 1}
+    assert "stale, reset on next use:  2 (1 were at the cap)" in report.format()
@@ -0,0 +1,90 @@
+import base64
+
+from smart_contracts.algorealm.state_cache import PlayerStateCache
+
+
+def _uint(key: str, value: int) -> dict:
+    return {
+        "key": base64.b64encode(key.encode()).decode(),
+        "value": {"type": 2, "uint": value},
+    }
+
+
+class FakeAlgod:
+    def __init__(self) -> None:
+        self.round = 10
+        self.app_info_calls: list[str] = []
+
+    def status(self) -> dict:
+        return {"last-round": self.round}
+
+    def account_application_info(self, address: str, app_id: int) -> dict:
+        self.app_info_calls.append(address)
+        return {
+            "round": self.round,
+            "app-local-state": {
+                "id": app_id,
+                "key-value": [
+                    _uint("player_level", 3),
+                    _uint("player_experience", 250),
+                    _uint("player_recovery_count", 1),
+                    {
+                        "key": base64.b64encode(b"is_registered").decode(),
+                        "value": {
+                            "type": 1,
+                            "bytes": base64.b64encode(b"\x80").decode(),
+                        },
+                    },
+                ],
+            },
+        }
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_reads_are_served_from_cache_within_a_round() -> None:
+    algod = FakeAlgod()
+    clock = FakeClock()
+    cache = PlayerStateCache(algod, app_id=1, clock=clock)  # type: ignore[arg-type]
+
+    first = cache.get("PLAYER")
+    second = cache.get("PLAYER")
+
+    assert first == second
+    assert first.player_level == 3
+    assert first.player_experience == 250
+    assert first.player_recovery_count == 1
+    assert first.is_registered
+    assert algod.app_info_calls == ["PLAYER"]
+
+
+def test_new_round_invalidates_cached_state() -> None:
+    algod = FakeAlgod()
+    clock = FakeClock()
+    cache = PlayerStateCache(algod, app_id=1, clock=clock)  # type: ignore[arg-type]
+    cache.get("PLAYER")
+
+    algod.round = 11
+    clock.now = 5.0
+    state = cache.get("PLAYER")
+
+    assert state.round == 11
+    assert algod.app_info_calls == ["PLAYER", "PLAYER"]
+
+
+def test_get_many_fetches_only_missing_and_evicts_lru() -> None:
+    algod = FakeAlgod()
+    cache = PlayerStateCache(algod, app_id=1, max_entries=2, clock=FakeClock())  # type: ignore[arg-type]
+
+    cache.get("A")
+    states = cache.get_many(["A", "B", "C"])
+
+    assert list(states) == ["A", "B", "C"]
+    assert sorted(algod.app_info_calls) == ["A", "B", "C"]
+    assert len(cache) == 2
@@ -69,7 +69,7 @@ export default function AlgoRealmGame({ onOpenWalletModal }: AlgoRealmGameProps)
   const [itemForm, setItemForm] = useState({
     recipient: '',
     itemName: '',
-    itemType: '',
+    itemType: 'Weapon',
     rarity: 'Common',
     attackPower: 10,
     defensePower: 5,
@@ -79,7 +79,7 @@ export default function AlgoRealmGame({ onOpenWalletModal }: AlgoRealmGameProps)
   // Recovery form
   const [recoveryForm, setRecoveryForm] = useState({
     originalItemId: '',
-    questProof: '',
+    questId: '',
     newRecipient: '',
   })
 
@@ -233,7 +233,7 @@ export default function AlgoRealmGame({ onOpenWalletModal }: AlgoRealmGameProps)
       setItemForm({
         recipient: '',
         itemName: '',
-        itemType: '',
+        itemType: 'Weapon',
         rarity: 'Common',
         attackPower: 10,
         defensePower: 5,
@@ -255,10 +255,9 @@ export default function AlgoRealmGame({ onOpenWalletModal }: AlgoRealmGameProps)
     setSuccess(null)
 
     try {
-      const questProofBytes = new TextEncoder().encode(recoveryForm.questProof)
       const result = await algoRealmHelper.recoverLostItem(
         BigInt(recoveryForm.originalItemId),
-        questProofBytes,
+        BigInt(recoveryForm.questId),
         recoveryForm.newRecipient,
         activeAccount.address,
       )
@@ -267,7 +266,7 @@ export default function AlgoRealmGame({ onOpenWalletModal }: AlgoRealmGameProps)
       await loadPlayerStats()
       setRecoveryForm({
         originalItemId: '',
-        questProof: '',
+        questId: '',
         newRecipient: '',
       })
     } catch (err) {
@@ -528,13 +527,17 @@ export default function AlgoRealmGame({ onOpenWalletModal }: AlgoRealmGameProps)
                   value={itemForm.itemName}
                   onChange={(e) => setItemForm({ ...itemForm, itemName: e.target.value })}
                 />
-                <input
-                  type="text"
-                  placeholder="Item Type (e.g., 'Weapon', 'Armor')"
-                  className="input input-bordered w-full bg-gray-800 text-white border-gray-600 placeholder-gray-400"
+                <select
+                  className="select select-bordered w-full bg-gray-800 text-white border-gray-600"
                   value={itemForm.itemType}
                   onChange={(e) => setItemForm({ ...itemForm, itemType: e.target.value })}
-                />
+                >
+                  <option value="Weapon">Weapon</option>
+                  <option value="Armor">Armor</option>
+                  <option value="Consumable">Consumable</option>
+                  <option value="Badge">Badge</option>
+                  <option value="Other">Other</option>
+                </select>
                 <select
                   className="select select-bordered w-full bg-gray-800 text-white border-gray-600"
                   value={itemForm.rarity}
@@ -851,23 +854,22 @@ export default function AlgoRealmGame({ onOpenWalletModal }: AlgoRealmGameProps)
                   </span>
                 </div>
               </div>
-              {/* Quest Proof Field */}
+              {/* Completed Quest Field */}
               <div>
                 <label className="label">
-                  <span className="label-text text-white font-semibold text-lg">Quest Completion Proof</span>
-                  <span className="label-text-alt text-gray-400 text-sm">The cryptographic proof from your heroic recovery quest</span>
+                  <span className="label-text text-white font-semibold text-lg">Completed Quest ID</span>
+                  <span className="label-text-alt text-gray-400 text-sm">A quest you have completed in the quest system</span>
                 </label>
                 <input
-                  type="text"
-                  placeholder="e.g., quest_hash_abc123xyz or a specific transaction ID"
+                  type="number"
+                  placeholder="e.g., 1"
                   className="input input-bordered w-full input-lg bg-gray-800 text-white border-red-500 focus:border-red-400 placeholder-gray-400"
-                  value={recoveryForm.questProof}
-                  onChange={(e) => setRecoveryForm({ ...recoveryForm, questProof: e.target.value })}
+                  value={recoveryForm.questId}
+                  onChange={(e) => setRecoveryForm({ ...recoveryForm, questId: e.target.value })}
                 />
                 <div className="label">
                   <span className="label-text-alt text-gray-500 text-sm">
-                    💡 Successfully complete the recovery quest within the AlgoRealm game to obtain this unique proof hash or transaction
-                    ID.
+                    💡 The quest system issues a single-use recovery proof for this quest, which the recovery then spends.
                   </span>
                 </div>
               </div>
@@ -910,7 +912,7 @@ export default function AlgoRealmGame({ onOpenWalletModal }: AlgoRealmGameProps)
               <button
                 className="btn btn-accent btn-lg w-full transform transition duration-300 hover:scale-105 hover:shadow-xl"
                 onClick={handleRecoverItem}
-                disabled={loading || !recoveryForm.originalItemId || !recoveryForm.questProof || !recoveryForm.newRecipient}
+                disabled={loading || !recoveryForm.originalItemId || !recoveryForm.questId || !recoveryForm.newRecipient}
               >
                 {loading ? 'Initiating Recovery...' : 'Recover My Lost Item'}
               </button>
@@ -1,8 +1,14 @@
+import { microAlgo } from '@algorandfoundation/algokit-utils'
 import { AlgorandClient } from '@algorandfoundation/algokit-utils/types/algorand-client'
-import { TransactionSigner } from 'algosdk'
+import { ABIMethod, TransactionSigner } from 'algosdk'
 import { AlgoRealmGameManagerClient } from './AlgoRealmGameManager'
 import deploymentInfo from './deployment_info.json'
 
+// MBR of a player registration, mirrors contract.PLAYER_NAME_BOX_MBR and
+// contract.PLAYER_NAME_BYTE_MBR
+const PLAYER_NAME_BOX_MBR = 45_000
+const PLAYER_NAME_BYTE_MBR = 400
+
 /**
  * Helper class to interact with the deployed AlgoRealm Game Manager contract
  */
@@ -71,12 +77,21 @@ export class AlgoRealmHelper {
       signer,
     })
 
-    // Then register the player
-    return await client.send.registerPlayer({
-      args: { playerName },
+    // Then register the player, paying for the name boxes in the same group
+    const mbrPayment = await this.algorand!.createTransaction.payment({
       sender,
-      signer,
+      receiver: client.appAddress,
+      amount: microAlgo(PLAYER_NAME_BOX_MBR + PLAYER_NAME_BYTE_MBR * new TextEncoder().encode(playerName).length),
     })
+    return await client
+      .newGroup()
+      .addTransaction(mbrPayment, signer)
+      .registerPlayer({
+        args: { playerName },
+        sender,
+        signer,
+      })
+      .send()
   }
 
   /**
@@ -112,10 +127,13 @@ export class AlgoRealmHelper {
 
   /**
    * Recover a lost item
+   * The game manager only accepts a single-use proof issued by the quest system,
+   * so one is generated from a completed quest right before the recovery
    */
-  async recoverLostItem(originalItemId: bigint, recoveryQuestProof: Uint8Array, newRecipient: string, sender: string) {
+  async recoverLostItem(originalItemId: bigint, questId: bigint, newRecipient: string, sender: string) {
     const client = this.getClient()
     const signer = this.ensureSigner()
+    const recoveryQuestProof = await this.generateRecoveryProof(questId, sender)
 
     return await client.send.recoverLostItem({
       args: {
@@ -128,6 +146,33 @@ export class AlgoRealmHelper {
     })
   }
 
+  /**
+   * Ask the quest system linked to the game manager for a recovery proof
+   */
+  private async generateRecoveryProof(questId: bigint, sender: string): Promise<Uint8Array> {
+    if (!this.algorand) {
+      throw new Error('Algorand client not initialized')
+    }
+    const gameState = await this.algorand.app.getGlobalState(this.getClient().appId)
+    const questAppId = gameState.quest_system_app?.value
+    if (typeof questAppId !== 'bigint' || questAppId === 0n) {
+      throw new Error('The quest system is not linked to the game manager')
+    }
+
+    const result = await this.algorand.send.appCallMethodCall({
+      appId: questAppId,
+      method: ABIMethod.fromSignature('generate_recovery_proof(uint64)byte[]'),
+      args: [questId],
+      sender,
+      signer: this.ensureSigner(),
+    })
+    const proof = result.return?.returnValue
+    if (!(proof instanceof Uint8Array)) {
+      throw new Error('The quest system did not return a recovery proof')
+    }
+    return proof
+  }
+
   /**
    * Issue seasonal event item
    */